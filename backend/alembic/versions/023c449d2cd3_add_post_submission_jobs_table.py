@@ -0,0 +1,77 @@
+"""add post_submission_jobs table
+
+Revision ID: 023c449d2cd3
+Revises: pwdlogin474a
+Create Date: 2026-10-18 12:00:00.000000
+
+Adds the durable queue backing the post-submission pipeline. Each completed
+fixed-form submission enqueues one row per non-scoring stage (response-time
+analysis, validity, SEM/CI, question statistics, distractor stats, shadow
+CAT); worker tasks claim rows with ``FOR UPDATE SKIP LOCKED`` so several
+API processes can drain the same queue without double-processing.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSON
+
+# revision identifiers, used by Alembic.
+revision: str = "023c449d2cd3"  # pragma: allowlist secret
+down_revision: Union[str, None] = "pwdlogin474a"  # pragma: allowlist secret
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "post_submission_jobs",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column(
+            "test_session_id",
+            sa.Integer(),
+            sa.ForeignKey("test_sessions.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("stage", sa.String(50), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False, server_default="pending"),
+        sa.Column("payload", JSON(), nullable=True),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("max_attempts", sa.Integer(), nullable=False, server_default="5"),
+        sa.Column(
+            "run_after",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.Column("locked_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.UniqueConstraint(
+            "test_session_id", "stage", name="uq_post_submission_jobs_session_stage"
+        ),
+    )
+    op.create_index(
+        "ix_post_submission_jobs_id", "post_submission_jobs", ["id"], unique=False
+    )
+    op.create_index(
+        "ix_post_submission_jobs_status_run_after",
+        "post_submission_jobs",
+        ["status", "run_after"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_post_submission_jobs_status_run_after", table_name="post_submission_jobs"
+    )
+    op.drop_index("ix_post_submission_jobs_id", table_name="post_submission_jobs")
+    op.drop_table("post_submission_jobs")
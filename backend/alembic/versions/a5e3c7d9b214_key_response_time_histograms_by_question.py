@@ -0,0 +1,89 @@
+"""key response_time_histogram_bins by question
+
+Revision ID: a5e3c7d9b214
+Revises: f2d86b0c4a19
+Create Date: 2026-10-19 10:00:00.000000
+
+The histogram bins were keyed by the question's (type, difficulty) at fold
+time, so recalibration relabeling a question's difficulty left its responses
+counted under the old label. Bins are now keyed by question and the labels
+are joined when reading.
+
+The table is rebuilt in this migration: every completed session is claimed
+(response_times_aggregated_at = now()) and its responses are folded with one
+INSERT ... SELECT, so the analytics reads never have to catch up on history.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "a5e3c7d9b214"  # pragma: allowlist secret
+down_revision: Union[str, None] = "f2d86b0c4a19"  # pragma: allowlist secret
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _backfill() -> None:
+    # now() is the transaction start time, so the INSERT picks up exactly the
+    # sessions claimed by the UPDATE. Sessions completing concurrently block
+    # on the claimed rows' locks or stay NULL for the next fold.
+    op.execute(
+        """
+        UPDATE test_sessions
+        SET response_times_aggregated_at = now()
+        WHERE status = 'COMPLETED'
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO response_time_histogram_bins
+            (question_id, time_spent_seconds, response_count, updated_at)
+        SELECT r.question_id, r.time_spent_seconds, count(*), now()
+        FROM responses r
+        JOIN test_sessions s ON s.id = r.test_session_id
+        WHERE s.response_times_aggregated_at = now()
+          AND r.time_spent_seconds IS NOT NULL
+        GROUP BY r.question_id, r.time_spent_seconds
+        """
+    )
+
+
+def upgrade() -> None:
+    op.drop_table("response_time_histogram_bins")
+    op.create_table(
+        "response_time_histogram_bins",
+        sa.Column("question_id", sa.Integer(), nullable=False),
+        sa.Column("time_spent_seconds", sa.Integer(), nullable=False),
+        sa.Column("response_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["question_id"], ["questions.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint(
+            "question_id",
+            "time_spent_seconds",
+            name="pk_response_time_histogram_bins",
+        ),
+    )
+    _backfill()
+
+
+def downgrade() -> None:
+    op.drop_table("response_time_histogram_bins")
+    op.create_table(
+        "response_time_histogram_bins",
+        sa.Column("question_type", sa.String(length=20), nullable=False),
+        sa.Column("difficulty_level", sa.String(length=20), nullable=False),
+        sa.Column("time_spent_seconds", sa.Integer(), nullable=False),
+        sa.Column("response_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint(
+            "question_type",
+            "difficulty_level",
+            "time_spent_seconds",
+            name="pk_response_time_histogram_bins",
+        ),
+    )
+    # The per-type bins are refilled by the next catch-up run
+    op.execute("UPDATE test_sessions SET response_times_aggregated_at = NULL")
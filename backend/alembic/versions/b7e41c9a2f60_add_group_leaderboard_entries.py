@@ -0,0 +1,77 @@
+"""add group_leaderboard_entries table
+
+Revision ID: b7e41c9a2f60
+Revises: 023c449d2cd3
+Create Date: 2026-10-18 13:00:00.000000
+
+Materializes per-member score aggregates (best, average, count) for the group
+leaderboard so reads no longer aggregate every member's test results on each
+request. Rows are maintained incrementally by app.core.group_leaderboard; this
+migration backfills one row per existing membership from test_results.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e41c9a2f60"  # pragma: allowlist secret
+down_revision: Union[str, None] = "023c449d2cd3"  # pragma: allowlist secret
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "group_leaderboard_entries",
+        sa.Column("group_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("best_score", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("avg_score", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("test_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("score_sum", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.ForeignKeyConstraint(["group_id"], ["groups.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint(
+            "group_id", "user_id", name="pk_group_leaderboard_entries"
+        ),
+    )
+    op.create_index(
+        "ix_group_leaderboard_entries_rank",
+        "group_leaderboard_entries",
+        ["group_id", sa.text("best_score DESC"), "user_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_group_leaderboard_entries_user_id",
+        "group_leaderboard_entries",
+        ["user_id"],
+        unique=False,
+    )
+
+    # Backfill one row per existing membership
+    op.execute("""
+        INSERT INTO group_leaderboard_entries
+            (group_id, user_id, best_score, avg_score, test_count, score_sum)
+        SELECT
+            gm.group_id,
+            gm.user_id,
+            COALESCE(MAX(tr.iq_score), 0),
+            COALESCE(AVG(tr.iq_score), 0),
+            COUNT(tr.id),
+            COALESCE(SUM(tr.iq_score), 0)
+        FROM group_memberships gm
+        LEFT JOIN test_results tr ON tr.user_id = gm.user_id
+        GROUP BY gm.group_id, gm.user_id
+        """)
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_group_leaderboard_entries_user_id", table_name="group_leaderboard_entries"
+    )
+    op.drop_index(
+        "ix_group_leaderboard_entries_rank", table_name="group_leaderboard_entries"
+    )
+    op.drop_table("group_leaderboard_entries")
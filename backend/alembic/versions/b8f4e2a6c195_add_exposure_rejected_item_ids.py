@@ -0,0 +1,31 @@
+"""add test_sessions.exposure_rejected_item_ids
+
+Revision ID: b8f4e2a6c195
+Revises: a5e3c7d9b214
+Create Date: 2026-10-19 11:00:00.000000
+
+Adaptive sessions remember which items the Sympson-Hetter draw rejected so
+they are not drawn again later in the same session.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "b8f4e2a6c195"  # pragma: allowlist secret
+down_revision: Union[str, None] = "a5e3c7d9b214"  # pragma: allowlist secret
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "test_sessions",
+        sa.Column("exposure_rejected_item_ids", sa.JSON(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("test_sessions", "exposure_rejected_item_ids")
@@ -0,0 +1,62 @@
+"""add compact question embedding columns
+
+Revision ID: c3a9d5e17f42
+Revises: b7e41c9a2f60
+Create Date: 2026-10-18 14:00:00.000000
+
+Stores question embeddings as packed float32 or int8-quantized bytes
+(embedding_vector) alongside the model name, dimension, encoding and
+quantization scale, instead of a float8[] of 1536 values per row.
+
+The legacy question_embedding column is left in place so readers can fall back
+to it until existing rows are converted. Convert them in keyset batches with:
+
+    python scripts/compact_question_embeddings.py
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "c3a9d5e17f42"  # pragma: allowlist secret
+down_revision: Union[str, None] = "b7e41c9a2f60"  # pragma: allowlist secret
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "questions",
+        sa.Column(
+            "embedding_vector",
+            sa.LargeBinary(),
+            nullable=True,
+            comment="Packed embedding bytes (float32 or int8, little-endian)",
+        ),
+    )
+    op.add_column(
+        "questions",
+        sa.Column("embedding_model", sa.String(length=100), nullable=True),
+    )
+    op.add_column(
+        "questions",
+        sa.Column("embedding_dim", sa.Integer(), nullable=True),
+    )
+    op.add_column(
+        "questions",
+        sa.Column("embedding_encoding", sa.String(length=10), nullable=True),
+    )
+    op.add_column(
+        "questions",
+        sa.Column("embedding_scale", sa.Float(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("questions", "embedding_scale")
+    op.drop_column("questions", "embedding_encoding")
+    op.drop_column("questions", "embedding_dim")
+    op.drop_column("questions", "embedding_model")
+    op.drop_column("questions", "embedding_vector")
@@ -0,0 +1,61 @@
+"""add response_time_histogram_bins table
+
+Revision ID: d4b8f2a61c07
+Revises: c3a9d5e17f42
+Create Date: 2026-10-18 15:00:00.000000
+
+Persists per-(question type, difficulty) histograms of whole-second response
+times so the response-time percentile analytics no longer load (and cap) raw
+response rows. test_sessions.response_times_aggregated_at records which
+sessions have been folded in; existing completed sessions start out pending
+and are folded in batches by the first analytics read.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "d4b8f2a61c07"  # pragma: allowlist secret
+down_revision: Union[str, None] = "c3a9d5e17f42"  # pragma: allowlist secret
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "response_time_histogram_bins",
+        sa.Column("question_type", sa.String(length=20), nullable=False),
+        sa.Column("difficulty_level", sa.String(length=20), nullable=False),
+        sa.Column("time_spent_seconds", sa.Integer(), nullable=False),
+        sa.Column("response_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint(
+            "question_type",
+            "difficulty_level",
+            "time_spent_seconds",
+            name="pk_response_time_histogram_bins",
+        ),
+    )
+    op.add_column(
+        "test_sessions",
+        sa.Column(
+            "response_times_aggregated_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_test_sessions_response_times_pending",
+        "test_sessions",
+        ["status"],
+        unique=False,
+        postgresql_where=sa.text("response_times_aggregated_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_test_sessions_response_times_pending", table_name="test_sessions")
+    op.drop_column("test_sessions", "response_times_aggregated_at")
+    op.drop_table("response_time_histogram_bins")
@@ -0,0 +1,48 @@
+"""add cat_readiness_aggregates table
+
+Revision ID: e7c1a94b3d25
+Revises: d4b8f2a61c07
+Create Date: 2026-10-18 20:00:00.000000
+
+Per-domain CAT readiness inputs (calibrated item counts, counts by SE band and
+the test information curve of the well-calibrated items), maintained
+incrementally as questions are calibrated, flagged or deactivated. The table
+starts empty and is built from the questions table by the first readiness
+evaluation.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "e7c1a94b3d25"  # pragma: allowlist secret
+down_revision: Union[str, None] = "d4b8f2a61c07"  # pragma: allowlist secret
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "cat_readiness_aggregates",
+        sa.Column("question_type", sa.String(length=20), nullable=False),
+        sa.Column("total_calibrated", sa.Integer(), nullable=False),
+        sa.Column("well_calibrated", sa.Integer(), nullable=False),
+        sa.Column("easy_count", sa.Integer(), nullable=False),
+        sa.Column("medium_count", sa.Integer(), nullable=False),
+        sa.Column("hard_count", sa.Integer(), nullable=False),
+        sa.Column("se_difficulty_bands", postgresql.JSON(), nullable=False),
+        sa.Column("se_discrimination_bands", postgresql.JSON(), nullable=False),
+        sa.Column("test_information", postgresql.ARRAY(sa.Float()), nullable=False),
+        sa.Column("max_se_difficulty", sa.Float(), nullable=False),
+        sa.Column("max_se_discrimination", sa.Float(), nullable=False),
+        sa.Column("rebuilt_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("question_type", name="pk_cat_readiness_aggregates"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("cat_readiness_aggregates")
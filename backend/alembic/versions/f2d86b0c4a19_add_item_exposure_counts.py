@@ -0,0 +1,36 @@
+"""add item_exposure_counts table
+
+Revision ID: f2d86b0c4a19
+Revises: e7c1a94b3d25
+Create Date: 2026-10-18 21:00:00.000000
+
+Fleet-wide CAT item selection counts. API workers count selections in memory
+and add them to this table in batches, so exposure monitoring covers every
+worker and survives restarts.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "f2d86b0c4a19"  # pragma: allowlist secret
+down_revision: Union[str, None] = "e7c1a94b3d25"  # pragma: allowlist secret
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "item_exposure_counts",
+        sa.Column("question_id", sa.Integer(), nullable=False),
+        sa.Column("selection_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["question_id"], ["questions.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("question_id", name="pk_item_exposure_counts"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("item_exposure_counts")
@@ -38,6 +38,7 @@ def _build_response_from_config(config: dict) -> CATReadinessResponse:
         evaluated_at=config.get("evaluated_at"),
         thresholds=CATReadinessThresholds(**config["thresholds"]),
         domains=[DomainReadinessResponse(**d) for d in config.get("domains", [])],
+        theta_grid=config.get("theta_grid", []),
         summary=config.get("summary", "Never evaluated"),
     )
 
@@ -98,8 +99,9 @@ async def evaluate_readiness(
     r"""
     Run CAT readiness evaluation and persist result.
 
-    Queries the question bank to evaluate IRT calibration readiness across
-    all 6 domains. Enables or disables CAT based on whether all domains
+    Evaluates IRT calibration readiness across all 6 domains from the
+    precomputed per-domain aggregates, and reports each domain's test
+    information curve and SE band counts. Enables or disables CAT based on whether all domains
     meet thresholds. The result is persisted to SystemConfig.
 
     Requires X-Admin-Token header.
@@ -138,8 +140,12 @@ async def evaluate_readiness(
                 medium_count=d.medium_count,
                 hard_count=d.hard_count,
                 reasons=d.reasons,
+                test_information=d.test_information,
+                se_difficulty_bands=d.se_difficulty_bands,
+                se_discrimination_bands=d.se_discrimination_bands,
             )
             for d in result.domains
         ],
+        theta_grid=result.theta_grid,
         summary=result.summary,
     )
@@ -15,6 +15,16 @@ from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth.dependencies import get_current_user
+from app.core.group_leaderboard import (
+    InvalidLeaderboardCursor,
+    add_leaderboard_entry,
+    count_leaderboard_entries,
+    decode_cursor,
+    delete_group_leaderboard,
+    encode_cursor,
+    fetch_leaderboard_page,
+    remove_leaderboard_entry,
+)
 from app.core.datetime_utils import utc_now
 from app.core.error_responses import (
     ErrorMessages,
@@ -142,6 +152,7 @@ async def create_group(
             role=GroupRole.OWNER,
         )
         db.add(membership)
+        await add_leaderboard_entry(db, group.id, current_user.id)
         await db.commit()
         await db.refresh(group)
     except SQLAlchemyError:
@@ -385,6 +396,7 @@ async def join_group(
             role=GroupRole.MEMBER,
         )
         db.add(membership)
+        await add_leaderboard_entry(db, group.id, current_user.id)
 
         # Record acceptance on the invite if one was used
         if invite is not None:
@@ -419,6 +431,64 @@ async def join_group(
     )
 
 
+async def _get_materialized_leaderboard(
+    db: AsyncSession,
+    group: Group,
+    limit: Optional[int],
+    offset: Optional[int],
+    cursor: Optional[str],
+) -> LeaderboardResponse:
+    """Serve the all-time leaderboard from group_leaderboard_entries."""
+    after = None
+    start_rank = offset or 0
+    if cursor is not None:
+        try:
+            after_score, after_user_id, start_rank = decode_cursor(cursor)
+        except InvalidLeaderboardCursor:
+            raise_bad_request("Invalid leaderboard cursor.")
+        after = (after_score, after_user_id)
+
+    total_count = await count_leaderboard_entries(db, group.id)
+    rows = await fetch_leaderboard_page(
+        db,
+        group.id,
+        limit=limit,
+        offset=offset,
+        after=after,
+    )
+
+    entries = [
+        LeaderboardEntryResponse(
+            rank=start_rank + idx + 1,
+            user_id=user_id,
+            first_name=first_name or "",
+            best_score=best_score,
+            average_score=float(avg_score),
+        )
+        for idx, (user_id, first_name, best_score, avg_score) in enumerate(rows)
+    ]
+
+    end_rank = start_rank + len(entries)
+    has_more = limit is not None and end_rank < total_count
+    next_cursor = (
+        encode_cursor(entries[-1].best_score, entries[-1].user_id, end_rank)
+        if has_more and entries
+        else None
+    )
+
+    return LeaderboardResponse(
+        group_id=group.id,
+        group_name=group.name,
+        entries=entries,
+        total_count=total_count,
+        limit=limit,
+        offset=offset if limit is not None else None,
+        has_more=has_more,
+        days=None,
+        next_cursor=next_cursor,
+    )
+
+
 @router.get("/{group_id}/leaderboard", response_model=LeaderboardResponse)
 async def get_leaderboard(
     group_id: int,
@@ -441,6 +511,13 @@ async def get_leaderboard(
         ge=0,
         description="Number of entries to skip (requires limit)",
     ),
+    cursor: Optional[str] = Query(
+        None,
+        description=(
+            "Opaque cursor from a previous page's next_cursor (requires limit; "
+            "all-time leaderboard only)"
+        ),
+    ),
 ) -> LeaderboardResponse:
     """
     Return a ranked leaderboard for all group members.
@@ -450,7 +527,12 @@ async def get_leaderboard(
 
     Supports an optional time-window filter (``days``) that restricts score
     aggregation to results completed within the last *N* days, and optional
-    pagination via ``limit`` / ``offset``.
+    pagination via ``limit`` / ``offset`` or ``limit`` / ``cursor``.
+
+    The all-time leaderboard is read from the materialized
+    ``group_leaderboard_entries`` table (ranked by best score, ties broken by
+    user ID), so its cost depends on the page size rather than the group size.
+    Time-windowed leaderboards are aggregated from test results per request.
 
     Args:
         group_id: Primary key of the group.
@@ -459,6 +541,7 @@ async def get_leaderboard(
         days: Optional time window — only aggregate results from the last N days.
         limit: Optional page size for pagination.
         offset: Optional offset for pagination (requires limit).
+        cursor: Optional keyset cursor for the next page (requires limit).
 
     Returns:
         LeaderboardResponse with ranked entries for every group member.
@@ -466,6 +549,17 @@ async def get_leaderboard(
     group = await _get_group_or_404(db, group_id)
     await _require_membership(db, group_id, current_user.id)
 
+    if cursor is not None:
+        if days is not None:
+            raise_bad_request("cursor pagination is not supported with days.")
+        if limit is None or offset is not None:
+            raise_bad_request("cursor requires limit and cannot be used with offset.")
+
+    if days is None:
+        return await _get_materialized_leaderboard(
+            db, group, limit=limit, offset=offset, cursor=cursor
+        )
+
     # Subquery: best and average IQ score per user (scoped to group members)
     member_ids = select(GroupMembership.user_id).where(
         GroupMembership.group_id == group_id
@@ -584,6 +678,7 @@ async def remove_member(
 
     try:
         await db.delete(target_membership)
+        await remove_leaderboard_entry(db, group_id, target_membership.user_id)
         await db.commit()
     except SQLAlchemyError:
         await db.rollback()
@@ -624,6 +719,7 @@ async def delete_group(
         raise_forbidden("Only the group owner can perform this action.")
 
     try:
+        await delete_group_leaderboard(db, group_id)
         await db.delete(group)
         await db.commit()
     except SQLAlchemyError:
@@ -48,6 +48,7 @@ from app.core.error_responses import (
     raise_not_found,
 )
 from app.core.graceful_failure import graceful_failure
+from app.core.group_leaderboard import record_result_in_leaderboards
 from app.core.question_utils import question_to_response
 from app.core.scoring.test_composition import async_select_stratified_questions
 from app.models import Question, TestSession, User, UserQuestion, get_db
@@ -754,6 +755,9 @@ async def claim_guest_result(
         await db.rollback()
         raise_conflict(ErrorMessages.GUEST_RESULT_ALREADY_CLAIMED)
 
+    # The result is new to the claimant's groups; fold it in with the claim
+    await record_result_in_leaderboards(db, current_user.id, test_result.iq_score)
+
     response_question_result = await db.execute(
         select(Response.question_id).where(Response.test_session_id == session_id)
     )
@@ -3,13 +3,12 @@ Test session management endpoints.
 """
 
 import logging
-import threading
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, case, func
 from sqlalchemy.exc import IntegrityError
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional, TypedDict, TYPE_CHECKING
+from typing import Any, Dict, Optional, Set, TypedDict, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from app.models.models import Response as ResponseModel
@@ -44,6 +43,7 @@ from app.schemas.responses import (
     MAX_HISTORY_PAGE_SIZE,
 )
 from app.core.auth.dependencies import get_current_user
+from app.core.background_tasks import safe_background_task
 from app.core.scoring.engine import (
     calculate_iq_score,
     calculate_weighted_iq_score,
@@ -62,6 +62,7 @@ from app.core.system_config import (
     async_get_domain_weights,
     async_get_domain_population_stats,
     async_is_cat_enabled,
+    async_get_exposure_parameters,
 )
 from app.core.psychometrics.time_analysis import (
     async_analyze_response_times,
@@ -69,9 +70,13 @@ from app.core.psychometrics.time_analysis import (
 )
 from app.core.config import settings
 from app.core.cache import invalidate_user_cache
+from app.core.group_leaderboard import record_result_in_leaderboards
 from app.core.reliability import invalidate_reliability_report_cache
 from app.core.analytics import AnalyticsTracker
 from app.core.psychometrics.question_analytics import update_question_statistics
+from app.core.psychometrics.response_time_histograms import (
+    async_fold_session_response_times,
+)
 from app.core.scoring.test_composition import async_select_stratified_questions
 from app.core.psychometrics.distractor_analysis import (
     async_update_distractor_stats,
@@ -85,7 +90,14 @@ from app.core.psychometrics.validity_analysis import (
     assess_session_validity,
 )
 from app.core.graceful_failure import graceful_failure
+from app.core.post_submission import (
+    FIXED_FORM_STAGES,
+    enqueue_post_submission_jobs,
+    notify_post_submission_workers,
+)
+from app.core.post_submission.queue import STAGE_SHADOW_CAT
 from app.core.cat.engine import CATSession, CATSessionManager
+from app.core.cat.exposure_store import exposure_monitor
 from app.core.cat.item_selection import select_next_item
 from app.observability import metrics
 
@@ -393,6 +405,7 @@ async def get_user_prior_theta(db: AsyncSession, user_id: int) -> float:
 
 @router.post("/start", response_model=StartTestResponse)
 async def start_test(
+    background_tasks: BackgroundTasks,
     question_count: int = Query(
         default=settings.TEST_TOTAL_QUESTIONS,
         ge=1,
@@ -413,6 +426,7 @@ async def start_test(
     as seen for the user. Returns the session details and questions.
 
     Args:
+        background_tasks: Runs the exposure count flush after the response
         question_count: Number of questions to include in test
         current_user: Current authenticated user
         db: Database session
@@ -555,6 +569,7 @@ async def start_test(
         )
 
         # Select first question via MFI
+        rejected_items: Set[int] = set()
         selected_question = select_next_item(
             item_pool=item_pool,
             theta_estimate=cat_session.theta_estimate,
@@ -562,6 +577,8 @@ async def start_test(
             domain_coverage=cat_session.domain_coverage,
             target_weights=settings.TEST_DOMAIN_WEIGHTS,
             seen_question_ids=None,  # Already filtered in item_pool query
+            exposure_parameters=await async_get_exposure_parameters(db),
+            rejected_items=rejected_items,
         )
 
         if not selected_question:
@@ -575,6 +592,7 @@ async def start_test(
             composition_metadata=None,
             is_adaptive=True,
             theta_history=[],
+            exposure_rejected_item_ids=sorted(rejected_items) or None,
         )
         db.add(test_session)
 
@@ -603,6 +621,12 @@ async def start_test(
         await db.commit()
         await db.refresh(test_session)
 
+        exposure_monitor.record_selection(selected_question.id)
+        if exposure_monitor.flush_due():
+            background_tasks.add_task(
+                safe_background_task, exposure_monitor.async_flush_in_own_session
+            )
+
         # Track analytics event
         AnalyticsTracker.track_test_started(
             user_id=user_id,
@@ -782,6 +806,7 @@ async def _finalize_adaptive_session(
         ci_upper=ci_upper,
     )
     db.add(test_result)
+    await record_result_in_leaderboards(db, user_id, cat_result.iq_score)
     await db.commit()
     await db.refresh(test_result)
 
@@ -807,6 +832,19 @@ async def _finalize_adaptive_session(
 
     result_response = await build_test_result_response(test_result, db=db)
 
+    # Fold response times into the percentile histograms (TASK-836). Runs
+    # after the response is built so a rollback here cannot expire it.
+    with graceful_failure(
+        f"update response time histograms for session {test_session.id}",
+        logger,
+    ):
+        try:
+            await async_fold_session_response_times(db, test_session.id)
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+
     return AdaptiveNextResponse(
         next_question=None,
         current_theta=cat_result.theta_estimate,
@@ -821,6 +859,7 @@ async def _finalize_adaptive_session(
 @router.post("/next", response_model=AdaptiveNextResponse)
 async def submit_adaptive_response(
     request: AdaptiveResponseRequest,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -833,6 +872,7 @@ async def submit_adaptive_response(
 
     Args:
         request: Adaptive response with session_id, question_id, user_answer, time_spent_seconds
+        background_tasks: Runs the exposure count flush after the response
         current_user: Current authenticated user
         db: Database session
 
@@ -990,6 +1030,8 @@ async def submit_adaptive_response(
     # Step 12: Test continues — select next question
     item_pool = await get_eligible_cat_item_pool(db, user_id)
     administered_ids = set(cat_session.administered_items)
+    rejected_items: Set[int] = set(test_session.exposure_rejected_item_ids or [])
+    rejected_before = len(rejected_items)
 
     next_question = select_next_item(
         item_pool=item_pool,
@@ -997,7 +1039,12 @@ async def submit_adaptive_response(
         administered_items=administered_ids,
         domain_coverage=cat_session.domain_coverage,
         target_weights=settings.TEST_DOMAIN_WEIGHTS,
+        exposure_parameters=await async_get_exposure_parameters(db),
+        rejected_items=rejected_items,
     )
+    if len(rejected_items) != rejected_before:
+        # Sympson-Hetter rejections stay out for the rest of the session
+        test_session.exposure_rejected_item_ids = sorted(rejected_items)
 
     if not next_question:
         return await _finalize_adaptive_session(
@@ -1034,6 +1081,12 @@ async def submit_adaptive_response(
         )
         raise_conflict(ErrorMessages.duplicate_response(request.question_id))
 
+    exposure_monitor.record_selection(next_question.id)
+    if exposure_monitor.flush_due():
+        background_tasks.add_task(
+            safe_background_task, exposure_monitor.async_flush_in_own_session
+        )
+
     metrics.record_questions_served(count=1, adaptive=True)
 
     next_question_response = question_to_response(
@@ -1401,6 +1454,7 @@ async def _process_responses(
     test_session: TestSession,
     user_id: int,
     questions_dict: dict[int, Question],
+    update_distractor_stats: bool = True,
 ) -> ResponseProcessingResult:
     """
     Process and store all responses for a test submission.
@@ -1414,6 +1468,8 @@ async def _process_responses(
         test_session: The test session being submitted
         user_id: Current user's ID
         questions_dict: Dictionary mapping question IDs to Question objects
+        update_distractor_stats: Update distractor selection counts inline.
+            False when the post-submission pipeline defers them to a job.
 
     Returns:
         ResponseProcessingResult with counts and response objects
@@ -1459,6 +1515,9 @@ async def _process_responses(
         response_objects.append(response)
         response_count += 1
 
+        if not update_distractor_stats:
+            continue
+
         # DA-006: Update distractor statistics for multiple-choice questions
         # Graceful degradation: failures are logged but don't block response recording
         with graceful_failure(
@@ -1787,40 +1846,30 @@ async def _run_post_submission_updates(
             total_questions=response_count,
         )
 
+    # Fold response times into the percentile histograms (TASK-836)
+    with graceful_failure(
+        f"update response time histograms for session {session_id}",
+        logger,
+    ):
+        try:
+            await async_fold_session_response_times(db, session_id)
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+
 
 def _trigger_shadow_cat(session_id: int) -> None:
-    """Trigger shadow CAT execution in a background thread (TASK-875).
+    """Schedule shadow CAT execution on the bounded shadow CAT executor (TASK-875).
 
-    Spawns a daemon thread with its own database session to run the CAT
-    algorithm retrospectively on a fixed-form test submission. Follows
-    the same pattern as calibration_runner.py for thread-safe DB access.
+    The run happens in a pool thread with its own database session. If the
+    executor is saturated the session is dropped and left for the batch
+    catch-up command.
     """
+    from app.core.shadow_cat.executor import get_shadow_cat_executor
 
-    def _run_shadow_thread() -> None:
-        db = None
-        try:
-            from app.models.base import SessionLocal
-            from app.core.shadow_cat.runner import run_shadow_cat
-
-            db = SessionLocal()
-            run_shadow_cat(db, session_id)
-        except Exception as e:
-            logger.error(
-                f"Shadow CAT thread failed for session {session_id}: {e}",
-                exc_info=True,
-            )
-        finally:
-            if db is not None:
-                try:
-                    db.rollback()
-                except Exception:
-                    pass
-                finally:
-                    db.close()
-
-    thread = threading.Thread(target=_run_shadow_thread, daemon=True)
-    thread.start()
-    logger.info(f"Shadow CAT thread started for session {session_id}")
+    if get_shadow_cat_executor().submit(session_id) is not None:
+        logger.info(f"Shadow CAT scheduled for session {session_id}")
 
 
 @router.post("/submit", response_model=SubmitTestResponse)
@@ -1850,6 +1899,11 @@ async def submit_test(
     from app.models.models import TestResult
 
     user_id = current_user.id
+    # When the pipeline is enabled, every non-scoring stage is deferred to the
+    # post_submission_jobs queue and the response returns once the score is
+    # committed. Validity, SEM and response-time fields are filled in by the
+    # worker shortly afterwards (validity_checked_at stays NULL until then).
+    use_pipeline = settings.POST_SUBMISSION_PIPELINE_ENABLED
 
     # Step 1: Validate submission
     validation_result = await _validate_submission(db, submission, user_id)
@@ -1858,7 +1912,12 @@ async def submit_test(
 
     # Step 2: Process responses
     processing_result = await _process_responses(
-        db, submission, test_session, user_id, questions_dict
+        db,
+        submission,
+        test_session,
+        user_id,
+        questions_dict,
+        update_distractor_stats=not use_pipeline,
     )
     response_count = processing_result["response_count"]
     correct_count = processing_result["correct_count"]
@@ -1881,19 +1940,35 @@ async def submit_test(
         response_count,
     )
 
-    # Step 4: Analyze response times
-    response_time_flags = await _analyze_response_times(db, test_session.id)
+    if use_pipeline:
+        # Steps 4-6 run in the post-submission pipeline
+        response_time_flags = None
+        validity_result: ValidityAnalysisResult = {
+            "validity_status": "valid",
+            "validity_flags": None,
+            "validity_checked_at": None,
+        }
+        sem_result: SEMCalculationResult = {
+            "standard_error": None,
+            "ci_lower": None,
+            "ci_upper": None,
+        }
+    else:
+        # Step 4: Analyze response times
+        response_time_flags = await _analyze_response_times(db, test_session.id)
 
-    # Step 5: Run validity analysis
-    validity_result = _run_validity_analysis(
-        test_session.id,
-        submission,
-        questions_dict,
-        correct_count,
-    )
+        # Step 5: Run validity analysis
+        validity_result = _run_validity_analysis(
+            test_session.id,
+            submission,
+            questions_dict,
+            correct_count,
+        )
 
-    # Step 6: Calculate SEM and confidence interval
-    sem_result = await _calculate_sem_and_ci(db, test_session.id, score_result.iq_score)
+        # Step 6: Calculate SEM and confidence interval
+        sem_result = await _calculate_sem_and_ci(
+            db, test_session.id, score_result.iq_score
+        )
 
     # Step 7: Create TestResult record
     test_result = TestResult(
@@ -1915,6 +1990,25 @@ async def submit_test(
         ci_upper=sem_result["ci_upper"],
     )
     db.add(test_result)
+    await record_result_in_leaderboards(db, user_id, score_result.iq_score)
+
+    # Step 7.5: Queue the deferred stages in the same transaction as the score
+    if use_pipeline:
+        stages = [
+            stage
+            for stage in FIXED_FORM_STAGES
+            if not (test_session.is_adaptive and stage == STAGE_SHADOW_CAT)
+        ]
+        enqueue_post_submission_jobs(
+            db,
+            test_session.id,
+            stages,
+            payload={
+                "correct_count": correct_count,
+                "response_count": response_count,
+            },
+            max_attempts=settings.POST_SUBMISSION_MAX_ATTEMPTS,
+        )
 
     # Step 8: Commit all changes
     # IntegrityError catch is a safety net for race conditions in batch submissions
@@ -1938,12 +2032,15 @@ async def submit_test(
         )
 
     # Step 9: Run post-submission updates (non-critical)
-    await _run_post_submission_updates(
-        db,
-        test_session.id,
-        correct_count,
-        response_count,
-    )
+    if use_pipeline:
+        notify_post_submission_workers()
+    else:
+        await _run_post_submission_updates(
+            db,
+            test_session.id,
+            correct_count,
+            response_count,
+        )
 
     # Step 10: Track analytics and invalidate caches
     AnalyticsTracker.track_test_completed(
@@ -1965,7 +2062,8 @@ async def submit_test(
     invalidate_reliability_report_cache()
 
     # Step 10.5: Trigger shadow CAT for research comparison (TASK-875)
-    if not test_session.is_adaptive:
+    # (queued as a pipeline stage when the pipeline is enabled)
+    if not test_session.is_adaptive and not use_pipeline:
         with graceful_failure(
             f"trigger shadow CAT for session {test_session.id}",
             logger,
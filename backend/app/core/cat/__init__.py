@@ -28,11 +28,14 @@ from .calibration_runner import (
     calibration_runner,
 )
 from .data_export import (
+    EXPORT_MEDIA_TYPES,
     DataExportError,
     export_ctt_summary,
     export_response_details,
     export_response_matrix,
     export_responses_for_calibration,
+    export_to_file,
+    iter_export_chunks,
 )
 from .engine import (
     CATResult,
@@ -45,6 +48,10 @@ from .exposure_control import (
     ExposureMonitor,
     apply_randomesque,
 )
+from .exposure_store import (
+    SharedExposureMonitor,
+    exposure_monitor,
+)
 from .item_selection import (
     fisher_information_2pl,
     select_next_item,
@@ -54,6 +61,10 @@ from .readiness import (
     DomainReadiness,
     evaluate_cat_readiness,
 )
+from .readiness_aggregates import (
+    READINESS_THETA_GRID,
+    rebuild_readiness_aggregates,
+)
 from .score_conversion import (
     DomainScore,
     IQResult,
@@ -65,6 +76,11 @@ from .stopping_rules import (
     StoppingDecision,
     check_stopping_criteria,
 )
+from .sympson_hetter import (
+    SympsonHetterResult,
+    compute_exposure_parameters,
+    run_exposure_parameter_job,
+)
 
 __all__ = [
     "calibrate_questions_2pl",
@@ -83,9 +99,14 @@ __all__ = [
     "export_response_details",
     "export_ctt_summary",
     "DataExportError",
+    "iter_export_chunks",
+    "export_to_file",
+    "EXPORT_MEDIA_TYPES",
     "evaluate_cat_readiness",
     "CATReadinessResult",
     "DomainReadiness",
+    "READINESS_THETA_GRID",
+    "rebuild_readiness_aggregates",
     "CATSessionManager",
     "CATSession",
     "CATStepResult",
@@ -94,6 +115,11 @@ __all__ = [
     "estimate_ability_eap",
     "ExposureMonitor",
     "apply_randomesque",
+    "SharedExposureMonitor",
+    "exposure_monitor",
+    "SympsonHetterResult",
+    "compute_exposure_parameters",
+    "run_exposure_parameter_job",
     "fisher_information_2pl",
     "select_next_item",
     "track_domain_coverage",
@@ -9,8 +9,13 @@ CLI Usage:
         --output calibration_data.csv \
         [--question-ids 1,2,3] \
         [--min-responses 10] \
-        [--format csv|jsonl] \
-        [--export-type responses|matrix|details|ctt-summary]
+        [--format csv|jsonl|parquet] \
+        [--export-type responses|matrix|details|ctt-summary] \
+        [--chunk-size 5000]
+
+The responses, matrix and details exports are streamed to the output file in
+chunks, so memory use does not grow with the size of the response history.
+Parquet output requires pyarrow.
 """
 
 import argparse
@@ -18,10 +23,25 @@ import csv
 import io
 import json
 import logging
+import os
 from datetime import datetime
-from typing import Any, Dict, List, Mapping, Optional, Sequence, TypedDict
-
-from sqlalchemy import func
+from itertools import groupby
+from operator import attrgetter
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    TypedDict,
+    Union,
+)
+
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from app.models.models import Question, Response, TestSession, TestStatus
@@ -31,6 +51,16 @@ logger = logging.getLogger(__name__)
 # Constants for minimum response thresholds
 MIN_RESPONSES_DEFAULT = 10  # Default minimum responses per question
 
+# Streaming export options
+EXPORT_FORMATS = ("csv", "jsonl", "parquet")
+STREAMING_EXPORT_TYPES = ("responses", "matrix", "details")
+DEFAULT_STREAM_CHUNK_SIZE = 5000  # Rows per database fetch / encoded chunk
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "jsonl": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
 
 class DataExportError(Exception):
     """Custom exception for data export errors."""
@@ -112,7 +142,9 @@ def export_responses_for_calibration(
     Export response data for IRT calibration.
 
     This function exports detailed response data from completed, fixed-form tests
-    in a format suitable for IRT calibration tools.
+    in a format suitable for IRT calibration tools. The whole export is returned
+    as one string; use export_to_file() or iter_export_chunks() for large
+    exports.
 
     Args:
         db: SQLAlchemy session
@@ -128,115 +160,20 @@ def export_responses_for_calibration(
     Raises:
         DataExportError: If export fails
     """
-    try:
-        logger.info(
-            f"Starting calibration data export: format={output_format}, "
-            f"min_responses={min_responses}, "
-            f"start_date={start_date}, end_date={end_date}"
-        )
-
-        # Build base query for responses from completed, fixed-form sessions
-        query = (
-            db.query(
-                Response.user_id,
-                Response.question_id,
-                Response.is_correct,
-                Response.time_spent_seconds,
-                Response.test_session_id,
-                TestSession.completed_at,
-            )
-            .join(TestSession, Response.test_session_id == TestSession.id)
-            .filter(TestSession.status == TestStatus.COMPLETED)
-            .filter(TestSession.is_adaptive == False)  # noqa: E712
-        )
-
-        # Apply date filters
-        if start_date:
-            query = query.filter(TestSession.completed_at >= start_date)
-            logger.debug(f"Filtering responses after {start_date}")
-
-        if end_date:
-            query = query.filter(TestSession.completed_at <= end_date)
-            logger.debug(f"Filtering responses before {end_date}")
-
-        # Get all responses
-        responses = query.all()
-        logger.debug(f"Retrieved {len(responses)} total responses")
-
-        # Count responses per question
-        question_response_counts: Dict[int, int] = {}
-        for response in responses:
-            qid = response.question_id
-            question_response_counts[qid] = question_response_counts.get(qid, 0) + 1
-
-        # Filter questions by min_responses threshold
-        eligible_questions = {
-            qid
-            for qid, count in question_response_counts.items()
-            if count >= min_responses
-        }
-
-        if question_ids:
-            # Further filter by requested question IDs
-            eligible_questions = eligible_questions.intersection(set(question_ids))
-            logger.debug(
-                f"Filtered to {len(eligible_questions)} requested question IDs"
-            )
-
-        logger.debug(
-            f"Filtered to {len(eligible_questions)} questions with >= {min_responses} responses"
-        )
-
-        # Filter responses to only include eligible questions
-        filtered_responses = [
-            r for r in responses if r.question_id in eligible_questions
-        ]
-
-        logger.info(
-            f"Exporting {len(filtered_responses)} responses for "
-            f"{len(eligible_questions)} questions"
-        )
-
-        if not filtered_responses:
-            logger.warning("No responses match the filter criteria")
-            return "" if output_format == "csv" else ""
-
-        # Convert to export format
-        export_data: List[ResponseExportData] = [
-            {
-                "user_id": r.user_id,
-                "question_id": r.question_id,
-                "is_correct": 1 if r.is_correct else 0,
-                "response_time": r.time_spent_seconds,
-                "test_session_id": r.test_session_id,
-                "completed_at": r.completed_at.isoformat(),
-            }
-            for r in filtered_responses
-        ]
-
-        # Generate output
-        if output_format == "csv":
-            return _generate_csv(export_data)
-        elif output_format == "jsonl":
-            return _generate_jsonl(export_data)
-        else:
-            raise DataExportError(
-                f"Invalid output format: {output_format}",
-                context={"valid_formats": ["csv", "jsonl"]},
-            )
-
-    except DataExportError:
-        raise
-    except Exception as e:
-        logger.exception("Failed to export calibration data")
-        raise DataExportError(
-            "Failed to export calibration data",
-            original_error=e,
-            context={
-                "format": output_format,
-                "min_responses": min_responses,
-            },
-        ) from e
+    logger.info(
+        f"Starting calibration data export: format={output_format}, "
+        f"min_responses={min_responses}, "
+        f"start_date={start_date}, end_date={end_date}"
+    )
+    return _export_text(
+        db,
+        "responses",
+        output_format,
+        start_date=start_date,
+        end_date=end_date,
+        question_ids=question_ids,
+        min_responses=min_responses,
+    )
 
 
 def export_response_matrix(
@@ -265,93 +202,16 @@ def export_response_matrix(
     Raises:
         DataExportError: If export fails
     """
-    try:
-        logger.info("Starting response matrix export")
-
-        # Build base query for responses from completed, fixed-form sessions
-        query = (
-            db.query(
-                Response.user_id,
-                Response.question_id,
-                Response.is_correct,
-            )
-            .join(TestSession, Response.test_session_id == TestSession.id)
-            .filter(TestSession.status == TestStatus.COMPLETED)
-            .filter(TestSession.is_adaptive == False)  # noqa: E712
-        )
-
-        if start_date:
-            query = query.filter(TestSession.completed_at >= start_date)
-        if end_date:
-            query = query.filter(TestSession.completed_at <= end_date)
-
-        responses = query.all()
-
-        # Count responses per question and filter by min_responses
-        question_response_counts: Dict[int, int] = {}
-        for response in responses:
-            qid = response.question_id
-            question_response_counts[qid] = question_response_counts.get(qid, 0) + 1
-
-        eligible_questions = {
-            qid
-            for qid, count in question_response_counts.items()
-            if count >= min_responses
-        }
-
-        if question_ids:
-            eligible_questions = eligible_questions.intersection(set(question_ids))
-
-        # Filter responses
-        filtered_responses = [
-            r for r in responses if r.question_id in eligible_questions
-        ]
-
-        if not filtered_responses:
-            logger.warning("No responses match the filter criteria")
-            return ""
-
-        # Build matrix data structure
-        # user_id -> question_id -> is_correct (1 or 0)
-        matrix: Dict[int, Dict[int, int]] = {}
-        for r in filtered_responses:
-            if r.user_id not in matrix:
-                matrix[r.user_id] = {}
-            matrix[r.user_id][r.question_id] = 1 if r.is_correct else 0
-
-        # Sort question IDs for consistent output
-        sorted_question_ids = sorted(eligible_questions)
-        user_ids = sorted(matrix.keys())
-
-        logger.info(
-            f"Exporting matrix: {len(user_ids)} users x {len(sorted_question_ids)} questions"
-        )
-
-        # Generate CSV
-        output = io.StringIO()
-        writer = csv.writer(output)
-
-        # Header row: user_id, then question IDs
-        writer.writerow(["user_id"] + sorted_question_ids)
-
-        # Data rows
-        for user_id in user_ids:
-            row: List[Any] = [user_id]
-            for qid in sorted_question_ids:
-                # Use empty string for not attempted (NaN equivalent)
-                value = matrix[user_id].get(qid, "")
-                row.append(value)
-            writer.writerow(row)
-
-        return output.getvalue()
-
-    except Exception as e:
-        logger.exception("Failed to export response matrix")
-        raise DataExportError(
-            "Failed to export response matrix",
-            original_error=e,
-            context={"min_responses": min_responses},
-        ) from e
+    logger.info("Starting response matrix export")
+    return _export_text(
+        db,
+        "matrix",
+        "csv",
+        start_date=start_date,
+        end_date=end_date,
+        question_ids=question_ids,
+        min_responses=min_responses,
+    )
 
 
 def export_response_details(
@@ -382,102 +242,16 @@ def export_response_details(
     Raises:
         DataExportError: If export fails
     """
-    try:
-        logger.info(f"Starting response details export: format={output_format}")
-
-        # Build query with question data from completed, fixed-form sessions
-        query = (
-            db.query(
-                Response.user_id,
-                Response.question_id,
-                Response.is_correct,
-                Response.time_spent_seconds,
-                Question.question_type,
-                Question.difficulty_level,
-                Question.empirical_difficulty,
-                Question.discrimination,
-            )
-            .join(TestSession, Response.test_session_id == TestSession.id)
-            .join(Question, Response.question_id == Question.id)
-            .filter(TestSession.status == TestStatus.COMPLETED)
-            .filter(TestSession.is_adaptive == False)  # noqa: E712
-        )
-
-        if start_date:
-            query = query.filter(TestSession.completed_at >= start_date)
-        if end_date:
-            query = query.filter(TestSession.completed_at <= end_date)
-
-        responses = query.all()
-
-        # Count responses per question and filter
-        question_response_counts: Dict[int, int] = {}
-        for response in responses:
-            qid = response.question_id
-            question_response_counts[qid] = question_response_counts.get(qid, 0) + 1
-
-        eligible_questions = {
-            qid
-            for qid, count in question_response_counts.items()
-            if count >= min_responses
-        }
-
-        if question_ids:
-            eligible_questions = eligible_questions.intersection(set(question_ids))
-
-        filtered_responses = [
-            r for r in responses if r.question_id in eligible_questions
-        ]
-
-        logger.info(f"Exporting {len(filtered_responses)} detailed response records")
-
-        if not filtered_responses:
-            logger.warning("No responses match the filter criteria")
-            return "" if output_format == "csv" else ""
-
-        # Convert to export format
-        export_data: List[ResponseDetailData] = [
-            {
-                "user_id": r.user_id,
-                "question_id": r.question_id,
-                "is_correct": 1 if r.is_correct else 0,
-                "time_spent_seconds": r.time_spent_seconds,
-                "question_type": (
-                    r.question_type.value
-                    if hasattr(r.question_type, "value")
-                    else str(r.question_type)
-                ),
-                "difficulty_level": (
-                    r.difficulty_level.value
-                    if hasattr(r.difficulty_level, "value")
-                    else str(r.difficulty_level)
-                ),
-                "empirical_difficulty": r.empirical_difficulty,
-                "discrimination": r.discrimination,
-            }
-            for r in filtered_responses
-        ]
-
-        # Generate output
-        if output_format == "csv":
-            return _generate_csv(export_data)
-        elif output_format == "jsonl":
-            return _generate_jsonl(export_data)
-        else:
-            raise DataExportError(
-                f"Invalid output format: {output_format}",
-                context={"valid_formats": ["csv", "jsonl"]},
-            )
-
-    except DataExportError:
-        raise
-    except Exception as e:
-        logger.exception("Failed to export response details")
-        raise DataExportError(
-            "Failed to export response details",
-            original_error=e,
-            context={"format": output_format, "min_responses": min_responses},
-        ) from e
+    logger.info(f"Starting response details export: format={output_format}")
+    return _export_text(
+        db,
+        "details",
+        output_format,
+        start_date=start_date,
+        end_date=end_date,
+        question_ids=question_ids,
+        min_responses=min_responses,
+    )
 
 
 def export_ctt_summary(
@@ -611,17 +385,485 @@ def _generate_csv(data: Sequence[Mapping[str, Any]]) -> str:
     return output.getvalue()
 
 
-def _generate_jsonl(data: Sequence[Mapping[str, Any]]) -> str:
-    """Generate JSONL string (one JSON object per line)."""
-    if not data:
-        return ""
+# Streaming exports
+#
+# Rows are read through a server-side cursor (Query.yield_per) and encoded in
+# chunks of ``chunk_size`` records, so memory stays proportional to one chunk
+# (plus one row of the matrix export) rather than to the response history.
+# Question eligibility (min_responses) is computed by the database with a
+# GROUP BY / HAVING subquery instead of counting every response in Python.
 
-    output = io.StringIO()
-    for record in data:
-        json.dump(record, output)
-        output.write("\n")
 
-    return output.getvalue()
+def iter_export_chunks(
+    db: Session,
+    export_type: str = "responses",
+    output_format: str = "csv",
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    question_ids: Optional[List[int]] = None,
+    min_responses: int = MIN_RESPONSES_DEFAULT,
+    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """
+    Stream an export as encoded byte chunks.
+
+    The iterator can be written to a file (see export_to_file()) or passed
+    straight to a Starlette/FastAPI ``StreamingResponse`` with the media type
+    from EXPORT_MEDIA_TYPES. Arguments are validated before the first chunk is
+    requested, so invalid options fail immediately.
+
+    Args:
+        db: SQLAlchemy session (kept busy until the iterator is exhausted)
+        export_type: "responses", "matrix" or "details"
+        output_format: "csv", "jsonl" or "parquet" (matrix: csv only)
+        start_date: Filter by date range start (optional)
+        end_date: Filter by date range end (optional)
+        question_ids: Optional list of question IDs to filter
+        min_responses: Minimum response count per question (default: 10)
+        chunk_size: Records per database fetch and per encoded chunk
+
+    Returns:
+        Iterator of encoded chunks; empty when nothing matches
+
+    Raises:
+        DataExportError: If the options are invalid, or (while iterating)
+            if the export fails
+    """
+    _validate_stream_options(export_type, output_format, chunk_size)
+    filters = _ExportFilters(start_date, end_date, question_ids, min_responses)
+
+    if export_type == "matrix":
+        chunks = _encode_matrix_csv(db, filters, chunk_size)
+    else:
+        records = (
+            _iter_response_records(db, filters, chunk_size)
+            if export_type == "responses"
+            else _iter_detail_records(db, filters, chunk_size)
+        )
+        if output_format == "csv":
+            chunks = _encode_csv(records, chunk_size)
+        elif output_format == "jsonl":
+            chunks = _encode_jsonl(records, chunk_size)
+        else:
+            chunks = _encode_parquet(
+                records, _PARQUET_SCHEMAS[export_type](), chunk_size
+            )
+    return _guard_export(chunks, export_type, output_format, min_responses)
+
+
+def export_to_file(
+    db: Session,
+    output: Union[str, "os.PathLike[str]", BinaryIO],
+    export_type: str = "responses",
+    output_format: str = "csv",
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    question_ids: Optional[List[int]] = None,
+    min_responses: int = MIN_RESPONSES_DEFAULT,
+    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+) -> int:
+    """
+    Stream an export into a file, one chunk at a time.
+
+    Args:
+        db: SQLAlchemy session
+        output: File path, or a binary file object opened for writing
+        export_type: "responses", "matrix" or "details"
+        output_format: "csv", "jsonl" or "parquet" (matrix: csv only)
+        start_date: Filter by date range start (optional)
+        end_date: Filter by date range end (optional)
+        question_ids: Optional list of question IDs to filter
+        min_responses: Minimum response count per question (default: 10)
+        chunk_size: Records per database fetch and per encoded chunk
+
+    Returns:
+        Number of bytes written
+
+    Raises:
+        DataExportError: If export fails
+    """
+    chunks = iter_export_chunks(
+        db,
+        export_type=export_type,
+        output_format=output_format,
+        start_date=start_date,
+        end_date=end_date,
+        question_ids=question_ids,
+        min_responses=min_responses,
+        chunk_size=chunk_size,
+    )
+    if isinstance(output, (str, os.PathLike)):
+        with open(output, "wb") as f:
+            return _write_chunks(chunks, f)
+    return _write_chunks(chunks, output)
+
+
+class _ExportFilters(NamedTuple):
+    start_date: Optional[datetime]
+    end_date: Optional[datetime]
+    question_ids: Optional[List[int]]
+    min_responses: int
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only binary stream whose contents are drained after each chunk.
+
+    tell() keeps counting across drains, which pyarrow relies on to record
+    offsets in the Parquet footer.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._parts: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:  # type: ignore[override]
+        chunk = bytes(data)
+        self._parts.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts.clear()
+        return data
+
+
+def _export_text(
+    db: Session,
+    export_type: str,
+    output_format: str,
+    **filters: Any,
+) -> str:
+    """Collect a text export into one string (legacy string-returning API)."""
+    if output_format not in ("csv", "jsonl"):
+        raise DataExportError(
+            f"Invalid output format: {output_format}",
+            context={"valid_formats": ["csv", "jsonl"]},
+        )
+    chunks = iter_export_chunks(db, export_type, output_format, **filters)
+    return b"".join(chunks).decode("utf-8")
+
+
+def _validate_stream_options(
+    export_type: str, output_format: str, chunk_size: int
+) -> None:
+    if export_type not in STREAMING_EXPORT_TYPES:
+        raise DataExportError(
+            f"Invalid export type: {export_type}",
+            context={"valid_export_types": list(STREAMING_EXPORT_TYPES)},
+        )
+    if output_format not in EXPORT_FORMATS:
+        raise DataExportError(
+            f"Invalid output format: {output_format}",
+            context={"valid_formats": list(EXPORT_FORMATS)},
+        )
+    if export_type == "matrix" and output_format != "csv":
+        raise DataExportError(
+            "Matrix export only supports CSV format",
+            context={"format": output_format},
+        )
+    if chunk_size < 1:
+        raise DataExportError(
+            "chunk_size must be at least 1", context={"chunk_size": chunk_size}
+        )
+    if output_format == "parquet":
+        _require_pyarrow()
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise DataExportError(
+            "pyarrow is required for Parquet export. "
+            "Install it with: pip install pyarrow",
+            original_error=e,
+        ) from e
+    return pyarrow, pyarrow.parquet
+
+
+def _guard_export(
+    chunks: Iterator[bytes],
+    export_type: str,
+    output_format: str,
+    min_responses: int,
+) -> Iterator[bytes]:
+    """Re-raise failures while streaming as DataExportError."""
+    try:
+        yield from chunks
+    except DataExportError:
+        raise
+    except Exception as e:
+        label = _EXPORT_LABELS[export_type]
+        logger.exception(f"Failed to export {label}")
+        raise DataExportError(
+            f"Failed to export {label}",
+            original_error=e,
+            context={"format": output_format, "min_responses": min_responses},
+        ) from e
+
+
+def _write_chunks(chunks: Iterator[bytes], f: BinaryIO) -> int:
+    written = 0
+    for chunk in chunks:
+        f.write(chunk)
+        written += len(chunk)
+    return written
+
+
+def _completed_fixed_form(query, filters: _ExportFilters):
+    """Restrict a Response query to completed, fixed-form sessions in range."""
+    query = (
+        query.join(TestSession, Response.test_session_id == TestSession.id)
+        .filter(TestSession.status == TestStatus.COMPLETED)
+        .filter(TestSession.is_adaptive == False)  # noqa: E712
+    )
+    if filters.start_date:
+        query = query.filter(TestSession.completed_at >= filters.start_date)
+    if filters.end_date:
+        query = query.filter(TestSession.completed_at <= filters.end_date)
+    return query
+
+
+def _eligible_questions(db: Session, filters: _ExportFilters):
+    """Query of question IDs with at least min_responses responses in range."""
+    query = _completed_fixed_form(db.query(Response.question_id), filters)
+    if filters.question_ids:
+        query = query.filter(Response.question_id.in_(filters.question_ids))
+    return query.group_by(Response.question_id).having(
+        func.count(Response.id) >= filters.min_responses
+    )
+
+
+def _iter_response_records(
+    db: Session, filters: _ExportFilters, chunk_size: int
+) -> Iterator[ResponseExportData]:
+    eligible = _eligible_questions(db, filters).subquery()
+    query = (
+        _completed_fixed_form(
+            db.query(
+                Response.user_id,
+                Response.question_id,
+                Response.is_correct,
+                Response.time_spent_seconds,
+                Response.test_session_id,
+                TestSession.completed_at,
+            ),
+            filters,
+        )
+        .filter(Response.question_id.in_(select(eligible.c.question_id)))
+        .order_by(Response.id)
+        .yield_per(chunk_size)
+    )
+    for r in query:
+        yield {
+            "user_id": r.user_id,
+            "question_id": r.question_id,
+            "is_correct": 1 if r.is_correct else 0,
+            "response_time": r.time_spent_seconds,
+            "test_session_id": r.test_session_id,
+            "completed_at": r.completed_at.isoformat(),
+        }
+
+
+def _iter_detail_records(
+    db: Session, filters: _ExportFilters, chunk_size: int
+) -> Iterator[ResponseDetailData]:
+    eligible = _eligible_questions(db, filters).subquery()
+    query = (
+        _completed_fixed_form(
+            db.query(
+                Response.user_id,
+                Response.question_id,
+                Response.is_correct,
+                Response.time_spent_seconds,
+                Question.question_type,
+                Question.difficulty_level,
+                Question.empirical_difficulty,
+                Question.discrimination,
+            ),
+            filters,
+        )
+        .join(Question, Response.question_id == Question.id)
+        .filter(Response.question_id.in_(select(eligible.c.question_id)))
+        .order_by(Response.id)
+        .yield_per(chunk_size)
+    )
+    for r in query:
+        yield {
+            "user_id": r.user_id,
+            "question_id": r.question_id,
+            "is_correct": 1 if r.is_correct else 0,
+            "time_spent_seconds": r.time_spent_seconds,
+            "question_type": (
+                r.question_type.value
+                if hasattr(r.question_type, "value")
+                else str(r.question_type)
+            ),
+            "difficulty_level": (
+                r.difficulty_level.value
+                if hasattr(r.difficulty_level, "value")
+                else str(r.difficulty_level)
+            ),
+            "empirical_difficulty": r.empirical_difficulty,
+            "discrimination": r.discrimination,
+        }
+
+
+def _encode_csv(
+    records: Iterator[Mapping[str, Any]], chunk_size: int
+) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer: Optional[csv.DictWriter] = None
+    pending = 0
+    for record in records:
+        if writer is None:
+            writer = csv.DictWriter(buffer, fieldnames=list(record.keys()))
+            writer.writeheader()
+        writer.writerow(record)
+        pending += 1
+        if pending >= chunk_size:
+            yield _drain_text(buffer)
+            pending = 0
+    if buffer.tell():
+        yield _drain_text(buffer)
+
+
+def _encode_jsonl(
+    records: Iterator[Mapping[str, Any]], chunk_size: int
+) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    pending = 0
+    for record in records:
+        buffer.write(json.dumps(record))
+        buffer.write("\n")
+        pending += 1
+        if pending >= chunk_size:
+            yield _drain_text(buffer)
+            pending = 0
+    if buffer.tell():
+        yield _drain_text(buffer)
+
+
+def _encode_parquet(
+    records: Iterator[Mapping[str, Any]], schema: Any, chunk_size: int
+) -> Iterator[bytes]:
+    pa, pq = _require_pyarrow()
+    sink = _ChunkSink()
+    writer = None
+    batch: List[Mapping[str, Any]] = []
+
+    def flush() -> bytes:
+        nonlocal writer
+        if writer is None:
+            writer = pq.ParquetWriter(sink, schema)
+        writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+        batch.clear()
+        return sink.drain()
+
+    for record in records:
+        batch.append(record)
+        if len(batch) >= chunk_size:
+            yield flush()
+    if batch:
+        yield flush()
+    if writer is not None:
+        writer.close()
+        yield sink.drain()
+
+
+def _encode_matrix_csv(
+    db: Session, filters: _ExportFilters, chunk_size: int
+) -> Iterator[bytes]:
+    """Stream the users x items matrix, one user row at a time."""
+    eligible_query = _eligible_questions(db, filters)
+    sorted_question_ids = sorted(qid for (qid,) in eligible_query)
+    if not sorted_question_ids:
+        logger.warning("No responses match the filter criteria")
+        return
+
+    eligible = eligible_query.subquery()
+    rows = (
+        _completed_fixed_form(
+            db.query(Response.user_id, Response.question_id, Response.is_correct),
+            filters,
+        )
+        .filter(Response.question_id.in_(select(eligible.c.question_id)))
+        .order_by(Response.user_id, Response.id)
+        .yield_per(chunk_size)
+    )
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # Header row: user_id, then question IDs
+    writer.writerow(["user_id"] + sorted_question_ids)
+    pending = 0
+    for user_id, user_rows in groupby(rows, key=attrgetter("user_id")):
+        answers = {r.question_id: 1 if r.is_correct else 0 for r in user_rows}
+        # Use empty string for not attempted (NaN equivalent)
+        writer.writerow([user_id] + [answers.get(q, "") for q in sorted_question_ids])
+        pending += 1
+        if pending >= chunk_size:
+            yield _drain_text(buffer)
+            pending = 0
+    yield _drain_text(buffer)
+
+
+def _drain_text(buffer: io.StringIO) -> bytes:
+    data = buffer.getvalue().encode("utf-8")
+    buffer.seek(0)
+    buffer.truncate()
+    return data
+
+
+def _response_parquet_schema():
+    pa, _ = _require_pyarrow()
+    return pa.schema(
+        [
+            ("user_id", pa.int64()),
+            ("question_id", pa.int64()),
+            ("is_correct", pa.int8()),
+            ("response_time", pa.int64()),
+            ("test_session_id", pa.int64()),
+            ("completed_at", pa.string()),
+        ]
+    )
+
+
+def _detail_parquet_schema():
+    pa, _ = _require_pyarrow()
+    return pa.schema(
+        [
+            ("user_id", pa.int64()),
+            ("question_id", pa.int64()),
+            ("is_correct", pa.int8()),
+            ("time_spent_seconds", pa.int64()),
+            ("question_type", pa.string()),
+            ("difficulty_level", pa.string()),
+            ("empirical_difficulty", pa.float64()),
+            ("discrimination", pa.float64()),
+        ]
+    )
+
+
+_PARQUET_SCHEMAS = {
+    "responses": _response_parquet_schema,
+    "details": _detail_parquet_schema,
+}
+
+_EXPORT_LABELS = {
+    "responses": "calibration data",
+    "matrix": "response matrix",
+    "details": "response details",
+}
 
 
 def main():
@@ -659,9 +901,9 @@ def main():
     parser.add_argument(
         "--format",
         type=str,
-        choices=["csv", "jsonl"],
+        choices=list(EXPORT_FORMATS),
         default="csv",
-        help="Output format (default: csv)",
+        help="Output format (default: csv; parquet requires pyarrow)",
     )
     parser.add_argument(
         "--export-type",
@@ -670,6 +912,15 @@ def main():
         default="responses",
         help="Type of export (default: responses)",
     )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_STREAM_CHUNK_SIZE,
+        help=(
+            "Rows fetched and written per chunk for streamed exports "
+            f"(default: {DEFAULT_STREAM_CHUNK_SIZE})"
+        ),
+    )
 
     args = parser.parse_args()
 
@@ -692,51 +943,31 @@ def main():
     db = SessionLocal()
 
     try:
-        # Select export function based on type
-        if args.export_type == "responses":
-            output = export_responses_for_calibration(
-                db=db,
-                start_date=start_date,
-                end_date=end_date,
-                question_ids=question_ids,
-                min_responses=args.min_responses,
-                output_format=args.format,
-            )
-        elif args.export_type == "matrix":
+        if args.export_type == "ctt-summary":
             if args.format != "csv":
-                raise ValueError("Matrix export only supports CSV format")
-            output = export_response_matrix(
+                raise ValueError("CTT summary export only supports CSV format")
+            output = export_ctt_summary(
                 db=db,
                 start_date=start_date,
                 end_date=end_date,
                 question_ids=question_ids,
                 min_responses=args.min_responses,
             )
-        elif args.export_type == "details":
-            output = export_response_details(
-                db=db,
-                start_date=start_date,
-                end_date=end_date,
-                question_ids=question_ids,
-                min_responses=args.min_responses,
+            with open(args.output, "w") as f:
+                f.write(output)
+        else:
+            # Stream straight to the file instead of building it in memory
+            export_to_file(
+                db,
+                args.output,
+                export_type=args.export_type,
                 output_format=args.format,
-            )
-        elif args.export_type == "ctt-summary":
-            if args.format != "csv":
-                raise ValueError("CTT summary export only supports CSV format")
-            output = export_ctt_summary(
-                db=db,
                 start_date=start_date,
                 end_date=end_date,
                 question_ids=question_ids,
                 min_responses=args.min_responses,
+                chunk_size=args.chunk_size,
             )
-        else:
-            raise ValueError(f"Unknown export type: {args.export_type}")
-
-        # Write to file
-        with open(args.output, "w") as f:
-            f.write(output)
 
         print(f"Successfully exported data to {args.output}")
         print(f"Export type: {args.export_type}")
@@ -14,6 +14,10 @@ Key components:
     - apply_randomesque(): Public API for randomesque selection with monitoring
     - ExposureMonitor: Thread-safe tracking of per-item exposure rates
 
+Sympson-Hetter exposure parameters (sympson_hetter.py) bound the exposure
+rate of individual items on top of randomesque selection; see
+select_next_item's ``exposure_parameters``.
+
 References:
     - Kingsbury, G.G., & Zara, A.R. (1989). Procedures for selecting items for
       computerized adaptive tests.
@@ -93,9 +97,9 @@ class ExposureMonitor:
     """
     Tracks per-item exposure rates and alerts on over-exposure.
 
-    Thread-safe. Uses in-memory counters. Designed to run within a
-    single backend process; for multi-process deployments, use a
-    shared store (Redis, database) as a future enhancement.
+    Thread-safe. Uses in-memory counters, so it only sees the selections of
+    one backend process; SharedExposureMonitor (exposure_store.py) adds
+    database-backed counts shared by all workers.
 
     Exposure rate is defined as:
         rate_i = (selections_i) / (total_selections)
@@ -0,0 +1,337 @@
+"""
+Shared, persistent item exposure tracking for CAT (TASK-868).
+
+``ExposureMonitor`` counts selections in the memory of a single process, so
+each API worker only sees its own share and the counts are lost on restart.
+``SharedExposureMonitor`` keeps the same interface but also adds every
+worker's selections to ``item_exposure_counts``:
+
+- ``record_selection`` stays an in-memory increment on the request path
+- once ``flush_due`` (CAT_EXPOSURE_FLUSH_SELECTIONS selections or
+  CAT_EXPOSURE_FLUSH_INTERVAL_SECONDS since the last flush), ``flush`` /
+  ``async_flush`` add the pending counts with one INSERT ... ON CONFLICT
+  statement in their own short transaction, then reload the fleet-wide
+  counts and run ``check_and_alert`` on them, so overexposure warnings
+  cover every worker
+- request handlers schedule ``async_flush_in_own_session`` as a background
+  task, so the flush never shares (or rolls back) the request's session and
+  never delays its response
+
+Flushing never raises: if the write fails the pending counts are dropped and
+logged, so exposure bookkeeping cannot fail a test request.
+
+Sympson-Hetter exposure parameters, the live control that keeps exposure
+bounded, are computed offline by simulation (see sympson_hetter.py) and read
+from the configuration snapshot (system_config.async_get_exposure_parameters).
+"""
+
+import logging
+import time
+from typing import Callable, Dict, List, Mapping, Optional
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.cat.exposure_control import (
+    DEFAULT_EXPOSURE_ALERT_THRESHOLD,
+    ExposureMonitor,
+)
+from app.core.config import settings
+from app.core.datetime_utils import utc_now
+from app.models.base import AsyncSessionLocal
+from app.models.models import ItemExposureCount
+
+logger = logging.getLogger(__name__)
+
+# Counts per INSERT ... ON CONFLICT statement (keeps bind parameters well under
+# the SQLite and PostgreSQL limits)
+UPSERT_BATCH_ITEMS = 1000
+
+
+def _upsert_statements(dialect_name: str, counts: Mapping[int, int]) -> List:
+    """
+    Build INSERT ... ON CONFLICT statements adding ``counts`` to the table.
+
+    Rows are written in question ID order so concurrent flushes from several
+    workers lock them in the same order.
+
+    Args:
+        dialect_name: "postgresql" or "sqlite"
+        counts: Question ID -> selections to add
+
+    Returns:
+        Statements to execute, one per UPSERT_BATCH_ITEMS items
+    """
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise NotImplementedError(
+            f"Item exposure counts do not support the {dialect_name} dialect"
+        )
+
+    now = utc_now()
+    values = [
+        {"question_id": question_id, "selection_count": count, "updated_at": now}
+        for question_id, count in sorted(counts.items())
+    ]
+    table = ItemExposureCount.__table__
+    statements = []
+    for start in range(0, len(values), UPSERT_BATCH_ITEMS):
+        stmt = insert(table).values(values[start : start + UPSERT_BATCH_ITEMS])
+        statements.append(
+            stmt.on_conflict_do_update(
+                index_elements=[table.c.question_id],
+                set_={
+                    "selection_count": table.c.selection_count
+                    + stmt.excluded.selection_count,
+                    "updated_at": stmt.excluded.updated_at,
+                },
+            )
+        )
+    return statements
+
+
+def _counts_query() -> Select:
+    return select(ItemExposureCount.question_id, ItemExposureCount.selection_count)
+
+
+class SharedExposureMonitor(ExposureMonitor):
+    """
+    ExposureMonitor whose counts are shared by all workers through the database.
+
+    Between flushes the counts are the fleet-wide totals as of the last flush
+    plus this worker's pending selections.
+
+    Attributes:
+        alert_threshold: Exposure rate above which items are flagged (0.0-1.0).
+        flush_selections: Pending selections that make a flush due.
+        flush_interval_seconds: Time since the last flush that makes a flush
+            due (when anything is pending).
+    """
+
+    def __init__(
+        self,
+        alert_threshold: float = DEFAULT_EXPOSURE_ALERT_THRESHOLD,
+        flush_selections: int = settings.CAT_EXPOSURE_FLUSH_SELECTIONS,
+        flush_interval_seconds: float = settings.CAT_EXPOSURE_FLUSH_INTERVAL_SECONDS,
+    ):
+        """
+        Initialize the monitor.
+
+        Args:
+            alert_threshold: Exposure rate threshold for alerts (default 0.15).
+            flush_selections: Pending selections that make a flush due.
+            flush_interval_seconds: Seconds after which pending selections are
+                flushed regardless of their number.
+
+        Raises:
+            ValueError: If alert_threshold is not in range [0.0, 1.0].
+        """
+        super().__init__(alert_threshold)
+        self.flush_selections = flush_selections
+        self.flush_interval_seconds = flush_interval_seconds
+        self._pending: Dict[int, int] = {}
+        self._pending_total = 0
+        self._last_flush = time.monotonic()
+
+    def record_selection(self, item_id: int) -> None:
+        """
+        Record that an item was selected in a test session.
+
+        Thread-safe. Only updates memory; the selection reaches the database
+        with the next flush.
+
+        Args:
+            item_id: The database ID of the selected question.
+        """
+        with self._lock:
+            self._item_counts[item_id] = self._item_counts.get(item_id, 0) + 1
+            self._total_selections += 1
+            self._pending[item_id] = self._pending.get(item_id, 0) + 1
+            self._pending_total += 1
+
+    @property
+    def pending_selections(self) -> int:
+        """Selections recorded by this worker and not flushed yet."""
+        with self._lock:
+            return self._pending_total
+
+    def flush_due(self) -> bool:
+        """
+        Check whether the pending selections should be flushed.
+
+        Returns:
+            True if at least flush_selections are pending, or anything is
+            pending and flush_interval_seconds have passed since the last flush.
+        """
+        with self._lock:
+            if self._pending_total >= self.flush_selections:
+                return True
+            return (
+                self._pending_total > 0
+                and time.monotonic() - self._last_flush >= self.flush_interval_seconds
+            )
+
+    def _take_pending(self) -> Dict[int, int]:
+        with self._lock:
+            pending = self._pending
+            self._pending = {}
+            self._pending_total = 0
+            self._last_flush = time.monotonic()
+            return pending
+
+    def _install(self, counts: Mapping[int, int]) -> None:
+        """Replace the counts with the fleet-wide ones plus what is pending."""
+        with self._lock:
+            merged = dict(counts)
+            for item_id, count in self._pending.items():
+                merged[item_id] = merged.get(item_id, 0) + count
+            self._item_counts = merged
+            self._total_selections = sum(merged.values())
+
+    def reset(self) -> None:
+        """
+        Reset the in-memory counters, including unflushed selections.
+
+        The database counts are untouched; the next refresh or flush loads
+        them again.
+        """
+        with self._lock:
+            self._pending.clear()
+            self._pending_total = 0
+        super().reset()
+
+    # -------------------------------------------------------------------------
+    # Sync API
+    # -------------------------------------------------------------------------
+
+    def refresh(self, db: Session) -> None:
+        """
+        Load the fleet-wide counts from the database.
+
+        Args:
+            db: Database session
+        """
+        self._install(dict(db.execute(_counts_query()).tuples().all()))
+
+    def flush(self, db: Session) -> int:
+        """
+        Add the pending selections to the database, reload the counts and
+        log any items above the alert threshold fleet-wide.
+
+        Commits its own transaction, so call it between units of work.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of selections written (0 if nothing was pending or the
+            write failed)
+        """
+        pending = self._take_pending()
+        if not pending:
+            return 0
+        try:
+            for stmt in _upsert_statements(db.get_bind().dialect.name, pending):
+                db.execute(stmt)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            return self._log_failed_flush(pending, e)
+        try:
+            self.refresh(db)
+        except Exception as e:
+            logger.warning(f"Failed to reload item exposure counts: {e}")
+        else:
+            self.check_and_alert()
+        return sum(pending.values())
+
+    def flush_if_due(self, db: Session) -> int:
+        """Flush if ``flush_due()``; see flush()."""
+        return self.flush(db) if self.flush_due() else 0
+
+    # -------------------------------------------------------------------------
+    # Async API
+    # -------------------------------------------------------------------------
+
+    async def async_refresh(self, db: AsyncSession) -> None:
+        """
+        Load the fleet-wide counts from the database (async version).
+
+        Args:
+            db: Async database session
+        """
+        result = await db.execute(_counts_query())
+        self._install(dict(result.tuples().all()))
+
+    async def async_flush(self, db: AsyncSession) -> int:
+        """
+        Add the pending selections to the database, reload the counts and
+        log any items above the alert threshold fleet-wide (async version).
+
+        Commits its own transaction, so call it after the request's commit.
+
+        Args:
+            db: Async database session
+
+        Returns:
+            Number of selections written (0 if nothing was pending or the
+            write failed)
+        """
+        pending = self._take_pending()
+        if not pending:
+            return 0
+        try:
+            for stmt in _upsert_statements(db.get_bind().dialect.name, pending):
+                await db.execute(stmt)
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            return self._log_failed_flush(pending, e)
+        try:
+            await self.async_refresh(db)
+        except Exception as e:
+            logger.warning(f"Failed to reload item exposure counts: {e}")
+        else:
+            self.check_and_alert()
+        return sum(pending.values())
+
+    async def async_flush_if_due(self, db: AsyncSession) -> int:
+        """Flush if ``flush_due()``; see async_flush()."""
+        return await self.async_flush(db) if self.flush_due() else 0
+
+    async def async_flush_in_own_session(
+        self, session_factory: Optional[Callable[[], AsyncSession]] = None
+    ) -> int:
+        """
+        Flush if ``flush_due()``, in a session of its own.
+
+        Meant to run as a background task after the response: a failed
+        write's rollback expires every instance loaded in its session, which
+        would break a request still building its response from them.
+
+        Args:
+            session_factory: Async session factory (default: AsyncSessionLocal)
+
+        Returns:
+            Number of selections written; see async_flush()
+        """
+        if not self.flush_due():
+            return 0
+        async with (session_factory or AsyncSessionLocal)() as db:
+            return await self.async_flush(db)
+
+    @staticmethod
+    def _log_failed_flush(pending: Mapping[int, int], error: Exception) -> int:
+        logger.error(
+            f"Failed to flush item exposure counts, dropping "
+            f"{sum(pending.values())} selections of {len(pending)} items: {error}"
+        )
+        return 0
+
+
+# Process-wide monitor used by the adaptive test endpoints
+exposure_monitor = SharedExposureMonitor()
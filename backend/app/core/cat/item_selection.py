@@ -12,7 +12,8 @@ The selection pipeline:
 1. Filter out already-administered items and previously seen items
 2. Apply content balancing constraints (domain coverage)
 3. Compute Fisher information for each eligible item at current theta
-4. Apply exposure control via randomesque selection from top-K items
+4. Apply exposure control via randomesque selection from top-K items,
+   optionally filtered by Sympson-Hetter exposure parameters
 5. Return the selected item
 
 References:
@@ -20,6 +21,8 @@ References:
       adaptive testing.
     - Chang, H.-H., & Ying, Z. (1999). a-Stratified multistage
       computerized adaptive testing.
+    - Sympson, J.B., & Hetter, R.D. (1985). Controlling item-exposure rates
+      in computerized adaptive testing.
 """
 
 import logging
@@ -30,6 +33,7 @@ from typing import (
     Any,
     Dict,
     List,
+    Mapping,
     Optional,
     Protocol,
     Sequence,
@@ -131,17 +135,23 @@ def select_next_item(
     min_items_per_domain: int = 2,
     max_items: int = 15,
     randomesque_k: int = RANDOMESQUE_K,
+    exposure_parameters: Optional[Mapping[int, float]] = None,
+    rejected_items: Optional[Set[int]] = None,
+    rng: Optional[random.Random] = None,
 ) -> Optional[Any]:
     """
     Select the next item using Maximum Fisher Information with constraints.
 
     Selection pipeline:
-    1. Filter out administered and previously seen items
+    1. Filter out administered, previously seen and exposure-rejected items
     2. Require calibrated IRT parameters (irt_discrimination, irt_difficulty)
     3. Apply content balancing: if any domain is below min_items_per_domain
        and the test has room, restrict the pool to under-represented domains
     4. Compute Fisher information at current theta for each eligible item
-    5. Apply randomesque exposure control: select randomly from the top-K items
+    5. Apply randomesque exposure control: select randomly from the top-K items.
+       With Sympson-Hetter exposure parameters, the pick is then administered
+       with probability K_i; a rejected item is dropped and the pick repeated,
+       and stays excluded for the rest of the session via ``rejected_items``
 
     Args:
         item_pool: List of Question model instances (must have id,
@@ -162,6 +172,14 @@ def select_next_item(
             content balancing is feasible).
         randomesque_k: Number of top items to select from randomly for
             exposure control. Set to 1 to disable randomesque selection.
+        exposure_parameters: Optional mapping of item ID -> Sympson-Hetter
+            exposure parameter K_i in (0, 1]. Items not in the mapping are
+            always administered when picked (K_i = 1).
+        rejected_items: Optional set of question IDs rejected by the
+            Sympson-Hetter draw earlier in this session. They are excluded
+            from the pool, and items rejected by this call are added to the
+            set, which the caller keeps for the session's later picks.
+        rng: Optional Random instance for deterministic testing.
 
     Returns:
         A Question instance from the pool, or None if no eligible items remain.
@@ -179,7 +197,9 @@ def select_next_item(
     # Step 1: Filter out administered and seen items, require calibrated params
     excluded_ids = administered_items
     if seen_question_ids is not None:
-        excluded_ids = administered_items | seen_question_ids
+        excluded_ids = excluded_ids | seen_question_ids
+    if rejected_items:
+        excluded_ids = excluded_ids | rejected_items
 
     eligible = [
         item
@@ -229,7 +249,13 @@ def select_next_item(
     # Step 4: Sort by information (descending) and apply randomesque selection
     candidates.sort(key=lambda c: c.information, reverse=True)
 
-    selected_candidate = _apply_exposure_control(candidates, randomesque_k)
+    selected_candidate = _apply_exposure_control(
+        candidates,
+        randomesque_k,
+        rng=rng,
+        exposure_parameters=exposure_parameters,
+        rejected_items=rejected_items,
+    )
 
     logger.debug(
         f"Item selection: theta={theta_estimate:.3f}, "
@@ -325,6 +351,8 @@ def _apply_exposure_control(
     candidates: List[ItemCandidate],
     k: int,
     rng: Optional[random.Random] = None,
+    exposure_parameters: Optional[Mapping[int, float]] = None,
+    rejected_items: Optional[Set[int]] = None,
 ) -> ItemCandidate:
     """
     Apply randomesque exposure control by selecting randomly from the top-K items.
@@ -332,6 +360,14 @@ def _apply_exposure_control(
     This prevents over-exposure of the single most informative item, which
     would make the test predictable and compromise item security.
 
+    With Sympson-Hetter exposure parameters, the randomesque pick is only
+    administered with probability K_i (one dictionary lookup and one random
+    draw). A rejected item is removed from the candidates and the pick is
+    repeated; the last remaining candidate is always administered so selection
+    never fails. Rejected IDs are added to ``rejected_items`` so the session
+    never draws them again, as the Sympson-Hetter model P(A) = P(S) * K
+    assumes.
+
     Non-determinism is intentional per CAT best practice (Kingsbury & Zara,
     1989). An optional ``rng`` parameter supports deterministic testing.
 
@@ -339,11 +375,22 @@ def _apply_exposure_control(
         candidates: List of ItemCandidate sorted by information (descending).
         k: Number of top items to select from.
         rng: Optional Random instance for deterministic testing.
+        exposure_parameters: Optional mapping of item ID -> exposure
+            parameter K_i; missing items have K_i = 1.
+        rejected_items: Optional set that receives the IDs of rejected items.
 
     Returns:
         The selected ItemCandidate.
     """
-    top_k = candidates[: min(k, len(candidates))]
-    if rng is not None:
-        return rng.choice(top_k)
-    return random.choice(top_k)
+    source = rng if rng is not None else random
+    remaining = candidates
+    while True:
+        selected = source.choice(remaining[: min(k, len(remaining))])
+        if not exposure_parameters or len(remaining) == 1:
+            return selected
+        parameter = exposure_parameters.get(selected.item.id, 1.0)
+        if parameter >= 1.0 or source.random() < parameter:
+            return selected
+        if rejected_items is not None:
+            rejected_items.add(selected.item.id)
+        remaining = [c for c in remaining if c is not selected]
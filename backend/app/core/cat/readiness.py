@@ -9,17 +9,27 @@ CAT activates only when every domain meets the configured thresholds.
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List
+from typing import Dict, List
 
-from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.core.cat.readiness_aggregates import (
+    READINESS_THETA_GRID,
+    SE_BAND_EDGES,
+    ReadinessTotals,
+    async_load_readiness_aggregates,
+    load_readiness_aggregates,
+    se_band_label,
+)
 from app.core.config import settings
-from app.models.models import Question, QuestionType
+from app.models.models import QuestionType
 
 logger = logging.getLogger(__name__)
 
+# Decimal places kept for test information values in results
+INFORMATION_DECIMALS = 4
+
 
 @dataclass
 class DomainReadiness:
@@ -33,6 +43,12 @@ class DomainReadiness:
     medium_count: int  # -1.0 <= IRT b <= 1.0
     hard_count: int  # IRT b > 1.0
     reasons: List[str] = field(default_factory=list)
+    # Test information of the well-calibrated items at each READINESS_THETA_GRID
+    # point
+    test_information: List[float] = field(default_factory=list)
+    # Calibrated items per SE band, e.g. {"<=0.1": 3, ..., ">1.0": 0}
+    se_difficulty_bands: Dict[str, int] = field(default_factory=dict)
+    se_discrimination_bands: Dict[str, int] = field(default_factory=dict)
 
 
 @dataclass
@@ -43,133 +59,84 @@ class CATReadinessResult:
     domains: List[DomainReadiness]
     summary: str
     thresholds: dict
+    theta_grid: List[float] = field(default_factory=list)
 
 
-def evaluate_cat_readiness(db: Session) -> CATReadinessResult:
-    """
-    Evaluate whether the question bank is ready for CAT across all domains.
+def _current_thresholds() -> dict:
+    return {
+        "min_calibrated_items_per_domain": settings.CAT_MIN_CALIBRATED_ITEMS_PER_DOMAIN,
+        "max_se_difficulty": settings.CAT_MAX_SE_DIFFICULTY,
+        "max_se_discrimination": settings.CAT_MAX_SE_DISCRIMINATION,
+        "min_items_per_difficulty_band": settings.CAT_MIN_ITEMS_PER_DIFFICULTY_BAND,
+    }
 
-    Per-domain evaluation:
-    1. Query active, normal-quality questions with irt_calibrated_at IS NOT NULL
-    2. Filter to items where irt_se_difficulty <= threshold AND
-       irt_se_discrimination <= threshold
-    3. Count items in 3 IRT difficulty bands: easy (b < -1.0),
-       medium (-1.0 <= b <= 1.0), hard (b > 1.0)
-    4. Domain passes if: total well-calibrated >= min AND each band has >= min items
 
-    Global readiness: all domains must pass.
+def _evaluate_domain(totals: ReadinessTotals, thresholds: dict) -> DomainReadiness:
+    """Apply the readiness thresholds to one domain's precomputed inputs."""
+    min_items = thresholds["min_calibrated_items_per_domain"]
+    min_per_band = thresholds["min_items_per_difficulty_band"]
 
-    Args:
-        db: Database session
+    reasons: List[str] = []
+    is_ready = True
 
-    Returns:
-        CATReadinessResult with per-domain breakdown
-    """
-    min_items = settings.CAT_MIN_CALIBRATED_ITEMS_PER_DOMAIN
-    max_se_diff = settings.CAT_MAX_SE_DIFFICULTY
-    max_se_disc = settings.CAT_MAX_SE_DISCRIMINATION
-    min_per_band = settings.CAT_MIN_ITEMS_PER_DIFFICULTY_BAND
-
-    thresholds = {
-        "min_calibrated_items_per_domain": min_items,
-        "max_se_difficulty": max_se_diff,
-        "max_se_discrimination": max_se_disc,
-        "min_items_per_difficulty_band": min_per_band,
-    }
-
-    domain_results: List[DomainReadiness] = []
-
-    for q_type in QuestionType:
-        domain_name = q_type.value
-
-        # Count all calibrated items (regardless of SE quality)
-        total_calibrated = (
-            db.query(func.count(Question.id))
-            .filter(
-                Question.question_type == q_type,
-                Question.is_active.is_(True),
-                Question.quality_flag == "normal",
-                Question.irt_calibrated_at.isnot(None),
-            )
-            .scalar()
-            or 0
+    if totals.well_calibrated < min_items:
+        is_ready = False
+        reasons.append(
+            f"Insufficient well-calibrated items: {totals.well_calibrated}/{min_items}"
         )
 
-        # Query well-calibrated items (SE below thresholds)
-        well_calibrated_query = db.query(Question).filter(
-            Question.question_type == q_type,
-            Question.is_active.is_(True),
-            Question.quality_flag == "normal",
-            Question.irt_calibrated_at.isnot(None),
-            Question.irt_se_difficulty.isnot(None),
-            Question.irt_se_discrimination.isnot(None),
-            Question.irt_se_difficulty <= max_se_diff,
-            Question.irt_se_discrimination <= max_se_disc,
-            Question.irt_difficulty.isnot(None),
+    if totals.easy_count < min_per_band:
+        is_ready = False
+        reasons.append(
+            f"Insufficient easy items (b < -1.0): {totals.easy_count}/{min_per_band}"
         )
 
-        well_calibrated_items = well_calibrated_query.all()
-        well_calibrated_count = len(well_calibrated_items)
-
-        # Count items in IRT difficulty bands
-        # irt_difficulty is guaranteed non-None by the query filter above
-        easy_count = sum(
-            1
-            for q in well_calibrated_items
-            if q.irt_difficulty is not None and q.irt_difficulty < -1.0
-        )
-        medium_count = sum(
-            1
-            for q in well_calibrated_items
-            if q.irt_difficulty is not None and -1.0 <= q.irt_difficulty <= 1.0
-        )
-        hard_count = sum(
-            1
-            for q in well_calibrated_items
-            if q.irt_difficulty is not None and q.irt_difficulty > 1.0
+    if totals.medium_count < min_per_band:
+        is_ready = False
+        reasons.append(
+            f"Insufficient medium items (-1.0 <= b <= 1.0): "
+            f"{totals.medium_count}/{min_per_band}"
         )
 
-        # Evaluate domain readiness
-        reasons: List[str] = []
-        is_ready = True
-
-        if well_calibrated_count < min_items:
-            is_ready = False
-            reasons.append(
-                f"Insufficient well-calibrated items: {well_calibrated_count}/{min_items}"
-            )
-
-        if easy_count < min_per_band:
-            is_ready = False
-            reasons.append(
-                f"Insufficient easy items (b < -1.0): {easy_count}/{min_per_band}"
-            )
-
-        if medium_count < min_per_band:
-            is_ready = False
-            reasons.append(
-                f"Insufficient medium items (-1.0 <= b <= 1.0): {medium_count}/{min_per_band}"
-            )
-
-        if hard_count < min_per_band:
-            is_ready = False
-            reasons.append(
-                f"Insufficient hard items (b > 1.0): {hard_count}/{min_per_band}"
-            )
-
-        domain_results.append(
-            DomainReadiness(
-                domain=domain_name,
-                is_ready=is_ready,
-                total_calibrated=total_calibrated,
-                well_calibrated=well_calibrated_count,
-                easy_count=easy_count,
-                medium_count=medium_count,
-                hard_count=hard_count,
-                reasons=reasons,
-            )
+    if totals.hard_count < min_per_band:
+        is_ready = False
+        reasons.append(
+            f"Insufficient hard items (b > 1.0): {totals.hard_count}/{min_per_band}"
         )
 
+    return DomainReadiness(
+        domain=totals.domain,
+        is_ready=is_ready,
+        total_calibrated=totals.total_calibrated,
+        well_calibrated=totals.well_calibrated,
+        easy_count=totals.easy_count,
+        medium_count=totals.medium_count,
+        hard_count=totals.hard_count,
+        reasons=reasons,
+        # Clamp the float residue left when items are added and removed
+        test_information=[
+            max(0.0, round(value, INFORMATION_DECIMALS))
+            for value in totals.test_information.tolist()
+        ],
+        se_difficulty_bands=_ordered_bands(totals.se_difficulty_bands),
+        se_discrimination_bands=_ordered_bands(totals.se_discrimination_bands),
+    )
+
+
+def _ordered_bands(bands: Dict[str, int]) -> Dict[str, int]:
+    """SE band counts in band order, including empty bands."""
+    labels = [se_band_label(edge) for edge in SE_BAND_EDGES]
+    labels.append(f">{SE_BAND_EDGES[-1]}")
+    return {label: bands.get(label, 0) for label in labels}
+
+
+def _evaluate_aggregates(aggregates: Dict[str, ReadinessTotals]) -> CATReadinessResult:
+    thresholds = _current_thresholds()
+    domain_results = [
+        _evaluate_domain(aggregates[q_type.value], thresholds)
+        for q_type in QuestionType
+    ]
+
     is_globally_ready = all(d.is_ready for d in domain_results)
 
     ready_count = sum(1 for d in domain_results if d.is_ready)
@@ -185,140 +152,45 @@ def evaluate_cat_readiness(db: Session) -> CATReadinessResult:
         domains=domain_results,
         summary=summary,
         thresholds=thresholds,
+        theta_grid=list(READINESS_THETA_GRID),
     )
 
 
-async def async_evaluate_cat_readiness(db: AsyncSession) -> CATReadinessResult:
-    """
-    Evaluate whether the question bank is ready for CAT (async version).
-
-    See evaluate_cat_readiness() for full documentation.
+def evaluate_cat_readiness(db: Session) -> CATReadinessResult:
     """
-    min_items = settings.CAT_MIN_CALIBRATED_ITEMS_PER_DOMAIN
-    max_se_diff = settings.CAT_MAX_SE_DIFFICULTY
-    max_se_disc = settings.CAT_MAX_SE_DISCRIMINATION
-    min_per_band = settings.CAT_MIN_ITEMS_PER_DIFFICULTY_BAND
-
-    thresholds = {
-        "min_calibrated_items_per_domain": min_items,
-        "max_se_difficulty": max_se_diff,
-        "max_se_discrimination": max_se_disc,
-        "min_items_per_difficulty_band": min_per_band,
-    }
+    Evaluate whether the question bank is ready for CAT across all domains.
 
-    domain_results: List[DomainReadiness] = []
+    Per-domain evaluation:
+    1. Consider active, normal-quality questions with irt_calibrated_at IS NOT NULL
+    2. Filter to items where irt_se_difficulty <= threshold AND
+       irt_se_discrimination <= threshold
+    3. Count items in 3 IRT difficulty bands: easy (b < -1.0),
+       medium (-1.0 <= b <= 1.0), hard (b > 1.0)
+    4. Domain passes if: total well-calibrated >= min AND each band has >= min items
 
-    for q_type in QuestionType:
-        domain_name = q_type.value
+    Global readiness: all domains must pass.
 
-        # Count all calibrated items
-        result = await db.execute(
-            select(func.count(Question.id)).where(
-                Question.question_type == q_type,
-                Question.is_active.is_(True),
-                Question.quality_flag == "normal",
-                Question.irt_calibrated_at.isnot(None),
-            )
-        )
-        total_calibrated = result.scalar() or 0
-
-        # Query well-calibrated items
-        result = await db.execute(
-            select(Question).where(
-                Question.question_type == q_type,
-                Question.is_active.is_(True),
-                Question.quality_flag == "normal",
-                Question.irt_calibrated_at.isnot(None),
-                Question.irt_se_difficulty.isnot(None),
-                Question.irt_se_discrimination.isnot(None),
-                Question.irt_se_difficulty <= max_se_diff,
-                Question.irt_se_discrimination <= max_se_disc,
-                Question.irt_difficulty.isnot(None),
-            )
-        )
-        well_calibrated_items = result.scalars().all()
-        well_calibrated_count = len(well_calibrated_items)
-
-        # Count items in IRT difficulty bands
-        easy_count = len(
-            [
-                q
-                for q in well_calibrated_items
-                if q.irt_difficulty is not None and q.irt_difficulty < -1.0
-            ]
-        )
-        medium_count = len(
-            [
-                q
-                for q in well_calibrated_items
-                if q.irt_difficulty is not None and -1.0 <= q.irt_difficulty <= 1.0
-            ]
-        )
-        hard_count = len(
-            [
-                q
-                for q in well_calibrated_items
-                if q.irt_difficulty is not None and q.irt_difficulty > 1.0
-            ]
-        )
+    The counts, SE band breakdowns and test information curves come from the
+    incrementally maintained cat_readiness_aggregates rows (see
+    readiness_aggregates), so an evaluation reads one row per domain. The rows
+    are rebuilt from the questions table first if they are missing or stale.
 
-        # Evaluate domain readiness
-        reasons: List[str] = []
-        is_ready = True
-
-        if well_calibrated_count < min_items:
-            is_ready = False
-            reasons.append(
-                f"Insufficient well-calibrated items: {well_calibrated_count}/{min_items}"
-            )
-
-        if easy_count < min_per_band:
-            is_ready = False
-            reasons.append(
-                f"Insufficient easy items (b < -1.0): {easy_count}/{min_per_band}"
-            )
-
-        if medium_count < min_per_band:
-            is_ready = False
-            reasons.append(
-                f"Insufficient medium items (-1.0 <= b <= 1.0): {medium_count}/{min_per_band}"
-            )
-
-        if hard_count < min_per_band:
-            is_ready = False
-            reasons.append(
-                f"Insufficient hard items (b > 1.0): {hard_count}/{min_per_band}"
-            )
-
-        domain_results.append(
-            DomainReadiness(
-                domain=domain_name,
-                is_ready=is_ready,
-                total_calibrated=total_calibrated,
-                well_calibrated=well_calibrated_count,
-                easy_count=easy_count,
-                medium_count=medium_count,
-                hard_count=hard_count,
-                reasons=reasons,
-            )
-        )
+    Args:
+        db: Database session
 
-    is_globally_ready = all(d.is_ready for d in domain_results)
+    Returns:
+        CATReadinessResult with per-domain breakdown
+    """
+    return _evaluate_aggregates(load_readiness_aggregates(db))
 
-    ready_count = sum(1 for d in domain_results if d.is_ready)
-    total_domains = len(domain_results)
-    summary = f"{ready_count}/{total_domains} domains ready for CAT"
 
-    logger.info(
-        f"CAT readiness evaluation: globally_ready={is_globally_ready}, {summary}"
-    )
+async def async_evaluate_cat_readiness(db: AsyncSession) -> CATReadinessResult:
+    """
+    Evaluate whether the question bank is ready for CAT (async version).
 
-    return CATReadinessResult(
-        is_globally_ready=is_globally_ready,
-        domains=domain_results,
-        summary=summary,
-        thresholds=thresholds,
-    )
+    See evaluate_cat_readiness() for full documentation.
+    """
+    return _evaluate_aggregates(await async_load_readiness_aggregates(db))
 
 
 def serialize_readiness_result(
@@ -349,8 +221,12 @@ def serialize_readiness_result(
                 "medium_count": d.medium_count,
                 "hard_count": d.hard_count,
                 "reasons": d.reasons,
+                "test_information": d.test_information,
+                "se_difficulty_bands": d.se_difficulty_bands,
+                "se_discrimination_bands": d.se_discrimination_bands,
             }
             for d in result.domains
         ],
+        "theta_grid": result.theta_grid,
         "summary": result.summary,
     }
@@ -0,0 +1,474 @@
+"""
+Incrementally maintained CAT readiness inputs (TASK-835).
+
+``cat_readiness_aggregates`` holds one row per domain with everything
+``evaluate_cat_readiness`` needs: the number of active, normal-quality,
+IRT-calibrated items, how many of them are well calibrated (SE at or below
+the configured thresholds) in each IRT difficulty band, counts by SE band,
+and the test information curve of the well-calibrated items on
+READINESS_THETA_GRID. Evaluating readiness reads these six rows instead of
+scanning the questions table.
+
+The rows are maintained in three ways:
+
+- ``_track_readiness_changes`` runs before every ORM flush. For each question
+  that is inserted, deleted, or has a readiness column changed (calibration
+  writing parameters, a quality flag change, deactivation) it subtracts the
+  question's old contribution and adds its new one, in the same transaction
+- ``rebuild_readiness_aggregates`` recomputes the rows from the questions
+  table. The readiness cron runs it nightly to pick up writes that bypass the
+  ORM (bulk UPDATE statements, manual SQL)
+- ``load_readiness_aggregates`` / ``async_load_readiness_aggregates`` rebuild
+  first when a row is missing, was classified against different SE
+  thresholds, or was last rebuilt more than REBUILD_MAX_AGE ago
+"""
+
+import logging
+import math
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+
+import numpy as np
+from sqlalchemy import Select, event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.datetime_utils import ensure_timezone_aware, utc_now
+from app.models.models import CATReadinessAggregate, Question, QuestionType
+
+logger = logging.getLogger(__name__)
+
+# Ability levels the test information curves are evaluated at (-4.0 to 4.0)
+READINESS_THETA_GRID: Tuple[float, ...] = tuple(-4.0 + 0.25 * i for i in range(33))
+
+# Upper bounds of the SE bands reported per domain; larger SEs fall in ">1.0"
+SE_BAND_EDGES: Tuple[float, ...] = (0.1, 0.2, 0.3, 0.4, 0.5, 0.75, 1.0)
+
+# IRT difficulty band boundaries: easy b < -1.0, medium -1.0 <= b <= 1.0,
+# hard b > 1.0
+EASY_BAND_MAX_DIFFICULTY = -1.0
+HARD_BAND_MIN_DIFFICULTY = 1.0
+
+# Rebuild from the questions table at least this often, so drift from writes
+# that bypass the ORM is bounded even if the nightly cron does not run
+REBUILD_MAX_AGE = timedelta(days=1)
+
+_THETA = np.array(READINESS_THETA_GRID)
+
+# Question columns an item's contribution depends on
+_READINESS_COLUMNS = (
+    "question_type",
+    "is_active",
+    "quality_flag",
+    "irt_calibrated_at",
+    "irt_difficulty",
+    "irt_discrimination",
+    "irt_se_difficulty",
+    "irt_se_discrimination",
+)
+
+
+class _Item(NamedTuple):
+    """The readiness-relevant parameters of one calibrated question."""
+
+    domain: str
+    difficulty: Optional[float]
+    discrimination: Optional[float]
+    se_difficulty: Optional[float]
+    se_discrimination: Optional[float]
+
+
+def _item(values: Dict[str, Any]) -> Optional[_Item]:
+    """
+    Build an item from question column values.
+
+    Returns None for questions that do not count towards readiness (inactive,
+    not normal quality, or never calibrated).
+    """
+    if (
+        not values["is_active"]
+        or values["quality_flag"] != "normal"
+        or values["irt_calibrated_at"] is None
+        or values["question_type"] is None
+    ):
+        return None
+    question_type = values["question_type"]
+    return _Item(
+        domain=getattr(question_type, "value", question_type),
+        difficulty=values["irt_difficulty"],
+        discrimination=values["irt_discrimination"],
+        se_difficulty=values["irt_se_difficulty"],
+        se_discrimination=values["irt_se_discrimination"],
+    )
+
+
+def se_band_label(se: float) -> str:
+    """
+    Label of the SE band containing ``se``.
+
+    Args:
+        se: Standard error of an IRT parameter
+
+    Returns:
+        "<=0.1", "<=0.2", ... or ">1.0"
+    """
+    for edge in SE_BAND_EDGES:
+        if se <= edge:
+            return f"<={edge}"
+    return f">{SE_BAND_EDGES[-1]}"
+
+
+def _information_curve(discrimination: float, difficulty: float) -> np.ndarray:
+    """2PL item information a^2 * P * (1 - P) at every grid theta."""
+    p = 1.0 / (1.0 + np.exp(-discrimination * (_THETA - difficulty)))
+    return discrimination**2 * p * (1.0 - p)
+
+
+def _add_to_bands(bands: Dict[str, int], se: Optional[float], sign: int) -> None:
+    if se is None:
+        return
+    label = se_band_label(se)
+    count = bands.get(label, 0) + sign
+    if count:
+        bands[label] = count
+    else:
+        bands.pop(label, None)
+
+
+@dataclass
+class ReadinessTotals:
+    """Readiness inputs for one domain, as stored in cat_readiness_aggregates."""
+
+    domain: str
+    max_se_difficulty: float
+    max_se_discrimination: float
+    total_calibrated: int = 0
+    well_calibrated: int = 0
+    easy_count: int = 0
+    medium_count: int = 0
+    hard_count: int = 0
+    se_difficulty_bands: Dict[str, int] = field(default_factory=dict)
+    se_discrimination_bands: Dict[str, int] = field(default_factory=dict)
+    test_information: np.ndarray = field(
+        default_factory=lambda: np.zeros(len(READINESS_THETA_GRID))
+    )
+
+    def add(self, item: _Item, sign: int = 1) -> None:
+        """Add (sign=1) or remove (sign=-1) one item's contribution."""
+        self.total_calibrated += sign
+        _add_to_bands(self.se_difficulty_bands, item.se_difficulty, sign)
+        _add_to_bands(self.se_discrimination_bands, item.se_discrimination, sign)
+
+        if (
+            item.difficulty is None
+            or item.se_difficulty is None
+            or item.se_discrimination is None
+            or item.se_difficulty > self.max_se_difficulty
+            or item.se_discrimination > self.max_se_discrimination
+        ):
+            return
+
+        self.well_calibrated += sign
+        if item.difficulty < EASY_BAND_MAX_DIFFICULTY:
+            self.easy_count += sign
+        elif item.difficulty > HARD_BAND_MIN_DIFFICULTY:
+            self.hard_count += sign
+        else:
+            self.medium_count += sign
+        if item.discrimination is not None and math.isfinite(item.discrimination):
+            self.test_information += sign * _information_curve(
+                item.discrimination, item.difficulty
+            )
+
+    @classmethod
+    def from_row(cls, row: CATReadinessAggregate) -> "ReadinessTotals":
+        return cls(
+            domain=row.question_type,
+            max_se_difficulty=row.max_se_difficulty,
+            max_se_discrimination=row.max_se_discrimination,
+            total_calibrated=row.total_calibrated,
+            well_calibrated=row.well_calibrated,
+            easy_count=row.easy_count,
+            medium_count=row.medium_count,
+            hard_count=row.hard_count,
+            se_difficulty_bands=dict(row.se_difficulty_bands or {}),
+            se_discrimination_bands=dict(row.se_discrimination_bands or {}),
+            test_information=np.array(row.test_information, dtype=float),
+        )
+
+    def write(self, row: CATReadinessAggregate) -> None:
+        """Copy the totals onto an aggregate row (assigning fresh containers)."""
+        row.max_se_difficulty = self.max_se_difficulty
+        row.max_se_discrimination = self.max_se_discrimination
+        row.total_calibrated = self.total_calibrated
+        row.well_calibrated = self.well_calibrated
+        row.easy_count = self.easy_count
+        row.medium_count = self.medium_count
+        row.hard_count = self.hard_count
+        row.se_difficulty_bands = dict(self.se_difficulty_bands)
+        row.se_discrimination_bands = dict(self.se_discrimination_bands)
+        row.test_information = self.test_information.tolist()
+
+
+def _current_thresholds() -> Tuple[float, float]:
+    return settings.CAT_MAX_SE_DIFFICULTY, settings.CAT_MAX_SE_DISCRIMINATION
+
+
+def _matches_thresholds(row: CATReadinessAggregate) -> bool:
+    return (row.max_se_difficulty, row.max_se_discrimination) == _current_thresholds()
+
+
+def _needs_rebuild(rows: Dict[str, CATReadinessAggregate]) -> bool:
+    if set(rows) != {q_type.value for q_type in QuestionType}:
+        return True
+    oldest_allowed = utc_now() - REBUILD_MAX_AGE
+    return any(
+        not _matches_thresholds(row)
+        or ensure_timezone_aware(row.rebuilt_at) < oldest_allowed
+        for row in rows.values()
+    )
+
+
+def _readiness_columns() -> List[Any]:
+    return [getattr(Question, column) for column in _READINESS_COLUMNS]
+
+
+def _current_values(question: Question) -> Dict[str, Any]:
+    return {column: getattr(question, column) for column in _READINESS_COLUMNS}
+
+
+def _calibrated_items_query() -> Select:
+    """Readiness columns of every active, normal-quality, calibrated question."""
+    return select(*_readiness_columns()).where(
+        Question.is_active.is_(True),
+        Question.quality_flag == "normal",
+        Question.irt_calibrated_at.isnot(None),
+    )
+
+
+def _compute_totals(rows: Iterable[Any]) -> Dict[str, ReadinessTotals]:
+    max_se_difficulty, max_se_discrimination = _current_thresholds()
+    totals = {
+        q_type.value: ReadinessTotals(
+            domain=q_type.value,
+            max_se_difficulty=max_se_difficulty,
+            max_se_discrimination=max_se_discrimination,
+        )
+        for q_type in QuestionType
+    }
+    for row in rows:
+        item = _item(dict(zip(_READINESS_COLUMNS, row)))
+        if item is not None and item.domain in totals:
+            totals[item.domain].add(item)
+    return totals
+
+
+def _store_totals(
+    rows: Dict[str, CATReadinessAggregate],
+    totals: Dict[str, ReadinessTotals],
+    add: Callable[[CATReadinessAggregate], None],
+) -> None:
+    now = utc_now()
+    for domain, domain_totals in totals.items():
+        row = rows.get(domain)
+        if row is None:
+            row = CATReadinessAggregate(question_type=domain)
+            add(row)
+        domain_totals.write(row)
+        row.rebuilt_at = now
+
+
+def _aggregates_query() -> Select:
+    return select(CATReadinessAggregate)
+
+
+# =============================================================================
+# SYNC API
+# =============================================================================
+
+
+def rebuild_readiness_aggregates(db: Session) -> Dict[str, ReadinessTotals]:
+    """
+    Recompute every domain's readiness inputs from the questions table.
+
+    Commits the rebuilt rows.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Readiness totals per domain (QuestionType value)
+    """
+    totals = _compute_totals(db.execute(_calibrated_items_query()).all())
+    rows = {row.question_type: row for row in db.execute(_aggregates_query()).scalars()}
+    _store_totals(rows, totals, db.add)
+    db.commit()
+    logger.info(f"Rebuilt CAT readiness aggregates for {len(totals)} domains")
+    return totals
+
+
+def load_readiness_aggregates(db: Session) -> Dict[str, ReadinessTotals]:
+    """
+    Load every domain's readiness inputs, rebuilding them if stale.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Readiness totals per domain (QuestionType value)
+    """
+    rows = {row.question_type: row for row in db.execute(_aggregates_query()).scalars()}
+    if _needs_rebuild(rows):
+        return rebuild_readiness_aggregates(db)
+    return {domain: ReadinessTotals.from_row(row) for domain, row in rows.items()}
+
+
+# =============================================================================
+# ASYNC API
+# =============================================================================
+
+
+async def async_rebuild_readiness_aggregates(
+    db: AsyncSession,
+) -> Dict[str, ReadinessTotals]:
+    """
+    Recompute every domain's readiness inputs from the questions table
+    (async version).
+
+    Args:
+        db: Async database session
+
+    Returns:
+        Readiness totals per domain (QuestionType value)
+    """
+    result = await db.execute(_calibrated_items_query())
+    totals = _compute_totals(result.all())
+    result = await db.execute(_aggregates_query())
+    rows = {row.question_type: row for row in result.scalars()}
+    _store_totals(rows, totals, db.add)
+    await db.commit()
+    logger.info(f"Rebuilt CAT readiness aggregates for {len(totals)} domains")
+    return totals
+
+
+async def async_load_readiness_aggregates(
+    db: AsyncSession,
+) -> Dict[str, ReadinessTotals]:
+    """
+    Load every domain's readiness inputs, rebuilding them if stale
+    (async version).
+
+    Args:
+        db: Async database session
+
+    Returns:
+        Readiness totals per domain (QuestionType value)
+    """
+    result = await db.execute(_aggregates_query())
+    rows = {row.question_type: row for row in result.scalars()}
+    if _needs_rebuild(rows):
+        return await async_rebuild_readiness_aggregates(db)
+    return {domain: ReadinessTotals.from_row(row) for domain, row in rows.items()}
+
+
+# =============================================================================
+# INCREMENTAL MAINTENANCE
+# =============================================================================
+
+
+def _question_changes(
+    session: Session,
+) -> List[Tuple[Optional[_Item], Optional[_Item]]]:
+    """
+    Collect (old item, new item) pairs for the questions about to be flushed.
+
+    Old values are read from the database, which still holds the state as of
+    the previous flush; attribute history cannot be relied on because
+    assigning to an expired attribute does not load its old value.
+    """
+    changes: List[Tuple[Optional[_Item], Optional[_Item]]] = []
+    previous: Dict[int, Optional[Question]] = {}
+
+    for obj in session.new:
+        if isinstance(obj, Question):
+            changes.append((None, _item(_current_values(obj))))
+
+    for obj in session.deleted:
+        if isinstance(obj, Question):
+            previous[inspect(obj).identity[0]] = None
+
+    for obj in session.dirty:
+        if not isinstance(obj, Question) or obj in session.deleted:
+            continue
+        state = inspect(obj)
+        if any(
+            state.attrs[column].history.has_changes() for column in _READINESS_COLUMNS
+        ):
+            previous[state.identity[0]] = obj
+
+    if not previous:
+        return changes
+
+    old_values = {
+        row[0]: dict(zip(_READINESS_COLUMNS, row[1:]))
+        for row in session.execute(
+            select(Question.id, *_readiness_columns()).where(Question.id.in_(previous))
+        )
+    }
+    for question_id, obj in previous.items():
+        old = old_values.get(question_id)
+        changes.append(
+            (
+                _item(old) if old is not None else None,
+                _item(_current_values(obj)) if obj is not None else None,
+            )
+        )
+    return changes
+
+
+def _track_readiness_changes(session: Session, flush_context: Any, instances: Any):
+    """
+    Apply questions' readiness deltas to the aggregates before a flush.
+
+    The aggregate rows are updated in the same flush, so they commit or roll
+    back together with the question changes. Rows that do not exist yet or
+    were classified against different thresholds are left alone; the next
+    load rebuilds them.
+    """
+    changes = [(old, new) for old, new in _question_changes(session) if old != new]
+    if not changes:
+        return
+
+    domains: Set[str] = {
+        item.domain for pair in changes for item in pair if item is not None
+    }
+    rows = session.execute(
+        _aggregates_query()
+        .where(CATReadinessAggregate.question_type.in_(domains))
+        .with_for_update()
+    ).scalars()
+    for row in rows:
+        if not _matches_thresholds(row):
+            continue
+        totals = ReadinessTotals.from_row(row)
+        for old, new in changes:
+            if old is not None and old.domain == row.question_type:
+                totals.add(old, sign=-1)
+            if new is not None and new.domain == row.question_type:
+                totals.add(new)
+        totals.write(row)
+
+
+event.listen(Session, "before_flush", _track_readiness_changes)
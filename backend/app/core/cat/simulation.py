@@ -24,7 +24,7 @@ import logging
 import math
 import random
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 import numpy as np
 
@@ -95,6 +95,10 @@ class SimulationConfig:
     domain_weights: Dict[str, float] = field(
         default_factory=lambda: DEFAULT_DOMAIN_WEIGHTS.copy()
     )
+    # Optional Sympson-Hetter exposure parameters (item ID -> K_i) applied
+    # during selection. Their accept/reject draws come from a generator seeded
+    # with ``seed``, so runs stay reproducible.
+    exposure_parameters: Optional[Dict[int, float]] = None
 
 
 @dataclass
@@ -271,6 +275,9 @@ def run_internal_simulation(
 
     rng = random.Random(config.seed)
     np_rng = np.random.default_rng(config.seed)
+    selection_rng = (
+        random.Random(config.seed) if config.exposure_parameters is not None else None
+    )
     cat_manager = CATSessionManager()
 
     examinee_results = []
@@ -290,6 +297,8 @@ def run_internal_simulation(
         # randomesque_k=1 gives deterministic selection (always pick most informative).
         # randomesque_k=5 matches production behavior (random from top-5).
         selection_k = 1 if config.deterministic_selection else 5
+        # Items rejected by Sympson-Hetter stay out for the rest of the exam
+        rejected_items: Set[int] = set()
         while True:
             next_item = select_next_item(
                 item_pool=item_bank,
@@ -301,6 +310,9 @@ def run_internal_simulation(
                 min_items_per_domain=config.min_items_per_domain,
                 max_items=config.max_items,
                 randomesque_k=selection_k,
+                exposure_parameters=config.exposure_parameters,
+                rejected_items=rejected_items,
+                rng=selection_rng,
             )
 
             if next_item is None:
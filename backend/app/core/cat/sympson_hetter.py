@@ -0,0 +1,262 @@
+"""
+Sympson-Hetter exposure parameters computed by simulation (TASK-868).
+
+Randomesque selection spreads administrations over the top-K items but does
+not bound any single item's exposure rate. The Sympson-Hetter procedure gives
+every item an exposure parameter K_i: when selection picks item i it is
+administered with probability K_i, so P(A_i) = P(S_i) * K_i.
+
+The parameters are found offline by simulating adaptive tests on the
+calibrated item pool:
+
+1. Start with K_i = 1 for every item
+2. Simulate N examinees with the current parameters and measure each item's
+   administration rate P(A_i) (share of examinees who saw it)
+3. Estimate the selection rate P(S_i) = P(A_i) / K_i and set
+   K_i = min(1, r_max / P(S_i))
+4. Stop when max P(A_i) <= r_max + tolerance, or after max_iterations
+
+The result is stored in system_config ("exposure_parameters") and applied by
+select_next_item with one dictionary lookup and one random draw per pick.
+
+References:
+    - Sympson, J.B., & Hetter, R.D. (1985). Controlling item-exposure rates
+      in computerized adaptive testing. Proceedings of the 27th Annual
+      Meeting of the Military Testing Association.
+    - Stocking, M.L., & Lewis, C. (1998). Controlling item exposure conditional
+      on ability in computerized adaptive testing.
+"""
+
+import logging
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import Dict, List, Mapping, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.cat.simulation import (
+    SimulatedItem,
+    SimulationConfig,
+    run_internal_simulation,
+)
+from app.core.cat.simulation_study import compute_exposure_analysis
+from app.core.config import settings
+from app.core.datetime_utils import utc_now
+from app.core.system_config import set_exposure_parameters
+from app.models.models import Question
+
+logger = logging.getLogger(__name__)
+
+# Simulated examinees per iteration
+DEFAULT_SIMULATED_EXAMINEES = 1000
+
+# Iterations of simulate-and-adjust before giving up on convergence
+DEFAULT_MAX_ITERATIONS = 10
+
+# Allowed excess of the maximum exposure rate over the target (simulation noise)
+DEFAULT_TOLERANCE = 0.01
+
+# Decimal places kept for stored parameters
+PARAMETER_DECIMALS = 4
+
+
+@dataclass
+class SympsonHetterResult:
+    """Exposure parameters and the simulated exposure they produced."""
+
+    exposure_parameters: Dict[int, float]  # Item ID -> K_i, only items with K_i < 1
+    target_rate: float
+    iterations: int
+    max_exposure_rate: float  # Highest P(A_i) in the final simulation
+    converged: bool  # max_exposure_rate <= target_rate + tolerance
+
+
+def update_exposure_parameters(
+    parameters: Mapping[int, float],
+    exposure_rates: Mapping[int, float],
+    target_rate: float,
+) -> Dict[int, float]:
+    """
+    One Sympson-Hetter adjustment step.
+
+    Args:
+        parameters: Current item ID -> K_i (missing items have K_i = 1).
+        exposure_rates: Item ID -> simulated administration rate P(A_i) under
+            ``parameters`` (missing items were never administered).
+        target_rate: Maximum acceptable exposure rate r_max.
+
+    Returns:
+        New item ID -> K_i, containing only items with K_i < 1.
+    """
+    updated: Dict[int, float] = {}
+    for item_id, rate in exposure_rates.items():
+        selection_rate = rate / parameters.get(item_id, 1.0)
+        if selection_rate > target_rate:
+            updated[item_id] = target_rate / selection_rate
+    return updated
+
+
+def compute_exposure_parameters(
+    item_bank: List[SimulatedItem],
+    config: Optional[SimulationConfig] = None,
+    target_rate: Optional[float] = None,
+    max_iterations: int = DEFAULT_MAX_ITERATIONS,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> SympsonHetterResult:
+    """
+    Compute Sympson-Hetter exposure parameters for an item pool by simulation.
+
+    Args:
+        item_bank: Items with calibrated IRT parameters.
+        config: Simulation settings. Defaults to DEFAULT_SIMULATED_EXAMINEES
+            examinees with production (randomesque) selection.
+        target_rate: Maximum acceptable exposure rate. Defaults to
+            settings.CAT_MAX_EXPOSURE_RATE.
+        max_iterations: Maximum simulate-and-adjust iterations.
+        tolerance: Allowed excess of the maximum exposure rate over the target.
+
+    Returns:
+        SympsonHetterResult with the parameters used in the last simulation.
+
+    Raises:
+        ValueError: If the item bank is empty or target_rate is not in (0, 1].
+    """
+    if not item_bank:
+        raise ValueError("Cannot compute exposure parameters for an empty item bank")
+    if target_rate is None:
+        target_rate = settings.CAT_MAX_EXPOSURE_RATE
+    if not (0.0 < target_rate <= 1.0):
+        raise ValueError(f"target_rate must be in (0.0, 1.0], got {target_rate}")
+    if config is None:
+        config = SimulationConfig(
+            n_examinees=DEFAULT_SIMULATED_EXAMINEES, deterministic_selection=False
+        )
+
+    parameters: Dict[int, float] = {}
+    max_rate = 0.0
+    iteration = 0
+    for iteration in range(1, max_iterations + 1):
+        simulation = run_internal_simulation(
+            item_bank, replace(config, exposure_parameters=parameters)
+        )
+        exposure = compute_exposure_analysis(
+            simulation.examinee_results, len(item_bank)
+        )
+        max_rate = exposure.max_exposure_rate
+        logger.info(
+            f"Sympson-Hetter iteration {iteration}: max exposure {max_rate:.3f} "
+            f"(target {target_rate:.3f}), {len(parameters)} restricted items"
+        )
+        if max_rate <= target_rate + tolerance or iteration == max_iterations:
+            break
+        parameters = update_exposure_parameters(
+            parameters, exposure.exposure_rates, target_rate
+        )
+
+    converged = max_rate <= target_rate + tolerance
+    if not converged:
+        logger.warning(
+            f"Sympson-Hetter parameters did not converge after {iteration} "
+            f"iterations: max exposure {max_rate:.3f} > target {target_rate:.3f}"
+        )
+
+    return SympsonHetterResult(
+        exposure_parameters=parameters,
+        target_rate=target_rate,
+        iterations=iteration,
+        max_exposure_rate=max_rate,
+        converged=converged,
+    )
+
+
+def serialize_exposure_parameters(
+    result: SympsonHetterResult, computed_at: datetime
+) -> dict:
+    """
+    Serialize exposure parameters for storage in SystemConfig.
+
+    Args:
+        result: Computed exposure parameters
+        computed_at: Timestamp of the computation
+
+    Returns:
+        JSON-serializable dict (item IDs become string keys)
+    """
+    return {
+        "target_rate": result.target_rate,
+        "iterations": result.iterations,
+        "max_exposure_rate": round(result.max_exposure_rate, PARAMETER_DECIMALS),
+        "converged": result.converged,
+        "computed_at": computed_at.isoformat(),
+        "parameters": {
+            str(item_id): round(value, PARAMETER_DECIMALS)
+            for item_id, value in sorted(result.exposure_parameters.items())
+        },
+    }
+
+
+def load_cat_item_bank(db: Session) -> List[SimulatedItem]:
+    """
+    Load the live CAT item pool as simulation items.
+
+    Uses the same eligibility as adaptive item selection: active,
+    normal-quality questions with a positive IRT discrimination and a
+    difficulty.
+
+    Args:
+        db: Database session
+
+    Returns:
+        List of SimulatedItem keyed by question ID
+    """
+    rows = db.execute(
+        select(
+            Question.id,
+            Question.irt_discrimination,
+            Question.irt_difficulty,
+            Question.question_type,
+        ).where(
+            Question.is_active.is_(True),
+            Question.quality_flag == "normal",
+            Question.irt_difficulty.isnot(None),
+            Question.irt_discrimination.isnot(None),
+            Question.irt_discrimination > 0,
+        )
+    ).all()
+    return [
+        SimulatedItem(
+            id=question_id,
+            irt_discrimination=discrimination,
+            irt_difficulty=difficulty,
+            question_type=question_type.value,
+        )
+        for question_id, discrimination, difficulty, question_type in rows
+    ]
+
+
+def run_exposure_parameter_job(
+    db: Session, config: Optional[SimulationConfig] = None
+) -> SympsonHetterResult:
+    """
+    Recompute exposure parameters for the live item pool and persist them.
+
+    Args:
+        db: Database session
+        config: Optional simulation settings (see compute_exposure_parameters)
+
+    Returns:
+        The computed SympsonHetterResult
+
+    Raises:
+        ValueError: If there are no calibrated items.
+    """
+    item_bank = load_cat_item_bank(db)
+    result = compute_exposure_parameters(item_bank, config=config)
+    set_exposure_parameters(db, serialize_exposure_parameters(result, utc_now()))
+    logger.info(
+        f"Stored Sympson-Hetter parameters: {len(result.exposure_parameters)} of "
+        f"{len(item_bank)} items restricted, max exposure "
+        f"{result.max_exposure_rate:.3f} after {result.iterations} iterations"
+    )
+    return result
@@ -124,6 +124,44 @@ class Settings(BaseSettings):
     CAT_MAX_SE_DISCRIMINATION: float = 0.30
     CAT_MIN_ITEMS_PER_DIFFICULTY_BAND: int = 5
 
+    # CAT item exposure control (TASK-868)
+    # Target maximum share of examinees who see any one item; the offline
+    # Sympson-Hetter simulation computes exposure parameters to keep items
+    # at or below it.
+    CAT_MAX_EXPOSURE_RATE: float = Field(default=0.20, gt=0.0, le=1.0)
+    # Each worker adds its in-memory selection counts to item_exposure_counts
+    # after this many selections or this many seconds, whichever comes first.
+    CAT_EXPOSURE_FLUSH_SELECTIONS: int = Field(default=50, ge=1)
+    CAT_EXPOSURE_FLUSH_INTERVAL_SECONDS: float = Field(default=60.0, gt=0.0)
+
+    # Post-submission pipeline
+    # When enabled, POST /test/submit persists the score and enqueues the
+    # non-scoring stages (response-time analysis, validity, SEM/CI, question and
+    # distractor statistics, shadow CAT) in the post_submission_jobs table
+    # instead of running them inline. Each API process runs a bounded worker
+    # pool that drains the queue; SKIP LOCKED claiming makes this multi-worker safe.
+    POST_SUBMISSION_PIPELINE_ENABLED: bool = False
+    POST_SUBMISSION_WORKER_CONCURRENCY: int = Field(default=4, ge=1)
+    POST_SUBMISSION_MAX_ATTEMPTS: int = Field(default=5, ge=1)
+    POST_SUBMISSION_POLL_INTERVAL_SECONDS: float = Field(default=2.0, gt=0.0)
+    # Claimed jobs whose worker has not finished within this window are
+    # assumed lost (e.g. process crash) and become claimable again
+    POST_SUBMISSION_LEASE_SECONDS: float = Field(default=300.0, gt=0.0)
+
+    # SystemConfig snapshot (app/core/system_config.py)
+    # Hot-path config reads are served from an in-process copy of the
+    # system_config table. Writes through the API update it immediately; writes
+    # from other workers or processes are picked up within this many seconds.
+    # 0 disables the snapshot (every read queries the table).
+    SYSTEM_CONFIG_CACHE_TTL_SECONDS: float = Field(default=15.0, ge=0.0)
+
+    # Shadow CAT (TASK-875)
+    # Live shadow runs share a bounded thread pool. Submissions arriving while
+    # all workers are busy and the wait queue is full are dropped and left for
+    # the batch catch-up command (scripts/run_shadow_cat_catchup.py).
+    SHADOW_CAT_MAX_WORKERS: int = Field(default=2, ge=1)
+    SHADOW_CAT_MAX_QUEUE_SIZE: int = Field(default=100, ge=0)
+
     # A/B Testing Configuration (TASK-885)
     # Percentage of users to assign to adaptive (CAT) testing mode
     # Can be ramped from 0% (all fixed) to 100% (all adaptive) for gradual rollout
@@ -157,6 +195,12 @@ class Settings(BaseSettings):
     APNS_BUNDLE_ID: str = ""  # iOS app bundle identifier
     APNS_KEY_PATH: str = ""  # Path to .p8 key file
     APNS_USE_SANDBOX: bool = True  # Use sandbox APNs server for development
+    # Maximum notifications in flight per APNsService. Sends are multiplexed over
+    # the client's persistent HTTP/2 connections, so this bounds open streams
+    # (and memory) rather than sockets.
+    APNS_MAX_CONCURRENT_SENDS: int = Field(default=100, ge=1)
+    # Users loaded, sent to and committed per page by the notification scheduler
+    NOTIFICATION_SEND_BATCH_SIZE: int = Field(default=500, ge=1)
 
     # Admin Dashboard
     ADMIN_ENABLED: bool = False  # Set to True to enable admin dashboard
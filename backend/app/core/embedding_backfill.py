@@ -0,0 +1,374 @@
+"""Batched, resumable backfill of question embeddings.
+
+Fills the compact embedding columns (see ``app.core.embedding_codec``) for
+questions that have no embedding at all, or, with ``reembed=True``, for every
+question not yet embedded with the target model (e.g. after a model change).
+
+Compared with embedding one question per request, the backfill:
+
+- pages through candidate questions with a keyset query on ``questions.id``;
+- packs their texts into requests bounded by an estimated token budget and an
+  input count, using the provider's list-input embeddings endpoint;
+- keeps several requests in flight at once, running page reads and writes
+  in worker threads so they never block the event loop;
+- writes each response back with a single executemany UPDATE and commits.
+
+Rows are selected by what they are missing, so an interrupted run resumes by
+simply being started again; ``start_after_id`` skips ahead explicitly.
+
+The client talks to any OpenAI-compatible ``/embeddings`` endpoint over httpx,
+so a local fake server can stand in for the provider in tests.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import httpx
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.core.embedding_codec import (
+    DEFAULT_EMBEDDING_MODEL,
+    EMBEDDING_ENCODING_FLOAT32,
+    encode_embedding,
+)
+from app.models.models import Question
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EMBEDDINGS_BASE_URL = "https://api.openai.com/v1"
+DEFAULT_PAGE_SIZE = 1000
+# OpenAI accepts up to 2048 inputs and 300k tokens per embeddings request;
+# stay well below both so one slow request does not hold back the pipeline.
+DEFAULT_MAX_BATCH_INPUTS = 256
+DEFAULT_MAX_BATCH_TOKENS = 50_000
+DEFAULT_CONCURRENCY = 4
+
+MAX_RETRIES = 5
+INITIAL_BACKOFF_SECONDS = 1.0
+_RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+
+# (question_id, question_text)
+BackfillItem = Tuple[int, str]
+
+
+@dataclass
+class BackfillSummary:
+    """Counts reported by a backfill run."""
+
+    scanned: int = 0
+    embedded: int = 0
+    failed: int = 0
+    requests: int = 0
+    last_id: int = 0
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a text (about four characters per token)."""
+    return len(text) // 4 + 1
+
+
+def pack_batches(
+    items: Sequence[BackfillItem],
+    max_tokens: int = DEFAULT_MAX_BATCH_TOKENS,
+    max_inputs: int = DEFAULT_MAX_BATCH_INPUTS,
+) -> List[List[BackfillItem]]:
+    """Greedily pack items, in order, into token- and count-bounded batches.
+
+    An item larger than ``max_tokens`` on its own gets a batch to itself.
+    """
+    batches: List[List[BackfillItem]] = []
+    current: List[BackfillItem] = []
+    current_tokens = 0
+    for item in items:
+        tokens = estimate_tokens(item[1])
+        if current and (
+            current_tokens + tokens > max_tokens or len(current) >= max_inputs
+        ):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(item)
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+class EmbeddingClient:
+    """Async client for an OpenAI-compatible embeddings endpoint."""
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = DEFAULT_EMBEDDING_MODEL,
+        base_url: str = DEFAULT_EMBEDDINGS_BASE_URL,
+        timeout: float = 60.0,
+        max_retries: int = MAX_RETRIES,
+        initial_backoff: float = INITIAL_BACKOFF_SECONDS,
+    ):
+        self.model = model
+        self.max_retries = max_retries
+        self.initial_backoff = initial_backoff
+        self._url = base_url.rstrip("/") + "/embeddings"
+        self._client = httpx.AsyncClient(
+            timeout=httpx.Timeout(timeout, connect=10.0),
+            headers={"Authorization": f"Bearer {api_key}"},
+        )
+
+    async def __aenter__(self) -> "EmbeddingClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._client.aclose()
+
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        """Embed a list of texts in one request, retrying transient failures.
+
+        Returns:
+            One vector per input text, in input order
+
+        Raises:
+            httpx.HTTPError: If the request keeps failing or is rejected
+            ValueError: If the response does not contain one vector per input
+        """
+        payload = {"model": self.model, "input": texts}
+        for attempt in range(self.max_retries + 1):
+            delay = self.initial_backoff * (2**attempt)
+            try:
+                response = await self._client.post(self._url, json=payload)
+            except httpx.TransportError:
+                if attempt == self.max_retries:
+                    raise
+                await asyncio.sleep(delay)
+                continue
+
+            if (
+                response.status_code in _RETRYABLE_STATUS_CODES
+                and attempt < self.max_retries
+            ):
+                retry_after = response.headers.get("retry-after")
+                if retry_after and retry_after.replace(".", "", 1).isdigit():
+                    delay = float(retry_after)
+                logger.warning(
+                    f"Embeddings request returned {response.status_code}; "
+                    f"retrying in {delay:.1f}s "
+                    f"(attempt {attempt + 1}/{self.max_retries})"
+                )
+                await asyncio.sleep(delay)
+                continue
+
+            response.raise_for_status()
+            data = sorted(response.json()["data"], key=lambda d: d["index"])
+            if len(data) != len(texts):
+                raise ValueError(
+                    f"Expected {len(texts)} embeddings, received {len(data)}"
+                )
+            return [d["embedding"] for d in data]
+
+        raise RuntimeError("Embeddings request retries exhausted")
+
+
+def fetch_backfill_page(
+    session: Session,
+    after_id: int,
+    limit: int,
+    model: str,
+    reembed: bool = False,
+) -> List[BackfillItem]:
+    """Return the next page of (id, text) needing an embedding after ``after_id``."""
+    if reembed:
+        needs_embedding = or_(
+            Question.embedding_vector.is_(None),
+            Question.embedding_model.is_(None),
+            Question.embedding_model != model,
+        )
+    else:
+        # Rows with only a legacy array are converted, not re-embedded, by
+        # scripts/compact_question_embeddings.py
+        needs_embedding = and_(
+            Question.embedding_vector.is_(None),
+            Question.question_embedding.is_(None),
+        )
+    rows = session.execute(
+        select(Question.id, Question.question_text)
+        .where(Question.id > after_id, needs_embedding)
+        .order_by(Question.id)
+        .limit(limit)
+    ).all()
+    return [(question_id, text) for question_id, text in rows]
+
+
+def store_embeddings(
+    session: Session,
+    ids: Sequence[int],
+    vectors: Sequence[Sequence[float]],
+    model: str,
+    encoding: str = EMBEDDING_ENCODING_FLOAT32,
+) -> int:
+    """Write a batch of embeddings with one executemany UPDATE and commit.
+
+    The legacy ``question_embedding`` array is cleared because the new vector
+    supersedes it.
+    """
+    params = [
+        {
+            "id": question_id,
+            **encode_embedding(vector, model, encoding=encoding).column_values(),
+            "question_embedding": None,
+        }
+        for question_id, vector in zip(ids, vectors)
+    ]
+    if not params:
+        return 0
+    session.execute(update(Question), params)
+    session.commit()
+    return len(params)
+
+
+def iter_backfill_batches(
+    session: Session,
+    model: str,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_batch_tokens: int = DEFAULT_MAX_BATCH_TOKENS,
+    max_batch_inputs: int = DEFAULT_MAX_BATCH_INPUTS,
+    reembed: bool = False,
+    start_after_id: int = 0,
+    limit: Optional[int] = None,
+    summary: Optional[BackfillSummary] = None,
+) -> Iterator[List[BackfillItem]]:
+    """Yield packed request batches, fetching keyset pages lazily."""
+    after_id = start_after_id
+    remaining = limit
+    while remaining is None or remaining > 0:
+        size = page_size if remaining is None else min(page_size, remaining)
+        page = fetch_backfill_page(session, after_id, size, model, reembed=reembed)
+        if not page:
+            return
+        after_id = page[-1][0]
+        if remaining is not None:
+            remaining -= len(page)
+        if summary is not None:
+            summary.scanned += len(page)
+            summary.last_id = after_id
+        yield from pack_batches(page, max_batch_tokens, max_batch_inputs)
+
+
+async def run_embedding_backfill(
+    session: Session,
+    client: Optional[EmbeddingClient],
+    *,
+    model: str = DEFAULT_EMBEDDING_MODEL,
+    encoding: str = EMBEDDING_ENCODING_FLOAT32,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_batch_tokens: int = DEFAULT_MAX_BATCH_TOKENS,
+    max_batch_inputs: int = DEFAULT_MAX_BATCH_INPUTS,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    reembed: bool = False,
+    start_after_id: int = 0,
+    limit: Optional[int] = None,
+    dry_run: bool = False,
+) -> BackfillSummary:
+    """Embed every question missing an embedding for ``model``.
+
+    Args:
+        session: Sync database session used for the keyset reads. Batch
+            updates run on short-lived sessions bound to the same engine.
+        client: Embeddings client (may be None for a dry run).
+        model: Embedding model to request and record.
+        encoding: Storage encoding, ``"float32"`` or ``"int8"``.
+        page_size: Questions fetched per keyset page.
+        max_batch_tokens: Estimated token budget per embeddings request.
+        max_batch_inputs: Maximum texts per embeddings request.
+        concurrency: Embeddings requests in flight at once.
+        reembed: Also re-embed questions embedded with a different model.
+        start_after_id: Skip questions with an id at or below this value.
+        limit: Maximum number of questions to process.
+        dry_run: Select and pack batches without calling the API or writing.
+
+    Returns:
+        BackfillSummary with counts and the last question id scanned.
+    """
+    if concurrency < 1 or page_size < 1:
+        raise ValueError("concurrency and page_size must be at least 1")
+    if client is None and not dry_run:
+        raise ValueError("An embeddings client is required unless dry_run is set")
+
+    summary = BackfillSummary(last_id=start_after_id)
+    batches = iter_backfill_batches(
+        session,
+        model,
+        page_size=page_size,
+        max_batch_tokens=max_batch_tokens,
+        max_batch_inputs=max_batch_inputs,
+        reembed=reembed,
+        start_after_id=start_after_id,
+        limit=limit,
+        summary=summary,
+    )
+
+    if dry_run:
+        summary.requests = await asyncio.to_thread(sum, (1 for _ in batches))
+        logger.info(
+            f"Dry run: {summary.scanned} questions would be embedded "
+            f"in {summary.requests} requests"
+        )
+        return summary
+
+    assert client is not None
+    bind = session.get_bind()
+    # The batch generator runs keyset queries on ``session``, and a generator
+    # cannot be advanced by two threads at once; the lock hands it to one
+    # worker thread at a time.
+    batches_lock = asyncio.Lock()
+
+    def _next_batch() -> Optional[List[BackfillItem]]:
+        batch = next(batches, None)
+        # End the read transaction so the session is not left idle in one
+        # while requests are in flight
+        session.commit()
+        return batch
+
+    def _store(ids: List[int], vectors: List[List[float]]) -> int:
+        # One short-lived session per write so concurrent workers never share
+        # a Session across threads
+        with Session(bind=bind) as write_session:
+            return store_embeddings(
+                write_session, ids, vectors, model, encoding=encoding
+            )
+
+    async def _worker() -> None:
+        # Blocking DB work runs in threads so requests from other workers
+        # stay in flight while a page is read or a batch is written.
+        while True:
+            async with batches_lock:
+                batch = await asyncio.to_thread(_next_batch)
+            if batch is None:
+                return
+            ids = [question_id for question_id, _ in batch]
+            summary.requests += 1
+            try:
+                vectors = await client.embed([text for _, text in batch])
+            except Exception as e:
+                summary.failed += len(batch)
+                logger.error(
+                    f"Embedding request for questions {ids[0]}-{ids[-1]} "
+                    f"failed: {e}"
+                )
+                continue
+            summary.embedded += await asyncio.to_thread(_store, ids, vectors)
+            logger.info(
+                f"Embedded {summary.embedded}/{summary.scanned} questions "
+                f"({summary.requests} requests, {summary.failed} failed)"
+            )
+
+    async with asyncio.TaskGroup() as workers:
+        for _ in range(concurrency):
+            workers.create_task(_worker())
+
+    return summary
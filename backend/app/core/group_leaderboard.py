@@ -0,0 +1,243 @@
+"""
+Maintenance and reads for the materialized group leaderboard.
+
+``group_leaderboard_entries`` holds one row per group membership with the
+member's best score, average score and test count. Rows are kept current by
+the write paths that change them, inside the caller's transaction:
+
+- ``add_leaderboard_entry`` when a membership is created
+- ``remove_leaderboard_entry`` / ``delete_group_leaderboard`` when memberships
+  go away
+- ``record_result_in_leaderboards`` when a user's TestResult is written
+
+None of these commit; the caller commits them together with the membership or
+result change so the table never drifts from its sources.
+``rebuild_group_leaderboard`` recomputes rows from scratch for repairs.
+
+Reads are ordered by ``(best_score DESC, user_id ASC)`` and served from the
+``ix_group_leaderboard_entries_rank`` index, with opaque keyset cursors for
+pagination.
+"""
+
+import base64
+import binascii
+from typing import Any, Optional, Sequence, Tuple
+
+from sqlalchemy import Row, and_, case, delete, func, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import User
+from app.models.group import GroupLeaderboardEntry, GroupMembership
+from app.models.models import TestResult
+
+
+class InvalidLeaderboardCursor(ValueError):
+    """Raised when a leaderboard cursor cannot be decoded."""
+
+
+def encode_cursor(best_score: int, user_id: int, rank: int) -> str:
+    """Encode the position after the last entry of a page as an opaque cursor."""
+    raw = f"{best_score}:{user_id}:{rank}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[int, int, int]:
+    """
+    Decode a cursor produced by ``encode_cursor``.
+
+    Returns:
+        (best_score, user_id, rank) of the last entry on the previous page
+
+    Raises:
+        InvalidLeaderboardCursor: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        best_score, user_id, rank = (
+            int(part) for part in base64.urlsafe_b64decode(padded).decode().split(":")
+        )
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidLeaderboardCursor("Invalid leaderboard cursor") from e
+    return best_score, user_id, rank
+
+
+async def add_leaderboard_entry(db: AsyncSession, group_id: int, user_id: int) -> None:
+    """
+    Create the leaderboard row for a new membership from the user's results.
+
+    Args:
+        db: Async database session (not committed)
+        group_id: Group the user joined
+        user_id: Joining user
+    """
+    result = await db.execute(
+        select(
+            func.max(TestResult.iq_score),
+            func.sum(TestResult.iq_score),
+            func.count(TestResult.id),
+        ).where(TestResult.user_id == user_id)
+    )
+    best_score, score_sum, test_count = result.one()
+    db.add(
+        GroupLeaderboardEntry(
+            group_id=group_id,
+            user_id=user_id,
+            best_score=best_score or 0,
+            avg_score=(score_sum / test_count) if test_count else 0.0,
+            test_count=test_count,
+            score_sum=score_sum or 0,
+        )
+    )
+
+
+async def remove_leaderboard_entry(
+    db: AsyncSession, group_id: int, user_id: int
+) -> None:
+    """Delete the leaderboard row for a removed membership (not committed)."""
+    await db.execute(
+        delete(GroupLeaderboardEntry).where(
+            and_(
+                GroupLeaderboardEntry.group_id == group_id,
+                GroupLeaderboardEntry.user_id == user_id,
+            )
+        )
+    )
+
+
+async def delete_group_leaderboard(db: AsyncSession, group_id: int) -> None:
+    """Delete every leaderboard row for a group (not committed)."""
+    await db.execute(
+        delete(GroupLeaderboardEntry).where(GroupLeaderboardEntry.group_id == group_id)
+    )
+
+
+async def record_result_in_leaderboards(
+    db: AsyncSession, user_id: int, iq_score: int
+) -> None:
+    """
+    Fold a new test result into the user's row in every group they belong to.
+
+    A single UPDATE over ``ix_group_leaderboard_entries_user_id``; the SET
+    expressions read the pre-update values, so concurrent results for the same
+    user serialize on the row locks without losing increments.
+
+    Args:
+        db: Async database session (not committed)
+        user_id: User the result belongs to
+        iq_score: Score of the new result
+    """
+    entry = GroupLeaderboardEntry
+    await db.execute(
+        update(entry)
+        .where(entry.user_id == user_id)
+        .values(
+            best_score=case(
+                (entry.best_score < iq_score, iq_score), else_=entry.best_score
+            ),
+            score_sum=entry.score_sum + iq_score,
+            test_count=entry.test_count + 1,
+            avg_score=(entry.score_sum + iq_score) * 1.0 / (entry.test_count + 1),
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def rebuild_group_leaderboard(
+    db: AsyncSession, group_id: Optional[int] = None
+) -> None:
+    """
+    Recompute leaderboard rows from memberships and test results.
+
+    Repairs drift (e.g. after results are deleted or rescored outside the
+    normal write paths). Not committed.
+
+    Args:
+        db: Async database session
+        group_id: Group to rebuild, or None for every group
+    """
+    stale = delete(GroupLeaderboardEntry)
+    source = (
+        select(
+            GroupMembership.group_id,
+            GroupMembership.user_id,
+            func.coalesce(func.max(TestResult.iq_score), 0),
+            func.coalesce(func.avg(TestResult.iq_score), 0.0),
+            func.count(TestResult.id),
+            func.coalesce(func.sum(TestResult.iq_score), 0),
+        )
+        .outerjoin(TestResult, TestResult.user_id == GroupMembership.user_id)
+        .group_by(GroupMembership.group_id, GroupMembership.user_id)
+    )
+    if group_id is not None:
+        stale = stale.where(GroupLeaderboardEntry.group_id == group_id)
+        source = source.where(GroupMembership.group_id == group_id)
+
+    await db.execute(stale)
+    await db.execute(
+        insert(GroupLeaderboardEntry).from_select(
+            [
+                "group_id",
+                "user_id",
+                "best_score",
+                "avg_score",
+                "test_count",
+                "score_sum",
+            ],
+            source,
+        )
+    )
+
+
+async def count_leaderboard_entries(db: AsyncSession, group_id: int) -> int:
+    """Return the number of ranked members in a group."""
+    result = await db.execute(
+        select(func.count())
+        .select_from(GroupLeaderboardEntry)
+        .where(GroupLeaderboardEntry.group_id == group_id)
+    )
+    return result.scalar() or 0
+
+
+async def fetch_leaderboard_page(
+    db: AsyncSession,
+    group_id: int,
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+    after: Optional[Tuple[int, int]] = None,
+) -> Sequence[Row[Any]]:
+    """
+    Return ranked (user_id, first_name, best_score, avg_score) rows for a group.
+
+    Args:
+        db: Async database session
+        group_id: Group to read
+        limit: Maximum rows to return (None for all)
+        offset: Rows to skip (ignored when ``after`` is given)
+        after: ``(best_score, user_id)`` of the last row already returned;
+            rows strictly after it in rank order are returned
+
+    Returns:
+        Rows ordered by best_score descending, then user_id ascending
+    """
+    entry = GroupLeaderboardEntry
+    stmt = (
+        select(entry.user_id, User.first_name, entry.best_score, entry.avg_score)
+        .join(User, User.id == entry.user_id)
+        .where(entry.group_id == group_id)
+        .order_by(entry.best_score.desc(), entry.user_id)
+    )
+    if after is not None:
+        after_score, after_user_id = after
+        stmt = stmt.where(
+            or_(
+                entry.best_score < after_score,
+                and_(entry.best_score == after_score, entry.user_id > after_user_id),
+            )
+        )
+    elif offset:
+        stmt = stmt.offset(offset)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+
+    result = await db.execute(stmt)
+    return result.all()
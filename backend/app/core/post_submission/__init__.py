@@ -0,0 +1,38 @@
+"""Asynchronous post-submission pipeline.
+
+Moves the non-scoring work of ``POST /v1/test/submit`` (response-time
+analysis, validity analysis, SEM/CI, question and distractor statistics,
+shadow CAT) onto a durable DB-backed queue drained by a bounded worker pool.
+Enabled with ``POST_SUBMISSION_PIPELINE_ENABLED``; when disabled, the submit
+endpoint keeps running every stage inline.
+"""
+
+from app.core.post_submission.queue import (
+    FIXED_FORM_STAGES,
+    claim_next_job,
+    compute_retry_delay,
+    enqueue_post_submission_jobs,
+    lock_owned_job,
+    record_job_failure,
+)
+from app.core.post_submission.worker import (
+    PostSubmissionWorkerPool,
+    get_post_submission_worker_pool,
+    init_post_submission_worker_pool,
+    notify_post_submission_workers,
+    shutdown_post_submission_worker_pool,
+)
+
+__all__ = [
+    "FIXED_FORM_STAGES",
+    "claim_next_job",
+    "compute_retry_delay",
+    "enqueue_post_submission_jobs",
+    "lock_owned_job",
+    "record_job_failure",
+    "PostSubmissionWorkerPool",
+    "get_post_submission_worker_pool",
+    "init_post_submission_worker_pool",
+    "notify_post_submission_workers",
+    "shutdown_post_submission_worker_pool",
+]
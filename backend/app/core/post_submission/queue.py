@@ -0,0 +1,259 @@
+"""Durable job queue for post-submission processing.
+
+Jobs live in the ``post_submission_jobs`` table so they survive restarts and
+are visible to every API process. Claiming uses ``SELECT ... FOR UPDATE SKIP
+LOCKED`` on PostgreSQL, which lets several worker pools drain the same queue
+concurrently without handing the same row to two workers. SQLite ignores the
+locking clause, which is fine for the single-process test suite.
+
+A claimed job carries a lease (``locked_at``). If the process dies mid-job,
+the lease expires and another worker reclaims the row, so work is never lost
+— only retried. Every claim increments ``attempts``, which doubles as a
+fencing token: a worker only writes stage results or failures while the row
+is still RUNNING with the attempt number it claimed.
+"""
+
+import logging
+from datetime import timedelta
+from typing import Any, Dict, Iterable, Optional
+
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.datetime_utils import utc_now
+from app.models.models import PostSubmissionJob, PostSubmissionJobStatus
+
+logger = logging.getLogger(__name__)
+
+# Stage names. Each maps to a handler in stages.py.
+STAGE_RESPONSE_TIME_ANALYSIS = "response_time_analysis"
+STAGE_RESPONSE_TIME_HISTOGRAM = "response_time_histogram"
+STAGE_VALIDITY_ANALYSIS = "validity_analysis"
+STAGE_SEM_CI = "sem_ci"
+STAGE_QUESTION_STATISTICS = "question_statistics"
+STAGE_DISTRACTOR_STATS = "distractor_stats"
+STAGE_DISTRACTOR_QUARTILE_STATS = "distractor_quartile_stats"
+STAGE_SHADOW_CAT = "shadow_cat"
+
+# Stages enqueued for every fixed-form submission
+FIXED_FORM_STAGES = (
+    STAGE_RESPONSE_TIME_ANALYSIS,
+    STAGE_RESPONSE_TIME_HISTOGRAM,
+    STAGE_VALIDITY_ANALYSIS,
+    STAGE_SEM_CI,
+    STAGE_DISTRACTOR_STATS,
+    STAGE_QUESTION_STATISTICS,
+    STAGE_DISTRACTOR_QUARTILE_STATS,
+    STAGE_SHADOW_CAT,
+)
+
+# Retry backoff: 5s, 10s, 20s, ... capped at 10 minutes
+RETRY_BASE_DELAY_SECONDS = 5.0
+RETRY_MAX_DELAY_SECONDS = 600.0
+
+# Truncate stored error messages so a huge traceback can't bloat the row
+MAX_ERROR_MESSAGE_LENGTH = 2000
+
+
+def compute_retry_delay(attempts: int) -> float:
+    """Return the backoff delay in seconds before retrying a failed job.
+
+    Args:
+        attempts: Number of attempts made so far (>= 1)
+
+    Returns:
+        Delay in seconds, doubling per attempt up to RETRY_MAX_DELAY_SECONDS
+    """
+    exponent = max(attempts - 1, 0)
+    return min(RETRY_BASE_DELAY_SECONDS * (2**exponent), RETRY_MAX_DELAY_SECONDS)
+
+
+def enqueue_post_submission_jobs(
+    db: AsyncSession,
+    session_id: int,
+    stages: Iterable[str],
+    payload: Optional[Dict[str, Any]] = None,
+    max_attempts: int = 5,
+) -> list[PostSubmissionJob]:
+    """Add one pending job per stage to the session.
+
+    Does NOT commit. Callers add the jobs in the same transaction that
+    persists the TestResult, so a committed score always has its follow-up
+    work queued and a rolled-back submission never leaves orphan jobs.
+
+    Args:
+        db: Async database session
+        session_id: Test session the jobs belong to
+        stages: Stage names to enqueue
+        payload: Stage inputs shared by all jobs (e.g. correct/total counts)
+        max_attempts: Attempts before a job is marked failed
+
+    Returns:
+        The newly added PostSubmissionJob objects
+    """
+    now = utc_now()
+    jobs = [
+        PostSubmissionJob(
+            test_session_id=session_id,
+            stage=stage,
+            status=PostSubmissionJobStatus.PENDING,
+            payload=payload,
+            attempts=0,
+            max_attempts=max_attempts,
+            run_after=now,
+            created_at=now,
+        )
+        for stage in stages
+    ]
+    db.add_all(jobs)
+    return jobs
+
+
+async def claim_next_job(
+    db: AsyncSession, lease_seconds: float
+) -> Optional[PostSubmissionJob]:
+    """Claim the next runnable job and commit the claim.
+
+    A job is runnable when it is pending and due, or when it is running but
+    its lease has expired (the worker that claimed it is presumed dead).
+
+    Args:
+        db: Async database session
+        lease_seconds: How long a claim is honoured before it can be stolen
+
+    Returns:
+        The claimed job (status RUNNING, attempts incremented) or None
+    """
+    now = utc_now()
+    lease_cutoff = now - timedelta(seconds=lease_seconds)
+
+    stmt = (
+        select(PostSubmissionJob)
+        .where(
+            or_(
+                and_(
+                    PostSubmissionJob.status == PostSubmissionJobStatus.PENDING,
+                    PostSubmissionJob.run_after <= now,
+                ),
+                and_(
+                    PostSubmissionJob.status == PostSubmissionJobStatus.RUNNING,
+                    PostSubmissionJob.locked_at < lease_cutoff,
+                ),
+            )
+        )
+        .order_by(PostSubmissionJob.run_after, PostSubmissionJob.id)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+    )
+    result = await db.execute(stmt)
+    job = result.scalar_one_or_none()
+    if job is None:
+        await db.rollback()
+        return None
+
+    if job.status == PostSubmissionJobStatus.RUNNING:
+        logger.warning(
+            f"Reclaiming post-submission job {job.id} ({job.stage}) for session "
+            f"{job.test_session_id}: lease expired after {lease_seconds}s"
+        )
+        if job.attempts >= job.max_attempts:
+            job.status = PostSubmissionJobStatus.FAILED
+            job.locked_at = None
+            job.last_error = "Lease expired on final attempt"
+            await db.commit()
+            return None
+
+    job.status = PostSubmissionJobStatus.RUNNING
+    job.locked_at = now
+    job.attempts += 1
+    await db.commit()
+    return job
+
+
+async def lock_owned_job(
+    db: AsyncSession, job_id: int, claimed_attempt: int
+) -> Optional[PostSubmissionJob]:
+    """Lock a claimed job and return it if this worker still holds the lease.
+
+    The row lock is held until the caller's transaction ends, so on
+    PostgreSQL the lease cannot be stolen (``claim_next_job`` skips locked
+    rows) between this check and the commit of the stage's writes.
+
+    Args:
+        db: Async database session the stage will write through
+        job_id: ID of the claimed job
+        claimed_attempt: ``attempts`` value observed when the job was claimed
+
+    Returns:
+        The locked job, or None if it is gone or was reclaimed by another
+        worker after the lease expired
+    """
+    result = await db.execute(
+        select(PostSubmissionJob)
+        .where(PostSubmissionJob.id == job_id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+    job = result.scalar_one_or_none()
+    if job is None:
+        return None
+    if (
+        job.status != PostSubmissionJobStatus.RUNNING
+        or job.attempts != claimed_attempt
+    ):
+        logger.warning(
+            f"Post-submission job {job.id} ({job.stage}) for session "
+            f"{job.test_session_id} lost its lease (claimed attempt "
+            f"{claimed_attempt}, now attempt {job.attempts}, status "
+            f"{job.status}); discarding this attempt"
+        )
+        return None
+    return job
+
+
+async def record_job_failure(
+    db: AsyncSession,
+    job_id: int,
+    error: BaseException,
+    claimed_attempt: Optional[int] = None,
+) -> Optional[PostSubmissionJob]:
+    """Record a failed attempt, scheduling a retry or marking the job failed.
+
+    Args:
+        db: Async database session (fresh; the handler's session is discarded)
+        job_id: ID of the job that failed
+        error: The exception raised by the stage handler
+        claimed_attempt: ``attempts`` value observed at claim time. When
+            given, the failure is only recorded if the lease is still held.
+
+    Returns:
+        The updated job, or None if it no longer exists or the lease was lost
+    """
+    if claimed_attempt is None:
+        job = await db.get(PostSubmissionJob, job_id)
+    else:
+        job = await lock_owned_job(db, job_id, claimed_attempt)
+    if job is None:
+        await db.rollback()
+        return None
+
+    job.last_error = f"{type(error).__name__}: {error}"[:MAX_ERROR_MESSAGE_LENGTH]
+    job.locked_at = None
+    if job.attempts >= job.max_attempts:
+        job.status = PostSubmissionJobStatus.FAILED
+        logger.error(
+            f"Post-submission job {job.id} ({job.stage}) for session "
+            f"{job.test_session_id} failed permanently after {job.attempts} "
+            f"attempts: {job.last_error}"
+        )
+    else:
+        delay = compute_retry_delay(job.attempts)
+        job.status = PostSubmissionJobStatus.PENDING
+        job.run_after = utc_now() + timedelta(seconds=delay)
+        logger.warning(
+            f"Post-submission job {job.id} ({job.stage}) for session "
+            f"{job.test_session_id} failed (attempt {job.attempts}/"
+            f"{job.max_attempts}), retrying in {delay:.0f}s: {job.last_error}"
+        )
+    await db.commit()
+    return job
@@ -0,0 +1,255 @@
+"""Stage handlers for the post-submission pipeline.
+
+Each handler receives the worker's AsyncSession and the claimed job. The
+worker marks the job completed in that same session before calling the
+handler and commits afterwards, so a stage's writes and its completion
+marker land in one transaction. Handlers that increment counters (distractor
+stats) therefore run exactly once per session even when retried, and
+handlers that recompute from scratch (validity, SEM, statistics) are
+naturally idempotent.
+
+Handlers raise on failure so the worker can schedule a retry; they do not
+swallow errors the way the inline ``graceful_failure`` blocks in
+``submit_test`` do.
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import invalidate_user_cache
+from app.core.datetime_utils import utc_now
+from app.core.post_submission.queue import (
+    STAGE_DISTRACTOR_QUARTILE_STATS,
+    STAGE_DISTRACTOR_STATS,
+    STAGE_QUESTION_STATISTICS,
+    STAGE_RESPONSE_TIME_ANALYSIS,
+    STAGE_RESPONSE_TIME_HISTOGRAM,
+    STAGE_SEM_CI,
+    STAGE_SHADOW_CAT,
+    STAGE_VALIDITY_ANALYSIS,
+)
+from app.core.psychometrics.distractor_analysis import (
+    async_update_distractor_stats,
+    async_update_session_quartile_stats,
+)
+from app.core.psychometrics.question_analytics import update_question_statistics
+from app.core.psychometrics.response_time_histograms import (
+    async_fold_session_response_times,
+)
+from app.core.psychometrics.time_analysis import (
+    async_analyze_response_times,
+    get_session_time_summary,
+)
+from app.core.psychometrics.validity_analysis import (
+    assess_session_validity,
+    calculate_person_fit_heuristic,
+    check_response_time_plausibility,
+    count_guttman_errors,
+    should_skip_revalidation,
+)
+from app.core.scoring.engine import (
+    async_get_cached_reliability,
+    calculate_confidence_interval,
+    calculate_sem,
+)
+from app.models.models import PostSubmissionJob, Question, Response, TestResult
+
+logger = logging.getLogger(__name__)
+
+StageHandler = Callable[[AsyncSession, PostSubmissionJob], Awaitable[None]]
+
+
+async def _get_test_result(db: AsyncSession, session_id: int) -> TestResult:
+    """Load the TestResult for a session, raising if it is missing."""
+    result = await db.execute(
+        select(TestResult).where(TestResult.test_session_id == session_id)
+    )
+    test_result = result.scalar_one_or_none()
+    if test_result is None:
+        raise LookupError(f"No test result for session {session_id}")
+    return test_result
+
+
+async def run_response_time_analysis(db: AsyncSession, job: PostSubmissionJob) -> None:
+    """Populate TestResult.response_time_flags from stored response times."""
+    session_id = job.test_session_id
+    test_result = await _get_test_result(db, session_id)
+
+    time_analysis = await async_analyze_response_times(db, session_id)
+    response_time_flags = get_session_time_summary(time_analysis)
+    test_result.response_time_flags = response_time_flags
+
+    if response_time_flags.get("validity_concern"):
+        logger.info(
+            f"Test session {session_id} has validity concerns: "
+            f"flags={response_time_flags.get('flags')}"
+        )
+    invalidate_user_cache(test_result.user_id)
+
+
+async def run_response_time_histogram(db: AsyncSession, job: PostSubmissionJob) -> None:
+    """Add the session's response times to the percentile histograms.
+
+    Folding marks the session, so a retried job never counts it twice.
+    """
+    await async_fold_session_response_times(db, job.test_session_id)
+
+
+async def run_validity_analysis(db: AsyncSession, job: PostSubmissionJob) -> None:
+    """Run person-fit, timing and Guttman checks and store the assessment.
+
+    Mirrors ``_run_validity_analysis`` in the submit endpoint, but reads the
+    responses back from the database instead of the request body. Sessions
+    that already carry a validity assessment (or an admin override) are left
+    untouched.
+    """
+    session_id = job.test_session_id
+    test_result = await _get_test_result(db, session_id)
+
+    if test_result.validity_overridden_at is not None or should_skip_revalidation(
+        test_result.validity_status, test_result.validity_checked_at
+    ):
+        return
+
+    result = await db.execute(
+        select(Response, Question)
+        .join(Question, Response.question_id == Question.id)
+        .where(Response.test_session_id == session_id)
+    )
+    rows = result.all()
+
+    person_fit_data: list[tuple[bool, str]] = []
+    time_check_data: list[dict[str, object]] = []
+    guttman_data: list[tuple[bool, float]] = []
+
+    for response, question in rows:
+        difficulty = (
+            question.difficulty_level.value if question.difficulty_level else "medium"
+        )
+        person_fit_data.append((response.is_correct, difficulty))
+        time_check_data.append(
+            {
+                "time_seconds": response.time_spent_seconds,
+                "is_correct": response.is_correct,
+                "difficulty": difficulty,
+            }
+        )
+        if question.empirical_difficulty is not None:
+            guttman_data.append((response.is_correct, question.empirical_difficulty))
+
+    correct_count = sum(1 for is_correct, _ in person_fit_data if is_correct)
+
+    validity_assessment = assess_session_validity(
+        person_fit=calculate_person_fit_heuristic(
+            responses=person_fit_data, total_score=correct_count
+        ),
+        time_check=check_response_time_plausibility(responses=time_check_data),
+        guttman_check=count_guttman_errors(responses=guttman_data),
+    )
+
+    test_result.validity_status = validity_assessment["validity_status"]
+    test_result.validity_flags = validity_assessment["flag_details"] or None
+    test_result.validity_checked_at = utc_now()
+
+    if test_result.validity_status != "valid":
+        logger.warning(
+            f"Test session {session_id} validity assessment: "
+            f"status={test_result.validity_status}, "
+            f"severity={validity_assessment['severity_score']}, "
+            f"flags={[f['type'] for f in validity_assessment['flag_details']]}"
+        )
+    invalidate_user_cache(test_result.user_id)
+
+
+async def run_sem_ci(db: AsyncSession, job: PostSubmissionJob) -> None:
+    """Populate standard error and 95% confidence interval on the TestResult."""
+    session_id = job.test_session_id
+    test_result = await _get_test_result(db, session_id)
+
+    reliability = await async_get_cached_reliability(db)
+    if reliability is None:
+        logger.info(
+            f"Test session {session_id}: SEM calculation skipped - "
+            "insufficient data or reliability below threshold (< 0.60)"
+        )
+        return
+
+    standard_error = calculate_sem(reliability)
+    ci_lower, ci_upper = calculate_confidence_interval(
+        score=test_result.iq_score, sem=standard_error
+    )
+    test_result.standard_error = standard_error
+    test_result.ci_lower = ci_lower
+    test_result.ci_upper = ci_upper
+    invalidate_user_cache(test_result.user_id)
+
+
+async def run_distractor_stats(db: AsyncSession, job: PostSubmissionJob) -> None:
+    """Increment per-option selection counts for every response in the session.
+
+    This is the deferred form of the per-response update ``_process_responses``
+    performs inline when the pipeline is disabled.
+    """
+    result = await db.execute(
+        select(Response.question_id, Response.user_answer).where(
+            Response.test_session_id == job.test_session_id
+        )
+    )
+    for question_id, user_answer in result.all():
+        await async_update_distractor_stats(
+            db=db, question_id=question_id, selected_answer=user_answer
+        )
+
+
+async def run_question_statistics(db: AsyncSession, job: PostSubmissionJob) -> None:
+    """Recompute empirical difficulty and discrimination for session items."""
+    await update_question_statistics(db, job.test_session_id)
+
+
+async def run_distractor_quartile_stats(
+    db: AsyncSession, job: PostSubmissionJob
+) -> None:
+    """Update top/bottom quartile distractor stats using the stored counts."""
+    payload = job.payload or {}
+    await async_update_session_quartile_stats(
+        db=db,
+        test_session_id=job.test_session_id,
+        correct_answers=payload["correct_count"],
+        total_questions=payload["response_count"],
+    )
+
+
+async def run_shadow_cat_stage(db: AsyncSession, job: PostSubmissionJob) -> None:
+    """Run shadow CAT on the shared bounded shadow CAT executor.
+
+    ``run_shadow_cat`` is synchronous and already idempotent (it returns the
+    existing ShadowCATResult if one is stored), so it runs on its own sync
+    session in an executor thread rather than sharing the worker's
+    AsyncSession. It runs with ``raise_errors`` so a failed replay fails the
+    stage, and when the executor is saturated the stage raises too; either
+    way the job is retried with backoff.
+    """
+    from app.core.shadow_cat.executor import get_shadow_cat_executor
+
+    future = get_shadow_cat_executor().submit(
+        job.test_session_id, raise_errors=True
+    )
+    if future is None:
+        raise RuntimeError("Shadow CAT executor is saturated")
+    await asyncio.wrap_future(future)
+
+
+STAGE_HANDLERS: Dict[str, StageHandler] = {
+    STAGE_RESPONSE_TIME_ANALYSIS: run_response_time_analysis,
+    STAGE_RESPONSE_TIME_HISTOGRAM: run_response_time_histogram,
+    STAGE_VALIDITY_ANALYSIS: run_validity_analysis,
+    STAGE_SEM_CI: run_sem_ci,
+    STAGE_DISTRACTOR_STATS: run_distractor_stats,
+    STAGE_QUESTION_STATISTICS: run_question_statistics,
+    STAGE_DISTRACTOR_QUARTILE_STATS: run_distractor_quartile_stats,
+    STAGE_SHADOW_CAT: run_shadow_cat_stage,
+}
@@ -0,0 +1,243 @@
+"""Worker pool that drains the post-submission job queue.
+
+The pool runs a fixed number of asyncio tasks on the application's event
+loop. Each task claims one job at a time, runs its stage handler on a fresh
+AsyncSession and records success or failure. Idle workers sleep until either
+the poll interval elapses or ``notify()`` is called by the submit endpoint
+after it commits new jobs, so freshly queued work starts immediately without
+tight polling.
+
+Concurrency is bounded by the number of workers, which also bounds the DB
+connections the pipeline can hold — unlike the per-submission threads it
+replaces.
+"""
+
+import asyncio
+import logging
+from typing import Callable, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.datetime_utils import utc_now
+from app.core.post_submission.queue import (
+    claim_next_job,
+    lock_owned_job,
+    record_job_failure,
+)
+from app.core.post_submission.stages import STAGE_HANDLERS
+from app.models.base import AsyncSessionLocal
+from app.models.models import PostSubmissionJobStatus
+from app.observability import metrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 4
+DEFAULT_POLL_INTERVAL_SECONDS = 2.0
+DEFAULT_LEASE_SECONDS = 300.0
+
+
+class PostSubmissionWorkerPool:
+    """
+    Bounded pool of asyncio workers for post-submission jobs.
+
+    Usage:
+        pool = PostSubmissionWorkerPool(concurrency=4)
+        pool.start()          # inside a running event loop (app lifespan)
+        pool.notify()         # after committing new jobs
+        await pool.stop()     # on shutdown
+    """
+
+    def __init__(
+        self,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        poll_interval_seconds: float = DEFAULT_POLL_INTERVAL_SECONDS,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+    ) -> None:
+        """Initialize the pool without starting any workers."""
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+        self.concurrency = concurrency
+        self.poll_interval_seconds = poll_interval_seconds
+        self.lease_seconds = lease_seconds
+        self._session_factory = session_factory
+        self._tasks: List[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stopping = False
+
+    @property
+    def is_running(self) -> bool:
+        """Whether worker tasks are currently active."""
+        return any(not task.done() for task in self._tasks)
+
+    def start(self) -> None:
+        """Start worker tasks on the current event loop (idempotent)."""
+        if self.is_running:
+            return
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        self._tasks = [
+            asyncio.create_task(
+                self._worker_loop(index), name=f"post-submission-worker-{index}"
+            )
+            for index in range(self.concurrency)
+        ]
+        logger.info(f"Post-submission worker pool started ({self.concurrency} workers)")
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Stop accepting work and wait for in-flight jobs to finish.
+
+        Jobs still running when the timeout expires are cancelled; their
+        leases expire and another process picks them up later.
+        """
+        if not self._tasks:
+            return
+        self._stopping = True
+        if self._wakeup is not None:
+            self._wakeup.set()
+        _, pending = await asyncio.wait(self._tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        self._tasks = []
+        logger.info("Post-submission worker pool stopped")
+
+    def notify(self) -> None:
+        """Wake idle workers so newly committed jobs start immediately."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def run_once(self) -> bool:
+        """Claim and run a single job.
+
+        Returns:
+            True if a job was claimed (whether it succeeded or not),
+            False if the queue had nothing runnable.
+        """
+        async with self._session_factory() as db:
+            job = await claim_next_job(db, lease_seconds=self.lease_seconds)
+            if job is None:
+                return False
+            job_id = job.id
+            stage = job.stage
+            session_id = job.test_session_id
+            claimed_attempt = job.attempts
+
+        try:
+            await self._execute(job_id, claimed_attempt)
+        except Exception as e:
+            logger.debug(
+                f"Post-submission stage '{stage}' failed for session {session_id}",
+                exc_info=True,
+            )
+            async with self._session_factory() as db:
+                failed_job = await record_job_failure(
+                    db, job_id, e, claimed_attempt=claimed_attempt
+                )
+            if (
+                failed_job is not None
+                and failed_job.status == PostSubmissionJobStatus.FAILED
+            ):
+                metrics.record_error(error_type=f"PostSubmissionJobFailure:{stage}")
+        return True
+
+    async def drain(self, max_jobs: Optional[int] = None) -> int:
+        """Run jobs until the queue is empty (or max_jobs have run).
+
+        Intended for scripts and tests; the API uses ``start()`` instead.
+
+        Returns:
+            Number of jobs processed
+        """
+        processed = 0
+        while max_jobs is None or processed < max_jobs:
+            if not await self.run_once():
+                break
+            processed += 1
+        return processed
+
+    async def _execute(self, job_id: int, claimed_attempt: int) -> None:
+        """Run a claimed job's stage and commit it together with completion.
+
+        Nothing is written if the lease was lost (another worker reclaimed
+        the job after it expired); that worker owns the job now.
+        """
+        async with self._session_factory() as db:
+            job = await lock_owned_job(db, job_id, claimed_attempt)
+            if job is None:
+                await db.rollback()
+                return
+            handler = STAGE_HANDLERS.get(job.stage)
+            if handler is None:
+                raise ValueError(f"Unknown post-submission stage '{job.stage}'")
+
+            job.status = PostSubmissionJobStatus.COMPLETED
+            job.completed_at = utc_now()
+            job.locked_at = None
+            job.last_error = None
+            try:
+                await handler(db, job)
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
+
+    async def _worker_loop(self, index: int) -> None:
+        """Claim and run jobs until the pool is stopped."""
+        assert self._wakeup is not None
+        while not self._stopping:
+            try:
+                if await self.run_once():
+                    continue
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # Claiming itself failed (e.g. DB unavailable); back off and retry
+                logger.exception(f"Post-submission worker {index} iteration failed")
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(), timeout=self.poll_interval_seconds
+                )
+            except asyncio.TimeoutError:
+                pass
+
+
+_worker_pool: Optional[PostSubmissionWorkerPool] = None
+
+
+def init_post_submission_worker_pool(
+    concurrency: int = DEFAULT_CONCURRENCY,
+    poll_interval_seconds: float = DEFAULT_POLL_INTERVAL_SECONDS,
+    lease_seconds: float = DEFAULT_LEASE_SECONDS,
+) -> PostSubmissionWorkerPool:
+    """Create (or replace) the process-wide worker pool and start it."""
+    global _worker_pool
+    _worker_pool = PostSubmissionWorkerPool(
+        concurrency=concurrency,
+        poll_interval_seconds=poll_interval_seconds,
+        lease_seconds=lease_seconds,
+    )
+    _worker_pool.start()
+    return _worker_pool
+
+
+def get_post_submission_worker_pool() -> Optional[PostSubmissionWorkerPool]:
+    """Return the process-wide worker pool, or None if not initialized."""
+    return _worker_pool
+
+
+async def shutdown_post_submission_worker_pool(timeout: float = 10.0) -> None:
+    """Stop the process-wide worker pool if it is running."""
+    global _worker_pool
+    if _worker_pool is not None:
+        await _worker_pool.stop(timeout=timeout)
+        _worker_pool = None
+
+
+def notify_post_submission_workers() -> None:
+    """Wake the process-wide worker pool, if one is running."""
+    if _worker_pool is not None:
+        _worker_pool.notify()
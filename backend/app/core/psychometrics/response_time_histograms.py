@@ -0,0 +1,333 @@
+"""
+Persisted response-time histograms for percentile analytics (TASK-836).
+
+``response_time_histogram_bins`` holds, per question, the number of responses
+that took each whole number of seconds. Because ``Response.time_spent_seconds``
+is an integer, these histograms are exact, mergeable quantile sketches:
+merging the bins of several groups gives the histogram of their union, and any
+order statistic (median, p90, p95) can be read off the cumulative counts
+without looking at a single response row.
+
+Bins are keyed by question rather than by (type, difficulty) so the reads
+join the question's current labels. Recalibration relabels
+``Question.difficulty_level`` in place, and the difficulty breakdowns follow
+it without any rewrite of the bins.
+
+Each completed session is folded in exactly once, marked by
+``TestSession.response_times_aggregated_at``:
+
+- ``async_fold_session_response_times`` when a submission completes (a
+  post-submission stage, or inline when the pipeline is disabled) and when an
+  adaptive session finishes
+- ``refresh_response_time_histograms`` from the daily CAT readiness cron,
+  catching up on any completed session the write path missed (rows written
+  by scripts, failed inline folds). History from before this table existed is
+  folded by its migration. Analytics reads never write.
+
+Folding claims sessions with a conditional UPDATE before incrementing, so two
+workers folding the same session concurrently cannot double count it.
+Responses removed after they were folded (account deletion) stay counted until
+``rebuild_response_time_histograms`` recomputes the table from scratch.
+"""
+
+import logging
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from sqlalchemy import Select, delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.datetime_utils import utc_now
+from app.models.models import (
+    Question,
+    Response,
+    ResponseTimeHistogramBin,
+    TestSession,
+    TestStatus,
+)
+
+logger = logging.getLogger(__name__)
+
+# (question_type, difficulty_level) enum values, e.g. ("pattern", "easy"), as
+# returned by the loaders after joining the questions' current labels
+HistogramKey = Tuple[str, str]
+
+# Seconds -> number of responses
+Histogram = Dict[int, int]
+
+# Completed sessions folded per transaction when catching up
+REFRESH_BATCH_SESSIONS = 500
+
+# Bins per INSERT ... ON CONFLICT statement (keeps bind parameters well under
+# the SQLite and PostgreSQL limits)
+UPSERT_BATCH_BINS = 1000
+
+
+def merge_histograms(histograms: Iterable[Histogram]) -> Histogram:
+    """
+    Merge histograms by adding their counts.
+
+    Args:
+        histograms: Histograms to combine
+
+    Returns:
+        Histogram of the union of the underlying responses
+    """
+    merged: Histogram = {}
+    for histogram in histograms:
+        for seconds, count in histogram.items():
+            merged[seconds] = merged.get(seconds, 0) + count
+    return merged
+
+
+def _pending_sessions_query(batch_size: int) -> Select:
+    """Completed sessions whose responses are not in the histograms yet."""
+    return (
+        select(TestSession.id)
+        .where(
+            TestSession.status == TestStatus.COMPLETED,
+            TestSession.response_times_aggregated_at.is_(None),
+        )
+        .order_by(TestSession.id)
+        .limit(batch_size)
+    )
+
+
+def _claim_statement(session_ids: Sequence[int]):
+    """
+    Mark sessions as folded, returning only the ones this caller claimed.
+
+    On PostgreSQL a concurrent claimer blocks on the row locks and then
+    re-evaluates ``response_times_aggregated_at IS NULL``, so each session is
+    returned to exactly one transaction.
+    """
+    return (
+        update(TestSession)
+        .where(
+            TestSession.id.in_(session_ids),
+            TestSession.status == TestStatus.COMPLETED,
+            TestSession.response_times_aggregated_at.is_(None),
+        )
+        .values(response_times_aggregated_at=utc_now())
+        .returning(TestSession.id)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _session_bins_query(session_ids: Sequence[int]) -> Select:
+    """Per-(question, seconds) response counts for the given sessions."""
+    return (
+        select(
+            Response.question_id,
+            Response.time_spent_seconds,
+            func.count(Response.id),
+        )
+        .where(
+            Response.test_session_id.in_(session_ids),
+            Response.time_spent_seconds.isnot(None),
+        )
+        .group_by(Response.question_id, Response.time_spent_seconds)
+    )
+
+
+def _upsert_statements(dialect_name: str, rows: Sequence[Tuple]) -> List:
+    """
+    Build INSERT ... ON CONFLICT statements adding ``rows`` to the bins.
+
+    Args:
+        dialect_name: "postgresql" or "sqlite"
+        rows: (question_id, seconds, count) tuples
+
+    Returns:
+        Statements to execute, one per UPSERT_BATCH_BINS rows
+    """
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise NotImplementedError(
+            f"Response-time histograms do not support the {dialect_name} dialect"
+        )
+
+    now = utc_now()
+    values = [
+        {
+            "question_id": question_id,
+            "time_spent_seconds": seconds,
+            "response_count": count,
+            "updated_at": now,
+        }
+        for question_id, seconds, count in rows
+    ]
+    table = ResponseTimeHistogramBin.__table__
+    statements = []
+    for start in range(0, len(values), UPSERT_BATCH_BINS):
+        stmt = insert(table).values(values[start : start + UPSERT_BATCH_BINS])
+        statements.append(
+            stmt.on_conflict_do_update(
+                index_elements=[table.c.question_id, table.c.time_spent_seconds],
+                set_={
+                    "response_count": table.c.response_count
+                    + stmt.excluded.response_count,
+                    "updated_at": stmt.excluded.updated_at,
+                },
+            )
+        )
+    return statements
+
+
+def _to_histograms(rows: Iterable[Tuple]) -> Dict[HistogramKey, Histogram]:
+    histograms: Dict[HistogramKey, Histogram] = {}
+    for question_type, difficulty_level, seconds, count in rows:
+        key = (question_type.value, difficulty_level.value)
+        histograms.setdefault(key, {})[seconds] = int(count)
+    return histograms
+
+
+def _load_query() -> Select:
+    """Per-question bins merged under each question's current labels."""
+    response_count = func.sum(ResponseTimeHistogramBin.response_count)
+    return (
+        select(
+            Question.question_type,
+            Question.difficulty_level,
+            ResponseTimeHistogramBin.time_spent_seconds,
+            response_count,
+        )
+        .join(Question, ResponseTimeHistogramBin.question_id == Question.id)
+        .group_by(
+            Question.question_type,
+            Question.difficulty_level,
+            ResponseTimeHistogramBin.time_spent_seconds,
+        )
+        .having(response_count > 0)
+    )
+
+
+# =============================================================================
+# SYNC API
+# =============================================================================
+
+
+def _fold_sessions(db: Session, session_ids: Sequence[int]) -> int:
+    claimed = db.execute(_claim_statement(session_ids)).scalars().all()
+    if not claimed:
+        return 0
+    rows = db.execute(_session_bins_query(claimed)).all()
+    for stmt in _upsert_statements(db.get_bind().dialect.name, rows):
+        db.execute(stmt)
+    return len(claimed)
+
+
+def refresh_response_time_histograms(
+    db: Session, batch_size: int = REFRESH_BATCH_SESSIONS
+) -> int:
+    """
+    Fold every completed, not yet aggregated session into the histograms.
+
+    Commits after each batch of sessions. When nothing is pending this is a
+    single indexed query. Run from the CAT readiness cron, not from reads.
+
+    Args:
+        db: Database session
+        batch_size: Sessions folded per transaction
+
+    Returns:
+        Number of sessions folded
+    """
+    folded = 0
+    while True:
+        session_ids = db.execute(_pending_sessions_query(batch_size)).scalars().all()
+        if not session_ids:
+            break
+        folded += _fold_sessions(db, session_ids)
+        db.commit()
+    if folded:
+        logger.info(f"Folded {folded} sessions into response-time histograms")
+    return folded
+
+
+def load_response_time_histograms(db: Session) -> Dict[HistogramKey, Histogram]:
+    """
+    Load the persisted histograms.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Histogram per (question_type, difficulty_level)
+    """
+    return _to_histograms(db.execute(_load_query()).all())
+
+
+def rebuild_response_time_histograms(db: Session) -> int:
+    """
+    Recompute the histograms from scratch (repairs, e.g. after deletions).
+
+    Args:
+        db: Database session
+
+    Returns:
+        Number of sessions folded
+    """
+    db.execute(delete(ResponseTimeHistogramBin))
+    db.execute(
+        update(TestSession)
+        .where(TestSession.response_times_aggregated_at.isnot(None))
+        .values(response_times_aggregated_at=None)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return refresh_response_time_histograms(db)
+
+
+# =============================================================================
+# ASYNC API
+# =============================================================================
+
+
+async def _async_fold_sessions(db: AsyncSession, session_ids: Sequence[int]) -> int:
+    result = await db.execute(_claim_statement(session_ids))
+    claimed = result.scalars().all()
+    if not claimed:
+        return 0
+    result = await db.execute(_session_bins_query(claimed))
+    rows = result.all()
+    for stmt in _upsert_statements(db.get_bind().dialect.name, rows):
+        await db.execute(stmt)
+    return len(claimed)
+
+
+async def async_fold_session_response_times(db: AsyncSession, session_id: int) -> bool:
+    """
+    Add a completed session's response times to the histograms.
+
+    Does NOT commit; the caller commits so the increments and the session's
+    aggregated marker land together.
+
+    Args:
+        db: Async database session
+        session_id: Completed test session ID
+
+    Returns:
+        True if the session was folded, False if it was already folded or is
+        not completed
+    """
+    return await _async_fold_sessions(db, [session_id]) == 1
+
+
+async def async_load_response_time_histograms(
+    db: AsyncSession,
+) -> Dict[HistogramKey, Histogram]:
+    """
+    Load the persisted histograms (async version).
+
+    Args:
+        db: Async database session
+
+    Returns:
+        Histogram per (question_type, difficulty_level)
+    """
+    result = await db.execute(_load_query())
+    return _to_histograms(result.all())
@@ -16,14 +16,22 @@ Anomaly Thresholds:
 - Rushed session: < 15 seconds average
 """
 
+import bisect
 import logging
 import statistics
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
 from sqlalchemy.orm import Session
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.psychometrics.response_time_histograms import (
+    Histogram,
+    HistogramKey,
+    async_load_response_time_histograms,
+    load_response_time_histograms,
+    merge_histograms,
+)
 from app.models.models import Response, Question, DifficultyLevel
 
 logger = logging.getLogger(__name__)
@@ -885,6 +893,9 @@ def get_aggregate_response_time_analytics(db: Session) -> Dict[str, Any]:
             "total_responses_analyzed": int
         }
 
+    Per-question means and the difficulty medians are read from the persisted
+    response-time histograms (see get_response_time_percentiles).
+
     Edge Cases Handled:
         - No completed sessions: Returns empty analytics with zeros
         - No time data: Returns None for statistics that can't be computed
@@ -908,38 +919,18 @@ def get_aggregate_response_time_analytics(db: Session) -> Dict[str, Any]:
         or 0
     )
 
-    # Count total responses with time data from completed sessions
-    total_responses: int = (
-        db.query(func.count(Response.id))
-        .join(TestSession, Response.test_session_id == TestSession.id)
-        .filter(
-            TestSession.status == TestStatus.COMPLETED,
-            Response.time_spent_seconds.isnot(None),
-        )
-        .scalar()
-        or 0
-    )
+    # Response counts, means and medians come from the persisted response-time
+    # histograms (folded in as sessions complete) instead of response scans
+    histograms = load_response_time_histograms(db)
+    total_responses = _histogram_response_count(histograms)
 
     # Handle edge case: no data
     if total_sessions == 0 or total_responses == 0:
         logger.info("No completed sessions with time data for aggregate analytics")
         return _create_empty_aggregate_analytics()
 
-    # ==========================================================================
-    # Calculate overall mean per question using database aggregation
-    # ==========================================================================
-
-    mean_per_question_result = (
-        db.query(func.avg(Response.time_spent_seconds))
-        .join(TestSession, Response.test_session_id == TestSession.id)
-        .filter(
-            TestSession.status == TestStatus.COMPLETED,
-            Response.time_spent_seconds.isnot(None),
-        )
-        .scalar()
-    )
-    mean_per_question: Optional[float] = (
-        round(float(mean_per_question_result), 2) if mean_per_question_result else None
+    mean_per_question, by_difficulty, by_question_type = _histogram_breakdowns(
+        histograms
     )
 
     # ==========================================================================
@@ -980,108 +971,6 @@ def get_aggregate_response_time_analytics(db: Session) -> Dict[str, Any]:
         "mean_per_question_seconds": mean_per_question,
     }
 
-    # ==========================================================================
-    # Calculate statistics by difficulty level using database aggregation
-    # ==========================================================================
-
-    difficulty_stats_query = (
-        db.query(
-            Question.difficulty_level,
-            func.avg(Response.time_spent_seconds).label("mean_time"),
-        )
-        .join(Response, Response.question_id == Question.id)
-        .join(TestSession, Response.test_session_id == TestSession.id)
-        .filter(
-            TestSession.status == TestStatus.COMPLETED,
-            Response.time_spent_seconds.isnot(None),
-        )
-        .group_by(Question.difficulty_level)
-        .all()
-    )
-
-    # Build difficulty stats from aggregated results
-    difficulty_means: Dict[str, Optional[float]] = {
-        "easy": None,
-        "medium": None,
-        "hard": None,
-    }
-    for row in difficulty_stats_query:
-        difficulty_key = row.difficulty_level.value
-        if difficulty_key in difficulty_means and row.mean_time is not None:
-            difficulty_means[difficulty_key] = round(float(row.mean_time), 2)
-
-    # For median by difficulty, we need to fetch the values grouped by difficulty
-    # This is still more efficient than loading Response+Question for all rows
-    difficulty_times_query = (
-        db.query(
-            Question.difficulty_level,
-            Response.time_spent_seconds,
-        )
-        .join(Response, Response.question_id == Question.id)
-        .join(TestSession, Response.test_session_id == TestSession.id)
-        .filter(
-            TestSession.status == TestStatus.COMPLETED,
-            Response.time_spent_seconds.isnot(None),
-        )
-        .all()
-    )
-
-    difficulty_times: Dict[str, List[int]] = {"easy": [], "medium": [], "hard": []}
-    for row in difficulty_times_query:
-        difficulty_key = row.difficulty_level.value
-        if difficulty_key in difficulty_times:
-            difficulty_times[difficulty_key].append(row.time_spent_seconds)
-
-    by_difficulty: Dict[str, Dict[str, Optional[float]]] = {}
-    for difficulty in ["easy", "medium", "hard"]:
-        times = difficulty_times[difficulty]
-        if times:
-            by_difficulty[difficulty] = {
-                "mean_seconds": difficulty_means[difficulty],
-                "median_seconds": round(statistics.median(times), 2),
-            }
-        else:
-            by_difficulty[difficulty] = {
-                "mean_seconds": None,
-                "median_seconds": None,
-            }
-
-    # ==========================================================================
-    # Calculate statistics by question type using database aggregation
-    # ==========================================================================
-
-    question_type_stats_query = (
-        db.query(
-            Question.question_type,
-            func.avg(Response.time_spent_seconds).label("mean_time"),
-        )
-        .join(Response, Response.question_id == Question.id)
-        .join(TestSession, Response.test_session_id == TestSession.id)
-        .filter(
-            TestSession.status == TestStatus.COMPLETED,
-            Response.time_spent_seconds.isnot(None),
-        )
-        .group_by(Question.question_type)
-        .all()
-    )
-
-    # Build question type stats from aggregated results
-    by_question_type: Dict[str, Dict[str, Optional[float]]] = {
-        "pattern": {"mean_seconds": None},
-        "logic": {"mean_seconds": None},
-        "spatial": {"mean_seconds": None},
-        "math": {"mean_seconds": None},
-        "verbal": {"mean_seconds": None},
-        "memory": {"mean_seconds": None},
-    }
-
-    for row in question_type_stats_query:
-        q_type_key = row.question_type.value
-        if q_type_key in by_question_type and row.mean_time is not None:
-            by_question_type[q_type_key] = {
-                "mean_seconds": round(float(row.mean_time), 2),
-            }
-
     # ==========================================================================
     # Calculate anomaly summary - only load response_time_flags column
     # ==========================================================================
@@ -1161,12 +1050,6 @@ QUANTILE_DIVISIONS = 20
 P90_INDEX = int(0.90 * QUANTILE_DIVISIONS) - 1  # 17
 P95_INDEX = int(0.95 * QUANTILE_DIVISIONS) - 1  # 18
 
-# Maximum rows to load for percentile computation.
-# Percentiles require raw values (can't be computed via SQL aggregation),
-# so we load rows into memory. At ~12 bytes per row (enum + enum + int),
-# 500K rows uses ~6MB — acceptable for admin analytics workloads.
-MAX_PERCENTILE_QUERY_ROWS = 500_000
-
 
 def _compute_percentile_stats(times: List[int]) -> Dict[str, Any]:
     """
@@ -1205,122 +1088,179 @@ def _compute_percentile_stats(times: List[int]) -> Dict[str, Any]:
     }
 
 
-def get_response_time_percentiles(db: Session) -> Dict[str, Any]:
+def _histogram_order_statistic(bins: List[Tuple[int, int]], index: int) -> int:
     """
-    Calculate response time percentile distributions grouped by question type
-    and difficulty level.
+    Return the value at ``index`` of the sorted data a histogram describes.
+
+    Args:
+        bins: (value, cumulative count) pairs sorted by value
+        index: 0-based position in the sorted data
+
+    Returns:
+        The index-th smallest value
+    """
+    position = bisect.bisect_right([cumulative for _, cumulative in bins], index)
+    return bins[position][0]
 
-    Returns aggregate statistics only (no individual user tracking) suitable
-    for validating whether current time limits are appropriate.
+
+def _compute_histogram_percentile_stats(histogram: Dict[int, int]) -> Dict[str, Any]:
+    """
+    Compute percentile statistics from a response-time histogram.
+
+    Produces exactly the values _compute_percentile_stats returns for the
+    expanded list of times (same median rule and inclusive quantile
+    interpolation), reading only the order statistics it needs.
 
     Args:
-        db: Database session
+        histogram: Response time in seconds -> number of responses. Must not be
+            empty.
 
     Returns:
-        Dictionary containing:
-        {
-            "by_type_and_difficulty": [
-                {
-                    "question_type": str,
-                    "difficulty_level": str,
-                    "stats": {count, mean, median, p90, p95}
-                },
-                ...
-            ],
-            "by_type": {
-                "pattern": {count, mean, median, p90, p95},
-                ...
-            },
-            "by_difficulty": {
-                "easy": {count, mean, median, p90, p95},
-                ...
-            },
-            "overall": {count, mean, median, p90, p95},
-            "total_responses_analyzed": int
-        }
+        Dictionary with count, mean, median, p90, and p95 values.
+        Percentiles are None if fewer than MIN_RESPONSES_FOR_PERCENTILES responses.
     """
-    from app.models.models import TestSession, TestStatus
+    bins: List[Tuple[int, int]] = []
+    count = 0
+    total = 0
+    for seconds in sorted(histogram):
+        count += histogram[seconds]
+        total += seconds * histogram[seconds]
+        bins.append((seconds, count))
+
+    def value_at(index: int) -> int:
+        return _histogram_order_statistic(bins, index)
+
+    mean_val = round(total / count, 2)
+    if count % 2:
+        median_val = round(value_at(count // 2), 2)
+    else:
+        median_val = round((value_at(count // 2 - 1) + value_at(count // 2)) / 2, 2)
 
-    # Fetch response times with their question type and difficulty
-    # from completed sessions only, with a safety LIMIT to prevent
-    # unbounded memory usage at scale.
-    rows = (
-        db.query(
-            Question.question_type,
-            Question.difficulty_level,
-            Response.time_spent_seconds,
-        )
-        .join(Response, Response.question_id == Question.id)
-        .join(TestSession, Response.test_session_id == TestSession.id)
-        .filter(
-            TestSession.status == TestStatus.COMPLETED,
-            Response.time_spent_seconds.isnot(None),
-        )
-        .order_by(Response.id)
-        .limit(MAX_PERCENTILE_QUERY_ROWS)
-        .all()
-    )
+    p90_val: Optional[float] = None
+    p95_val: Optional[float] = None
 
-    if not rows:
-        logger.info("No response time data available for percentile analysis")
-        return _create_empty_percentile_analytics()
+    if count >= MIN_RESPONSES_FOR_PERCENTILES:
+        # Same interpolation as statistics.quantiles(method="inclusive")
+        def cut_point(quantile_index: int) -> float:
+            j, delta = divmod((quantile_index + 1) * (count - 1), QUANTILE_DIVISIONS)
+            if delta == 0:
+                return float(value_at(j))
+            return (
+                value_at(j) * (QUANTILE_DIVISIONS - delta) + value_at(j + 1) * delta
+            ) / QUANTILE_DIVISIONS
+
+        p90_val = round(float(cut_point(P90_INDEX)), 2)
+        p95_val = round(float(cut_point(P95_INDEX)), 2)
+
+    return {
+        "count": count,
+        "mean_seconds": mean_val,
+        "median_seconds": median_val,
+        "p90_seconds": p90_val,
+        "p95_seconds": p95_val,
+    }
+
+
+def _histogram_response_count(histograms: Dict[HistogramKey, Histogram]) -> int:
+    """Total number of responses across all histograms."""
+    return sum(sum(histogram.values()) for histogram in histograms.values())
 
-    if len(rows) >= MAX_PERCENTILE_QUERY_ROWS:
-        logger.warning(
-            f"Percentile analysis truncated at {MAX_PERCENTILE_QUERY_ROWS} responses; "
-            "results may not reflect the full dataset"
-        )
 
-    # Group times by (type, difficulty), by type, by difficulty, and overall
-    type_difficulty_times: Dict[tuple, List[int]] = {}
-    type_times: Dict[str, List[int]] = {}
-    difficulty_times: Dict[str, List[int]] = {}
-    all_times: List[int] = []
+def _group_histograms(
+    histograms: Dict[HistogramKey, Histogram], key_index: int
+) -> Dict[str, Histogram]:
+    """Merge (type, difficulty) histograms by question type (0) or difficulty (1)."""
+    grouped: Dict[str, List[Histogram]] = {}
+    for key, histogram in histograms.items():
+        grouped.setdefault(key[key_index], []).append(histogram)
+    return {name: merge_histograms(parts) for name, parts in grouped.items()}
 
-    for question_type, difficulty_level, time_spent in rows:
-        q_type = question_type.value
-        d_level = difficulty_level.value
-        time_val = time_spent
 
-        # By (type, difficulty)
-        key = (q_type, d_level)
-        type_difficulty_times.setdefault(key, []).append(time_val)
+def _histogram_mean(histogram: Histogram) -> Optional[float]:
+    count = sum(histogram.values())
+    if not count:
+        return None
+    return round(sum(s * n for s, n in histogram.items()) / count, 2)
+
+
+def _histogram_breakdowns(
+    histograms: Dict[HistogramKey, Histogram],
+) -> Tuple[Optional[float], Dict[str, Any], Dict[str, Any]]:
+    """
+    Build the per-question mean and the difficulty/type breakdowns of the
+    aggregate analytics from response-time histograms.
+
+    Returns:
+        Tuple of (mean_per_question_seconds, by_difficulty, by_question_type)
+    """
+    mean_per_question = _histogram_mean(merge_histograms(histograms.values()))
 
-        # By type
-        type_times.setdefault(q_type, []).append(time_val)
+    difficulty_histograms = _group_histograms(histograms, 1)
+    by_difficulty: Dict[str, Dict[str, Optional[float]]] = {}
+    for difficulty in ["easy", "medium", "hard"]:
+        histogram = difficulty_histograms.get(difficulty)
+        if histogram:
+            stats = _compute_histogram_percentile_stats(histogram)
+            by_difficulty[difficulty] = {
+                "mean_seconds": stats["mean_seconds"],
+                "median_seconds": stats["median_seconds"],
+            }
+        else:
+            by_difficulty[difficulty] = {
+                "mean_seconds": None,
+                "median_seconds": None,
+            }
+
+    type_histograms = _group_histograms(histograms, 0)
+    by_question_type: Dict[str, Dict[str, Optional[float]]] = {
+        q_type: {"mean_seconds": _histogram_mean(type_histograms.get(q_type, {}))}
+        for q_type in ["pattern", "logic", "spatial", "math", "verbal", "memory"]
+    }
 
-        # By difficulty
-        difficulty_times.setdefault(d_level, []).append(time_val)
+    return mean_per_question, by_difficulty, by_question_type
 
-        # Overall
-        all_times.append(time_val)
 
-    # Compute stats for each group
+def _build_percentile_analytics(
+    histograms: Dict[HistogramKey, Histogram],
+) -> Dict[str, Any]:
+    """
+    Build the percentile analytics response from (type, difficulty) histograms.
+
+    Args:
+        histograms: Histogram per (question_type, difficulty_level)
+
+    Returns:
+        Percentile analytics dictionary (see get_response_time_percentiles)
+    """
+    if not histograms:
+        logger.info("No response time data available for percentile analysis")
+        return _create_empty_percentile_analytics()
+
     by_type_and_difficulty = []
-    for (q_type, d_level), times in sorted(type_difficulty_times.items()):
+    for (q_type, d_level), histogram in sorted(histograms.items()):
         by_type_and_difficulty.append(
             {
                 "question_type": q_type,
                 "difficulty_level": d_level,
-                "stats": _compute_percentile_stats(times),
+                "stats": _compute_histogram_percentile_stats(histogram),
             }
         )
 
-    by_type = {}
-    for q_type, times in sorted(type_times.items()):
-        by_type[q_type] = _compute_percentile_stats(times)
-
-    by_difficulty = {}
-    for d_level, times in sorted(difficulty_times.items()):
-        by_difficulty[d_level] = _compute_percentile_stats(times)
-
-    overall = _compute_percentile_stats(all_times)
+    by_type = {
+        q_type: _compute_histogram_percentile_stats(histogram)
+        for q_type, histogram in sorted(_group_histograms(histograms, 0).items())
+    }
+    by_difficulty = {
+        d_level: _compute_histogram_percentile_stats(histogram)
+        for d_level, histogram in sorted(_group_histograms(histograms, 1).items())
+    }
+    overall = _compute_histogram_percentile_stats(merge_histograms(histograms.values()))
 
-    total_responses = len(all_times)
+    total_responses = overall["count"]
 
     logger.info(
         f"Percentile analytics computed: {total_responses} responses across "
-        f"{len(type_difficulty_times)} type-difficulty groups"
+        f"{len(histograms)} type-difficulty groups"
     )
 
     return {
@@ -1332,6 +1272,48 @@ def get_response_time_percentiles(db: Session) -> Dict[str, Any]:
     }
 
 
+def get_response_time_percentiles(db: Session) -> Dict[str, Any]:
+    """
+    Calculate response time percentile distributions grouped by question type
+    and difficulty level.
+
+    Returns aggregate statistics only (no individual user tracking) suitable
+    for validating whether current time limits are appropriate.
+
+    Statistics cover the full history and are read from the persisted
+    response-time histograms, which give exactly the values that sorting every
+    response time would. The read never writes: sessions not yet folded in
+    (normally none) are picked up by the CAT readiness cron.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Dictionary containing:
+        {
+            "by_type_and_difficulty": [
+                {
+                    "question_type": str,
+                    "difficulty_level": str,
+                    "stats": {count, mean, median, p90, p95}
+                },
+                ...
+            ],
+            "by_type": {
+                "pattern": {count, mean, median, p90, p95},
+                ...
+            },
+            "by_difficulty": {
+                "easy": {count, mean, median, p90, p95},
+                ...
+            },
+            "overall": {count, mean, median, p90, p95},
+            "total_responses_analyzed": int
+        }
+    """
+    return _build_percentile_analytics(load_response_time_histograms(db))
+
+
 def _create_empty_percentile_analytics() -> Dict[str, Any]:
     """
     Create empty percentile analytics when no data is available.
@@ -1421,33 +1403,16 @@ async def async_get_aggregate_response_time_analytics(
     )
     total_sessions: int = result.scalar() or 0
 
-    # Count total responses with time data from completed sessions
-    result = await db.execute(
-        select(func.count(Response.id))
-        .join(TestSession, Response.test_session_id == TestSession.id)
-        .where(
-            TestSession.status == TestStatus.COMPLETED,
-            Response.time_spent_seconds.isnot(None),
-        )
-    )
-    total_responses: int = result.scalar() or 0
+    # Response counts, means and medians come from the persisted histograms
+    histograms = await async_load_response_time_histograms(db)
+    total_responses = _histogram_response_count(histograms)
 
     if total_sessions == 0 or total_responses == 0:
         logger.info("No completed sessions with time data for aggregate analytics")
         return _create_empty_aggregate_analytics()
 
-    # Overall mean per question
-    result = await db.execute(
-        select(func.avg(Response.time_spent_seconds))
-        .join(TestSession, Response.test_session_id == TestSession.id)
-        .where(
-            TestSession.status == TestStatus.COMPLETED,
-            Response.time_spent_seconds.isnot(None),
-        )
-    )
-    mean_per_question_result = result.scalar()
-    mean_per_question: Optional[float] = (
-        round(float(mean_per_question_result), 2) if mean_per_question_result else None
+    mean_per_question, by_difficulty, by_question_type = _histogram_breakdowns(
+        histograms
     )
 
     # Per-session durations
@@ -1482,99 +1447,6 @@ async def async_get_aggregate_response_time_analytics(
         "mean_per_question_seconds": mean_per_question,
     }
 
-    # Statistics by difficulty level
-    result = await db.execute(
-        select(
-            Question.difficulty_level,
-            func.avg(Response.time_spent_seconds).label("mean_time"),
-        )
-        .join(Response, Response.question_id == Question.id)
-        .join(TestSession, Response.test_session_id == TestSession.id)
-        .where(
-            TestSession.status == TestStatus.COMPLETED,
-            Response.time_spent_seconds.isnot(None),
-        )
-        .group_by(Question.difficulty_level)
-    )
-    difficulty_stats_rows = result.all()
-
-    difficulty_means: Dict[str, Optional[float]] = {
-        "easy": None,
-        "medium": None,
-        "hard": None,
-    }
-    for row in difficulty_stats_rows:
-        difficulty_key = row.difficulty_level.value
-        if difficulty_key in difficulty_means and row.mean_time is not None:
-            difficulty_means[difficulty_key] = round(float(row.mean_time), 2)
-
-    # For median by difficulty, fetch individual values
-    result = await db.execute(
-        select(
-            Question.difficulty_level,
-            Response.time_spent_seconds,
-        )
-        .join(Response, Response.question_id == Question.id)
-        .join(TestSession, Response.test_session_id == TestSession.id)
-        .where(
-            TestSession.status == TestStatus.COMPLETED,
-            Response.time_spent_seconds.isnot(None),
-        )
-    )
-    difficulty_times_rows = result.all()
-
-    difficulty_times: Dict[str, List[int]] = {"easy": [], "medium": [], "hard": []}
-    for row in difficulty_times_rows:
-        difficulty_key = row.difficulty_level.value
-        if difficulty_key in difficulty_times:
-            difficulty_times[difficulty_key].append(row.time_spent_seconds)
-
-    by_difficulty: Dict[str, Dict[str, Optional[float]]] = {}
-    for difficulty in ["easy", "medium", "hard"]:
-        times = difficulty_times[difficulty]
-        if times:
-            by_difficulty[difficulty] = {
-                "mean_seconds": difficulty_means[difficulty],
-                "median_seconds": round(statistics.median(times), 2),
-            }
-        else:
-            by_difficulty[difficulty] = {
-                "mean_seconds": None,
-                "median_seconds": None,
-            }
-
-    # Statistics by question type
-    result = await db.execute(
-        select(
-            Question.question_type,
-            func.avg(Response.time_spent_seconds).label("mean_time"),
-        )
-        .join(Response, Response.question_id == Question.id)
-        .join(TestSession, Response.test_session_id == TestSession.id)
-        .where(
-            TestSession.status == TestStatus.COMPLETED,
-            Response.time_spent_seconds.isnot(None),
-        )
-        .group_by(Question.question_type)
-    )
-    question_type_stats_rows = result.all()
-
-    by_question_type: Dict[str, Dict[str, Optional[float]]] = {
-        "pattern": {"mean_seconds": None},
-        "logic": {"mean_seconds": None},
-        "spatial": {"mean_seconds": None},
-        "math": {"mean_seconds": None},
-        "verbal": {"mean_seconds": None},
-        "memory": {"mean_seconds": None},
-    }
-
-    for row in question_type_stats_rows:
-        q_type_key = row.question_type.value
-        if q_type_key in by_question_type and row.mean_time is not None:
-            by_question_type[q_type_key] = {
-                "mean_seconds": round(float(row.mean_time), 2),
-            }
-
     # Anomaly summary - only load response_time_flags column
     result = await db.execute(
         select(TestResult.response_time_flags)
@@ -1636,83 +1508,4 @@ async def async_get_response_time_percentiles(db: AsyncSession) -> Dict[str, Any
     Returns:
         Dictionary containing percentile analytics (same format as sync version)
     """
-    from app.models.models import TestSession, TestStatus
-
-    result = await db.execute(
-        select(
-            Question.question_type,
-            Question.difficulty_level,
-            Response.time_spent_seconds,
-        )
-        .join(Response, Response.question_id == Question.id)
-        .join(TestSession, Response.test_session_id == TestSession.id)
-        .where(
-            TestSession.status == TestStatus.COMPLETED,
-            Response.time_spent_seconds.isnot(None),
-        )
-        .order_by(Response.id)
-        .limit(MAX_PERCENTILE_QUERY_ROWS)
-    )
-    rows = result.all()
-
-    if not rows:
-        logger.info("No response time data available for percentile analysis")
-        return _create_empty_percentile_analytics()
-
-    if len(rows) >= MAX_PERCENTILE_QUERY_ROWS:
-        logger.warning(
-            f"Percentile analysis truncated at {MAX_PERCENTILE_QUERY_ROWS} responses; "
-            "results may not reflect the full dataset"
-        )
-
-    # Group times by (type, difficulty), by type, by difficulty, and overall
-    type_difficulty_times: Dict[tuple, List[int]] = {}
-    type_times: Dict[str, List[int]] = {}
-    difficulty_times: Dict[str, List[int]] = {}
-    all_times: List[int] = []
-
-    for question_type, difficulty_level, time_spent in rows:
-        q_type = question_type.value
-        d_level = difficulty_level.value
-        time_val = time_spent
-
-        key = (q_type, d_level)
-        type_difficulty_times.setdefault(key, []).append(time_val)
-        type_times.setdefault(q_type, []).append(time_val)
-        difficulty_times.setdefault(d_level, []).append(time_val)
-        all_times.append(time_val)
-
-    by_type_and_difficulty = []
-    for (q_type, d_level), times in sorted(type_difficulty_times.items()):
-        by_type_and_difficulty.append(
-            {
-                "question_type": q_type,
-                "difficulty_level": d_level,
-                "stats": _compute_percentile_stats(times),
-            }
-        )
-
-    by_type = {}
-    for q_type, times in sorted(type_times.items()):
-        by_type[q_type] = _compute_percentile_stats(times)
-
-    by_difficulty_result = {}
-    for d_level, times in sorted(difficulty_times.items()):
-        by_difficulty_result[d_level] = _compute_percentile_stats(times)
-
-    overall = _compute_percentile_stats(all_times)
-
-    total_responses = len(all_times)
-
-    logger.info(
-        f"Percentile analytics computed: {total_responses} responses across "
-        f"{len(type_difficulty_times)} type-difficulty groups"
-    )
-
-    return {
-        "by_type_and_difficulty": by_type_and_difficulty,
-        "by_type": by_type,
-        "by_difficulty": by_difficulty_result,
-        "overall": overall,
-        "total_responses_analyzed": total_responses,
-    }
+    return _build_percentile_analytics(await async_load_response_time_histograms(db))
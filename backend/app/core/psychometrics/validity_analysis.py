@@ -228,10 +228,6 @@ def calculate_person_fit_heuristic(
 
     total_responses = len(responses)
 
-    # Calculate score percentile category
-    score_percent = (total_score / total_responses) * 100 if total_responses > 0 else 0
-    score_percentile = _get_score_percentile(score_percent)
-
     # Count responses by difficulty
     difficulty_counts: Dict[str, Dict[str, int]] = {
         "easy": {"correct": 0, "total": 0},
@@ -252,6 +248,41 @@ def calculate_person_fit_heuristic(
             if is_correct:
                 difficulty_counts[difficulty]["correct"] += 1
 
+    result = _build_person_fit_result(difficulty_counts, total_responses, total_score)
+
+    logger.info(
+        f"Person-fit analysis: score={total_score}/{total_responses}, "
+        f"percentile={result['score_percentile']}, "
+        f"fit_ratio={result['fit_ratio']:.3f}, fit_flag={result['fit_flag']}, "
+        f"short_test={result['is_short_test']}"
+    )
+
+    return result
+
+
+def _build_person_fit_result(
+    difficulty_counts: Dict[str, Dict[str, int]],
+    total_responses: int,
+    total_score: int,
+) -> Dict[str, Any]:
+    """
+    Build the person-fit result from per-difficulty counts.
+
+    Shared by calculate_person_fit_heuristic() and the batch engine in
+    validity_batch so both produce identical results.
+
+    Args:
+        difficulty_counts: {"easy"/"medium"/"hard": {"correct": int, "total": int}}
+        total_responses: Number of responses (including unknown difficulties)
+        total_score: Number of correct answers
+
+    Returns:
+        Person-fit analysis dictionary (see calculate_person_fit_heuristic)
+    """
+    # Calculate score percentile category
+    score_percent = (total_score / total_responses) * 100 if total_responses > 0 else 0
+    score_percentile = _get_score_percentile(score_percent)
+
     # Calculate unexpected responses
     unexpected_correct = 0  # Got hard questions right when expected wrong
     unexpected_incorrect = 0  # Got easy questions wrong when expected right
@@ -323,12 +354,6 @@ def calculate_person_fit_heuristic(
             f"Fit ratio {fit_ratio:.2f} is within normal range{short_test_note}."
         )
 
-    logger.info(
-        f"Person-fit analysis: score={total_score}/{total_responses}, "
-        f"percentile={score_percentile}, fit_ratio={fit_ratio:.3f}, "
-        f"fit_flag={fit_flag}, short_test={is_short_test}"
-    )
-
     return {
         "fit_ratio": round(fit_ratio, 3),
         "fit_flag": fit_flag,
@@ -477,7 +502,6 @@ def check_response_time_plausibility(responses: List[Dict[str, Any]]) -> Dict[st
         logger.info("Response time check skipped: no responses provided")
         return _create_empty_time_check_result()
 
-    flags: List[Dict[str, Any]] = []
     response_times: List[float] = []
     rapid_response_count = 0
     extended_pause_count = 0
@@ -539,14 +563,60 @@ def check_response_time_plausibility(responses: List[Dict[str, Any]]) -> Dict[st
             f"{missing_time_count} response(s) missing time information."
         )
 
-    # Calculate statistics
-    total_time_seconds = sum(response_times)
-    mean_time = total_time_seconds / len(response_times)
-    min_time = min(response_times)
-    max_time = max(response_times)
+    result = _build_time_check_result(
+        total_time_seconds=sum(response_times),
+        min_time=min(response_times),
+        max_time=max(response_times),
+        total_responses=len(response_times),
+        rapid_response_count=rapid_response_count,
+        extended_pause_count=extended_pause_count,
+        fast_hard_correct_count=fast_hard_correct_count,
+    )
+
+    logger.info(
+        f"Response time analysis: total={result['total_time_seconds']:.0f}s, "
+        f"mean={result['statistics']['mean_time']:.1f}s, "
+        f"rapid={rapid_response_count}, pauses={extended_pause_count}, "
+        f"fast_hard={fast_hard_correct_count}, flags={len(result['flags'])}, "
+        f"validity_concern={result['validity_concern']}, "
+        f"short_test={result['is_short_test']}"
+    )
+
+    return result
+
+
+def _build_time_check_result(
+    total_time_seconds: float,
+    min_time: float,
+    max_time: float,
+    total_responses: int,
+    rapid_response_count: int,
+    extended_pause_count: int,
+    fast_hard_correct_count: int,
+) -> Dict[str, Any]:
+    """
+    Build the response time result from per-session timing statistics.
+
+    Shared by check_response_time_plausibility() and the batch engine in
+    validity_batch so both produce identical results.
+
+    Args:
+        total_time_seconds: Sum of the valid response times
+        min_time: Fastest response
+        max_time: Slowest response
+        total_responses: Number of responses with valid time data (> 0)
+        rapid_response_count: Responses under RAPID_RESPONSE_THRESHOLD_SECONDS
+        extended_pause_count: Responses over EXTENDED_PAUSE_THRESHOLD_SECONDS
+        fast_hard_correct_count: Correct hard responses under
+            FAST_HARD_CORRECT_THRESHOLD_SECONDS
+
+    Returns:
+        Response time analysis dictionary (see check_response_time_plausibility)
+    """
+    flags: List[Dict[str, Any]] = []
+    mean_time = total_time_seconds / total_responses
 
     # CD-016: Determine if this is a short test
-    total_responses = len(response_times)
     is_short_test = total_responses < MINIMUM_QUESTIONS_FOR_FULL_ANALYSIS
 
     # CD-016: Adjust rapid response threshold for short tests
@@ -653,14 +723,6 @@ def check_response_time_plausibility(responses: List[Dict[str, Any]]) -> Dict[st
             f"average per question: {mean_time:.1f} seconds."
         )
 
-    logger.info(
-        f"Response time analysis: total={total_time_seconds:.0f}s, "
-        f"mean={mean_time:.1f}s, rapid={rapid_response_count}, "
-        f"pauses={extended_pause_count}, fast_hard={fast_hard_correct_count}, "
-        f"flags={len(flags)}, validity_concern={validity_concern}, "
-        f"short_test={is_short_test}"
-    )
-
     return {
         "flags": flags,
         "validity_concern": validity_concern,
@@ -817,6 +879,66 @@ def count_guttman_errors(responses: List[Tuple[bool, float]]) -> Dict[str, Any]:
     correct_count = sum(1 for is_correct, _ in sorted_responses if is_correct)
     incorrect_count = len(sorted_responses) - correct_count
 
+    # Count Guttman errors
+    # An error occurs when an easier item is incorrect AND a harder item is correct
+    error_count = 0
+
+    # Compare each pair: for each incorrect easy item and correct hard item
+    for i, (is_correct_i, difficulty_i) in enumerate(sorted_responses):
+        for j, (is_correct_j, difficulty_j) in enumerate(sorted_responses):
+            # Skip if same item or difficulties are equal
+            if i >= j or difficulty_i == difficulty_j:
+                continue
+
+            # Item i is easier (higher p-value, appears earlier in sorted list)
+            # Item j is harder (lower p-value, appears later in sorted list)
+            # Error: easier item wrong, harder item correct
+            if not is_correct_i and is_correct_j:
+                error_count += 1
+
+    result = _build_guttman_result(
+        total_responses=len(sorted_responses),
+        correct_count=correct_count,
+        error_count=error_count,
+    )
+
+    if result["max_possible_errors"] > 0:
+        logger.info(
+            f"Guttman error analysis: "
+            f"errors={error_count}/{result['max_possible_errors']}, "
+            f"rate={result['error_rate']:.3f}, "
+            f"interpretation={result['interpretation']}, "
+            f"short_test={result['is_short_test']}"
+        )
+    else:
+        logger.info(
+            f"Guttman error check: correct={correct_count}, "
+            f"incorrect={incorrect_count}, "
+            f"interpretation={result['interpretation']}"
+        )
+
+    return result
+
+
+def _build_guttman_result(
+    total_responses: int, correct_count: int, error_count: int
+) -> Dict[str, Any]:
+    """
+    Build the Guttman error result from a session's counts.
+
+    Shared by count_guttman_errors() and the batch engine in validity_batch so
+    both produce identical results.
+
+    Args:
+        total_responses: Number of responses with valid difficulty (>= 2)
+        correct_count: Number of correct responses among them
+        error_count: Number of Guttman errors among them
+
+    Returns:
+        Guttman error analysis dictionary (see count_guttman_errors)
+    """
+    incorrect_count = total_responses - correct_count
+
     # Handle edge cases: all correct or all incorrect
     if correct_count == 0 or incorrect_count == 0:
         interpretation = "normal"
@@ -825,39 +947,17 @@ def count_guttman_errors(responses: List[Tuple[bool, float]]) -> Dict[str, Any]:
         else:
             details = "All items correct; no Guttman errors possible."
 
-        logger.info(
-            f"Guttman error check: correct={correct_count}, "
-            f"incorrect={incorrect_count}, interpretation={interpretation}"
-        )
-
         return {
             "error_count": 0,
             "max_possible_errors": 0,
             "error_rate": 0.0,
             "interpretation": interpretation,
-            "total_responses": len(sorted_responses),
+            "total_responses": total_responses,
             "correct_count": correct_count,
             "incorrect_count": incorrect_count,
             "details": details,
         }
 
-    # Count Guttman errors
-    # An error occurs when an easier item is incorrect AND a harder item is correct
-    error_count = 0
-
-    # Compare each pair: for each incorrect easy item and correct hard item
-    for i, (is_correct_i, difficulty_i) in enumerate(sorted_responses):
-        for j, (is_correct_j, difficulty_j) in enumerate(sorted_responses):
-            # Skip if same item or difficulties are equal
-            if i >= j or difficulty_i == difficulty_j:
-                continue
-
-            # Item i is easier (higher p-value, appears earlier in sorted list)
-            # Item j is harder (lower p-value, appears later in sorted list)
-            # Error: easier item wrong, harder item correct
-            if not is_correct_i and is_correct_j:
-                error_count += 1
-
     # Calculate maximum possible errors
     # Maximum errors = number of correct * number of incorrect
     # (each correct item could theoretically be paired with each incorrect item)
@@ -868,7 +968,7 @@ def count_guttman_errors(responses: List[Tuple[bool, float]]) -> Dict[str, Any]:
 
     # CD-016: Use adjusted thresholds for short tests (< 5 items)
     # Short tests have higher variance, so require more extreme patterns
-    is_short_test = len(sorted_responses) < MINIMUM_QUESTIONS_FOR_FULL_ANALYSIS
+    is_short_test = total_responses < MINIMUM_QUESTIONS_FOR_FULL_ANALYSIS
     aberrant_threshold = (
         SHORT_TEST_GUTTMAN_ABERRANT_THRESHOLD
         if is_short_test
@@ -911,18 +1011,12 @@ def count_guttman_errors(responses: List[Tuple[bool, float]]) -> Dict[str, Any]:
             f"Response pattern is consistent with expected difficulty ordering{short_test_note}."
         )
 
-    logger.info(
-        f"Guttman error analysis: errors={error_count}/{max_possible_errors}, "
-        f"rate={error_rate:.3f}, interpretation={interpretation}, "
-        f"short_test={is_short_test}"
-    )
-
     return {
         "error_count": error_count,
         "max_possible_errors": max_possible_errors,
         "error_rate": round(error_rate, 3),
         "interpretation": interpretation,
-        "total_responses": len(sorted_responses),
+        "total_responses": total_responses,
         "correct_count": correct_count,
         "incorrect_count": incorrect_count,
         "details": details,
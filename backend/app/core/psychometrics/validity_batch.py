@@ -0,0 +1,446 @@
+"""
+Batch validity analysis for many test sessions at once.
+
+The checks in ``validity_analysis`` (person-fit heuristic, response time
+plausibility, Guttman errors) take one session's Python lists at a time, and
+the Guttman check compares every pair of items in nested Python loops. This
+module packs the responses of many sessions into flat NumPy arrays and
+computes every session's counts with a handful of vectorized passes:
+
+- person-fit: correct/total counts per (session, difficulty) via ``bincount``
+- timing: sums, extremes and threshold counts per session
+- Guttman errors: one sort by (session, p-value descending) and a cumulative
+  count of missed items, so each correct item's errors are read off in O(1)
+  instead of O(n) per pair
+
+The per-session result dictionaries are then built by the same helpers the
+single-session functions use, so the results are identical to calling
+``run_validity_analysis_with_edge_case_handling`` once per session. This makes
+revalidation sweeps over the whole session history practical.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple, TypedDict
+
+import numpy as np
+
+from app.core.psychometrics.validity_analysis import (
+    EXTENDED_PAUSE_THRESHOLD_SECONDS,
+    FAST_HARD_CORRECT_THRESHOLD_SECONDS,
+    MINIMUM_QUESTIONS_FOR_FULL_ANALYSIS,
+    RAPID_RESPONSE_THRESHOLD_SECONDS,
+    VALID_SESSION_STATUSES,
+    _build_guttman_result,
+    _build_person_fit_result,
+    _build_time_check_result,
+    _create_empty_guttman_result,
+    _create_empty_person_fit_result,
+    _create_empty_time_check_result,
+    assess_session_validity,
+    check_validity_for_abandoned_session,
+    estimate_empirical_difficulty_from_level,
+    should_skip_revalidation,
+)
+
+logger = logging.getLogger(__name__)
+
+# Person-fit difficulty buckets, in the order calculate_person_fit_heuristic
+# reports them
+_DIFFICULTY_LEVELS = ("easy", "medium", "hard")
+_DIFFICULTY_CODES = {level: code for code, level in enumerate(_DIFFICULTY_LEVELS)}
+_UNKNOWN_DIFFICULTY = -1
+
+
+class BatchSession(TypedDict, total=False):
+    """
+    One session for run_batch_validity_analysis().
+
+    Keys mirror the arguments of run_validity_analysis_with_edge_case_handling().
+    """
+
+    responses: List[Dict[str, Any]]
+    session_status: str
+    existing_validity_status: Optional[str]
+    existing_validity_checked_at: Any
+
+
+@dataclass(frozen=True)
+class _PackedResponses:
+    """Responses of several sessions flattened into parallel arrays."""
+
+    lengths: np.ndarray  # responses per session
+    session: np.ndarray  # session index of each response
+    is_correct: np.ndarray
+    difficulty: np.ndarray  # _DIFFICULTY_CODES value, or _UNKNOWN_DIFFICULTY
+    is_hard: np.ndarray  # "hard" as the time check normalizes it
+    time_seconds: np.ndarray  # NaN where missing or not numeric
+    p_value: np.ndarray  # empirical difficulty, or the difficulty_level estimate
+    used_fallback: np.ndarray  # p_value came from difficulty_level
+
+    @property
+    def session_count(self) -> int:
+        return len(self.lengths)
+
+
+def _to_float(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _seconds(value: Any) -> float:
+    """time_seconds as a float, NaN when missing or not numeric."""
+    if value is None:
+        return np.nan
+    seconds = _to_float(value)
+    return np.nan if seconds is None else seconds
+
+
+def _pack_sessions(sessions: Sequence[Sequence[Dict[str, Any]]]) -> _PackedResponses:
+    """
+    Flatten per-session response dicts into arrays.
+
+    Applies the same normalization as run_validity_analysis_with_edge_case_handling()
+    and the checks it calls: missing difficulty_level means "medium", and a
+    missing or invalid empirical_difficulty falls back to the estimate for the
+    difficulty_level.
+    """
+    flat = [r for responses in sessions for r in responses]
+    levels = [r.get("difficulty_level") for r in flat]
+
+    # Difficulty levels take a handful of distinct values; normalize each once
+    level_codes: Dict[Any, Tuple[int, bool, float]] = {}
+    for level in set(levels):
+        named = level or "medium"
+        normalized = named.lower() if isinstance(named, str) else named
+        level_codes[level] = (
+            _DIFFICULTY_CODES.get(str(normalized).lower(), _UNKNOWN_DIFFICULTY),
+            normalized == "hard",
+            estimate_empirical_difficulty_from_level(named),
+        )
+    codes = [level_codes[level] for level in levels]
+
+    p_values = [
+        p if type(p) is float else _to_float(p) if p is not None else None
+        for p in (r.get("empirical_difficulty") for r in flat)
+    ]
+    used_fallback = [p is None for p in p_values]
+
+    lengths = np.fromiter((len(responses) for responses in sessions), dtype=np.int64)
+    return _PackedResponses(
+        lengths=lengths,
+        session=np.repeat(np.arange(len(lengths)), lengths),
+        is_correct=np.array(
+            [bool(r.get("is_correct", False)) for r in flat], dtype=bool
+        ),
+        difficulty=np.array([code[0] for code in codes], dtype=np.int64),
+        is_hard=np.array([code[1] for code in codes], dtype=bool),
+        time_seconds=np.array(
+            [
+                t if type(t) is int or type(t) is float else _seconds(t)
+                for t in (r.get("time_seconds") for r in flat)
+            ],
+            dtype=np.float64,
+        ),
+        p_value=np.array(
+            [code[2] if p is None else p for p, code in zip(p_values, codes)],
+            dtype=np.float64,
+        ),
+        used_fallback=np.array(used_fallback, dtype=bool),
+    )
+
+
+def _count(packed: _PackedResponses, mask: np.ndarray) -> np.ndarray:
+    """Number of responses per session where ``mask`` holds."""
+    return np.bincount(packed.session[mask], minlength=packed.session_count)
+
+
+# =============================================================================
+# VECTORIZED COUNTS
+# =============================================================================
+
+
+def _person_fit_counts(
+    packed: _PackedResponses,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Per-session (correct, total) counts by difficulty.
+
+    Returns:
+        Two (sessions, 3) arrays, columns ordered easy/medium/hard
+    """
+    known = packed.difficulty != _UNKNOWN_DIFFICULTY
+    cells = packed.session * len(_DIFFICULTY_LEVELS) + packed.difficulty
+    size = packed.session_count * len(_DIFFICULTY_LEVELS)
+    totals = np.bincount(cells[known], minlength=size)
+    correct = np.bincount(cells[known & packed.is_correct], minlength=size)
+    shape = (packed.session_count, len(_DIFFICULTY_LEVELS))
+    return correct.reshape(shape), totals.reshape(shape)
+
+
+def _timing_stats(packed: _PackedResponses) -> Dict[str, np.ndarray]:
+    """Per-session timing statistics over responses with valid time data."""
+    times = packed.time_seconds
+    valid = ~np.isnan(times)
+    sessions = packed.session[valid]
+    valid_times = times[valid]
+
+    # bincount adds the weights in input order, so each total is summed in the
+    # same order (and with the same rounding) as sum() over the session's list
+    totals = np.bincount(sessions, weights=valid_times, minlength=packed.session_count)
+    mins = np.full(packed.session_count, np.inf)
+    maxs = np.full(packed.session_count, -np.inf)
+    np.minimum.at(mins, sessions, valid_times)
+    np.maximum.at(maxs, sessions, valid_times)
+
+    with np.errstate(invalid="ignore"):
+        rapid = valid & (times < RAPID_RESPONSE_THRESHOLD_SECONDS)
+        extended = valid & (times > EXTENDED_PAUSE_THRESHOLD_SECONDS)
+        fast_hard = (
+            valid
+            & packed.is_correct
+            & packed.is_hard
+            & (times < FAST_HARD_CORRECT_THRESHOLD_SECONDS)
+        )
+
+    return {
+        "count": _count(packed, valid),
+        "total": totals,
+        "min": mins,
+        "max": maxs,
+        "rapid": _count(packed, rapid),
+        "extended": _count(packed, extended),
+        "fast_hard": _count(packed, fast_hard),
+    }
+
+
+def _guttman_error_counts(packed: _PackedResponses) -> np.ndarray:
+    """
+    Guttman errors per session.
+
+    An error is a pair (missed item, correct item) from the same session where
+    the missed item is strictly easier (higher p-value). After sorting by
+    session and p-value descending, the missed items strictly easier than a
+    correct item are the missed items before its tie group, minus those before
+    its session; summing that over the correct items gives the error count.
+    """
+    if len(packed.session) == 0:
+        return np.zeros(packed.session_count, dtype=np.int64)
+
+    order = np.lexsort((-packed.p_value, packed.session))
+    sessions = packed.session[order]
+    p_values = packed.p_value[order]
+    correct = packed.is_correct[order]
+
+    missed = (~correct).astype(np.int64)
+    missed_before = np.cumsum(missed) - missed
+
+    positions = np.arange(len(order))
+    session_start = np.ones(len(order), dtype=bool)
+    session_start[1:] = sessions[1:] != sessions[:-1]
+    tie_start = session_start.copy()
+    tie_start[1:] |= p_values[1:] != p_values[:-1]
+    first_in_session = np.maximum.accumulate(np.where(session_start, positions, 0))
+    first_in_tie = np.maximum.accumulate(np.where(tie_start, positions, 0))
+
+    easier_missed = missed_before[first_in_tie] - missed_before[first_in_session]
+    errors = np.zeros(packed.session_count, dtype=np.int64)
+    np.add.at(errors, sessions[correct], easier_missed[correct])
+    return errors
+
+
+# =============================================================================
+# PUBLIC API
+# =============================================================================
+
+
+def batch_validity_checks(
+    sessions: Sequence[Sequence[Dict[str, Any]]],
+) -> List[Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]]:
+    """
+    Run the person-fit, response time and Guttman checks for many sessions.
+
+    Args:
+        sessions: Each session's responses, as dictionaries in the format of
+            run_validity_analysis_with_edge_case_handling():
+            - is_correct: bool
+            - difficulty_level: str ("easy", "medium", "hard")
+            - empirical_difficulty: float | None (p-value)
+            - time_seconds: float | None
+
+    Returns:
+        One (person_fit, time_check, guttman_check) tuple per session, equal to
+        the results of calculate_person_fit_heuristic(),
+        check_response_time_plausibility() and
+        count_guttman_errors_with_fallback() on that session's responses
+    """
+    packed = _pack_sessions(sessions)
+    fit_correct, fit_totals = _person_fit_counts(packed)
+    timing = _timing_stats(packed)
+    errors = _guttman_error_counts(packed)
+    scores = _count(packed, packed.is_correct)
+    fallbacks = _count(packed, packed.used_fallback)
+
+    # Python ints and floats, so results match the single-session functions
+    lengths = packed.lengths.tolist()
+    fit_correct_rows = fit_correct.tolist()
+    fit_total_rows = fit_totals.tolist()
+    timing_lists = {name: values.tolist() for name, values in timing.items()}
+    error_counts = errors.tolist()
+    score_counts = scores.tolist()
+    fallback_counts = fallbacks.tolist()
+
+    results = []
+    for i, n in enumerate(lengths):
+        if n == 0:
+            guttman = _create_empty_guttman_result()
+            guttman["used_fallback"] = False
+            results.append(
+                (
+                    _create_empty_person_fit_result(),
+                    _create_empty_time_check_result(),
+                    guttman,
+                )
+            )
+            continue
+
+        person_fit = _build_person_fit_result(
+            {
+                level: {
+                    "correct": fit_correct_rows[i][code],
+                    "total": fit_total_rows[i][code],
+                }
+                for code, level in enumerate(_DIFFICULTY_LEVELS)
+            },
+            total_responses=n,
+            total_score=score_counts[i],
+        )
+
+        timed = timing_lists["count"][i]
+        if timed == 0:
+            time_check = _create_empty_time_check_result(
+                details=f"No valid response time data available. "
+                f"{n} response(s) missing time information."
+            )
+        else:
+            time_check = _build_time_check_result(
+                total_time_seconds=timing_lists["total"][i],
+                min_time=timing_lists["min"][i],
+                max_time=timing_lists["max"][i],
+                total_responses=timed,
+                rapid_response_count=timing_lists["rapid"][i],
+                extended_pause_count=timing_lists["extended"][i],
+                fast_hard_correct_count=timing_lists["fast_hard"][i],
+            )
+
+        if n == 1:
+            guttman = _create_empty_guttman_result(
+                total_responses=1,
+                correct_count=score_counts[i],
+                incorrect_count=1 - score_counts[i],
+                details="Single item response; no pairs available for Guttman analysis.",
+            )
+        else:
+            guttman = _build_guttman_result(
+                total_responses=n,
+                correct_count=score_counts[i],
+                error_count=error_counts[i],
+            )
+        guttman["used_fallback"] = fallback_counts[i] > 0
+        guttman["fallback_count"] = fallback_counts[i]
+
+        results.append((person_fit, time_check, guttman))
+
+    logger.info(
+        f"Batch validity checks: {len(lengths)} sessions, "
+        f"{len(packed.session)} responses, "
+        f"{sum(1 for n, f in zip(lengths, fallback_counts) if n and f == n)} "
+        f"sessions used only fallback difficulty estimates"
+    )
+    return results
+
+
+def run_batch_validity_analysis(
+    sessions: Sequence[BatchSession],
+    force_revalidate: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Run full validity analysis with edge case handling for many sessions.
+
+    Batch counterpart of run_validity_analysis_with_edge_case_handling(): each
+    result is the dictionary that function returns for the same session, but
+    the checks for all analyzed sessions run in a single vectorized pass.
+
+    Args:
+        sessions: Sessions to analyze (see BatchSession); session_status
+            defaults to "completed"
+        force_revalidate: If True, re-validates sessions that already have a
+            validity assessment
+
+    Returns:
+        One validity assessment dictionary per session, in input order
+    """
+    results: Dict[int, Dict[str, Any]] = {}
+    to_analyze: List[int] = []
+
+    for i, session in enumerate(sessions):
+        status = session.get("session_status", "completed")
+        if status not in VALID_SESSION_STATUSES:
+            logger.warning(
+                f"Unknown session_status '{status}', treating as 'completed'"
+            )
+            status = "completed"
+
+        existing_status = session.get("existing_validity_status")
+        if should_skip_revalidation(
+            existing_status,
+            session.get("existing_validity_checked_at"),
+            force_revalidate,
+        ):
+            results[i] = {
+                "validity_status": existing_status,
+                "skipped": True,
+                "reason": "already_validated",
+                "details": f"Session already validated with status '{existing_status}'",
+            }
+        elif status == "abandoned":
+            results[i] = check_validity_for_abandoned_session()
+        elif not session.get("responses"):
+            results[i] = {
+                "validity_status": "valid",
+                "severity_score": 0,
+                "confidence": 1.0,
+                "flags": [],
+                "flag_details": [],
+                "components": {
+                    "person_fit": "skipped",
+                    "time_check": "skipped",
+                    "guttman_check": "skipped",
+                },
+                "details": "No responses to analyze. Session marked as valid by default.",
+                "is_empty": True,
+            }
+        else:
+            to_analyze.append(i)
+
+    checks = batch_validity_checks([sessions[i]["responses"] for i in to_analyze])
+    for i, (person_fit, time_check, guttman) in zip(to_analyze, checks):
+        responses = sessions[i]["responses"]
+        result = assess_session_validity(
+            person_fit=person_fit,
+            time_check=time_check,
+            guttman_check=guttman,
+        )
+        result["edge_case_info"] = {
+            "is_short_test": len(responses) < MINIMUM_QUESTIONS_FOR_FULL_ANALYSIS,
+            "total_responses": len(responses),
+            "used_difficulty_fallback": guttman.get("used_fallback", False),
+            "missing_time_data_count": sum(
+                1 for r in responses if r.get("time_seconds") is None
+            ),
+        }
+        results[i] = result
+
+    return [results[i] for i in range(len(sessions))]
@@ -0,0 +1,293 @@
+"""Batch catch-up for shadow CAT results (TASK-875).
+
+Replays shadow CAT for completed fixed-form sessions that have a TestResult
+but no ShadowCATResult, e.g. sessions dropped by the live executor under load
+or submitted before shadow testing was enabled.
+
+Unlike the live path, which issues several queries per session, catch-up:
+
+- pages through missing sessions with a keyset query on ``test_sessions.id``;
+- loads the calibrated item bank once and ships it to each worker process
+  through the pool initializer;
+- fetches the responses for a whole page in one query;
+- runs the CPU-bound CAT replays in a process pool, so they are not
+  serialised behind the GIL;
+- bulk-inserts the page's results in a single commit.
+
+IRT parameters are taken from the item bank as it is at catch-up time, which
+may differ from the parameters a live run would have seen at submission time.
+"""
+
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.datetime_utils import utc_now
+from app.core.shadow_cat.runner import (
+    MIN_CALIBRATED_ITEMS,
+    ShadowCATItem,
+    compute_shadow_cat_fields,
+)
+from app.models.models import (
+    Question,
+    Response,
+    ShadowCATResult,
+    TestResult,
+    TestSession,
+    TestStatus,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 500
+
+# question_id -> (question_type, irt_difficulty, irt_discrimination)
+ItemBank = Dict[int, Tuple[str, float, float]]
+
+# (session_id, user_id, actual_iq, [(question_id, is_correct), ...])
+CatchupTask = Tuple[int, int, int, List[Tuple[int, bool]]]
+
+# Item bank installed in each worker process by _init_worker
+_worker_item_bank: ItemBank = {}
+
+
+@dataclass
+class CatchupSummary:
+    """Counts reported by a catch-up run."""
+
+    scanned: int = 0
+    computed: int = 0
+    skipped: int = 0
+    failed: int = 0
+    inserted: int = 0
+
+
+def load_item_bank(db: Session) -> ItemBank:
+    """Load IRT parameters for every calibrated question in one query."""
+    rows = (
+        db.query(
+            Question.id,
+            Question.question_type,
+            Question.irt_difficulty,
+            Question.irt_discrimination,
+        )
+        .filter(
+            Question.irt_difficulty.isnot(None),
+            Question.irt_discrimination.isnot(None),
+        )
+        .all()
+    )
+    return {
+        question_id: (question_type.value, difficulty, discrimination)
+        for question_id, question_type, difficulty, discrimination in rows
+    }
+
+
+def find_sessions_missing_shadow_results(
+    db: Session, after_session_id: int = 0, limit: int = DEFAULT_BATCH_SIZE
+) -> List[Tuple[int, int, int]]:
+    """Return the next page of (session_id, user_id, actual_iq) needing shadow CAT.
+
+    Keyset-paginated on ``test_sessions.id`` so each page is an index range
+    scan regardless of how far into the table the run has progressed.
+    """
+    rows = (
+        db.query(TestSession.id, TestSession.user_id, TestResult.iq_score)
+        .join(TestResult, TestResult.test_session_id == TestSession.id)
+        .outerjoin(ShadowCATResult, ShadowCATResult.test_session_id == TestSession.id)
+        .filter(
+            TestSession.id > after_session_id,
+            TestSession.status == TestStatus.COMPLETED,
+            TestSession.is_adaptive.is_(False),
+            ShadowCATResult.id.is_(None),
+        )
+        .order_by(TestSession.id)
+        .limit(limit)
+        .all()
+    )
+    return [(session_id, user_id, iq) for session_id, user_id, iq in rows]
+
+
+def fetch_session_responses(
+    db: Session, session_ids: List[int]
+) -> Dict[int, List[Tuple[int, bool]]]:
+    """Fetch (question_id, is_correct) per session in answer order, in one query."""
+    responses: Dict[int, List[Tuple[int, bool]]] = {sid: [] for sid in session_ids}
+    if not session_ids:
+        return responses
+    rows = (
+        db.query(Response.test_session_id, Response.question_id, Response.is_correct)
+        .filter(Response.test_session_id.in_(session_ids))
+        .order_by(Response.test_session_id, Response.answered_at, Response.id)
+        .all()
+    )
+    for session_id, question_id, is_correct in rows:
+        responses[session_id].append((question_id, is_correct))
+    return responses
+
+
+def _init_worker(item_bank: ItemBank) -> None:
+    """Process pool initializer: install the shared item bank once per worker."""
+    global _worker_item_bank
+    _worker_item_bank = item_bank
+
+
+def _replay_session(task: CatchupTask) -> Tuple[int, Optional[Dict[str, Any]], str]:
+    """Replay CAT for one session against the worker's item bank.
+
+    Returns:
+        (session_id, ShadowCATResult column values or None, outcome) where
+        outcome is ``"computed"``, ``"skipped"`` or ``"failed"``.
+    """
+    session_id, user_id, actual_iq, responses = task
+    start_time = time.perf_counter()
+    try:
+        items = []
+        for question_id, is_correct in responses:
+            params = _worker_item_bank.get(question_id)
+            if params is None:
+                continue
+            question_type, difficulty, discrimination = params
+            items.append(
+                ShadowCATItem(
+                    question_id=question_id,
+                    is_correct=is_correct,
+                    question_type=question_type,
+                    irt_difficulty=difficulty,
+                    irt_discrimination=discrimination,
+                )
+            )
+
+        if len(items) < MIN_CALIBRATED_ITEMS:
+            return session_id, None, "skipped"
+
+        fields = compute_shadow_cat_fields(items, session_id, user_id, actual_iq)
+        fields["execution_time_ms"] = int((time.perf_counter() - start_time) * 1000)
+        return session_id, fields, "computed"
+    except Exception as e:
+        logger.error(f"Shadow CAT catch-up failed for session {session_id}: {e}")
+        return session_id, None, "failed"
+
+
+def _store_results(db: Session, results: List[Dict[str, Any]]) -> int:
+    """Bulk-insert computed results, skipping sessions stored concurrently."""
+    if not results:
+        return 0
+    session_ids = [fields["test_session_id"] for fields in results]
+    already_stored = {
+        sid
+        for (sid,) in db.query(ShadowCATResult.test_session_id)
+        .filter(ShadowCATResult.test_session_id.in_(session_ids))
+        .all()
+    }
+    executed_at = utc_now()
+    new_rows = [
+        ShadowCATResult(**fields, executed_at=executed_at)
+        for fields in results
+        if fields["test_session_id"] not in already_stored
+    ]
+    db.add_all(new_rows)
+    db.commit()
+    return len(new_rows)
+
+
+def iter_catchup_batches(
+    db: Session, batch_size: int = DEFAULT_BATCH_SIZE, limit: Optional[int] = None
+) -> Iterator[List[CatchupTask]]:
+    """Yield pages of catch-up tasks until no missing sessions remain."""
+    after_session_id = 0
+    remaining = limit
+    while remaining is None or remaining > 0:
+        page_size = batch_size if remaining is None else min(batch_size, remaining)
+        sessions = find_sessions_missing_shadow_results(
+            db, after_session_id=after_session_id, limit=page_size
+        )
+        if not sessions:
+            return
+        after_session_id = sessions[-1][0]
+        if remaining is not None:
+            remaining -= len(sessions)
+
+        responses = fetch_session_responses(db, [sid for sid, _, _ in sessions])
+        yield [
+            (session_id, user_id, actual_iq, responses[session_id])
+            for session_id, user_id, actual_iq in sessions
+        ]
+
+
+def run_shadow_cat_catchup(
+    db: Session,
+    workers: Optional[int] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    limit: Optional[int] = None,
+    dry_run: bool = False,
+) -> CatchupSummary:
+    """Compute and store shadow CAT results for every session missing one.
+
+    Args:
+        db: Sync database session used for reads and inserts.
+        workers: Worker processes for CAT replays. Defaults to the CPU count;
+            ``1`` runs replays in-process without a pool.
+        batch_size: Sessions fetched, replayed and committed per page.
+        limit: Maximum number of sessions to process.
+        dry_run: Replay but do not insert results.
+
+    Returns:
+        CatchupSummary with per-outcome counts.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    workers = workers or os.cpu_count() or 1
+
+    item_bank = load_item_bank(db)
+    logger.info(
+        f"Shadow CAT catch-up: {len(item_bank)} calibrated items, "
+        f"{workers} worker(s), batch size {batch_size}"
+    )
+
+    summary = CatchupSummary()
+    pool: Optional[ProcessPoolExecutor] = None
+    if workers > 1:
+        pool = ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(item_bank,)
+        )
+    else:
+        _init_worker(item_bank)
+
+    try:
+        for tasks in iter_catchup_batches(db, batch_size=batch_size, limit=limit):
+            summary.scanned += len(tasks)
+            if pool is not None:
+                chunksize = max(1, len(tasks) // (workers * 4))
+                outcomes = list(pool.map(_replay_session, tasks, chunksize=chunksize))
+            else:
+                outcomes = [_replay_session(task) for task in tasks]
+
+            computed = []
+            for _, fields, outcome in outcomes:
+                if outcome == "computed" and fields is not None:
+                    computed.append(fields)
+                elif outcome == "skipped":
+                    summary.skipped += 1
+                else:
+                    summary.failed += 1
+            summary.computed += len(computed)
+
+            if not dry_run:
+                summary.inserted += _store_results(db, computed)
+
+            logger.info(
+                f"Shadow CAT catch-up: scanned={summary.scanned}, "
+                f"computed={summary.computed}, inserted={summary.inserted}, "
+                f"skipped={summary.skipped}, failed={summary.failed}"
+            )
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    return summary
@@ -0,0 +1,137 @@
+"""Bounded executor for live shadow CAT runs.
+
+Shadow CAT used to spawn one daemon thread per fixed-form submission, so a
+burst of submissions produced an unbounded number of threads each holding a
+DB connection. This executor caps both the number of concurrent runs and the
+number of runs waiting for a worker. Submissions beyond that are dropped with
+a warning rather than queued without limit: shadow CAT is instrumentation
+only, and dropped sessions are picked up later by the batch catch-up command
+(``scripts/run_shadow_cat_catchup.py``).
+"""
+
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
+
+from app.core.config import settings
+from app.core.shadow_cat.runner import run_shadow_cat
+
+logger = logging.getLogger(__name__)
+
+
+def _run_with_own_session(session_id: int, raise_errors: bool = False) -> None:
+    """Run shadow CAT on a dedicated sync session (executes in a worker thread)."""
+    from app.models.base import SessionLocal
+
+    db = SessionLocal()
+    try:
+        run_shadow_cat(db, session_id, raise_errors=raise_errors)
+    finally:
+        db.close()
+
+
+class ShadowCATExecutor:
+    """Thread pool with a hard cap on in-flight shadow CAT runs.
+
+    Args:
+        max_workers: Number of runs executing concurrently.
+        max_queue_size: Number of runs allowed to wait for a free worker.
+    """
+
+    def __init__(self, max_workers: int = 2, max_queue_size: int = 100) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if max_queue_size < 0:
+            raise ValueError("max_queue_size must be non-negative")
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue_size)
+        self._lock = threading.Lock()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._dropped = 0
+
+    @property
+    def dropped_count(self) -> int:
+        """Number of submissions rejected because the executor was full."""
+        return self._dropped
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="shadow-cat"
+                )
+            return self._pool
+
+    def _release(self, _future: Future) -> None:
+        self._slots.release()
+
+    def submit(self, session_id: int, raise_errors: bool = False) -> Optional[Future]:
+        """Schedule a shadow CAT run for a session without blocking.
+
+        Args:
+            session_id: Completed fixed-form session to replay.
+            raise_errors: Surface run failures through the returned Future
+                instead of logging and swallowing them.
+
+        Returns:
+            The Future for the run, or None if the executor is saturated and
+            the session was dropped.
+        """
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._dropped += 1
+            logger.warning(
+                f"Shadow CAT executor full ({self.max_workers} running, "
+                f"{self.max_queue_size} queued); dropping session {session_id} "
+                "for later catch-up"
+            )
+            return None
+
+        try:
+            future = self._get_pool().submit(
+                _run_with_own_session, session_id, raise_errors
+            )
+        except RuntimeError:
+            # Pool already shut down
+            self._slots.release()
+            logger.warning(
+                f"Shadow CAT executor is shut down; dropping session {session_id}"
+            )
+            return None
+
+        future.add_done_callback(self._release)
+        return future
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the pool, discarding runs that have not started yet."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+
+_executor: Optional[ShadowCATExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_shadow_cat_executor() -> ShadowCATExecutor:
+    """Return the process-wide executor, creating it from settings on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ShadowCATExecutor(
+                max_workers=settings.SHADOW_CAT_MAX_WORKERS,
+                max_queue_size=settings.SHADOW_CAT_MAX_QUEUE_SIZE,
+            )
+        return _executor
+
+
+def shutdown_shadow_cat_executor(wait: bool = True) -> None:
+    """Shut down the process-wide executor if it was created."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
@@ -4,13 +4,16 @@ Runs the CAT algorithm on completed fixed-form test responses to compare
 theta-based IQ estimates with CTT-based scores. Results are stored in the
 shadow_cat_results table for admin analysis.
 
-This module never raises exceptions to callers - all errors are logged
-and handled gracefully since shadow testing is instrumentation-only.
+By default this module never raises exceptions to callers - all errors are
+logged and handled gracefully since shadow testing is instrumentation-only.
+The post-submission pipeline opts into ``raise_errors`` so its retry loop
+sees failures.
 """
 
 import logging
 import time
-from typing import Any, List, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
 
 from sqlalchemy import and_
 from sqlalchemy.orm import Session
@@ -32,7 +35,9 @@ MIN_CALIBRATED_ITEMS = CATSessionManager.MIN_ITEMS
 logger = logging.getLogger(__name__)
 
 
-def run_shadow_cat(db: Session, session_id: int) -> Optional[ShadowCATResult]:
+def run_shadow_cat(
+    db: Session, session_id: int, raise_errors: bool = False
+) -> Optional[ShadowCATResult]:
     """Run shadow CAT retrospectively on a completed fixed-form test.
 
     Fetches the test session's responses with their IRT parameters,
@@ -42,10 +47,12 @@ def run_shadow_cat(db: Session, session_id: int) -> Optional[ShadowCATResult]:
     Args:
         db: Database session (caller is responsible for closing)
         session_id: ID of the completed test session
+        raise_errors: Re-raise unexpected errors after logging and rolling
+            back instead of returning None. Used by callers that retry.
 
     Returns:
         ShadowCATResult if successful, None if skipped or failed.
-        Never raises exceptions.
+        Never raises exceptions unless ``raise_errors`` is set.
     """
     start_time = time.perf_counter()
 
@@ -131,6 +138,8 @@ def run_shadow_cat(db: Session, session_id: int) -> Optional[ShadowCATResult]:
             db.rollback()
         except Exception:
             pass
+        if raise_errors:
+            raise
         return None
 
 
@@ -157,6 +166,22 @@ def _fetch_calibrated_responses(db: Session, session_id: int) -> List[Any]:
     )
 
 
+@dataclass(frozen=True)
+class ShadowCATItem:
+    """One administered item as seen by the shadow CAT engine.
+
+    A plain, picklable view of a (Response, Question) pair so the same CAT
+    replay can run on ORM rows (live path) or on rows assembled from a
+    preloaded item bank in a worker process (batch catch-up).
+    """
+
+    question_id: int
+    is_correct: bool
+    question_type: str
+    irt_difficulty: float
+    irt_discrimination: float
+
+
 def _execute_shadow_cat(
     responses_with_irt: List[Any],
     session_id: int,
@@ -169,6 +194,36 @@ def _execute_shadow_cat(
     theta and SE progression. The CAT may "stop" before all items are
     processed if stopping criteria are met.
     """
+    items = []
+    for response, question in responses_with_irt:
+        # irt_difficulty and irt_discrimination are guaranteed non-None
+        # by the _fetch_calibrated_responses filter
+        assert question.irt_difficulty is not None
+        assert question.irt_discrimination is not None
+        items.append(
+            ShadowCATItem(
+                question_id=question.id,
+                is_correct=response.is_correct,
+                question_type=question.question_type.value,
+                irt_difficulty=question.irt_difficulty,
+                irt_discrimination=question.irt_discrimination,
+            )
+        )
+
+    fields = compute_shadow_cat_fields(items, session_id, user_id, actual_iq)
+    return ShadowCATResult(**fields, executed_at=utc_now())
+
+
+def compute_shadow_cat_fields(
+    items: Sequence[ShadowCATItem],
+    session_id: int,
+    user_id: int,
+    actual_iq: int,
+) -> Dict[str, Any]:
+    """Replay the CAT engine over items and return ShadowCATResult column values.
+
+    Pure computation with no DB access, so it can run in a worker process.
+    """
     manager = CATSessionManager()
     cat_session = manager.initialize(user_id=user_id, session_id=session_id)
 
@@ -177,24 +232,19 @@ def _execute_shadow_cat(
     administered_ids: List[int] = []
     stop_reason: Optional[str] = None
 
-    for response, question in responses_with_irt:
-        # irt_difficulty and irt_discrimination are guaranteed non-None
-        # by the _fetch_calibrated_responses filter
-        assert question.irt_difficulty is not None
-        assert question.irt_discrimination is not None
-
+    for item in items:
         step_result = manager.process_response(
             session=cat_session,
-            question_id=question.id,
-            is_correct=response.is_correct,
-            question_type=question.question_type.value,
-            irt_difficulty=question.irt_difficulty,
-            irt_discrimination=question.irt_discrimination,
+            question_id=item.question_id,
+            is_correct=item.is_correct,
+            question_type=item.question_type,
+            irt_difficulty=item.irt_difficulty,
+            irt_discrimination=item.irt_discrimination,
         )
 
         theta_history.append(step_result.theta_estimate)
         se_history.append(step_result.theta_se)
-        administered_ids.append(question.id)
+        administered_ids.append(item.question_id)
 
         if step_result.should_stop:
             stop_reason = step_result.stop_reason
@@ -210,18 +260,17 @@ def _execute_shadow_cat(
     # Calculate delta
     theta_iq_delta = float(cat_result.iq_score - actual_iq)
 
-    return ShadowCATResult(
-        test_session_id=session_id,
-        shadow_theta=cat_result.theta_estimate,
-        shadow_se=cat_result.theta_se,
-        shadow_iq=cat_result.iq_score,
-        items_administered=cat_result.items_administered,
-        administered_question_ids=administered_ids,
-        stopping_reason=stop_reason,
-        actual_iq=actual_iq,
-        theta_iq_delta=theta_iq_delta,
-        theta_history=theta_history,
-        se_history=se_history,
-        domain_coverage=dict(cat_session.domain_coverage),
-        executed_at=utc_now(),
-    )
+    return {
+        "test_session_id": session_id,
+        "shadow_theta": cat_result.theta_estimate,
+        "shadow_se": cat_result.theta_se,
+        "shadow_iq": cat_result.iq_score,
+        "items_administered": cat_result.items_administered,
+        "administered_question_ids": administered_ids,
+        "stopping_reason": stop_reason,
+        "actual_iq": actual_iq,
+        "theta_iq_delta": theta_iq_delta,
+        "theta_history": theta_history,
+        "se_history": se_history,
+        "domain_coverage": dict(cat_session.domain_coverage),
+    }
@@ -9,8 +9,21 @@ Common configuration keys:
 - domain_weights: {"pattern": 0.20, "logic": 0.18, ...}
 - use_weighted_scoring: {"enabled": false}
 - domain_population_stats: {"pattern": {"mean_accuracy": 0.65, "sd_accuracy": 0.18}, ...}
+- exposure_parameters: {"target_rate": 0.2, "computed_at": "...", "parameters": {"123": 0.41, ...}}
+
+Reads on the test start/submit path (CAT enabled, weighted scoring, domain
+weights, population stats, item exposure parameters) are served from an in-process snapshot of the
+whole table instead of querying it on every call. The snapshot is loaded at
+startup, updated immediately by writes made through this module, and reloaded
+once it is older than SYSTEM_CONFIG_CACHE_TTL_SECONDS, so changes made by
+other workers or processes (e.g. the CAT readiness cron) are picked up within
+that delay. get_config / get_all_configs / config_exists always read the
+database.
 """
 
+import copy
+import time
+
 from app.core.datetime_utils import utc_now
 from typing import Any, Optional
 
@@ -18,8 +31,149 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.models.models import SystemConfig
 
+_DELETED = object()
+
+
+class SystemConfigSnapshot:
+    """
+    In-process copy of the system_config table with a bounded staleness.
+
+    Values are replaced copy-on-write, so a reader holding the dict returned by
+    ``values`` never sees a partial update. A generation counter, bumped by
+    every local write, stops a reload that started before the write from
+    installing the older rows over it.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        """
+        Initialize an empty snapshot.
+
+        Args:
+            ttl_seconds: Maximum age of the snapshot before it is reloaded
+        """
+        self.ttl_seconds = ttl_seconds
+        self._values: Optional[dict[str, Any]] = None
+        self._loaded_at = 0.0
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Counter incremented by every local write or invalidation."""
+        return self._generation
+
+    def values(self) -> Optional[dict[str, Any]]:
+        """
+        Return the snapshot if it is loaded and younger than the TTL.
+
+        Returns:
+            Mapping of key to value, or None if the snapshot must be (re)loaded
+        """
+        if self._values is None:
+            return None
+        if time.monotonic() - self._loaded_at >= self.ttl_seconds:
+            return None
+        return self._values
+
+    def install(self, values: dict[str, Any], generation: int) -> dict[str, Any]:
+        """
+        Install freshly loaded rows unless a local write happened meanwhile.
+
+        Args:
+            values: All configuration rows, as loaded from the database
+            generation: ``generation`` observed before the load started
+
+        Returns:
+            The loaded values (usable by the caller either way)
+        """
+        if generation == self._generation:
+            self._values = values
+            self._loaded_at = time.monotonic()
+        return values
+
+    def apply(self, key: str, value: Any = _DELETED) -> None:
+        """
+        Reflect a committed write (or, without ``value``, a delete).
+
+        Args:
+            key: Configuration key written
+            value: New value; omit for a deleted key
+        """
+        self._generation += 1
+        if self._values is None:
+            return
+        values = dict(self._values)
+        if value is _DELETED:
+            values.pop(key, None)
+        else:
+            values[key] = copy.deepcopy(value)
+        self._values = values
+
+    def invalidate(self) -> None:
+        """Drop the snapshot so the next read reloads it."""
+        self._generation += 1
+        self._values = None
+
+
+_config_snapshot = SystemConfigSnapshot(settings.SYSTEM_CONFIG_CACHE_TTL_SECONDS)
+
+
+def get_config_snapshot() -> SystemConfigSnapshot:
+    """Get the process-wide configuration snapshot."""
+    return _config_snapshot
+
+
+def invalidate_config_snapshot() -> None:
+    """Force the next cached read to reload the configuration table."""
+    _config_snapshot.invalidate()
+
+
+def _snapshot_values(db: Session) -> dict[str, Any]:
+    values = _config_snapshot.values()
+    if values is None:
+        generation = _config_snapshot.generation
+        values = _config_snapshot.install(get_all_configs(db), generation)
+    return values
+
+
+async def _async_snapshot_values(db: AsyncSession) -> dict[str, Any]:
+    values = _config_snapshot.values()
+    if values is None:
+        generation = _config_snapshot.generation
+        values = _config_snapshot.install(await async_get_all_configs(db), generation)
+    return values
+
+
+# (config value the mapping was built from, item ID -> exposure parameter)
+_exposure_parameters_memo: tuple[Any, dict[int, float]] = (None, {})
+
+
+def _exposure_parameter_map(config: Any) -> dict[int, float]:
+    """
+    Convert the stored exposure parameters to an item ID keyed mapping.
+
+    Snapshot values are replaced rather than mutated, so the conversion is
+    redone only when a new value was loaded or written.
+    """
+    global _exposure_parameters_memo
+    source, parameters = _exposure_parameters_memo
+    if config is source:
+        return parameters
+    parameters = {
+        int(item_id): float(value)
+        for item_id, value in (config or {}).get("parameters", {}).items()
+    }
+    _exposure_parameters_memo = (config, parameters)
+    return parameters
+
+
+def _is_enabled(config: Any) -> bool:
+    if config is None:
+        return False
+    return config.get("enabled", False)
+
 
 def get_config(db: Session, key: str, default: Any = None) -> Any:
     """
@@ -63,6 +217,7 @@ def set_config(db: Session, key: str, value: Any) -> SystemConfig:
         config.updated_at = utc_now()
 
     db.commit()
+    _config_snapshot.apply(key, value)
     db.refresh(config)
     return config
 
@@ -84,6 +239,7 @@ def delete_config(db: Session, key: str) -> bool:
 
     db.delete(config)
     db.commit()
+    _config_snapshot.apply(key)
     return True
 
 
@@ -115,6 +271,37 @@ def config_exists(db: Session, key: str) -> bool:
     return db.query(SystemConfig).filter(SystemConfig.key == key).first() is not None
 
 
+def get_cached_config(db: Session, key: str, default: Any = None) -> Any:
+    """
+    Get a configuration value from the in-process snapshot.
+
+    Makes no query while the snapshot is fresh; the whole table is reloaded
+    (one query) when it has expired.
+
+    Args:
+        db: Database session, used only to reload the snapshot
+        key: Configuration key to retrieve
+        default: Default value to return if key doesn't exist
+
+    Returns:
+        A copy of the configuration value, or default if not found
+    """
+    values = _snapshot_values(db)
+    if key not in values:
+        return default
+    return copy.deepcopy(values[key])
+
+
+def load_config_snapshot(db: Session) -> None:
+    """
+    Load the configuration snapshot now (e.g. at process startup).
+
+    Args:
+        db: Database session
+    """
+    _config_snapshot.install(get_all_configs(db), _config_snapshot.generation)
+
+
 # Convenience functions for specific configuration keys
 
 
@@ -128,7 +315,7 @@ def get_domain_weights(db: Session) -> Optional[dict[str, float]]:
     Returns:
         Dictionary mapping domain names to weights, or None if not configured
     """
-    return get_config(db, "domain_weights")
+    return get_cached_config(db, "domain_weights")
 
 
 def set_domain_weights(db: Session, weights: dict[str, float]) -> SystemConfig:
@@ -155,8 +342,7 @@ def is_weighted_scoring_enabled(db: Session) -> bool:
     Returns:
         True if weighted scoring is enabled, False otherwise (default)
     """
-    config = get_config(db, "use_weighted_scoring", {"enabled": False})
-    return config.get("enabled", False)
+    return _is_enabled(_snapshot_values(db).get("use_weighted_scoring"))
 
 
 def set_weighted_scoring_enabled(db: Session, enabled: bool) -> SystemConfig:
@@ -177,7 +363,8 @@ def is_cat_enabled(db: Session) -> bool:
     """
     Check if CAT (Computerized Adaptive Testing) is enabled.
 
-    Single-row lookup suitable for the hot path in start_test().
+    Served from the configuration snapshot; suitable for the hot path in
+    start_test().
 
     Args:
         db: Database session
@@ -185,10 +372,7 @@ def is_cat_enabled(db: Session) -> bool:
     Returns:
         True if CAT is enabled, False otherwise (default)
     """
-    config = get_config(db, "cat_readiness")
-    if config is None:
-        return False
-    return config.get("enabled", False)
+    return _is_enabled(_snapshot_values(db).get("cat_readiness"))
 
 
 def get_cat_readiness_status(db: Session) -> Optional[dict]:
@@ -229,7 +413,7 @@ def get_domain_population_stats(db: Session) -> Optional[dict[str, dict[str, flo
         Dictionary mapping domain names to their stats (mean_accuracy, sd_accuracy),
         or None if not configured
     """
-    return get_config(db, "domain_population_stats")
+    return get_cached_config(db, "domain_population_stats")
 
 
 def set_domain_population_stats(
@@ -248,6 +432,38 @@ def set_domain_population_stats(
     return set_config(db, "domain_population_stats", stats)
 
 
+def get_exposure_parameters(db: Session) -> dict[int, float]:
+    """
+    Get the Sympson-Hetter exposure parameters for CAT item selection.
+
+    Served from the configuration snapshot; suitable for every item selection.
+    The returned mapping is shared and must not be modified.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Mapping of question ID -> exposure parameter in (0, 1]; empty if none
+        have been computed (items missing from it are unrestricted)
+    """
+    return _exposure_parameter_map(_snapshot_values(db).get("exposure_parameters"))
+
+
+def set_exposure_parameters(db: Session, table: dict) -> SystemConfig:
+    """
+    Persist Sympson-Hetter exposure parameters.
+
+    Args:
+        db: Database session
+        table: Dictionary with "parameters" (question ID -> parameter) and
+            metadata about the simulation that produced them
+
+    Returns:
+        The SystemConfig instance
+    """
+    return set_config(db, "exposure_parameters", table)
+
+
 # Async versions for async endpoints
 
 
@@ -270,6 +486,32 @@ async def async_get_config(db: AsyncSession, key: str, default: Any = None) -> A
     return config.value
 
 
+async def async_get_cached_config(
+    db: AsyncSession, key: str, default: Any = None
+) -> Any:
+    """
+    Get a configuration value from the in-process snapshot (async version).
+
+    Args:
+        db: Async database session, used only to reload the snapshot
+        key: Configuration key to retrieve
+        default: Default value to return if key doesn't exist
+
+    Returns:
+        A copy of the configuration value, or default if not found
+    """
+    values = await _async_snapshot_values(db)
+    if key not in values:
+        return default
+    return copy.deepcopy(values[key])
+
+
+async def async_load_config_snapshot(db: AsyncSession) -> None:
+    """Load the configuration snapshot now (async version)."""
+    generation = _config_snapshot.generation
+    _config_snapshot.install(await async_get_all_configs(db), generation)
+
+
 async def async_is_weighted_scoring_enabled(db: AsyncSession) -> bool:
     """
     Check if weighted scoring is enabled (async version).
@@ -280,8 +522,8 @@ async def async_is_weighted_scoring_enabled(db: AsyncSession) -> bool:
     Returns:
         True if weighted scoring is enabled, False otherwise (default)
     """
-    config = await async_get_config(db, "use_weighted_scoring", {"enabled": False})
-    return config.get("enabled", False)
+    values = await _async_snapshot_values(db)
+    return _is_enabled(values.get("use_weighted_scoring"))
 
 
 async def async_get_domain_weights(db: AsyncSession) -> Optional[dict[str, float]]:
@@ -294,14 +536,15 @@ async def async_get_domain_weights(db: AsyncSession) -> Optional[dict[str, float
     Returns:
         Dictionary mapping domain names to weights, or None if not configured
     """
-    return await async_get_config(db, "domain_weights")
+    return await async_get_cached_config(db, "domain_weights")
 
 
 async def async_is_cat_enabled(db: AsyncSession) -> bool:
     """
     Check if CAT (Computerized Adaptive Testing) is enabled (async version).
 
-    Single-row lookup suitable for the hot path in start_test().
+    Served from the configuration snapshot; suitable for the hot path in
+    start_test().
 
     Args:
         db: Async database session
@@ -309,10 +552,8 @@ async def async_is_cat_enabled(db: AsyncSession) -> bool:
     Returns:
         True if CAT is enabled, False otherwise (default)
     """
-    config = await async_get_config(db, "cat_readiness")
-    if config is None:
-        return False
-    return config.get("enabled", False)
+    values = await _async_snapshot_values(db)
+    return _is_enabled(values.get("cat_readiness"))
 
 
 async def async_get_domain_population_stats(
@@ -328,7 +569,23 @@ async def async_get_domain_population_stats(
         Dictionary mapping domain names to their stats (mean_accuracy, sd_accuracy),
         or None if not configured
     """
-    return await async_get_config(db, "domain_population_stats")
+    return await async_get_cached_config(db, "domain_population_stats")
+
+
+async def async_get_exposure_parameters(db: AsyncSession) -> dict[int, float]:
+    """
+    Get the Sympson-Hetter exposure parameters for CAT item selection
+    (async version).
+
+    Args:
+        db: Async database session
+
+    Returns:
+        Mapping of question ID -> exposure parameter in (0, 1]; empty if none
+        have been computed
+    """
+    values = await _async_snapshot_values(db)
+    return _exposure_parameter_map(values.get("exposure_parameters"))
 
 
 async def async_set_config(db: AsyncSession, key: str, value: Any) -> SystemConfig:
@@ -344,6 +601,7 @@ async def async_set_config(db: AsyncSession, key: str, value: Any) -> SystemConf
         config.updated_at = utc_now()
 
     await db.commit()
+    _config_snapshot.apply(key, value)
     await db.refresh(config)
     return config
 
@@ -357,6 +615,7 @@ async def async_delete_config(db: AsyncSession, key: str) -> bool:
 
     await db.delete(config)
     await db.commit()
+    _config_snapshot.apply(key)
     return True
 
 
@@ -402,3 +661,8 @@ async def async_set_domain_population_stats(
 ) -> SystemConfig:
     """Set domain population statistics (async version)."""
     return await async_set_config(db, "domain_population_stats", stats)
+
+
+async def async_set_exposure_parameters(db: AsyncSession, table: dict) -> SystemConfig:
+    """Persist Sympson-Hetter exposure parameters (async version)."""
+    return await async_set_config(db, "exposure_parameters", table)
@@ -226,9 +226,41 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         except Exception as e:
             logger.warning(f"Failed to setup database query instrumentation: {e}")
 
+    # Warm the SystemConfig snapshot so the first requests make no config queries
+    try:
+        from app.core.system_config import async_load_config_snapshot
+        from app.models import AsyncSessionLocal
+
+        async with AsyncSessionLocal() as db:
+            await async_load_config_snapshot(db)
+        logger.info("System config snapshot loaded")
+    except Exception as e:
+        # Not fatal: the snapshot is loaded lazily on first use instead
+        logger.warning(f"Failed to preload system config snapshot: {e}")
+
+    # Start the post-submission worker pool (drains post_submission_jobs)
+    if settings.POST_SUBMISSION_PIPELINE_ENABLED:
+        from app.core.post_submission import init_post_submission_worker_pool
+
+        init_post_submission_worker_pool(
+            concurrency=settings.POST_SUBMISSION_WORKER_CONCURRENCY,
+            poll_interval_seconds=settings.POST_SUBMISSION_POLL_INTERVAL_SECONDS,
+            lease_seconds=settings.POST_SUBMISSION_LEASE_SECONDS,
+        )
+
     yield
 
     # Shutdown
+    if settings.POST_SUBMISSION_PIPELINE_ENABLED:
+        from app.core.post_submission import shutdown_post_submission_worker_pool
+
+        await shutdown_post_submission_worker_pool(timeout=10.0)
+
+    # Discard queued shadow CAT runs; anything missed is replayed by catch-up
+    from app.core.shadow_cat.executor import shutdown_shadow_cat_executor
+
+    shutdown_shadow_cat_executor(wait=False)
+
     shutdown_tracing()
 
     # Shutdown observability backends (flushes pending data to Sentry/OTEL)
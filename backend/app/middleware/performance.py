@@ -4,17 +4,16 @@ Performance monitoring middleware for tracking API response times.
 
 import time
 import logging
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
 from starlette.requests import Request
-from starlette.responses import Response
-from typing import Callable
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from app.core.analytics import AnalyticsTracker
 from gioe_libs.observability import observability
 
 logger = logging.getLogger(__name__)
 
 
-class PerformanceMonitoringMiddleware(BaseHTTPMiddleware):
+class PerformanceMonitoringMiddleware:
     """
     Middleware to monitor and log API endpoint performance.
 
@@ -22,113 +21,148 @@ class PerformanceMonitoringMiddleware(BaseHTTPMiddleware):
     - Request processing time
     - Slow queries (> threshold)
     - Response status codes
+
+    Implemented as a pure ASGI middleware: the processing time is taken when
+    the response starts, which is the point at which BaseHTTPMiddleware's
+    call_next used to return.
     """
 
-    def __init__(self, app, slow_request_threshold: float = 1.0):
+    def __init__(self, app: ASGIApp, slow_request_threshold: float = 1.0):
         """
         Initialize performance monitoring middleware.
 
         Args:
-            app: FastAPI application
+            app: ASGI application
             slow_request_threshold: Time in seconds to consider a request slow (default: 1.0s)
         """
-        super().__init__(app)
+        self.app = app
         self.slow_request_threshold = slow_request_threshold
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process request and track performance metrics.
 
         Args:
-            request: Incoming request
-            call_next: Next middleware/endpoint in chain
-
-        Returns:
-            Response from the endpoint
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        method = request.method
+
         # Use route template (e.g., "/v1/users/{user_id}") instead of actual path
         # to avoid cardinality explosion in metrics
-        route = request.scope.get("route")
+        route = scope.get("route")
         route_path = route.path if route else str(request.url.path)
 
         with observability.start_span(
             "http_request",
             kind="server",
             attributes={
-                "http.method": request.method,
+                "http.method": method,
                 "http.route": route_path,
             },
         ) as span:
             start_time = time.time()
 
-            # Process request
-            response = await call_next(request)
-
-            # Calculate processing time
-            process_time = time.time() - start_time
+            async def send_with_metrics(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    # Calculate processing time
+                    process_time = time.time() - start_time
 
-            # Add custom header with processing time
-            response.headers["X-Process-Time"] = str(round(process_time, 4))
+                    # Add custom header with processing time
+                    MutableHeaders(scope=message)["X-Process-Time"] = str(
+                        round(process_time, 4)
+                    )
+                    self._record(
+                        request, span, route_path, message["status"], process_time
+                    )
+                await send(message)
 
-            # Set span attributes for the response
-            span.set_http_attributes(
-                method=request.method,
-                url=str(request.url),
-                status_code=response.status_code,
-                route=route_path,
-            )
+            # Process request
+            await self.app(scope, receive, send_with_metrics)
+
+    def _record(
+        self,
+        request: Request,
+        span,
+        route_path: str,
+        status_code: int,
+        process_time: float,
+    ) -> None:
+        """
+        Record span attributes, metrics and slow-request analytics.
 
-            # Record metrics via observability facade
-            # Counter for request count
-            observability.record_metric(
-                "http.server.requests",
-                value=1,
-                labels={
-                    "http.method": request.method,
-                    "http.route": route_path,
-                    "http.status_code": str(response.status_code),
-                },
-                metric_type="counter",
+        Args:
+            request: Incoming request
+            span: Active request span
+            route_path: Route template (or raw path) used as the metric label
+            status_code: Response status code
+            process_time: Time until the response started, in seconds
+        """
+        method = request.method
+
+        # Set span attributes for the response
+        span.set_http_attributes(
+            method=method,
+            url=str(request.url),
+            status_code=status_code,
+            route=route_path,
+        )
+
+        # Record metrics via observability facade
+        # Counter for request count
+        observability.record_metric(
+            "http.server.requests",
+            value=1,
+            labels={
+                "http.method": method,
+                "http.route": route_path,
+                "http.status_code": str(status_code),
+            },
+            metric_type="counter",
+        )
+
+        # Histogram for request duration
+        observability.record_metric(
+            "http.server.request.duration",
+            value=process_time,
+            labels={
+                "http.method": method,
+                "http.route": route_path,
+            },
+            metric_type="histogram",
+            unit="s",
+        )
+
+        # Log slow requests and track analytics
+        if process_time > self.slow_request_threshold:
+            logger.warning(
+                f"Slow request: {method} {request.url.path} "
+                f"took {process_time:.4f}s (threshold: {self.slow_request_threshold}s)"
             )
-
-            # Histogram for request duration
-            observability.record_metric(
-                "http.server.request.duration",
-                value=process_time,
-                labels={
-                    "http.method": request.method,
-                    "http.route": route_path,
+            span.add_event(
+                "slow_request",
+                attributes={
+                    "threshold_seconds": self.slow_request_threshold,
+                    "actual_seconds": process_time,
                 },
-                metric_type="histogram",
-                unit="s",
             )
-
-            # Log slow requests and track analytics
-            if process_time > self.slow_request_threshold:
-                logger.warning(
-                    f"Slow request: {request.method} {request.url.path} "
-                    f"took {process_time:.4f}s (threshold: {self.slow_request_threshold}s)"
-                )
-                span.add_event(
-                    "slow_request",
-                    attributes={
-                        "threshold_seconds": self.slow_request_threshold,
-                        "actual_seconds": process_time,
-                    },
-                )
-                # Track slow request analytics
-                AnalyticsTracker.track_slow_request(
-                    method=request.method,
-                    path=str(request.url.path),
-                    duration_seconds=process_time,
-                    status_code=response.status_code,
-                )
-
-            # Log all requests in debug mode
-            logger.debug(
-                f"{request.method} {request.url.path} "
-                f"- Status: {response.status_code} "
-                f"- Time: {process_time:.4f}s"
+            # Track slow request analytics
+            AnalyticsTracker.track_slow_request(
+                method=method,
+                path=str(request.url.path),
+                duration_seconds=process_time,
+                status_code=status_code,
             )
 
-            return response
+        # Log all requests in debug mode
+        logger.debug(
+            f"{method} {request.url.path} "
+            f"- Status: {status_code} "
+            f"- Time: {process_time:.4f}s"
+        )
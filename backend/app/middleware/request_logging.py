@@ -5,10 +5,9 @@ Request/response logging middleware for tracking API interactions.
 import logging
 import time
 import uuid
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
 from starlette.requests import Request
-from starlette.responses import Response
-from typing import Callable
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.logging_config import request_id_context
 from gioe_libs.observability import observability
@@ -16,7 +15,7 @@ from gioe_libs.observability import observability
 logger = logging.getLogger(__name__)
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+class RequestLoggingMiddleware:
     """
     Middleware to log incoming requests and outgoing responses.
 
@@ -25,28 +24,35 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
     - Response status code and duration
     - User identifier (from auth header if present)
     - Request ID for correlation
+
+    Implemented as a pure ASGI middleware; the response is logged when it
+    starts, as soon as its status code is known.
     """
 
-    def __init__(self, app):
+    def __init__(self, app: ASGIApp):
         """
         Initialize request logging middleware.
 
         Args:
-            app: FastAPI application
+            app: ASGI application
         """
-        super().__init__(app)
+        self.app = app
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process request and log details.
 
         Args:
-            request: Incoming request
-            call_next: Next middleware/endpoint in chain
-
-        Returns:
-            Response from the endpoint
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+
         # Generate or extract request ID for correlation
         request_id = request.headers.get("X-Request-ID") or str(uuid.uuid4())
         ctx_token = request_id_context.set(request_id)
@@ -101,58 +107,84 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
                     },
                 )
 
-                # Process request
-                response = await call_next(request)
-
-                # Calculate duration in milliseconds
-                duration_ms = round((time.time() - start_time) * 1000, 2)
-                status_code = response.status_code
-
-                # Add request_id header to response for client-side correlation
-                try:
-                    response.headers["X-Request-ID"] = request_id
-                except (AttributeError, TypeError, RuntimeError):
-                    # Some response types (e.g., StreamingResponse) may not support header modification
-                    logger.debug(
-                        f"Could not add X-Request-ID header to response type: {type(response).__name__}"
-                    )
-
-                # Set span status based on response code
-                span.set_http_attributes(
-                    method=method,
-                    url=str(request.url),
-                    status_code=status_code,
-                    route=route_path,
-                )
+                async def send_with_request_id(message: Message) -> None:
+                    if message["type"] == "http.response.start":
+                        # Add request_id header to response for client-side correlation
+                        MutableHeaders(scope=message)["X-Request-ID"] = request_id
+                        self._log_response(
+                            request,
+                            span,
+                            route_path,
+                            message["status"],
+                            start_time,
+                            user_identifier,
+                        )
+                    await send(message)
 
-                if status_code >= 500:
-                    span.set_status("error", f"Server error: {status_code}")
-                elif status_code >= 400:
-                    span.set_status("error", f"Client error: {status_code}")
-                else:
-                    span.set_status("ok")
-
-                # Note: http.server.requests metric is recorded by PerformanceMonitoringMiddleware
-                # to avoid double-counting. This middleware focuses on logging and span management.
-
-                # Log response with structured fields
-                extra_fields = {
-                    "method": method,
-                    "path": path,
-                    "status_code": status_code,
-                    "duration_ms": duration_ms,
-                    "client_host": client_host,
-                    "user_identifier": user_identifier,
-                }
-
-                if status_code >= 500:
-                    logger.error("Server error response", extra=extra_fields)
-                elif status_code >= 400:
-                    logger.warning("Client error response", extra=extra_fields)
-                else:
-                    logger.info("Request completed", extra=extra_fields)
-
-                return response
+                # Process request
+                await self.app(scope, receive, send_with_request_id)
         finally:
             # Reset context to prevent request ID leaking between requests
             request_id_context.reset(ctx_token)
+
+    def _log_response(
+        self,
+        request: Request,
+        span,
+        route_path: str,
+        status_code: int,
+        start_time: float,
+        user_identifier: str,
+    ) -> None:
+        """
+        Set the span status and log the response.
+
+        Args:
+            request: Incoming request
+            span: Active request span
+            route_path: Route template (or raw path) used for the span
+            status_code: Response status code
+            start_time: Request start time (time.time())
+            user_identifier: Anonymized user identifier for the log line
+        """
+        method = request.method
+        path = str(request.url.path)
+        client_host = request.client.host if request.client else "unknown"
+
+        # Calculate duration in milliseconds
+        duration_ms = round((time.time() - start_time) * 1000, 2)
+
+        # Set span status based on response code
+        span.set_http_attributes(
+            method=method,
+            url=str(request.url),
+            status_code=status_code,
+            route=route_path,
+        )
+
+        if status_code >= 500:
+            span.set_status("error", f"Server error: {status_code}")
+        elif status_code >= 400:
+            span.set_status("error", f"Client error: {status_code}")
+        else:
+            span.set_status("ok")
+
+        # Note: http.server.requests metric is recorded by PerformanceMonitoringMiddleware
+        # to avoid double-counting. This middleware focuses on logging and span management.
+
+        # Log response with structured fields
+        extra_fields = {
+            "method": method,
+            "path": path,
+            "status_code": status_code,
+            "duration_ms": duration_ms,
+            "client_host": client_host,
+            "user_identifier": user_identifier,
+        }
+
+        if status_code >= 500:
+            logger.error("Server error response", extra=extra_fields)
+        elif status_code >= 400:
+            logger.warning("Client error response", extra=extra_fields)
+        else:
+            logger.info("Request completed", extra=extra_fields)
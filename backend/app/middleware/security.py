@@ -1,14 +1,20 @@
 """
 Security middleware for adding security headers and enforcing security policies.
+
+Both middlewares are plain ASGI callables rather than BaseHTTPMiddleware
+subclasses: they act on the ``http.response.start`` message (or reject the
+request up front) without wrapping the downstream app in an extra task and
+response stream.
 """
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
-from typing import Callable
+from typing import List, Tuple
+
+from fastapi import Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+class SecurityHeadersMiddleware:
     """
     Middleware to add security headers to all responses.
 
@@ -38,40 +44,35 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
             hsts_max_age: HSTS max age in seconds
             csp_enabled: Enable Content Security Policy
         """
-        super().__init__(app)
+        self.app = app
         self.hsts_enabled = hsts_enabled
         self.hsts_max_age = hsts_max_age
         self.csp_enabled = csp_enabled
+        # The header set is fixed per instance, so build it once
+        self.security_headers = self._build_headers()
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def _build_headers(self) -> List[Tuple[str, str]]:
         """
-        Process request and add security headers to response.
-
-        Args:
-            request: HTTP request
-            call_next: Next middleware in chain
+        Build the (name, value) pairs added to every response.
 
         Returns:
-            HTTP response with security headers
+            Security headers in the order they are applied
         """
-        response = await call_next(request)
-
-        # X-Frame-Options: Prevent clickjacking
-        response.headers["X-Frame-Options"] = "DENY"
-
-        # X-Content-Type-Options: Prevent MIME type sniffing
-        response.headers["X-Content-Type-Options"] = "nosniff"
-
-        # X-XSS-Protection: Enable XSS filter (for older browsers)
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-
-        # Referrer-Policy: Control referrer information leakage
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-
-        # Permissions-Policy: Control browser features
-        response.headers["Permissions-Policy"] = (
-            "geolocation=(), microphone=(), camera=(), payment=(), usb=()"
-        )
+        headers = [
+            # X-Frame-Options: Prevent clickjacking
+            ("X-Frame-Options", "DENY"),
+            # X-Content-Type-Options: Prevent MIME type sniffing
+            ("X-Content-Type-Options", "nosniff"),
+            # X-XSS-Protection: Enable XSS filter (for older browsers)
+            ("X-XSS-Protection", "1; mode=block"),
+            # Referrer-Policy: Control referrer information leakage
+            ("Referrer-Policy", "strict-origin-when-cross-origin"),
+            # Permissions-Policy: Control browser features
+            (
+                "Permissions-Policy",
+                "geolocation=(), microphone=(), camera=(), payment=(), usb=()",
+            ),
+        ]
 
         # Content-Security-Policy: Control resource loading
         if self.csp_enabled:
@@ -85,21 +86,45 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
                 "frame-ancestors 'none'",
                 "upgrade-insecure-requests",
             ]
-            response.headers["Content-Security-Policy"] = "; ".join(csp_directives)
+            headers.append(("Content-Security-Policy", "; ".join(csp_directives)))
 
         # Strict-Transport-Security: Enforce HTTPS (only in production)
         if self.hsts_enabled:
-            response.headers["Strict-Transport-Security"] = (
-                f"max-age={self.hsts_max_age}; includeSubDomains; preload"
+            headers.append(
+                (
+                    "Strict-Transport-Security",
+                    f"max-age={self.hsts_max_age}; includeSubDomains; preload",
+                )
             )
 
         # X-Permitted-Cross-Domain-Policies: Restrict cross-domain access
-        response.headers["X-Permitted-Cross-Domain-Policies"] = "none"
+        headers.append(("X-Permitted-Cross-Domain-Policies", "none"))
+        return headers
 
-        return response
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Process request and add security headers to the response.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                for name, value in self.security_headers:
+                    headers[name] = value
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
 
 
-class RequestSizeLimitMiddleware(BaseHTTPMiddleware):
+class RequestSizeLimitMiddleware:
     """
     Middleware to enforce maximum request body size limits.
 
@@ -114,28 +139,28 @@ class RequestSizeLimitMiddleware(BaseHTTPMiddleware):
             app: ASGI application
             max_body_size: Maximum request body size in bytes (default: 1MB)
         """
-        super().__init__(app)
+        self.app = app
         self.max_body_size = max_body_size
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Check request body size before processing.
 
         Args:
-            request: HTTP request
-            call_next: Next middleware in chain
-
-        Returns:
-            HTTP response or error if body too large
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
-        # Check Content-Length header if present
-        content_length = request.headers.get("content-length")
-        if content_length and int(content_length) > self.max_body_size:
-            return Response(
-                content='{"detail": "Request body too large"}',
-                status_code=413,
-                media_type="application/json",
-            )
-
-        response = await call_next(request)
-        return response
+        if scope["type"] == "http":
+            # Check Content-Length header if present
+            content_length = Headers(scope=scope).get("content-length")
+            if content_length and int(content_length) > self.max_body_size:
+                response = Response(
+                    content='{"detail": "Request body too large"}',
+                    status_code=413,
+                    media_type="application/json",
+                )
+                await response(scope, receive, send)
+                return
+
+        await self.app(scope, receive, send)
@@ -19,6 +19,8 @@ from .models import (
     Response,
     TestResult,
     ShadowCATResult,
+    PostSubmissionJob,
+    PostSubmissionJobStatus,
     QuestionType,
     DifficultyLevel,
     NotificationType,
@@ -45,6 +47,7 @@ from .group import (
     Group,
     GroupMembership,
     GroupInvite,
+    GroupLeaderboardEntry,
     GroupRole,
 )
 
@@ -63,6 +66,8 @@ __all__ = [
     "Response",
     "TestResult",
     "ShadowCATResult",
+    "PostSubmissionJob",
+    "PostSubmissionJobStatus",
     "QuestionType",
     "DifficultyLevel",
     "NotificationType",
@@ -85,5 +90,6 @@ __all__ = [
     "Group",
     "GroupMembership",
     "GroupInvite",
+    "GroupLeaderboardEntry",
     "GroupRole",
 ]
@@ -8,7 +8,15 @@ import string
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional, List
 
-from sqlalchemy import ForeignKey, String, DateTime, UniqueConstraint, Index
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    ForeignKey,
+    Index,
+    PrimaryKeyConstraint,
+    String,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.datetime_utils import utc_now
@@ -101,3 +109,39 @@ class GroupInvite(Base):
     group: Mapped["Group"] = relationship(back_populates="invites")
     inviter: Mapped["User"] = relationship(foreign_keys=[invited_by])
     acceptor: Mapped[Optional["User"]] = relationship(foreign_keys=[accepted_by])
+
+
+class GroupLeaderboardEntry(Base):
+    """Materialized per-member score aggregates backing the group leaderboard.
+
+    One row per group membership, maintained incrementally by
+    ``app.core.group_leaderboard`` when a member joins or leaves and when a
+    test result is written, so leaderboard reads are index range scans
+    instead of aggregating every member's results per request. Members
+    without results have ``test_count == 0`` and a ``best_score`` of 0.
+    """
+
+    __tablename__ = "group_leaderboard_entries"
+
+    group_id: Mapped[int] = mapped_column(ForeignKey("groups.id", ondelete="CASCADE"))
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
+    best_score: Mapped[int] = mapped_column(default=0)
+    avg_score: Mapped[float] = mapped_column(default=0.0)
+    test_count: Mapped[int] = mapped_column(default=0)
+    # Running total so avg_score can be updated exactly on each new result
+    score_sum: Mapped[int] = mapped_column(BigInteger, default=0)
+
+    __table_args__ = (
+        PrimaryKeyConstraint(
+            "group_id", "user_id", name="pk_group_leaderboard_entries"
+        ),
+        # Serves ranked reads and keyset pagination within a group
+        Index(
+            "ix_group_leaderboard_entries_rank",
+            "group_id",
+            best_score.desc(),
+            "user_id",
+        ),
+        # Serves the fan-out update when a user's new result is recorded
+        Index("ix_group_leaderboard_entries_user_id", "user_id"),
+    )
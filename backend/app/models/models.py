@@ -62,6 +62,7 @@ from sqlalchemy import (
     Index,
     CheckConstraint,
     DateTime,
+    LargeBinary,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import JSON
@@ -397,6 +398,29 @@ class Question(Base):
     # Computed once at question creation time using OpenAI text-embedding-3-small
     # Enables efficient duplicate detection without recomputing embeddings
     # Format: Array of 1536 float values representing semantic meaning
+    # Legacy format: superseded by embedding_vector, kept readable until every
+    # row has been converted by scripts/compact_question_embeddings.py
+
+    # Compact embedding storage
+    # Raw little-endian float32 or int8-quantized bytes (see
+    # app/core/embedding_codec.py), 2x (float32) or 8x (int8) smaller than the
+    # float8[] column and decodable into a NumPy view without materializing
+    # Python floats
+    embedding_vector: Mapped[Optional[bytes]] = mapped_column(
+        LargeBinary, nullable=True
+    )
+    embedding_model: Mapped[Optional[str]] = mapped_column(
+        String(100), nullable=True
+    )  # Model that produced embedding_vector (e.g. "text-embedding-3-small")
+    embedding_dim: Mapped[Optional[int]] = mapped_column(
+        nullable=True
+    )  # Number of components in embedding_vector
+    embedding_encoding: Mapped[Optional[str]] = mapped_column(
+        String(10), nullable=True
+    )  # "float32" or "int8"
+    embedding_scale: Mapped[Optional[float]] = mapped_column(
+        nullable=True
+    )  # int8 dequantization scale (value = int8 * scale); NULL for float32
 
     # Anchor item designation (TASK-850)
     # Curated subset embedded in every test to accumulate IRT calibration data faster.
@@ -508,6 +532,12 @@ class TestSession(Base):
     # Format: [0.0, 0.3, 0.5, 0.45, ...] (List[float])
     # NULL for fixed-form tests (is_adaptive=false)
 
+    exposure_rejected_item_ids: Mapped[Optional[Any]] = mapped_column(
+        JSON, nullable=True
+    )  # Question IDs rejected by the Sympson-Hetter draw (TASK-868)
+    # Excluded from the rest of the session's picks; List[int]
+    # NULL for fixed-form tests and sessions with no rejections
+
     final_theta: Mapped[Optional[float]] = mapped_column(
         nullable=True
     )  # Final theta (ability) estimate at test completion
@@ -524,6 +554,12 @@ class TestSession(Base):
     # Values: "se_threshold", "max_items", "min_items_and_se", "abandoned"
     # NULL for fixed-form tests
 
+    # Response-time histograms (see ResponseTimeHistogramBin)
+    response_times_aggregated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )  # When this session's response times were added to the histograms
+    # NULL until the session is completed and folded in; set exactly once
+
     # Relationships
     user: Mapped["User"] = relationship(back_populates="test_sessions")
     responses: Mapped[List["Response"]] = relationship(
@@ -543,6 +579,13 @@ class TestSession(Base):
         Index("ix_test_sessions_user_status", "user_id", "status"),
         Index("ix_test_sessions_user_completed", "user_id", "completed_at"),
         Index("idx_test_sessions_adaptive", "is_adaptive"),
+        # Finds completed sessions not yet folded into the response-time
+        # histograms; only sessions with no timestamp are indexed
+        Index(
+            "ix_test_sessions_response_times_pending",
+            "status",
+            postgresql_where=sa.text("response_times_aggregated_at IS NULL"),
+        ),
     )
 
 
@@ -787,6 +830,145 @@ class ShadowCATResult(Base):
     )
 
 
+class PostSubmissionJobStatus(str, enum.Enum):
+    """Status enumeration for queued post-submission jobs."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class PostSubmissionJob(Base):
+    """Durable queue entry for a non-scoring post-submission stage.
+
+    When the post-submission pipeline is enabled, ``submit_test`` writes one
+    row per stage (response-time analysis, validity, SEM, statistics updates,
+    shadow CAT) in the same transaction as the TestResult. Worker tasks claim
+    pending rows, run the stage and mark the row completed, retrying failures
+    with backoff up to ``max_attempts``.
+
+    The unique (test_session_id, stage) constraint makes enqueueing idempotent:
+    a session can never have the same stage queued twice.
+    """
+
+    __tablename__ = "post_submission_jobs"
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    test_session_id: Mapped[int] = mapped_column(
+        ForeignKey("test_sessions.id", ondelete="CASCADE")
+    )
+    stage: Mapped[str] = mapped_column(String(50))
+    # Explicit String(20) for the same reason as CalibrationRun.status
+    status: Mapped[PostSubmissionJobStatus] = mapped_column(
+        String(20), default=PostSubmissionJobStatus.PENDING
+    )
+    payload: Mapped[Optional[Any]] = mapped_column(
+        JSON, nullable=True
+    )  # Stage inputs not recoverable from the DB (e.g. correct/total counts)
+    attempts: Mapped[int] = mapped_column(default=0)
+    max_attempts: Mapped[int] = mapped_column(default=5)
+    run_after: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=utc_now
+    )  # Earliest time the job may be claimed (pushed back on retry)
+    locked_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )  # Set when a worker claims the job; stale locks are reclaimed
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=utc_now
+    )
+    completed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "test_session_id", "stage", name="uq_post_submission_jobs_session_stage"
+        ),
+        Index("ix_post_submission_jobs_status_run_after", "status", "run_after"),
+    )
+
+
+class ResponseTimeHistogramBin(Base):
+    """One bin of the persisted response-time histograms (TASK-836).
+
+    Holds the number of responses in completed sessions that took exactly
+    ``time_spent_seconds`` on one question. Response times are whole seconds,
+    so a set of bins is an exact, mergeable sketch of its distribution: the
+    percentile analytics merge these rows under each question's current type
+    and difficulty instead of scanning every response. Keying by question
+    keeps the difficulty breakdowns correct when recalibration relabels a
+    question. Counts are incremented once per session, tracked by
+    TestSession.response_times_aggregated_at.
+    """
+
+    __tablename__ = "response_time_histogram_bins"
+
+    question_id: Mapped[int] = mapped_column(
+        ForeignKey("questions.id", ondelete="CASCADE"), primary_key=True
+    )
+    time_spent_seconds: Mapped[int] = mapped_column(primary_key=True)
+    response_count: Mapped[int] = mapped_column(default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=utc_now, onupdate=utc_now
+    )
+
+
+class CATReadinessAggregate(Base):
+    """Precomputed CAT readiness inputs for one domain (TASK-835).
+
+    Counts the active, normal-quality, IRT-calibrated questions of a question
+    type, classifies them against the SE thresholds recorded on the row, and
+    holds the test information curve of the well-calibrated items on
+    READINESS_THETA_GRID. Kept current by per-question deltas whenever a flush
+    changes a question's calibration, activity or quality flag, and rebuilt
+    from the questions table when missing, stale or built with different
+    thresholds (see app/core/cat/readiness_aggregates.py).
+    """
+
+    __tablename__ = "cat_readiness_aggregates"
+
+    # QuestionType value ("pattern", ...) as a plain string
+    question_type: Mapped[str] = mapped_column(String(20), primary_key=True)
+    total_calibrated: Mapped[int] = mapped_column(default=0)
+    well_calibrated: Mapped[int] = mapped_column(default=0)
+    easy_count: Mapped[int] = mapped_column(default=0)  # IRT b < -1.0
+    medium_count: Mapped[int] = mapped_column(default=0)  # -1.0 <= IRT b <= 1.0
+    hard_count: Mapped[int] = mapped_column(default=0)  # IRT b > 1.0
+    # Calibrated items per SE band label, e.g. {"<=0.2": 12, ">1.0": 1}
+    se_difficulty_bands: Mapped[Any] = mapped_column(JSON)
+    se_discrimination_bands: Mapped[Any] = mapped_column(JSON)
+    # Sum of 2PL item information of the well-calibrated items per grid theta
+    test_information: Mapped[List[float]] = mapped_column(FloatArray())
+    # SE thresholds the well-calibrated counts were classified against
+    max_se_difficulty: Mapped[float] = mapped_column()
+    max_se_discrimination: Mapped[float] = mapped_column()
+    rebuilt_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=utc_now, onupdate=utc_now
+    )
+
+
+class ItemExposureCount(Base):
+    """Fleet-wide CAT selection count for one question (TASK-868).
+
+    Every API worker counts its item selections in memory and adds them here
+    in batches (see app/core/cat/exposure_store.py), so exposure rates and
+    overexposure alerts cover all workers and survive restarts.
+    """
+
+    __tablename__ = "item_exposure_counts"
+
+    question_id: Mapped[int] = mapped_column(
+        ForeignKey("questions.id", ondelete="CASCADE"), primary_key=True
+    )
+    selection_count: Mapped[int] = mapped_column(default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=utc_now, onupdate=utc_now
+    )
+
+
 class QuestionGenerationRun(Base):
     """
     Model for tracking question generation service execution metrics.
@@ -7,10 +7,11 @@ with customizable identifier resolution and response headers.
 
 import logging
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import Request
+from starlette.datastructures import MutableHeaders
 from starlette.responses import JSONResponse
-from typing import Callable, Optional, Awaitable, TypedDict
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from typing import Callable, Optional, TypedDict
 
 from .limiter import RateLimiter
 from app.core.auth.ip_extraction import get_secure_client_ip
@@ -28,7 +29,7 @@ class EndpointLimitConfig(TypedDict):
     window: int
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+class RateLimitMiddleware:
     """
     FastAPI middleware for automatic rate limiting.
 
@@ -36,6 +37,10 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
     Adds rate limit headers to responses.
     Supports per-endpoint rate limit overrides.
 
+    Implemented as a pure ASGI middleware: allowed requests are passed
+    straight to the app and the headers are added to its response start
+    message, without BaseHTTPMiddleware's extra task and response stream.
+
     Example:
         ```python
         from fastapi import FastAPI
@@ -57,7 +62,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         limiter: RateLimiter,
         identifier_resolver: Optional[Callable[[Request], str]] = None,
         skip_paths: Optional[list[str]] = None,
@@ -68,7 +73,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         Initialize rate limit middleware.
 
         Args:
-            app: FastAPI application
+            app: ASGI application
             limiter: RateLimiter instance
             identifier_resolver: Function to extract identifier from request
                                 (default: uses client IP)
@@ -79,29 +84,32 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                            Each endpoint uses a separate rate limit bucket,
                            independent of the default rate limit.
         """
-        super().__init__(app)
+        self.app = app
         self.limiter = limiter
         self.identifier_resolver = identifier_resolver or self._default_identifier
         self.skip_paths = skip_paths or []
         self.add_headers = add_headers
         self.endpoint_limits = endpoint_limits or {}
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process request with rate limiting.
 
         Args:
-            request: Incoming request
-            call_next: Next middleware/handler
-
-        Returns:
-            Response with rate limit headers
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+
         # Check if path should skip rate limiting
         if request.url.path in self.skip_paths:
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         # Resolve identifier
         try:
@@ -113,7 +121,8 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 e,
                 exc_info=True,
             )
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         # Get endpoint-specific limits or use defaults
         path = request.url.path
@@ -139,16 +148,21 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 path=path,
                 limit=metadata.get("limit", 0),
             )
-            return self._rate_limit_response(metadata)
+            await self._rate_limit_response(metadata)(scope, receive, send)
+            return
 
-        # Process request
-        response = await call_next(request)
+        if not self.add_headers:
+            await self.app(scope, receive, send)
+            return
 
-        # Add rate limit headers
-        if self.add_headers:
-            self._add_rate_limit_headers(response, metadata)
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Add rate limit headers
+                self._add_rate_limit_headers(MutableHeaders(scope=message), metadata)
+            await send(message)
 
-        return response
+        # Process request
+        await self.app(scope, receive, send_with_headers)
 
     def _default_identifier(self, request: Request) -> str:
         """
@@ -186,7 +200,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         )
 
         # Add rate limit headers
-        self._add_rate_limit_headers(response, metadata)
+        self._add_rate_limit_headers(response.headers, metadata)
 
         # Add Retry-After header (standard HTTP header)
         retry_after = metadata.get("retry_after", 0)
@@ -195,9 +209,9 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
         return response
 
-    def _add_rate_limit_headers(self, response: Response, metadata: dict) -> None:
+    def _add_rate_limit_headers(self, headers: MutableHeaders, metadata: dict) -> None:
         """
-        Add rate limit headers to response.
+        Add rate limit headers to response headers.
 
         Uses standard RateLimit headers (draft RFC):
         - X-RateLimit-Limit: Request quota
@@ -205,12 +219,12 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         - X-RateLimit-Reset: When quota resets (Unix timestamp)
 
         Args:
-            response: Response to add headers to
+            headers: Response headers to add to
             metadata: Rate limit metadata
         """
-        response.headers["X-RateLimit-Limit"] = str(metadata.get("limit", 0))
-        response.headers["X-RateLimit-Remaining"] = str(metadata.get("remaining", 0))
-        response.headers["X-RateLimit-Reset"] = str(metadata.get("reset_at", 0))
+        headers["X-RateLimit-Limit"] = str(metadata.get("limit", 0))
+        headers["X-RateLimit-Remaining"] = str(metadata.get("remaining", 0))
+        headers["X-RateLimit-Reset"] = str(metadata.get("reset_at", 0))
 
 
 def get_user_identifier(request: Request) -> str:
@@ -6,7 +6,7 @@ the question bank is ready for Computerized Adaptive Testing (CAT).
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -41,6 +41,18 @@ class DomainReadinessResponse(BaseModel):
         default_factory=list,
         description="Reasons domain is not ready (empty if ready)",
     )
+    test_information: List[float] = Field(
+        default_factory=list,
+        description="Test information of the well-calibrated items at each theta_grid point",
+    )
+    se_difficulty_bands: Dict[str, int] = Field(
+        default_factory=dict,
+        description="Calibrated items per SE band of the IRT difficulty parameter",
+    )
+    se_discrimination_bands: Dict[str, int] = Field(
+        default_factory=dict,
+        description="Calibrated items per SE band of the IRT discrimination parameter",
+    )
 
 
 class CATReadinessThresholds(BaseModel):
@@ -78,4 +90,8 @@ class CATReadinessResponse(BaseModel):
     domains: List[DomainReadinessResponse] = Field(
         ..., description="Per-domain readiness breakdown"
     )
+    theta_grid: List[float] = Field(
+        default_factory=list,
+        description="Ability levels the domains' test_information values are given at",
+    )
     summary: str = Field(..., description="Human-readable summary of readiness status")
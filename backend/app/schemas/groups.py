@@ -9,7 +9,6 @@ from pydantic import BaseModel, Field, field_validator
 
 from app.core.validators import StringSanitizer, validate_no_sql_injection
 
-
 # =============================================================================
 # Request Schemas
 # =============================================================================
@@ -178,3 +177,10 @@ class LeaderboardResponse(BaseModel):
         None,
         description="Time window in days used to filter scores (null if all-time)",
     )
+    next_cursor: Optional[str] = Field(
+        None,
+        description=(
+            "Cursor for the next page of the all-time leaderboard "
+            "(null if there are no more entries or days is set)"
+        ),
+    )
@@ -5,7 +5,7 @@ Apple Push Notification Service (APNs) integration for sending push notification
 import asyncio
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
 from aioapns import APNs, NotificationRequest, PushType
 
@@ -21,6 +21,22 @@ logger = logging.getLogger(__name__)
 # 12 hex characters provide sufficient uniqueness while avoiding PII concerns.
 DEVICE_TOKEN_PREFIX_LENGTH = 12
 
+# APNs rejection reasons meaning the device token will never be deliverable
+# again. Tokens rejected with these reasons should be removed from the user.
+# https://developer.apple.com/documentation/usernotifications/handling-notification-responses-from-apns
+INVALID_TOKEN_REASONS = frozenset(
+    {"BadDeviceToken", "Unregistered", "DeviceTokenNotForTopic"}
+)
+
+
+class APNsRejectedError(Exception):
+    """Raised internally when APNs answers a send with a non-success status."""
+
+    def __init__(self, status: str, reason: Optional[str]):
+        self.status = status
+        self.reason = reason
+        super().__init__(f"APNs rejected notification: {status} ({reason})")
+
 
 class APNsService:
     """
@@ -28,6 +44,11 @@ class APNsService:
 
     This service handles the connection to APNs and provides methods for sending
     notifications to iOS devices.
+
+    A connected instance keeps its aioapns client (a pool of multiplexed HTTP/2
+    connections) open until ``disconnect()``, so callers sending many batches
+    should reuse one instance rather than reconnecting per batch, as Apple
+    recommends. Concurrent sends are capped at ``max_concurrent_sends``.
     """
 
     def __init__(
@@ -37,6 +58,7 @@ class APNsService:
         bundle_id: Optional[str] = None,
         key_path: Optional[str] = None,
         use_sandbox: Optional[bool] = None,
+        max_concurrent_sends: Optional[int] = None,
     ):
         """
         Initialize the APNs service.
@@ -47,6 +69,7 @@ class APNsService:
             bundle_id: iOS app bundle identifier. Defaults to settings.APNS_BUNDLE_ID
             key_path: Path to .p8 key file. Defaults to settings.APNS_KEY_PATH
             use_sandbox: Whether to use sandbox APNs server. Defaults to settings.APNS_USE_SANDBOX
+            max_concurrent_sends: Maximum in-flight sends. Defaults to settings.APNS_MAX_CONCURRENT_SENDS
         """
         self.key_id = key_id or settings.APNS_KEY_ID
         self.team_id = team_id or settings.APNS_TEAM_ID
@@ -55,7 +78,13 @@ class APNsService:
         self.use_sandbox = (
             use_sandbox if use_sandbox is not None else settings.APNS_USE_SANDBOX
         )
+        self.max_concurrent_sends = (
+            max_concurrent_sends or settings.APNS_MAX_CONCURRENT_SENDS
+        )
         self._client: Optional[APNs] = None
+        self._send_semaphore: Optional[asyncio.Semaphore] = None
+        # Tokens APNs rejected as permanently undeliverable since the last batch
+        self._invalid_tokens: Set[str] = set()
 
     def _validate_config(self) -> None:
         """
@@ -174,7 +203,15 @@ class APNsService:
             )
 
             # Send the notification
-            await self._client.send_notification(request)
+            if self._send_semaphore is None:
+                self._send_semaphore = asyncio.Semaphore(self.max_concurrent_sends)
+            async with self._send_semaphore:
+                response = await self._client.send_notification(request)
+
+            if response is not None and not response.is_successful:
+                if response.description in INVALID_TOKEN_REASONS:
+                    self._invalid_tokens.add(device_token)
+                raise APNsRejectedError(response.status, response.description)
 
             logger.info(f"Successfully sent notification to device: {token_prefix}...")
 
@@ -231,6 +268,12 @@ class APNsService:
             Dictionary with counts and per-notification results:
             {"success": X, "failed": Y, "per_result": [True, False, ...]}
             per_result[i] corresponds to notifications[i].
+            The result also carries ``invalid_tokens``: device tokens from this
+            batch that APNs rejected as permanently undeliverable.
+
+            At most ``max_concurrent_sends`` notifications are in flight at a
+            time; callers with very large audiences should pass the audience
+            in pages to keep memory flat.
         """
         if not self._client:
             logger.error("APNs client not connected. Call connect() first.")
@@ -238,13 +281,14 @@ class APNsService:
                 "success": 0,
                 "failed": len(notifications),
                 "per_result": [False] * len(notifications),
+                "invalid_tokens": [],
             }
 
         success_count = 0
         failed_count = 0
 
-        # Send notifications concurrently
-        # Individual send_notification calls handle per-notification analytics
+        # Send notifications concurrently; send_notification bounds the number
+        # in flight. Individual calls handle per-notification analytics.
         tasks = []
         for notification in notifications:
             task = self.send_notification(
@@ -270,6 +314,10 @@ class APNsService:
             else:
                 failed_count += 1
 
+        batch_tokens = {notification["device_token"] for notification in notifications}
+        invalid_tokens = sorted(self._invalid_tokens & batch_tokens)
+        self._invalid_tokens -= batch_tokens
+
         logger.info(
             f"Batch notification results: {success_count} succeeded, {failed_count} failed"
         )
@@ -278,6 +326,7 @@ class APNsService:
             "success": success_count,
             "failed": failed_count,
             "per_result": per_result,
+            "invalid_tokens": invalid_tokens,
         }
 
 
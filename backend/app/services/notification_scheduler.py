@@ -4,11 +4,23 @@ test reminder notifications based on the 3-month testing cadence.
 """
 
 import logging
+from contextlib import AsyncExitStack, asynccontextmanager
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
-from sqlalchemy import and_, select
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+from sqlalchemy import Select, and_, exists, null, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.sql import func
+from sqlalchemy.sql import ColumnElement, func
 
 from app.models import User, TestResult
 from app.core.config import settings
@@ -16,6 +28,9 @@ from app.core.datetime_utils import ensure_timezone_aware, utc_now
 from app.models.models import NotificationType
 from app.services.constants import NOTIFICATION_INTERVAL_MONTHS
 
+if TYPE_CHECKING:
+    from app.services.apns_service import APNsService
+
 logger = logging.getLogger(__name__)
 
 # Day 30 reminder configuration
@@ -55,27 +70,19 @@ def generate_deep_link(
     return "aiq://home"
 
 
-async def get_users_due_for_test(
-    db: AsyncSession,
-    notification_window_start: Optional[datetime] = None,
-    notification_window_end: Optional[datetime] = None,
-) -> List[User]:
+def _due_date_range(
+    notification_window_start: Optional[datetime],
+    notification_window_end: Optional[datetime],
+) -> Tuple[datetime, datetime]:
     """
-    Get users who are due for a test notification based on the testing cadence.
-
-    This function identifies users who:
-    1. Have notifications enabled
-    2. Have a registered device token
-    3. Have completed at least one test previously
-    4. Are due for their next test (within the notification window)
+    Translate a notification window into the last-test-date range that makes users due.
 
     Args:
-        db: Async database session
         notification_window_start: Start of notification window (defaults to now - NOTIFICATION_REMINDER_DAYS)
         notification_window_end: End of notification window (defaults to now + NOTIFICATION_ADVANCE_DAYS)
 
     Returns:
-        List of User objects who should receive notifications
+        (due_date_start, due_date_end) bounds for a user's last test completion
     """
     now = utc_now()
 
@@ -99,6 +106,48 @@ async def get_users_due_for_test(
         days=settings.TEST_CADENCE_DAYS
     )
     due_date_end = notification_window_end - timedelta(days=settings.TEST_CADENCE_DAYS)
+    return due_date_start, due_date_end
+
+
+def _day_30_date_range() -> Tuple[datetime, datetime]:
+    """Return the first-test-date range that makes users eligible for the Day 30 reminder."""
+    now = utc_now()
+
+    # We want users whose first test was completed 30 days ago (±1 day tolerance)
+    target_date_start = now - timedelta(
+        days=DAY_30_REMINDER_DAYS + DAY_30_NOTIFICATION_WINDOW_DAYS
+    )
+    target_date_end = now - timedelta(
+        days=DAY_30_REMINDER_DAYS - DAY_30_NOTIFICATION_WINDOW_DAYS
+    )
+    return target_date_start, target_date_end
+
+
+async def get_users_due_for_test(
+    db: AsyncSession,
+    notification_window_start: Optional[datetime] = None,
+    notification_window_end: Optional[datetime] = None,
+) -> List[User]:
+    """
+    Get users who are due for a test notification based on the testing cadence.
+
+    This function identifies users who:
+    1. Have notifications enabled
+    2. Have a registered device token
+    3. Have completed at least one test previously
+    4. Are due for their next test (within the notification window)
+
+    Args:
+        db: Async database session
+        notification_window_start: Start of notification window (defaults to now - NOTIFICATION_REMINDER_DAYS)
+        notification_window_end: End of notification window (defaults to now + NOTIFICATION_ADVANCE_DAYS)
+
+    Returns:
+        List of User objects who should receive notifications
+    """
+    due_date_start, due_date_end = _due_date_range(
+        notification_window_start, notification_window_end
+    )
 
     # Subquery to get the most recent test completion date for each user
     latest_test_subquery = (
@@ -185,16 +234,8 @@ async def get_users_for_day_30_reminder(db: AsyncSession) -> List[User]:
     Returns:
         List of User objects who should receive Day 30 reminder notifications
     """
-    now = utc_now()
-
     # Calculate the target date range for first test completion
-    # We want users whose first test was completed 30 days ago (±1 day tolerance)
-    target_date_start = now - timedelta(
-        days=DAY_30_REMINDER_DAYS + DAY_30_NOTIFICATION_WINDOW_DAYS
-    )
-    target_date_end = now - timedelta(
-        days=DAY_30_REMINDER_DAYS - DAY_30_NOTIFICATION_WINDOW_DAYS
-    )
+    target_date_start, target_date_end = _day_30_date_range()
 
     # Subquery to get the first test completion date and test count for each user
     first_test_subquery = (
@@ -237,18 +278,246 @@ async def get_users_for_day_30_reminder(db: AsyncSession) -> List[User]:
     return list(result.scalars().all())
 
 
+class NotificationTarget(NamedTuple):
+    """Narrow row describing one notification recipient.
+
+    ``result_id`` is the test result the notification deep-links to: the
+    latest result for test reminders, the first result for Day 30 reminders,
+    and None for users who have never tested.
+    """
+
+    user_id: int
+    device_token: str
+    first_name: Optional[str]
+    result_id: Optional[int]
+
+
+def _notifiable_user_filters(after_user_id: int) -> List[ColumnElement[bool]]:
+    """Filters shared by every recipient query, plus the keyset cursor."""
+    return [
+        User.id > after_user_id,
+        User.notification_enabled.is_(True),
+        User.apns_device_token.isnot(None),
+        User.apns_device_token != "",
+    ]
+
+
+async def _iter_target_pages(
+    db: AsyncSession,
+    build_page_query: Callable[[int], Select[Any]],
+    chunk_size: int,
+) -> AsyncIterator[List[NotificationTarget]]:
+    """
+    Keyset-page a recipient query that already applies every filter in SQL.
+
+    ``build_page_query`` receives the last user id of the previous page and
+    returns a query selecting ``(user_id, device_token, first_name,
+    result_id)`` for matching users after it. Only users that will actually
+    be notified cross the wire, so a run costs one round trip per
+    ``chunk_size`` recipients rather than per ``chunk_size`` notifiable users.
+    """
+    after_user_id = 0
+    while True:
+        stmt = build_page_query(after_user_id).order_by(User.id).limit(chunk_size)
+        rows = (await db.execute(stmt)).all()
+        if not rows:
+            return
+        yield [NotificationTarget(*row) for row in rows]
+        if len(rows) < chunk_size:
+            return
+        after_user_id = rows[-1].user_id
+
+
+def _target_columns(result_id: ColumnElement[Any]) -> Tuple[ColumnElement[Any], ...]:
+    return (
+        User.id.label("user_id"),
+        User.apns_device_token.label("device_token"),
+        User.first_name.label("first_name"),
+        result_id.label("result_id"),
+    )
+
+
+async def iter_users_due_for_test(
+    db: AsyncSession,
+    notification_window_start: Optional[datetime] = None,
+    notification_window_end: Optional[datetime] = None,
+    chunk_size: Optional[int] = None,
+) -> AsyncIterator[List[NotificationTarget]]:
+    """
+    Stream users due for a test reminder as chunks of NotificationTarget rows.
+
+    Same selection as ``get_users_due_for_test``, but keyset-paginated over
+    users and without loading ORM objects, so memory stays flat regardless of
+    the user count. ``result_id`` is the user's latest test result.
+
+    Args:
+        db: Async database session
+        notification_window_start: Start of notification window
+        notification_window_end: End of notification window
+        chunk_size: Users returned per query (defaults to NOTIFICATION_SEND_BATCH_SIZE)
+
+    Yields:
+        Non-empty lists of NotificationTarget rows
+    """
+    due_date_start, due_date_end = _due_date_range(
+        notification_window_start, notification_window_end
+    )
+
+    def build_page_query(after_user_id: int) -> Select[Any]:
+        latest_test = (
+            select(
+                TestResult.user_id,
+                func.max(TestResult.id).label("latest_result_id"),
+            )
+            .where(TestResult.user_id > after_user_id)
+            .group_by(TestResult.user_id)
+            .having(
+                func.max(TestResult.completed_at).between(due_date_start, due_date_end)
+            )
+            .subquery()
+        )
+        return (
+            select(*_target_columns(latest_test.c.latest_result_id))
+            .join(latest_test, User.id == latest_test.c.user_id)
+            .where(
+                and_(
+                    *_notifiable_user_filters(after_user_id),
+                    # Bypass users are not subject to cadence and don't need reminders
+                    User.bypass_cooldown.is_(False),
+                )
+            )
+        )
+
+    async for chunk in _iter_target_pages(
+        db, build_page_query, chunk_size or settings.NOTIFICATION_SEND_BATCH_SIZE
+    ):
+        yield chunk
+
+
+async def iter_users_never_tested(
+    db: AsyncSession, chunk_size: Optional[int] = None
+) -> AsyncIterator[List[NotificationTarget]]:
+    """
+    Stream notifiable users who have never completed a test.
+
+    Streaming counterpart of ``get_users_never_tested``; ``result_id`` is None.
+    """
+
+    def build_page_query(after_user_id: int) -> Select[Any]:
+        return select(*_target_columns(null())).where(
+            and_(
+                *_notifiable_user_filters(after_user_id),
+                ~exists().where(TestResult.user_id == User.id),
+            )
+        )
+
+    async for chunk in _iter_target_pages(
+        db, build_page_query, chunk_size or settings.NOTIFICATION_SEND_BATCH_SIZE
+    ):
+        yield chunk
+
+
+async def iter_users_for_day_30_reminder(
+    db: AsyncSession, chunk_size: Optional[int] = None
+) -> AsyncIterator[List[NotificationTarget]]:
+    """
+    Stream users eligible for the Day 30 reminder.
+
+    Streaming counterpart of ``get_users_for_day_30_reminder``; ``result_id``
+    is the user's first (and only) test result.
+    """
+    target_date_start, target_date_end = _day_30_date_range()
+
+    def build_page_query(after_user_id: int) -> Select[Any]:
+        first_test = (
+            select(
+                TestResult.user_id,
+                func.min(TestResult.id).label("first_result_id"),
+            )
+            .where(TestResult.user_id > after_user_id)
+            .group_by(TestResult.user_id)
+            .having(
+                and_(
+                    func.count(TestResult.id) == 1,
+                    func.min(TestResult.completed_at).between(
+                        target_date_start, target_date_end
+                    ),
+                )
+            )
+            .subquery()
+        )
+        return (
+            select(*_target_columns(first_test.c.first_result_id))
+            .join(first_test, User.id == first_test.c.user_id)
+            .where(
+                and_(
+                    *_notifiable_user_filters(after_user_id),
+                    # Deduplication: skip users who already received a Day 30 reminder
+                    User.day_30_reminder_sent_at.is_(None),
+                )
+            )
+        )
+
+    async for chunk in _iter_target_pages(
+        db, build_page_query, chunk_size or settings.NOTIFICATION_SEND_BATCH_SIZE
+    ):
+        yield chunk
+
+
+async def clear_invalid_device_tokens(db: AsyncSession, tokens: Iterable[str]) -> int:
+    """
+    Remove device tokens that APNs reported as permanently undeliverable.
+
+    Clears ``apns_device_token`` for every user holding one of the tokens in a
+    single UPDATE, so later runs stop sending to dead devices. The user can
+    re-register a token from the app at any time.
+
+    Args:
+        db: Async database session
+        tokens: Device tokens APNs rejected (BadDeviceToken, Unregistered, ...)
+
+    Returns:
+        Number of users whose token was cleared
+    """
+    token_list = list(tokens)
+    if not token_list:
+        return 0
+
+    result = await db.execute(
+        update(User)
+        .where(User.apns_device_token.in_(token_list))
+        .values(apns_device_token=None)
+    )
+    await db.commit()
+
+    cleared = result.rowcount or 0
+    if cleared:
+        logger.info("Cleared %d invalid APNs device tokens", cleared)
+    return cleared
+
+
 class NotificationScheduler:
     """Service class for managing notification scheduling logic.
 
     This class provides methods to identify users who should receive
     notifications and schedule them appropriately.
 
-    **APNsService session lifecycle:** Each send method (``send_notifications_to_users``,
-    ``send_day_30_reminder_notifications``) creates its own short-lived ``APNsService``
-    instance, connects, sends a batch, and disconnects in a ``try … finally`` block.
-    Callers do **not** need to manage the APNs connection — the scheduler handles it
-    internally.  If the connection or batch send raises, the ``finally`` block still
-    disconnects, and the exception propagates to the caller.
+    **APNsService session lifecycle:** Callers that run several send methods
+    (e.g. the notifications cron) should pass one connected ``APNsService`` to
+    the constructor; every send method then reuses its persistent HTTP/2
+    connection and the caller disconnects it when done.  Without one, each
+    send method (``send_notifications_to_users``,
+    ``send_day_30_reminder_notifications``) creates its own ``APNsService``,
+    connects, sends, and disconnects in a ``try … finally`` block.  If the
+    connection or a batch send raises, the service is still disconnected and
+    the exception propagates to the caller.
+
+    **Paging:** Recipients are streamed as narrow ``NotificationTarget`` rows,
+    one keyset page of ``NOTIFICATION_SEND_BATCH_SIZE`` users per query (see
+    ``iter_users_due_for_test``), so send memory is independent of the user
+    count.  Each page is one ``send_batch_notifications`` call (itself capped at
+    ``APNS_MAX_CONCURRENT_SENDS`` in flight), followed by a bulk clear of any
+    device tokens APNs reported as permanently invalid.
 
     **Retry expectations:** Neither send method retries on failure.  For Day 30
     reminders, users whose sends fail keep ``day_30_reminder_sent_at = NULL`` and
@@ -259,14 +528,17 @@ class NotificationScheduler:
     notification window.  No notification is retried indefinitely.
     """
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, apns_service: Optional["APNsService"] = None):
         """
         Initialize the notification scheduler.
 
         Args:
             db: Async database session
+            apns_service: Optional already-connected APNsService shared by all
+                send methods. The caller owns its connection lifecycle.
         """
         self.db = db
+        self._apns_service = apns_service
 
     async def get_users_to_notify(
         self,
@@ -347,107 +619,138 @@ class NotificationScheduler:
         # Check if the next test date has passed
         return utc_now() >= next_test_date
 
-    async def send_notifications_to_users(
+    @asynccontextmanager
+    async def _apns_session(self) -> AsyncIterator["APNsService"]:
+        """Yield a connected APNsService for one send method.
+
+        Reuses the shared service passed to the constructor when there is one
+        (the caller owns its connection); otherwise connects a fresh service
+        and disconnects it afterwards.
+        """
+        from app.services.apns_service import APNsService
+
+        if self._apns_service is not None:
+            yield self._apns_service
+            return
+
+        apns_service = APNsService()
+        try:
+            await apns_service.connect()
+            yield apns_service
+        finally:
+            await apns_service.disconnect()
+
+    async def iter_targets_to_notify(
         self,
         include_never_tested: bool = False,
         notification_window_start: Optional[datetime] = None,
         notification_window_end: Optional[datetime] = None,
-    ) -> Dict[str, int]:
+    ) -> AsyncIterator[List[NotificationTarget]]:
         """
-        Send test reminder notifications to all users who are due.
-
-        This method:
-        1. Identifies users who should receive notifications
-        2. Sends push notifications to their devices via APNs
-        3. Returns a summary of the results
+        Stream the recipients ``get_users_to_notify`` would return, in chunks.
 
         Args:
             include_never_tested: Whether to include users who have never taken a test
             notification_window_start: Start of notification window
             notification_window_end: End of notification window
 
-        Returns:
-            Dictionary with counts: {"total": X, "success": Y, "failed": Z}
+        Yields:
+            Non-empty lists of NotificationTarget rows
         """
-        from app.services.apns_service import APNsService
-
-        # Get users who should receive notifications
-        users_to_notify = await self.get_users_to_notify(
-            include_never_tested=include_never_tested,
+        async for chunk in iter_users_due_for_test(
+            self.db,
             notification_window_start=notification_window_start,
             notification_window_end=notification_window_end,
-        )
-
-        if not users_to_notify:
-            return {"total": 0, "success": 0, "failed": 0}
+        ):
+            yield chunk
 
-        # Get the latest test result ID for each user to include in deep links
-        user_ids = [user.id for user in users_to_notify]
-        stmt = (
-            select(
-                TestResult.user_id,
-                func.max(TestResult.id).label("latest_result_id"),
-            )
-            .where(TestResult.user_id.in_(user_ids))
-            .group_by(TestResult.user_id)
-        )
-        result = await self.db.execute(stmt)
-        user_to_latest_result = {row.user_id: row.latest_result_id for row in result}
+        if include_never_tested:
+            async for chunk in iter_users_never_tested(self.db):
+                yield chunk
 
-        # Build notification payloads
-        notifications = []
-        for user in users_to_notify:
-            if not user.apns_device_token:
-                continue
+    async def send_notifications_to_users(
+        self,
+        include_never_tested: bool = False,
+        notification_window_start: Optional[datetime] = None,
+        notification_window_end: Optional[datetime] = None,
+    ) -> Dict[str, int]:
+        """
+        Send test reminder notifications to all users who are due.
 
-            title = "Ready for Your Next AIQ Test?"
-            body = f"Hi {user.first_name}, it's been {NOTIFICATION_INTERVAL_MONTHS} months! Ready to track your cognitive progress?"
+        This method:
+        1. Streams users who should receive notifications, one keyset page of
+           ``NOTIFICATION_SEND_BATCH_SIZE`` narrow rows at a time
+        2. Sends each page as one batch over a single APNs connection
+        3. Clears device tokens APNs reports as permanently invalid
+        4. Returns a summary of the results
 
-            # Generate deep link to user's last test result
-            latest_result_id = user_to_latest_result.get(user.id)
-            deep_link = generate_deep_link(
-                NotificationType.TEST_REMINDER, latest_result_id
-            )
+        Args:
+            include_never_tested: Whether to include users who have never taken a test
+            notification_window_start: Start of notification window
+            notification_window_end: End of notification window
 
-            notifications.append(
-                {
-                    "device_token": user.apns_device_token,
-                    "title": title,
-                    "body": body,
-                    "badge": 1,
-                    "data": {
-                        "type": NotificationType.TEST_REMINDER.value,
-                        "user_id": str(user.id),
-                        "deep_link": deep_link,
-                    },
-                    "user_id": user.id,
-                }
-            )
+        Returns:
+            Dictionary with counts: {"total": X, "success": Y, "failed": Z}
+        """
+        totals = {"total": 0, "success": 0, "failed": 0}
+
+        async with AsyncExitStack() as stack:
+            apns_service: Optional["APNsService"] = None
+            async for chunk in self.iter_targets_to_notify(
+                include_never_tested=include_never_tested,
+                notification_window_start=notification_window_start,
+                notification_window_end=notification_window_end,
+            ):
+                # Connect on the first page so runs with nobody to notify
+                # never touch APNs
+                if apns_service is None:
+                    apns_service = await stack.enter_async_context(self._apns_session())
+
+                # Build notification payloads
+                notifications = []
+                for target in chunk:
+                    title = "Ready for Your Next AIQ Test?"
+                    body = f"Hi {target.first_name}, it's been {NOTIFICATION_INTERVAL_MONTHS} months! Ready to track your cognitive progress?"
+
+                    # Generate deep link to user's last test result
+                    deep_link = generate_deep_link(
+                        NotificationType.TEST_REMINDER, target.result_id
+                    )
+
+                    notifications.append(
+                        {
+                            "device_token": target.device_token,
+                            "title": title,
+                            "body": body,
+                            "badge": 1,
+                            "data": {
+                                "type": NotificationType.TEST_REMINDER.value,
+                                "user_id": str(target.user_id),
+                                "deep_link": deep_link,
+                            },
+                            "user_id": target.user_id,
+                        }
+                    )
+
+                results = await apns_service.send_batch_notifications(
+                    notifications, notification_type=NotificationType.TEST_REMINDER
+                )
+                totals["total"] += len(notifications)
+                totals["success"] += results["success"]
+                totals["failed"] += results["failed"]
+                await clear_invalid_device_tokens(
+                    self.db, results.get("invalid_tokens", [])
+                )
 
-        # Send notifications via APNs
-        apns_service = APNsService()
-        try:
-            await apns_service.connect()
-            results = await apns_service.send_batch_notifications(
-                notifications, notification_type=NotificationType.TEST_REMINDER
+        if totals["failed"] > 0:
+            logger.warning(
+                "Test reminder batch had failures: sent=%d, success=%d, failed=%d",
+                totals["total"],
+                totals["success"],
+                totals["failed"],
             )
 
-            if results["failed"] > 0:
-                logger.warning(
-                    "Test reminder batch had failures: "
-                    "sent=%d, success=%d, failed=%d",
-                    len(notifications),
-                    results["success"],
-                    results["failed"],
-                )
-
-            return {
-                "total": len(notifications),
-                "success": results["success"],
-                "failed": results["failed"],
-            }
-        finally:
-            await apns_service.disconnect()
+        return totals
 
     async def send_day_30_reminder_notifications(self) -> Dict[str, int]:
         """
@@ -464,116 +767,90 @@ class NotificationScheduler:
 
         After sending, only users whose notifications were delivered successfully
         are marked with day_30_reminder_sent_at. Users whose sends failed remain
-        eligible for retry on the next scheduled run.
+        eligible for retry on the next scheduled run. Users are streamed, sent
+        to and marked one keyset page of ``NOTIFICATION_SEND_BATCH_SIZE`` at a
+        time, so an interrupted run keeps the marks for the pages it finished.
 
         Returns:
             Dictionary with counts: {"total": X, "success": Y, "failed": Z, "users_found": N}
         """
-        from app.services.apns_service import APNsService
-
-        # Get users who should receive Day 30 reminders
-        users_to_notify = await get_users_for_day_30_reminder(self.db)
-
-        if not users_to_notify:
-            return {"total": 0, "success": 0, "failed": 0, "users_found": 0}
-
-        # Get the first (and only) test result ID for each user to include in deep links
-        user_ids = [user.id for user in users_to_notify]
-        stmt = (
-            select(
-                TestResult.user_id,
-                func.min(TestResult.id).label("first_result_id"),
-            )
-            .where(TestResult.user_id.in_(user_ids))
-            .group_by(TestResult.user_id)
-        )
-        result = await self.db.execute(stmt)
-        user_to_first_result = {row.user_id: row.first_result_id for row in result}
-
-        # Build notification payloads for Day 30 reminder
-        # Keep track of user_id -> notification mapping for deduplication marking
-        notifications = []
-        user_id_to_notification_index: Dict[int, int] = {}
-
-        for user in users_to_notify:
-            if not user.apns_device_token:
-                continue
-
-            # Personalize if we have the user's name
-            first_name = user.first_name or "there"
-
-            title = "Your Cognitive Journey Continues"
-            body = f"Hi {first_name}! It's been 30 days since your first test. Your next test is in 60 days."
-
-            # Generate deep link to user's first test result
-            first_result_id = user_to_first_result.get(user.id)
-            deep_link = generate_deep_link(
-                NotificationType.DAY_30_REMINDER, first_result_id
-            )
-
-            user_id_to_notification_index[user.id] = len(notifications)
-            notifications.append(
-                {
-                    "device_token": user.apns_device_token,
-                    "title": title,
-                    "body": body,
-                    # No badge for silent/provisional notifications
-                    "badge": None,
-                    # No sound for provisional notifications (silent delivery)
-                    "sound": None,
-                    "data": {
-                        "type": NotificationType.DAY_30_REMINDER.value,
-                        "user_id": str(user.id),
-                        "days_since_first_test": 30,
-                        "days_until_next_test": 60,
-                        "deep_link": deep_link,
-                    },
-                    "user_id": user.id,
-                }
-            )
-
-        if not notifications:
-            return {
-                "total": 0,
-                "success": 0,
-                "failed": 0,
-                "users_found": len(users_to_notify),
-            }
+        totals = {"total": 0, "success": 0, "failed": 0, "users_found": 0}
+
+        async with AsyncExitStack() as stack:
+            apns_service: Optional["APNsService"] = None
+            async for chunk in iter_users_for_day_30_reminder(self.db):
+                totals["users_found"] += len(chunk)
+                if apns_service is None:
+                    apns_service = await stack.enter_async_context(self._apns_session())
+
+                # Build notification payloads for Day 30 reminder
+                notifications = []
+                for target in chunk:
+                    # Personalize if we have the user's name
+                    first_name = target.first_name or "there"
+
+                    title = "Your Cognitive Journey Continues"
+                    body = f"Hi {first_name}! It's been 30 days since your first test. Your next test is in 60 days."
+
+                    # Generate deep link to user's first test result
+                    deep_link = generate_deep_link(
+                        NotificationType.DAY_30_REMINDER, target.result_id
+                    )
+
+                    notifications.append(
+                        {
+                            "device_token": target.device_token,
+                            "title": title,
+                            "body": body,
+                            # No badge for silent/provisional notifications
+                            "badge": None,
+                            # No sound for provisional notifications (silent delivery)
+                            "sound": None,
+                            "data": {
+                                "type": NotificationType.DAY_30_REMINDER.value,
+                                "user_id": str(target.user_id),
+                                "days_since_first_test": 30,
+                                "days_until_next_test": 60,
+                                "deep_link": deep_link,
+                            },
+                            "user_id": target.user_id,
+                        }
+                    )
+
+                results = await apns_service.send_batch_notifications(
+                    notifications, notification_type=NotificationType.DAY_30_REMINDER
+                )
+                totals["total"] += len(notifications)
+                totals["success"] += results["success"]
+                totals["failed"] += results["failed"]
+
+                # Only mark users whose sends actually succeeded.
+                # Failed users keep day_30_reminder_sent_at = None so they
+                # remain eligible on the next scheduled run.
+                per_result = results.get("per_result", [])
+                sent_user_ids = [
+                    target.user_id
+                    for target, succeeded in zip(chunk, per_result)
+                    if succeeded
+                ]
+                if sent_user_ids:
+                    await self.db.execute(
+                        update(User)
+                        .where(User.id.in_(sent_user_ids))
+                        .values(day_30_reminder_sent_at=utc_now())
+                    )
+                    await self.db.commit()
+
+                await clear_invalid_device_tokens(
+                    self.db, results.get("invalid_tokens", [])
+                )
 
-        # Send notifications via APNs
-        apns_service = APNsService()
-        try:
-            await apns_service.connect()
-            results = await apns_service.send_batch_notifications(
-                notifications, notification_type=NotificationType.DAY_30_REMINDER
+        if totals["failed"] > 0:
+            logger.warning(
+                "Day 30 reminder batch had failures: sent=%d, success=%d, failed=%d",
+                totals["total"],
+                totals["success"],
+                totals["failed"],
             )
 
-            per_result = results.get("per_result", [])
-
-            if results["failed"] > 0:
-                logger.warning(
-                    "Day 30 reminder batch had failures: "
-                    "sent=%d, success=%d, failed=%d",
-                    len(notifications),
-                    results["success"],
-                    results["failed"],
-                )
-
-            # Only mark users whose sends actually succeeded.
-            # Failed users keep day_30_reminder_sent_at = None so they
-            # remain eligible on the next scheduled run.
-            now = utc_now()
-            for user in users_to_notify:
-                idx = user_id_to_notification_index.get(user.id)
-                if idx is not None and idx < len(per_result) and per_result[idx]:
-                    user.day_30_reminder_sent_at = now
-            await self.db.commit()
-
-            return {
-                "total": len(notifications),
-                "success": results["success"],
-                "failed": results["failed"],
-                "users_found": len(users_to_notify),
-            }
-        finally:
-            await apns_service.disconnect()
+        return totals
@@ -0,0 +1,173 @@
+"""Micro-benchmark of per-request middleware overhead.
+
+Drives three versions of a trivial FastAPI app directly through the ASGI
+interface (no network, no server) and reports the mean and p50/p99 time per
+request:
+
+    bare    - no middleware
+    asgi    - the production middleware stack from app/main.py (request
+              logging, performance monitoring, security headers, request size
+              limit and rate limiting), all pure ASGI
+    legacy  - the same stack with every layer behind a BaseHTTPMiddleware
+              dispatch, which is the per-layer task and response-streaming
+              shim the stack paid before it was converted
+
+The difference between asgi and legacy is the overhead the conversion removed;
+the difference between bare and asgi is what the middlewares themselves cost.
+
+Usage:
+    python scripts/benchmark_middleware.py [--requests N] [--warmup N]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List
+
+from fastapi import FastAPI
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.middleware import (  # noqa: E402
+    PerformanceMonitoringMiddleware,
+    RequestLoggingMiddleware,
+    RequestSizeLimitMiddleware,
+    SecurityHeadersMiddleware,
+)
+from app.ratelimit import (  # noqa: E402
+    InMemoryStorage,
+    RateLimiter,
+    RateLimitMiddleware,
+)
+
+
+async def _passthrough(request, call_next):
+    return await call_next(request)
+
+
+def build_app(with_middleware: bool, legacy_dispatch: bool = False) -> FastAPI:
+    """Build a one-route app with the main.py middleware stack.
+
+    Args:
+        with_middleware: Install the middleware stack
+        legacy_dispatch: Put a BaseHTTPMiddleware dispatch in front of every
+            middleware layer, reproducing the pre-conversion overhead
+    """
+    app = FastAPI()
+
+    @app.get("/v1/ping")
+    async def ping():
+        return {"status": "ok"}
+
+    if not with_middleware:
+        return app
+
+    limiter = RateLimiter(
+        storage=InMemoryStorage(), default_limit=10**9, default_window=60
+    )
+    # Same order as create_application(): the last one added is outermost
+    stack: List[tuple] = [
+        (RequestLoggingMiddleware, {}),
+        (PerformanceMonitoringMiddleware, {"slow_request_threshold": 1.0}),
+        (SecurityHeadersMiddleware, {"hsts_enabled": True}),
+        (RequestSizeLimitMiddleware, {"max_body_size": 1024 * 1024}),
+        (RateLimitMiddleware, {"limiter": limiter}),
+    ]
+    for middleware_cls, options in stack:
+        app.add_middleware(middleware_cls, **options)
+        if legacy_dispatch:
+            app.add_middleware(BaseHTTPMiddleware, dispatch=_passthrough)
+    return app
+
+
+def _scope() -> Dict:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/v1/ping",
+        "raw_path": b"/v1/ping",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [
+            (b"host", b"testserver"),
+            (b"authorization", b"Bearer benchmark-token"),
+        ],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+
+
+async def _request(app: ASGIApp) -> int:
+    status = 0
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(_scope(), receive, send)
+    return status
+
+
+async def measure(app: ASGIApp, requests: int, warmup: int) -> List[float]:
+    """Return per-request latencies in microseconds."""
+    for _ in range(warmup):
+        assert await _request(app) == 200
+    timings = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        await _request(app)
+        timings.append((time.perf_counter() - start) * 1e6)
+    return timings
+
+
+def _percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def main():
+    """Main entry point for the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark middleware overhead")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--warmup", type=int, default=500)
+    args = parser.parse_args()
+
+    # Keep log output out of the measurement
+    logging.basicConfig(level=logging.ERROR)
+
+    variants: Dict[str, Callable[[], FastAPI]] = {
+        "bare": lambda: build_app(with_middleware=False),
+        "asgi": lambda: build_app(with_middleware=True),
+        "legacy": lambda: build_app(with_middleware=True, legacy_dispatch=True),
+    }
+    results = {}
+    for name, factory in variants.items():
+        timings = asyncio.run(measure(factory(), args.requests, args.warmup))
+        results[name] = timings
+
+    print(f"{'stack':<8} {'mean_us':>10} {'p50_us':>10} {'p99_us':>10}")
+    for name, timings in results.items():
+        print(
+            f"{name:<8} {statistics.fmean(timings):>10.1f} "
+            f"{_percentile(timings, 0.5):>10.1f} {_percentile(timings, 0.99):>10.1f}"
+        )
+    saved = statistics.median(results["legacy"]) - statistics.median(results["asgi"])
+    print(f"\np50 overhead removed per request: {saved:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
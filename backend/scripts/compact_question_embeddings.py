@@ -0,0 +1,184 @@
+"""Convert legacy float8[] question embeddings to the compact binary format.
+
+Rewrites questions.question_embedding (an array of 1536 double-precision
+values) into questions.embedding_vector as packed float32 or int8-quantized
+bytes, recording the model name, dimension, encoding and scale alongside.
+See app/core/embedding_codec.py for the format.
+
+Usage:
+    python scripts/compact_question_embeddings.py [--encoding {float32,int8}]
+                                                  [--batch-size N]
+                                                  [--clear-legacy] [--dry-run]
+
+Requirements:
+    - DATABASE_URL environment variable must be set
+    - Alembic migration c3a9d5e17f42 must be applied first
+
+Safety Features:
+    - Keyset pagination on questions.id; an interrupted run resumes where it
+      stopped because converted rows no longer match the filter
+    - One commit per batch, so no long-lived transaction
+    - The legacy column is only cleared with --clear-legacy; a clearing run
+      also visits rows converted by an earlier run and only nulls their
+      legacy column, leaving the existing embedding_vector untouched
+
+Performance:
+    - One SELECT and one executemany UPDATE per batch; no embedding API calls
+"""
+
+import argparse
+import logging
+import os
+import sys
+from typing import Any, Dict, List
+
+from sqlalchemy import create_engine, select, update
+from sqlalchemy.orm import Session, sessionmaker
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.core.embedding_codec import (  # noqa: E402
+    EMBEDDING_ENCODING_FLOAT32,
+    EMBEDDING_ENCODINGS,
+    encode_embedding,
+    legacy_embedding_model,
+)
+from app.models.models import Question  # noqa: E402
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 500
+
+
+def compact_batch(
+    session: Session,
+    after_id: int,
+    batch_size: int,
+    encoding: str,
+    clear_legacy: bool,
+    dry_run: bool,
+) -> List[int]:
+    """Convert the next batch of legacy embeddings after ``after_id``.
+
+    Without ``clear_legacy`` only unconverted rows are visited. With it, every
+    row still holding a legacy embedding is visited so rows converted by an
+    earlier run get their legacy column cleared too.
+
+    Returns:
+        IDs of the questions in the batch (empty when none remain)
+    """
+    filters = [Question.id > after_id, Question.question_embedding.isnot(None)]
+    if not clear_legacy:
+        filters.append(Question.embedding_vector.is_(None))
+    rows = session.execute(
+        select(
+            Question.id,
+            Question.question_embedding,
+            Question.embedding_vector.isnot(None).label("converted"),
+        )
+        .where(*filters)
+        .order_by(Question.id)
+        .limit(batch_size)
+    ).all()
+    if not rows:
+        return []
+
+    params: List[Dict[str, Any]] = []
+    for question_id, legacy, converted in rows:
+        values: Dict[str, Any] = {"id": question_id}
+        if legacy and not converted:
+            encoded = encode_embedding(
+                legacy, legacy_embedding_model(len(legacy)), encoding=encoding
+            )
+            values.update(encoded.column_values())
+        if clear_legacy:
+            values["question_embedding"] = None
+        if len(values) > 1:
+            params.append(values)
+
+    if params and not dry_run:
+        session.execute(update(Question), params)
+        session.commit()
+    return [row.id for row in rows]
+
+
+def main():
+    """Main entry point for the compaction script."""
+    parser = argparse.ArgumentParser(
+        description="Convert legacy question embeddings to compact binary storage"
+    )
+    parser.add_argument(
+        "--encoding",
+        choices=EMBEDDING_ENCODINGS,
+        default=EMBEDDING_ENCODING_FLOAT32,
+        help="Storage encoding (default: float32; int8 is 4x smaller again)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Questions per batch (default: {DEFAULT_BATCH_SIZE})",
+    )
+    parser.add_argument(
+        "--clear-legacy",
+        action="store_true",
+        help="Set question_embedding to NULL once a row is converted",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Preview changes without modifying database",
+    )
+
+    args = parser.parse_args()
+
+    database_url = os.environ.get("DATABASE_URL")
+    if not database_url:
+        logger.error("DATABASE_URL environment variable is required")
+        sys.exit(1)
+
+    engine = create_engine(database_url)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    converted = 0
+    after_id = 0
+    try:
+        while True:
+            ids = compact_batch(
+                session,
+                after_id=after_id,
+                batch_size=args.batch_size,
+                encoding=args.encoding,
+                clear_legacy=args.clear_legacy,
+                dry_run=args.dry_run,
+            )
+            if not ids:
+                break
+            after_id = ids[-1]
+            converted += len(ids)
+            logger.info(f"Processed {converted} questions (last id {after_id})")
+    except KeyboardInterrupt:
+        logger.info("Compaction interrupted by user; rerun to resume")
+        sys.exit(1)
+    except Exception as e:
+        session.rollback()
+        logger.error(f"Compaction failed with error: {str(e)}")
+        sys.exit(1)
+    finally:
+        session.close()
+        engine.dispose()
+
+    logger.info(
+        f"Compaction complete{' (dry run)' if args.dry_run else ''}: "
+        f"{converted} questions processed ({args.encoding}"
+        f"{', legacy column cleared' if args.clear_legacy else ''})"
+    )
+
+
+if __name__ == "__main__":
+    main()
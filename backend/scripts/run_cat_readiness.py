@@ -4,7 +4,11 @@ Railway cron job: Evaluate CAT readiness daily.
 Runs at 3:30 AM UTC (90 minutes after question generation).
 Evaluates whether the calibrated item pool supports Computerized Adaptive
 Testing across all 6 cognitive domains, and persists the result to the
-system_config table.
+system_config table. The readiness aggregates are rebuilt from the questions
+table first, so writes that bypassed the ORM are picked up.
+
+Also folds any completed sessions the submit path missed into the
+response-time histograms, so the admin analytics reads stay read-only.
 """
 
 import logging
@@ -18,8 +22,12 @@ from app.core.cat.readiness import (
     evaluate_cat_readiness,
     serialize_readiness_result,
 )
+from app.core.cat.readiness_aggregates import rebuild_readiness_aggregates
 from app.core.config import settings
 from app.core.datetime_utils import utc_now
+from app.core.psychometrics.response_time_histograms import (
+    refresh_response_time_histograms,
+)
 from app.core.system_config import set_cat_readiness
 from app.models.base import SessionLocal
 
@@ -30,6 +38,8 @@ def work_fn() -> RunSummary:
     """Evaluate CAT readiness and persist the result."""
     db = SessionLocal()
     try:
+        folded_sessions = refresh_response_time_histograms(db)
+        rebuild_readiness_aggregates(db)
         result = evaluate_cat_readiness(db)
 
         now = utc_now()
@@ -60,6 +70,7 @@ def work_fn() -> RunSummary:
             "is_globally_ready": result.is_globally_ready,
             "summary": result.summary,
             "evaluated_at": now.isoformat(),
+            "response_time_sessions_folded": folded_sessions,
         }
     finally:
         db.close()
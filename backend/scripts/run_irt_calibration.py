@@ -4,7 +4,8 @@ Railway cron job: Weekly IRT recalibration.
 Runs at 4:00 AM UTC on Sundays (after question generation at 2:00 AM
 and CAT readiness at 3:30 AM). Recalibrates IRT parameters for all
 eligible questions if new response data has accumulated since the last
-successful calibration.
+successful calibration, then recomputes the Sympson-Hetter item exposure
+parameters for the recalibrated pool.
 """
 
 import logging
@@ -16,6 +17,7 @@ from gioe_libs.cron_runner.cron_job import CronJob
 from gioe_libs.observability import observability
 
 from app.core.cat.calibration import CalibrationError, run_calibration_job
+from app.core.cat.sympson_hetter import run_exposure_parameter_job
 from app.core.config import settings
 from app.core.datetime_utils import utc_now
 from app.models.base import SessionLocal
@@ -164,6 +166,19 @@ def work_fn() -> RunSummary:
             duration,
         )
 
+        # New item parameters change which items get selected, so the
+        # exposure parameters are recomputed for the new pool. A failure here
+        # leaves the previous parameters in place.
+        try:
+            exposure = run_exposure_parameter_job(db)
+            exposure_summary = {
+                "exposure_restricted_items": len(exposure.exposure_parameters),
+                "max_exposure_rate": round(exposure.max_exposure_rate, 3),
+            }
+        except Exception as exc:
+            logger.error("Exposure parameter computation failed: %s", exc)
+            exposure_summary = {"exposure_parameters": "failed"}
+
         return {
             "status": "completed",
             "job_id": job_id,
@@ -173,6 +188,7 @@ def work_fn() -> RunSummary:
             "mean_discrimination": round(summary["mean_discrimination"], 3),
             "new_responses": new_response_count,
             "duration_seconds": round(duration, 1),
+            **exposure_summary,
         }
     finally:
         db.close()
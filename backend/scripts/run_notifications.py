@@ -1,9 +1,11 @@
 """
 Railway cron job: Send test reminder and Day 30 notifications.
 
-Runs daily at 9 AM UTC.  Creates an async DB session, instantiates
-NotificationScheduler, and calls both send_notifications_to_users() and
-send_day_30_reminder_notifications().
+Runs daily at 9 AM UTC.  Creates an async DB session and one connected
+APNsService, instantiates NotificationScheduler with both, and calls
+send_notifications_to_users() and send_day_30_reminder_notifications().
+Recipients are streamed in keyset pages of NOTIFICATION_SEND_BATCH_SIZE
+narrow rows, so the job runs in constant memory regardless of user count.
 
 Deployment
 ----------
@@ -29,6 +31,7 @@ from gioe_libs.observability import observability
 from app.core.config import settings
 from app.core.datetime_utils import utc_now
 from app.models.base import AsyncSessionLocal
+from app.services.apns_service import APNsService
 from app.services.notification_scheduler import NotificationScheduler
 
 logger = logging.getLogger("notifications_cron")
@@ -36,11 +39,18 @@ logger = logging.getLogger("notifications_cron")
 
 async def _send_all() -> RunSummary:
     """Send test-reminder and Day 30 notifications, return a RunSummary dict."""
-    async with AsyncSessionLocal() as db:
-        scheduler = NotificationScheduler(db)
-
-        test_results = await scheduler.send_notifications_to_users()
-        day30_results = await scheduler.send_day_30_reminder_notifications()
+    # One APNs client for the whole run: both sends share its persistent
+    # HTTP/2 connections instead of reconnecting per notification type.
+    apns_service = APNsService()
+    await apns_service.connect()
+    try:
+        async with AsyncSessionLocal() as db:
+            scheduler = NotificationScheduler(db, apns_service=apns_service)
+
+            test_results = await scheduler.send_notifications_to_users()
+            day30_results = await scheduler.send_day_30_reminder_notifications()
+    finally:
+        await apns_service.disconnect()
 
     total_sent = test_results.get("success", 0) + day30_results.get("success", 0)
     total_failed = test_results.get("failed", 0) + day30_results.get("failed", 0)
@@ -0,0 +1,112 @@
+"""Replay shadow CAT for sessions missing a shadow result (TASK-875).
+
+Picks up completed fixed-form sessions that have a TestResult but no
+ShadowCATResult, either because the live shadow CAT executor dropped them
+under load or because they predate shadow testing, and stores their shadow
+results in bulk.
+
+Usage:
+    python scripts/run_shadow_cat_catchup.py [--workers N] [--batch-size N]
+                                             [--limit N] [--dry-run]
+
+Requirements:
+    - DATABASE_URL environment variable must be set
+
+Performance:
+    - The calibrated item bank is loaded once and shared with every worker
+      process; responses are fetched one page at a time
+    - CAT replays run in parallel processes (default: one per CPU)
+    - Results are inserted with one commit per page
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.core.shadow_cat.catchup import (  # noqa: E402
+    DEFAULT_BATCH_SIZE,
+    run_shadow_cat_catchup,
+)
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """Main entry point for the shadow CAT catch-up script."""
+    parser = argparse.ArgumentParser(
+        description="Compute shadow CAT results for sessions missing one"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for CAT replays (default: CPU count, 1 = in-process)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Sessions per page (default: {DEFAULT_BATCH_SIZE})",
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=None,
+        help="Maximum number of sessions to process",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Compute results without writing them",
+    )
+
+    args = parser.parse_args()
+
+    database_url = os.environ.get("DATABASE_URL")
+    if not database_url:
+        logger.error("DATABASE_URL environment variable is required")
+        sys.exit(1)
+
+    engine = create_engine(database_url)
+    db = sessionmaker(bind=engine)()
+    try:
+        summary = run_shadow_cat_catchup(
+            db,
+            workers=args.workers,
+            batch_size=args.batch_size,
+            limit=args.limit,
+            dry_run=args.dry_run,
+        )
+    except KeyboardInterrupt:
+        logger.info("Catch-up interrupted by user")
+        sys.exit(1)
+    except Exception as e:
+        logger.error(f"Catch-up failed with error: {str(e)}")
+        sys.exit(1)
+    finally:
+        db.close()
+        engine.dispose()
+
+    logger.info(
+        f"Shadow CAT catch-up complete{' (dry run)' if args.dry_run else ''}: "
+        f"scanned={summary.scanned}, computed={summary.computed}, "
+        f"inserted={summary.inserted}, skipped={summary.skipped}, "
+        f"failed={summary.failed}"
+    )
+    sys.exit(1 if summary.failed else 0)
+
+
+if __name__ == "__main__":
+    main()
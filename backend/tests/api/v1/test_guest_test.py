@@ -5,7 +5,13 @@ import pytest
 from app.api.v1 import guest_test as guest_test_module
 from app.core.config import settings
 from app.core.auth.security import create_access_token
-from app.models import models
+from app.models import (
+    Group,
+    GroupLeaderboardEntry,
+    GroupMembership,
+    GroupRole,
+    models,
+)
 from app.models.models import (
     DifficultyLevel,
     Question,
@@ -226,6 +232,54 @@ class TestGuestResultClaim:
         history_result_ids = {item["id"] for item in history_response.json()["results"]}
         assert result_id in history_result_ids
 
+    def test_claim_updates_group_leaderboard(
+        self, client, db_session, guest_user, many_questions, test_user, auth_headers
+    ):
+        group = Group(name="Claimers", created_by=test_user.id, max_members=10)
+        db_session.add(group)
+        db_session.flush()
+        db_session.add(
+            GroupMembership(
+                group_id=group.id, user_id=test_user.id, role=GroupRole.OWNER
+            )
+        )
+        db_session.add(
+            GroupLeaderboardEntry(
+                group_id=group.id,
+                user_id=test_user.id,
+                best_score=0,
+                avg_score=0.0,
+                test_count=0,
+                score_sum=0,
+            )
+        )
+        db_session.commit()
+
+        submit_data = _submit_completed_guest_test(client)
+        response = client.post(
+            "/v1/test/guest/claim",
+            json={"claim_token": submit_data["claim_token"]},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200, response.json()
+
+        db_session.expire_all()
+        iq_score = (
+            db_session.query(models.TestResult)
+            .filter_by(id=submit_data["result"]["id"])
+            .one()
+            .iq_score
+        )
+        entry = (
+            db_session.query(GroupLeaderboardEntry)
+            .filter_by(group_id=group.id, user_id=test_user.id)
+            .one()
+        )
+        assert entry.test_count == 1
+        assert entry.best_score == iq_score
+        assert entry.score_sum == iq_score
+        assert entry.avg_score == pytest.approx(iq_score)
+
     def test_claim_rejects_invalid_token(self, client, auth_headers):
         response = client.post(
             "/v1/test/guest/claim",
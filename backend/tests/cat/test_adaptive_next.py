@@ -203,6 +203,39 @@ class TestAdaptiveNextEndpoint:
             current_question = data["next_question"]
 
 
+    def test_failed_exposure_flush_does_not_fail_request(
+        self, client, auth_headers, db_session
+    ):
+        """Test start and next return 200 when the exposure flush write fails."""
+        from unittest.mock import patch
+
+        from app.core.cat.exposure_store import exposure_monitor
+        from tests.conftest import AsyncTestingSessionLocal
+
+        _create_calibrated_item_pool(db_session)
+
+        with patch.object(exposure_monitor, "flush_due", return_value=True), patch(
+            "app.core.cat.exposure_store.AsyncSessionLocal", AsyncTestingSessionLocal
+        ), patch(
+            "app.core.cat.exposure_store._upsert_statements",
+            side_effect=RuntimeError("down"),
+        ) as upsert:
+            session_id, first_question = _start_adaptive_session(client, auth_headers)
+            response = client.post(
+                "/v1/test/next",
+                json={
+                    "session_id": session_id,
+                    "question_id": first_question["id"],
+                    "user_answer": "A",
+                },
+                headers=auth_headers,
+            )
+
+        assert response.status_code == 200
+        assert response.json()["next_question"]["id"] != first_question["id"]
+        assert upsert.call_count == 2
+
+
 class TestAdaptiveNextValidation:
     """Tests for validation logic in POST /v1/test/next."""
 
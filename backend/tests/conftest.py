@@ -67,6 +67,7 @@ from contextlib import asynccontextmanager  # noqa: E402
 from app.api.v1.api import api_router  # noqa: E402
 from app.core.auth.security import hash_password, create_access_token  # noqa: E402
 from app.core.config import settings  # noqa: E402
+from app.core.system_config import invalidate_config_snapshot  # noqa: E402
 
 
 @asynccontextmanager
@@ -216,6 +217,8 @@ def db_session():
     """
     # Create all tables
     Base.metadata.create_all(bind=engine)
+    # The database is recreated per test, so drop any cached config rows
+    invalidate_config_snapshot()
 
     db = TestingSessionLocal()
     try:
@@ -224,6 +227,7 @@ def db_session():
         db.close()
         # Drop all tables after test
         Base.metadata.drop_all(bind=engine)
+        invalidate_config_snapshot()
 
 
 @pytest.fixture(scope="function")
@@ -426,12 +430,14 @@ async def async_db_session() -> AsyncGenerator[AsyncSession, None]:
     """
     async with async_test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    invalidate_config_snapshot()
 
     async with AsyncTestingSessionLocal() as session:
         yield session
 
     async with async_test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
+    invalidate_config_snapshot()
 
 
 @pytest.fixture(scope="function")
@@ -6,6 +6,7 @@ Tests cover all export functions:
 - export_response_matrix
 - export_response_details
 - export_ctt_summary
+- iter_export_chunks / export_to_file (streaming exports)
 """
 
 import csv
@@ -21,6 +22,8 @@ from app.core.cat.data_export import (
     export_response_details,
     export_response_matrix,
     export_responses_for_calibration,
+    export_to_file,
+    iter_export_chunks,
 )
 from app.models.models import (
     DifficultyLevel,
@@ -618,6 +621,83 @@ class TestExportCTTSummary:
         assert question_ids == sorted(question_ids)
 
 
+class TestStreamingExport:
+    """Tests for iter_export_chunks and export_to_file."""
+
+    def test_chunks_match_string_export(self, db_session, test_responses):
+        """Test small chunks concatenate to the same output as the string API."""
+        chunks = list(
+            iter_export_chunks(
+                db_session, "responses", "csv", min_responses=1, chunk_size=2
+            )
+        )
+
+        # Header + 2 rows, then 2 rows, then 2 rows
+        assert len(chunks) == 3
+        expected = export_responses_for_calibration(
+            db=db_session, min_responses=1, output_format="csv"
+        )
+        assert b"".join(chunks).decode("utf-8") == expected
+
+    def test_export_to_file(self, db_session, test_responses, tmp_path):
+        """Test streaming to a file writes the full JSONL export."""
+        path = tmp_path / "responses.jsonl"
+
+        written = export_to_file(
+            db_session, path, "details", "jsonl", min_responses=1, chunk_size=4
+        )
+
+        content = path.read_text()
+        assert written == len(content.encode("utf-8"))
+        assert content == export_response_details(
+            db=db_session, min_responses=1, output_format="jsonl"
+        )
+
+    def test_matrix_chunks_match_string_export(self, db_session, test_responses):
+        """Test the streamed matrix (one row per user) matches the string API."""
+        chunks = list(
+            iter_export_chunks(
+                db_session, "matrix", "csv", min_responses=1, chunk_size=1
+            )
+        )
+
+        assert b"".join(chunks).decode("utf-8") == export_response_matrix(
+            db=db_session, min_responses=1
+        )
+
+    def test_min_responses_applied_in_stream(self, db_session, test_responses):
+        """Test questions below min_responses are excluded by the query."""
+        assert list(iter_export_chunks(db_session, min_responses=100)) == []
+
+    def test_invalid_options_fail_before_iteration(self, db_session):
+        """Test invalid options raise immediately, not on first chunk."""
+        with pytest.raises(DataExportError) as exc_info:
+            iter_export_chunks(db_session, "responses", "xml")
+        assert "Invalid output format" in str(exc_info.value)
+
+        with pytest.raises(DataExportError) as exc_info:
+            iter_export_chunks(db_session, "matrix", "jsonl")
+        assert "only supports CSV" in str(exc_info.value)
+
+        with pytest.raises(DataExportError) as exc_info:
+            iter_export_chunks(db_session, "ctt-summary", "csv")
+        assert "Invalid export type" in str(exc_info.value)
+
+    def test_parquet_export(self, db_session, test_responses, tmp_path):
+        """Test Parquet export round-trips through pyarrow."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "responses.parquet"
+
+        export_to_file(
+            db_session, path, "responses", "parquet", min_responses=1, chunk_size=2
+        )
+
+        table = pq.read_table(path)
+        assert table.num_rows == 6
+        assert pq.ParquetFile(path).num_row_groups == 3
+        assert set(table.column("is_correct").to_pylist()) <= {0, 1}
+
+
 class TestDataExportError:
     """Tests for DataExportError exception class."""
 
@@ -0,0 +1,238 @@
+"""
+Tests for the incrementally maintained CAT readiness aggregates (TASK-835).
+
+The aggregates kept current by the before_flush hook must always equal a
+rebuild from the questions table, so most tests compare the two.
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.cat.readiness import evaluate_cat_readiness
+from app.core.cat.readiness_aggregates import (
+    READINESS_THETA_GRID,
+    _calibrated_items_query,
+    _compute_totals,
+    load_readiness_aggregates,
+    rebuild_readiness_aggregates,
+    se_band_label,
+)
+from app.core.config import settings
+from app.models.models import (
+    CATReadinessAggregate,
+    DifficultyLevel,
+    Question,
+    QuestionType,
+)
+
+
+def _create_question(
+    db_session: Session,
+    question_type: QuestionType,
+    irt_difficulty: float,
+    irt_discrimination: float = 1.0,
+    irt_se_difficulty: float = 0.20,
+    irt_se_discrimination: float = 0.15,
+    calibrated: bool = True,
+) -> Question:
+    q = Question(
+        question_text=f"Test question ({question_type.value}, b={irt_difficulty})",
+        question_type=question_type,
+        difficulty_level=DifficultyLevel.MEDIUM,
+        correct_answer="A",
+        answer_options=["A", "B", "C", "D"],
+        is_active=True,
+        quality_flag="normal",
+        irt_difficulty=irt_difficulty,
+        irt_discrimination=irt_discrimination,
+        irt_se_difficulty=irt_se_difficulty,
+        irt_se_discrimination=irt_se_discrimination,
+        irt_calibrated_at=datetime(2026, 1, 15, 12, 0, 0) if calibrated else None,
+    )
+    db_session.add(q)
+    return q
+
+
+def _populate(db_session: Session) -> list:
+    questions = [
+        _create_question(db_session, q_type, irt_difficulty=b, irt_se_difficulty=se)
+        for q_type in (QuestionType.PATTERN, QuestionType.LOGIC)
+        for b, se in ((-1.8, 0.2), (-0.4, 0.35), (0.0, 0.6), (0.9, 0.2), (1.7, 0.25))
+    ]
+    questions.append(
+        _create_question(db_session, QuestionType.MATH, 0.5, calibrated=False)
+    )
+    db_session.commit()
+    return questions
+
+
+def _assert_matches_rebuild(db_session: Session) -> None:
+    """The stored aggregates equal a fresh computation from the questions."""
+    stored = load_readiness_aggregates(db_session)
+    expected = _compute_totals(db_session.execute(_calibrated_items_query()).all())
+
+    assert stored.keys() == expected.keys()
+    for domain, totals in expected.items():
+        actual = stored[domain]
+        assert actual.total_calibrated == totals.total_calibrated
+        assert actual.well_calibrated == totals.well_calibrated
+        assert actual.easy_count == totals.easy_count
+        assert actual.medium_count == totals.medium_count
+        assert actual.hard_count == totals.hard_count
+        assert actual.se_difficulty_bands == totals.se_difficulty_bands
+        assert actual.se_discrimination_bands == totals.se_discrimination_bands
+        np.testing.assert_allclose(
+            actual.test_information, totals.test_information, atol=1e-9
+        )
+
+
+def _rebuilt_at(db_session: Session) -> set:
+    return set(
+        db_session.execute(select(CATReadinessAggregate.rebuilt_at)).scalars().all()
+    )
+
+
+class TestIncrementalMaintenance:
+    """Question changes flushed through the ORM update the aggregates."""
+
+    @pytest.fixture
+    def questions(self, db_session: Session) -> list:
+        questions = _populate(db_session)
+        rebuild_readiness_aggregates(db_session)
+        return questions
+
+    def test_deactivation(self, db_session: Session, questions: list):
+        """Test deactivating an item removes its contribution."""
+        rebuilt_at = _rebuilt_at(db_session)
+
+        questions[3].is_active = False
+        db_session.commit()
+
+        assert _rebuilt_at(db_session) == rebuilt_at
+        _assert_matches_rebuild(db_session)
+        pattern = load_readiness_aggregates(db_session)[QuestionType.PATTERN.value]
+        assert pattern.total_calibrated == 4
+
+    def test_quality_flag_change(self, db_session: Session, questions: list):
+        """Test flagging and restoring an item round-trips the aggregates."""
+        questions[0].quality_flag = "under_review"
+        db_session.commit()
+        _assert_matches_rebuild(db_session)
+
+        questions[0].quality_flag = "normal"
+        db_session.commit()
+        _assert_matches_rebuild(db_session)
+
+    def test_recalibration(self, db_session: Session, questions: list):
+        """Test new IRT parameters move an item between bands."""
+        questions[2].irt_se_difficulty = 0.2
+        questions[2].irt_difficulty = 1.4
+        questions[6].irt_discrimination = 2.2
+        questions[10].irt_calibrated_at = datetime(2026, 2, 1)
+        db_session.commit()
+
+        _assert_matches_rebuild(db_session)
+        totals = load_readiness_aggregates(db_session)
+        assert totals[QuestionType.PATTERN.value].hard_count == 2
+        assert totals[QuestionType.MATH.value].total_calibrated == 1
+
+    def test_domain_change_and_delete(self, db_session: Session, questions: list):
+        """Test moving an item to another domain and deleting one."""
+        questions[1].question_type = QuestionType.VERBAL
+        db_session.delete(questions[5])
+        db_session.commit()
+
+        _assert_matches_rebuild(db_session)
+
+    def test_insert(self, db_session: Session, questions: list):
+        """Test a new calibrated question is added in the same flush."""
+        _create_question(db_session, QuestionType.SPATIAL, irt_difficulty=-1.2)
+        db_session.commit()
+
+        _assert_matches_rebuild(db_session)
+
+    def test_rollback_discards_delta(self, db_session: Session, questions: list):
+        """Test a rolled back change leaves the aggregates untouched."""
+        questions[3].is_active = False
+        db_session.flush()
+        db_session.rollback()
+
+        _assert_matches_rebuild(db_session)
+        pattern = load_readiness_aggregates(db_session)[QuestionType.PATTERN.value]
+        assert pattern.total_calibrated == 5
+
+
+class TestLoad:
+    """Tests for load_readiness_aggregates."""
+
+    def test_builds_missing_rows(self, db_session: Session):
+        """Test the first load builds every domain's row."""
+        _populate(db_session)
+
+        totals = load_readiness_aggregates(db_session)
+
+        assert set(totals) == {q_type.value for q_type in QuestionType}
+        rows = db_session.execute(select(CATReadinessAggregate)).scalars().all()
+        assert len(rows) == len(QuestionType)
+
+    def test_rebuilds_on_threshold_change(self, db_session: Session, monkeypatch):
+        """Test rows classified against other thresholds are rebuilt."""
+        _populate(db_session)
+        before = load_readiness_aggregates(db_session)[QuestionType.PATTERN.value]
+
+        monkeypatch.setattr(settings, "CAT_MAX_SE_DIFFICULTY", 1.0)
+        after = load_readiness_aggregates(db_session)[QuestionType.PATTERN.value]
+
+        assert before.well_calibrated < after.well_calibrated == 5
+        _assert_matches_rebuild(db_session)
+
+    def test_rebuilds_stale_rows(self, db_session: Session):
+        """Test rows older than the maximum age are rebuilt."""
+        _populate(db_session)
+        load_readiness_aggregates(db_session)
+        for row in db_session.execute(select(CATReadinessAggregate)).scalars():
+            row.rebuilt_at = row.rebuilt_at - timedelta(days=2)
+        db_session.commit()
+        stale = _rebuilt_at(db_session)
+
+        load_readiness_aggregates(db_session)
+
+        assert _rebuilt_at(db_session).isdisjoint(stale)
+
+
+class TestReadinessOutputs:
+    """Tests for the curves and SE bands reported by evaluate_cat_readiness."""
+
+    def test_information_curve_sums_items(self, db_session: Session):
+        """Test test information is the sum of the 2PL item information."""
+        _create_question(db_session, QuestionType.MEMORY, 0.0, irt_discrimination=1.5)
+        _create_question(db_session, QuestionType.MEMORY, 1.2, irt_discrimination=0.8)
+        db_session.commit()
+
+        result = evaluate_cat_readiness(db_session)
+        memory = next(d for d in result.domains if d.domain == "memory")
+
+        theta = np.array(READINESS_THETA_GRID)
+        expected = np.zeros_like(theta)
+        for a, b in ((1.5, 0.0), (0.8, 1.2)):
+            p = 1.0 / (1.0 + np.exp(-a * (theta - b)))
+            expected += a**2 * p * (1 - p)
+        assert result.theta_grid == list(READINESS_THETA_GRID)
+        np.testing.assert_allclose(memory.test_information, expected, atol=1e-4)
+
+    def test_se_bands(self, db_session: Session):
+        """Test every calibrated item is counted in its SE bands."""
+        _populate(db_session)
+
+        result = evaluate_cat_readiness(db_session)
+        pattern = next(d for d in result.domains if d.domain == "pattern")
+
+        assert pattern.se_difficulty_bands[se_band_label(0.2)] == 2
+        assert pattern.se_difficulty_bands[se_band_label(0.6)] == 1
+        assert sum(pattern.se_difficulty_bands.values()) == 5
+        assert pattern.se_discrimination_bands[se_band_label(0.15)] == 5
+        assert pattern.se_discrimination_bands[">1.0"] == 0
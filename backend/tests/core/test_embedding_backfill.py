@@ -0,0 +1,195 @@
+"""Tests for the batched, resumable question embedding backfill."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pytest
+
+from app.core.embedding_backfill import (
+    EmbeddingClient,
+    estimate_tokens,
+    pack_batches,
+    run_embedding_backfill,
+)
+from app.core.embedding_codec import decode_embedding, encode_embedding
+from app.models.models import Question
+
+EMBEDDING_DIM = 8
+
+
+class _FakeEmbeddingsServer:
+    """Local OpenAI-compatible /embeddings server with deterministic vectors.
+
+    Records the number of inputs of every request; inputs containing
+    ``fail_marker`` make the whole request fail with a 500.
+    """
+
+    def __init__(self, fail_marker=None):
+        self.request_sizes = []
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                texts = body["input"]
+                fake.request_sizes.append(len(texts))
+                if fail_marker and any(fail_marker in t for t in texts):
+                    self.send_response(500)
+                    self.end_headers()
+                    return
+                # Reverse the order to check results are re-sorted by index
+                data = [
+                    {"index": i, "embedding": [float(len(text))] * EMBEDDING_DIM}
+                    for i, text in enumerate(texts)
+                ][::-1]
+                payload = json.dumps({"data": data, "model": body["model"]}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+async def _backfill(db_session, server, **kwargs):
+    async with EmbeddingClient(
+        "test-key", "test-model", base_url=server.base_url, max_retries=0
+    ) as client:
+        return await run_embedding_backfill(
+            db_session, client, model="test-model", **kwargs
+        )
+
+
+class TestPackBatches:
+    """Tests for token- and count-bounded batch packing."""
+
+    def test_respects_input_limit(self):
+        """Test batches never exceed max_inputs and preserve order."""
+        items = [(i, "short") for i in range(10)]
+
+        batches = pack_batches(items, max_tokens=10_000, max_inputs=4)
+
+        assert [len(b) for b in batches] == [4, 4, 2]
+        assert [item for batch in batches for item in batch] == items
+
+    def test_respects_token_budget(self):
+        """Test batches stay within the estimated token budget."""
+        items = [(i, "x" * 40) for i in range(6)]  # 11 tokens each
+
+        batches = pack_batches(items, max_tokens=30, max_inputs=100)
+
+        assert [len(b) for b in batches] == [2, 2, 2]
+        for batch in batches:
+            assert sum(estimate_tokens(text) for _, text in batch) <= 30
+
+    def test_oversized_item_gets_its_own_batch(self):
+        """Test a single item over the budget is still sent, alone."""
+        items = [(1, "a"), (2, "x" * 400), (3, "b")]
+
+        batches = pack_batches(items, max_tokens=20, max_inputs=100)
+
+        assert [[i for i, _ in b] for b in batches] == [[1], [2], [3]]
+
+
+class TestRunEmbeddingBackfill:
+    """Tests for run_embedding_backfill against a local fake server."""
+
+    @pytest.mark.asyncio
+    async def test_backfills_in_batches_and_resumes(self, db_session, test_questions):
+        """Test every question is embedded in batched requests and a rerun is a no-op."""
+        with _FakeEmbeddingsServer() as server:
+            summary = await _backfill(
+                db_session, server, page_size=3, max_batch_inputs=2, concurrency=2
+            )
+
+            assert summary.scanned == len(test_questions)
+            assert summary.embedded == len(test_questions)
+            assert summary.failed == 0
+            assert sum(server.request_sizes) == len(test_questions)
+            assert max(server.request_sizes) <= 2
+            assert summary.requests == len(server.request_sizes)
+
+            for question in test_questions:
+                db_session.refresh(question)
+                assert question.embedding_model == "test-model"
+                assert question.embedding_dim == EMBEDDING_DIM
+                vector = decode_embedding(
+                    question.embedding_vector, question.embedding_encoding
+                )
+                np.testing.assert_allclose(
+                    vector, [len(question.question_text)] * EMBEDDING_DIM
+                )
+
+            rerun = await _backfill(db_session, server)
+
+        assert rerun.scanned == 0
+        assert rerun.requests == 0
+
+    @pytest.mark.asyncio
+    async def test_dry_run_makes_no_requests(self, db_session, test_questions):
+        """Test a dry run counts batches without calling the API or writing."""
+        summary = await run_embedding_backfill(
+            db_session, None, model="test-model", max_batch_inputs=2, dry_run=True
+        )
+
+        assert summary.scanned == len(test_questions)
+        assert summary.requests == (len(test_questions) + 1) // 2
+        assert summary.embedded == 0
+        assert (
+            db_session.query(Question)
+            .filter(Question.embedding_vector.isnot(None))
+            .count()
+            == 0
+        )
+
+    @pytest.mark.asyncio
+    async def test_reembed_picks_up_other_models(self, db_session, test_questions):
+        """Test reembed only re-embeds questions from a different model."""
+        stale, current = test_questions[0], test_questions[1]
+        for question, model in ((stale, "old-model"), (current, "test-model")):
+            for column, value in (
+                encode_embedding([1.0] * EMBEDDING_DIM, model).column_values().items()
+            ):
+                setattr(question, column, value)
+        db_session.commit()
+
+        with _FakeEmbeddingsServer() as server:
+            summary = await _backfill(db_session, server, reembed=True)
+
+        assert summary.scanned == len(test_questions) - 1
+        db_session.refresh(stale)
+        db_session.refresh(current)
+        assert stale.embedding_model == "test-model"
+        assert (
+            decode_embedding(current.embedding_vector).tolist() == [1.0] * EMBEDDING_DIM
+        )
+
+    @pytest.mark.asyncio
+    async def test_failed_request_leaves_rows_for_next_run(
+        self, db_session, test_questions
+    ):
+        """Test a failing batch is counted and its rows stay unembedded."""
+        failing = test_questions[0]
+        with _FakeEmbeddingsServer(fail_marker=failing.question_text) as server:
+            summary = await _backfill(db_session, server, max_batch_inputs=1)
+
+        assert summary.failed == 1
+        assert summary.embedded == len(test_questions) - 1
+        db_session.refresh(failing)
+        assert failing.embedding_vector is None
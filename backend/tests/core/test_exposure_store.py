@@ -0,0 +1,196 @@
+"""
+Tests for the shared, persistent item exposure counts (TASK-868).
+"""
+
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import select
+
+from app.core.cat.exposure_store import SharedExposureMonitor
+from app.models.models import ItemExposureCount
+from tests.conftest import AsyncTestingSessionLocal
+
+
+def _stored_counts(db_session):
+    rows = db_session.execute(
+        select(ItemExposureCount.question_id, ItemExposureCount.selection_count)
+    ).all()
+    return dict(rows)
+
+
+class TestFlushDue:
+    """Tests for SharedExposureMonitor.flush_due."""
+
+    def test_due_after_batch_of_selections(self):
+        """Test a flush is due once flush_selections are pending."""
+        monitor = SharedExposureMonitor(flush_selections=3)
+
+        monitor.record_selection(1)
+        monitor.record_selection(2)
+        assert monitor.flush_due() is False
+
+        monitor.record_selection(1)
+        assert monitor.flush_due() is True
+        assert monitor.pending_selections == 3
+
+    def test_due_after_interval(self):
+        """Test pending selections are flushed after the interval."""
+        monitor = SharedExposureMonitor(flush_selections=100, flush_interval_seconds=0)
+
+        assert monitor.flush_due() is False
+        monitor.record_selection(1)
+        assert monitor.flush_due() is True
+
+
+class TestFlush:
+    """Tests for flushing to item_exposure_counts."""
+
+    def test_flush_adds_pending_counts(self, db_session, test_questions):
+        """Test pending selections are added to the stored counts."""
+        first, second = test_questions[0].id, test_questions[1].id
+        monitor = SharedExposureMonitor()
+        for item_id in (first, first, second):
+            monitor.record_selection(item_id)
+
+        assert monitor.flush(db_session) == 3
+        assert monitor.flush(db_session) == 0
+        monitor.record_selection(first)
+        monitor.flush(db_session)
+
+        assert _stored_counts(db_session) == {first: 3, second: 1}
+        assert monitor.pending_selections == 0
+
+    def test_counts_shared_between_workers(self, db_session, test_questions):
+        """Test each monitor sees the other's flushed selections."""
+        first, second = test_questions[0].id, test_questions[1].id
+        worker_a = SharedExposureMonitor()
+        worker_b = SharedExposureMonitor()
+
+        for _ in range(3):
+            worker_a.record_selection(first)
+        worker_a.flush(db_session)
+        worker_b.record_selection(second)
+        worker_b.flush(db_session)
+
+        assert worker_b.total_selections == 4
+        assert worker_b.get_exposure_rate(first) == pytest.approx(0.75)
+        worker_a.refresh(db_session)
+        assert worker_a.get_exposure_rates() == worker_b.get_exposure_rates()
+
+    def test_refresh_keeps_pending_selections(self, db_session, test_questions):
+        """Test unflushed local selections stay counted after a refresh."""
+        first = test_questions[0].id
+        flushed = SharedExposureMonitor()
+        flushed.record_selection(first)
+        flushed.flush(db_session)
+
+        monitor = SharedExposureMonitor()
+        monitor.record_selection(first)
+        monitor.refresh(db_session)
+
+        assert monitor.total_selections == 2
+        assert monitor.pending_selections == 1
+
+    def test_alerts_on_fleet_wide_counts(self, db_session, test_questions):
+        """Test overexposure is detected from other workers' selections."""
+        first, second = test_questions[0].id, test_questions[1].id
+        busy = SharedExposureMonitor()
+        for _ in range(9):
+            busy.record_selection(first)
+        busy.record_selection(second)
+        busy.flush(db_session)
+
+        monitor = SharedExposureMonitor(alert_threshold=0.5)
+        monitor.refresh(db_session)
+
+        assert monitor.check_and_alert() == [(first, pytest.approx(0.9))]
+
+    def test_flush_alerts_on_fleet_wide_counts(self, db_session, test_questions):
+        """Test a flush checks the reloaded counts for overexposure."""
+        first, second = test_questions[0].id, test_questions[1].id
+        other = SharedExposureMonitor()
+        for _ in range(9):
+            other.record_selection(first)
+        other.flush(db_session)
+
+        monitor = SharedExposureMonitor(alert_threshold=0.5)
+        monitor.record_selection(second)
+        with patch.object(monitor, "check_and_alert") as check_and_alert:
+            monitor.flush(db_session)
+
+        check_and_alert.assert_called_once()
+        assert monitor.get_overexposed_items() == [(first, pytest.approx(0.9))]
+
+    def test_failed_flush_drops_counts(self, db_session, test_questions):
+        """Test a failing write is logged and does not raise."""
+        monitor = SharedExposureMonitor()
+        monitor.record_selection(test_questions[0].id)
+
+        with patch.object(db_session, "execute", side_effect=RuntimeError("down")):
+            assert monitor.flush(db_session) == 0
+
+        assert monitor.pending_selections == 0
+        assert _stored_counts(db_session) == {}
+
+
+class TestAsyncFlush:
+    """Tests for the async flush path."""
+
+    async def test_async_flush_if_due(self, async_db_session):
+        """Test async flushing writes and reloads the counts."""
+        from app.models.models import DifficultyLevel, Question, QuestionType
+
+        question = Question(
+            question_text="q",
+            question_type=QuestionType.PATTERN,
+            difficulty_level=DifficultyLevel.EASY,
+            correct_answer="A",
+            answer_options=["A", "B"],
+        )
+        async_db_session.add(question)
+        await async_db_session.commit()
+
+        monitor = SharedExposureMonitor(flush_selections=2)
+        monitor.record_selection(question.id)
+        assert await monitor.async_flush_if_due(async_db_session) == 0
+
+        monitor.record_selection(question.id)
+        assert await monitor.async_flush_if_due(async_db_session) == 2
+
+        result = await async_db_session.execute(
+            select(ItemExposureCount.selection_count)
+        )
+        assert result.scalar_one() == 2
+        assert monitor.total_selections == 2
+
+    async def test_flush_in_own_session_leaves_callers_session_alone(
+        self, async_db_session
+    ):
+        """Test a failed background flush never rolls back the caller's session."""
+        from app.models.models import DifficultyLevel, Question, QuestionType
+
+        question = Question(
+            question_text="q",
+            question_type=QuestionType.PATTERN,
+            difficulty_level=DifficultyLevel.EASY,
+            correct_answer="A",
+            answer_options=["A", "B"],
+        )
+        async_db_session.add(question)
+        await async_db_session.commit()
+
+        monitor = SharedExposureMonitor(flush_selections=1)
+        monitor.record_selection(question.id)
+        with patch(
+            "app.core.cat.exposure_store._upsert_statements",
+            side_effect=RuntimeError("down"),
+        ):
+            flushed = await monitor.async_flush_in_own_session(
+                AsyncTestingSessionLocal
+            )
+
+        assert flushed == 0
+        assert monitor.pending_selections == 0
+        # Still loaded: reading it does not need a lazy load
+        assert question.question_text == "q"
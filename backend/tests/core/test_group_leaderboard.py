@@ -0,0 +1,221 @@
+"""
+Tests for the materialized group leaderboard.
+"""
+
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import select
+
+from app.core.auth.security import create_access_token, hash_password
+from app.core.datetime_utils import utc_now
+from app.core.group_leaderboard import (
+    InvalidLeaderboardCursor,
+    add_leaderboard_entry,
+    decode_cursor,
+    encode_cursor,
+    fetch_leaderboard_page,
+    rebuild_group_leaderboard,
+    record_result_in_leaderboards,
+)
+from app.models import Group, GroupLeaderboardEntry, GroupMembership, GroupRole, User
+from app.models.models import TestResult, TestSession, TestStatus
+
+
+async def _add_result(db, user_id, iq_score):
+    """Persist a completed session and result for a user."""
+    now = utc_now()
+    session = TestSession(
+        user_id=user_id,
+        status=TestStatus.COMPLETED,
+        started_at=now - timedelta(minutes=20),
+        completed_at=now,
+    )
+    db.add(session)
+    await db.flush()
+    db.add(
+        TestResult(
+            test_session_id=session.id,
+            user_id=user_id,
+            iq_score=iq_score,
+            total_questions=20,
+            correct_answers=10,
+            completed_at=now,
+        )
+    )
+
+
+async def _create_group(db, owner, members):
+    """Create a group with the owner plus members, maintaining the leaderboard."""
+    group = Group(name="Leaderboard", created_by=owner.id, max_members=100)
+    db.add(group)
+    await db.flush()
+    for user in [owner, *members]:
+        db.add(
+            GroupMembership(
+                group_id=group.id,
+                user_id=user.id,
+                role=GroupRole.OWNER if user is owner else GroupRole.MEMBER,
+            )
+        )
+        await add_leaderboard_entry(db, group.id, user.id)
+    await db.commit()
+    return group
+
+
+async def _create_users(db, count):
+    users = [
+        User(
+            email=f"leader{i}@example.com",
+            password_hash=hash_password("testpassword123"),
+            first_name=f"Leader{i}",
+            last_name="User",
+        )
+        for i in range(count)
+    ]
+    db.add_all(users)
+    await db.commit()
+    return users
+
+
+async def _entries(db, group_id):
+    result = await db.execute(
+        select(GroupLeaderboardEntry)
+        .where(GroupLeaderboardEntry.group_id == group_id)
+        .order_by(GroupLeaderboardEntry.user_id)
+    )
+    return [
+        (e.user_id, e.best_score, e.avg_score, e.test_count)
+        for e in result.scalars().all()
+    ]
+
+
+class TestCursor:
+    """Tests for leaderboard cursor encoding."""
+
+    def test_round_trip(self):
+        assert decode_cursor(encode_cursor(130, 42, 7)) == (130, 42, 7)
+
+    def test_rejects_garbage(self):
+        with pytest.raises(InvalidLeaderboardCursor):
+            decode_cursor("not-a-cursor")
+
+
+class TestIncrementalMaintenance:
+    """Tests that incremental updates match a full rebuild."""
+
+    async def test_join_picks_up_existing_results(self, async_db_session):
+        owner, member = await _create_users(async_db_session, 2)
+        await _add_result(async_db_session, member.id, 110)
+        await _add_result(async_db_session, member.id, 120)
+        await async_db_session.commit()
+
+        group = await _create_group(async_db_session, owner, [member])
+
+        assert await _entries(async_db_session, group.id) == [
+            (owner.id, 0, 0.0, 0),
+            (member.id, 120, 115.0, 2),
+        ]
+
+    async def test_new_results_update_every_group(self, async_db_session):
+        owner, member = await _create_users(async_db_session, 2)
+        first = await _create_group(async_db_session, owner, [member])
+        second = await _create_group(async_db_session, member, [])
+
+        for score in (100, 130, 115):
+            await _add_result(async_db_session, member.id, score)
+            await record_result_in_leaderboards(async_db_session, member.id, score)
+        await async_db_session.commit()
+
+        incremental = [
+            await _entries(async_db_session, first.id),
+            await _entries(async_db_session, second.id),
+        ]
+        assert (member.id, 130, pytest.approx(115.0), 3) in incremental[0]
+
+        await rebuild_group_leaderboard(async_db_session)
+        await async_db_session.commit()
+        rebuilt = [
+            await _entries(async_db_session, first.id),
+            await _entries(async_db_session, second.id),
+        ]
+        assert rebuilt == incremental
+
+
+class TestLeaderboardReads:
+    """Tests for ranked reads and keyset pagination."""
+
+    async def test_keyset_pages_cover_ranking(self, async_db_session):
+        users = await _create_users(async_db_session, 5)
+        for user, score in zip(users, (100, 140, 120, 140, 90)):
+            await _add_result(async_db_session, user.id, score)
+        await async_db_session.commit()
+        group = await _create_group(async_db_session, users[0], users[1:])
+
+        full = await fetch_leaderboard_page(async_db_session, group.id)
+        expected = [row.user_id for row in full]
+        # Ties on best score are broken by user id
+        assert expected[:2] == sorted([users[1].id, users[3].id])
+
+        seen = []
+        after = None
+        while True:
+            page = await fetch_leaderboard_page(
+                async_db_session, group.id, limit=2, after=after
+            )
+            if not page:
+                break
+            seen.extend(row.user_id for row in page)
+            after = (page[-1].best_score, page[-1].user_id)
+
+        assert seen == expected
+
+    async def test_endpoint_cursor_pagination(
+        self, async_client, async_db_session, async_test_user
+    ):
+        others = await _create_users(async_db_session, 2)
+        for user, score in zip([async_test_user, *others], (100, 120, 110)):
+            await _add_result(async_db_session, user.id, score)
+        await async_db_session.commit()
+        group = await _create_group(async_db_session, async_test_user, others)
+        headers = {
+            "Authorization": "Bearer "
+            + create_access_token({"user_id": async_test_user.id})
+        }
+
+        first = await async_client.get(
+            f"/v1/groups/{group.id}/leaderboard?limit=2", headers=headers
+        )
+        assert first.status_code == 200
+        body = first.json()
+        assert [e["best_score"] for e in body["entries"]] == [120, 110]
+        assert body["total_count"] == 3
+        assert body["has_more"] is True
+
+        second = await async_client.get(
+            f"/v1/groups/{group.id}/leaderboard",
+            params={"limit": 2, "cursor": body["next_cursor"]},
+            headers=headers,
+        )
+        assert second.status_code == 200
+        page = second.json()
+        assert [(e["rank"], e["best_score"]) for e in page["entries"]] == [(3, 100)]
+        assert page["has_more"] is False
+        assert page["next_cursor"] is None
+
+    async def test_endpoint_rejects_cursor_with_days(
+        self, async_client, async_db_session, async_test_user
+    ):
+        group = await _create_group(async_db_session, async_test_user, [])
+        headers = {
+            "Authorization": "Bearer "
+            + create_access_token({"user_id": async_test_user.id})
+        }
+
+        response = await async_client.get(
+            f"/v1/groups/{group.id}/leaderboard",
+            params={"limit": 2, "days": 30, "cursor": encode_cursor(100, 1, 2)},
+            headers=headers,
+        )
+
+        assert response.status_code == 400
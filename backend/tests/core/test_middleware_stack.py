@@ -0,0 +1,94 @@
+"""
+Tests for the pure ASGI middleware stack (request logging, performance
+monitoring, security headers, request size limit and rate limiting).
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from starlette.testclient import TestClient
+
+from app.middleware import (
+    PerformanceMonitoringMiddleware,
+    RequestLoggingMiddleware,
+    RequestSizeLimitMiddleware,
+    SecurityHeadersMiddleware,
+)
+from app.ratelimit import InMemoryStorage, RateLimiter, RateLimitMiddleware
+
+
+@pytest.fixture
+def stack_client():
+    """Client for a small app wrapped in the full production middleware stack."""
+    app = FastAPI()
+    app.state.calls = 0
+
+    @app.get("/json")
+    async def json_endpoint():
+        app.state.calls += 1
+        return {"message": "ok"}
+
+    @app.get("/stream")
+    async def stream_endpoint():
+        return StreamingResponse(iter([b"a", b"b", b"c"]), media_type="text/plain")
+
+    @app.post("/upload")
+    async def upload_endpoint():
+        app.state.calls += 1
+        return {"message": "ok"}
+
+    limiter = RateLimiter(storage=InMemoryStorage(), default_limit=2, default_window=60)
+    app.add_middleware(RequestLoggingMiddleware)
+    app.add_middleware(PerformanceMonitoringMiddleware, slow_request_threshold=1.0)
+    app.add_middleware(SecurityHeadersMiddleware, hsts_enabled=True)
+    app.add_middleware(RequestSizeLimitMiddleware, max_body_size=16)
+    app.add_middleware(RateLimitMiddleware, limiter=limiter)
+
+    with TestClient(app) as client:
+        yield client
+
+
+class TestPureASGIMiddlewareStack:
+    """Behaviour of the middleware stack now that it no longer uses BaseHTTPMiddleware."""
+
+    def test_all_headers_added_to_json_response(self, stack_client):
+        """Test every layer contributes its headers to a normal response."""
+        response = stack_client.get("/json", headers={"X-Request-ID": "req-123"})
+
+        assert response.status_code == 200
+        assert response.json() == {"message": "ok"}
+        assert response.headers["X-Request-ID"] == "req-123"
+        assert float(response.headers["X-Process-Time"]) >= 0
+        assert response.headers["X-Frame-Options"] == "DENY"
+        assert "max-age=31536000" in response.headers["Strict-Transport-Security"]
+        assert response.headers["X-RateLimit-Limit"] == "2"
+        assert response.headers["X-RateLimit-Remaining"] == "1"
+
+    def test_streaming_response_gets_headers(self, stack_client):
+        """Test headers are added to streaming responses without buffering them."""
+        response = stack_client.get("/stream")
+
+        assert response.text == "abc"
+        assert "X-Request-ID" in response.headers
+        assert "X-Process-Time" in response.headers
+        assert response.headers["X-Content-Type-Options"] == "nosniff"
+
+    def test_oversized_body_rejected_before_endpoint(self, stack_client):
+        """Test the size limit answers 413 without calling the endpoint."""
+        response = stack_client.post("/upload", content=b"x" * 64)
+
+        assert response.status_code == 413
+        assert response.json() == {"detail": "Request body too large"}
+        assert stack_client.app.state.calls == 0
+
+    def test_rate_limited_request_short_circuits(self, stack_client):
+        """Test requests over the limit get a 429 and never reach the endpoint."""
+        for _ in range(2):
+            assert stack_client.get("/json").status_code == 200
+
+        response = stack_client.get("/json")
+
+        assert response.status_code == 429
+        assert response.json()["error"] == "rate_limit_exceeded"
+        assert response.headers["X-RateLimit-Remaining"] == "0"
+        assert stack_client.app.state.calls == 2
@@ -0,0 +1,363 @@
+"""
+Tests for the post-submission pipeline (durable queue + worker pool).
+"""
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import select
+
+from app.core.auth.security import create_access_token
+from app.core.datetime_utils import utc_now
+from app.core.post_submission import (
+    FIXED_FORM_STAGES,
+    PostSubmissionWorkerPool,
+    claim_next_job,
+    compute_retry_delay,
+    enqueue_post_submission_jobs,
+    record_job_failure,
+)
+from app.core.post_submission.queue import (
+    RETRY_MAX_DELAY_SECONDS,
+    STAGE_SHADOW_CAT,
+    STAGE_VALIDITY_ANALYSIS,
+)
+from app.core.post_submission.stages import STAGE_HANDLERS
+from app.models import Question, TestResult, TestSession, UserQuestion
+from app.models.models import (
+    DifficultyLevel,
+    PostSubmissionJob,
+    PostSubmissionJobStatus,
+    QuestionType,
+    Response,
+    TestStatus,
+)
+from tests.conftest import AsyncTestingSessionLocal
+
+
+async def _create_completed_session(db, user, n_questions=5):
+    """Create a completed fixed-form session with responses and a TestResult."""
+    questions = [
+        Question(
+            question_text=f"Question {i}",
+            question_type=QuestionType.PATTERN,
+            difficulty_level=DifficultyLevel.MEDIUM,
+            correct_answer="A",
+            answer_options={"A": "1", "B": "2", "C": "3", "D": "4"},
+            explanation="",
+            source_llm="test-llm",
+            judge_score=0.9,
+            is_active=True,
+        )
+        for i in range(n_questions)
+    ]
+    db.add_all(questions)
+    await db.flush()
+
+    now = utc_now()
+    session = TestSession(
+        user_id=user.id,
+        status=TestStatus.COMPLETED,
+        started_at=now - timedelta(minutes=10),
+        completed_at=now,
+    )
+    db.add(session)
+    await db.flush()
+
+    for i, question in enumerate(questions):
+        db.add(
+            Response(
+                test_session_id=session.id,
+                user_id=user.id,
+                question_id=question.id,
+                user_answer="A" if i % 2 == 0 else "B",
+                is_correct=i % 2 == 0,
+                answered_at=now,
+                time_spent_seconds=30,
+            )
+        )
+
+    db.add(
+        TestResult(
+            test_session_id=session.id,
+            user_id=user.id,
+            iq_score=100,
+            total_questions=n_questions,
+            correct_answers=(n_questions + 1) // 2,
+            completed_at=now,
+        )
+    )
+    await db.commit()
+    return session
+
+
+class TestComputeRetryDelay:
+    """Tests for exponential retry backoff."""
+
+    def test_doubles_per_attempt(self):
+        assert compute_retry_delay(2) == pytest.approx(2 * compute_retry_delay(1))
+        assert compute_retry_delay(3) == pytest.approx(4 * compute_retry_delay(1))
+
+    def test_capped_at_maximum(self):
+        assert compute_retry_delay(50) == RETRY_MAX_DELAY_SECONDS
+
+
+class TestQueue:
+    """Tests for enqueue, claim, and failure bookkeeping."""
+
+    async def test_enqueue_and_claim(self, async_db_session, async_test_user):
+        session = await _create_completed_session(async_db_session, async_test_user)
+        enqueue_post_submission_jobs(
+            async_db_session, session.id, [STAGE_VALIDITY_ANALYSIS]
+        )
+        await async_db_session.commit()
+
+        job = await claim_next_job(async_db_session, lease_seconds=300)
+
+        assert job is not None
+        assert job.stage == STAGE_VALIDITY_ANALYSIS
+        assert job.status == PostSubmissionJobStatus.RUNNING
+        assert job.attempts == 1
+        assert job.locked_at is not None
+        # Nothing else is runnable while the lease is held
+        assert await claim_next_job(async_db_session, lease_seconds=300) is None
+
+    async def test_expired_lease_is_reclaimed(self, async_db_session, async_test_user):
+        session = await _create_completed_session(async_db_session, async_test_user)
+        enqueue_post_submission_jobs(
+            async_db_session, session.id, [STAGE_VALIDITY_ANALYSIS]
+        )
+        await async_db_session.commit()
+        job = await claim_next_job(async_db_session, lease_seconds=300)
+        job.locked_at = utc_now() - timedelta(seconds=600)
+        await async_db_session.commit()
+
+        reclaimed = await claim_next_job(async_db_session, lease_seconds=300)
+
+        assert reclaimed is not None
+        assert reclaimed.id == job.id
+        assert reclaimed.attempts == 2
+
+    async def test_failure_schedules_retry_then_fails(
+        self, async_db_session, async_test_user
+    ):
+        session = await _create_completed_session(async_db_session, async_test_user)
+        enqueue_post_submission_jobs(
+            async_db_session, session.id, [STAGE_VALIDITY_ANALYSIS], max_attempts=2
+        )
+        await async_db_session.commit()
+
+        job = await claim_next_job(async_db_session, lease_seconds=300)
+        job = await record_job_failure(async_db_session, job.id, RuntimeError("boom"))
+        assert job.status == PostSubmissionJobStatus.PENDING
+        assert "boom" in job.last_error
+        # Backed off, so not immediately claimable
+        assert await claim_next_job(async_db_session, lease_seconds=300) is None
+
+        job.run_after = utc_now() - timedelta(seconds=1)
+        await async_db_session.commit()
+        job = await claim_next_job(async_db_session, lease_seconds=300)
+        job = await record_job_failure(async_db_session, job.id, RuntimeError("boom"))
+        assert job.status == PostSubmissionJobStatus.FAILED
+
+
+class TestWorkerPool:
+    """Tests for running stages through the worker pool."""
+
+    async def test_drain_runs_all_stages(self, async_db_session, async_test_user):
+        session = await _create_completed_session(async_db_session, async_test_user)
+        enqueue_post_submission_jobs(
+            async_db_session,
+            session.id,
+            FIXED_FORM_STAGES,
+            payload={"correct_count": 3, "response_count": 5},
+        )
+        await async_db_session.commit()
+
+        shadow_stage = AsyncMock()
+        pool = PostSubmissionWorkerPool(session_factory=AsyncTestingSessionLocal)
+        with patch.dict(STAGE_HANDLERS, {STAGE_SHADOW_CAT: shadow_stage}):
+            processed = await pool.drain()
+
+        assert processed == len(FIXED_FORM_STAGES)
+        shadow_stage.assert_awaited_once()
+
+        async with AsyncTestingSessionLocal() as db:
+            statuses = (
+                (await db.execute(select(PostSubmissionJob.status))).scalars().all()
+            )
+            assert set(statuses) == {PostSubmissionJobStatus.COMPLETED}
+
+            result = (
+                await db.execute(
+                    select(TestResult).where(TestResult.test_session_id == session.id)
+                )
+            ).scalar_one()
+            assert result.validity_checked_at is not None
+            assert result.response_time_flags is not None
+
+    async def test_failed_stage_is_rolled_back_and_retried(
+        self, async_db_session, async_test_user
+    ):
+        session = await _create_completed_session(async_db_session, async_test_user)
+        enqueue_post_submission_jobs(
+            async_db_session, session.id, [STAGE_VALIDITY_ANALYSIS]
+        )
+        await async_db_session.commit()
+
+        failing_stage = AsyncMock(side_effect=RuntimeError("transient"))
+        pool = PostSubmissionWorkerPool(session_factory=AsyncTestingSessionLocal)
+        with patch.dict(STAGE_HANDLERS, {STAGE_VALIDITY_ANALYSIS: failing_stage}):
+            assert await pool.run_once() is True
+
+        async with AsyncTestingSessionLocal() as db:
+            job = (await db.execute(select(PostSubmissionJob))).scalar_one()
+            assert job.status == PostSubmissionJobStatus.PENDING
+            assert job.completed_at is None
+            assert job.attempts == 1
+
+    async def test_lost_lease_writes_nothing(self, async_db_session, async_test_user):
+        session = await _create_completed_session(async_db_session, async_test_user)
+        enqueue_post_submission_jobs(
+            async_db_session, session.id, [STAGE_VALIDITY_ANALYSIS]
+        )
+        await async_db_session.commit()
+
+        job = await claim_next_job(async_db_session, lease_seconds=300)
+        claimed_attempt = job.attempts
+        # Lease expires and another worker reclaims the job
+        job.locked_at = utc_now() - timedelta(seconds=600)
+        await async_db_session.commit()
+        assert await claim_next_job(async_db_session, lease_seconds=300) is not None
+
+        stage = AsyncMock()
+        pool = PostSubmissionWorkerPool(session_factory=AsyncTestingSessionLocal)
+        with patch.dict(STAGE_HANDLERS, {STAGE_VALIDITY_ANALYSIS: stage}):
+            await pool._execute(job.id, claimed_attempt)
+        stage.assert_not_awaited()
+
+        async with AsyncTestingSessionLocal() as db:
+            assert (
+                await record_job_failure(
+                    db, job.id, RuntimeError("late"), claimed_attempt=claimed_attempt
+                )
+                is None
+            )
+            stored = await db.get(PostSubmissionJob, job.id)
+            assert stored.status == PostSubmissionJobStatus.RUNNING
+            assert stored.attempts == claimed_attempt + 1
+            assert stored.completed_at is None
+            assert stored.last_error is None
+
+    async def test_shadow_cat_failure_is_retried(
+        self, async_db_session, async_test_user
+    ):
+        session = await _create_completed_session(async_db_session, async_test_user)
+        enqueue_post_submission_jobs(async_db_session, session.id, [STAGE_SHADOW_CAT])
+        await async_db_session.commit()
+
+        pool = PostSubmissionWorkerPool(session_factory=AsyncTestingSessionLocal)
+        with patch(
+            "app.core.shadow_cat.executor._run_with_own_session",
+            side_effect=RuntimeError("replay failed"),
+        ):
+            assert await pool.run_once() is True
+
+        async with AsyncTestingSessionLocal() as db:
+            job = (await db.execute(select(PostSubmissionJob))).scalar_one()
+            assert job.status == PostSubmissionJobStatus.PENDING
+            assert "replay failed" in job.last_error
+
+    async def test_start_and_stop(self):
+        pool = PostSubmissionWorkerPool(
+            concurrency=2,
+            poll_interval_seconds=0.01,
+            session_factory=AsyncTestingSessionLocal,
+        )
+        with patch.object(pool, "run_once", AsyncMock(return_value=False)):
+            pool.start()
+            assert pool.is_running
+            pool.notify()
+            await pool.stop(timeout=1.0)
+        assert not pool.is_running
+
+    def test_rejects_non_positive_concurrency(self):
+        with pytest.raises(ValueError):
+            PostSubmissionWorkerPool(concurrency=0)
+
+
+class TestSubmitWithPipeline:
+    """Tests for POST /v1/test/submit with the pipeline enabled."""
+
+    async def test_submit_defers_non_scoring_stages(
+        self, async_client, async_db_session, async_test_user
+    ):
+        questions = [
+            Question(
+                question_text=f"Question {i}",
+                question_type=QuestionType.MATH,
+                difficulty_level=DifficultyLevel.EASY,
+                correct_answer="A",
+                answer_options={"A": "1", "B": "2"},
+                explanation="",
+                source_llm="test-llm",
+                judge_score=0.9,
+                is_active=True,
+            )
+            for i in range(3)
+        ]
+        async_db_session.add_all(questions)
+        session = TestSession(
+            user_id=async_test_user.id,
+            status=TestStatus.IN_PROGRESS,
+            started_at=utc_now() - timedelta(minutes=5),
+        )
+        async_db_session.add(session)
+        await async_db_session.flush()
+        for question in questions:
+            async_db_session.add(
+                UserQuestion(
+                    user_id=async_test_user.id,
+                    question_id=question.id,
+                    seen_at=utc_now(),
+                )
+            )
+        await async_db_session.commit()
+
+        headers = {
+            "Authorization": "Bearer "
+            + create_access_token({"user_id": async_test_user.id})
+        }
+        submission = {
+            "session_id": session.id,
+            "responses": [{"question_id": q.id, "user_answer": "A"} for q in questions],
+        }
+
+        with (
+            patch("app.api.v1.test.settings.POST_SUBMISSION_PIPELINE_ENABLED", True),
+            patch("app.api.v1.test._run_post_submission_updates") as inline_updates,
+            patch("app.api.v1.test._trigger_shadow_cat") as shadow_thread,
+        ):
+            response = await async_client.post(
+                "/v1/test/submit", json=submission, headers=headers
+            )
+
+        assert response.status_code == 200
+        assert response.json()["result"]["iq_score"] is not None
+        inline_updates.assert_not_called()
+        shadow_thread.assert_not_called()
+
+        jobs = (
+            (
+                await async_db_session.execute(
+                    select(PostSubmissionJob).where(
+                        PostSubmissionJob.test_session_id == session.id
+                    )
+                )
+            )
+            .scalars()
+            .all()
+        )
+        assert {job.stage for job in jobs} == set(FIXED_FORM_STAGES)
+        assert all(job.payload["response_count"] == 3 for job in jobs)
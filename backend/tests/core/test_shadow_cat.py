@@ -7,8 +7,12 @@ Tests cover:
 - Graceful skip when test result missing
 - Idempotency (no duplicate shadow results)
 - Error handling (exceptions logged, never raised)
+- Bounded executor for live runs
+- Batch catch-up for sessions missing a shadow result
 """
 
+import threading
+
 import pytest
 from unittest.mock import patch
 from datetime import datetime, timezone
@@ -18,6 +22,12 @@ from app.core.shadow_cat.runner import (
     _fetch_calibrated_responses,
     _execute_shadow_cat,
 )
+from app.core.shadow_cat.catchup import (
+    find_sessions_missing_shadow_results,
+    load_item_bank,
+    run_shadow_cat_catchup,
+)
+from app.core.shadow_cat.executor import ShadowCATExecutor
 from app.models.models import (
     Question,
     QuestionType,
@@ -300,6 +310,15 @@ class TestRunShadowCat:
             result = run_shadow_cat(db, completed_session.id)
             assert result is None
 
+    def test_db_error_raised_when_requested(self, db, completed_session):
+        """raise_errors surfaces failures so a retrying caller can react."""
+        with patch(
+            "app.core.shadow_cat.runner._fetch_calibrated_responses",
+            side_effect=Exception("DB connection lost"),
+        ):
+            with pytest.raises(Exception, match="DB connection lost"):
+                run_shadow_cat(db, completed_session.id, raise_errors=True)
+
 
 class TestFetchCalibratedResponses:
     """Tests for _fetch_calibrated_responses helper."""
@@ -392,3 +411,132 @@ class TestExecuteShadowCat:
         )
 
         assert result.theta_iq_delta == result.shadow_iq - 110
+
+
+class TestShadowCATExecutor:
+    """Tests for the bounded live shadow CAT executor."""
+
+    def test_submit_runs_session(self):
+        executor = ShadowCATExecutor(max_workers=1, max_queue_size=1)
+        with patch("app.core.shadow_cat.executor._run_with_own_session") as run:
+            future = executor.submit(42)
+            assert future is not None
+            future.result(timeout=5)
+        executor.shutdown()
+
+        run.assert_called_once_with(42)
+
+    def test_drops_when_saturated(self):
+        release = threading.Event()
+        executor = ShadowCATExecutor(max_workers=1, max_queue_size=1)
+        with patch(
+            "app.core.shadow_cat.executor._run_with_own_session",
+            side_effect=lambda _: release.wait(5),
+        ):
+            running = executor.submit(1)
+            queued = executor.submit(2)
+            dropped = executor.submit(3)
+
+            assert running is not None
+            assert queued is not None
+            assert dropped is None
+            assert executor.dropped_count == 1
+
+            release.set()
+            running.result(timeout=5)
+            queued.result(timeout=5)
+            # Slots are released once runs finish
+            accepted = executor.submit(4)
+            assert accepted is not None
+            accepted.result(timeout=5)
+        executor.shutdown()
+
+    def test_rejects_invalid_sizes(self):
+        with pytest.raises(ValueError):
+            ShadowCATExecutor(max_workers=0)
+        with pytest.raises(ValueError):
+            ShadowCATExecutor(max_queue_size=-1)
+
+
+class TestShadowCATCatchup:
+    """Tests for the batch catch-up path."""
+
+    def test_item_bank_contains_only_calibrated(
+        self, db, calibrated_questions, uncalibrated_questions
+    ):
+        bank = load_item_bank(db)
+
+        assert set(bank) == {q.id for q in calibrated_questions}
+
+    def test_finds_sessions_without_results(self, db, completed_session):
+        missing = find_sessions_missing_shadow_results(db)
+        assert missing == [(completed_session.id, completed_session.user_id, 100)]
+
+        run_shadow_cat(db, completed_session.id)
+        assert find_sessions_missing_shadow_results(db) == []
+
+    def test_catchup_matches_live_run(self, db, completed_session):
+        summary = run_shadow_cat_catchup(db, workers=1)
+
+        assert summary.scanned == 1
+        assert summary.inserted == 1
+        stored = (
+            db.query(ShadowCATResult)
+            .filter(ShadowCATResult.test_session_id == completed_session.id)
+            .one()
+        )
+        responses = _fetch_calibrated_responses(db, completed_session.id)
+        live = _execute_shadow_cat(
+            responses_with_irt=responses,
+            session_id=completed_session.id,
+            user_id=completed_session.user_id,
+            actual_iq=100,
+        )
+        assert stored.shadow_theta == pytest.approx(live.shadow_theta)
+        assert stored.administered_question_ids == live.administered_question_ids
+        assert stored.execution_time_ms is not None
+
+    def test_dry_run_writes_nothing(self, db, completed_session):
+        summary = run_shadow_cat_catchup(db, workers=1, dry_run=True)
+
+        assert summary.computed == 1
+        assert summary.inserted == 0
+        assert db.query(ShadowCATResult).count() == 0
+
+    def test_skips_sessions_with_too_few_calibrated_items(
+        self, db, user, uncalibrated_questions
+    ):
+        session = TestSession(
+            user_id=user.id,
+            status=TestStatus.COMPLETED,
+            is_adaptive=False,
+            completed_at=datetime.now(timezone.utc),
+        )
+        db.add(session)
+        db.flush()
+        for q in uncalibrated_questions:
+            db.add(
+                Response(
+                    test_session_id=session.id,
+                    user_id=user.id,
+                    question_id=q.id,
+                    user_answer="A",
+                    is_correct=True,
+                    answered_at=datetime.now(timezone.utc),
+                )
+            )
+        db.add(
+            TestResult(
+                test_session_id=session.id,
+                user_id=user.id,
+                iq_score=100,
+                total_questions=5,
+                correct_answers=5,
+            )
+        )
+        db.commit()
+
+        summary = run_shadow_cat_catchup(db, workers=1)
+
+        assert summary.skipped == 1
+        assert summary.inserted == 0
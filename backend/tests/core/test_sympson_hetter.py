@@ -0,0 +1,181 @@
+"""
+Tests for Sympson-Hetter exposure control (TASK-868).
+"""
+
+import random
+from datetime import datetime
+
+import pytest
+
+from app.core.cat.item_selection import select_next_item
+from app.core.cat.simulation import SimulationConfig, generate_item_bank
+from app.core.cat.sympson_hetter import (
+    SympsonHetterResult,
+    compute_exposure_parameters,
+    serialize_exposure_parameters,
+    update_exposure_parameters,
+)
+from app.core.system_config import get_exposure_parameters, set_exposure_parameters
+
+DOMAIN_WEIGHTS = {
+    "pattern": 0.22,
+    "logic": 0.20,
+    "verbal": 0.19,
+    "spatial": 0.16,
+    "math": 0.13,
+    "memory": 0.10,
+}
+
+
+class TestUpdateExposureParameters:
+    """Tests for the adjustment step."""
+
+    def test_restricts_overexposed_items(self):
+        """Test K_i = r_max / P(S_i) for items selected too often."""
+        updated = update_exposure_parameters(
+            parameters={1: 0.5},
+            exposure_rates={1: 0.2, 2: 0.4, 3: 0.1},
+            target_rate=0.2,
+        )
+
+        # Item 1: P(S) = 0.2 / 0.5 = 0.4 -> K = 0.5; item 2: P(S) = 0.4 -> K = 0.5
+        assert updated == {1: pytest.approx(0.5), 2: pytest.approx(0.5)}
+
+    def test_releases_items_under_target(self):
+        """Test items selected at most r_max of the time get K_i = 1."""
+        updated = update_exposure_parameters(
+            parameters={1: 0.5, 2: 0.3},
+            exposure_rates={1: 0.05},
+            target_rate=0.2,
+        )
+
+        assert updated == {}
+
+
+class TestSelectionWithExposureParameters:
+    """Tests for select_next_item with Sympson-Hetter parameters."""
+
+    def test_restricted_item_rarely_administered(self):
+        """Test an item with a small K_i is mostly passed over."""
+        bank = generate_item_bank(n_items_per_domain=5)
+        coverage = {domain: 2 for domain in DOMAIN_WEIGHTS}
+        best = select_next_item(bank, 0.0, set(), coverage, {}, randomesque_k=1)
+
+        rng = random.Random(7)
+        picks = [
+            select_next_item(
+                bank,
+                0.0,
+                set(),
+                coverage,
+                {},
+                randomesque_k=1,
+                exposure_parameters={best.id: 0.1},
+                rng=rng,
+            ).id
+            for _ in range(500)
+        ]
+
+        assert 20 < picks.count(best.id) < 80
+
+    def test_last_candidate_always_administered(self):
+        """Test selection still returns an item when every pick is rejected."""
+        bank = generate_item_bank(n_items_per_domain=1, domains=["pattern"])
+        parameters = {item.id: 1e-9 for item in bank}
+
+        selected = select_next_item(
+            bank,
+            0.0,
+            set(),
+            {"pattern": 2},
+            {},
+            exposure_parameters=parameters,
+            rng=random.Random(1),
+        )
+
+        assert selected is bank[0]
+
+    def test_rejected_item_excluded_for_rest_of_session(self):
+        """Test a rejected item is recorded and never drawn again."""
+        bank = generate_item_bank(n_items_per_domain=5)
+        coverage = {domain: 2 for domain in DOMAIN_WEIGHTS}
+        best = select_next_item(bank, 0.0, set(), coverage, {}, randomesque_k=1)
+
+        rejected = set()
+        first = select_next_item(
+            bank,
+            0.0,
+            set(),
+            coverage,
+            {},
+            randomesque_k=1,
+            exposure_parameters={best.id: 1e-9},
+            rejected_items=rejected,
+            rng=random.Random(3),
+        )
+        assert first is not best
+        assert rejected == {best.id}
+
+        # Even with the restriction lifted, the session never draws it again
+        picks = {
+            select_next_item(
+                bank,
+                0.0,
+                {first.id},
+                coverage,
+                {},
+                randomesque_k=1,
+                rejected_items=rejected,
+            ).id
+            for _ in range(20)
+        }
+        assert best.id not in picks
+
+
+class TestComputeExposureParameters:
+    """Tests for the simulation-based computation."""
+
+    def test_bounds_maximum_exposure(self):
+        """Test the computed parameters bring the maximum exposure down."""
+        bank = generate_item_bank(n_items_per_domain=12)
+        config = SimulationConfig(n_examinees=150, max_items=10, seed=3)
+
+        result = compute_exposure_parameters(
+            bank, config=config, target_rate=0.3, max_iterations=6, tolerance=0.05
+        )
+        unrestricted = compute_exposure_parameters(
+            bank, config=config, target_rate=1.0, max_iterations=1
+        )
+
+        assert result.exposure_parameters
+        assert all(0 < k < 1 for k in result.exposure_parameters.values())
+        assert result.max_exposure_rate < unrestricted.max_exposure_rate
+        assert result.converged is (result.max_exposure_rate <= 0.35)
+
+    def test_rejects_empty_bank(self):
+        """Test an empty item bank is an error."""
+        with pytest.raises(ValueError):
+            compute_exposure_parameters([])
+
+
+class TestStoredParameters:
+    """Tests for persisting parameters in SystemConfig."""
+
+    def test_round_trip_through_system_config(self, db_session):
+        """Test stored parameters are read back keyed by question ID."""
+        result = SympsonHetterResult(
+            exposure_parameters={12: 0.41234567, 3: 0.9},
+            target_rate=0.2,
+            iterations=4,
+            max_exposure_rate=0.2031,
+            converged=True,
+        )
+        assert get_exposure_parameters(db_session) == {}
+
+        set_exposure_parameters(
+            db_session, serialize_exposure_parameters(result, datetime(2026, 1, 1))
+        )
+
+        parameters = get_exposure_parameters(db_session)
+        assert parameters == {12: 0.4123, 3: 0.9}
+        assert get_exposure_parameters(db_session) is parameters
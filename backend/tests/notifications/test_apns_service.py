@@ -2,7 +2,10 @@
 Tests for the Apple Push Notification service (APNs) integration.
 """
 
+import asyncio
+
 import pytest
+from aioapns.common import NotificationResult
 from unittest.mock import AsyncMock, patch
 
 from app.models.models import NotificationType
@@ -371,6 +374,64 @@ class TestAPNsService:
         assert result["success"] == 1
         assert result["failed"] == 0
 
+    @pytest.mark.asyncio
+    async def test_rejected_send_reports_failure_and_invalid_token(self):
+        """Test that an APNs rejection fails the send and surfaces dead tokens."""
+        service = APNsService()
+
+        mock_client = AsyncMock()
+        mock_client.send_notification.side_effect = [
+            NotificationResult("id1", "200"),
+            NotificationResult("id2", "410", "Unregistered"),
+            NotificationResult("id3", "429", "TooManyRequests"),
+        ]
+        service._client = mock_client
+
+        notifications = [
+            {"device_token": "token1", "title": "Test 1", "body": "Body 1"},
+            {"device_token": "token2", "title": "Test 2", "body": "Body 2"},
+            {"device_token": "token3", "title": "Test 3", "body": "Body 3"},
+        ]
+
+        result = await service.send_batch_notifications(notifications)
+
+        assert result["per_result"] == [True, False, False]
+        # Throttling is transient; only the unregistered token is invalid
+        assert result["invalid_tokens"] == ["token2"]
+
+        # Invalid tokens are reported once, with the batch that produced them
+        mock_client.send_notification.side_effect = None
+        result = await service.send_batch_notifications(notifications[:1])
+        assert result["invalid_tokens"] == []
+
+    @pytest.mark.asyncio
+    async def test_send_batch_bounds_in_flight_sends(self):
+        """Test that no more than max_concurrent_sends are in flight at once."""
+        service = APNsService(max_concurrent_sends=2)
+        in_flight = 0
+        peak = 0
+
+        async def slow_send(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        mock_client = AsyncMock()
+        mock_client.send_notification.side_effect = slow_send
+        service._client = mock_client
+
+        notifications = [
+            {"device_token": f"token{i}", "title": "Test", "body": "Body"}
+            for i in range(10)
+        ]
+
+        result = await service.send_batch_notifications(notifications)
+
+        assert result["success"] == 10
+        assert peak == 2
+
 
 class TestSendNotificationMetricsWiring:
     """Tests that send_notification emits notification metrics correctly."""
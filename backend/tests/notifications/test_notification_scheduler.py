@@ -16,9 +16,13 @@ from app.services.notification_scheduler import (
     DAY_30_NOTIFICATION_WINDOW_DAYS,
     NotificationScheduler,
     calculate_next_test_date,
+    clear_invalid_device_tokens,
     get_users_due_for_test,
     get_users_for_day_30_reminder,
     get_users_never_tested,
+    iter_users_due_for_test,
+    iter_users_for_day_30_reminder,
+    iter_users_never_tested,
 )
 from app.core.config import settings
 from app.core.auth.security import hash_password
@@ -917,3 +921,158 @@ class TestGranularRetryTracking:
         assert user1.day_30_reminder_sent_at is not None
         # Second user should NOT be marked (eligible for retry)
         assert user2.day_30_reminder_sent_at is None
+
+
+class TestStreamingSends:
+    """Tests for paged sends over a shared APNs connection."""
+
+    @pytest.mark.asyncio
+    async def test_pages_share_one_connection(self, async_db_session):
+        """Test that each page is one batch and all pages reuse one client."""
+        ninety_days_ago = utc_now() - timedelta(days=settings.TEST_CADENCE_DAYS)
+        for i in range(3):
+            user = User(
+                email=f"page_user{i}@example.com",
+                password_hash=hash_password("testpassword123"),
+                first_name=f"Page{i}",
+                last_name="User",
+                notification_enabled=True,
+                apns_device_token=f"pagetoken{i}" + "0" * 30,
+            )
+            async_db_session.add(user)
+            await async_db_session.commit()
+            await async_db_session.refresh(user)
+            await create_test_result(async_db_session, user.id, ninety_days_ago)
+
+        mock_apns = AsyncMock()
+        mock_apns.send_batch_notifications = AsyncMock(
+            return_value={"success": 1, "failed": 0, "per_result": [True]}
+        )
+        scheduler = NotificationScheduler(async_db_session, apns_service=mock_apns)
+
+        with patch(
+            "app.services.notification_scheduler.settings.NOTIFICATION_SEND_BATCH_SIZE",
+            1,
+        ):
+            results = await scheduler.send_notifications_to_users()
+
+        assert results == {"total": 3, "success": 3, "failed": 0}
+        assert mock_apns.send_batch_notifications.await_count == 3
+        # The caller owns the shared connection
+        mock_apns.connect.assert_not_called()
+        mock_apns.disconnect.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_invalid_tokens_are_cleared(
+        self, async_db_session, user_with_device_token
+    ):
+        """Test that tokens APNs reports as invalid are removed after the send."""
+        ninety_days_ago = utc_now() - timedelta(days=settings.TEST_CADENCE_DAYS)
+        await create_test_result(
+            async_db_session, user_with_device_token.id, ninety_days_ago
+        )
+        token = user_with_device_token.apns_device_token
+
+        mock_apns = AsyncMock()
+        mock_apns.send_batch_notifications = AsyncMock(
+            return_value={
+                "success": 0,
+                "failed": 1,
+                "per_result": [False],
+                "invalid_tokens": [token],
+            }
+        )
+        scheduler = NotificationScheduler(async_db_session, apns_service=mock_apns)
+        await scheduler.send_notifications_to_users()
+
+        await async_db_session.refresh(user_with_device_token)
+        assert user_with_device_token.apns_device_token is None
+
+    @pytest.mark.asyncio
+    async def test_clear_invalid_device_tokens_ignores_empty(self, async_db_session):
+        """Test that clearing no tokens is a no-op."""
+        assert await clear_invalid_device_tokens(async_db_session, []) == 0
+
+
+async def _collect(chunks):
+    """Drain an async chunk iterator into (chunk sizes, flat rows)."""
+    sizes, rows = [], []
+    async for chunk in chunks:
+        sizes.append(len(chunk))
+        rows.extend(chunk)
+    return sizes, rows
+
+
+class TestStreamingSelection:
+    """Tests for keyset-paginated recipient queries."""
+
+    @pytest.mark.asyncio
+    async def test_due_users_streamed_in_pages(self, async_db_session):
+        """Test that due users come back as narrow rows across keyset pages."""
+        ninety_days_ago = utc_now() - timedelta(days=settings.TEST_CADENCE_DAYS)
+        recent = utc_now() - timedelta(days=10)
+        expected = {}
+        for i, completed_at in enumerate(
+            [ninety_days_ago, recent, ninety_days_ago, ninety_days_ago]
+        ):
+            user = User(
+                email=f"stream_user{i}@example.com",
+                password_hash=hash_password("testpassword123"),
+                first_name=f"Stream{i}",
+                last_name="User",
+                notification_enabled=True,
+                apns_device_token=f"streamtoken{i}" + "0" * 28,
+            )
+            async_db_session.add(user)
+            await async_db_session.commit()
+            await async_db_session.refresh(user)
+            result = await create_test_result(async_db_session, user.id, completed_at)
+            if completed_at == ninety_days_ago:
+                expected[user.id] = result.id
+
+        sizes, rows = await _collect(
+            iter_users_due_for_test(async_db_session, chunk_size=2)
+        )
+
+        # Not-due users are filtered in SQL, so only the three due users are paged
+        assert sizes == [2, 1]
+        assert {row.user_id: row.result_id for row in rows} == expected
+        assert all(row.device_token.startswith("streamtoken") for row in rows)
+
+    @pytest.mark.asyncio
+    async def test_due_users_match_list_query(
+        self, async_db_session, user_with_device_token, user_without_device_token
+    ):
+        """Test that the streaming query selects the same users as the list query."""
+        ninety_days_ago = utc_now() - timedelta(days=settings.TEST_CADENCE_DAYS)
+        for user in (user_with_device_token, user_without_device_token):
+            await create_test_result(async_db_session, user.id, ninety_days_ago)
+
+        _, rows = await _collect(iter_users_due_for_test(async_db_session))
+        users = await get_users_due_for_test(async_db_session)
+
+        assert [row.user_id for row in rows] == [user.id for user in users]
+
+    @pytest.mark.asyncio
+    async def test_never_tested_users(self, async_db_session, user_with_device_token):
+        """Test that never-tested users stream with no result id."""
+        _, rows = await _collect(iter_users_never_tested(async_db_session))
+
+        assert [row.user_id for row in rows] == [user_with_device_token.id]
+        assert rows[0].result_id is None
+
+    @pytest.mark.asyncio
+    async def test_day_30_users_carry_first_result(
+        self, async_db_session, user_with_device_token
+    ):
+        """Test that Day 30 rows deep-link to the user's first result."""
+        thirty_days_ago = utc_now() - timedelta(days=DAY_30_REMINDER_DAYS)
+        result = await create_test_result(
+            async_db_session, user_with_device_token.id, thirty_days_ago
+        )
+
+        _, rows = await _collect(iter_users_for_day_30_reminder(async_db_session))
+
+        assert [(row.user_id, row.result_id) for row in rows] == [
+            (user_with_device_token.id, result.id)
+        ]
@@ -4,12 +4,19 @@ These tests verify that:
 1. The Question model has the question_embedding column
 2. Embeddings can be stored and retrieved correctly
 3. The embedding dimension is correct (1536)
+4. Compact float32/int8 embeddings round-trip through the codec
 """
 
+import numpy as np
 import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
 
+from app.core.embedding_codec import (
+    decode_embedding,
+    encode_embedding,
+    legacy_embedding_model,
+)
 from app.models.models import Question, QuestionType, DifficultyLevel
 
 
@@ -157,3 +164,68 @@ def test_embedding_persistence_after_update(db_session: Session):
     # Verify embedding persisted
     assert reloaded.question_embedding == original_embedding
     assert reloaded.question_text == "Updated text"
+
+
+def test_compact_embedding_round_trip(db_session: Session):
+    """Test that compact float32 embeddings persist and decode to a view."""
+    vector = np.linspace(-1.0, 1.0, 1536)
+    encoded = encode_embedding(vector, "text-embedding-3-small")
+
+    question = Question(
+        question_text="Compact question",
+        question_type=QuestionType.LOGIC,
+        difficulty_level=DifficultyLevel.MEDIUM,
+        correct_answer="A",
+        is_active=True,
+        **encoded.column_values(),
+    )
+    db_session.add(question)
+    db_session.commit()
+    db_session.expire(question)
+
+    assert question.embedding_model == "text-embedding-3-small"
+    assert question.embedding_dim == 1536
+    assert len(question.embedding_vector) == 1536 * 4
+
+    decoded = decode_embedding(question.embedding_vector, question.embedding_encoding)
+    assert decoded.dtype == np.float32
+    assert not decoded.flags.owndata
+    np.testing.assert_allclose(decoded, vector, rtol=1e-6)
+
+
+def test_int8_embedding_preserves_cosine_similarity():
+    """Test that int8 quantization keeps cosine similarity close to float."""
+    rng = np.random.default_rng(0)
+    a = rng.normal(size=1536)
+    b = a + rng.normal(scale=0.5, size=1536)
+
+    encoded_a = encode_embedding(a, "text-embedding-3-small", encoding="int8")
+    encoded_b = encode_embedding(b, "text-embedding-3-small", encoding="int8")
+    assert len(encoded_a.data) == 1536
+
+    qa = decode_embedding(encoded_a.data, "int8").astype(np.float32)
+    qb = decode_embedding(encoded_b.data, "int8").astype(np.float32)
+
+    def cosine(x, y):
+        return float(np.dot(x, y) / (np.linalg.norm(x) * np.linalg.norm(y)))
+
+    assert cosine(qa, qb) == pytest.approx(cosine(a, b), abs=1e-3)
+
+    dequantized = decode_embedding(
+        encoded_a.data, "int8", encoded_a.scale, dequantize=True
+    )
+    np.testing.assert_allclose(dequantized, a, atol=encoded_a.scale)
+
+
+def test_decode_embedding_rejects_bad_input():
+    """Test that decoding validates the encoding and byte length."""
+    with pytest.raises(ValueError):
+        decode_embedding(b"\x00" * 6, "float32")
+    with pytest.raises(ValueError):
+        decode_embedding(b"\x00" * 8, "float16")
+
+
+def test_legacy_embedding_model_by_dimension():
+    """Test inferring the model of legacy embeddings from their dimension."""
+    assert legacy_embedding_model(1536) == "text-embedding-3-small"
+    assert legacy_embedding_model(768) == "text-embedding-004"
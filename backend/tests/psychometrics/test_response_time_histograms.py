@@ -0,0 +1,230 @@
+"""
+Tests for the persisted response-time histograms (TASK-836).
+
+Tests cover:
+- Exactness of histogram percentile statistics vs. sorting raw times
+- Folding completed sessions exactly once (refresh and async fold)
+- Rebuilding the histograms after responses are deleted
+- Reads follow a question's current difficulty after recalibration
+"""
+
+import random
+
+import pytest
+from sqlalchemy import select
+
+from app.core.psychometrics.response_time_histograms import (
+    async_fold_session_response_times,
+    load_response_time_histograms,
+    merge_histograms,
+    rebuild_response_time_histograms,
+    refresh_response_time_histograms,
+)
+from app.core.psychometrics.time_analysis import (
+    _compute_histogram_percentile_stats,
+    _compute_percentile_stats,
+    get_response_time_percentiles,
+)
+from app.models.models import (
+    DifficultyLevel,
+    Question,
+    QuestionType,
+    Response,
+    TestSession,
+    TestStatus,
+    User,
+)
+
+
+def _histogram(times):
+    histogram = {}
+    for t in times:
+        histogram[t] = histogram.get(t, 0) + 1
+    return histogram
+
+
+def _add_sessions(db, user, question, times, status=TestStatus.COMPLETED):
+    """Add one session per time, each with a single timed response."""
+    sessions = []
+    for t in times:
+        session = TestSession(user_id=user.id, status=status)
+        db.add(session)
+        db.flush()
+        db.add(
+            Response(
+                test_session_id=session.id,
+                user_id=user.id,
+                question_id=question.id,
+                user_answer="A",
+                is_correct=True,
+                time_spent_seconds=t,
+            )
+        )
+        sessions.append(session)
+    db.commit()
+    return sessions
+
+
+@pytest.fixture
+def pattern_question(db_session):
+    """A single easy pattern question."""
+    question = Question(
+        question_text="Pattern question",
+        question_type=QuestionType.PATTERN,
+        difficulty_level=DifficultyLevel.EASY,
+        correct_answer="A",
+        is_active=True,
+    )
+    db_session.add(question)
+    db_session.commit()
+    return question
+
+
+class TestHistogramPercentileStats:
+    """Histogram statistics must equal the raw-list statistics exactly."""
+
+    @pytest.mark.parametrize("seed", range(25))
+    def test_matches_sorted_times(self, seed):
+        """Test random samples give identical stats from either representation."""
+        rng = random.Random(seed)
+        times = [rng.randint(1, 300) for _ in range(rng.randint(1, 200))]
+
+        assert _compute_histogram_percentile_stats(
+            _histogram(times)
+        ) == _compute_percentile_stats(times)
+
+    def test_merge_is_union(self):
+        """Test merging histograms equals the histogram of concatenated data."""
+        a, b = [5, 5, 7, 30], [7, 8, 30, 30, 90]
+
+        merged = merge_histograms([_histogram(a), _histogram(b)])
+
+        assert merged == _histogram(a + b)
+
+
+class TestHistogramMaintenance:
+    """Tests for folding sessions into the persisted histograms."""
+
+    def test_refresh_folds_each_session_once(
+        self, db_session, test_user, pattern_question
+    ):
+        """Test a second refresh neither refolds nor double counts sessions."""
+        _add_sessions(db_session, test_user, pattern_question, [10, 20, 20, 30])
+
+        assert refresh_response_time_histograms(db_session) == 4
+        assert refresh_response_time_histograms(db_session) == 0
+
+        histograms = load_response_time_histograms(db_session)
+        assert histograms == {("pattern", "easy"): {10: 1, 20: 2, 30: 1}}
+
+    def test_in_progress_sessions_wait_until_completed(
+        self, db_session, test_user, pattern_question
+    ):
+        """Test sessions are folded only once they are completed."""
+        (session,) = _add_sessions(
+            db_session,
+            test_user,
+            pattern_question,
+            [40],
+            status=TestStatus.IN_PROGRESS,
+        )
+        assert refresh_response_time_histograms(db_session) == 0
+
+        session.status = TestStatus.COMPLETED
+        db_session.commit()
+
+        assert refresh_response_time_histograms(db_session) == 1
+        assert get_response_time_percentiles(db_session)["overall"]["count"] == 1
+        assert session.response_times_aggregated_at is not None
+
+    def test_small_batches_fold_everything(
+        self, db_session, test_user, pattern_question
+    ):
+        """Test catching up in several batches covers every pending session."""
+        _add_sessions(db_session, test_user, pattern_question, range(1, 8))
+
+        assert refresh_response_time_histograms(db_session, batch_size=3) == 7
+
+        histograms = load_response_time_histograms(db_session)
+        assert sum(histograms[("pattern", "easy")].values()) == 7
+
+    def test_rebuild_drops_deleted_responses(
+        self, db_session, test_user, pattern_question
+    ):
+        """Test a rebuild recomputes counts after folded sessions are deleted."""
+        other = User(email="other@example.com", password_hash="hash")
+        db_session.add(other)
+        db_session.commit()
+        _add_sessions(db_session, test_user, pattern_question, [10])
+        _add_sessions(db_session, other, pattern_question, [50, 60])
+        refresh_response_time_histograms(db_session)
+
+        db_session.delete(other)
+        db_session.commit()
+        # Counts are kept until the histograms are rebuilt
+        assert get_response_time_percentiles(db_session)["overall"]["count"] == 3
+
+        assert rebuild_response_time_histograms(db_session) == 1
+        assert get_response_time_percentiles(db_session)["overall"]["count"] == 1
+
+    def test_reads_do_not_fold(self, db_session, test_user, pattern_question):
+        """Test analytics reads leave pending sessions for the catch-up job."""
+        (session,) = _add_sessions(db_session, test_user, pattern_question, [15])
+
+        assert get_response_time_percentiles(db_session)["overall"]["count"] == 0
+        db_session.refresh(session)
+        assert session.response_times_aggregated_at is None
+
+    def test_recalibration_moves_folded_responses(
+        self, db_session, test_user, pattern_question
+    ):
+        """Test relabeling a question's difficulty moves its counted responses."""
+        _add_sessions(db_session, test_user, pattern_question, [10, 20])
+        refresh_response_time_histograms(db_session)
+
+        pattern_question.difficulty_level = DifficultyLevel.HARD
+        db_session.commit()
+
+        histograms = load_response_time_histograms(db_session)
+        assert histograms == {("pattern", "hard"): {10: 1, 20: 1}}
+        by_difficulty = get_response_time_percentiles(db_session)["by_difficulty"]
+        assert by_difficulty["hard"]["count"] == 2
+
+
+class TestAsyncFoldSession:
+    """Tests for async_fold_session_response_times."""
+
+    async def test_fold_marks_session(self, async_db_session, async_test_user):
+        """Test folding a completed session counts it once and marks it."""
+        question = Question(
+            question_text="Math question",
+            question_type=QuestionType.MATH,
+            difficulty_level=DifficultyLevel.HARD,
+            correct_answer="A",
+            is_active=True,
+        )
+        session = TestSession(user_id=async_test_user.id, status=TestStatus.COMPLETED)
+        async_db_session.add_all([question, session])
+        await async_db_session.flush()
+        async_db_session.add(
+            Response(
+                test_session_id=session.id,
+                user_id=async_test_user.id,
+                question_id=question.id,
+                user_answer="A",
+                is_correct=True,
+                time_spent_seconds=42,
+            )
+        )
+        await async_db_session.commit()
+
+        assert await async_fold_session_response_times(async_db_session, session.id)
+        assert not await async_fold_session_response_times(async_db_session, session.id)
+        await async_db_session.commit()
+
+        result = await async_db_session.execute(
+            select(TestSession.response_times_aggregated_at).where(
+                TestSession.id == session.id
+            )
+        )
+        assert result.scalar_one() is not None
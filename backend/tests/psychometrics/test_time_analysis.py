@@ -14,6 +14,9 @@ Tests cover:
 
 import pytest
 
+from app.core.psychometrics.response_time_histograms import (
+    refresh_response_time_histograms,
+)
 from app.core.psychometrics.time_analysis import (
     analyze_response_times,
     get_session_time_summary,
@@ -1192,6 +1195,7 @@ class TestGetAggregateResponseTimeAnalytics:
 
     def test_no_data_returns_empty_analytics(self, db_session):
         """Test that empty database returns empty analytics."""
+        refresh_response_time_histograms(db_session)
         result = get_aggregate_response_time_analytics(db_session)
 
         assert result["total_sessions_analyzed"] == 0
@@ -1251,6 +1255,7 @@ class TestGetAggregateResponseTimeAnalytics:
         db_session.add(test_result)
         db_session.commit()
 
+        refresh_response_time_histograms(db_session)
         result = get_aggregate_response_time_analytics(db_session)
 
         assert result["total_sessions_analyzed"] == 1
@@ -1340,6 +1345,7 @@ class TestGetAggregateResponseTimeAnalytics:
         )
         db_session.commit()
 
+        refresh_response_time_histograms(db_session)
         result = get_aggregate_response_time_analytics(db_session)
 
         assert result["by_difficulty"]["easy"]["mean_seconds"] == pytest.approx(20.0)
@@ -1423,6 +1429,7 @@ class TestGetAggregateResponseTimeAnalytics:
         )
         db_session.commit()
 
+        refresh_response_time_histograms(db_session)
         result = get_aggregate_response_time_analytics(db_session)
 
         assert result["by_question_type"]["pattern"]["mean_seconds"] == pytest.approx(
@@ -1495,6 +1502,7 @@ class TestGetAggregateResponseTimeAnalytics:
         db_session.add_all([result1, result2])
         db_session.commit()
 
+        refresh_response_time_histograms(db_session)
         result = get_aggregate_response_time_analytics(db_session)
 
         assert result["anomaly_summary"]["sessions_with_rapid_responses"] == 1
@@ -1528,6 +1536,7 @@ class TestGetAggregateResponseTimeAnalytics:
         )
         db_session.commit()
 
+        refresh_response_time_histograms(db_session)
         result = get_aggregate_response_time_analytics(db_session)
 
         # Should be empty because the session is not completed
@@ -1570,6 +1579,7 @@ class TestGetAggregateResponseTimeAnalytics:
         )
         db_session.commit()
 
+        refresh_response_time_histograms(db_session)
         result = get_aggregate_response_time_analytics(db_session)
 
         # Only 1 response has time data
@@ -1686,6 +1696,7 @@ class TestGetResponseTimePercentiles:
 
     def test_no_data_returns_empty(self, db_session):
         """Test that empty database returns empty percentile analytics."""
+        refresh_response_time_histograms(db_session)
         result = get_response_time_percentiles(db_session)
 
         assert result["total_responses_analyzed"] == 0
@@ -1736,6 +1747,7 @@ class TestGetResponseTimePercentiles:
             )
         db_session.commit()
 
+        refresh_response_time_histograms(db_session)
         result = get_response_time_percentiles(db_session)
 
         assert result["total_responses_analyzed"] == 5
@@ -1827,6 +1839,7 @@ class TestGetResponseTimePercentiles:
             )
         db_session.commit()
 
+        refresh_response_time_histograms(db_session)
         result = get_response_time_percentiles(db_session)
 
         assert result["total_responses_analyzed"] == 10
@@ -1875,6 +1888,7 @@ class TestGetResponseTimePercentiles:
         )
         db_session.commit()
 
+        refresh_response_time_histograms(db_session)
         result = get_response_time_percentiles(db_session)
 
         assert result["total_responses_analyzed"] == 0
@@ -1915,6 +1929,7 @@ class TestGetResponseTimePercentiles:
         )
         db_session.commit()
 
+        refresh_response_time_histograms(db_session)
         result = get_response_time_percentiles(db_session)
 
         assert result["total_responses_analyzed"] == 1
@@ -0,0 +1,157 @@
+"""
+Tests for the batch validity engine.
+
+Every batch result must equal the single-session functions' result for the
+same session, so most tests compare the two directly.
+"""
+
+import random
+from datetime import datetime
+
+import pytest
+
+from app.core.psychometrics.validity_analysis import (
+    calculate_person_fit_heuristic,
+    check_response_time_plausibility,
+    count_guttman_errors_with_fallback,
+    run_validity_analysis_with_edge_case_handling,
+)
+from app.core.psychometrics.validity_batch import (
+    batch_validity_checks,
+    run_batch_validity_analysis,
+)
+
+
+def _random_response(rng):
+    return {
+        "is_correct": rng.random() < 0.6,
+        "difficulty_level": rng.choice(["easy", "medium", "hard", "Hard", None]),
+        # Few distinct p-values so ties between items are common
+        "empirical_difficulty": rng.choice([None, 0.2, 0.35, 0.5, 0.5, 0.8, "0.65"]),
+        "time_seconds": rng.choice(
+            [None, 1, 2, 2.5, 8, 15, 45, 90, 301, 900, "bad", "12"]
+        ),
+    }
+
+
+def _random_sessions(seed, count=60):
+    rng = random.Random(seed)
+    return [
+        [_random_response(rng) for _ in range(rng.choice([0, 1, 2, 3, 4, 5, 12, 30]))]
+        for _ in range(count)
+    ]
+
+
+def _scalar_checks(responses):
+    """The three checks as run_validity_analysis_with_edge_case_handling runs them."""
+    person_fit = calculate_person_fit_heuristic(
+        [
+            (r.get("is_correct", False), r.get("difficulty_level") or "medium")
+            for r in responses
+        ],
+        sum(1 for r in responses if r.get("is_correct", False)),
+    )
+    time_check = check_response_time_plausibility(
+        [
+            {
+                "time_seconds": r.get("time_seconds"),
+                "is_correct": r.get("is_correct", False),
+                "difficulty": r.get("difficulty_level") or "medium",
+            }
+            for r in responses
+        ]
+    )
+    guttman = count_guttman_errors_with_fallback(
+        [
+            (
+                r.get("is_correct", False),
+                r.get("empirical_difficulty"),
+                r.get("difficulty_level"),
+            )
+            for r in responses
+        ]
+    )
+    return person_fit, time_check, guttman
+
+
+class TestBatchValidityChecks:
+    """Tests for batch_validity_checks."""
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_matches_single_session_checks(self, seed):
+        """Test random sessions give the same three results as the scalar checks."""
+        sessions = _random_sessions(seed)
+
+        batch = batch_validity_checks(sessions)
+
+        assert batch == [_scalar_checks(responses) for responses in sessions]
+
+    def test_guttman_errors_counted_across_ties(self):
+        """Test items with equal p-values are never compared with each other."""
+        responses = [
+            {"is_correct": False, "empirical_difficulty": 0.9},
+            {"is_correct": True, "empirical_difficulty": 0.5},
+            {"is_correct": False, "empirical_difficulty": 0.5},
+            {"is_correct": True, "empirical_difficulty": 0.2},
+        ]
+
+        ((_, _, guttman),) = batch_validity_checks([responses])
+
+        # (0.9 missed, 0.5 correct), (0.9 missed, 0.2 correct), (0.5 missed, 0.2 correct)
+        assert guttman["error_count"] == 3
+        assert guttman == _scalar_checks(responses)[2]
+
+    def test_no_sessions(self):
+        """Test an empty batch returns no results."""
+        assert batch_validity_checks([]) == []
+
+
+class TestRunBatchValidityAnalysis:
+    """Tests for run_batch_validity_analysis."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_single_session_analysis(self, seed):
+        """Test every session gets the result of the single-session entry point."""
+        rng = random.Random(seed)
+        sessions = [
+            {
+                "responses": responses,
+                "session_status": rng.choice(
+                    ["completed", "completed", "abandoned", "in_progress", "unknown"]
+                ),
+                "existing_validity_status": rng.choice([None, None, "valid"]),
+                "existing_validity_checked_at": rng.choice(
+                    [None, datetime(2025, 1, 1)]
+                ),
+            }
+            for responses in _random_sessions(seed)
+        ]
+
+        for force in (False, True):
+            batch = run_batch_validity_analysis(sessions, force_revalidate=force)
+
+            assert batch == [
+                run_validity_analysis_with_edge_case_handling(
+                    session["responses"],
+                    session_status=session["session_status"],
+                    existing_validity_status=session["existing_validity_status"],
+                    existing_validity_checked_at=session[
+                        "existing_validity_checked_at"
+                    ],
+                    force_revalidate=force,
+                )
+                for session in sessions
+            ]
+
+    def test_defaults_to_completed_session(self):
+        """Test a session with only responses is analyzed as completed."""
+        responses = [
+            {"is_correct": True, "difficulty_level": "hard", "time_seconds": 1}
+            for _ in range(6)
+        ]
+
+        (result,) = run_batch_validity_analysis([{"responses": responses}])
+
+        assert result["validity_status"] == "invalid"
+        assert "multiple_rapid_responses" in result["flags"]
+        assert result["edge_case_info"]["total_responses"] == 6
@@ -18,6 +18,14 @@ from app.core.system_config import (
     set_weighted_scoring_enabled,
     get_domain_population_stats,
     set_domain_population_stats,
+    get_cached_config,
+    get_config_snapshot,
+    is_cat_enabled,
+    set_cat_readiness,
+    SystemConfigSnapshot,
+    async_get_cached_config,
+    async_is_cat_enabled,
+    async_set_config,
 )
 
 
@@ -302,3 +310,73 @@ class TestDomainPopulationStatsHelpers:
         set_domain_population_stats(db_session, stats)
         result = get_domain_population_stats(db_session)
         assert result == stats
+
+
+class TestConfigSnapshot:
+    """Tests for the in-process configuration snapshot."""
+
+    def _insert_directly(self, db_session, key, value):
+        db_session.add(SystemConfig(key=key, value=value, updated_at=utc_now()))
+        db_session.commit()
+
+    def test_cached_reads_do_not_see_out_of_band_rows(self, db_session):
+        """Test a fresh snapshot is served without re-querying the table."""
+        assert get_cached_config(db_session, "domain_weights") is None
+
+        # Simulates a write from another worker
+        self._insert_directly(db_session, "domain_weights", {"pattern": 1.0})
+
+        assert get_cached_config(db_session, "domain_weights") is None
+        assert get_config(db_session, "domain_weights") == {"pattern": 1.0}
+
+    def test_expired_snapshot_reloads(self, db_session, monkeypatch):
+        """Test rows written elsewhere are picked up once the TTL has passed."""
+        snapshot = get_config_snapshot()
+        assert is_cat_enabled(db_session) is False
+        self._insert_directly(db_session, "cat_readiness", {"enabled": True})
+
+        monkeypatch.setattr(snapshot, "ttl_seconds", 0.0)
+
+        assert is_cat_enabled(db_session) is True
+
+    def test_writes_update_snapshot_immediately(self, db_session):
+        """Test set_config and delete_config are visible to cached reads at once."""
+        assert is_cat_enabled(db_session) is False
+
+        set_cat_readiness(db_session, {"enabled": True})
+        assert is_cat_enabled(db_session) is True
+
+        set_domain_weights(db_session, {"logic": 1.0})
+        assert get_domain_weights(db_session) == {"logic": 1.0}
+
+        delete_config(db_session, "domain_weights")
+        assert get_domain_weights(db_session) is None
+
+    def test_returned_values_are_copies(self, db_session):
+        """Test callers cannot mutate the shared snapshot."""
+        set_domain_weights(db_session, {"pattern": 0.5, "logic": 0.5})
+
+        weights = get_domain_weights(db_session)
+        weights["pattern"] = 0.0
+
+        assert get_domain_weights(db_session)["pattern"] == 0.5
+
+    def test_reload_started_before_write_is_discarded(self):
+        """Test a stale load cannot overwrite a newer local write."""
+        snapshot = SystemConfigSnapshot(ttl_seconds=60.0)
+        snapshot.install({"key": "old"}, snapshot.generation)
+
+        generation = snapshot.generation
+        snapshot.apply("key", "new")
+        snapshot.install({"key": "old"}, generation)
+
+        assert snapshot.values() == {"key": "new"}
+
+    async def test_async_reads_use_snapshot(self, async_db_session):
+        """Test the async readers share the snapshot and its write-through."""
+        assert await async_is_cat_enabled(async_db_session) is False
+
+        await async_set_config(async_db_session, "cat_readiness", {"enabled": True})
+
+        assert await async_is_cat_enabled(async_db_session) is True
+        assert await async_get_cached_config(async_db_session, "missing", 3) == 3
@@ -94,10 +94,42 @@ class Settings(BaseSettings):
         2  # Successes in half-open to close circuit
     )
     circuit_breaker_window_size: int = 10  # Sliding window for error rate calculation
+    # Share breaker state across processes: memory, sqlite or redis (REDIS_URL)
+    circuit_breaker_state_backend: str = "memory"
+    circuit_breaker_state_path: str = "./cache/circuit_breakers.sqlite3"
+    circuit_breaker_sync_interval: float = 1.0  # Seconds between shared-state merges
+
+    # Hedged Generation Requests (see QuestionGenerator._run_hedged)
+    generation_hedging_enabled: bool = False  # Duplicate slow calls to a 2nd provider
+    generation_hedge_percentile: float = 0.95  # Latency percentile triggering a hedge
+    generation_hedge_min_success_rate: float = (
+        0.5  # Skip hedge targets with a lower tracked success rate
+    )
+    generation_hedge_budget: float = 0.05  # Max fraction of calls that send a hedge
+    generation_hedge_benchmark_path: Optional[str] = (
+        None  # Benchmark report seeding latencies until live data accumulates
+    )
+
+    # Adaptive Batch Chunking (see app.generation.chunk_sizing)
+    generation_adaptive_chunking: bool = False  # Learn chunk sizes per provider/model
+    generation_chunk_stats_path: str = (
+        "./cache/chunk_sizing.json"  # Learned chunk sizing estimates
+    )
 
     # Deduplication Configuration
     dedup_similarity_threshold: float = 0.98  # Semantic similarity threshold (0.0-1.0)
     dedup_embedding_model: str = "text-embedding-3-small"  # OpenAI embedding model
+    embedding_storage_encoding: str = (
+        "float32"  # Stored embedding encoding: "float32" or "int8" (4x smaller)
+    )
+
+    # Answer Correctness Audit Configuration
+    audit_concurrency: int = 16  # Questions verified concurrently by the audit CLI
+    audit_provider_concurrency: int = 4  # Concurrent verifications per judge provider
+    audit_commit_batch_size: int = 25  # Audited questions per commit
+    audit_checkpoint_path: str = (
+        "./logs/correctness_audit_checkpoint.json"  # Resume point after a crash
+    )
 
     # Redis Embedding Cache Configuration
     redis_url: Optional[str] = (
@@ -107,6 +139,17 @@ class Settings(BaseSettings):
         None  # TTL for cached embeddings in seconds (None = no expiration)
     )
 
+    # LLM Completion Cache Configuration (see app/infrastructure/completion_cache.py)
+    llm_cache_mode: str = "off"  # "off", "read_write", "record" or "replay"
+    llm_cache_path: str = "./cache/llm_completions.sqlite3"
+    llm_cache_ttl: Optional[int] = (
+        604800  # Seconds before cached completions expire (None = no expiration)
+    )
+    llm_cache_max_entries: int = 50_000  # LRU entries evicted beyond this
+    llm_cache_max_temperature: float = (
+        0.5  # Highest request temperature cached in read_write mode
+    )
+
     # Runtime Model Validation Configuration
     provider_model_cache_ttl: int = 3600  # Cache duration in seconds (default: 1 hour)
     enable_runtime_model_validation: bool = (
@@ -148,6 +191,38 @@ class Settings(BaseSettings):
             )
         return v
 
+    @field_validator("embedding_storage_encoding")
+    @classmethod
+    def validate_embedding_storage_encoding(cls, v: str) -> str:
+        """Validate embedding_storage_encoding names a supported encoding."""
+        if v not in ("float32", "int8"):
+            raise ValueError(
+                f"embedding_storage_encoding must be 'float32' or 'int8', got {v!r}"
+            )
+        return v
+
+    @field_validator("llm_cache_mode")
+    @classmethod
+    def validate_llm_cache_mode(cls, v: str) -> str:
+        """Validate llm_cache_mode names a supported completion cache mode."""
+        if v not in ("off", "read_write", "record", "replay"):
+            raise ValueError(
+                "llm_cache_mode must be 'off', 'read_write', 'record' or "
+                f"'replay', got {v!r}"
+            )
+        return v
+
+    @field_validator("circuit_breaker_state_backend")
+    @classmethod
+    def validate_circuit_breaker_state_backend(cls, v: str) -> str:
+        """Validate circuit_breaker_state_backend names a supported backend."""
+        if v not in ("memory", "sqlite", "redis"):
+            raise ValueError(
+                "circuit_breaker_state_backend must be 'memory', 'sqlite' or "
+                f"'redis', got {v!r}"
+            )
+        return v
+
     @model_validator(mode="after")
     def load_secrets_and_validate(self) -> Self:
         """Load secrets from secrets management backend and validate configuration.
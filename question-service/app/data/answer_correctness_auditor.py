@@ -8,19 +8,29 @@ maintenance step so incorrectly-keyed questions are caught before they reach use
 Safe to re-run: only targets currently-active questions; a clean pool produces 0 hits.
 Supports incremental mode via ``audit_window_hours`` (skip recently-audited questions)
 and ``max_questions`` (cap per-run scope).
+
+``run_answer_correctness_audit_async`` is the concurrent engine used by the
+standalone CLI: it verifies questions in parallel under per-provider limits,
+commits results in small batches and can resume from a checkpoint file.
 """
 
+import asyncio
+import json
 import logging
+import os
 from collections import defaultdict
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import TYPE_CHECKING, Any, Callable, Optional, cast
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Mapping, Optional, cast
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.data.answer_leakage_auditor import MIN_ACTIVE_PER_BUCKET, _label
 from app.data.db_models import AuditRunModel, QuestionModel
 from app.data.models import GeneratedQuestion
-from app.observability.cost_tracking import track_costs
+from app.observability.cost_tracking import CostTracker, track_costs
 from app.observability.pipeline_run import record_pipeline_run
 from aiq_types import QuestionType
 from gioe_libs.domain_types import DifficultyLevel
@@ -56,6 +66,139 @@ def _model_to_generated(q: QuestionModel) -> GeneratedQuestion:
     )
 
 
+def _flag_low_buckets(
+    health_counts: Mapping[tuple[str, str], int], result: dict
+) -> None:
+    """Append type/difficulty buckets below MIN_ACTIVE_PER_BUCKET to low_buckets."""
+    for (qt, dl), count in sorted(health_counts.items()):
+        if count < MIN_ACTIVE_PER_BUCKET:
+            msg = f"{qt}/{dl}={count}"
+            result["low_buckets"].append(msg)
+            logger.warning(
+                f"[answer-correctness-audit] LOW POOL: {msg} "
+                f"(min {MIN_ACTIVE_PER_BUCKET})"
+            )
+
+    if not result["low_buckets"]:
+        logger.info(
+            "[answer-correctness-audit] All type/difficulty buckets "
+            "meet the minimum threshold."
+        )
+
+
+def _report_pool_health(session: Session, result: dict) -> None:
+    """Count active questions per bucket after the audit and flag low buckets."""
+    _flag_low_buckets(_active_bucket_counts(session), result)
+
+
+def _record_audit_metrics(result: dict) -> None:
+    """Record audit counters when observability is initialised."""
+    try:
+        if observability.is_initialized:
+            observability.record_metric(
+                "audit.correctness.scanned",
+                value=result["scanned"],
+                metric_type="counter",
+            )
+            observability.record_metric(
+                "audit.correctness.failed",
+                value=result["failed"],
+                metric_type="counter",
+            )
+            observability.record_metric(
+                "audit.correctness.deactivated",
+                value=result["deactivated"],
+                metric_type="counter",
+            )
+    except Exception:
+        logger.debug(
+            "[answer-correctness-audit] Failed to record observability metrics.",
+            exc_info=True,
+        )
+
+
+def _persist_audit_run(
+    session_factory: Callable[[], Session],
+    result: dict,
+    cost_tracker: CostTracker,
+    audit_start: datetime,
+) -> None:
+    """Attach the cost summary to ``result`` and persist the audit run records."""
+    cost_summary = cost_tracker.get_summary()
+    result["cost_summary"] = cost_summary
+    audit_end = datetime.now(timezone.utc)
+
+    logger.info(
+        "[answer-correctness-audit] Cost: total_cost_usd=%.6f, "
+        "input_tokens=%d, output_tokens=%d, providers=%s",
+        cost_summary.get("total_cost_usd", 0),
+        cost_summary.get("total_input_tokens", 0),
+        cost_summary.get("total_output_tokens", 0),
+        list(cost_summary.get("by_provider", {}).keys()),
+    )
+
+    # Persist audit run to database
+    persist_session: Session = session_factory()
+    try:
+        duration = (audit_end - audit_start).total_seconds()
+        audit_run = AuditRunModel(
+            started_at=audit_start,
+            completed_at=audit_end,
+            duration_seconds=round(duration, 2),
+            scanned=result["scanned"],
+            verified_correct=result["verified_correct"],
+            failed=result["failed"],
+            deactivated=result["deactivated"],
+            skipped=result["skipped"],
+            errors=result["errors"],
+            total_cost_usd=cost_summary.get("total_cost_usd"),
+            total_input_tokens=cost_summary.get("total_input_tokens"),
+            total_output_tokens=cost_summary.get("total_output_tokens"),
+            cost_by_provider=cost_summary.get("by_provider"),
+        )
+        persist_session.add(audit_run)
+        persist_session.commit()
+        logger.info(
+            "[answer-correctness-audit] Audit run persisted (id=%s).",
+            audit_run.id,
+        )
+    except Exception:
+        persist_session.rollback()
+        logger.exception(
+            "[answer-correctness-audit] Failed to persist audit run; "
+            "cost data available in result dict only."
+        )
+    finally:
+        persist_session.close()
+
+    # Persist unified pipeline run record
+    record_pipeline_run(
+        session_factory=session_factory,
+        pipeline_type="correctness_audit",
+        started_at=audit_start,
+        completed_at=audit_end,
+        cost_tracker=cost_tracker,
+        result_summary={
+            "scanned": result["scanned"],
+            "verified_correct": result["verified_correct"],
+            "failed": result["failed"],
+            "deactivated": result["deactivated"],
+            "skipped": result["skipped"],
+            "errors": result["errors"],
+        },
+    )
+
+    logger.info(
+        f"[answer-correctness-audit] Complete: "
+        f"scanned={result['scanned']}, "
+        f"correct={result['verified_correct']}, "
+        f"failed={result['failed']}, "
+        f"deactivated={result['deactivated']}, "
+        f"skipped={result['skipped']}, "
+        f"errors={result['errors']}"
+    )
+
+
 def run_answer_correctness_audit(
     session_factory: Callable[[], Session],
     judge: "QuestionJudge",
@@ -256,57 +399,8 @@ def run_answer_correctness_audit(
             # Commit last_audited_at timestamps and any deactivations
             session.commit()
 
-            # --- Pool health check ---
-            active_after = (
-                session.query(QuestionModel)
-                .filter(QuestionModel.is_active.is_(True))
-                .all()
-            )
-            health_counts: dict[tuple[str, str], int] = defaultdict(int)
-            for q in active_after:
-                health_counts[
-                    (_label(q.question_type), _label(q.difficulty_level))
-                ] += 1
-
-            for (qt, dl), count in sorted(health_counts.items()):
-                if count < MIN_ACTIVE_PER_BUCKET:
-                    msg = f"{qt}/{dl}={count}"
-                    result["low_buckets"].append(msg)
-                    logger.warning(
-                        f"[answer-correctness-audit] LOW POOL: {msg} "
-                        f"(min {MIN_ACTIVE_PER_BUCKET})"
-                    )
-
-            if not result["low_buckets"]:
-                logger.info(
-                    "[answer-correctness-audit] All type/difficulty buckets "
-                    "meet the minimum threshold."
-                )
-
-            # --- Observability metrics ---
-            try:
-                if observability.is_initialized:
-                    observability.record_metric(
-                        "audit.correctness.scanned",
-                        value=result["scanned"],
-                        metric_type="counter",
-                    )
-                    observability.record_metric(
-                        "audit.correctness.failed",
-                        value=result["failed"],
-                        metric_type="counter",
-                    )
-                    observability.record_metric(
-                        "audit.correctness.deactivated",
-                        value=result["deactivated"],
-                        metric_type="counter",
-                    )
-            except Exception:
-                logger.debug(
-                    "[answer-correctness-audit] Failed to record "
-                    "observability metrics.",
-                    exc_info=True,
-                )
+            _report_pool_health(session, result)
+            _record_audit_metrics(result)
 
         except Exception:
             session.rollback()
@@ -315,79 +409,393 @@ def run_answer_correctness_audit(
         finally:
             session.close()
 
-        # --- Cost tracking ---
-        cost_summary = cost_tracker.get_summary()
-        result["cost_summary"] = cost_summary
-        audit_end = datetime.now(timezone.utc)
+        _persist_audit_run(session_factory, result, cost_tracker, audit_start)
 
-        logger.info(
-            "[answer-correctness-audit] Cost: total_cost_usd=%.6f, "
-            "input_tokens=%d, output_tokens=%d, providers=%s",
-            cost_summary.get("total_cost_usd", 0),
-            cost_summary.get("total_input_tokens", 0),
-            cost_summary.get("total_output_tokens", 0),
-            list(cost_summary.get("by_provider", {}).keys()),
+        return result
+
+
+# ---------------------------------------------------------------------------
+# Concurrent audit engine
+# ---------------------------------------------------------------------------
+
+DEFAULT_AUDIT_CONCURRENCY = 16  # Questions verified in flight across providers
+DEFAULT_PROVIDER_CONCURRENCY = 4  # Questions in flight per judge provider
+DEFAULT_COMMIT_BATCH_SIZE = 25  # Audited questions per commit
+
+_COMMITTED_COUNTERS = (
+    "scanned",
+    "verified_correct",
+    "failed",
+    "deactivated",
+    "skipped",
+)
+
+
+@dataclass(frozen=True)
+class _AuditCandidate:
+    """A question detached from its session, ready for async verification."""
+
+    id: int
+    question_type: str
+    difficulty: str
+    question: GeneratedQuestion
+
+
+def _load_checkpoint(path: Path) -> Optional[dict]:
+    """Return the checkpoint left by an interrupted run, or None."""
+    if not path.exists():
+        return None
+    try:
+        with path.open() as f:
+            checkpoint = json.load(f)
+        checkpoint["started_at"] = datetime.fromisoformat(checkpoint["started_at"])
+        return checkpoint
+    except (OSError, ValueError, KeyError, TypeError):
+        logger.warning(
+            "[answer-correctness-audit] Ignoring unreadable checkpoint %s.", path
         )
+        return None
 
-        # Persist audit run to database
-        persist_session: Session = session_factory()
-        try:
-            duration = (audit_end - audit_start).total_seconds()
-            audit_run = AuditRunModel(
-                started_at=audit_start,
-                completed_at=audit_end,
-                duration_seconds=round(duration, 2),
-                scanned=result["scanned"],
-                verified_correct=result["verified_correct"],
-                failed=result["failed"],
-                deactivated=result["deactivated"],
-                skipped=result["skipped"],
-                errors=result["errors"],
-                total_cost_usd=cost_summary.get("total_cost_usd"),
-                total_input_tokens=cost_summary.get("total_input_tokens"),
-                total_output_tokens=cost_summary.get("total_output_tokens"),
-                cost_by_provider=cost_summary.get("by_provider"),
+
+def _save_checkpoint(path: Path, started_at: datetime, progress: dict) -> None:
+    """Atomically write run progress so a crashed run can resume from it."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with tmp_path.open("w") as f:
+        json.dump({"started_at": started_at.isoformat(), "progress": progress}, f)
+    os.replace(tmp_path, path)
+
+
+def _load_audit_candidates(
+    session_factory: Callable[[], Session],
+    audit_window_hours: Optional[float],
+    max_questions: Optional[int],
+    audited_before: datetime,
+) -> tuple[list[_AuditCandidate], dict[tuple[str, str], int]]:
+    """Select questions to audit and count the active pool per bucket.
+
+    Uses one short read-only session; candidates are converted to plain
+    dataclasses so no session or transaction stays open during verification.
+    Questions stamped at or after ``audited_before`` (i.e. by the run being
+    resumed) are excluded.
+    """
+    session = session_factory()
+    try:
+        cutoff = audited_before
+        if audit_window_hours is not None:
+            cutoff = min(
+                cutoff,
+                datetime.now(timezone.utc) - timedelta(hours=audit_window_hours),
             )
-            persist_session.add(audit_run)
-            persist_session.commit()
-            logger.info(
-                "[answer-correctness-audit] Audit run persisted (id=%s).",
-                audit_run.id,
+        query = (
+            session.query(QuestionModel)
+            .filter(QuestionModel.is_active.is_(True))
+            .filter(
+                (QuestionModel.last_audited_at.is_(None))
+                | (QuestionModel.last_audited_at < cutoff)
             )
-        except Exception:
-            persist_session.rollback()
-            logger.exception(
-                "[answer-correctness-audit] Failed to persist audit run; "
-                "cost data available in result dict only."
+            .order_by(
+                QuestionModel.last_audited_at.asc().nulls_first(), QuestionModel.id
             )
-        finally:
-            persist_session.close()
+        )
+        if max_questions is not None:
+            query = query.limit(max_questions)
+
+        candidates = [
+            _AuditCandidate(
+                id=q.id,
+                question_type=_label(q.question_type),
+                difficulty=_label(q.difficulty_level),
+                question=_model_to_generated(q),
+            )
+            for q in query.all()
+        ]
+        return candidates, _active_bucket_counts(session)
+    finally:
+        session.close()
+
+
+def _active_bucket_counts(session: Session) -> dict[tuple[str, str], int]:
+    """Count active questions per (type, difficulty) bucket in one query."""
+    rows = (
+        session.query(
+            QuestionModel.question_type,
+            QuestionModel.difficulty_level,
+            func.count(QuestionModel.id),
+        )
+        .filter(QuestionModel.is_active.is_(True))
+        .group_by(QuestionModel.question_type, QuestionModel.difficulty_level)
+        .all()
+    )
+    counts: dict[tuple[str, str], int] = defaultdict(int)
+    for question_type, difficulty, count in rows:
+        counts[(_label(question_type), _label(difficulty))] += count
+    return counts
 
-        # Persist unified pipeline run record
-        record_pipeline_run(
-            session_factory=session_factory,
-            pipeline_type="correctness_audit",
-            started_at=audit_start,
-            completed_at=audit_end,
-            cost_tracker=cost_tracker,
-            result_summary={
-                "scanned": result["scanned"],
-                "verified_correct": result["verified_correct"],
-                "failed": result["failed"],
-                "deactivated": result["deactivated"],
-                "skipped": result["skipped"],
-                "errors": result["errors"],
-            },
+
+def _commit_audit_batch(
+    session_factory: Callable[[], Session],
+    audited_at: datetime,
+    audited_ids: list[int],
+    deactivate_ids: list[int],
+) -> None:
+    """Stamp ``last_audited_at`` and apply deactivations in one short transaction."""
+    session = session_factory()
+    try:
+        session.query(QuestionModel).filter(QuestionModel.id.in_(audited_ids)).update(
+            {QuestionModel.last_audited_at: audited_at}, synchronize_session=False
         )
+        if deactivate_ids:
+            session.query(QuestionModel).filter(
+                QuestionModel.id.in_(deactivate_ids)
+            ).update({QuestionModel.is_active: False}, synchronize_session=False)
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
+async def run_answer_correctness_audit_async(
+    session_factory: Callable[[], Session],
+    judge: "QuestionJudge",
+    judge_config: "JudgeConfigLoader",
+    *,
+    max_questions: Optional[int] = None,
+    audit_window_hours: Optional[float] = None,
+    concurrency: int = DEFAULT_AUDIT_CONCURRENCY,
+    provider_concurrency: Optional[Mapping[str, int]] = None,
+    default_provider_concurrency: int = DEFAULT_PROVIDER_CONCURRENCY,
+    commit_batch_size: int = DEFAULT_COMMIT_BATCH_SIZE,
+    checkpoint_path: Optional[Path] = None,
+) -> dict:
+    """Audit the active pool concurrently, committing results as they arrive.
+
+    Same verification, bucket-safety rule and result shape as
+    ``run_answer_correctness_audit``, but:
 
+    - questions are verified with ``judge.verify_answer_async`` by up to
+      ``concurrency`` workers, each judge provider capped at its entry in
+      ``provider_concurrency`` (default ``default_provider_concurrency``);
+    - ``last_audited_at`` stamps and deactivations are committed every
+      ``commit_batch_size`` results in a fresh short-lived session, so no
+      transaction spans the scan;
+    - with ``checkpoint_path``, committed progress is written after every
+      batch. If the file exists when a run starts, the run resumes: questions
+      stamped since the interrupted run began are skipped and its committed
+      counters are carried over. The file is removed when the run finishes.
+
+    Questions whose verification raised are not stamped, so a resumed run
+    retries them; their ``errors`` count is not carried across a resume.
+
+    Args:
+        session_factory: A callable that returns a SQLAlchemy Session.
+        judge: An initialised QuestionJudge with at least one provider.
+        judge_config: Loaded judge configuration for provider resolution.
+        max_questions: If set, cap the number of questions audited per run
+                       (including questions audited before a resume).
+        audit_window_hours: If set, skip questions audited within this many hours.
+        concurrency: Maximum questions verified at once.
+        provider_concurrency: Per-judge-provider limits, keyed by provider name.
+        default_provider_concurrency: Limit for providers not in
+                                      ``provider_concurrency``.
+        commit_batch_size: Audited questions per commit.
+        checkpoint_path: Where to persist progress for crash recovery.
+
+    Returns:
+        dict with the same keys as ``run_answer_correctness_audit``.
+    """
+    if concurrency < 1 or commit_batch_size < 1:
+        raise ValueError("concurrency and commit_batch_size must be at least 1")
+
+    with track_costs() as cost_tracker:
+        checkpoint = _load_checkpoint(checkpoint_path) if checkpoint_path else None
+        progress: dict = {name: 0 for name in _COMMITTED_COUNTERS}
+        progress["details"] = []
+        if checkpoint is not None:
+            audit_start: datetime = checkpoint["started_at"]
+            progress.update(checkpoint.get("progress", {}))
+            logger.info(
+                f"[answer-correctness-audit] Resuming run started "
+                f"{audit_start.isoformat()} ({progress['scanned']} question(s) "
+                f"already audited)."
+            )
+        else:
+            audit_start = datetime.now(timezone.utc)
+        if checkpoint_path is not None:
+            _save_checkpoint(checkpoint_path, audit_start, progress)
+
+        remaining = None
+        if max_questions is not None:
+            remaining = max(0, max_questions - progress["scanned"])
+
+        candidates, bucket_counts = await asyncio.to_thread(
+            _load_audit_candidates,
+            session_factory,
+            audit_window_hours,
+            remaining,
+            audit_start,
+        )
         logger.info(
-            f"[answer-correctness-audit] Complete: "
-            f"scanned={result['scanned']}, "
-            f"correct={result['verified_correct']}, "
-            f"failed={result['failed']}, "
-            f"deactivated={result['deactivated']}, "
-            f"skipped={result['skipped']}, "
-            f"errors={result['errors']}"
+            f"[answer-correctness-audit] Auditing {len(candidates)} question(s) "
+            f"with concurrency={concurrency}, batch size={commit_batch_size}."
+        )
+
+        available = list(judge.providers.keys())
+        limits = dict(provider_concurrency or {})
+        provider_limiters: dict[str, asyncio.Semaphore] = {}
+        errors: list[dict] = []
+        pending: list[tuple[_AuditCandidate, bool, dict]] = []
+        flush_lock = asyncio.Lock()
+        candidate_iter = iter(candidates)
+
+        async def _verify(candidate: _AuditCandidate) -> None:
+            try:
+                j_provider, j_model = judge_config.resolve_judge_provider(
+                    candidate.question_type, available
+                )
+                effective_model = j_model or judge.providers[j_provider].model
+                limiter = provider_limiters.get(j_provider)
+                if limiter is None:
+                    limiter = asyncio.Semaphore(
+                        limits.get(j_provider, default_provider_concurrency)
+                    )
+                    provider_limiters[j_provider] = limiter
+                async with limiter:
+                    verified, details = await judge.verify_answer_async(
+                        question=candidate.question,
+                        judge_provider_name=j_provider,
+                        judge_model_name=effective_model,
+                    )
+            except Exception:
+                errors.append(
+                    {
+                        "id": candidate.id,
+                        "type": candidate.question_type,
+                        "difficulty": candidate.difficulty,
+                        "outcome": "error",
+                    }
+                )
+                logger.exception(
+                    f"[answer-correctness-audit] Error verifying "
+                    f"question {candidate.id}; skipping (fail-open)."
+                )
+                return
+            pending.append((candidate, verified, details))
+
+        async def _flush() -> None:
+            async with flush_lock:
+                batch = pending[:]
+                del pending[:]
+                if not batch:
+                    return
+
+                counts = {name: 0 for name in _COMMITTED_COUNTERS}
+                details_out: list[dict] = []
+                deactivate_ids: list[int] = []
+                for candidate, verified, details in batch:
+                    counts["scanned"] += 1
+                    outcome = details.get("outcome", "")
+                    entry = {
+                        "id": candidate.id,
+                        "type": candidate.question_type,
+                        "difficulty": candidate.difficulty,
+                    }
+                    if outcome == "skipped":
+                        counts["skipped"] += 1
+                        details_out.append(
+                            {**entry, "outcome": "skipped", "details": details}
+                        )
+                    elif verified:
+                        counts["verified_correct"] += 1
+                    else:
+                        counts["failed"] += 1
+                        details_out.append(
+                            {**entry, "outcome": "fail", "details": details}
+                        )
+                        logger.warning(
+                            f"[answer-correctness-audit] Question {candidate.id} "
+                            f"({candidate.question_type}/{candidate.difficulty}) "
+                            f"failed verification: {details}"
+                        )
+                        bucket = (candidate.question_type, candidate.difficulty)
+                        if bucket_counts[bucket] - 1 >= MIN_ACTIVE_PER_BUCKET:
+                            deactivate_ids.append(candidate.id)
+                            bucket_counts[bucket] -= 1
+                        else:
+                            logger.warning(
+                                f"[answer-correctness-audit] Cannot deactivate "
+                                f"question {candidate.id} ({bucket[0]}/{bucket[1]}): "
+                                f"would breach min pool threshold "
+                                f"({bucket_counts[bucket]} active, "
+                                f"min {MIN_ACTIVE_PER_BUCKET})."
+                            )
+                counts["deactivated"] = len(deactivate_ids)
+
+                await asyncio.to_thread(
+                    _commit_audit_batch,
+                    session_factory,
+                    datetime.now(timezone.utc),
+                    [candidate.id for candidate, _, _ in batch],
+                    deactivate_ids,
+                )
+                if deactivate_ids:
+                    logger.info(
+                        "[answer-correctness-audit] Deactivated IDs: %s",
+                        deactivate_ids,
+                    )
+
+                for name, value in counts.items():
+                    progress[name] += value
+                progress["details"].extend(details_out)
+                if checkpoint_path is not None:
+                    _save_checkpoint(checkpoint_path, audit_start, progress)
+
+        async def _worker() -> None:
+            for candidate in candidate_iter:
+                await _verify(candidate)
+                if len(pending) >= commit_batch_size:
+                    await _flush()
+
+        async with asyncio.TaskGroup() as workers:
+            for _ in range(min(concurrency, len(candidates))):
+                workers.create_task(_worker())
+        await _flush()
+
+        result: dict = {
+            **{name: progress[name] for name in _COMMITTED_COUNTERS},
+            "errors": len(errors),
+            "low_buckets": [],
+            "details": progress["details"] + errors,
+        }
+        result["scanned"] += len(errors)
+
+        if result["deactivated"]:
+            logger.info(
+                f"[answer-correctness-audit] Deactivated {result['deactivated']} "
+                f"question(s) with incorrect answers."
+            )
+        elif not result["failed"]:
+            logger.info(
+                "[answer-correctness-audit] All questions passed "
+                "verification. Pool is clean."
+            )
+
+        def _final_bucket_counts() -> dict[tuple[str, str], int]:
+            session = session_factory()
+            try:
+                return _active_bucket_counts(session)
+            finally:
+                session.close()
+
+        _flag_low_buckets(await asyncio.to_thread(_final_bucket_counts), result)
+        _record_audit_metrics(result)
+
+        await asyncio.to_thread(
+            _persist_audit_run, session_factory, result, cost_tracker, audit_start
         )
+        if checkpoint_path is not None:
+            checkpoint_path.unlink(missing_ok=True)
 
         return result
@@ -8,16 +8,24 @@ import logging
 import sys
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Generator, List, Optional
+from typing import Any, Dict, Generator, Iterator, List, Optional, Sequence, Tuple
 
 from sqlalchemy import (
     create_engine,
+    insert,
     text,
 )
 from openai import OpenAI
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.data.db_models import QuestionModel
+from app.infrastructure.embedding_cache import HybridEmbeddingCache
+from app.infrastructure.embedding_codec import (
+    EMBEDDING_ENCODING_FLOAT32,
+    decode_embedding,
+    encode_embedding,
+    legacy_embedding_model,
+)
 from app.infrastructure.embedding_utils import (
     DEFAULT_EMBEDDING_MODEL as EMBEDDING_MODEL,
     generate_embedding_safe,
@@ -40,6 +48,158 @@ logger = logging.getLogger(__name__)
 # - 2.1: Added stimulus field for memory questions (TASK-732-736)
 PROMPT_VERSION = "2.1"
 
+# Fields of a full question record (keys of the dicts returned by loaders)
+QUESTION_FIELDS = (
+    "id",
+    "question_text",
+    "question_type",
+    "difficulty_level",
+    "correct_answer",
+    "answer_options",
+    "explanation",
+    "stimulus",  # TASK-727: Content to memorize
+    "sub_type",
+    "inferred_sub_type",
+    "metadata",  # TASK-445: Standardized key name
+    "source_llm",
+    "source_model",
+    "judge_score",
+    "prompt_version",
+    "created_at",
+    "is_active",
+    "question_embedding",  # TASK-433: Include pre-computed embedding
+)
+
+# Fields needed to check new questions against the bank for duplicates
+DEDUP_FIELDS = ("id", "question_text", "question_embedding")
+
+# Rows fetched per keyset page by iter_questions
+DEFAULT_PAGE_SIZE = 1000
+
+# Columns selected for fields that are not a same-named QuestionModel column
+_FIELD_COLUMNS: Dict[str, Tuple[Any, ...]] = {
+    "metadata": (QuestionModel.question_metadata,),
+    "question_embedding": (
+        QuestionModel.question_embedding,
+        QuestionModel.embedding_vector,
+        QuestionModel.embedding_encoding,
+        QuestionModel.embedding_scale,
+    ),
+}
+
+# Embedding columns written by bulk inserts, so every row has the same keys
+_EMBEDDING_COLUMN_NAMES = (
+    "embedding_vector",
+    "embedding_model",
+    "embedding_dim",
+    "embedding_encoding",
+    "embedding_scale",
+)
+
+
+def _embedding_columns(
+    embedding: Optional[Sequence[float]], encoding: str
+) -> Dict[str, Any]:
+    """Build compact embedding column values for a new question.
+
+    The model is inferred from the dimension because the shared embedding
+    helpers fall back to Google text-embedding-004 (768-d) without saying so.
+    """
+    if embedding is None or len(embedding) == 0:
+        return {}
+    encoded = encode_embedding(
+        embedding, legacy_embedding_model(len(embedding)), encoding=encoding
+    )
+    return encoded.column_values()
+
+
+def _question_row(
+    question: GeneratedQuestion,
+    judge_score: Optional[float],
+    embedding: Optional[Sequence[float]],
+    encoding: str,
+) -> Dict[str, Any]:
+    """Build QuestionModel attribute values for a new question.
+
+    QuestionType enum values match the backend directly, so no mapping is needed.
+    """
+    return {
+        "question_text": question.question_text,
+        "question_type": question.question_type.value,
+        "difficulty_level": question.difficulty_level.value,
+        "correct_answer": question.correct_answer,
+        "answer_options": question.answer_options,
+        "explanation": question.explanation,
+        "stimulus": question.stimulus,  # TASK-727: Content to memorize
+        "sub_type": question.sub_type,
+        "question_metadata": question.metadata,
+        "source_llm": question.source_llm,
+        "source_model": question.source_model,
+        "judge_score": judge_score,
+        "prompt_version": PROMPT_VERSION,
+        "is_active": True,
+        # TASK-433: Store pre-computed embedding (compact format)
+        **_embedding_columns(embedding, encoding),
+    }
+
+
+def _enriched_question(evaluated_question: EvaluatedQuestion) -> GeneratedQuestion:
+    """Copy a question with its individual evaluation scores merged into metadata.
+
+    Stored scores enable future recalculation without re-calling the judge API.
+    """
+    question = evaluated_question.question
+    evaluation = evaluated_question.evaluation
+
+    enriched_metadata = {
+        **(question.metadata or {}),
+        "evaluation_scores": {
+            "clarity_score": evaluation.clarity_score,
+            "difficulty_score": evaluation.difficulty_score,
+            "validity_score": evaluation.validity_score,
+            "formatting_score": evaluation.formatting_score,
+            "creativity_score": evaluation.creativity_score,
+            "feedback": evaluation.feedback,
+        },
+        "judge_model": evaluated_question.judge_model,
+    }
+
+    return GeneratedQuestion(
+        question_text=question.question_text,
+        question_type=question.question_type,
+        difficulty_level=question.difficulty_level,
+        correct_answer=question.correct_answer,
+        answer_options=question.answer_options,
+        explanation=question.explanation,
+        stimulus=question.stimulus,  # TASK-727: Preserve stimulus field
+        sub_type=question.sub_type,
+        metadata=enriched_metadata,
+        source_llm=question.source_llm,
+        source_model=question.source_model,
+    )
+
+
+def _field_value(row: Any, field: str) -> Any:
+    """Read one loader field from a projected row."""
+    if field == "question_embedding":
+        return _stored_embedding(row)
+    if field == "metadata":
+        return row.question_metadata
+    return getattr(row, field)
+
+
+def _stored_embedding(row: Any) -> Any:
+    """Return a row's embedding, preferring the compact binary columns.
+
+    Compact embeddings are decoded into a zero-copy NumPy view over the bytes
+    returned by the driver; rows not yet converted fall back to the legacy
+    ``question_embedding`` list.
+    """
+    data = getattr(row, "embedding_vector", None)
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return decode_embedding(data, row.embedding_encoding, row.embedding_scale)
+    return row.question_embedding
+
 
 class DatabaseService:
     """Service for database operations related to question storage."""
@@ -49,6 +209,8 @@ class DatabaseService:
         database_url: str,
         openai_api_key: Optional[str] = None,
         google_api_key: Optional[str] = None,
+        embedding_encoding: str = EMBEDDING_ENCODING_FLOAT32,
+        embedding_cache: Optional[HybridEmbeddingCache] = None,
     ):
         """Initialize database service.
 
@@ -58,6 +220,11 @@ class DatabaseService:
                            If not provided, embeddings will not be computed.
             google_api_key: Optional Google API key used as fallback when
                            OpenAI quota is exhausted.
+            embedding_encoding: Storage encoding for new embeddings
+                           ("float32" or "int8").
+            embedding_cache: Optional deduplicator embedding cache. Batch
+                           inserts reuse embeddings computed during
+                           deduplication and add the ones they compute.
 
         Raises:
             Exception: If database connection fails
@@ -68,6 +235,8 @@ class DatabaseService:
             autocommit=False, autoflush=False, bind=self.engine
         )
         self.google_api_key = google_api_key
+        self.embedding_encoding = embedding_encoding
+        self.embedding_cache = embedding_cache
 
         # Initialize OpenAI client for embedding generation (TASK-433)
         self.openai_client = None
@@ -155,24 +324,10 @@ class DatabaseService:
                     # during deduplication. Falls back to None if OpenAI client is unavailable.
                     embedding = self._generate_embedding(question.question_text)
 
-                    # Create database model
-                    # Note: No mapping needed - QuestionType enum values now match backend directly
                     db_question = QuestionModel(
-                        question_text=question.question_text,
-                        question_type=question.question_type.value,
-                        difficulty_level=question.difficulty_level.value,
-                        correct_answer=question.correct_answer,
-                        answer_options=question.answer_options,
-                        explanation=question.explanation,
-                        stimulus=question.stimulus,  # TASK-727: Content to memorize
-                        sub_type=question.sub_type,
-                        question_metadata=question.metadata,
-                        source_llm=question.source_llm,
-                        source_model=question.source_model,
-                        judge_score=judge_score,
-                        prompt_version=PROMPT_VERSION,
-                        is_active=True,
-                        question_embedding=embedding,  # TASK-433: Store pre-computed embedding
+                        **_question_row(
+                            question, judge_score, embedding, self.embedding_encoding
+                        )
                     )
 
                     session.add(db_question)
@@ -223,45 +378,50 @@ class DatabaseService:
                 "approved": evaluated_question.approved,
             },
         ) as span:
-            # Merge individual scores into question metadata for future recalculation
-            question = evaluated_question.question
-            evaluation = evaluated_question.evaluation
-
-            enriched_metadata = {
-                **(question.metadata or {}),
-                "evaluation_scores": {
-                    "clarity_score": evaluation.clarity_score,
-                    "difficulty_score": evaluation.difficulty_score,
-                    "validity_score": evaluation.validity_score,
-                    "formatting_score": evaluation.formatting_score,
-                    "creativity_score": evaluation.creativity_score,
-                    "feedback": evaluation.feedback,
-                },
-                "judge_model": evaluated_question.judge_model,
-            }
-
-            # Create a new question with enriched metadata
-            enriched_question = GeneratedQuestion(
-                question_text=question.question_text,
-                question_type=question.question_type,
-                difficulty_level=question.difficulty_level,
-                correct_answer=question.correct_answer,
-                answer_options=question.answer_options,
-                explanation=question.explanation,
-                stimulus=question.stimulus,  # TASK-727: Preserve stimulus field
-                sub_type=question.sub_type,
-                metadata=enriched_metadata,
-                source_llm=question.source_llm,
-                source_model=question.source_model,
-            )
-
             question_id = self.insert_question(
-                question=enriched_question,
-                judge_score=evaluation.overall_score,
+                question=_enriched_question(evaluated_question),
+                judge_score=evaluated_question.evaluation.overall_score,
             )
             span.set_attribute("question_id", question_id)
             return question_id
 
+    def _generate_embeddings(self, texts: List[str]) -> List[Optional[Sequence[float]]]:
+        """Generate embeddings for many texts with at most one API call.
+
+        Embeddings already in the embedding cache (typically computed by the
+        deduplicator moments earlier) are reused; the rest are requested in a
+        single batch call and added to the cache. Failures leave None entries
+        so rows can be inserted without embeddings and backfilled later.
+
+        Args:
+            texts: Texts to generate embeddings for
+
+        Returns:
+            One embedding (or None) per text, in order
+        """
+        embeddings: List[Optional[Sequence[float]]] = [None] * len(texts)
+        missing = []
+        for i, text_value in enumerate(texts):
+            if self.embedding_cache is not None:
+                embeddings[i] = self.embedding_cache.get(text_value, EMBEDDING_MODEL)
+            if embeddings[i] is None:
+                missing.append(i)
+
+        if missing and self.openai_client:
+            try:
+                batch_results = generate_embeddings_batch(
+                    self.openai_client, [texts[i] for i in missing], EMBEDDING_MODEL
+                )
+                for i, emb in zip(missing, batch_results):
+                    embeddings[i] = emb
+                    if self.embedding_cache is not None:
+                        self.embedding_cache.set(texts[i], EMBEDDING_MODEL, emb)
+            except Exception as e:
+                logger.debug(
+                    f"Batch embedding generation failed, proceeding without: {e}"
+                )
+        return embeddings
+
     def insert_questions_batch(
         self,
         questions: List[GeneratedQuestion],
@@ -293,43 +453,23 @@ class DatabaseService:
             try:
                 with self.session_scope() as session:
                     db_questions = []
-                    embeddings_computed = 0
 
                     # Generate embeddings in a single batch API call for efficiency
-                    embeddings: List[Optional[List[float]]] = [None] * len(questions)
-                    if self.openai_client:
-                        try:
-                            texts = [q.question_text for q in questions]
-                            batch_results = generate_embeddings_batch(
-                                self.openai_client, texts, EMBEDDING_MODEL
-                            )
-                            for i, emb in enumerate(batch_results):
-                                embeddings[i] = emb.tolist()
-                                embeddings_computed += 1
-                        except Exception as e:
-                            logger.debug(
-                                f"Batch embedding generation failed, proceeding without: {e}"
-                            )
+                    embeddings = self._generate_embeddings(
+                        [q.question_text for q in questions]
+                    )
+                    embeddings_computed = sum(e is not None for e in embeddings)
 
                     for i, question in enumerate(questions):
                         judge_score = judge_scores[i] if judge_scores else None
 
                         db_question = QuestionModel(
-                            question_text=question.question_text,
-                            question_type=question.question_type.value,
-                            difficulty_level=question.difficulty_level.value,
-                            correct_answer=question.correct_answer,
-                            answer_options=question.answer_options,
-                            explanation=question.explanation,
-                            stimulus=question.stimulus,  # TASK-727: Content to memorize
-                            sub_type=question.sub_type,
-                            question_metadata=question.metadata,
-                            source_llm=question.source_llm,
-                            source_model=question.source_model,
-                            judge_score=judge_score,
-                            prompt_version=PROMPT_VERSION,
-                            is_active=True,
-                            question_embedding=embeddings[i],
+                            **_question_row(
+                                question,
+                                judge_score,
+                                embeddings[i],
+                                self.embedding_encoding,
+                            )
                         )
 
                         session.add(db_question)
@@ -355,6 +495,89 @@ class DatabaseService:
                 logger.error(f"Failed to insert batch of questions: {str(e)}")
                 raise
 
+    def insert_questions_bulk(
+        self,
+        questions: List[GeneratedQuestion],
+        judge_scores: Optional[List[float]] = None,
+    ) -> List[int]:
+        """Insert many questions with multi-row INSERT ... RETURNING id.
+
+        Unlike insert_questions_batch, no ORM objects are built: rows go to
+        the database as ORM bulk INSERT statements, which SQLAlchemy sends as
+        multi-row VALUES lists (up to 1000 rows per statement) and whose
+        RETURNING ids come back in input order. All rows share one
+        transaction, and embeddings come from the embedding cache or a
+        single batch API call.
+
+        Args:
+            questions: List of generated questions to insert
+            judge_scores: Optional list of judge scores (must match length of questions)
+
+        Returns:
+            List of inserted question IDs, in the order of questions
+
+        Raises:
+            ValueError: If judge_scores length doesn't match questions
+            Exception: If insertion fails
+        """
+        if judge_scores and len(judge_scores) != len(questions):
+            raise ValueError(
+                f"Length of judge_scores ({len(judge_scores)}) must match "
+                f"length of questions ({len(questions)})"
+            )
+        if not questions:
+            return []
+
+        with observability.start_span(
+            "database.insert_questions_bulk",
+            attributes={"count": len(questions)},
+        ) as span:
+            try:
+                embeddings = self._generate_embeddings(
+                    [q.question_text for q in questions]
+                )
+                embeddings_computed = sum(e is not None for e in embeddings)
+
+                # Every row carries every embedding column (None when missing)
+                # so the whole batch shares one statement shape
+                empty_embedding = dict.fromkeys(_EMBEDDING_COLUMN_NAMES)
+                rows = [
+                    {
+                        **empty_embedding,
+                        **_question_row(
+                            question,
+                            judge_scores[i] if judge_scores else None,
+                            embeddings[i],
+                            self.embedding_encoding,
+                        ),
+                    }
+                    for i, question in enumerate(questions)
+                ]
+
+                with self.session_scope() as session:
+                    question_ids = list(
+                        session.scalars(
+                            insert(QuestionModel).returning(
+                                QuestionModel.id, sort_by_parameter_order=True
+                            ),
+                            rows,
+                        )
+                    )
+
+                span.set_attribute("success", True)
+                span.set_attribute("questions_inserted", len(question_ids))
+                logger.info(
+                    f"Bulk inserted {len(question_ids)} questions "
+                    f"({embeddings_computed} with embeddings)"
+                )
+                return question_ids
+
+            except Exception as e:
+                span.set_attribute("success", False)
+                span.set_status("error", str(e))
+                logger.error(f"Failed to bulk insert questions: {str(e)}")
+                raise
+
     def insert_evaluated_questions_batch(
         self,
         evaluated_questions: List[EvaluatedQuestion],
@@ -362,7 +585,8 @@ class DatabaseService:
         """Insert multiple evaluated questions in a batch.
 
         Stores individual evaluation scores in metadata to enable future
-        recalculation without re-calling the judge API.
+        recalculation without re-calling the judge API. Uses the bulk
+        insertion path (insert_questions_bulk).
 
         Args:
             evaluated_questions: List of evaluated questions with scores
@@ -377,46 +601,11 @@ class DatabaseService:
             "database.insert_evaluated_questions_batch",
             attributes={"count": len(evaluated_questions)},
         ) as span:
-            # Enrich each question with individual evaluation scores
-            enriched_questions = []
-            scores = []
-
-            for eq in evaluated_questions:
-                question = eq.question
-                evaluation = eq.evaluation
-
-                enriched_metadata = {
-                    **(question.metadata or {}),
-                    "evaluation_scores": {
-                        "clarity_score": evaluation.clarity_score,
-                        "difficulty_score": evaluation.difficulty_score,
-                        "validity_score": evaluation.validity_score,
-                        "formatting_score": evaluation.formatting_score,
-                        "creativity_score": evaluation.creativity_score,
-                        "feedback": evaluation.feedback,
-                    },
-                    "judge_model": eq.judge_model,
-                }
-
-                enriched_question = GeneratedQuestion(
-                    question_text=question.question_text,
-                    question_type=question.question_type,
-                    difficulty_level=question.difficulty_level,
-                    correct_answer=question.correct_answer,
-                    answer_options=question.answer_options,
-                    explanation=question.explanation,
-                    stimulus=question.stimulus,  # TASK-727: Preserve stimulus field
-                    sub_type=question.sub_type,
-                    metadata=enriched_metadata,
-                    source_llm=question.source_llm,
-                    source_model=question.source_model,
-                )
-
-                enriched_questions.append(enriched_question)
-                scores.append(evaluation.overall_score)
-
-            question_ids = self.insert_questions_batch(
-                questions=enriched_questions, judge_scores=scores
+            question_ids = self.insert_questions_bulk(
+                questions=[_enriched_question(eq) for eq in evaluated_questions],
+                judge_scores=[
+                    eq.evaluation.overall_score for eq in evaluated_questions
+                ],
             )
             span.set_attribute("questions_inserted", len(question_ids))
             return question_ids
@@ -424,6 +613,9 @@ class DatabaseService:
     def get_all_questions(self) -> List[Dict[str, Any]]:
         """Retrieve all questions from database.
 
+        Prefer iter_questions with only the fields a job needs; this loads
+        every field of every question into memory.
+
         Returns:
             List of question dictionaries including embeddings (TASK-433)
 
@@ -431,41 +623,74 @@ class DatabaseService:
             Exception: If query fails
         """
         try:
-            with self.session_scope(read_only=True) as session:
-                questions = session.query(QuestionModel).all()
-
-                result = []
-                for q in questions:
-                    result.append(
-                        {
-                            "id": q.id,
-                            "question_text": q.question_text,
-                            "question_type": q.question_type,
-                            "difficulty_level": q.difficulty_level,
-                            "correct_answer": q.correct_answer,
-                            "answer_options": q.answer_options,
-                            "explanation": q.explanation,
-                            "stimulus": q.stimulus,  # TASK-727: Content to memorize
-                            "sub_type": q.sub_type,
-                            "inferred_sub_type": q.inferred_sub_type,
-                            "metadata": q.question_metadata,  # TASK-445: Standardized key name
-                            "source_llm": q.source_llm,
-                            "source_model": q.source_model,
-                            "judge_score": q.judge_score,
-                            "prompt_version": q.prompt_version,
-                            "created_at": q.created_at,
-                            "is_active": q.is_active,
-                            "question_embedding": q.question_embedding,  # TASK-433: Include pre-computed embedding
-                        }
-                    )
-
-                logger.info(f"Retrieved {len(result)} questions from database")
-                return result
+            result = list(self.iter_questions(QUESTION_FIELDS))
+            logger.info(f"Retrieved {len(result)} questions from database")
+            return result
 
         except Exception as e:
             logger.error(f"Failed to retrieve questions: {str(e)}")
             raise
 
+    def iter_questions(
+        self,
+        fields: Sequence[str] = QUESTION_FIELDS,
+        difficulty: Optional[str] = None,
+        question_type: Optional[str] = None,
+        active_only: bool = False,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream questions in id order, selecting only the requested fields.
+
+        Pages are read with keyset pagination (``WHERE id > last_id ORDER BY
+        id LIMIT page_size``), each in its own short read-only session, so
+        memory use and transaction length stay bounded by the page size
+        rather than the size of the bank.
+
+        Args:
+            fields: Keys of the yielded dicts, from QUESTION_FIELDS
+                   (e.g. DEDUP_FIELDS)
+            difficulty: Only questions with this difficulty level
+            question_type: Only questions of this type
+            active_only: Only active questions
+            page_size: Rows fetched per query
+
+        Yields:
+            Dict per question with the requested fields
+
+        Raises:
+            ValueError: If a field is not in QUESTION_FIELDS
+            Exception: If a query fails
+        """
+        unknown = set(fields) - set(QUESTION_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown question fields: {sorted(unknown)}")
+
+        # id is always selected: pages are keyed on it
+        columns: Dict[str, Any] = {"id": QuestionModel.id}
+        for field in fields:
+            for column in _FIELD_COLUMNS.get(field, (getattr(QuestionModel, field),)):
+                columns[column.key] = column
+
+        last_id = 0
+        while True:
+            with self.session_scope(read_only=True) as session:
+                query = session.query(*columns.values()).filter(
+                    QuestionModel.id > last_id
+                )
+                if difficulty is not None:
+                    query = query.filter(QuestionModel.difficulty_level == difficulty)
+                if question_type is not None:
+                    query = query.filter(QuestionModel.question_type == question_type)
+                if active_only:
+                    query = query.filter(QuestionModel.is_active.is_(True))
+                rows = query.order_by(QuestionModel.id).limit(page_size).all()
+
+            for row in rows:
+                yield {field: _field_value(row, field) for field in fields}
+            if len(rows) < page_size:
+                return
+            last_id = rows[-1].id
+
     def get_questions_by_difficulty(self, difficulty: str) -> List[Dict[str, Any]]:
         """Retrieve questions filtered by difficulty level.
 
@@ -482,26 +707,15 @@ class DatabaseService:
             Exception: If query fails
         """
         try:
-            with self.session_scope(read_only=True) as session:
-                rows = (
-                    session.query(
-                        QuestionModel.question_text,
-                        QuestionModel.question_embedding,
-                    )
-                    .filter(QuestionModel.difficulty_level == difficulty)
-                    .all()
-                )
-                result = [
-                    {
-                        "question_text": r.question_text,
-                        "question_embedding": r.question_embedding,
-                    }
-                    for r in rows
-                ]
-                logger.info(
-                    f"Retrieved {len(result)} questions with difficulty={difficulty!r}"
+            result = list(
+                self.iter_questions(
+                    ("question_text", "question_embedding"), difficulty=difficulty
                 )
-                return result
+            )
+            logger.info(
+                f"Retrieved {len(result)} questions with difficulty={difficulty!r}"
+            )
+            return result
 
         except Exception as e:
             logger.error(f"Failed to retrieve questions by difficulty: {str(e)}")
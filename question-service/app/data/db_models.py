@@ -17,6 +17,7 @@ from sqlalchemy import (
     Enum,
     Float,
     Integer,
+    LargeBinary,
     String,
     Text,
 )
@@ -55,7 +56,14 @@ class QuestionModel(Base):
     is_active = Column(Boolean, default=True, nullable=False, index=True)
     question_embedding = Column(
         ARRAY(Float), nullable=True
-    )  # TASK-433: Pre-computed embedding
+    )  # TASK-433: Pre-computed embedding (legacy float8[]; see embedding_vector)
+    embedding_vector = Column(
+        LargeBinary, nullable=True
+    )  # Packed float32/int8 embedding bytes (app/infrastructure/embedding_codec.py)
+    embedding_model = Column(String(100), nullable=True)
+    embedding_dim = Column(Integer, nullable=True)
+    embedding_encoding = Column(String(10), nullable=True)  # "float32" or "int8"
+    embedding_scale = Column(Float, nullable=True)  # int8 dequantization scale
     stimulus = Column(
         Text, nullable=True
     )  # TASK-727: Content to memorize (memory questions)
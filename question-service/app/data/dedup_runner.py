@@ -3,6 +3,7 @@
 import logging
 import time
 from difflib import SequenceMatcher
+from typing import Optional
 
 from gioe_libs.observability import observability
 
@@ -15,6 +16,7 @@ from app.reporting.run_summary import RunSummary as PipelineRunSummary
 def dedupe_within_batch(
     questions: list,
     similarity_threshold: float = 0.85,
+    seen_texts: Optional[list[str]] = None,
 ) -> list:
     """Remove near-duplicate questions within a batch before judge evaluation.
 
@@ -24,15 +26,20 @@ def dedupe_within_batch(
     Args:
         questions: List of GeneratedQuestion objects
         similarity_threshold: Similarity ratio above which questions are considered duplicates
+        seen_texts: Normalized texts of questions kept from earlier batches.
+            Questions are also checked against these, and the texts of kept
+            questions are appended, so batches can be deduplicated as they
+            arrive.
 
     Returns:
         Filtered list with duplicates removed (keeps first occurrence)
     """
-    if len(questions) <= 1:
-        return questions
+    if seen_texts is None:
+        if len(questions) <= 1:
+            return questions
+        seen_texts = []
 
     unique_questions = []
-    seen_texts = []
 
     for question in questions:
         question_text = question.question_text.lower().strip()
@@ -51,6 +58,75 @@ def dedupe_within_batch(
     return unique_questions
 
 
+def is_unique_question(
+    evaluated_question: EvaluatedQuestion,
+    db: QuestionDatabase,
+    deduplicator: QuestionDeduplicator,
+    questions_by_difficulty: dict,
+    metrics: PipelineRunSummary,
+    logger: logging.Logger,
+) -> bool:
+    """Check one approved question against existing questions of its difficulty.
+
+    Existing questions are loaded once per difficulty into
+    ``questions_by_difficulty`` (an empty list if loading fails).
+
+    Returns:
+        False if the question is a duplicate. Check failures keep the
+        question (fail-open) and return True.
+    """
+    try:
+        q_difficulty = str(evaluated_question.question.difficulty_level.value).lower()
+        if q_difficulty not in questions_by_difficulty:
+            try:
+                questions_by_difficulty[q_difficulty] = db.get_questions_by_difficulty(
+                    q_difficulty
+                )
+            except Exception as e:
+                logger.error(f"Failed to load existing questions: {e}")
+                observability.capture_error(
+                    e,
+                    context={"phase": "deduplication", "step": "load_existing"},
+                )
+                questions_by_difficulty[q_difficulty] = []
+        same_difficulty_questions = questions_by_difficulty[q_difficulty]
+        result = deduplicator.check_duplicate(
+            evaluated_question.question, same_difficulty_questions
+        )
+
+        if not result.is_duplicate:
+            logger.debug(
+                f"✓ Unique: {evaluated_question.question.question_text[:60]}..."
+            )
+        else:
+            logger.info(
+                f"✗ Duplicate ({result.duplicate_type}, score={result.similarity_score:.3f}): "
+                f"{evaluated_question.question.question_text[:60]}..."
+            )
+
+        metrics.record_duplicate_check(
+            is_duplicate=result.is_duplicate,
+            duplicate_type=result.duplicate_type,
+        )
+
+        if result.is_duplicate:
+            observability.record_metric(
+                "dedup.by_type",
+                value=1,
+                labels={"duplicate_type": result.duplicate_type or "unknown"},
+                metric_type="counter",
+            )
+
+        return not result.is_duplicate
+
+    except Exception as e:
+        logger.error(f"Deduplication check failed: {e}")
+        observability.capture_error(
+            e, context={"phase": "deduplication", "step": "check"}
+        )
+        return True
+
+
 def run_dedup_phase(
     approved_questions: list,
     db: QuestionDatabase,
@@ -75,64 +151,23 @@ def run_dedup_phase(
         questions_by_difficulty: dict = {}
         unique_questions = []
         duplicate_count = 0
-        total_existing = 0
 
         for evaluated_question in approved_questions:
-            try:
-                q_difficulty = str(
-                    evaluated_question.question.difficulty_level.value
-                ).lower()
-                if q_difficulty not in questions_by_difficulty:
-                    try:
-                        questions_by_difficulty[q_difficulty] = (
-                            db.get_questions_by_difficulty(q_difficulty)
-                        )
-                        total_existing += len(questions_by_difficulty[q_difficulty])
-                    except Exception as e:
-                        logger.error(f"Failed to load existing questions: {e}")
-                        observability.capture_error(
-                            e,
-                            context={"phase": "deduplication", "step": "load_existing"},
-                        )
-                        questions_by_difficulty[q_difficulty] = []
-                same_difficulty_questions = questions_by_difficulty[q_difficulty]
-                result = deduplicator.check_duplicate(
-                    evaluated_question.question, same_difficulty_questions
-                )
-
-                if not result.is_duplicate:
-                    unique_questions.append(evaluated_question)
-                    logger.debug(
-                        f"✓ Unique: {evaluated_question.question.question_text[:60]}..."
-                    )
-                else:
-                    duplicate_count += 1
-                    logger.info(
-                        f"✗ Duplicate ({result.duplicate_type}, score={result.similarity_score:.3f}): "
-                        f"{evaluated_question.question.question_text[:60]}..."
-                    )
-
-                metrics.record_duplicate_check(
-                    is_duplicate=result.is_duplicate,
-                    duplicate_type=result.duplicate_type,
-                )
-
-                if result.is_duplicate:
-                    observability.record_metric(
-                        "dedup.by_type",
-                        value=1,
-                        labels={"duplicate_type": result.duplicate_type or "unknown"},
-                        metric_type="counter",
-                    )
-
-            except Exception as e:
-                logger.error(f"Deduplication check failed: {e}")
-                observability.capture_error(
-                    e, context={"phase": "deduplication", "step": "check"}
-                )
+            if is_unique_question(
+                evaluated_question,
+                db,
+                deduplicator,
+                questions_by_difficulty,
+                metrics,
+                logger,
+            ):
                 unique_questions.append(evaluated_question)
-                continue
+            else:
+                duplicate_count += 1
 
+        total_existing = sum(
+            len(existing) for existing in questions_by_difficulty.values()
+        )
         dedup_span.set_attribute("existing_questions", total_existing)
         dedup_span.set_attribute("unique_count", len(unique_questions))
         dedup_span.set_attribute("duplicate_count", duplicate_count)
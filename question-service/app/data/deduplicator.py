@@ -263,8 +263,13 @@ class QuestionDeduplicator:
                     continue
 
                 existing_embedding_data = existing.get("question_embedding")
-                if existing_embedding_data:
-                    existing_embedding = np.array(existing_embedding_data)
+                if (
+                    existing_embedding_data is not None
+                    and len(existing_embedding_data) > 0
+                ):
+                    # Compact embeddings arrive as NumPy views over the stored
+                    # bytes; asarray keeps them uncopied until they are stacked
+                    existing_embedding = np.asarray(existing_embedding_data)
                 else:
                     # Fall back to on-demand generation for questions without embeddings
                     # (e.g., questions created before TASK-433 was implemented)
@@ -284,7 +289,9 @@ class QuestionDeduplicator:
 
             # Stack all embeddings into a 2D matrix and compute all cosine similarities
             # in a single vectorized operation: O(N*D) instead of O(N) sequential calls.
-            matrix = np.stack(embeddings)  # shape (N, D)
+            # Compared in float32: int8-quantized rows are upcast and their
+            # per-vector scale cancels out of the cosine.
+            matrix = np.stack(embeddings).astype(np.float32, copy=False)  # (N, D)
             norms = np.linalg.norm(matrix, axis=1)  # shape (N,)
             valid = norms > 0
             similarities = np.zeros(len(embeddings))
@@ -414,6 +421,15 @@ class QuestionDeduplicator:
         """
         self._embedding_cache.clear()
 
+    @property
+    def embedding_cache(self) -> HybridEmbeddingCache:
+        """Return the embedding cache, for sharing with database insertion.
+
+        Returns:
+            The HybridEmbeddingCache used for question embeddings
+        """
+        return self._embedding_cache
+
     @property
     def using_redis_cache(self) -> bool:
         """Return whether Redis is being used for embedding cache.
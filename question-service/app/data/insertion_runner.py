@@ -10,6 +10,46 @@ from app.data.database import DatabaseService
 from app.reporting.run_summary import RunSummary as PipelineRunSummary
 
 
+def insert_question_batch(
+    questions: list,
+    db: DatabaseService,
+    metrics: PipelineRunSummary,
+    logger: logging.Logger,
+) -> int:
+    """Insert evaluated questions in one transaction and record the outcome.
+
+    Failures are logged and recorded as insertion failures, not raised.
+
+    Returns number of inserted questions (0 if the batch failed).
+    """
+    try:
+        question_ids = db.insert_evaluated_questions_batch(questions)
+    except Exception as e:
+        logger.error(f"✗ Failed to insert questions batch: {e}")
+        observability.capture_error(
+            e,
+            context={
+                "phase": "db_insertion",
+                "question_count": len(questions),
+            },
+        )
+        metrics.record_insertion_failure(count=len(questions))
+        return 0
+
+    for i, (evaluated_question, question_id) in enumerate(
+        zip(questions, question_ids), 1
+    ):
+        logger.debug(
+            f"✓ Inserted question {i}/{len(questions)} "
+            f"(ID: {question_id}, score: {evaluated_question.evaluation.overall_score:.2f})"
+        )
+        metrics.record_insertion_success(
+            count=1,
+            question_type=evaluated_question.question.question_type.value,
+        )
+    return len(question_ids)
+
+
 def run_insertion_phase(
     unique_questions: list,
     db: Optional[DatabaseService],
@@ -23,39 +63,13 @@ def run_insertion_phase(
     if db is None:
         raise ValueError("db is required for insertion phase")
 
-    inserted_count = 0
     storage_start = time.perf_counter()
 
     with observability.start_span(
         "phase4_db_insertion",
         attributes={"questions_to_insert": len(unique_questions)},
     ) as insert_span:
-        try:
-            question_ids = db.insert_evaluated_questions_batch(unique_questions)
-            inserted_count = len(question_ids)
-
-            for i, (evaluated_question, question_id) in enumerate(
-                zip(unique_questions, question_ids), 1
-            ):
-                logger.debug(
-                    f"✓ Inserted question {i}/{len(unique_questions)} "
-                    f"(ID: {question_id}, score: {evaluated_question.evaluation.overall_score:.2f})"
-                )
-                metrics.record_insertion_success(
-                    count=1,
-                    question_type=evaluated_question.question.question_type.value,
-                )
-        except Exception as e:
-            logger.error(f"✗ Failed to insert questions batch: {e}")
-            observability.capture_error(
-                e,
-                context={
-                    "phase": "db_insertion",
-                    "question_count": len(unique_questions),
-                },
-            )
-            for evaluated_question in unique_questions:
-                metrics.record_insertion_failure(count=1)
+        inserted_count = insert_question_batch(unique_questions, db, metrics, logger)
 
         insert_span.set_attribute("inserted_count", inserted_count)
         insert_span.set_attribute(
@@ -7,7 +7,7 @@ specialized LLM models based on question type.
 import asyncio
 import json
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from gioe_libs.observability import observability
 
@@ -31,10 +31,11 @@ from app.generation.prompts import (
     build_judge_prompt,
 )
 from app.providers.anthropic_provider import AnthropicProvider
-from app.providers.base import BaseLLMProvider
+from app.providers.base import BaseLLMProvider, batch_request_key
 from app.providers.google_provider import GoogleProvider
 from app.providers.openai_provider import OpenAIProvider
 from app.providers.xai_provider import XAIProvider
+from app.utils.text_utils import safe_json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +47,11 @@ DEFAULT_FALLBACK_TIMEOUT_SECONDS = (
 )
 ANSWER_VERIFICATION_MAX_TOKENS = 2000
 
+# Batch API evaluation settings (see evaluate_questions_batch_async)
+DEFAULT_BATCH_CHUNK_SIZE = 500  # Questions per provider batch job
+DEFAULT_BATCH_POLL_INTERVAL_SECONDS = 30.0  # Seconds between batch status checks
+DEFAULT_BATCH_TIMEOUT_SECONDS = 3600.0  # Batch job deadline before individual retry
+
 
 def _error_category(error: BaseException) -> str:
     """Return a lowercase error category derived from the exception type name."""
@@ -331,34 +337,19 @@ class QuestionJudge:
                     else:
                         raise
 
-                # Parse evaluation scores
-                evaluation = self._parse_evaluation_response(result.content)
-
-                # Calculate overall score using evaluation criteria weights
-                overall_score = self._calculate_overall_score(evaluation)
-
-                # Update overall score in evaluation
-                evaluation.overall_score = overall_score
-
-                # Determine if question is approved
-                min_score = self.judge_config.get_min_judge_score()
-                approved = overall_score >= min_score
+                evaluated = self._build_evaluated_question(
+                    question, result.content, f"{resolved_provider}/{effective_model}"
+                )
+                overall_score = evaluated.evaluation.overall_score
 
                 span.set_attribute("success", True)
                 span.set_attribute("score", overall_score)
-                span.set_attribute("approved", approved)
+                span.set_attribute("approved", evaluated.approved)
 
                 logger.info(
                     f"Question evaluated: overall_score={overall_score:.3f}, "
-                    f"approved={approved} (threshold={min_score})"
-                )
-
-                # Create evaluated question
-                evaluated = EvaluatedQuestion(
-                    question=question,
-                    evaluation=evaluation,
-                    judge_model=f"{resolved_provider}/{effective_model}",
-                    approved=approved,
+                    f"approved={evaluated.approved} "
+                    f"(threshold={self.judge_config.get_min_judge_score()})"
                 )
 
                 return evaluated
@@ -546,34 +537,19 @@ class QuestionJudge:
                     else:
                         raise
 
-                # Parse evaluation scores
-                evaluation = self._parse_evaluation_response(response)
-
-                # Calculate overall score using evaluation criteria weights
-                overall_score = self._calculate_overall_score(evaluation)
-
-                # Update overall score in evaluation
-                evaluation.overall_score = overall_score
-
-                # Determine if question is approved
-                min_score = self.judge_config.get_min_judge_score()
-                approved = overall_score >= min_score
+                evaluated = self._build_evaluated_question(
+                    question, response, f"{resolved_provider}/{effective_model}"
+                )
+                overall_score = evaluated.evaluation.overall_score
 
                 span.set_attribute("success", True)
                 span.set_attribute("score", overall_score)
-                span.set_attribute("approved", approved)
+                span.set_attribute("approved", evaluated.approved)
 
                 logger.info(
                     f"Question evaluated (async): overall_score={overall_score:.3f}, "
-                    f"approved={approved} (threshold={min_score})"
-                )
-
-                # Create evaluated question
-                evaluated = EvaluatedQuestion(
-                    question=question,
-                    evaluation=evaluation,
-                    judge_model=f"{resolved_provider}/{effective_model}",
-                    approved=approved,
+                    f"approved={evaluated.approved} "
+                    f"(threshold={self.judge_config.get_min_judge_score()})"
                 )
 
                 return evaluated
@@ -1296,6 +1272,238 @@ class QuestionJudge:
             max_tokens=max_tokens,
         )
 
+    async def evaluate_questions_batch_async(
+        self,
+        questions: List[GeneratedQuestion],
+        temperature: float = 0.3,
+        max_tokens: int = 500,
+        chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE,
+        poll_interval: float = DEFAULT_BATCH_POLL_INTERVAL_SECONDS,
+        timeout: float = DEFAULT_BATCH_TIMEOUT_SECONDS,
+    ) -> AsyncIterator[EvaluatedQuestion]:
+        """Evaluate questions through provider batch APIs, streaming results.
+
+        Questions are grouped by resolved judge provider/model and submitted in
+        chunks of up to chunk_size as provider batch jobs, which all run
+        concurrently. Evaluated questions are yielded as soon as their batch
+        job finishes, so callers can start processing before every job is done.
+
+        Questions whose judge provider has no batch API, whose batch job could
+        not be submitted or timed out, or whose batch response is missing or
+        unparseable are evaluated individually with evaluate_question_async
+        (including its fallback provider). As with evaluate_questions_list_async,
+        questions that still fail are logged and not yielded.
+
+        Args:
+            questions: List of generated questions to evaluate
+            temperature: Sampling temperature for evaluation
+            max_tokens: Maximum tokens for evaluation response
+            chunk_size: Maximum questions per batch job (capped at the
+                provider's max_batch_size)
+            poll_interval: Seconds between batch job status checks
+            timeout: Seconds to wait for a batch job before cancelling it and
+                evaluating its questions individually
+
+        Yields:
+            Successfully evaluated questions, in completion order
+        """
+        if not questions:
+            return
+
+        available_providers = list(self.providers.keys())
+        groups: Dict[Tuple[str, Optional[str]], List[GeneratedQuestion]] = {}
+        individual: List[GeneratedQuestion] = []
+        for question in questions:
+            try:
+                provider_name, model = self.judge_config.resolve_judge_provider(
+                    question.question_type.value, available_providers
+                )
+            except ValueError:
+                individual.append(question)  # Fails (and is logged) individually
+                continue
+            if self.providers[provider_name].supports_batch:
+                groups.setdefault((provider_name, model), []).append(question)
+            else:
+                individual.append(question)
+
+        logger.info(
+            f"Evaluating {len(questions)} questions via batch API "
+            f"({len(groups)} judge models, {len(individual)} individually)"
+        )
+
+        pending: set[asyncio.Task] = set()
+        for (provider_name, model), group in groups.items():
+            size = max(1, min(chunk_size, self.providers[provider_name].max_batch_size))
+            for start in range(0, len(group), size):
+                pending.add(
+                    asyncio.create_task(
+                        self._evaluate_batch_chunk(
+                            provider_name,
+                            model,
+                            group[start : start + size],
+                            temperature=temperature,
+                            max_tokens=max_tokens,
+                            poll_interval=poll_interval,
+                            timeout=timeout,
+                        )
+                    )
+                )
+        if individual:
+            pending.add(
+                asyncio.create_task(
+                    self._evaluate_individually(individual, temperature, max_tokens)
+                )
+            )
+
+        evaluated_count = 0
+        retried = 0
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    evaluated, failed = task.result()
+                    for evaluated_question in evaluated:
+                        evaluated_count += 1
+                        yield evaluated_question
+                    if failed:
+                        retried += len(failed)
+                        pending.add(
+                            asyncio.create_task(
+                                self._evaluate_individually(
+                                    failed, temperature, max_tokens
+                                )
+                            )
+                        )
+        finally:
+            for task in pending:
+                task.cancel()
+
+        logger.info(
+            f"Batch evaluation complete: {evaluated_count}/{len(questions)} "
+            f"evaluated, {retried} retried individually after batch failures"
+        )
+
+    async def _evaluate_batch_chunk(
+        self,
+        provider_name: str,
+        model: Optional[str],
+        questions: List[GeneratedQuestion],
+        temperature: float,
+        max_tokens: int,
+        poll_interval: float,
+        timeout: float,
+    ) -> Tuple[List[EvaluatedQuestion], List[GeneratedQuestion]]:
+        """Evaluate questions as one provider batch job.
+
+        Never raises: a job that cannot be submitted or completed returns every
+        question as failed.
+
+        Returns:
+            (evaluated questions, questions to retry individually)
+        """
+        provider = self.providers[provider_name]
+        judge_model = f"{provider_name}/{model or provider.model}"
+        circuit_breaker = self._circuit_breaker_registry.get_or_create(
+            f"judge-{provider_name}"
+        )
+        prompts = [
+            build_judge_prompt(
+                question=question.question_text,
+                answer_options=question.answer_options or [question.correct_answer],
+                correct_answer=question.correct_answer,
+                question_type=question.question_type.value,
+                difficulty=question.difficulty_level.value,
+                stimulus=question.stimulus,
+            )
+            for question in questions
+        ]
+
+        with observability.start_span(
+            "judge.evaluate_batch_chunk",
+            attributes={
+                "provider": provider_name,
+                "model": judge_model,
+                "questions": len(questions),
+            },
+        ) as span:
+            job_name: Optional[str] = None
+            try:
+                job_name = await circuit_breaker.execute_async(
+                    asyncio.to_thread,
+                    provider.create_batch_job,
+                    prompts,
+                    model_override=model,
+                    display_name=f"judge-{provider_name}-{len(questions)}",
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    response_format={},  # Provider will handle JSON mode
+                )
+                result = await provider.wait_for_batch_job_async(
+                    job_name, poll_interval=poll_interval, timeout=timeout
+                )
+            except Exception as e:
+                span.set_attribute("success", False)
+                span.set_status("error", str(e))
+                logger.error(
+                    f"Judge batch job {job_name or '(not submitted)'} on "
+                    f"{judge_model} failed for {len(questions)} questions: {e}"
+                )
+                if isinstance(e, TimeoutError) and job_name is not None:
+                    try:
+                        await asyncio.to_thread(provider.cancel_batch_job, job_name)
+                    except Exception as cancel_error:
+                        logger.warning(
+                            f"Failed to cancel batch job {job_name}: {cancel_error}"
+                        )
+                return [], list(questions)
+
+            by_key = {
+                batch_request_key(i): question for i, question in enumerate(questions)
+            }
+            evaluated: List[EvaluatedQuestion] = []
+            for response in result.responses:
+                question = by_key.get(response.get("key", ""))
+                if question is None:
+                    continue
+                try:
+                    evaluated.append(
+                        self._build_evaluated_question(
+                            question, safe_json_loads(response["text"]), judge_model
+                        )
+                    )
+                except (ValueError, TypeError) as e:
+                    # json.JSONDecodeError is a ValueError
+                    logger.warning(
+                        f"Unusable batch response {response.get('key')}: {e}"
+                    )
+                    continue
+                del by_key[response["key"]]
+
+            for error in result.errors:
+                logger.warning(f"Judge batch job {job_name}: {error}")
+            span.set_attribute("success", True)
+            span.set_attribute("evaluated", len(evaluated))
+            span.set_attribute("failed", len(by_key))
+            logger.info(
+                f"Judge batch job {job_name} ({judge_model}): "
+                f"{len(evaluated)}/{len(questions)} evaluated"
+            )
+            return evaluated, list(by_key.values())
+
+    async def _evaluate_individually(
+        self,
+        questions: List[GeneratedQuestion],
+        temperature: float,
+        max_tokens: int,
+    ) -> Tuple[List[EvaluatedQuestion], List[GeneratedQuestion]]:
+        """Evaluate questions one request each; failures are logged and dropped."""
+        evaluated = await self.evaluate_questions_list_async(
+            questions=questions, temperature=temperature, max_tokens=max_tokens
+        )
+        return evaluated, []
+
     def evaluate_batch(
         self,
         batch: GenerationBatch,
@@ -1408,6 +1616,41 @@ class QuestionJudge:
 
         return evaluated_questions
 
+    def _build_evaluated_question(
+        self,
+        question: GeneratedQuestion,
+        response: Dict[str, Any],
+        judge_model: str,
+    ) -> EvaluatedQuestion:
+        """Score a judge response and decide approval.
+
+        Args:
+            question: The question that was evaluated
+            response: Raw JSON response from the judge
+            judge_model: "provider/model" that produced the response
+
+        Returns:
+            Evaluated question with weighted overall score and approval status
+
+        Raises:
+            ValueError: If response is invalid or missing required fields
+        """
+        # Parse evaluation scores
+        evaluation = self._parse_evaluation_response(response)
+
+        # Calculate overall score using evaluation criteria weights
+        evaluation.overall_score = self._calculate_overall_score(evaluation)
+
+        # Determine if question is approved
+        approved = evaluation.overall_score >= self.judge_config.get_min_judge_score()
+
+        return EvaluatedQuestion(
+            question=question,
+            evaluation=evaluation,
+            judge_model=judge_model,
+            approved=approved,
+        )
+
     def _parse_evaluation_response(self, response: Dict[str, Any]) -> EvaluationScore:
         """Parse LLM evaluation response into EvaluationScore object.
 
@@ -127,6 +127,194 @@ def apply_difficulty_placement(
     return adjusted_eval
 
 
+def record_judge_decision(
+    evaluated_question: EvaluatedQuestion,
+    judge: QuestionJudge,
+    min_score: float,
+    metrics: PipelineRunSummary,
+    logger: logging.Logger,
+) -> Optional[EvaluatedQuestion]:
+    """Apply the approval rules to one judge evaluation and record the outcome.
+
+    Args:
+        evaluated_question: The EvaluatedQuestion returned by the judge
+        judge: The QuestionJudge instance (for difficulty placement)
+        min_score: Minimum overall score for approval
+        metrics: Run summary to record the evaluation in
+        logger: Logger instance
+
+    Returns:
+        The approved question after difficulty placement, or None if it was
+        rejected for answer leakage or a score below min_score.
+    """
+    leakage = evaluated_question.evaluation.leakage_score
+    leakage_rejected = leakage is not None and leakage <= _LEAKAGE_REJECTION_THRESHOLD
+
+    approved_question = None
+    if leakage_rejected:
+        logger.info(
+            f"  ✗ LEAKAGE REJECTED (leakage_score: {leakage:.2f}) - "
+            f"{evaluated_question.question.question_type.value}/"
+            f"{evaluated_question.question.difficulty_level.value}"
+        )
+        observability.record_metric(
+            "judge.leakage_rejection",
+            value=1,
+            labels={
+                "question_type": evaluated_question.question.question_type.value,
+                "difficulty": evaluated_question.question.difficulty_level.value,
+            },
+            metric_type="counter",
+        )
+    elif evaluated_question.evaluation.overall_score >= min_score:
+        logger.info(
+            f"  ✓ APPROVED (score: {evaluated_question.evaluation.overall_score:.2f})"
+        )
+        approved_question = apply_difficulty_placement(
+            evaluated_question, judge, logger
+        )
+    else:
+        log_rejection_details(evaluated_question, logger)
+
+    metrics.record_evaluation_success(
+        score=evaluated_question.evaluation.overall_score,
+        approved=approved_question is not None,
+        judge_model=evaluated_question.judge_model,
+    )
+    observability.record_metric(
+        "judge.evaluation_score",
+        value=evaluated_question.evaluation.overall_score,
+        metric_type="histogram",
+    )
+    return approved_question
+
+
+def _record_verification_result(
+    eq: EvaluatedQuestion,
+    verified: bool,
+    details: dict,
+    metrics: PipelineRunSummary,
+    logger: logging.Logger,
+) -> bool:
+    eq.evaluation.answer_verified = verified
+    eq.evaluation.verification_details = details
+
+    if not verified:
+        # Correct the approval count recorded before verification
+        metrics.questions_approved -= 1
+        metrics.questions_rejected += 1
+        logger.info(
+            f"  ✗ VERIFICATION FAILED ({details.get('outcome', 'unknown')}) - "
+            f"{eq.question.question_type.value}/"
+            f"{eq.question.difficulty_level.value}"
+        )
+        observability.record_metric(
+            "verifier.rejection",
+            value=1,
+            labels={
+                "question_type": eq.question.question_type.value,
+                "difficulty": eq.question.difficulty_level.value,
+                "outcome": details.get("outcome", "unknown"),
+            },
+            metric_type="counter",
+        )
+    return verified
+
+
+def _record_verification_error(
+    eq: EvaluatedQuestion,
+    error: Exception,
+    j_provider: str,
+    effective_model: str,
+    metrics: PipelineRunSummary,
+    logger: logging.Logger,
+) -> None:
+    is_parse_error = _is_structured_json_parse_error(error)
+    metrics.record_verification_error(
+        parse_error=is_parse_error,
+        fail_open=True,
+    )
+    if is_parse_error:
+        logger.warning(
+            "VERIFICATION_PARSE_ERROR_FAIL_OPEN step=%s provider=%s model=%s "
+            "question_type=%s difficulty=%s error=%s",
+            "unknown",
+            j_provider,
+            effective_model,
+            eq.question.question_type.value,
+            eq.question.difficulty_level.value,
+            str(error),
+        )
+    else:
+        logger.error(f"  ✗ Verification error: {error}")
+    observability.capture_error(
+        error,
+        context={"phase": "answer_verification"},
+    )
+
+
+def verify_approved_question(
+    eq: EvaluatedQuestion,
+    judge: QuestionJudge,
+    metrics: PipelineRunSummary,
+    logger: logging.Logger,
+) -> bool:
+    """Run blind-solve answer verification on one approved question.
+
+    Returns:
+        False if verification rejected the question. Verification errors
+        keep the question approved (fail-open) and return True.
+    """
+    j_provider = "unknown"
+    effective_model = "unknown"
+    try:
+        # Resolve judge provider for this question type
+        q_type = eq.question.question_type.value
+        available = list(judge.providers.keys())
+        j_provider, j_model = judge.judge_config.resolve_judge_provider(
+            q_type, available
+        )
+        effective_model = j_model or judge.providers[j_provider].model
+
+        verified, details = judge.verify_answer(
+            question=eq.question,
+            judge_provider_name=j_provider,
+            judge_model_name=effective_model,
+        )
+        return _record_verification_result(eq, verified, details, metrics, logger)
+    except Exception as e:
+        _record_verification_error(eq, e, j_provider, effective_model, metrics, logger)
+        return True
+
+
+async def verify_approved_question_async(
+    eq: EvaluatedQuestion,
+    judge: QuestionJudge,
+    metrics: PipelineRunSummary,
+    logger: logging.Logger,
+) -> bool:
+    """Async version of verify_approved_question."""
+    j_provider = "unknown"
+    effective_model = "unknown"
+    try:
+        q_type = eq.question.question_type.value
+        available = list(judge.providers.keys())
+        j_provider, j_model = judge.judge_config.resolve_judge_provider(
+            q_type, available
+        )
+        effective_model = j_model or judge.providers[j_provider].model
+
+        verified, details = await judge.verify_answer_async(
+            question=eq.question,
+            judge_provider_name=j_provider,
+            judge_model_name=effective_model,
+        )
+        return _record_verification_result(eq, verified, details, metrics, logger)
+    except Exception as e:
+        _record_verification_error(eq, e, j_provider, effective_model, metrics, logger)
+        return True
+
+
 def run_judge_phase(
     generated_questions: list,
     judge: QuestionJudge,
@@ -134,9 +322,14 @@ def run_judge_phase(
     use_async_judge: bool,
     metrics: PipelineRunSummary,
     logger: logging.Logger,
+    use_batch_judge: bool = False,
 ) -> tuple[list[EvaluatedQuestion], list[EvaluatedQuestion], float]:
     """Phase 2: Evaluate questions with the judge.
 
+    With use_batch_judge, evaluations are submitted as provider batch jobs
+    (slower to complete, but cheaper and not subject to per-request rate
+    limits); this takes precedence over use_async_judge.
+
     Returns (approved_questions, rejected_questions, approval_rate).
     """
     evaluation_start = time.perf_counter()
@@ -150,7 +343,23 @@ def run_judge_phase(
             "questions_to_evaluate": len(generated_questions),
         },
     ) as judge_span:
-        if use_async_judge:
+        if use_batch_judge:
+            logger.info("Using provider batch API judge evaluation mode")
+            judge_span.set_attribute("mode", "batch")
+
+            async def _eval_batch() -> list:
+                try:
+                    return [
+                        evaluated
+                        async for evaluated in judge.evaluate_questions_batch_async(
+                            questions=generated_questions,
+                        )
+                    ]
+                finally:
+                    await judge.cleanup()
+
+            all_evaluated = asyncio.run(_eval_batch())
+        elif use_async_judge:
             logger.info("Using async parallel judge evaluation mode")
             judge_span.set_attribute("mode", "async")
 
@@ -178,52 +387,13 @@ def run_judge_phase(
                     )
 
         for evaluated_question in all_evaluated:
-            leakage = evaluated_question.evaluation.leakage_score
-            leakage_rejected = (
-                leakage is not None and leakage <= _LEAKAGE_REJECTION_THRESHOLD
+            approved_question = record_judge_decision(
+                evaluated_question, judge, min_score, metrics, logger
             )
-
-            if leakage_rejected:
+            if approved_question is None:
                 rejected_questions.append(evaluated_question)
-                logger.info(
-                    f"  ✗ LEAKAGE REJECTED (leakage_score: {leakage:.2f}) - "
-                    f"{evaluated_question.question.question_type.value}/"
-                    f"{evaluated_question.question.difficulty_level.value}"
-                )
-                observability.record_metric(
-                    "judge.leakage_rejection",
-                    value=1,
-                    labels={
-                        "question_type": evaluated_question.question.question_type.value,
-                        "difficulty": evaluated_question.question.difficulty_level.value,
-                    },
-                    metric_type="counter",
-                )
-            elif evaluated_question.evaluation.overall_score >= min_score:
-                logger.info(
-                    f"  ✓ APPROVED (score: {evaluated_question.evaluation.overall_score:.2f})"
-                )
-                approved_questions.append(
-                    apply_difficulty_placement(evaluated_question, judge, logger)
-                )
             else:
-                rejected_questions.append(evaluated_question)
-                log_rejection_details(evaluated_question, logger)
-
-            approved = (
-                not leakage_rejected
-                and evaluated_question.evaluation.overall_score >= min_score
-            )
-            metrics.record_evaluation_success(
-                score=evaluated_question.evaluation.overall_score,
-                approved=approved,
-                judge_model=evaluated_question.judge_model,
-            )
-            observability.record_metric(
-                "judge.evaluation_score",
-                value=evaluated_question.evaluation.overall_score,
-                metric_type="histogram",
-            )
+                approved_questions.append(approved_question)
 
         # Phase 2b: Answer verification on approved questions
         if judge.judge_config.get_answer_verification_enabled() and approved_questions:
@@ -235,74 +405,11 @@ def run_judge_phase(
             verification_failures = 0
 
             for eq in approved_questions:
-                j_provider = "unknown"
-                effective_model = "unknown"
-                try:
-                    # Resolve judge provider for this question type
-                    q_type = eq.question.question_type.value
-                    available = list(judge.providers.keys())
-                    j_provider, j_model = judge.judge_config.resolve_judge_provider(
-                        q_type, available
-                    )
-                    effective_model = j_model or judge.providers[j_provider].model
-
-                    verified, details = judge.verify_answer(
-                        question=eq.question,
-                        judge_provider_name=j_provider,
-                        judge_model_name=effective_model,
-                    )
-
-                    eq.evaluation.answer_verified = verified
-                    eq.evaluation.verification_details = details
-
-                    if verified:
-                        verified_approved.append(eq)
-                    else:
-                        verification_failures += 1
-                        rejected_questions.append(eq)
-                        # Correct the approval count recorded before verification
-                        metrics.questions_approved -= 1
-                        metrics.questions_rejected += 1
-                        logger.info(
-                            f"  ✗ VERIFICATION FAILED ({details.get('outcome', 'unknown')}) - "
-                            f"{eq.question.question_type.value}/"
-                            f"{eq.question.difficulty_level.value}"
-                        )
-                        observability.record_metric(
-                            "verifier.rejection",
-                            value=1,
-                            labels={
-                                "question_type": eq.question.question_type.value,
-                                "difficulty": eq.question.difficulty_level.value,
-                                "outcome": details.get("outcome", "unknown"),
-                            },
-                            metric_type="counter",
-                        )
-                except Exception as e:
-                    is_parse_error = _is_structured_json_parse_error(e)
-                    metrics.record_verification_error(
-                        parse_error=is_parse_error,
-                        fail_open=True,
-                    )
-                    if is_parse_error:
-                        logger.warning(
-                            "VERIFICATION_PARSE_ERROR_FAIL_OPEN step=%s provider=%s model=%s "
-                            "question_type=%s difficulty=%s error=%s",
-                            "unknown",
-                            j_provider,
-                            effective_model,
-                            eq.question.question_type.value,
-                            eq.question.difficulty_level.value,
-                            str(e),
-                        )
-                    else:
-                        logger.error(f"  ✗ Verification error: {e}")
-                    observability.capture_error(
-                        e,
-                        context={"phase": "answer_verification"},
-                    )
-                    # On error, keep the question approved (fail-open)
+                if verify_approved_question(eq, judge, metrics, logger):
                     verified_approved.append(eq)
+                else:
+                    verification_failures += 1
+                    rejected_questions.append(eq)
 
             approved_questions = verified_approved
             logger.info(
@@ -0,0 +1,351 @@
+"""Adaptive chunk sizing for single-call batch generation.
+
+Single-call batch generation asks one LLM call for many questions. Asking for
+too many truncates the JSON response at max_tokens, and asking for too few
+wastes calls. ChunkSizeEstimator learns, per (provider, model, question_type):
+
+- output tokens per question, so a chunk fits within max_tokens with headroom;
+- a truncation cap, shrunk whenever a response is cut off or fails to parse
+  and regrown after repeated clean calls at the cap;
+- a linear latency model (overhead + seconds per output token), used to pick
+  the chunk size that finishes a batch soonest given the request concurrency.
+
+Estimates persist to a JSON file so later runs start from what earlier runs
+learned. Recording only marks the estimates dirty; they are written at most
+every SAVE_INTERVAL_SECONDS on a background thread, and by flush() (called
+from QuestionGenerator.cleanup), so recording never blocks the event loop on
+file I/O.
+"""
+
+import json
+import logging
+import math
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Output this close to max_tokens with questions missing counts as truncated
+TRUNCATION_TOKEN_RATIO = 0.95
+
+# Fraction of max_tokens a chunk is sized to fill
+TOKEN_HEADROOM = 0.8
+
+# Smoothing factor for the tokens-per-question moving average
+EWMA_ALPHA = 0.3
+
+# Clean calls at the truncation cap before it grows by one
+RECOVERY_SUCCESSES = 3
+
+# (output_tokens, latency) samples kept for the latency model
+LATENCY_SAMPLES = 50
+
+# Chunk sizes within this factor of the fastest are treated as equally fast,
+# and the largest such size is used (fewer calls, fewer prompt tokens)
+CHUNK_TIME_TOLERANCE = 1.1
+
+STATS_VERSION = 1
+
+# Minimum seconds between background writes of the stats file
+SAVE_INTERVAL_SECONDS = 30.0
+
+
+@dataclass
+class ChunkStats:
+    """Learned sizing data for one provider/model/question type."""
+
+    tokens_per_question: Optional[float] = None
+    truncation_cap: Optional[int] = None
+    successes_at_cap: int = 0
+    calls: int = 0
+    truncations: int = 0
+    samples: List[Tuple[float, float]] = field(default_factory=list)
+
+
+class ChunkSizeEstimator:
+    """Thread-safe learner of batch chunk sizes, persisted to a JSON file."""
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        """Initialize the estimator, loading earlier estimates if present.
+
+        Args:
+            path: JSON file to persist estimates to (None = in memory only)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        # Serializes writes of the stats file
+        self._save_lock = threading.Lock()
+        self._stats: Dict[str, ChunkStats] = {}
+        self._dirty = False
+        self._saving = False
+        self._last_save = time.monotonic()
+        if path and Path(path).exists():
+            self._load(path)
+
+    @staticmethod
+    def _key(provider: str, model: str, question_type: str) -> str:
+        return f"{provider}|{model}|{question_type}"
+
+    def record(
+        self,
+        provider: str,
+        model: str,
+        question_type: str,
+        count: int,
+        generated: int,
+        output_tokens: Optional[int],
+        latency: float,
+        max_tokens: int,
+    ) -> None:
+        """Record a completed single-call batch.
+
+        Args:
+            provider: Provider name
+            model: Model used
+            question_type: Question type value
+            count: Questions requested
+            generated: Questions parsed from the response
+            output_tokens: Output tokens reported by the provider (if known)
+            latency: Call latency in seconds
+            max_tokens: Output token limit the call was sent with, the same
+                budget output_tokens counts against (reasoning tokens
+                included; see BaseLLMProvider.effective_output_limit)
+        """
+        truncated = (
+            generated < count
+            and output_tokens is not None
+            and output_tokens >= TRUNCATION_TOKEN_RATIO * max_tokens
+        )
+        with self._lock:
+            stats = self._stats.setdefault(
+                self._key(provider, model, question_type), ChunkStats()
+            )
+            stats.calls += 1
+            if generated > 0 and output_tokens:
+                per_question = output_tokens / generated
+                stats.tokens_per_question = (
+                    per_question
+                    if stats.tokens_per_question is None
+                    else EWMA_ALPHA * per_question
+                    + (1 - EWMA_ALPHA) * stats.tokens_per_question
+                )
+                stats.samples.append((float(output_tokens), latency))
+                del stats.samples[:-LATENCY_SAMPLES]
+            if truncated:
+                self._shrink(stats, count)
+            elif stats.truncation_cap is not None and count >= stats.truncation_cap:
+                stats.successes_at_cap += 1
+                if stats.successes_at_cap >= RECOVERY_SUCCESSES:
+                    stats.truncation_cap += 1
+                    stats.successes_at_cap = 0
+            self._mark_dirty()
+
+    def record_truncation(
+        self, provider: str, model: str, question_type: str, count: int
+    ) -> None:
+        """Record a single-call batch whose response could not be parsed.
+
+        Args:
+            provider: Provider name
+            model: Model used
+            question_type: Question type value
+            count: Questions requested
+        """
+        with self._lock:
+            stats = self._stats.setdefault(
+                self._key(provider, model, question_type), ChunkStats()
+            )
+            stats.calls += 1
+            self._shrink(stats, count)
+            self._mark_dirty()
+
+    @staticmethod
+    def _shrink(stats: ChunkStats, count: int) -> None:
+        """Cut the truncation cap below a count that truncated."""
+        stats.truncations += 1
+        current = min(count, stats.truncation_cap or count)
+        stats.truncation_cap = max(1, current * 3 // 4)
+        stats.successes_at_cap = 0
+
+    def recommend(
+        self,
+        provider: str,
+        model: str,
+        question_type: str,
+        count: int,
+        max_tokens: int,
+        max_chunk_size: Optional[int] = None,
+        concurrency: int = 1,
+    ) -> Optional[int]:
+        """Choose the chunk size for a batch.
+
+        Args:
+            provider: Provider name
+            model: Model to be used
+            question_type: Question type value
+            count: Total questions wanted
+            max_tokens: Output token limit each call is sent with
+                (BaseLLMProvider.effective_output_limit)
+            max_chunk_size: Configured upper bound (generators.yaml max_batch_size)
+            concurrency: Calls that can run at once
+
+        Returns:
+            Questions per call, or max_chunk_size unchanged if nothing has
+            been learned for this provider/model/question type
+        """
+        with self._lock:
+            stats = self._stats.get(self._key(provider, model, question_type))
+            if stats is None:
+                return max_chunk_size
+            tokens_per_question = stats.tokens_per_question
+            truncation_cap = stats.truncation_cap
+            samples = list(stats.samples)
+
+        limit = min(count, max_chunk_size or count)
+        if truncation_cap is not None:
+            limit = min(limit, truncation_cap)
+        if tokens_per_question:
+            limit = min(limit, int(TOKEN_HEADROOM * max_tokens / tokens_per_question))
+        limit = max(1, limit)
+
+        latency_model = _fit_latency(samples)
+        if latency_model is None or not tokens_per_question:
+            return limit
+        overhead, seconds_per_token = latency_model
+
+        def wall_time(size: int) -> float:
+            waves = math.ceil(math.ceil(count / size) / max(1, concurrency))
+            return waves * (overhead + seconds_per_token * tokens_per_question * size)
+
+        fastest = min(wall_time(size) for size in range(1, limit + 1))
+        return max(
+            size
+            for size in range(1, limit + 1)
+            if wall_time(size) <= fastest * CHUNK_TIME_TOLERANCE
+        )
+
+    def get_stats(self) -> Dict[str, Dict[str, object]]:
+        """Summarize learned estimates.
+
+        Returns:
+            Mapping of "provider|model|question_type" to its estimates
+        """
+        with self._lock:
+            return {
+                key: {
+                    "tokens_per_question": stats.tokens_per_question,
+                    "truncation_cap": stats.truncation_cap,
+                    "calls": stats.calls,
+                    "truncations": stats.truncations,
+                }
+                for key, stats in self._stats.items()
+            }
+
+    def _load(self, path: str) -> None:
+        try:
+            data = json.loads(Path(path).read_text())
+            if data.get("version") != STATS_VERSION:
+                return
+            for key, raw in data["stats"].items():
+                raw["samples"] = [tuple(sample) for sample in raw.get("samples", [])]
+                self._stats[key] = ChunkStats(**raw)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable chunk sizing stats at {path}: {e}")
+
+    def _mark_dirty(self) -> None:
+        """Flag unsaved estimates and start a background save when one is due.
+
+        Must be called with _lock held.
+        """
+        if not self.path:
+            return
+        self._dirty = True
+        if (
+            not self._saving
+            and time.monotonic() - self._last_save >= SAVE_INTERVAL_SECONDS
+        ):
+            self._saving = True
+            threading.Thread(
+                target=self.flush, name="chunk-stats-save", daemon=True
+            ).start()
+
+    def flush(self) -> None:
+        """Write unsaved estimates to the stats file.
+
+        Blocks on file I/O; async callers should run it in a thread.
+        """
+        if not self.path:
+            return
+        with self._save_lock:
+            with self._lock:
+                dirty, self._dirty = self._dirty, False
+                self._saving = False
+                self._last_save = time.monotonic()
+                if not dirty:
+                    return
+                data = {
+                    "version": STATS_VERSION,
+                    "stats": {
+                        key: asdict(stats) for key, stats in self._stats.items()
+                    },
+                }
+            try:
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = f"{self.path}.tmp"
+                Path(tmp_path).write_text(json.dumps(data))
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                logger.warning(f"Could not persist chunk sizing stats: {e}")
+                with self._lock:
+                    self._dirty = True
+
+
+def _fit_latency(samples: List[Tuple[float, float]]) -> Optional[Tuple[float, float]]:
+    """Least-squares fit of latency = overhead + seconds_per_token * tokens.
+
+    Returns:
+        (overhead, seconds_per_token), both non-negative, or None with fewer
+        than three samples or no spread in output tokens
+    """
+    if len(samples) < 3:
+        return None
+    n = len(samples)
+    mean_x = sum(x for x, _ in samples) / n
+    mean_y = sum(y for _, y in samples) / n
+    var_x = sum((x - mean_x) ** 2 for x, _ in samples)
+    if var_x == 0:
+        return None
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in samples) / var_x
+    slope = max(0.0, slope)
+    return max(0.0, mean_y - slope * mean_x), slope
+
+
+# Global chunk size estimator instance
+_estimator: Optional[ChunkSizeEstimator] = None
+_estimator_lock = threading.Lock()
+
+
+def get_chunk_size_estimator() -> ChunkSizeEstimator:
+    """Get the global chunk size estimator, persisted at settings' path.
+
+    Returns:
+        Global ChunkSizeEstimator instance
+    """
+    global _estimator
+    with _estimator_lock:
+        if _estimator is None:
+            from app.config.config import settings  # noqa: PLC0415
+
+            _estimator = ChunkSizeEstimator(settings.generation_chunk_stats_path)
+        return _estimator
+
+
+def reset_chunk_size_estimator() -> None:
+    """Drop the global chunk size estimator (it is reloaded on next use)."""
+    global _estimator
+    with _estimator_lock:
+        _estimator = None
@@ -10,7 +10,7 @@ import logging
 import random
 import time
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Literal, Optional, TypeVar
 
 from gioe_libs.observability import observability
 
@@ -20,10 +20,15 @@ from app.infrastructure.circuit_breaker import (
     get_circuit_breaker_registry,
 )
 from app.observability.cost_tracking import calculate_cost
+from app.observability.provider_latency import (
+    ProviderLatencyTracker,
+    get_provider_latency_tracker,
+)
 from app.config.generator_config import (
     get_generator_config,
     is_generator_config_initialized,
 )
+from app.generation.chunk_sizing import ChunkSizeEstimator, get_chunk_size_estimator
 from app.data.models import (
     DifficultyLevel,
     GeneratedQuestion,
@@ -39,6 +44,8 @@ from app.providers.xai_provider import XAIProvider
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 def _safe_capture_generation_error(
     error: BaseException,
@@ -161,10 +168,29 @@ def _safe_record_metric(
         logger.debug(f"Failed to record observability metric {name}: {e}")
 
 
+def _is_parse_failure(error: BaseException) -> bool:
+    """Whether an error came from an unparseable (typically truncated) response.
+
+    Providers re-raise json.JSONDecodeError wrapped in a generic exception, so
+    the whole cause chain is checked.
+    """
+    current: Optional[BaseException] = error
+    while current is not None:
+        if isinstance(current, json.JSONDecodeError):
+            return True
+        current = current.__cause__ or current.__context__
+    return False
+
+
 # Default rate limiting settings
 DEFAULT_MAX_CONCURRENT_REQUESTS = 10  # Max concurrent LLM API calls per provider
 DEFAULT_ASYNC_TIMEOUT_SECONDS = 60.0  # Timeout for individual async LLM calls
 
+# Hedged request defaults
+DEFAULT_HEDGE_PERCENTILE = 0.95  # Latency percentile after which a call is hedged
+DEFAULT_HEDGE_MIN_SUCCESS_RATE = 0.5  # Skip hedge targets less reliable than this
+DEFAULT_HEDGE_BUDGET = 0.05  # Fraction of hedgeable calls allowed to send a hedge
+
 # JSON response schemas for structured LLM completions
 _QUESTION_SCHEMA = {
     "type": "object",
@@ -207,6 +233,14 @@ class QuestionGenerator:
         circuit_breaker_registry: Optional[CircuitBreakerRegistry] = None,
         max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
         async_timeout_seconds: float = DEFAULT_ASYNC_TIMEOUT_SECONDS,
+        hedge_requests: bool = False,
+        hedge_percentile: float = DEFAULT_HEDGE_PERCENTILE,
+        hedge_min_success_rate: float = DEFAULT_HEDGE_MIN_SUCCESS_RATE,
+        hedge_budget: float = DEFAULT_HEDGE_BUDGET,
+        hedge_benchmark_path: Optional[str] = None,
+        latency_tracker: Optional[ProviderLatencyTracker] = None,
+        adaptive_chunking: bool = False,
+        chunk_size_estimator: Optional[ChunkSizeEstimator] = None,
     ):
         """Initialize the question generator with LLM provider credentials.
 
@@ -222,13 +256,41 @@ class QuestionGenerator:
             circuit_breaker_registry: Circuit breaker registry (uses global if not provided)
             max_concurrent_requests: Maximum concurrent LLM API calls (default: 10)
             async_timeout_seconds: Timeout for individual async calls in seconds (default: 60)
+            hedge_requests: Send a duplicate request to a second provider when an
+                async generation call runs past its provider's hedge_percentile
+                latency; the first success wins and the other is cancelled
+            hedge_percentile: Latency percentile (0.0-1.0) that triggers a hedge
+            hedge_min_success_rate: Minimum tracked success rate of a hedge target
+            hedge_budget: Fraction of hedgeable calls that may send a hedge
+                (about 5% by default), so hedging can't multiply load
+            hedge_benchmark_path: Benchmark report used as latency priors until
+                enough live calls have been tracked
+            latency_tracker: Per-provider latency tracker (uses global if not provided)
+            adaptive_chunking: Size single-call batch chunks from learned output
+                tokens, truncations and latency instead of max_batch_size alone
+            chunk_size_estimator: Chunk size estimator (uses global if not provided)
         """
         self.providers: Dict[str, BaseLLMProvider] = {}
         self._circuit_breaker_registry = (
             circuit_breaker_registry or get_circuit_breaker_registry()
         )
         self._rate_limiter = asyncio.Semaphore(max_concurrent_requests)
+        self._max_concurrent_requests = max_concurrent_requests
         self._async_timeout = async_timeout_seconds
+        self._hedge_requests = hedge_requests
+        self._hedge_percentile = hedge_percentile
+        self._hedge_min_success_rate = hedge_min_success_rate
+        self._hedge_budget = hedge_budget
+        # Token bucket: each hedgeable call earns hedge_budget, a hedge spends 1
+        self._hedge_tokens = 1.0
+        self._latency_tracker = latency_tracker or get_provider_latency_tracker()
+        if hedge_benchmark_path:
+            self._latency_tracker.load_benchmark_file(hedge_benchmark_path)
+        self._chunk_size_estimator: Optional[ChunkSizeEstimator] = None
+        if adaptive_chunking:
+            self._chunk_size_estimator = (
+                chunk_size_estimator or get_chunk_size_estimator()
+            )
 
         # Initialize available providers
         if openai_api_key:
@@ -574,6 +636,167 @@ class QuestionGenerator:
         is_fallback = new_provider is not None and new_provider != current_provider
         return (new_provider, new_model, is_fallback)
 
+    def _get_hedge_target(
+        self, question_type: QuestionType, current_provider: str, operation: str
+    ) -> Optional[tuple[str, Optional[str]]]:
+        """Pick the provider and model to send a hedged duplicate request to.
+
+        Candidates are the question type's primary and fallback specialists
+        (keeping quality routing), skipping the provider being hedged and any
+        whose tracked success rate is below the hedge minimum.
+
+        Args:
+            question_type: Type of question being generated
+            current_provider: The provider whose call is running slow
+            operation: Kind of call, for the tracked success rate
+
+        Returns:
+            Tuple of (provider_name, model_override), or None if no candidate
+        """
+        for tier in ("primary", "fallback"):
+            name, model = self._get_specialist_provider(question_type, tier)
+            if name is None or name == current_provider:
+                continue
+            success_rate = self._latency_tracker.get_success_rate(
+                name, model or self.providers[name].model, operation
+            )
+            if success_rate is not None and success_rate < self._hedge_min_success_rate:
+                logger.debug(
+                    f"Not hedging to {name}: success rate {success_rate:.0%} "
+                    f"below {self._hedge_min_success_rate:.0%}"
+                )
+                continue
+            return (name, model)
+        return None
+
+    async def _run_hedged(
+        self,
+        question_type: QuestionType,
+        provider_name: str,
+        model_override: Optional[str],
+        operation: str,
+        call: Callable[[str, Optional[str], asyncio.Event], Awaitable[T]],
+    ) -> T:
+        """Run a generation call, hedging to a second provider if it runs slow.
+
+        The call starts on provider_name. If it has not finished after the
+        provider/model's tracked hedge percentile latency, the same request is
+        sent to the hedge target; the first successful response is returned
+        and the other request is cancelled. Without latency data or a hedge
+        target the call simply runs unhedged.
+
+        The hedge delay starts once the call holds a rate-limiter slot, so time
+        spent queued behind other calls never triggers a hedge. Hedges are
+        also skipped when the hedge budget is spent or every slot is taken,
+        since a duplicate would only add load to a saturated generator.
+
+        Args:
+            question_type: Type of question being generated
+            provider_name: Provider to try first
+            model_override: Model override for provider_name
+            operation: Kind of call, for latency tracking
+            call: Coroutine factory taking (provider_name, model_override,
+                slot_acquired), where slot_acquired is set once the call holds
+                a rate-limiter slot
+
+        Returns:
+            Result of the first call to succeed
+
+        Raises:
+            Exception: The primary call's error if both calls fail
+        """
+        model = model_override or self.providers[provider_name].model
+        delay = self._latency_tracker.get_percentile(
+            provider_name, model, self._hedge_percentile, operation
+        )
+        target = (
+            self._get_hedge_target(question_type, provider_name, operation)
+            if delay is not None
+            else None
+        )
+        if delay is None or target is None:
+            return await call(provider_name, model_override, asyncio.Event())
+
+        self._hedge_tokens = min(1.0, self._hedge_tokens + self._hedge_budget)
+        primary_acquired = asyncio.Event()
+        primary = asyncio.create_task(
+            call(provider_name, model_override, primary_acquired)
+        )
+        acquired = asyncio.create_task(primary_acquired.wait())
+        try:
+            await asyncio.wait(
+                {primary, acquired}, return_when=asyncio.FIRST_COMPLETED
+            )
+            start_time = time.perf_counter()
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+        except asyncio.CancelledError:
+            primary.cancel()
+            raise
+        finally:
+            acquired.cancel()
+        if done:
+            return primary.result()
+
+        hedge_provider, hedge_model = target
+        if self._hedge_tokens < 1.0 or self._rate_limiter.locked():
+            logger.debug(
+                f"Not hedging slow {provider_name} {operation} call: "
+                + (
+                    "hedge budget spent"
+                    if self._hedge_tokens < 1.0
+                    else "all request slots busy"
+                )
+            )
+            return await primary
+        self._hedge_tokens -= 1.0
+
+        logger.info(
+            f"{provider_name} {operation} call exceeded p"
+            f"{self._hedge_percentile * 100:.0f} ({delay:.1f}s); "
+            f"hedging to {hedge_provider}"
+        )
+        hedged = asyncio.create_task(call(hedge_provider, hedge_model, asyncio.Event()))
+        pending = {primary, hedged}
+        errors: Dict[asyncio.Task, BaseException] = {}
+        winner = "none"
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    error = task.exception()
+                    if error is not None:
+                        errors[task] = error
+                        continue
+                    winner = "primary" if task is primary else "hedge"
+                    if task is hedged and primary in pending:
+                        # Record the cancelled primary's elapsed time as a lower
+                        # bound, so cancelling slow calls doesn't drag the
+                        # tracked percentile down.
+                        self._latency_tracker.record(
+                            provider_name,
+                            model,
+                            time.perf_counter() - start_time,
+                            operation=operation,
+                        )
+                    return task.result()
+            raise errors.get(primary) or errors[hedged]
+        finally:
+            for task in pending:
+                task.cancel()
+            _safe_record_metric(
+                "question.generation.hedge",
+                value=1,
+                labels={
+                    "question_type": question_type.value,
+                    "provider": provider_name,
+                    "hedge_provider": hedge_provider,
+                    "winner": winner,
+                },
+                metric_type="counter",
+            )
+
     def generate_batch(
         self,
         question_type: QuestionType,
@@ -1033,6 +1256,8 @@ class QuestionGenerator:
         max_tokens: int = 1500,
         timeout: Optional[float] = None,
         subtype: Optional[str] = None,
+        hedge: bool = True,
+        slot_acquired: Optional[asyncio.Event] = None,
     ) -> GeneratedQuestion:
         """Generate a single question asynchronously using a specific or random provider.
 
@@ -1048,6 +1273,8 @@ class QuestionGenerator:
             max_tokens: Maximum tokens to generate
             timeout: Timeout in seconds (uses instance default if not specified)
             subtype: Optional sub-type focus (randomly selected if not provided)
+            hedge: Allow a hedged duplicate request (when hedging is enabled)
+            slot_acquired: Event set once the call holds a rate-limiter slot
 
         Returns:
             Generated question
@@ -1081,6 +1308,26 @@ class QuestionGenerator:
                 )
             provider = self.providers[provider_name]
 
+        if hedge and self._hedge_requests:
+            return await self._run_hedged(
+                question_type,
+                provider_name,
+                model_override,
+                operation="generate",
+                call=lambda name, model, acquired: self.generate_question_async(
+                    question_type=question_type,
+                    difficulty=difficulty,
+                    provider_name=name,
+                    model_override=model,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    timeout=timeout,
+                    subtype=subtype,
+                    hedge=False,
+                    slot_acquired=acquired,
+                ),
+            )
+
         # Get circuit breaker for this provider
         circuit_breaker = self._circuit_breaker_registry.get_or_create(provider_name)
 
@@ -1103,6 +1350,9 @@ class QuestionGenerator:
 
         # Track timing for latency metrics (TASK-575)
         start_time = time.perf_counter()
+        # Tracked latency starts once a rate-limiter slot is held, so it
+        # measures the provider rather than our own queue
+        service_start: Optional[float] = None
         completion_result = None
 
         with observability.start_span(
@@ -1116,8 +1366,11 @@ class QuestionGenerator:
         ) as span:
             # Define the async API call with cost tracking
             async def _do_async_generation() -> Dict[str, Any]:
-                nonlocal completion_result
+                nonlocal completion_result, service_start
                 async with self._rate_limiter:
+                    service_start = time.perf_counter()
+                    if slot_acquired is not None:
+                        slot_acquired.set()
                     completion_result = await asyncio.wait_for(
                         provider.generate_structured_completion_with_usage_async(
                             prompt=prompt,
@@ -1134,6 +1387,7 @@ class QuestionGenerator:
             try:
                 response = await circuit_breaker.execute_async(_do_async_generation)
                 latency = time.perf_counter() - start_time
+                service_latency = time.perf_counter() - (service_start or start_time)
                 span.set_attribute("generation_duration", latency)
 
                 # Record latency and cost metrics
@@ -1173,6 +1427,12 @@ class QuestionGenerator:
                     model=actual_model,
                 )
                 question.sub_type = subtype
+                self._latency_tracker.record(
+                    provider_name,
+                    actual_model,
+                    service_latency,
+                    operation="generate",
+                )
 
                 span.set_attribute("success", True)
                 logger.info(
@@ -1189,6 +1449,13 @@ class QuestionGenerator:
                 raise
             except asyncio.TimeoutError:
                 span.set_attribute("success", False)
+                self._latency_tracker.record(
+                    provider_name,
+                    actual_model,
+                    time.perf_counter() - (service_start or start_time),
+                    success=False,
+                    operation="generate",
+                )
                 span.set_status("error", f"Timeout after {effective_timeout}s")
                 logger.warning(
                     "generation.timeout provider=%s type=%s difficulty=%s after=%.1fs",
@@ -1200,6 +1467,13 @@ class QuestionGenerator:
                 raise
             except LLMProviderError as e:
                 span.set_attribute("success", False)
+                self._latency_tracker.record(
+                    provider_name,
+                    actual_model,
+                    time.perf_counter() - (service_start or start_time),
+                    success=False,
+                    operation="generate",
+                )
                 span.set_status("error", str(e))
                 logger.warning(
                     "generation.provider_error provider=%s type=%s difficulty=%s "
@@ -1233,6 +1507,13 @@ class QuestionGenerator:
                 raise
             except Exception as e:
                 span.set_attribute("success", False)
+                self._latency_tracker.record(
+                    provider_name,
+                    actual_model,
+                    time.perf_counter() - (service_start or start_time),
+                    success=False,
+                    operation="generate",
+                )
                 span.set_status("error", str(e))
                 logger.warning(
                     "generation.error provider=%s type=%s difficulty=%s message=%s",
@@ -1421,6 +1702,18 @@ class QuestionGenerator:
         if use_single_call_batch and single_call_provider:
             # Check if max_batch_size is configured for this question type
             max_batch_size = self._get_max_batch_size(question_type)
+            if self._chunk_size_estimator is not None:
+                provider = self.providers[single_call_provider]
+                model = single_call_model or provider.model
+                max_batch_size = self._chunk_size_estimator.recommend(
+                    provider=single_call_provider,
+                    model=model,
+                    question_type=question_type.value,
+                    count=count,
+                    max_tokens=provider.effective_output_limit(max_tokens * 2, model),
+                    max_chunk_size=max_batch_size,
+                    concurrency=self._max_concurrent_requests,
+                )
 
             if max_batch_size is not None and count > max_batch_size:
                 # Chunk into parallel sub-batches with sub-type rotation
@@ -2154,6 +2447,8 @@ class QuestionGenerator:
         max_tokens: int = 3000,
         timeout: Optional[float] = None,
         subtype: Optional[str] = None,
+        hedge: bool = True,
+        slot_acquired: Optional[asyncio.Event] = None,
     ) -> List[GeneratedQuestion]:
         """Generate multiple questions in a single API call.
 
@@ -2170,6 +2465,8 @@ class QuestionGenerator:
             max_tokens: Maximum tokens (should be higher for batch)
             timeout: Timeout in seconds
             subtype: Optional sub-type focus for prompt diversity
+            hedge: Allow a hedged duplicate request (when hedging is enabled)
+            slot_acquired: Event set once the call holds a rate-limiter slot
 
         Returns:
             List of generated questions
@@ -2185,6 +2482,29 @@ class QuestionGenerator:
                 f"Available: {list(self.providers.keys())}"
             )
 
+        if hedge and self._hedge_requests:
+            return await self._run_hedged(
+                question_type,
+                provider_name,
+                model_override,
+                operation="generate_batch",
+                call=lambda name, model, acquired: (
+                    self.generate_batch_single_call_async(
+                        question_type=question_type,
+                        difficulty=difficulty,
+                        count=count,
+                        provider_name=name,
+                        model_override=model,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                        timeout=timeout,
+                        subtype=subtype,
+                        hedge=False,
+                        slot_acquired=acquired,
+                    )
+                ),
+            )
+
         provider = self.providers[provider_name]
         circuit_breaker = self._circuit_breaker_registry.get_or_create(provider_name)
         actual_model = model_override or provider.model
@@ -2204,6 +2524,9 @@ class QuestionGenerator:
         )
 
         start_time = time.perf_counter()
+        # Tracked latency starts once a rate-limiter slot is held, so it
+        # measures the provider rather than our own queue
+        service_start: Optional[float] = None
         completion_result = None
 
         with observability.start_span(
@@ -2218,8 +2541,11 @@ class QuestionGenerator:
         ) as span:
 
             async def _do_batch_generation() -> Any:
-                nonlocal completion_result
+                nonlocal completion_result, service_start
                 async with self._rate_limiter:
+                    service_start = time.perf_counter()
+                    if slot_acquired is not None:
+                        slot_acquired.set()
                     completion_result = await asyncio.wait_for(
                         provider.generate_structured_completion_with_usage_async(
                             prompt=prompt,
@@ -2235,6 +2561,7 @@ class QuestionGenerator:
             try:
                 response = await circuit_breaker.execute_async(_do_batch_generation)
                 latency = time.perf_counter() - start_time
+                service_latency = time.perf_counter() - (service_start or start_time)
                 span.set_attribute("generation_duration", latency)
 
                 # Record metrics
@@ -2278,6 +2605,30 @@ class QuestionGenerator:
                 if subtype:
                     for q in questions:
                         q.sub_type = subtype
+                self._latency_tracker.record(
+                    provider_name,
+                    actual_model,
+                    service_latency,
+                    operation="generate_batch",
+                )
+                if self._chunk_size_estimator is not None:
+                    token_usage = (
+                        completion_result.token_usage if completion_result else None
+                    )
+                    self._chunk_size_estimator.record(
+                        provider_name,
+                        actual_model,
+                        question_type.value,
+                        count=count,
+                        generated=len(questions),
+                        output_tokens=(
+                            token_usage.output_tokens if token_usage else None
+                        ),
+                        latency=service_latency,
+                        max_tokens=provider.effective_output_limit(
+                            max_tokens, actual_model
+                        ),
+                    )
 
                 span.set_attribute("success", True)
                 span.set_attribute("questions_generated", len(questions))
@@ -2297,6 +2648,13 @@ class QuestionGenerator:
                 raise
             except asyncio.TimeoutError:
                 span.set_attribute("success", False)
+                self._latency_tracker.record(
+                    provider_name,
+                    actual_model,
+                    time.perf_counter() - (service_start or start_time),
+                    success=False,
+                    operation="generate_batch",
+                )
                 span.set_status("error", f"Timeout after {effective_timeout}s")
                 logger.warning(
                     "generation.timeout provider=%s type=%s difficulty=%s after=%.1fs",
@@ -2308,6 +2666,17 @@ class QuestionGenerator:
                 raise
             except Exception as e:
                 span.set_attribute("success", False)
+                self._latency_tracker.record(
+                    provider_name,
+                    actual_model,
+                    time.perf_counter() - (service_start or start_time),
+                    success=False,
+                    operation="generate_batch",
+                )
+                if self._chunk_size_estimator is not None and _is_parse_failure(e):
+                    self._chunk_size_estimator.record_truncation(
+                        provider_name, actual_model, question_type.value, count
+                    )
                 span.set_status("error", str(e))
                 logger.warning(
                     "generation.error provider=%s type=%s difficulty=%s message=%s",
@@ -2371,6 +2740,14 @@ class QuestionGenerator:
             }
         return stats
 
+    def get_latency_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get tracked latency and success statistics per provider/model.
+
+        Returns:
+            Dictionary of call statistics keyed by provider/model/operation
+        """
+        return self._latency_tracker.get_stats()
+
     def get_circuit_breaker_stats(self) -> Dict[str, Dict[str, Any]]:
         """Get circuit breaker statistics for all providers.
 
@@ -2622,6 +2999,8 @@ class QuestionGenerator:
 
         if cleanup_tasks:
             await asyncio.gather(*cleanup_tasks, return_exceptions=True)
+        if self._chunk_size_estimator is not None:
+            await asyncio.to_thread(self._chunk_size_estimator.flush)
         logger.info("Question generator cleanup complete")
 
     async def __aenter__(self) -> "QuestionGenerator":
@@ -9,7 +9,7 @@ import logging
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from app.config.config import settings
 from app.generation.generator import QuestionGenerator
@@ -64,6 +64,12 @@ class QuestionGenerationPipeline:
             anthropic_api_key=self.anthropic_key,
             google_api_key=self.google_key,
             xai_api_key=self.xai_key,
+            hedge_requests=settings.generation_hedging_enabled,
+            hedge_percentile=settings.generation_hedge_percentile,
+            hedge_min_success_rate=settings.generation_hedge_min_success_rate,
+            hedge_budget=settings.generation_hedge_budget,
+            hedge_benchmark_path=settings.generation_hedge_benchmark_path,
+            adaptive_chunking=settings.generation_adaptive_chunking,
         )
 
         logger.info("Question generation pipeline initialized")
@@ -390,6 +396,7 @@ class QuestionGenerationPipeline:
         question_types: Optional[List[QuestionType]] = None,
         difficulty_distribution: Optional[Dict[DifficultyLevel, float]] = None,
         provider_tier: Optional[str] = None,
+        on_batch: Optional[Callable[[GenerationBatch], Awaitable[None]]] = None,
     ) -> Dict[str, Any]:
         """Run a complete question generation job asynchronously with parallel generation.
 
@@ -402,6 +409,10 @@ class QuestionGenerationPipeline:
             question_types: Specific types to generate (None = all types)
             difficulty_distribution: Distribution of difficulties (None = equal)
             provider_tier: Which tier to use - "primary" or "fallback" (None = "primary")
+            on_batch: Optional coroutine function awaited with each batch as soon
+                as it is generated, e.g. to stream questions into evaluation. The
+                batch's generation task waits for it, so a slow consumer applies
+                backpressure.
 
         Returns:
             Dictionary with job statistics and results
@@ -442,12 +453,15 @@ class QuestionGenerationPipeline:
             for question_type in types_to_generate:
                 for difficulty, proportion in difficulty_distribution.items():
                     count = max(1, int(questions_per_type * proportion))
-                    task = self.generate_questions_async(
-                        question_type=question_type,
-                        difficulty=difficulty,
-                        count=count,
-                        distribute_providers=True,
-                        provider_tier=provider_tier,
+                    task = self._generate_and_emit(
+                        self.generate_questions_async(
+                            question_type=question_type,
+                            difficulty=difficulty,
+                            count=count,
+                            distribute_providers=True,
+                            provider_tier=provider_tier,
+                        ),
+                        on_batch,
                     )
                     tasks.append(task)
                     task_metadata.append(
@@ -668,6 +682,7 @@ class QuestionGenerationPipeline:
         self,
         stratum_allocations: Dict[Tuple[QuestionType, DifficultyLevel], int],
         provider_tier: Optional[str] = None,
+        on_batch: Optional[Callable[[GenerationBatch], Awaitable[None]]] = None,
     ) -> Dict[str, Any]:
         """Run a balanced question generation job asynchronously with parallel generation.
 
@@ -679,6 +694,10 @@ class QuestionGenerationPipeline:
             stratum_allocations: Dictionary mapping (QuestionType, DifficultyLevel)
                 tuples to the number of questions to generate for that stratum.
             provider_tier: Which tier to use - "primary" or "fallback" (None = "primary")
+            on_batch: Optional coroutine function awaited with each batch as soon
+                as it is generated, e.g. to stream questions into evaluation. The
+                batch's generation task waits for it, so a slow consumer applies
+                backpressure.
 
         Returns:
             Dictionary with job statistics and results
@@ -707,12 +726,15 @@ class QuestionGenerationPipeline:
                 if count <= 0:
                     continue
 
-                task = self.generate_questions_async(
-                    question_type=question_type,
-                    difficulty=difficulty,
-                    count=count,
-                    distribute_providers=True,
-                    provider_tier=provider_tier,
+                task = self._generate_and_emit(
+                    self.generate_questions_async(
+                        question_type=question_type,
+                        difficulty=difficulty,
+                        count=count,
+                        distribute_providers=True,
+                        provider_tier=provider_tier,
+                    ),
+                    on_batch,
                 )
                 tasks.append(task)
                 task_metadata.append(
@@ -806,6 +828,17 @@ class QuestionGenerationPipeline:
                 "questions": all_questions,
             }
 
+    async def _generate_and_emit(
+        self,
+        generation: Awaitable[GenerationBatch],
+        on_batch: Optional[Callable[[GenerationBatch], Awaitable[None]]],
+    ) -> GenerationBatch:
+        """Await a batch generation and hand the batch to on_batch, if given."""
+        batch = await generation
+        if on_batch is not None:
+            await on_batch(batch)
+        return batch
+
     def get_pipeline_info(self) -> Dict[str, Any]:
         """Get information about the pipeline configuration.
 
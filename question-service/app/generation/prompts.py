@@ -7,9 +7,11 @@ IQ test questions from various LLM providers.
 import logging
 import random
 import re
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 from app.data.models import DifficultyLevel, QuestionType
+from app.providers.base import register_cacheable_prefix
 
 logger = logging.getLogger(__name__)
 
@@ -768,6 +770,78 @@ JSON_RESPONSE_FORMAT = {
 }
 
 
+@lru_cache(maxsize=None)
+def _type_prompt(question_type: QuestionType, subtype: Optional[str]) -> str:
+    """Question type instructions, narrowed to a single sub-type if given."""
+    type_prompt = QUESTION_TYPE_PROMPTS[question_type]
+    # When a subtype is specified, narrow the "Example types" list to just that
+    # subtype so the LLM doesn't see the full menu and pick its favorite.
+    if subtype:
+        type_prompt = re.sub(
+            r"Example types:\n(?:- .*\n)+",
+            f"Example types:\n- {subtype}\n",
+            type_prompt,
+        )
+    return type_prompt
+
+
+@lru_cache(maxsize=1024)
+def question_prompt_prefix(
+    question_type: QuestionType,
+    gold_standard: str,
+    diff_instructions: str,
+    subtype: Optional[str] = None,
+) -> str:
+    """Build the stable leading part of generation and regeneration prompts.
+
+    The prefix (system prompt, type instructions, gold standard example and
+    difficulty instructions) is compiled once per combination and registered
+    as cacheable, so providers with prompt caching only bill the
+    request-specific remainder at the full input rate.
+
+    Args:
+        question_type: Type of question
+        gold_standard: Gold standard example included in the prompt
+        diff_instructions: Difficulty instructions included in the prompt
+        subtype: Optional sub-type the type instructions are narrowed to
+
+    Returns:
+        Prompt prefix, ending with a newline
+    """
+    prefix = (
+        f"{SYSTEM_PROMPT}\n\n{_type_prompt(question_type, subtype)}\n\n"
+        f"{gold_standard}\n\n{diff_instructions}\n"
+    )
+    register_cacheable_prefix(prefix)
+    return prefix
+
+
+@lru_cache(maxsize=None)
+def _generation_instructions(
+    question_type: QuestionType, difficulty: DifficultyLevel, count: int
+) -> str:
+    """Response instructions ending a generation prompt."""
+    # Memory questions use a two-phase UX: the stimulus is shown first, then hidden
+    # before the question appears. The inline conditional below adds a "stimulus"
+    # field instruction only for memory questions so the LLM includes it in its
+    # JSON response. For all other question types, the conditional evaluates to an
+    # empty string and the field is omitted.
+    return f"""
+Generate {count} unique, high-quality {"question" if count == 1 else "questions"} of type '{question_type.value}' at '{difficulty.value}' difficulty.
+
+IMPORTANT: Respond with valid JSON only. Do not include any text outside the JSON structure.
+
+For each question, provide:
+1. question_text: The complete question statement
+2. correct_answer: The correct answer (must be one of the answer_options)
+3. answer_options: An array of 4-6 options (must include correct_answer)
+4. explanation: A clear explanation of why the answer is correct
+{"5. stimulus: The content to memorize (REQUIRED for memory questions - this is shown first, then hidden before the question)" if question_type == QuestionType.MEMORY else ""}
+
+{"If generating multiple questions, return an array of question objects." if count > 1 else "Return a single question object."}
+"""
+
+
 def build_generation_prompt(
     question_type: QuestionType,
     difficulty: DifficultyLevel,
@@ -788,20 +862,10 @@ def build_generation_prompt(
     Returns:
         Complete prompt string for the LLM
     """
-    type_prompt = QUESTION_TYPE_PROMPTS[question_type]
     diff_instructions = TYPE_DIFFICULTY_OVERRIDES.get(
         (question_type, difficulty), DIFFICULTY_INSTRUCTIONS[difficulty]
     )
 
-    # When a subtype is specified, narrow the "Example types" list to just that
-    # subtype so the LLM doesn't see the full menu and pick its favorite.
-    if subtype:
-        type_prompt = re.sub(
-            r"Example types:\n(?:- .*\n)+",
-            f"Example types:\n- {subtype}\n",
-            type_prompt,
-        )
-
     # Select gold standard example: prefer subtype-specific match to reduce
     # anchoring on an unrelated example that contradicts the assigned subtype.
     if subtype and subtype in GOLD_STANDARD_BY_SUBTYPE:
@@ -831,34 +895,111 @@ Do NOT generate questions of other sub-types (e.g., do not generate cube rotatio
 Vary the specific scenarios, objects, and transformations within this sub-type.
 """
 
-    # Memory questions use a two-phase UX: the stimulus is shown first, then hidden
-    # before the question appears. The inline conditional below adds a "stimulus"
-    # field instruction only for memory questions so the LLM includes it in its
-    # JSON response. For all other question types, the conditional evaluates to an
-    # empty string and the field is omitted.
-    prompt = f"""{SYSTEM_PROMPT}
+    prompt = (
+        question_prompt_prefix(question_type, gold_standard, diff_instructions, subtype)
+        + diversity_instruction
+        + _generation_instructions(question_type, difficulty, count)
+    )
 
-{type_prompt}
+    return prompt.strip()
 
-{gold_standard}
 
-{diff_instructions}
-{diversity_instruction}
-Generate {count} unique, high-quality {"question" if count == 1 else "questions"} of type '{question_type.value}' at '{difficulty.value}' difficulty.
+# Stable opening of every judge prompt: context, the full scoring rubric,
+# calibration examples and the response format. Everything question-specific
+# follows it, so the prefix stays above Anthropic's minimum cacheable length
+# and is registered as a cacheable prefix
+JUDGE_PROMPT_PREFIX = """You are an expert psychometrician evaluating IQ test questions for a mobile app used for longitudinal cognitive tracking.
 
-IMPORTANT: Respond with valid JSON only. Do not include any text outside the JSON structure.
+CONTEXT: These questions will be used for repeated testing every 3 months. They must be highly original, suitable for mobile display, and aligned with established IQ testing principles (Wechsler, Stanford-Binet, Raven's).
 
-For each question, provide:
-1. question_text: The complete question statement
-2. correct_answer: The correct answer (must be one of the answer_options)
-3. answer_options: An array of 4-6 options (must include correct_answer)
-4. explanation: A clear explanation of why the answer is correct
-{"5. stimulus: The content to memorize (REQUIRED for memory questions - this is shown first, then hidden before the question)" if question_type == QuestionType.MEMORY else ""}
+IMPORTANT: Evaluate QUESTION CONTENT QUALITY only. Delivery mechanism concerns (e.g., screenshots, hiding sequences before recall, preventing cheating) are handled by the app UX - do NOT penalize validity for these concerns.
 
-{"If generating multiple questions, return an array of question objects." if count > 1 else "Return a single question object."}
-"""
+Evaluate the question at the end of this prompt across these criteria:
 
-    return prompt.strip()
+1. CLARITY (0.0-1.0):
+   - Is wording unambiguous and clear?
+   - Is the question concise enough for mobile display (ideally <300 characters)?
+   - Can it be understood without multiple readings?
+
+2. DIFFICULTY (0.0-1.0):
+   - Rate the ACTUAL cognitive difficulty of this question on an absolute scale:
+     0.0-0.3 = Easy (single-step, basic recall/recognition, ~70-80% success rate)
+     0.4-0.6 = Medium (multi-step reasoning, integration of concepts, ~40-60% success rate)
+     0.7-1.0 = Hard (abstract/creative thinking, complex working memory, ~10-30% success rate)
+   - Score the question's inherent difficulty, regardless of the target level given with the question
+   - Base your rating on cognitive demand, not obscure knowledge
+
+3. VALIDITY (0.0-1.0):
+   - Does it genuinely measure the cognitive ability named by its type?
+   - Is there ONE objectively correct answer?
+   - Is it culturally neutral (no region-specific knowledge, idioms, or bias)?
+   - Does it align with psychometric best practices?
+
+4. FORMATTING (0.0-1.0):
+   - Are there 4-6 answer options?
+   - Is the correct answer included in the options?
+   - Are distractors plausible and well-designed (not obviously wrong)?
+   - Do distractors test understanding rather than random guessing?
+
+5. CREATIVITY (0.0-1.0):
+   - Is the question original and unlikely to be recognized on retesting?
+   - Avoids well-known puzzles (Monty Hall, Tower of Hanoi, common riddles)?
+   - Would it feel fresh even to someone who took an IQ test recently?
+   - Does it show innovative problem design?
+
+6. LEAKAGE (0.0-1.0):
+   - Does the question body reveal the correct answer?
+   - Score 0.0 if the correct answer text appears verbatim anywhere in the question body
+   - Score 0.0 if any answer option text is quoted or reproduced in the question itself
+   - Score 1.0 if the question body contains no part of the correct answer
+
+SCORING EXAMPLES (for calibration only; do not reuse their scores):
+
+Example A - well-known puzzle with a leaked answer:
+Type: logic, Difficulty: medium
+Question: "A bat and a ball cost $1.10 in total. The bat costs $1.00 more than the ball, so the ball costs $0.05. How much does the ball cost?"
+Options: $0.05, $0.10, $0.15, $1.00
+Scores: clarity 0.8, difficulty 0.2, validity 0.5, formatting 0.8, creativity 0.1, leakage 0.0
+Why: the answer is stated in the question body, the puzzle is a famous cognitive reflection item that retested users will recognize, and nothing is left to reason about.
+
+Example B - clear, original, multi-step item:
+Type: pattern, Difficulty: medium
+Question: "What number comes next: 4, 7, 12, 21, ?"
+Options: 34, 36, 38, 40, 42
+Scores: clarity 0.9, difficulty 0.5, validity 0.9, formatting 0.9, creativity 0.8, leakage 1.0
+Why: the differences 3, 5, 9, 17 each double minus one, so the next difference is 33 and the single answer is 38; the distractors come from plausible partial rules, and the answer appears only in the options.
+
+Example C - sound idea undermined by cultural knowledge:
+Type: verbal, Difficulty: hard
+Question: "Which word completes the analogy: cricket is to wicket as baseball is to ?"
+Options: base, bat, glove, mound
+Scores: clarity 0.8, difficulty 0.4, validity 0.4, formatting 0.8, creativity 0.6, leakage 1.0
+Why: solving it depends on familiarity with two region-specific sports rather than verbal reasoning, and the relation is loose enough that more than one option can be defended.
+
+Example D - memory item that tests recall of its stimulus:
+Type: memory, Difficulty: easy
+Stimulus: "lamp, river, seven, copper, violin"
+Question: "Which item in the list you saw was a metal?"
+Options: lamp, river, copper, violin, silver
+Scores: clarity 0.9, difficulty 0.3, validity 0.8, formatting 0.9, creativity 0.6, leakage 1.0
+Why: the stimulus is hidden when the question appears, so only someone who memorized it can answer; "silver" is a plausible metal that was not in the list. Not repeating the stimulus in the question is intended and is not leakage.
+
+Respond with valid JSON matching this exact structure:
+{
+    "clarity_score": <float 0.0-1.0>,
+    "difficulty_score": <float 0.0-1.0>,
+    "validity_score": <float 0.0-1.0>,
+    "formatting_score": <float 0.0-1.0>,
+    "creativity_score": <float 0.0-1.0>,
+    "leakage_score": <float 0.0-1.0>,
+    "feedback": "<brief explanation of scores and any issues>"
+}
+
+Be rigorous in your evaluation. Questions must score above 0.7 in ALL categories to be acceptable.
+A question with even one weak dimension should be rejected.
+CRITICAL: A leakage_score of 0.0 means automatic rejection — the question must be completely rewritten.
+"""
+register_cacheable_prefix(JUDGE_PROMPT_PREFIX)
 
 
 def build_judge_prompt(
@@ -914,52 +1055,11 @@ Memory questions use a two-phase delivery: the stimulus is shown first, then hid
 
 """
 
-    return f"""You are an expert psychometrician evaluating IQ test questions for a mobile app used for longitudinal cognitive tracking.
-
-CONTEXT: These questions will be used for repeated testing every 3 months. They must be highly original, suitable for mobile display, and aligned with established IQ testing principles (Wechsler, Stanford-Binet, Raven's).
-
-IMPORTANT: Evaluate QUESTION CONTENT QUALITY only. Delivery mechanism concerns (e.g., screenshots, hiding sequences before recall, preventing cheating) are handled by the app UX - do NOT penalize validity for these concerns.
-{memory_guidance}
-Evaluate the following question across these criteria:
-
-1. CLARITY (0.0-1.0):
-   - Is wording unambiguous and clear?
-   - Is the question concise enough for mobile display (ideally <300 characters)?
-   - Can it be understood without multiple readings?
-
-2. DIFFICULTY (0.0-1.0):
-   - Rate the ACTUAL cognitive difficulty of this question on an absolute scale:
-     0.0-0.3 = Easy (single-step, basic recall/recognition, ~70-80% success rate)
-     0.4-0.6 = Medium (multi-step reasoning, integration of concepts, ~40-60% success rate)
-     0.7-1.0 = Hard (abstract/creative thinking, complex working memory, ~10-30% success rate)
-   - Score the question's inherent difficulty, regardless of the target level ({difficulty})
-   - Base your rating on cognitive demand, not obscure knowledge
-
-3. VALIDITY (0.0-1.0):
-   - Does it genuinely measure {question_type} cognitive ability?
-   - Is there ONE objectively correct answer?
-   - Is it culturally neutral (no region-specific knowledge, idioms, or bias)?
-   - Does it align with psychometric best practices?
-
-4. FORMATTING (0.0-1.0):
-   - Are there 4-6 answer options?
-   - Is the correct answer included in the options?
-   - Are distractors plausible and well-designed (not obviously wrong)?
-   - Do distractors test understanding rather than random guessing?
-
-5. CREATIVITY (0.0-1.0):
-   - Is the question original and unlikely to be recognized on retesting?
-   - Avoids well-known puzzles (Monty Hall, Tower of Hanoi, common riddles)?
-   - Would it feel fresh even to someone who took an IQ test recently?
-   - Does it show innovative problem design?
-
-6. LEAKAGE (0.0-1.0):
-   - Does the question body reveal the correct answer?
-   - Score 0.0 if the correct answer text appears verbatim anywhere in the question body
-   - Score 0.0 if any answer option text is quoted or reproduced in the question itself
-   - Score 1.0 if the question body contains no part of the correct answer
-
-Question to evaluate:
+    return (
+        JUDGE_PROMPT_PREFIX
+        + "\n"
+        + memory_guidance
+        + f"""Question to evaluate:
 ---
 Type: {question_type}
 Difficulty: {difficulty}
@@ -975,21 +1075,9 @@ Answer Options:
 Correct Answer: {correct_answer}
 ---
 
-Respond with valid JSON matching this exact structure:
-{{
-    "clarity_score": <float 0.0-1.0>,
-    "difficulty_score": <float 0.0-1.0>,
-    "validity_score": <float 0.0-1.0>,
-    "formatting_score": <float 0.0-1.0>,
-    "creativity_score": <float 0.0-1.0>,
-    "leakage_score": <float 0.0-1.0>,
-    "feedback": "<brief explanation of scores and any issues>"
-}}
-
-Be rigorous in your evaluation. Questions must score above 0.7 in ALL categories to be acceptable.
-A question with even one weak dimension should be rejected.
-CRITICAL: A leakage_score of 0.0 means automatic rejection — the question must be completely rewritten.
+Score this question against the criteria above and respond with the JSON structure only.
 """
+    )
 
 
 def build_regeneration_prompt(
@@ -1020,7 +1108,6 @@ def build_regeneration_prompt(
     Returns:
         Complete prompt string for regeneration
     """
-    type_prompt = QUESTION_TYPE_PROMPTS[question_type]
     diff_instructions = DIFFICULTY_INSTRUCTIONS[difficulty]
 
     # Randomly select a gold standard example to reduce anchoring bias
@@ -1054,14 +1141,8 @@ def build_regeneration_prompt(
     # field for memory questions only. This mirrors the two-phase UX where
     # stimulus content is shown first, then hidden before the question appears.
     # See also: build_generation_prompt() which uses the same pattern.
-    prompt = f"""{SYSTEM_PROMPT}
-
-{type_prompt}
-
-{gold_standard}
-
-{diff_instructions}
-
+    prefix = question_prompt_prefix(question_type, gold_standard, diff_instructions)
+    prompt = f"""{prefix}
 ---
 
 REGENERATION TASK: A previous question was rejected by our quality judge. Your task is to create a NEW, IMPROVED question that addresses the identified issues while maintaining the same type and difficulty.
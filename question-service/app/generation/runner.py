@@ -40,6 +40,42 @@ def run_optionally_async(async_fn, sync_fn, use_async: bool, cleanup_fn=None):
     return sync_fn()
 
 
+def record_generation_stats(
+    stats: GenerationStats,
+    provider_tier: str,
+    metrics: PipelineRunSummary,
+    logger: logging.Logger,
+) -> None:
+    """Record a generation job's statistics in the run summary and metrics."""
+    metrics.questions_requested = stats["target_questions"]
+    metrics.questions_generated = stats["questions_generated"]
+    metrics.generation_failures = (
+        stats["target_questions"] - stats["questions_generated"]
+    )
+    metrics.questions_by_type = dict(stats.get("questions_by_type", {}))
+    metrics.questions_by_difficulty = dict(stats.get("questions_by_difficulty", {}))
+
+    observability.record_metric(
+        "generation.questions_produced",
+        value=stats["questions_generated"],
+        labels={"provider_tier": provider_tier},
+        metric_type="counter",
+    )
+    observability.record_metric(
+        "generation.duration",
+        value=stats["duration_seconds"],
+        labels={"provider_tier": provider_tier},
+        metric_type="histogram",
+        unit="s",
+    )
+
+    logger.info(
+        f"Generated: {stats['questions_generated']}/{stats['target_questions']} "
+        f"questions ({stats['success_rate']*100:.1f}% success rate)"
+    )
+    logger.info(f"Duration: {stats['duration_seconds']:.1f}s")
+
+
 def run_generation_phase(
     pipeline: QuestionGenerationPipeline,
     generation_plan: Optional[GenerationPlan],
@@ -114,38 +150,12 @@ def run_generation_phase(
         stats = job_result["statistics"]
         generated_questions = job_result["questions"]
 
-        metrics.questions_requested = stats["target_questions"]
-        metrics.questions_generated = stats["questions_generated"]
-        metrics.generation_failures = (
-            stats["target_questions"] - stats["questions_generated"]
-        )
-        metrics.questions_by_type = dict(stats.get("questions_by_type", {}))
-        metrics.questions_by_difficulty = dict(stats.get("questions_by_difficulty", {}))
+        record_generation_stats(stats, provider_tier, metrics, logger)
 
         gen_span.set_attribute("questions_generated", stats["questions_generated"])
         gen_span.set_attribute("target_questions", stats["target_questions"])
         gen_span.set_attribute("duration_seconds", stats["duration_seconds"])
 
-        observability.record_metric(
-            "generation.questions_produced",
-            value=stats["questions_generated"],
-            labels={"provider_tier": provider_tier},
-            metric_type="counter",
-        )
-        observability.record_metric(
-            "generation.duration",
-            value=stats["duration_seconds"],
-            labels={"provider_tier": provider_tier},
-            metric_type="histogram",
-            unit="s",
-        )
-
-        logger.info(
-            f"Generated: {stats['questions_generated']}/{stats['target_questions']} "
-            f"questions ({stats['success_rate']*100:.1f}% success rate)"
-        )
-        logger.info(f"Duration: {stats['duration_seconds']:.1f}s")
-
         if generated_questions and len(generated_questions) > 1:
             original_count = len(generated_questions)
             generated_questions = dedupe_within_batch(generated_questions)
@@ -0,0 +1,429 @@
+"""Streaming mode of the question generation pipeline.
+
+The phase runners run generation, judge evaluation, salvage, deduplication and
+insertion as barriers: no question is judged until the last generation batch
+finishes, and none is inserted until every question is judged. The streaming
+mode connects the same stages with bounded asyncio queues so each question
+moves on as soon as its stage is done with it:
+
+    generation ──▶ judge workers ──▶ deduplication ──▶ insertion
+    (per batch)    (verification,    (one worker)       (small batches,
+                    salvage)                             one commit each)
+
+A full queue blocks the stage feeding it (backpressure), so run time tracks the
+slowest stage instead of the sum of all stages, and every question inserted
+before a late failure stays committed. The run is recorded in the same
+PipelineRunSummary fields as the phase runners.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+from gioe_libs.observability import observability
+
+from app.data.database import DatabaseService as QuestionDatabase
+from app.data.dedup_runner import dedupe_within_batch, is_unique_question
+from app.data.deduplicator import QuestionDeduplicator
+from app.data.insertion_runner import insert_question_batch
+from app.data.models import EvaluatedQuestion, GeneratedQuestion, GenerationBatch
+from app.evaluation.judge import QuestionJudge
+from app.evaluation.runner import (
+    record_judge_decision,
+    verify_approved_question_async,
+)
+from app.generation.pipeline import QuestionGenerationPipeline
+from app.generation.runner import GenerationStats, record_generation_stats
+from app.inventory.inventory_analyzer import GenerationPlan
+from app.reporting.run_summary import RunSummary as PipelineRunSummary
+from app.salvage.runner import (
+    MAX_REGENERATIONS_PER_RUN,
+    attempt_local_salvage,
+    attempt_regeneration_with_feedback,
+    build_salvaged_evaluation,
+)
+
+# Questions buffered between two stages before the upstream stage waits
+DEFAULT_STREAM_QUEUE_SIZE = 50
+
+# Most questions inserted per transaction; smaller batches are inserted as soon
+# as deduplication has nothing more ready
+STREAM_INSERT_BATCH_SIZE = 10
+
+# Queue item marking the end of a stage's input
+_END = object()
+
+
+@dataclass
+class StreamingRunResult:
+    """Questions that went through each stage of a streaming run."""
+
+    stats: Optional[GenerationStats] = None
+    generated_questions: list[GeneratedQuestion] = field(default_factory=list)
+    approved_questions: list[EvaluatedQuestion] = field(default_factory=list)
+    rejected_questions: list[EvaluatedQuestion] = field(default_factory=list)
+    unique_questions: list[EvaluatedQuestion] = field(default_factory=list)
+    inserted_count: int = 0
+
+    @property
+    def approval_rate(self) -> float:
+        """Approved (including salvaged) questions as a percentage of generated."""
+        if not self.generated_questions:
+            return 0.0
+        return len(self.approved_questions) / len(self.generated_questions) * 100
+
+
+def _first_error(error: BaseException) -> BaseException:
+    """Unwrap the first exception raised inside (nested) task groups."""
+    while isinstance(error, BaseExceptionGroup):
+        error = error.exceptions[0]
+    return error
+
+
+def run_streaming_pipeline(
+    pipeline: QuestionGenerationPipeline,
+    judge: QuestionJudge,
+    db: Optional[QuestionDatabase],
+    deduplicator: Optional[QuestionDeduplicator],
+    generation_plan: Optional[GenerationPlan],
+    question_types: Optional[list],
+    difficulty_distribution: Optional[dict],
+    max_concurrent: int,
+    timeout: int,
+    provider_tier: str,
+    count: Optional[int],
+    min_score: float,
+    max_concurrent_judge: int,
+    skip_deduplication: bool,
+    metrics: PipelineRunSummary,
+    logger: logging.Logger,
+    queue_size: int = DEFAULT_STREAM_QUEUE_SIZE,
+) -> StreamingRunResult:
+    """Run generation, judge, salvage, dedup and insertion as overlapped stages.
+
+    Generation always uses the async pipeline. Judge evaluation runs in
+    max_concurrent_judge workers; deduplication and insertion run in one
+    worker each, with their blocking calls in a thread.
+
+    Returns the questions seen by each stage. If a stage fails unexpectedly
+    the error is raised after the other stages are cancelled; questions
+    inserted up to that point stay in the database.
+    """
+    pipeline.generator._rate_limiter = asyncio.Semaphore(max_concurrent)
+    pipeline.generator._async_timeout = timeout
+
+    async def _run() -> StreamingRunResult:
+        try:
+            return await run_streaming_pipeline_async(
+                pipeline=pipeline,
+                judge=judge,
+                db=db,
+                deduplicator=deduplicator,
+                generation_plan=generation_plan,
+                question_types=question_types,
+                difficulty_distribution=difficulty_distribution,
+                provider_tier=provider_tier,
+                count=count,
+                min_score=min_score,
+                max_concurrent_judge=max_concurrent_judge,
+                skip_deduplication=skip_deduplication,
+                metrics=metrics,
+                logger=logger,
+                queue_size=queue_size,
+            )
+        finally:
+            await pipeline.cleanup()
+            await judge.cleanup()
+
+    return asyncio.run(_run())
+
+
+async def run_streaming_pipeline_async(
+    pipeline: QuestionGenerationPipeline,
+    judge: QuestionJudge,
+    db: Optional[QuestionDatabase],
+    deduplicator: Optional[QuestionDeduplicator],
+    generation_plan: Optional[GenerationPlan],
+    question_types: Optional[list],
+    difficulty_distribution: Optional[dict],
+    provider_tier: str,
+    count: Optional[int],
+    min_score: float,
+    max_concurrent_judge: int,
+    skip_deduplication: bool,
+    metrics: PipelineRunSummary,
+    logger: logging.Logger,
+    queue_size: int = DEFAULT_STREAM_QUEUE_SIZE,
+    existing_by_difficulty: Optional[dict] = None,
+) -> StreamingRunResult:
+    """Async form of run_streaming_pipeline for callers that own the event loop.
+
+    The pipeline and judge are left open, and the generator keeps its own
+    rate limiter and timeout. existing_by_difficulty is the deduplication
+    cache of existing questions per difficulty; pass the same dict to
+    several runs to load each difficulty from the database only once.
+    Questions whose insert batch fails are removed from it again.
+    """
+    if db is None:
+        raise ValueError("db must not be None")
+    if deduplicator is None and not skip_deduplication:
+        raise ValueError("deduplicator must not be None")
+    if queue_size < 1 or max_concurrent_judge < 1:
+        raise ValueError("queue_size and max_concurrent_judge must be at least 1")
+
+    logger.info(
+        f"Using streaming pipeline mode (queue_size={queue_size}, "
+        f"max_concurrent_judge={max_concurrent_judge})"
+    )
+
+    result = StreamingRunResult()
+    stream_start = time.perf_counter()
+
+    with observability.start_span(
+        "pipeline_streaming",
+        attributes={"provider_tier": provider_tier, "queue_size": queue_size},
+    ) as stream_span:
+        try:
+            await _stream(
+                pipeline=pipeline,
+                judge=judge,
+                db=db,
+                deduplicator=deduplicator,
+                generation_plan=generation_plan,
+                question_types=question_types,
+                difficulty_distribution=difficulty_distribution,
+                provider_tier=provider_tier,
+                count=count,
+                min_score=min_score,
+                judge_workers=max_concurrent_judge,
+                skip_deduplication=skip_deduplication,
+                queue_size=queue_size,
+                existing_by_difficulty=(
+                    {} if existing_by_difficulty is None else existing_by_difficulty
+                ),
+                metrics=metrics,
+                logger=logger,
+                result=result,
+            )
+        except BaseExceptionGroup as eg:
+            logger.error(
+                f"Streaming pipeline failed after inserting "
+                f"{result.inserted_count} questions"
+            )
+            raise _first_error(eg) from eg
+
+        duplicate_count = len(result.approved_questions) - len(result.unique_questions)
+        stream_span.set_attribute(
+            "questions_generated", len(result.generated_questions)
+        )
+        stream_span.set_attribute("approved_count", len(result.approved_questions))
+        stream_span.set_attribute("inserted_count", result.inserted_count)
+
+        observability.record_metric(
+            "judge.approved",
+            value=len(result.approved_questions),
+            metric_type="counter",
+        )
+        observability.record_metric(
+            "judge.rejected",
+            value=len(result.rejected_questions),
+            metric_type="counter",
+        )
+        observability.record_metric(
+            "dedup.duplicates_removed", value=duplicate_count, metric_type="counter"
+        )
+        observability.record_metric(
+            "db.questions_inserted", value=result.inserted_count, metric_type="counter"
+        )
+        observability.record_metric(
+            "pipeline.stage.duration",
+            value=time.perf_counter() - stream_start,
+            labels={"stage": "streaming"},
+            metric_type="histogram",
+            unit="s",
+        )
+
+    logger.info(
+        f"\nApproved: {len(result.approved_questions)}/"
+        f"{len(result.generated_questions)} ({result.approval_rate:.1f}%)"
+    )
+    logger.info(f"Rejected: {len(result.rejected_questions)}")
+    logger.info(f"Duplicates removed: {duplicate_count}")
+    logger.info(
+        f"Inserted: {result.inserted_count}/{len(result.unique_questions)} questions"
+    )
+
+    return result
+
+
+async def _stream(
+    pipeline: QuestionGenerationPipeline,
+    judge: QuestionJudge,
+    db: QuestionDatabase,
+    deduplicator: Optional[QuestionDeduplicator],
+    generation_plan: Optional[GenerationPlan],
+    question_types: Optional[list],
+    difficulty_distribution: Optional[dict],
+    provider_tier: str,
+    count: Optional[int],
+    min_score: float,
+    judge_workers: int,
+    skip_deduplication: bool,
+    queue_size: int,
+    existing_by_difficulty: dict,
+    metrics: PipelineRunSummary,
+    logger: logging.Logger,
+    result: StreamingRunResult,
+) -> None:
+    judge_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    dedup_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    insert_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    seen_texts: list[str] = []
+    # Dedup cache entries of unique questions whose insert batch is pending,
+    # by id of the question: (the difficulty's cache list, the entry)
+    pending_cache_entries: dict[int, tuple[list, dict]] = {}
+    regenerations_left = MAX_REGENERATIONS_PER_RUN
+    verify_answers = judge.judge_config.get_answer_verification_enabled()
+
+    async def _on_batch(batch: GenerationBatch) -> None:
+        questions = dedupe_within_batch(batch.questions, seen_texts=seen_texts)
+        dupes_removed = len(batch.questions) - len(questions)
+        if dupes_removed > 0:
+            logger.info(
+                f"Within-batch dedup: Removed {dupes_removed} near-duplicate questions"
+            )
+        for question in questions:
+            result.generated_questions.append(question)
+            await judge_queue.put(question)
+
+    async def _generate() -> None:
+        if generation_plan is not None:
+            logger.info("Using auto-balanced generation mode")
+            job_result = await pipeline.run_balanced_generation_job_async(
+                stratum_allocations=generation_plan.allocations,
+                provider_tier=provider_tier,
+                on_batch=_on_batch,
+            )
+        else:
+            job_result = await pipeline.run_generation_job_async(
+                questions_per_run=count,
+                question_types=question_types,
+                difficulty_distribution=difficulty_distribution,
+                provider_tier=provider_tier,
+                on_batch=_on_batch,
+            )
+        result.stats = job_result["statistics"]
+        record_generation_stats(result.stats, provider_tier, metrics, logger)
+        for _ in range(judge_workers):
+            await judge_queue.put(_END)
+
+    async def _salvage(rejected: EvaluatedQuestion) -> Optional[EvaluatedQuestion]:
+        nonlocal regenerations_left
+        salvaged_question = attempt_local_salvage(rejected, logger)
+        if salvaged_question is not None:
+            return build_salvaged_evaluation(salvaged_question)
+        if regenerations_left <= 0:
+            return None
+        regenerations_left -= 1
+        try:
+            regenerated, _ = await attempt_regeneration_with_feedback(
+                rejected_questions=[rejected],
+                generator=pipeline.generator,
+                judge=judge,
+                min_score=min_score,
+                logger=logger,
+                max_regenerations=1,
+            )
+        except Exception as e:
+            logger.warning(f"  Regeneration failed: {e}")
+            return None
+        return regenerated[0] if regenerated else None
+
+    async def _judge_worker() -> None:
+        while (question := await judge_queue.get()) is not _END:
+            try:
+                evaluated = await judge.evaluate_question_async(question=question)
+            except Exception as e:
+                logger.error(f"  ✗ Evaluation failed: {e}")
+                observability.capture_error(
+                    e, context={"phase": "judge_evaluation", "mode": "streaming"}
+                )
+                continue
+
+            approved = record_judge_decision(
+                evaluated, judge, min_score, metrics, logger
+            )
+            if approved is not None and verify_answers:
+                if not await verify_approved_question_async(
+                    approved, judge, metrics, logger
+                ):
+                    evaluated, approved = approved, None
+            if approved is None:
+                result.rejected_questions.append(evaluated)
+                approved = await _salvage(evaluated)
+                if approved is None:
+                    continue
+
+            result.approved_questions.append(approved)
+            await dedup_queue.put(approved)
+
+    async def _judge() -> None:
+        async with asyncio.TaskGroup() as workers:
+            for _ in range(judge_workers):
+                workers.create_task(_judge_worker())
+        await dedup_queue.put(_END)
+
+    async def _deduplicate() -> None:
+        while (evaluated := await dedup_queue.get()) is not _END:
+            if skip_deduplication or await asyncio.to_thread(
+                is_unique_question,
+                evaluated,
+                db,
+                deduplicator,
+                existing_by_difficulty,
+                metrics,
+                logger,
+            ):
+                result.unique_questions.append(evaluated)
+                # Later questions, and later runs sharing the cache, are
+                # checked against this one without reloading the difficulty.
+                # The entry is dropped again if its insert batch fails.
+                difficulty = str(evaluated.question.difficulty_level.value).lower()
+                cached = existing_by_difficulty.get(difficulty)
+                if cached is not None:
+                    entry = {"question_text": evaluated.question.question_text}
+                    cached.append(entry)
+                    pending_cache_entries[id(evaluated)] = (cached, entry)
+                await insert_queue.put(evaluated)
+        await insert_queue.put(_END)
+
+    async def _insert() -> None:
+        item = None
+        while item is not _END:
+            item = await insert_queue.get()
+            if item is _END:
+                break
+            batch = [item]
+            while len(batch) < STREAM_INSERT_BATCH_SIZE and not insert_queue.empty():
+                item = insert_queue.get_nowait()
+                if item is _END:
+                    break
+                batch.append(item)
+            inserted = await asyncio.to_thread(
+                insert_question_batch, batch, db, metrics, logger
+            )
+            result.inserted_count += inserted
+            for evaluated in batch:
+                pending = pending_cache_entries.pop(id(evaluated), None)
+                if pending is not None and not inserted:
+                    cached, entry = pending
+                    # By identity, so equal entries loaded from the db stay
+                    cached[:] = [e for e in cached if e is not entry]
+
+    async with asyncio.TaskGroup() as stages:
+        stages.create_task(_generate())
+        stages.create_task(_judge())
+        stages.create_task(_deduplicate())
+        stages.create_task(_insert())
@@ -0,0 +1,406 @@
+"""Long-lived worker that runs generation jobs on warm pipeline components.
+
+Every run of run_generation.py pays for interpreter start-up, imports,
+provider client construction, config loading and reloading the existing
+questions used for deduplication. GenerationWorker is built once from
+initialized components and runs jobs from an in-process queue on a single
+background event loop, so provider clients, the embedding cache and the
+per-difficulty deduplication cache stay warm between jobs. Each job is a
+streaming pipeline run (see app.generation.streaming_runner).
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Callable, Optional
+
+from gioe_libs.observability import observability
+
+from app.data.database import DatabaseService as QuestionDatabase
+from app.data.deduplicator import QuestionDeduplicator
+from app.data.models import QuestionType
+from app.evaluation.judge import QuestionJudge
+from app.generation.pipeline import QuestionGenerationPipeline
+from app.generation.streaming_runner import (
+    DEFAULT_STREAM_QUEUE_SIZE,
+    StreamingRunResult,
+    run_streaming_pipeline_async,
+)
+from app.reporting.run_summary import RunSummary as PipelineRunSummary
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENT_JOBS = 1
+DEFAULT_MAX_QUEUED_JOBS = 10
+
+# Existing questions cached for deduplication are reloaded after this many
+# seconds so questions inserted by other writers (e.g. the cron job) are seen
+DEFAULT_DEDUP_CACHE_TTL_SECONDS = 3600
+
+# Finished jobs kept for status lookups before the oldest are forgotten
+MAX_FINISHED_JOBS = 100
+
+
+class JobStatus(str, Enum):
+    """Lifecycle of a generation job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+_FINISHED_STATUSES = {JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED}
+
+
+class WorkerBusyError(RuntimeError):
+    """Raised when a job is submitted while the job queue is full."""
+
+
+@dataclass
+class GenerationJob:
+    """A generation job and its outcome once finished."""
+
+    job_id: str
+    count: int
+    question_types: Optional[list[QuestionType]] = None
+    status: JobStatus = JobStatus.QUEUED
+    cancel_requested: bool = False
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    result: Optional[StreamingRunResult] = None
+    summary: dict = field(default_factory=dict)
+    error: Optional[str] = None
+    _task: Optional[asyncio.Task] = field(default=None, repr=False, compare=False)
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job succeeded, failed or was cancelled."""
+        return self.status in _FINISHED_STATUSES
+
+    @property
+    def duration_seconds(self) -> Optional[float]:
+        """Run time of a started job (up to now while it is running)."""
+        if self.started_at is None:
+            return None
+        end = self.finished_at or datetime.now(timezone.utc)
+        return (end - self.started_at).total_seconds()
+
+
+class GenerationWorker:
+    """Runs generation jobs from a queue on one long-lived event loop.
+
+    Up to max_concurrent_jobs jobs run at a time and up to max_queued_jobs
+    wait for a slot. submit(), get_job() and cancel() may be called from any
+    thread. The worker owns the components it is given: stop() closes the
+    pipeline, judge and database.
+    """
+
+    def __init__(
+        self,
+        pipeline: QuestionGenerationPipeline,
+        judge: QuestionJudge,
+        db: QuestionDatabase,
+        deduplicator: Optional[QuestionDeduplicator],
+        min_score: float,
+        max_concurrent: int = 10,
+        timeout: int = 60,
+        max_concurrent_judge: int = 10,
+        provider_tier: str = "primary",
+        skip_deduplication: bool = False,
+        queue_size: int = DEFAULT_STREAM_QUEUE_SIZE,
+        max_concurrent_jobs: int = DEFAULT_MAX_CONCURRENT_JOBS,
+        max_queued_jobs: int = DEFAULT_MAX_QUEUED_JOBS,
+        dedup_cache_ttl_seconds: float = DEFAULT_DEDUP_CACHE_TTL_SECONDS,
+        on_job_finished: Optional[Callable[[GenerationJob], None]] = None,
+    ) -> None:
+        """Initialize the worker; call start() before submitting jobs.
+
+        Args:
+            pipeline: Initialized generation pipeline
+            judge: Initialized question judge
+            db: Database the questions are deduplicated against and inserted into
+            deduplicator: Deduplicator (may be None with skip_deduplication)
+            min_score: Minimum judge score for approval
+            max_concurrent: Concurrent generation requests across all jobs
+            timeout: Timeout in seconds for generation API calls
+            max_concurrent_judge: Judge workers per job
+            provider_tier: Provider tier used for generation
+            skip_deduplication: Insert approved questions without dedup checks
+            queue_size: Questions buffered between pipeline stages
+            max_concurrent_jobs: Jobs that run at the same time
+            max_queued_jobs: Jobs that may wait for a free slot
+            dedup_cache_ttl_seconds: Age after which existing questions are
+                reloaded for deduplication
+            on_job_finished: Called in a thread with each job that ran, once
+                it has finished; errors are logged and ignored
+        """
+        if max_concurrent_jobs < 1 or max_queued_jobs < 0:
+            raise ValueError(
+                "max_concurrent_jobs must be at least 1 and max_queued_jobs "
+                "must not be negative"
+            )
+        self.pipeline = pipeline
+        self.judge = judge
+        self.db = db
+        self.deduplicator = deduplicator
+        self.min_score = min_score
+        self.max_concurrent = max_concurrent
+        self.timeout = timeout
+        self.max_concurrent_judge = max_concurrent_judge
+        self.provider_tier = provider_tier
+        self.skip_deduplication = skip_deduplication
+        self.queue_size = queue_size
+        self.max_concurrent_jobs = max_concurrent_jobs
+        self.max_queued_jobs = max_queued_jobs
+        self.dedup_cache_ttl_seconds = dedup_cache_ttl_seconds
+        self.on_job_finished = on_job_finished
+
+        self._jobs: OrderedDict[str, GenerationJob] = OrderedDict()
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._serve_task: Optional[asyncio.Task] = None
+        self._existing_by_difficulty: dict = {}
+        self._dedup_cache_started = time.monotonic()
+
+    @property
+    def running(self) -> bool:
+        """Whether the worker loop is accepting jobs."""
+        return self._ready.is_set()
+
+    def start(self) -> None:
+        """Start the worker loop in a background thread."""
+        if self._thread is not None:
+            raise RuntimeError("Generation worker already started")
+        self._thread = threading.Thread(
+            target=asyncio.run,
+            args=(self._serve(),),
+            name="generation-worker",
+            daemon=True,
+        )
+        self._thread.start()
+        self._ready.wait()
+        logger.info(
+            f"Generation worker started (max_concurrent_jobs="
+            f"{self.max_concurrent_jobs}, max_queued_jobs={self.max_queued_jobs})"
+        )
+
+    def stop(self, timeout: float = 30.0) -> None:
+        """Cancel queued and running jobs, then close the components."""
+        if self._thread is None:
+            return
+        if self._loop is not None and self._serve_task is not None:
+            self._loop.call_soon_threadsafe(self._serve_task.cancel)
+        self._thread.join(timeout)
+        self._thread = None
+        try:
+            self.db.close()
+        except Exception as e:
+            logger.warning(f"Failed to close database connection: {e}")
+        logger.info("Generation worker stopped")
+
+    def submit(
+        self,
+        count: int,
+        question_types: Optional[list[QuestionType]] = None,
+    ) -> GenerationJob:
+        """Queue a job generating count questions of the given types (or all).
+
+        Raises:
+            RuntimeError: If the worker is not running
+            WorkerBusyError: If max_queued_jobs jobs are already waiting
+        """
+        with self._lock:
+            if not self.running or self._loop is None or self._queue is None:
+                raise RuntimeError("Generation worker is not running")
+            queued = sum(
+                1 for job in self._jobs.values() if job.status is JobStatus.QUEUED
+            )
+            if queued >= self.max_queued_jobs:
+                raise WorkerBusyError(
+                    f"{queued} generation jobs are already queued "
+                    f"(max {self.max_queued_jobs})"
+                )
+            job = GenerationJob(
+                job_id=uuid.uuid4().hex,
+                count=count,
+                question_types=question_types or None,
+            )
+            self._jobs[job.job_id] = job
+            self._forget_finished_jobs()
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, job)
+
+        logger.info(f"Queued generation job {job.job_id} (count={count})")
+        return job
+
+    def get_job(self, job_id: str) -> Optional[GenerationJob]:
+        """Return a job by ID, or None if it is unknown or was forgotten."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[GenerationJob]:
+        """Cancel a queued or running job.
+
+        A queued job is cancelled immediately. A running job is cancelled
+        asynchronously: its status changes once its stages have stopped, and
+        questions inserted before then stay in the database.
+
+        Returns:
+            The job, or None if the job ID is unknown
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.finished:
+                return job
+            job.cancel_requested = True
+            if job.status is JobStatus.QUEUED:
+                job.status = JobStatus.CANCELLED
+                job.finished_at = datetime.now(timezone.utc)
+            elif job._task is not None and self._loop is not None:
+                self._loop.call_soon_threadsafe(job._task.cancel)
+
+        logger.info(f"Cancellation requested for generation job {job_id}")
+        return job
+
+    def _forget_finished_jobs(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[: max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self._jobs[job_id]
+
+    async def _serve(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._serve_task = asyncio.current_task()
+        # One limiter for every job, so max_concurrent holds across jobs
+        self.pipeline.generator._rate_limiter = asyncio.Semaphore(self.max_concurrent)
+        self.pipeline.generator._async_timeout = self.timeout
+        self._ready.set()
+        try:
+            async with asyncio.TaskGroup() as consumers:
+                for _ in range(self.max_concurrent_jobs):
+                    consumers.create_task(self._consume())
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._ready.clear()
+            with self._lock:
+                for job in self._jobs.values():
+                    if job.status is JobStatus.QUEUED:
+                        job.status = JobStatus.CANCELLED
+                        job.finished_at = datetime.now(timezone.utc)
+            await self.pipeline.cleanup()
+            await self.judge.cleanup()
+
+    async def _consume(self) -> None:
+        assert self._queue is not None
+        while True:
+            job = await self._queue.get()
+            with self._lock:
+                if job.status is not JobStatus.QUEUED:
+                    continue
+                job.status = JobStatus.RUNNING
+                job.started_at = datetime.now(timezone.utc)
+                task = job._task = asyncio.create_task(self._run_job(job))
+            try:
+                await asyncio.wait({task})
+            except asyncio.CancelledError:
+                task.cancel()
+                await asyncio.wait({task})
+                raise
+
+    def _dedup_cache(self) -> dict:
+        """Existing questions per difficulty, reset once older than the TTL."""
+        if time.monotonic() - self._dedup_cache_started > self.dedup_cache_ttl_seconds:
+            # Replaced rather than cleared: running jobs keep their reference
+            self._existing_by_difficulty = {}
+            self._dedup_cache_started = time.monotonic()
+        return self._existing_by_difficulty
+
+    async def _run_job(self, job: GenerationJob) -> None:
+        job_logger = logging.getLogger(f"{__name__}.{job.job_id[:8]}")
+        metrics = PipelineRunSummary()
+        metrics.start_run()
+        status = JobStatus.FAILED
+
+        with observability.start_span(
+            "generation_job",
+            kind="internal",
+            attributes={
+                "job_id": job.job_id,
+                "count": job.count,
+                "types": (
+                    ",".join(qt.value for qt in job.question_types)
+                    if job.question_types
+                    else "all"
+                ),
+                "warm_worker": True,
+            },
+        ) as span:
+            try:
+                job.result = await run_streaming_pipeline_async(
+                    pipeline=self.pipeline,
+                    judge=self.judge,
+                    db=self.db,
+                    deduplicator=self.deduplicator,
+                    generation_plan=None,
+                    question_types=job.question_types,
+                    difficulty_distribution=None,
+                    provider_tier=self.provider_tier,
+                    count=job.count,
+                    min_score=self.min_score,
+                    max_concurrent_judge=self.max_concurrent_judge,
+                    skip_deduplication=self.skip_deduplication,
+                    metrics=metrics,
+                    logger=job_logger,
+                    queue_size=self.queue_size,
+                    existing_by_difficulty=self._dedup_cache(),
+                )
+                if job.result.inserted_count > 0:
+                    status = JobStatus.SUCCEEDED
+                    span.set_status("ok")
+                else:
+                    job.error = "No questions were inserted to database"
+                    span.set_status("error", job.error)
+            except asyncio.CancelledError:
+                status = JobStatus.CANCELLED
+                job.error = "Cancelled"
+                span.set_status("error", job.error)
+            except Exception as e:
+                job_logger.exception(f"Generation job {job.job_id} failed: {e}")
+                job.error = str(e)
+                span.set_status("error", job.error)
+                observability.capture_error(
+                    e, context={"job_id": job.job_id, "count": job.count}
+                )
+
+            if status is not JobStatus.SUCCEEDED:
+                # The cache may hold questions that were never inserted
+                self._existing_by_difficulty = {}
+
+        metrics.end_run()
+        job.summary = metrics.to_summary_dict()
+        with self._lock:
+            job.status = status
+            job.finished_at = datetime.now(timezone.utc)
+            job._task = None
+        logger.info(
+            f"Generation job {job.job_id} {status.value} in "
+            f"{job.duration_seconds:.1f}s"
+        )
+
+        if self.on_job_finished is not None:
+            try:
+                await asyncio.to_thread(self.on_job_finished, job)
+            except Exception as e:
+                logger.warning(f"on_job_finished failed for job {job.job_id}: {e}")
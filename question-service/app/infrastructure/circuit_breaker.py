@@ -14,23 +14,98 @@ Transitions:
     OPEN -> HALF_OPEN: After recovery timeout expires
     HALF_OPEN -> CLOSED: When success count threshold is met
     HALF_OPEN -> OPEN: On any failure during testing
+
+With a shared state store (see circuit_breaker_state), breakers of the same
+name in different processes merge their error-rate windows every
+sync_interval seconds and publish state transitions immediately. Merges run on
+a background thread, so the store's I/O never happens under the breaker lock
+or on an event loop: calls only read the last adopted state, and a slow or
+unreachable store leaves each breaker running on its local state.
 """
 
 import logging
 import threading
 import time
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Callable, Deque, Dict, List, Optional, TypeVar
 
 from app.config.config import settings
+from app.infrastructure.circuit_breaker_state import (
+    CircuitBreakerStateStore,
+    create_circuit_breaker_state_store,
+)
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Threads running shared-state merges (each breaker has at most one in flight)
+SYNC_WORKERS = 4
+
+_sync_executor: Optional[ThreadPoolExecutor] = None
+_sync_executor_lock = threading.Lock()
+
+
+def _get_sync_executor() -> ThreadPoolExecutor:
+    """Get the thread pool that runs shared-state merges."""
+    global _sync_executor
+    with _sync_executor_lock:
+        if _sync_executor is None:
+            _sync_executor = ThreadPoolExecutor(
+                max_workers=SYNC_WORKERS, thread_name_prefix="circuit-breaker-sync"
+            )
+        return _sync_executor
+
+
+def _merge_shared_record(
+    shared: Dict[str, Any],
+    pending: List[bool],
+    local: Dict[str, Any],
+    window_size: int,
+) -> Dict[str, Any]:
+    """Merge one breaker's unpublished calls and transition into a shared record.
+
+    The newest state transition from any process wins, and every process's
+    call outcomes feed one shared error-rate window.
+
+    Args:
+        shared: Record from the state store
+        pending: Call outcomes not yet merged into the shared record
+        local: The breaker's own state (CircuitBreakerStats.to_shared_record)
+        window_size: Calls kept in the error-rate window
+
+    Returns:
+        The merged record
+    """
+    record = dict(shared)
+    recent = list(record["recent_calls"])
+    for success in pending:
+        recent.append(success)
+        if success:
+            record["consecutive_successes"] += 1
+            record["consecutive_failures"] = 0
+        else:
+            record["consecutive_failures"] += 1
+            record["consecutive_successes"] = 0
+            record["last_failure_time"] = max(
+                record["last_failure_time"] or 0.0,
+                local["last_failure_time"] or 0.0,
+            )
+    record["recent_calls"] = recent[-window_size:]
+    if local["state_changed_at"] > record["state_changed_at"]:
+        record["state"] = local["state"]
+        record["state_changed_at"] = local["state_changed_at"]
+        if local["state"] == CircuitState.CLOSED.value:
+            record["consecutive_failures"] = 0
+            record["recent_calls"] = []
+        elif local["state"] == CircuitState.HALF_OPEN.value:
+            record["consecutive_successes"] = 0
+    return record
+
 
 class CircuitState(Enum):
     """Circuit breaker states."""
@@ -62,6 +137,9 @@ class CircuitBreakerConfig:
     enabled: bool = True
     """Whether circuit breaker is enabled."""
 
+    sync_interval: float = 1.0
+    """Seconds between merges with the shared state store (if configured)."""
+
     def __post_init__(self) -> None:
         """Validate configuration after initialization."""
         if self.failure_threshold < 1:
@@ -74,6 +152,8 @@ class CircuitBreakerConfig:
             raise ValueError("success_threshold must be at least 1")
         if self.window_size < 1:
             raise ValueError("window_size must be at least 1")
+        if self.sync_interval < 0:
+            raise ValueError("sync_interval must be non-negative")
 
     @classmethod
     def from_settings(cls) -> "CircuitBreakerConfig":
@@ -93,6 +173,7 @@ class CircuitBreakerConfig:
             success_threshold=getattr(settings, "circuit_breaker_success_threshold", 2),
             window_size=getattr(settings, "circuit_breaker_window_size", 10),
             enabled=getattr(settings, "circuit_breaker_enabled", True),
+            sync_interval=getattr(settings, "circuit_breaker_sync_interval", 1.0),
         )
 
 
@@ -174,6 +255,21 @@ class CircuitBreakerStats:
             }
         )
 
+    def to_shared_record(self) -> Dict[str, Any]:
+        """Convert the state shared between processes to a JSON-able record.
+
+        Returns:
+            Record in the format kept by CircuitBreakerStateStore
+        """
+        return {
+            "state": self.state.value,
+            "state_changed_at": self.last_state_change_time or 0.0,
+            "last_failure_time": self.last_failure_time,
+            "consecutive_failures": self.consecutive_failures,
+            "consecutive_successes": self.consecutive_successes,
+            "recent_calls": list(self.recent_calls),
+        }
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert stats to dictionary.
 
@@ -226,6 +322,7 @@ class CircuitBreaker:
         provider_name: str,
         config: Optional[CircuitBreakerConfig] = None,
         on_open: Optional[Callable[[str, str], None]] = None,
+        state_store: Optional[CircuitBreakerStateStore] = None,
     ):
         """Initialize circuit breaker.
 
@@ -235,12 +332,24 @@ class CircuitBreaker:
             on_open: Optional callback invoked when circuit transitions CLOSED→OPEN.
                      Receives (provider_name, reason). Exceptions are caught and
                      logged so failures never propagate to the breaker logic.
+                     Not invoked for transitions adopted from the shared state.
+            state_store: Optional store sharing state with other processes
         """
         self.provider_name = provider_name
         self.config = config or CircuitBreakerConfig.from_settings()
         self._lock = threading.RLock()
         self._stats = CircuitBreakerStats(provider_name=provider_name)
         self._on_open = on_open
+        self._state_store = state_store
+        # Call outcomes not yet merged into the shared state
+        self._pending_calls: List[bool] = []
+        self._last_sync = 0.0
+        # Background merge state: one merge in flight at a time, a forced
+        # request made meanwhile starts another when it finishes
+        self._sync_running = False
+        self._sync_requested = False
+        self._replace_shared = False
+        self._sync_idle = threading.Condition(self._lock)
 
         logger.debug(
             f"CircuitBreaker initialized for {provider_name} "
@@ -269,6 +378,7 @@ class CircuitBreaker:
             return True
 
         with self._lock:
+            self._maybe_sync()
             self._check_state_transition()
             return self._stats.state != CircuitState.OPEN
 
@@ -334,6 +444,131 @@ class CircuitBreaker:
 
                     threading.Thread(target=_fire, daemon=True).start()
 
+            self._maybe_sync(force=True)
+
+    def _maybe_sync(self, force: bool = False) -> None:
+        """Start a background merge with the shared state store if one is due.
+
+        A merge is due once per sync interval, or immediately with force
+        (state transitions and resets). Never waits on the store.
+
+        Must be called while holding the lock.
+
+        Args:
+            force: Merge now regardless of the sync interval
+        """
+        if self._state_store is None:
+            return
+        if self._sync_running:
+            self._sync_requested = self._sync_requested or force
+            return
+        if not force and time.time() - self._last_sync < self.config.sync_interval:
+            return
+        self._sync_running = True
+        self._sync_requested = False
+        pending, self._pending_calls = self._pending_calls, []
+        replace, self._replace_shared = self._replace_shared, False
+        _get_sync_executor().submit(
+            self._sync, pending, self._stats.to_shared_record(), replace
+        )
+
+    def sync(self, timeout: Optional[float] = None) -> bool:
+        """Merge with the shared state store now and wait for the merge.
+
+        Blocks, so use it from scripts, shutdown hooks and tests rather than
+        on an event loop.
+
+        Args:
+            timeout: Seconds to wait (None = until done)
+
+        Returns:
+            True if no merge is still running
+        """
+        with self._lock:
+            self._maybe_sync(force=True)
+            return self._sync_idle.wait_for(
+                lambda: not self._sync_running, timeout=timeout
+            )
+
+    def _sync(
+        self, pending: List[bool], local: Dict[str, Any], replace: bool
+    ) -> None:
+        """Push call outcomes and the local state, then adopt the shared state.
+
+        Runs on a sync thread without the lock, from snapshots taken by
+        _maybe_sync. Store errors are logged and leave this breaker running on
+        its local state; the unpublished calls are kept for the next merge.
+
+        Args:
+            pending: Call outcomes not yet merged into the shared state
+            local: Snapshot of this breaker's state
+            replace: Overwrite the shared record with the local state (reset)
+        """
+        assert self._state_store is not None
+        window_size = self.config.window_size
+
+        def merge(shared: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+            if shared is None or replace:
+                return local
+            return _merge_shared_record(shared, pending, local, window_size)
+
+        record: Optional[Dict[str, Any]] = None
+        try:
+            record = self._state_store.update(self.provider_name, merge)
+        except Exception as e:
+            logger.warning(
+                f"Circuit breaker [{self.provider_name}] state sync failed: {e}"
+            )
+
+        with self._lock:
+            self._last_sync = time.time()
+            self._sync_running = False
+            if record is None:
+                self._pending_calls = (pending + self._pending_calls)[-window_size:]
+                self._replace_shared = self._replace_shared or replace
+            else:
+                self._adopt(record)
+            if self._sync_requested:
+                self._maybe_sync(force=True)
+            self._sync_idle.notify_all()
+
+    def _adopt(self, record: Dict[str, Any]) -> None:
+        """Take over a shared record, keeping calls made since the merge began.
+
+        Must be called while holding the lock.
+
+        Args:
+            record: Record returned by the state store
+        """
+        record = _merge_shared_record(
+            record,
+            self._pending_calls,
+            self._stats.to_shared_record(),
+            self.config.window_size,
+        )
+        self._stats.recent_calls = list(record["recent_calls"])
+        self._stats.consecutive_failures = record["consecutive_failures"]
+        self._stats.consecutive_successes = record["consecutive_successes"]
+        self._stats.last_failure_time = record["last_failure_time"]
+        shared_state = CircuitState(record["state"])
+        if shared_state != self._stats.state:
+            logger.info(
+                f"Circuit breaker [{self.provider_name}]: "
+                f"{self._stats.state.value} -> {shared_state.value} (shared state)"
+            )
+            self._stats.record_state_change(
+                self._stats.state, shared_state, "Adopted from shared state"
+            )
+        self._stats.last_state_change_time = record["state_changed_at"]
+
+        if self._stats.state == CircuitState.CLOSED and self._should_open_circuit():
+            self._transition_to(
+                CircuitState.OPEN,
+                f"Shared failure threshold exceeded "
+                f"(consecutive={self._stats.consecutive_failures}, "
+                f"error_rate={self._stats.get_error_rate():.2%})",
+            )
+
     def _should_open_circuit(self) -> bool:
         """Check if circuit should open based on failure metrics.
 
@@ -359,6 +594,8 @@ class CircuitBreaker:
 
         with self._lock:
             self._stats.record_call(success=True, window_size=self.config.window_size)
+            if self._state_store is not None:
+                self._pending_calls.append(True)
 
             if self._stats.state == CircuitState.HALF_OPEN:
                 if self._stats.consecutive_successes >= self.config.success_threshold:
@@ -366,6 +603,7 @@ class CircuitBreaker:
                         CircuitState.CLOSED,
                         f"Success threshold ({self.config.success_threshold}) met in HALF_OPEN",
                     )
+            self._maybe_sync()
 
     def record_failure(self) -> None:
         """Record a failed call."""
@@ -374,6 +612,8 @@ class CircuitBreaker:
 
         with self._lock:
             self._stats.record_call(success=False, window_size=self.config.window_size)
+            if self._state_store is not None:
+                self._pending_calls.append(False)
 
             if self._stats.state == CircuitState.CLOSED:
                 if self._should_open_circuit():
@@ -387,6 +627,7 @@ class CircuitBreaker:
                 self._transition_to(
                     CircuitState.OPEN, "Failure during HALF_OPEN testing"
                 )
+            self._maybe_sync()
 
     def execute(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
         """Execute a function with circuit breaker protection.
@@ -407,6 +648,7 @@ class CircuitBreaker:
             return func(*args, **kwargs)
 
         with self._lock:
+            self._maybe_sync()
             self._check_state_transition()
 
             if self._stats.state == CircuitState.OPEN:
@@ -445,6 +687,7 @@ class CircuitBreaker:
             return await func(*args, **kwargs)
 
         with self._lock:
+            self._maybe_sync()
             self._check_state_transition()
 
             if self._stats.state == CircuitState.OPEN:
@@ -472,10 +715,15 @@ class CircuitBreaker:
             return self._stats.to_dict()
 
     def reset(self) -> None:
-        """Reset circuit breaker to initial state."""
+        """Reset circuit breaker to initial state (in every process when shared)."""
         with self._lock:
             old_state = self._stats.state
             self._stats = CircuitBreakerStats(provider_name=self.provider_name)
+            if self._state_store is not None:
+                self._pending_calls = []
+                self._stats.last_state_change_time = time.time()
+                self._replace_shared = True
+                self._maybe_sync(force=True)
             logger.info(
                 f"Circuit breaker [{self.provider_name}] reset from {old_state.value}"
             )
@@ -491,6 +739,7 @@ class CircuitBreakerRegistry:
         self,
         config: Optional[CircuitBreakerConfig] = None,
         on_open: Optional[Callable[[str, str], None]] = None,
+        state_store: Optional[CircuitBreakerStateStore] = None,
     ):
         """Initialize the registry.
 
@@ -499,11 +748,13 @@ class CircuitBreakerRegistry:
             on_open: Optional callback for CLOSED→OPEN transitions, passed to
                      each new CircuitBreaker (and applied to existing ones via
                      set_on_open_callback).
+            state_store: Optional store sharing breaker state across processes
         """
         self._breakers: Dict[str, CircuitBreaker] = {}
         self._lock = threading.Lock()
         self._config = config or CircuitBreakerConfig.from_settings()
         self._on_open = on_open
+        self.state_store = state_store
 
     def set_on_open_callback(
         self, callback: Optional[Callable[[str, str], None]]
@@ -534,6 +785,7 @@ class CircuitBreakerRegistry:
                     provider_name=provider_name,
                     config=self._config,
                     on_open=self._on_open,
+                    state_store=self.state_store,
                 )
             return self._breakers[provider_name]
 
@@ -606,13 +858,18 @@ _registry_lock = threading.Lock()
 def get_circuit_breaker_registry() -> CircuitBreakerRegistry:
     """Get the global circuit breaker registry.
 
+    The registry shares breaker state across processes when
+    CIRCUIT_BREAKER_STATE_BACKEND is sqlite or redis.
+
     Returns:
         Global CircuitBreakerRegistry instance
     """
     global _registry
     with _registry_lock:
         if _registry is None:
-            _registry = CircuitBreakerRegistry()
+            _registry = CircuitBreakerRegistry(
+                state_store=create_circuit_breaker_state_store()
+            )
         return _registry
 
 
@@ -622,4 +879,6 @@ def reset_circuit_breaker_registry() -> None:
     with _registry_lock:
         if _registry is not None:
             _registry.reset_all()
+            if _registry.state_store is not None:
+                _registry.state_store.close()
         _registry = None
@@ -0,0 +1,200 @@
+"""Shared circuit breaker state for multi-process deployments.
+
+Each process (trigger server job subprocesses, parallel bootstrap workers)
+normally keeps its own CircuitBreakerRegistry, so every process rediscovers a
+failing provider by burning its own retries and timeouts. With a shared state
+store, circuit breakers periodically merge their recent call outcomes into one
+record per breaker and adopt the shared state, so an outage detected by one
+process opens the circuit in all of them.
+
+Backends (``CIRCUIT_BREAKER_STATE_BACKEND``):
+    memory - Per-process state only (default).
+    sqlite - A SQLite file shared by processes on one host.
+    redis  - Redis at ``REDIS_URL``, for processes on several hosts.
+
+A store only performs atomic read-modify-write of JSON records; the merge
+rules live in CircuitBreaker, which calls the store from a background thread.
+Every update is bounded (short lock/socket timeouts, a capped number of
+optimistic retries) so an unreachable store fails fast instead of piling up
+merges.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+STATE_BACKENDS = ("memory", "sqlite", "redis")
+
+# Shared records untouched for this long are dropped (Redis) or ignored
+RECORD_TTL_SECONDS = 86400
+
+# Optimistic (WATCH/MULTI) attempts per Redis update before giving up
+MAX_UPDATE_ATTEMPTS = 5
+
+MergeFn = Callable[[Optional[Dict[str, Any]]], Dict[str, Any]]
+
+
+class CircuitBreakerStateStore(ABC):
+    """Storage for circuit breaker records shared between processes."""
+
+    @abstractmethod
+    def update(self, name: str, merge: MergeFn) -> Dict[str, Any]:
+        """Atomically replace the record for name with merge(current).
+
+        Args:
+            name: Circuit breaker name
+            merge: Function from the stored record (None if absent) to the
+                new record; may be called more than once on contention
+
+        Returns:
+            The record that was stored
+
+        Raises:
+            Exception: If the store is unreachable, busy or keeps conflicting
+        """
+
+    def close(self) -> None:
+        """Release connections held by the store."""
+
+
+class SQLiteCircuitBreakerStore(CircuitBreakerStateStore):
+    """Shared state in a SQLite file, for processes on one host."""
+
+    def __init__(self, path: str, busy_timeout: float = 0.5) -> None:
+        """Open (or create) the state file.
+
+        Args:
+            path: SQLite file path; parent directories are created
+            busy_timeout: Seconds to wait for another process's write lock
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path, timeout=busy_timeout, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS circuit_breakers ("
+            " name TEXT PRIMARY KEY,"
+            " record TEXT NOT NULL,"
+            " updated_at REAL NOT NULL)"
+        )
+        logger.info(f"Circuit breaker state shared via SQLite at {path}")
+
+    def update(self, name: str, merge: MergeFn) -> Dict[str, Any]:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT record, updated_at FROM circuit_breakers WHERE name = ?",
+                    (name,),
+                ).fetchone()
+                current = None
+                if row is not None and time.time() - row[1] < RECORD_TTL_SECONDS:
+                    current = json.loads(row[0])
+                record = merge(current)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO circuit_breakers (name, record, updated_at)"
+                    " VALUES (?, ?, ?)",
+                    (name, json.dumps(record), time.time()),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return record
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class RedisCircuitBreakerStore(CircuitBreakerStateStore):
+    """Shared state in Redis, for processes on several hosts.
+
+    Updates use WATCH/MULTI optimistic transactions, retried on contention up
+    to MAX_UPDATE_ATTEMPTS times.
+    """
+
+    KEY_PREFIX = "circuit_breaker:"
+
+    def __init__(
+        self,
+        redis_url: str,
+        socket_timeout: float = 1.0,
+        socket_connect_timeout: float = 1.0,
+    ) -> None:
+        """Connect to Redis.
+
+        Args:
+            redis_url: Redis connection URL
+            socket_timeout: Timeout for Redis operations in seconds
+            socket_connect_timeout: Timeout for connecting in seconds
+
+        Raises:
+            ImportError: If redis-py is not installed
+        """
+        import redis  # type: ignore[import-untyped]
+
+        self._redis_module = redis
+        self._redis = redis.Redis.from_url(
+            redis_url,
+            socket_timeout=socket_timeout,
+            socket_connect_timeout=socket_connect_timeout,
+            decode_responses=True,
+        )
+        logger.info("Circuit breaker state shared via Redis")
+
+    def update(self, name: str, merge: MergeFn) -> Dict[str, Any]:
+        key = f"{self.KEY_PREFIX}{name}"
+        with self._redis.pipeline() as pipe:
+            for _ in range(MAX_UPDATE_ATTEMPTS):
+                try:
+                    pipe.watch(key)
+                    raw = pipe.get(key)
+                    record = merge(json.loads(raw) if raw else None)
+                    pipe.multi()
+                    pipe.set(key, json.dumps(record), ex=RECORD_TTL_SECONDS)
+                    pipe.execute()
+                    return record
+                except self._redis_module.WatchError:
+                    continue
+        raise RuntimeError(
+            f"Circuit breaker record {name!r} still contended after "
+            f"{MAX_UPDATE_ATTEMPTS} attempts"
+        )
+
+    def close(self) -> None:
+        self._redis.close()
+
+
+def create_circuit_breaker_state_store() -> Optional[CircuitBreakerStateStore]:
+    """Create the shared state store configured by settings (None = memory).
+
+    A store that cannot be opened falls back to per-process state, since
+    circuit breakers must keep working without it.
+    """
+    from app.config.config import settings  # noqa: PLC0415
+
+    backend = settings.circuit_breaker_state_backend
+    try:
+        if backend == "sqlite":
+            return SQLiteCircuitBreakerStore(settings.circuit_breaker_state_path)
+        if backend == "redis":
+            if not settings.redis_url:
+                logger.warning(
+                    "CIRCUIT_BREAKER_STATE_BACKEND=redis but REDIS_URL is not set; "
+                    "circuit breaker state will not be shared"
+                )
+                return None
+            return RedisCircuitBreakerStore(settings.redis_url)
+    except Exception as e:
+        logger.warning(f"Shared circuit breaker state disabled: {e}")
+    return None
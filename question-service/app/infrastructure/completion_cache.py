@@ -0,0 +1,284 @@
+"""Persistent content-addressed cache for LLM completions.
+
+Re-evaluation runs, the salvage phase and the answer-correctness auditor often
+send the same (provider, model, prompt, temperature, ...) request more than once
+across runs. CompletionCache stores structured completions in a SQLite file,
+keyed by the SHA-256 hash of the full request, so identical requests can be
+served without provider latency or cost.
+
+Modes (``LLM_CACHE_MODE``):
+    off         - No caching (default).
+    read_write  - Serve cached responses and store misses. Only requests with
+                  temperature <= LLM_CACHE_MAX_TEMPERATURE are cached, so
+                  sampling-heavy generation calls still produce fresh output.
+    record      - Send every request to the provider and store the response.
+    replay      - Serve every request from the cache and never call a provider;
+                  a miss raises CompletionCacheMissError. For offline runs and
+                  tests against recorded responses.
+
+Entries expire after a TTL, and the least recently used entries are evicted
+once the cache holds more than max_entries.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+CACHE_MODES = ("off", "read_write", "record", "replay")
+
+# Bumped when the key or value format changes, so old entries are never served
+CACHE_FORMAT_VERSION = 1
+
+
+class CompletionCacheMissError(LookupError):
+    """Raised in replay mode when a request has no recorded response."""
+
+
+class CompletionCache:
+    """SQLite-backed completion cache with TTL and LRU size bound.
+
+    All operations are thread-safe via a lock around one shared connection.
+    """
+
+    DEFAULT_MAX_ENTRIES = 50_000
+
+    def __init__(
+        self,
+        path: str,
+        mode: str = "read_write",
+        ttl_seconds: Optional[int] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_temperature: float = 0.5,
+    ) -> None:
+        """Open (or create) the cache file.
+
+        Args:
+            path: SQLite file path; parent directories are created
+            mode: One of CACHE_MODES other than "off"
+            ttl_seconds: Age after which entries expire (None = no expiration)
+            max_entries: Entries kept before the least recently used are evicted
+            max_temperature: Highest temperature cached in read_write mode
+        """
+        if mode not in CACHE_MODES or mode == "off":
+            raise ValueError(f"Invalid completion cache mode: {mode!r}")
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            raise ValueError(
+                f"ttl_seconds must be positive or None (for no expiration), "
+                f"got {ttl_seconds}"
+            )
+
+        self.mode = mode
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_temperature = max_temperature
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS completions ("
+            " key TEXT PRIMARY KEY,"
+            " provider TEXT NOT NULL,"
+            " model TEXT NOT NULL,"
+            " content TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_completions_accessed_at "
+            "ON completions (accessed_at)"
+        )
+        self._purge_expired()
+        self._size = self._conn.execute("SELECT COUNT(*) FROM completions").fetchone()[
+            0
+        ]
+        self._conn.commit()
+        logger.info(
+            f"LLM completion cache opened ({mode}, {self._size} entries) at {path}"
+        )
+
+    @staticmethod
+    def compute_key(
+        provider: str,
+        model: str,
+        prompt: str,
+        response_format: Dict[str, Any],
+        temperature: float,
+        max_tokens: int,
+        **kwargs: Any,
+    ) -> str:
+        """SHA-256 of every request field that can change the response."""
+        request = {
+            "version": CACHE_FORMAT_VERSION,
+            "provider": provider,
+            "model": model,
+            "prompt": prompt,
+            "response_format": response_format,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "kwargs": kwargs,
+        }
+        encoded = json.dumps(request, sort_keys=True, default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def serves(self, temperature: float) -> bool:
+        """Whether a request at this temperature is looked up in the cache."""
+        if self.mode == "record":
+            return False
+        return self.mode == "replay" or temperature <= self.max_temperature
+
+    def stores(self, temperature: float) -> bool:
+        """Whether a provider response at this temperature is stored."""
+        if self.mode == "replay":
+            return False
+        return self.mode == "record" or temperature <= self.max_temperature
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached content for key, or None if missing or expired."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content, created_at FROM completions WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and self._is_expired(row[1], now):
+                self._conn.execute("DELETE FROM completions WHERE key = ?", (key,))
+                self._conn.commit()
+                self._size -= 1
+                row = None
+            if row is None:
+                self._misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE completions SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self._hits += 1
+        return json.loads(row[0])
+
+    def set(self, key: str, provider: str, model: str, content: Any) -> None:
+        """Store content for key, evicting least recently used entries if full."""
+        try:
+            serialized = json.dumps(content)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Completion not cached (not JSON-serializable): {e}")
+            return
+        now = time.time()
+        with self._lock:
+            exists = self._conn.execute(
+                "SELECT 1 FROM completions WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO completions "
+                "(key, provider, model, content, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, provider, model, serialized, now, now),
+            )
+            if exists is None:
+                self._size += 1
+            overflow = self._size - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    "DELETE FROM completions WHERE key IN ("
+                    " SELECT key FROM completions ORDER BY accessed_at LIMIT ?)",
+                    (overflow,),
+                )
+                self._size -= overflow
+                self._evictions += overflow
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Delete every cached completion."""
+        with self._lock:
+            self._conn.execute("DELETE FROM completions")
+            self._conn.commit()
+            count, self._size = self._size, 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+        logger.info(f"Cleared {count} cached completions")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return cache statistics."""
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "mode": self.mode,
+                "size": self._size,
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": self._hits / total if total > 0 else 0.0,
+            }
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def _purge_expired(self) -> None:
+        if self.ttl_seconds is not None:
+            self._conn.execute(
+                "DELETE FROM completions WHERE created_at < ?",
+                (time.time() - self.ttl_seconds,),
+            )
+
+
+_cache: Optional[CompletionCache] = None
+_cache_loaded = False
+_cache_lock = threading.Lock()
+
+
+def get_completion_cache() -> Optional[CompletionCache]:
+    """Get the global completion cache configured by settings (None when off).
+
+    A cache file that cannot be opened disables caching, except in replay
+    mode where running without recorded responses would call providers.
+    """
+    global _cache, _cache_loaded
+    with _cache_lock:
+        if not _cache_loaded:
+            from app.config.config import settings  # noqa: PLC0415
+
+            if settings.llm_cache_mode != "off":
+                try:
+                    _cache = CompletionCache(
+                        path=settings.llm_cache_path,
+                        mode=settings.llm_cache_mode,
+                        ttl_seconds=settings.llm_cache_ttl,
+                        max_entries=settings.llm_cache_max_entries,
+                        max_temperature=settings.llm_cache_max_temperature,
+                    )
+                except (sqlite3.Error, OSError) as e:
+                    if settings.llm_cache_mode == "replay":
+                        raise
+                    logger.warning(f"LLM completion cache disabled: {e}")
+            _cache_loaded = True
+        return _cache
+
+
+def reset_completion_cache() -> None:
+    """Close the global completion cache so the next use reloads settings."""
+    global _cache, _cache_loaded
+    with _cache_lock:
+        if _cache is not None:
+            _cache.close()
+        _cache = None
+        _cache_loaded = False
@@ -0,0 +1,155 @@
+"""
+Compact binary encoding for question embeddings.
+
+Embeddings are stored as raw little-endian bytes in
+``questions.embedding_vector`` with their model name, dimension, encoding
+and (for int8) quantization scale in sibling columns. Compared with a
+PostgreSQL ``float8[]`` of the same vector this is 2x smaller as float32
+and 8x smaller as int8, before counting per-element array overhead.
+
+Decoding uses ``np.frombuffer`` so the returned array is a view over the
+bytes the driver handed back; no Python float objects are created.
+
+The same format is read and written by the backend
+(``backend/app/core/embedding_codec.py``); keep the two in sync.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+EMBEDDING_ENCODING_FLOAT32 = "float32"
+EMBEDDING_ENCODING_INT8 = "int8"
+EMBEDDING_ENCODINGS = (EMBEDDING_ENCODING_FLOAT32, EMBEDDING_ENCODING_INT8)
+
+_DTYPES = {
+    EMBEDDING_ENCODING_FLOAT32: np.dtype("<f4"),
+    EMBEDDING_ENCODING_INT8: np.dtype("i1"),
+}
+
+_INT8_MAX = 127
+
+# Models that produced the legacy float8[] embeddings, keyed by dimension
+DEFAULT_EMBEDDING_MODEL = "text-embedding-3-small"
+_LEGACY_MODELS_BY_DIM = {768: "text-embedding-004"}
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+@dataclass(frozen=True)
+class EncodedEmbedding:
+    """An embedding vector packed for storage, with its metadata."""
+
+    data: bytes
+    model: str
+    dim: int
+    encoding: str
+    scale: Optional[float] = None
+
+    def column_values(self) -> dict:
+        """Return the ``questions`` column values for this embedding."""
+        return {
+            "embedding_vector": self.data,
+            "embedding_model": self.model,
+            "embedding_dim": self.dim,
+            "embedding_encoding": self.encoding,
+            "embedding_scale": self.scale,
+        }
+
+
+def encode_embedding(
+    vector: Union[Sequence[float], np.ndarray],
+    model: str,
+    encoding: str = EMBEDDING_ENCODING_FLOAT32,
+) -> EncodedEmbedding:
+    """
+    Pack an embedding vector into bytes.
+
+    int8 uses symmetric per-vector quantization: each component is divided by
+    ``max(|v|) / 127`` and rounded. Cosine similarity is invariant to the
+    scale, so quantized vectors can be compared without dequantizing.
+
+    Args:
+        vector: Embedding values
+        model: Embedding model that produced the vector
+        encoding: ``"float32"`` or ``"int8"``
+
+    Returns:
+        EncodedEmbedding ready to be written to the ``embedding_*`` columns
+
+    Raises:
+        ValueError: If the encoding is unknown or the vector is not 1-D
+    """
+    if encoding not in _DTYPES:
+        raise ValueError(f"Unknown embedding encoding: {encoding!r}")
+    values = np.asarray(vector, dtype=np.float32)
+    if values.ndim != 1:
+        raise ValueError("Embedding vector must be one-dimensional")
+
+    scale: Optional[float] = None
+    if encoding == EMBEDDING_ENCODING_INT8:
+        max_abs = float(np.max(np.abs(values))) if values.size else 0.0
+        scale = max_abs / _INT8_MAX if max_abs > 0 else 1.0
+        packed = np.clip(np.rint(values / scale), -_INT8_MAX, _INT8_MAX).astype(
+            _DTYPES[encoding]
+        )
+    else:
+        packed = values.astype(_DTYPES[encoding], copy=False)
+
+    return EncodedEmbedding(
+        data=packed.tobytes(),
+        model=model,
+        dim=int(values.size),
+        encoding=encoding,
+        scale=scale,
+    )
+
+
+def decode_embedding(
+    data: BytesLike,
+    encoding: str = EMBEDDING_ENCODING_FLOAT32,
+    scale: Optional[float] = None,
+    dequantize: bool = False,
+) -> np.ndarray:
+    """
+    Decode stored embedding bytes.
+
+    Args:
+        data: Bytes from ``questions.embedding_vector``
+        encoding: Value of ``questions.embedding_encoding``
+        scale: Value of ``questions.embedding_scale`` (int8 only)
+        dequantize: For int8, return float32 values multiplied by the scale
+            instead of the raw int8 view
+
+    Returns:
+        A zero-copy NumPy view over ``data`` (a new float32 array when
+        dequantizing int8)
+
+    Raises:
+        ValueError: If the encoding is unknown or the byte length does not
+            match it
+    """
+    dtype = _DTYPES.get(encoding)
+    if dtype is None:
+        raise ValueError(f"Unknown embedding encoding: {encoding!r}")
+    if memoryview(data).nbytes % dtype.itemsize:
+        raise ValueError(
+            f"Embedding byte length is not a multiple of {dtype.itemsize} "
+            f"for encoding {encoding!r}"
+        )
+    view = np.frombuffer(data, dtype=dtype)
+    if dequantize and encoding == EMBEDDING_ENCODING_INT8:
+        return view.astype(np.float32) * np.float32(scale or 1.0)
+    return view
+
+
+def legacy_embedding_model(dim: int) -> str:
+    """
+    Infer the model of a legacy ``question_embedding`` from its dimension.
+
+    The legacy column did not record the model. Vectors came from OpenAI
+    text-embedding-3-small (1536-d) unless the Google text-embedding-004
+    fallback (768-d) was used.
+    """
+    return _LEGACY_MODELS_BY_DIM.get(dim, DEFAULT_EMBEDDING_MODEL)
@@ -22,21 +22,33 @@ class TokenUsage:
     """Token usage for a single API call.
 
     Attributes:
-        input_tokens: Number of tokens in the prompt/input
+        input_tokens: Number of uncached tokens in the prompt/input
         output_tokens: Number of tokens in the completion/output
         model: The model used for this call
         provider: The provider name (e.g., "openai", "anthropic")
+        cache_read_tokens: Prompt tokens served from the provider's prompt cache
+        cache_write_tokens: Prompt tokens written to the provider's prompt cache
+        batch: True if the call ran through a provider batch API, which is
+            billed at BATCH_PRICE_MULTIPLIER of the synchronous price
     """
 
     input_tokens: int
     output_tokens: int
     model: str
     provider: str
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    batch: bool = False
 
     @property
     def total_tokens(self) -> int:
-        """Get total tokens used."""
-        return (self.input_tokens or 0) + (self.output_tokens or 0)
+        """Get total tokens used, including cached prompt tokens."""
+        return (
+            (self.input_tokens or 0)
+            + (self.output_tokens or 0)
+            + self.cache_read_tokens
+            + self.cache_write_tokens
+        )
 
 
 @dataclass
@@ -59,6 +71,16 @@ MODEL_PRICING: Dict[str, Dict[str, float]] = get_all_pricing()
 # Default pricing for unknown models (conservative estimate)
 DEFAULT_PRICING: Dict[str, float] = {"input": 10.00, "output": 30.00}
 
+# Prompt-cache prices as multiples of the input price, used unless a model's
+# pricing sets cache_read/cache_write explicitly (Anthropic: reads 0.1x,
+# 5-minute cache writes 1.25x)
+CACHE_READ_PRICE_MULTIPLIER = 0.1
+CACHE_WRITE_PRICE_MULTIPLIER = 1.25
+
+# Batch API calls (Anthropic Message Batches, OpenAI Batch, Gemini batch mode)
+# cost half the synchronous price
+BATCH_PRICE_MULTIPLIER = 0.5
+
 # Maximum number of usage records to retain.
 # Prevents memory leaks in long-running processes by evicting oldest entries.
 COST_HISTORY_LIMIT = 1000
@@ -71,7 +93,8 @@ def get_model_pricing(model: str) -> Dict[str, float]:
         model: Model identifier
 
     Returns:
-        Dictionary with 'input' and 'output' prices per 1M tokens
+        Dictionary with 'input' and 'output' (and optionally 'cache_read' and
+        'cache_write') prices per 1M tokens
     """
     pricing = MODEL_PRICING.get(model)
     if pricing is None:
@@ -100,8 +123,17 @@ def calculate_cost(token_usage: TokenUsage) -> float:
 
     input_cost = (input_tokens / 1_000_000) * pricing["input"]
     output_cost = (output_tokens / 1_000_000) * pricing["output"]
+    cache_read_cost = (token_usage.cache_read_tokens / 1_000_000) * pricing.get(
+        "cache_read", pricing["input"] * CACHE_READ_PRICE_MULTIPLIER
+    )
+    cache_write_cost = (token_usage.cache_write_tokens / 1_000_000) * pricing.get(
+        "cache_write", pricing["input"] * CACHE_WRITE_PRICE_MULTIPLIER
+    )
 
-    return input_cost + output_cost
+    cost = input_cost + output_cost + cache_read_cost + cache_write_cost
+    if token_usage.batch:
+        cost *= BATCH_PRICE_MULTIPLIER
+    return cost
 
 
 @dataclass
@@ -111,8 +143,10 @@ class ProviderCostSummary:
     Attributes:
         provider: Provider name
         total_calls: Number of API calls
-        total_input_tokens: Total input tokens used
+        total_input_tokens: Total uncached input tokens used
         total_output_tokens: Total output tokens used
+        total_cache_read_tokens: Total prompt tokens read from the cache
+        total_cache_write_tokens: Total prompt tokens written to the cache
         total_cost: Total cost in USD
         cost_by_model: Cost breakdown by model
     """
@@ -121,6 +155,8 @@ class ProviderCostSummary:
     total_calls: int = 0
     total_input_tokens: int = 0
     total_output_tokens: int = 0
+    total_cache_read_tokens: int = 0
+    total_cache_write_tokens: int = 0
     total_cost: float = 0.0
     cost_by_model: Dict[str, float] = field(default_factory=dict)
     tokens_by_model: Dict[str, Dict[str, int]] = field(default_factory=dict)
@@ -148,6 +184,8 @@ class CostTracker:
             self._total_cost: float = 0.0
             self._total_input_tokens: int = 0
             self._total_output_tokens: int = 0
+            self._total_cache_read_tokens: int = 0
+            self._total_cache_write_tokens: int = 0
             logger.debug("CostTracker reset")
 
     def record_usage(self, token_usage: TokenUsage) -> float:
@@ -175,6 +213,8 @@ class CostTracker:
                 "model": token_usage.model,
                 "input_tokens": token_usage.input_tokens,
                 "output_tokens": token_usage.output_tokens,
+                "cache_read_tokens": token_usage.cache_read_tokens,
+                "cache_write_tokens": token_usage.cache_write_tokens,
                 "total_tokens": token_usage.total_tokens,
                 "cost_usd": cost,
             }
@@ -184,6 +224,8 @@ class CostTracker:
             self._total_cost += cost
             self._total_input_tokens += token_usage.input_tokens or 0
             self._total_output_tokens += token_usage.output_tokens or 0
+            self._total_cache_read_tokens += token_usage.cache_read_tokens
+            self._total_cache_write_tokens += token_usage.cache_write_tokens
 
             # Update provider summary
             if token_usage.provider not in self._by_provider:
@@ -195,6 +237,8 @@ class CostTracker:
             summary.total_calls += 1
             summary.total_input_tokens += token_usage.input_tokens or 0
             summary.total_output_tokens += token_usage.output_tokens or 0
+            summary.total_cache_read_tokens += token_usage.cache_read_tokens
+            summary.total_cache_write_tokens += token_usage.cache_write_tokens
             summary.total_cost += cost
 
             # Update model breakdown
@@ -203,6 +247,8 @@ class CostTracker:
                 summary.tokens_by_model[token_usage.model] = {
                     "input": 0,
                     "output": 0,
+                    "cache_read": 0,
+                    "cache_write": 0,
                 }
             summary.cost_by_model[token_usage.model] += cost
             summary.tokens_by_model[token_usage.model]["input"] += (
@@ -211,6 +257,12 @@ class CostTracker:
             summary.tokens_by_model[token_usage.model]["output"] += (
                 token_usage.output_tokens or 0
             )
+            summary.tokens_by_model[token_usage.model][
+                "cache_read"
+            ] += token_usage.cache_read_tokens
+            summary.tokens_by_model[token_usage.model][
+                "cache_write"
+            ] += token_usage.cache_write_tokens
 
         logger.debug(
             f"Recorded usage: {token_usage.provider}/{token_usage.model} - "
@@ -232,8 +284,12 @@ class CostTracker:
                     "total_calls": summary.total_calls,
                     "total_input_tokens": summary.total_input_tokens,
                     "total_output_tokens": summary.total_output_tokens,
+                    "total_cache_read_tokens": summary.total_cache_read_tokens,
+                    "total_cache_write_tokens": summary.total_cache_write_tokens,
                     "total_tokens": summary.total_input_tokens
-                    + summary.total_output_tokens,
+                    + summary.total_output_tokens
+                    + summary.total_cache_read_tokens
+                    + summary.total_cache_write_tokens,
                     "total_cost_usd": round(summary.total_cost, 6),
                     "cost_by_model": {
                         model: round(cost, 6)
@@ -246,7 +302,12 @@ class CostTracker:
                 "total_cost_usd": round(self._total_cost, 6),
                 "total_input_tokens": self._total_input_tokens,
                 "total_output_tokens": self._total_output_tokens,
-                "total_tokens": self._total_input_tokens + self._total_output_tokens,
+                "total_cache_read_tokens": self._total_cache_read_tokens,
+                "total_cache_write_tokens": self._total_cache_write_tokens,
+                "total_tokens": self._total_input_tokens
+                + self._total_output_tokens
+                + self._total_cache_read_tokens
+                + self._total_cache_write_tokens,
                 "by_provider": provider_summaries,
                 "recent_records": list(self._usage_records)[-10:],  # Last 10 records
             }
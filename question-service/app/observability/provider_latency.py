@@ -0,0 +1,241 @@
+"""Per-provider/model latency and success tracking for request routing.
+
+The generator records the latency and outcome of every LLM call here. The
+hedged router reads the tracked percentiles to decide when a slow call should
+be duplicated to a second provider, and the success rates to decide whether
+that provider is healthy enough to be worth hedging to.
+
+Until a provider/model has min_samples live calls, estimates fall back to the
+provider-level numbers from a benchmark report (app.evaluation.benchmark
+output), if one was loaded. The benchmark times single-question calls, so its
+priors only stand in for the "generate" operation.
+"""
+
+import json
+import logging
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Calls kept per provider/model/operation
+LATENCY_WINDOW_SIZE = 200
+
+# Live samples required before live percentiles replace benchmark priors
+DEFAULT_MIN_SAMPLES = 20
+
+# Operation the benchmark priors were measured on (single-question calls)
+PRIOR_OPERATION = "generate"
+
+_Key = Tuple[str, str, str]
+
+
+def _percentile(sorted_values: list, percentile: float) -> float:
+    """Linearly interpolated percentile of pre-sorted values (0.0 to 1.0)."""
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    index = percentile * (len(sorted_values) - 1)
+    lower = int(index)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    weight = index - lower
+    return sorted_values[lower] * (1 - weight) + sorted_values[upper] * weight
+
+
+class ProviderLatencyTracker:
+    """Thread-safe rolling window of call latencies and outcomes.
+
+    Calls are keyed by (provider, model, operation) so that, for example,
+    single-question and whole-batch generation calls keep separate
+    distributions.
+    """
+
+    def __init__(
+        self,
+        window_size: int = LATENCY_WINDOW_SIZE,
+        min_samples: int = DEFAULT_MIN_SAMPLES,
+    ) -> None:
+        """Initialize the tracker.
+
+        Args:
+            window_size: Calls kept per provider/model/operation
+            min_samples: Live calls required before their percentiles are used
+        """
+        self.window_size = window_size
+        self.min_samples = min_samples
+        self._lock = threading.Lock()
+        self._latencies: Dict[_Key, Deque[float]] = {}
+        self._outcomes: Dict[_Key, Deque[bool]] = {}
+        # Provider -> {"p50": s, "p95": s, "p99": s, "success_rate": r}
+        self._priors: Dict[str, Dict[str, float]] = {}
+
+    def record(
+        self,
+        provider: str,
+        model: str,
+        latency: float,
+        success: bool = True,
+        operation: str = "generate",
+    ) -> None:
+        """Record one call.
+
+        Args:
+            provider: Provider name
+            model: Model used for the call
+            latency: Call latency in seconds (only recorded for successes)
+            success: Whether the call succeeded
+            operation: Kind of call (e.g. "generate", "generate_batch")
+        """
+        key = (provider, model, operation)
+        with self._lock:
+            outcomes = self._outcomes.setdefault(key, deque(maxlen=self.window_size))
+            outcomes.append(success)
+            if success:
+                latencies = self._latencies.setdefault(
+                    key, deque(maxlen=self.window_size)
+                )
+                latencies.append(latency)
+
+    def get_percentile(
+        self,
+        provider: str,
+        model: str,
+        percentile: float,
+        operation: str = "generate",
+    ) -> Optional[float]:
+        """Estimate a latency percentile in seconds.
+
+        Args:
+            provider: Provider name
+            model: Model name
+            percentile: Percentile to estimate (0.0 to 1.0)
+            operation: Kind of call
+
+        Returns:
+            Live percentile if enough calls were recorded, else the benchmark
+            prior for the provider (nearest of p50/p95/p99) for "generate"
+            calls, else None
+        """
+        with self._lock:
+            latencies = self._latencies.get((provider, model, operation))
+            if latencies is not None and len(latencies) >= self.min_samples:
+                return _percentile(sorted(latencies), percentile)
+            prior = self._priors.get(provider) if operation == PRIOR_OPERATION else None
+        if prior is None:
+            return None
+        nearest = min((50, 95, 99), key=lambda p: abs(p / 100 - percentile))
+        return prior.get(f"p{nearest}")
+
+    def get_success_rate(
+        self, provider: str, model: str, operation: str = "generate"
+    ) -> Optional[float]:
+        """Estimate the success rate of calls to a provider/model.
+
+        Returns:
+            Live success rate if enough calls were recorded, else the benchmark
+            prior for the provider for "generate" calls, else None
+        """
+        with self._lock:
+            outcomes = self._outcomes.get((provider, model, operation))
+            if outcomes is not None and len(outcomes) >= self.min_samples:
+                return sum(outcomes) / len(outcomes)
+            prior = self._priors.get(provider) if operation == PRIOR_OPERATION else None
+        return None if prior is None else prior.get("success_rate")
+
+    def load_benchmark(self, report: Dict[str, Any]) -> None:
+        """Use a benchmark report's per-provider results as priors.
+
+        Args:
+            report: Output of app.evaluation.benchmark.generate_output
+        """
+        priors: Dict[str, Dict[str, float]] = {}
+        for provider, summary in report.get("results", {}).items():
+            generated = summary.get("questions_generated", 0)
+            failed = summary.get("questions_failed", 0)
+            if not generated:
+                continue
+            priors[provider] = {
+                "p50": summary["p50_latency_ms"] / 1000,
+                "p95": summary["p95_latency_ms"] / 1000,
+                "p99": summary["p99_latency_ms"] / 1000,
+                "success_rate": generated / (generated + failed),
+            }
+        with self._lock:
+            self._priors.update(priors)
+        logger.info(f"Loaded latency priors for providers: {sorted(priors)}")
+
+    def load_benchmark_file(self, path: str) -> None:
+        """Load priors from a benchmark JSON file.
+
+        Unreadable files are logged and ignored, since priors only seed
+        routing until live data accumulates.
+
+        Args:
+            path: Path to a benchmark report written by app.evaluation.benchmark
+        """
+        try:
+            self.load_benchmark(json.loads(Path(path).read_text()))
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Could not load benchmark latency priors from {path}: {e}")
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Summarize tracked calls.
+
+        Returns:
+            Mapping of "provider/model/operation" to call count, success rate
+            and p50/p95 latency in seconds
+        """
+        with self._lock:
+            snapshot = {
+                key: (list(self._outcomes[key]), sorted(self._latencies.get(key, ())))
+                for key in self._outcomes
+            }
+        stats = {}
+        for (provider, model, operation), (outcomes, latencies) in snapshot.items():
+            stats[f"{provider}/{model}/{operation}"] = {
+                "calls": len(outcomes),
+                "success_rate": round(sum(outcomes) / len(outcomes), 4),
+                "p50_latency_s": (
+                    round(_percentile(latencies, 0.50), 3) if latencies else None
+                ),
+                "p95_latency_s": (
+                    round(_percentile(latencies, 0.95), 3) if latencies else None
+                ),
+            }
+        return stats
+
+    def reset(self) -> None:
+        """Forget all recorded calls and priors."""
+        with self._lock:
+            self._latencies.clear()
+            self._outcomes.clear()
+            self._priors.clear()
+
+
+# Global latency tracker instance
+_latency_tracker: Optional[ProviderLatencyTracker] = None
+_tracker_lock = threading.Lock()
+
+
+def get_provider_latency_tracker() -> ProviderLatencyTracker:
+    """Get the global provider latency tracker instance (thread-safe).
+
+    Returns:
+        Global ProviderLatencyTracker instance
+    """
+    global _latency_tracker
+    with _tracker_lock:
+        if _latency_tracker is None:
+            _latency_tracker = ProviderLatencyTracker()
+        return _latency_tracker
+
+
+def reset_provider_latency_tracker() -> None:
+    """Reset the global provider latency tracker (thread-safe)."""
+    global _latency_tracker
+    with _tracker_lock:
+        if _latency_tracker is not None:
+            _latency_tracker.reset()
+        else:
+            _latency_tracker = ProviderLatencyTracker()
@@ -2,7 +2,7 @@
 
 import json
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import anthropic
 from anthropic import Anthropic, AsyncAnthropic
@@ -10,7 +10,12 @@ from anthropic import Anthropic, AsyncAnthropic
 from app.config.models_config import get_known_models
 from app.observability.cost_tracking import CompletionResult, TokenUsage
 from app.utils.text_utils import safe_json_loads
-from .base import BaseLLMProvider
+from .base import (
+    BaseLLMProvider,
+    BatchJobResult,
+    batch_request_key,
+    split_cacheable_prefix,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +23,9 @@ logger = logging.getLogger(__name__)
 # To add a new Claude model: edit config/models.yaml.
 ANTHROPIC_MODELS: list[str] = get_known_models("anthropic")
 
+# Anthropic only caches prompt prefixes of at least this many tokens
+MIN_CACHEABLE_PREFIX_TOKENS = 1024
+
 
 def _structured_prompt(prompt: str, response_format: Dict[str, Any]) -> str:
     if not response_format:
@@ -29,20 +37,36 @@ def _structured_prompt(prompt: str, response_format: Dict[str, Any]) -> str:
     )
 
 
+def _cache_tokens(usage: Any, field: str) -> int:
+    """Prompt-cache token count from a usage block (0 when caching is unused)."""
+    tokens = getattr(usage, field, None)
+    return tokens if isinstance(tokens, int) else 0
+
+
 class AnthropicProvider(BaseLLMProvider):
     """Anthropic API integration for question generation and evaluation."""
 
-    def __init__(self, api_key: str, model: str = "claude-sonnet-4-5-20250929"):
+    supports_batch = True
+    max_batch_size = 100_000  # Message Batches API limit per batch
+    batch_terminal_states = frozenset({"ended"})
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "claude-sonnet-4-5-20250929",
+        base_url: Optional[str] = None,
+    ):
         """
         Initialize Anthropic provider.
 
         Args:
             api_key: Anthropic API key
             model: Model to use (default: claude-sonnet-4-5-20250929)
+            base_url: Optional API base URL (default: the SDK's Anthropic endpoint)
         """
         super().__init__(api_key, model)
-        self.client = Anthropic(api_key=api_key)
-        self.async_client = AsyncAnthropic(api_key=api_key)
+        self.client = Anthropic(api_key=api_key, base_url=base_url)
+        self.async_client = AsyncAnthropic(api_key=api_key, base_url=base_url)
 
     def generate_completion(
         self,
@@ -125,6 +149,34 @@ class AnthropicProvider(BaseLLMProvider):
         # For Claude models, this is a reasonable estimate
         return len(text) // 4
 
+    def _user_message(self, prompt: str) -> Dict[str, Any]:
+        """Build the user message, marking a registered stable prefix as cacheable.
+
+        Prompts starting with a prefix registered by the prompt builders (see
+        register_cacheable_prefix) send it as a separate content block with
+        cache_control, so repeated prefixes are billed at the cache-read rate.
+
+        Args:
+            prompt: The prompt to send
+
+        Returns:
+            Message dict for the Messages API
+        """
+        prefix, rest = split_cacheable_prefix(prompt)
+        if not rest or self.count_tokens(prefix) < MIN_CACHEABLE_PREFIX_TOKENS:
+            return {"role": "user", "content": prompt}
+        return {
+            "role": "user",
+            "content": [
+                {
+                    "type": "text",
+                    "text": prefix,
+                    "cache_control": {"type": "ephemeral"},
+                },
+                {"type": "text", "text": rest},
+            ],
+        }
+
     async def generate_completion_async(
         self,
         prompt: str,
@@ -220,7 +272,7 @@ class AnthropicProvider(BaseLLMProvider):
             try:
                 response = self.client.messages.create(
                     model=model_to_use,
-                    messages=[{"role": "user", "content": prompt}],
+                    messages=[self._user_message(prompt)],
                     temperature=temperature,
                     max_tokens=max_tokens,
                     **kwargs,
@@ -237,6 +289,12 @@ class AnthropicProvider(BaseLLMProvider):
                     token_usage = TokenUsage(
                         input_tokens=response.usage.input_tokens,
                         output_tokens=response.usage.output_tokens,
+                        cache_read_tokens=_cache_tokens(
+                            response.usage, "cache_read_input_tokens"
+                        ),
+                        cache_write_tokens=_cache_tokens(
+                            response.usage, "cache_creation_input_tokens"
+                        ),
                         model=model_to_use,
                         provider=self.get_provider_name(),
                     )
@@ -279,7 +337,7 @@ class AnthropicProvider(BaseLLMProvider):
 
                 response = self.client.messages.create(
                     model=model_to_use,
-                    messages=[{"role": "user", "content": json_prompt}],
+                    messages=[self._user_message(json_prompt)],
                     temperature=temperature,
                     max_tokens=max_tokens,
                     **kwargs,
@@ -301,6 +359,12 @@ class AnthropicProvider(BaseLLMProvider):
                     token_usage = TokenUsage(
                         input_tokens=response.usage.input_tokens,
                         output_tokens=response.usage.output_tokens,
+                        cache_read_tokens=_cache_tokens(
+                            response.usage, "cache_read_input_tokens"
+                        ),
+                        cache_write_tokens=_cache_tokens(
+                            response.usage, "cache_creation_input_tokens"
+                        ),
                         model=model_to_use,
                         provider=self.get_provider_name(),
                     )
@@ -341,7 +405,7 @@ class AnthropicProvider(BaseLLMProvider):
             try:
                 response = await self.async_client.messages.create(
                     model=model_to_use,
-                    messages=[{"role": "user", "content": prompt}],
+                    messages=[self._user_message(prompt)],
                     temperature=temperature,
                     max_tokens=max_tokens,
                     **kwargs,
@@ -358,6 +422,12 @@ class AnthropicProvider(BaseLLMProvider):
                     token_usage = TokenUsage(
                         input_tokens=response.usage.input_tokens,
                         output_tokens=response.usage.output_tokens,
+                        cache_read_tokens=_cache_tokens(
+                            response.usage, "cache_read_input_tokens"
+                        ),
+                        cache_write_tokens=_cache_tokens(
+                            response.usage, "cache_creation_input_tokens"
+                        ),
                         model=model_to_use,
                         provider=self.get_provider_name(),
                     )
@@ -400,7 +470,7 @@ class AnthropicProvider(BaseLLMProvider):
 
                 response = await self.async_client.messages.create(
                     model=model_to_use,
-                    messages=[{"role": "user", "content": json_prompt}],
+                    messages=[self._user_message(json_prompt)],
                     temperature=temperature,
                     max_tokens=max_tokens,
                     **kwargs,
@@ -424,6 +494,12 @@ class AnthropicProvider(BaseLLMProvider):
                     token_usage = TokenUsage(
                         input_tokens=response.usage.input_tokens,
                         output_tokens=response.usage.output_tokens,
+                        cache_read_tokens=_cache_tokens(
+                            response.usage, "cache_read_input_tokens"
+                        ),
+                        cache_write_tokens=_cache_tokens(
+                            response.usage, "cache_creation_input_tokens"
+                        ),
                         model=model_to_use,
                         provider=self.get_provider_name(),
                     )
@@ -437,6 +513,141 @@ class AnthropicProvider(BaseLLMProvider):
 
         return await self._execute_with_retry_async(_make_request)
 
+    # -------------------------------------------------------------------------
+    # Batch API Methods
+    # -------------------------------------------------------------------------
+
+    def create_batch_job(
+        self,
+        prompts: List[str],
+        model_override: Optional[str] = None,
+        display_name: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4000,
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        Create a Message Batches API job for multiple prompts.
+
+        Args:
+            prompts: List of prompts to process (max 100,000 prompts)
+            model_override: Optional model to use instead of the provider's default
+            display_name: Unused; Anthropic batches have no display name
+            temperature: Sampling temperature (0.0 to 1.0)
+            max_tokens: Maximum tokens per response
+            response_format: When not None, instruct the model to answer in JSON
+
+        Returns:
+            The message batch ID for tracking
+
+        Raises:
+            ValueError: If prompts list is empty or exceeds maximum size
+            LLMProviderError: If batch creation fails
+        """
+        self._validate_batch_prompts(prompts)
+        model = model_override or self.model
+
+        requests = [
+            {
+                "custom_id": batch_request_key(i),
+                "params": {
+                    "model": model,
+                    "max_tokens": max_tokens,
+                    "temperature": temperature,
+                    "messages": [
+                        self._user_message(
+                            _structured_prompt(prompt, response_format or {})
+                        )
+                    ],
+                },
+            }
+            for i, prompt in enumerate(prompts)
+        ]
+        try:
+            batch = self.client.messages.batches.create(
+                requests=requests  # type: ignore[arg-type]
+            )
+        except anthropic.AnthropicError as e:
+            raise self._handle_api_error(e)
+
+        logger.info(f"Created batch job: {batch.id} with {len(prompts)} requests")
+        return batch.id
+
+    def get_batch_job_status(self, job_name: str) -> str:
+        """
+        Get the processing status of a message batch.
+
+        Args:
+            job_name: The message batch ID
+
+        Returns:
+            Processing status ('in_progress', 'canceling' or 'ended')
+        """
+        return self.client.messages.batches.retrieve(job_name).processing_status
+
+    def get_batch_job_results(self, job_name: str) -> BatchJobResult:
+        """
+        Stream the results of an ended message batch.
+
+        Args:
+            job_name: The message batch ID
+
+        Returns:
+            BatchJobResult with all responses, errors and batch-priced token usage
+        """
+        batch = self.client.messages.batches.retrieve(job_name)
+        result = BatchJobResult(job_name=job_name, state=batch.processing_status)
+        if batch.processing_status != "ended":
+            result.errors.append(f"Job ended with state: {batch.processing_status}")
+            return result
+
+        for entry in self.client.messages.batches.results(job_name):
+            result.total_requests += 1
+            if entry.result.type == "succeeded":
+                message = entry.result.message
+                result.token_usage.append(
+                    TokenUsage(
+                        input_tokens=message.usage.input_tokens,
+                        output_tokens=message.usage.output_tokens,
+                        cache_read_tokens=_cache_tokens(
+                            message.usage, "cache_read_input_tokens"
+                        ),
+                        cache_write_tokens=_cache_tokens(
+                            message.usage, "cache_creation_input_tokens"
+                        ),
+                        model=message.model,
+                        provider=self.get_provider_name(),
+                        batch=True,
+                    )
+                )
+                text = "".join(
+                    block.text for block in message.content if block.type == "text"
+                )
+                if text:
+                    result.responses.append({"text": text, "key": entry.custom_id})
+                    result.successful_requests += 1
+                    continue
+                result.errors.append(f"Response {entry.custom_id} has empty content")
+            elif entry.result.type == "errored":
+                result.errors.append(
+                    f"Request {entry.custom_id} failed: {entry.result.error}"
+                )
+            else:
+                result.errors.append(f"Request {entry.custom_id} {entry.result.type}")
+            result.failed_requests += 1
+
+        return result
+
+    def cancel_batch_job(self, job_name: str) -> None:
+        """
+        Cancel a running message batch.
+
+        Args:
+            job_name: The message batch ID to cancel
+        """
+        self.client.messages.batches.cancel(job_name)
+        logger.info(f"Cancelled batch job: {job_name}")
+
     def get_available_models(self) -> list[str]:
         """
         Get list of known Anthropic models (static list).
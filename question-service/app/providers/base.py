@@ -10,8 +10,14 @@ from dataclasses import dataclass, field
 from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
 
 from app.config.config import settings
+from app.infrastructure.completion_cache import (
+    CompletionCache,
+    CompletionCacheMissError,
+    get_completion_cache,
+)
 from app.observability.cost_tracking import (
     CompletionResult,
+    TokenUsage,
     get_cost_tracker,
 )
 from app.infrastructure.error_classifier import ClassifiedError, ErrorClassifier
@@ -123,6 +129,31 @@ class LLMProviderError(Exception):
         super().__init__(str(classified_error))
 
 
+@dataclass
+class BatchJobResult:
+    """Result from a batch job execution.
+
+    Each response is ``{"text": ..., "key": "request-N"}`` where N is the index
+    of the prompt in the submitted batch. Providers may return responses out of
+    order, and failed requests have no response entry. token_usage holds the
+    usage of every request the provider billed, priced as batch usage.
+    """
+
+    job_name: str
+    state: str
+    responses: List[Dict[str, Any]] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    total_requests: int = 0
+    successful_requests: int = 0
+    failed_requests: int = 0
+    token_usage: List[TokenUsage] = field(default_factory=list)
+
+
+def batch_request_key(index: int) -> str:
+    """Key identifying the prompt at index in a batch job's responses."""
+    return f"request-{index}"
+
+
 class RetryConfig:
     """Configuration for retry behavior."""
 
@@ -241,6 +272,39 @@ def reset_retry_metrics() -> None:
         _retry_metrics = RetryMetrics()
 
 
+# Stable prompt prefixes shared by many requests (system prompt, question type
+# instructions, judge rubric), registered by the prompt builders in
+# app.generation.prompts. Providers with explicit prompt caching mark these as
+# cacheable; providers with automatic prefix caching benefit from them as-is.
+_cacheable_prefixes: set[str] = set()
+_prefixes_lock = threading.Lock()
+
+
+def register_cacheable_prefix(prefix: str) -> None:
+    """Register a prompt prefix that many requests will start with.
+
+    Args:
+        prefix: Exact leading text shared by the prompts
+    """
+    with _prefixes_lock:
+        _cacheable_prefixes.add(prefix)
+
+
+def split_cacheable_prefix(prompt: str) -> tuple[str, str]:
+    """Split a prompt into its longest registered prefix and the remainder.
+
+    Args:
+        prompt: Prompt to split
+
+    Returns:
+        Tuple of (prefix, remainder); prefix is "" if none matches
+    """
+    with _prefixes_lock:
+        prefixes = list(_cacheable_prefixes)
+    best = max((p for p in prefixes if prompt.startswith(p)), key=len, default="")
+    return best, prompt[len(best) :]
+
+
 def calculate_backoff_delay(
     attempt: int,
     base_delay: float,
@@ -624,8 +688,22 @@ class BaseLLMProvider(ABC):
             **kwargs: Additional provider-specific parameters
 
         Returns:
-            CompletionResult with parsed JSON content and token usage
+            CompletionResult with parsed JSON content and token usage. Responses
+            served by the completion cache have no token usage.
+
+        Raises:
+            CompletionCacheMissError: In replay mode, if the request was not recorded
         """
+        cache = get_completion_cache()
+        cache_key = None
+        if cache is not None:
+            cache_key = self._completion_cache_key(
+                prompt, response_format, temperature, max_tokens, model_override, kwargs
+            )
+            cached = self._get_cached_completion(cache, cache_key, temperature)
+            if cached is not None:
+                return cached
+
         result = self._generate_structured_completion_internal(
             prompt=prompt,
             response_format=response_format,
@@ -639,6 +717,11 @@ class BaseLLMProvider(ABC):
         if result.token_usage:
             get_cost_tracker().record_usage(result.token_usage)
 
+        if cache is not None and cache_key is not None:
+            self._store_completion(
+                cache, cache_key, temperature, model_override, result
+            )
+
         return result
 
     async def generate_completion_with_usage_async(
@@ -705,8 +788,24 @@ class BaseLLMProvider(ABC):
             **kwargs: Additional provider-specific parameters
 
         Returns:
-            CompletionResult with parsed JSON content and token usage
+            CompletionResult with parsed JSON content and token usage. Responses
+            served by the completion cache have no token usage.
+
+        Raises:
+            CompletionCacheMissError: In replay mode, if the request was not recorded
         """
+        cache = get_completion_cache()
+        cache_key = None
+        if cache is not None:
+            cache_key = self._completion_cache_key(
+                prompt, response_format, temperature, max_tokens, model_override, kwargs
+            )
+            cached = await asyncio.to_thread(
+                self._get_cached_completion, cache, cache_key, temperature
+            )
+            if cached is not None:
+                return cached
+
         result = await self._generate_structured_completion_internal_async(
             prompt=prompt,
             response_format=response_format,
@@ -720,8 +819,74 @@ class BaseLLMProvider(ABC):
         if result.token_usage:
             get_cost_tracker().record_usage(result.token_usage)
 
+        if cache is not None and cache_key is not None:
+            await asyncio.to_thread(
+                self._store_completion,
+                cache,
+                cache_key,
+                temperature,
+                model_override,
+                result,
+            )
+
         return result
 
+    def _completion_cache_key(
+        self,
+        prompt: str,
+        response_format: Dict[str, Any],
+        temperature: float,
+        max_tokens: int,
+        model_override: Optional[str],
+        kwargs: Dict[str, Any],
+    ) -> str:
+        return CompletionCache.compute_key(
+            provider=self.get_provider_name(),
+            model=model_override or self.model,
+            prompt=prompt,
+            response_format=response_format,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs,
+        )
+
+    def _get_cached_completion(
+        self, cache: CompletionCache, cache_key: str, temperature: float
+    ) -> Optional[CompletionResult]:
+        """Serve a structured completion from the completion cache.
+
+        Raises:
+            CompletionCacheMissError: In replay mode, on a cache miss
+        """
+        if not cache.serves(temperature):
+            return None
+        content = cache.get(cache_key)
+        if content is not None:
+            logger.debug(f"Completion cache hit for {self.get_provider_name()}")
+            return CompletionResult(content=content, token_usage=None)
+        if cache.mode == "replay":
+            raise CompletionCacheMissError(
+                f"No recorded {self.get_provider_name()} completion for request "
+                f"{cache_key[:12]} (LLM_CACHE_MODE=replay)"
+            )
+        return None
+
+    def _store_completion(
+        self,
+        cache: CompletionCache,
+        cache_key: str,
+        temperature: float,
+        model_override: Optional[str],
+        result: CompletionResult,
+    ) -> None:
+        if cache.stores(temperature):
+            cache.set(
+                cache_key,
+                provider=self.get_provider_name(),
+                model=model_override or self.model,
+                content=result.content,
+            )
+
     def _generate_completion_internal(
         self,
         prompt: str,
@@ -851,6 +1016,26 @@ class BaseLLMProvider(ABC):
         """
         return self.__class__.__name__.replace("Provider", "").lower()
 
+    def effective_output_limit(
+        self, max_tokens: int, model: Optional[str] = None
+    ) -> int:
+        """
+        Get the output token limit a call with max_tokens is actually sent with.
+
+        Providers that widen the requested limit (e.g. to leave room for
+        reasoning tokens, which are counted as output) override this, so
+        callers comparing reported output tokens against the limit use the
+        same budget the API enforced.
+
+        Args:
+            max_tokens: Requested maximum output tokens
+            model: Model the call is made with (default: the provider's model)
+
+        Returns:
+            Output token limit sent to the API
+        """
+        return max_tokens
+
     @abstractmethod
     def get_available_models(self) -> list[str]:
         """
@@ -1046,6 +1231,166 @@ class BaseLLMProvider(ABC):
             self.validate_model(model)
             self._validated_models.add(model)
 
+    # -------------------------------------------------------------------------
+    # Batch API Methods
+    # -------------------------------------------------------------------------
+
+    # Providers with a batch endpoint set supports_batch and implement
+    # create_batch_job, get_batch_job_status, get_batch_job_results and
+    # cancel_batch_job; generate_batch_completions_async drives them.
+    supports_batch: bool = False
+    # Largest number of prompts accepted in one batch job
+    max_batch_size: int = 0
+    # Job states after which a batch job makes no further progress
+    batch_terminal_states: frozenset[str] = frozenset()
+
+    def create_batch_job(
+        self,
+        prompts: List[str],
+        model_override: Optional[str] = None,
+        display_name: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4000,
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        Submit prompts as one provider batch job.
+
+        Args:
+            prompts: Prompts to process; responses are keyed by batch_request_key
+            model_override: Optional model to use instead of the provider's default
+            display_name: Optional display name for the batch job
+            temperature: Sampling temperature for generation
+            max_tokens: Maximum tokens per response
+            response_format: When not None, request JSON responses as
+                generate_structured_completion does ({} = schema is in the prompt)
+
+        Returns:
+            The batch job name/ID for tracking
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support batch jobs"
+        )
+
+    def get_batch_job_status(self, job_name: str) -> str:
+        """Get the provider-specific state of a batch job."""
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support batch jobs"
+        )
+
+    def get_batch_job_results(self, job_name: str) -> BatchJobResult:
+        """Fetch the responses and errors of a finished batch job."""
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support batch jobs"
+        )
+
+    def cancel_batch_job(self, job_name: str) -> None:
+        """Cancel a running batch job."""
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support batch jobs"
+        )
+
+    def _record_batch_usage(self, result: BatchJobResult) -> None:
+        """Record the token usage of a finished batch job in the cost tracker."""
+        tracker = get_cost_tracker()
+        for usage in result.token_usage:
+            tracker.record_usage(usage)
+
+    def _validate_batch_prompts(self, prompts: List[str]) -> None:
+        """Raise ValueError if prompts cannot be submitted as one batch job."""
+        if not prompts:
+            raise ValueError("Prompts list cannot be empty")
+        if len(prompts) > self.max_batch_size:
+            raise ValueError(
+                f"Batch size {len(prompts)} exceeds maximum of {self.max_batch_size}"
+            )
+
+    async def wait_for_batch_job_async(
+        self,
+        job_name: str,
+        poll_interval: float = 30.0,
+        timeout: float = 3600.0,
+    ) -> BatchJobResult:
+        """
+        Poll a batch job until it reaches a terminal state and return its results.
+
+        The results' token usage is recorded in the global cost tracker.
+
+        Args:
+            job_name: The batch job name/ID
+            poll_interval: Seconds between status checks
+            timeout: Maximum seconds to wait before timing out
+
+        Returns:
+            BatchJobResult with responses and any errors
+
+        Raises:
+            TimeoutError: If job doesn't complete within timeout
+        """
+        start_time = time.time()
+        current_state = await asyncio.to_thread(self.get_batch_job_status, job_name)
+
+        while current_state not in self.batch_terminal_states:
+            elapsed = time.time() - start_time
+            if elapsed > timeout:
+                raise TimeoutError(
+                    f"Batch job {job_name} did not complete within {timeout}s"
+                )
+
+            logger.info(
+                f"Batch job {job_name} state: {current_state}, "
+                f"elapsed: {elapsed:.1f}s"
+            )
+            await asyncio.sleep(poll_interval)
+            current_state = await asyncio.to_thread(self.get_batch_job_status, job_name)
+
+        result = await asyncio.to_thread(self.get_batch_job_results, job_name)
+        self._record_batch_usage(result)
+        return result
+
+    async def generate_batch_completions_async(
+        self,
+        prompts: List[str],
+        model_override: Optional[str] = None,
+        display_name: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4000,
+        poll_interval: float = 30.0,
+        timeout: float = 3600.0,
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> BatchJobResult:
+        """
+        Generate completions for multiple prompts using the provider's batch API.
+
+        Args:
+            prompts: List of prompts to process
+            model_override: Optional model to use instead of the provider's default
+            display_name: Optional display name for the batch job
+            temperature: Sampling temperature for generation
+            max_tokens: Maximum tokens per response
+            poll_interval: Seconds between status checks
+            timeout: Maximum seconds to wait for completion
+            response_format: When not None, request JSON responses
+
+        Returns:
+            BatchJobResult with all responses and any errors
+
+        Raises:
+            TimeoutError: If job doesn't complete within timeout
+        """
+        job_name = await asyncio.to_thread(
+            self.create_batch_job,
+            prompts,
+            model_override,
+            display_name,
+            temperature,
+            max_tokens,
+            response_format,
+        )
+        return await self.wait_for_batch_job_async(
+            job_name, poll_interval=poll_interval, timeout=timeout
+        )
+
     async def cleanup(self) -> None:
         """Clean up async resources.
 
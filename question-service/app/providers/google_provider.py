@@ -3,7 +3,6 @@
 import json
 import logging
 import time
-from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 from google import genai
@@ -11,24 +10,11 @@ from google.genai import types
 
 from app.observability.cost_tracking import CompletionResult, TokenUsage
 from app.utils.text_utils import safe_json_loads
-from .base import BaseLLMProvider
+from .base import BaseLLMProvider, BatchJobResult, batch_request_key
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class BatchJobResult:
-    """Result from a batch job execution."""
-
-    job_name: str
-    state: str
-    responses: List[Dict[str, Any]] = field(default_factory=list)
-    errors: List[str] = field(default_factory=list)
-    total_requests: int = 0
-    successful_requests: int = 0
-    failed_requests: int = 0
-
-
 # Minimum max_tokens for structured completions to prevent truncation.
 # Gemini 3 Pro Preview uses chain-of-thought reasoning which consumes tokens
 # from the output budget before generating the final response. Structured
@@ -36,6 +22,16 @@ class BatchJobResult:
 MIN_STRUCTURED_COMPLETION_TOKENS = 4000
 
 
+def _structured_prompt(prompt: str, response_format: Dict[str, Any]) -> str:
+    if not response_format:
+        return prompt
+    return (
+        f"{prompt}\n\n"
+        f"Respond with valid JSON matching this schema: {json.dumps(response_format)}\n"
+        f"Your response must be only valid JSON with no additional text."
+    )
+
+
 def _parse_google_model_name(raw_name: Optional[str]) -> Optional[str]:
     """Extract and normalize a Gemini model name from the Google API response.
 
@@ -66,6 +62,17 @@ class GoogleProvider(BaseLLMProvider):
     batch processing to handle bulk question generation efficiently.
     """
 
+    supports_batch = True
+    max_batch_size = 1000  # Google's batch API limit
+    batch_terminal_states = frozenset(
+        {
+            "JOB_STATE_SUCCEEDED",
+            "JOB_STATE_FAILED",
+            "JOB_STATE_CANCELLED",
+            "JOB_STATE_EXPIRED",
+        }
+    )
+
     def __init__(self, api_key: str, model: str = "gemini-2.5-pro"):
         """
         Initialize Google provider.
@@ -326,14 +333,7 @@ class GoogleProvider(BaseLLMProvider):
                 # Only add JSON schema instructions if a non-empty schema is provided.
                 # If response_format is empty, assume the prompt already contains
                 # JSON format instructions (e.g., judge prompts specify exact structure).
-                if response_format:
-                    json_prompt = (
-                        f"{prompt}\n\n"
-                        f"Respond with valid JSON matching this schema: {json.dumps(response_format)}\n"
-                        f"Your response must be only valid JSON with no additional text."
-                    )
-                else:
-                    json_prompt = prompt
+                json_prompt = _structured_prompt(prompt, response_format)
 
                 config = types.GenerateContentConfig(
                     temperature=temperature,
@@ -483,14 +483,7 @@ class GoogleProvider(BaseLLMProvider):
                 # Only add JSON schema instructions if a non-empty schema is provided.
                 # If response_format is empty, assume the prompt already contains
                 # JSON format instructions (e.g., judge prompts specify exact structure).
-                if response_format:
-                    json_prompt = (
-                        f"{prompt}\n\n"
-                        f"Respond with valid JSON matching this schema: {json.dumps(response_format)}\n"
-                        f"Your response must be only valid JSON with no additional text."
-                    )
-                else:
-                    json_prompt = prompt
+                json_prompt = _structured_prompt(prompt, response_format)
 
                 config = types.GenerateContentConfig(
                     temperature=temperature,
@@ -555,6 +548,7 @@ class GoogleProvider(BaseLLMProvider):
         display_name: Optional[str] = None,
         temperature: float = 0.7,
         max_tokens: int = 4000,
+        response_format: Optional[Dict[str, Any]] = None,
     ) -> str:
         """
         Create a batch job for processing multiple prompts.
@@ -569,6 +563,8 @@ class GoogleProvider(BaseLLMProvider):
             display_name: Optional display name for the batch job
             temperature: Sampling temperature for generation
             max_tokens: Maximum tokens per response
+            response_format: When not None, request JSON responses as
+                generate_structured_completion does
 
         Returns:
             The batch job name/ID for tracking
@@ -577,27 +573,26 @@ class GoogleProvider(BaseLLMProvider):
             ValueError: If prompts list is empty or exceeds maximum size
             Exception: If batch job creation fails
         """
-        # Validate inputs
-        if not prompts:
-            raise ValueError("Prompts list cannot be empty")
-
-        max_batch_size = 1000  # Google's batch API limit
-        if len(prompts) > max_batch_size:
-            raise ValueError(
-                f"Batch size {len(prompts)} exceeds maximum of {max_batch_size}"
-            )
+        self._validate_batch_prompts(prompts)
 
         model = model_override or self.model
 
+        config: Dict[str, Any] = {
+            "temperature": temperature,
+            "max_output_tokens": max_tokens,
+        }
+        if response_format is not None:
+            config["max_output_tokens"] = max(
+                max_tokens, MIN_STRUCTURED_COMPLETION_TOKENS
+            )
+            config["response_mime_type"] = "application/json"
+
         inline_requests: List[Dict[str, Any]] = []
         for i, prompt in enumerate(prompts):
             request: Dict[str, Any] = {
-                "contents": prompt,
-                "config": {
-                    "temperature": temperature,
-                    "max_output_tokens": max_tokens,
-                },
-                "metadata": {"key": f"request-{i}"},
+                "contents": _structured_prompt(prompt, response_format or {}),
+                "config": dict(config),
+                "metadata": {"key": batch_request_key(i)},
             }
             inline_requests.append(request)
 
@@ -650,18 +645,11 @@ class GoogleProvider(BaseLLMProvider):
         Raises:
             TimeoutError: If job doesn't complete within timeout
         """
-        completed_states = {
-            "JOB_STATE_SUCCEEDED",
-            "JOB_STATE_FAILED",
-            "JOB_STATE_CANCELLED",
-            "JOB_STATE_EXPIRED",
-        }
-
         start_time = time.time()
         batch_job = self._client.batches.get(name=job_name)
         current_state = batch_job.state.name if batch_job.state else "UNKNOWN"
 
-        while current_state not in completed_states:
+        while current_state not in self.batch_terminal_states:
             elapsed = time.time() - start_time
             if elapsed > timeout:
                 raise TimeoutError(
@@ -676,7 +664,21 @@ class GoogleProvider(BaseLLMProvider):
             batch_job = self._client.batches.get(name=job_name)
             current_state = batch_job.state.name if batch_job.state else "UNKNOWN"
 
-        return self._extract_batch_results(batch_job)
+        result = self._extract_batch_results(batch_job)
+        self._record_batch_usage(result)
+        return result
+
+    def get_batch_job_results(self, job_name: str) -> BatchJobResult:
+        """
+        Fetch the results of a finished batch job.
+
+        Args:
+            job_name: The batch job name/ID
+
+        Returns:
+            BatchJobResult with all responses and errors
+        """
+        return self._extract_batch_results(self._client.batches.get(name=job_name))
 
     def _extract_batch_results(self, batch_job: Any) -> BatchJobResult:
         """
@@ -686,7 +688,7 @@ class GoogleProvider(BaseLLMProvider):
             batch_job: The completed batch job object
 
         Returns:
-            BatchJobResult with all responses and errors
+            BatchJobResult with all responses, errors and batch-priced token usage
         """
         job_name = batch_job.name or ""
         state_name = batch_job.state.name if batch_job.state else "UNKNOWN"
@@ -694,6 +696,9 @@ class GoogleProvider(BaseLLMProvider):
             job_name=job_name,
             state=state_name,
         )
+        model = (getattr(batch_job, "model", None) or self.model).removeprefix(
+            "models/"
+        )
 
         if state_name != "JOB_STATE_SUCCEEDED":
             result.errors.append(f"Job ended with state: {state_name}")
@@ -703,13 +708,26 @@ class GoogleProvider(BaseLLMProvider):
             for idx, inline_response in enumerate(batch_job.dest.inlined_responses):
                 result.total_requests += 1
                 if inline_response.response:
+                    metadata = getattr(inline_response.response, "usage_metadata", None)
+                    if metadata:
+                        result.token_usage.append(
+                            TokenUsage(
+                                input_tokens=getattr(metadata, "prompt_token_count", 0),
+                                output_tokens=getattr(
+                                    metadata, "candidates_token_count", 0
+                                ),
+                                model=model,
+                                provider=self.get_provider_name(),
+                                batch=True,
+                            )
+                        )
                     try:
                         text = inline_response.response.text
                         # Use iteration index as key since Google's API doesn't return
                         # the request key in the response. Responses are in request order.
                         if text:
                             result.responses.append(
-                                {"text": text, "key": f"request-{idx}"}
+                                {"text": text, "key": batch_request_key(idx)}
                             )
                             result.successful_requests += 1
                         else:
@@ -773,76 +791,6 @@ class GoogleProvider(BaseLLMProvider):
             timeout=timeout,
         )
 
-    async def generate_batch_completions_async(
-        self,
-        prompts: List[str],
-        model_override: Optional[str] = None,
-        display_name: Optional[str] = None,
-        temperature: float = 0.7,
-        max_tokens: int = 4000,
-        poll_interval: float = 30.0,
-        timeout: float = 3600.0,
-    ) -> BatchJobResult:
-        """
-        Generate completions for multiple prompts using batch API asynchronously.
-
-        Args:
-            prompts: List of prompts to process
-            model_override: Optional model to use instead of the provider's default
-            display_name: Optional display name for the batch job
-            temperature: Sampling temperature for generation
-            max_tokens: Maximum tokens per response
-            poll_interval: Seconds between status checks
-            timeout: Maximum seconds to wait for completion
-
-        Returns:
-            BatchJobResult with all responses and any errors
-
-        Raises:
-            TimeoutError: If job doesn't complete within timeout
-        """
-        import asyncio
-
-        job_name = self.create_batch_job(
-            prompts=prompts,
-            model_override=model_override,
-            display_name=display_name,
-            temperature=temperature,
-            max_tokens=max_tokens,
-        )
-
-        completed_states = {
-            "JOB_STATE_SUCCEEDED",
-            "JOB_STATE_FAILED",
-            "JOB_STATE_CANCELLED",
-            "JOB_STATE_EXPIRED",
-        }
-
-        def _get_batch_job() -> Any:
-            return self._client.batches.get(name=job_name)
-
-        loop = asyncio.get_event_loop()
-        start_time = time.time()
-        batch_job = await loop.run_in_executor(None, _get_batch_job)
-        current_state = batch_job.state.name if batch_job.state else "UNKNOWN"
-
-        while current_state not in completed_states:
-            elapsed = time.time() - start_time
-            if elapsed > timeout:
-                raise TimeoutError(
-                    f"Batch job {job_name} did not complete within {timeout}s"
-                )
-
-            logger.info(
-                f"Batch job {job_name} state: {current_state}, "
-                f"elapsed: {elapsed:.1f}s"
-            )
-            await asyncio.sleep(poll_interval)
-            batch_job = await loop.run_in_executor(None, _get_batch_job)
-            current_state = batch_job.state.name if batch_job.state else "UNKNOWN"
-
-        return self._extract_batch_results(batch_job)
-
     def list_batch_jobs(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
         List recent batch jobs.
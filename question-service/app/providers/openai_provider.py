@@ -2,15 +2,15 @@
 
 import json
 import logging
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Dict, List, Optional
 
 import openai
 from openai import AsyncOpenAI, OpenAI
 
 from app.observability.cost_tracking import CompletionResult, TokenUsage
 from app.utils.text_utils import safe_json_loads
-from .base import BaseLLMProvider
-
+from .base import BaseLLMProvider, BatchJobResult, batch_request_key
 
 logger = logging.getLogger(__name__)
 
@@ -33,11 +33,17 @@ class OpenAIProvider(BaseLLMProvider):
     _MAX_COMPLETION_TOKENS_MODELS = ("gpt-5", "o1", "o3", "o4")
     _REASONING_TOKEN_MULTIPLIER = 4
 
+    supports_batch = True
+    max_batch_size = 50_000  # OpenAI Batch API limit per input file
+    batch_terminal_states = frozenset({"completed", "failed", "expired", "cancelled"})
+    _BATCH_ENDPOINT = "/v1/chat/completions"
+
     def __init__(
         self,
         api_key: str,
         model: str = "gpt-4o",
         organization: Optional[str] = None,
+        base_url: Optional[str] = None,
     ):
         """
         Initialize OpenAI provider.
@@ -46,10 +52,15 @@ class OpenAIProvider(BaseLLMProvider):
             api_key: OpenAI API key
             model: Model to use (default: gpt-4o)
             organization: Optional organization ID
+            base_url: Optional API base URL (default: the SDK's OpenAI endpoint)
         """
         super().__init__(api_key, model)
-        self.client = OpenAI(api_key=api_key, organization=organization)
-        self.async_client = AsyncOpenAI(api_key=api_key, organization=organization)
+        self.client = OpenAI(
+            api_key=api_key, organization=organization, base_url=base_url
+        )
+        self.async_client = AsyncOpenAI(
+            api_key=api_key, organization=organization, base_url=base_url
+        )
 
     def _uses_max_completion_tokens(self, model: str) -> bool:
         """Check if a model requires max_completion_tokens instead of max_tokens."""
@@ -71,11 +82,18 @@ class OpenAIProvider(BaseLLMProvider):
         that consumes the completion token budget. The requested max_tokens
         is multiplied to leave room for both reasoning and output.
         """
+        limit = self.effective_output_limit(max_tokens, model)
         if self._uses_max_completion_tokens(model):
-            return {
-                "max_completion_tokens": max_tokens * self._REASONING_TOKEN_MULTIPLIER,
-            }
-        return {"max_tokens": max_tokens}
+            return {"max_completion_tokens": limit}
+        return {"max_tokens": limit}
+
+    def effective_output_limit(
+        self, max_tokens: int, model: Optional[str] = None
+    ) -> int:
+        """Output token limit sent for max_tokens, widened for reasoning models."""
+        if self._uses_max_completion_tokens(model or self.model):
+            return max_tokens * self._REASONING_TOKEN_MULTIPLIER
+        return max_tokens
 
     def generate_completion(
         self,
@@ -451,6 +469,166 @@ class OpenAIProvider(BaseLLMProvider):
 
         return await self._execute_with_retry_async(_make_request)
 
+    # -------------------------------------------------------------------------
+    # Batch API Methods
+    # -------------------------------------------------------------------------
+
+    def create_batch_job(
+        self,
+        prompts: List[str],
+        model_override: Optional[str] = None,
+        display_name: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4000,
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        Upload prompts as a JSONL input file and create a Batch API job.
+
+        Args:
+            prompts: List of prompts to process (max 50,000 prompts)
+            model_override: Optional model to use instead of the provider's default
+            display_name: Optional display name, stored in the batch metadata
+            temperature: Sampling temperature for generation
+            max_tokens: Maximum tokens per response
+            response_format: When not None, request JSON object responses
+
+        Returns:
+            The batch job ID for tracking
+
+        Raises:
+            ValueError: If prompts list is empty or exceeds maximum size
+            LLMProviderError: If the upload or batch creation fails
+        """
+        self._validate_batch_prompts(prompts)
+        model = model_override or self.model
+
+        lines = []
+        for i, prompt in enumerate(prompts):
+            body: Dict[str, Any] = {
+                "model": model,
+                "messages": [
+                    {
+                        "role": "user",
+                        "content": _structured_prompt(prompt, response_format or {}),
+                    }
+                ],
+                "temperature": temperature,
+                **self._token_limit_kwargs(model, max_tokens),
+            }
+            if response_format is not None:
+                body["response_format"] = {"type": "json_object"}
+            lines.append(
+                json.dumps(
+                    {
+                        "custom_id": batch_request_key(i),
+                        "method": "POST",
+                        "url": self._BATCH_ENDPOINT,
+                        "body": body,
+                    }
+                )
+            )
+
+        job_display_name = display_name or f"question-service-batch-{int(time.time())}"
+        try:
+            input_file = self.client.files.create(
+                file=(f"{job_display_name}.jsonl", "\n".join(lines).encode("utf-8")),
+                purpose="batch",
+            )
+            batch = self.client.batches.create(
+                input_file_id=input_file.id,
+                endpoint=self._BATCH_ENDPOINT,
+                completion_window="24h",
+                metadata={"display_name": job_display_name, "model": model},
+            )
+        except openai.OpenAIError as e:
+            raise self._handle_api_error(e)
+
+        logger.info(f"Created batch job: {batch.id} with {len(prompts)} requests")
+        return batch.id
+
+    def get_batch_job_status(self, job_name: str) -> str:
+        """
+        Get the status of a batch job.
+
+        Args:
+            job_name: The batch job ID
+
+        Returns:
+            Batch status (e.g., 'in_progress', 'completed', 'failed')
+        """
+        return self.client.batches.retrieve(job_name).status
+
+    def get_batch_job_results(self, job_name: str) -> BatchJobResult:
+        """
+        Download and parse the output and error files of a finished batch job.
+
+        Args:
+            job_name: The batch job ID
+
+        Returns:
+            BatchJobResult with all responses, errors and batch-priced token usage
+        """
+        batch = self.client.batches.retrieve(job_name)
+        result = BatchJobResult(job_name=job_name, state=batch.status)
+        # Price usage as the model the job was created for; the response body
+        # names the dated snapshot that served it
+        model = (batch.metadata or {}).get("model") or self.model
+
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            for line in self.client.files.content(file_id).text.splitlines():
+                if line.strip():
+                    self._add_batch_output_line(result, json.loads(line), model)
+
+        if batch.status != "completed" and not result.responses:
+            result.errors.append(f"Job ended with state: {batch.status}")
+        return result
+
+    def _add_batch_output_line(
+        self, result: BatchJobResult, record: Dict[str, Any], model: str
+    ) -> None:
+        """Record one line of a batch output or error file in result."""
+        key = record.get("custom_id", "")
+        response = record.get("response") or {}
+        body = response.get("body") or {}
+        result.total_requests += 1
+
+        usage = body.get("usage")
+        if usage:
+            result.token_usage.append(
+                TokenUsage(
+                    input_tokens=usage.get("prompt_tokens", 0),
+                    output_tokens=usage.get("completion_tokens", 0),
+                    model=model,
+                    provider=self.get_provider_name(),
+                    batch=True,
+                )
+            )
+
+        if response.get("status_code") == 200 and body.get("choices"):
+            text = body["choices"][0].get("message", {}).get("content")
+            if text:
+                result.responses.append({"text": text, "key": key})
+                result.successful_requests += 1
+                return
+            result.errors.append(f"Response {key} has empty content")
+        else:
+            error = record.get("error") or body.get("error") or response
+            result.errors.append(f"Request {key} failed: {error}")
+        result.failed_requests += 1
+
+    def cancel_batch_job(self, job_name: str) -> None:
+        """
+        Cancel a running batch job.
+
+        Args:
+            job_name: The batch job ID to cancel
+        """
+        self.client.batches.cancel(job_name)
+        logger.info(f"Cancelled batch job: {job_name}")
+
     def get_available_models(self) -> list[str]:
         """
         Get list of known OpenAI models loaded from config/models.yaml.
@@ -15,6 +15,9 @@ from app.data.models import (
 # Minimum score threshold for reclassification eligibility (validity, clarity, formatting)
 MIN_SCORE_FOR_RECLASSIFICATION = 0.6
 
+# Maximum rejected questions regenerated with judge feedback per run (limits API costs)
+MAX_REGENERATIONS_PER_RUN = 5
+
 
 def attempt_answer_repair(
     evaluated_question,
@@ -211,6 +214,56 @@ def attempt_difficulty_reclassification(
     return (reclassified, new_difficulty, reason)
 
 
+def attempt_local_salvage(
+    evaluated_question,
+    logger: logging.Logger,
+) -> Optional[GeneratedQuestion]:
+    """Try answer repair, then difficulty reclassification, on a rejected question.
+
+    Neither step calls an LLM.
+
+    Args:
+        evaluated_question: The EvaluatedQuestion that was rejected
+        logger: Logger instance
+
+    Returns:
+        The repaired or reclassified question, or None if neither applies
+    """
+    repair_result = attempt_answer_repair(evaluated_question, logger)
+    if repair_result:
+        repaired_question, reason = repair_result
+        logger.info(f"  ✓ REPAIRED: {reason}")
+        logger.info(f"    Question: {repaired_question.question_text[:60]}...")
+        return repaired_question
+
+    reclass_result = attempt_difficulty_reclassification(evaluated_question, logger)
+    if reclass_result:
+        reclassified_question, new_difficulty, reason = reclass_result
+        logger.info(f"  ✓ RECLASSIFIED: {reason}")
+        logger.info(f"    Question: {reclassified_question.question_text[:60]}...")
+        return reclassified_question
+
+    return None
+
+
+def build_salvaged_evaluation(question: GeneratedQuestion) -> EvaluatedQuestion:
+    """Wrap a repaired or reclassified question as an approved EvaluatedQuestion."""
+    return EvaluatedQuestion(
+        question=question,
+        evaluation=EvaluationScore(
+            clarity_score=0.8,
+            difficulty_score=0.8,
+            validity_score=0.8,
+            formatting_score=0.8,
+            creativity_score=0.6,
+            overall_score=0.75,
+            feedback="Salvaged question (repaired or reclassified)",
+        ),
+        judge_model="salvage",
+        approved=True,
+    )
+
+
 async def attempt_regeneration_with_feedback(
     rejected_questions: list,
     generator,
@@ -322,23 +375,11 @@ def run_salvage_phase(
     still_rejected = []
 
     for rejected in rejected_questions:
-        repair_result = attempt_answer_repair(rejected, logger)
-        if repair_result:
-            repaired_question, reason = repair_result
-            salvaged_questions.append(repaired_question)
-            logger.info(f"  ✓ REPAIRED: {reason}")
-            logger.info(f"    Question: {repaired_question.question_text[:60]}...")
-            continue
-
-        reclass_result = attempt_difficulty_reclassification(rejected, logger)
-        if reclass_result:
-            reclassified_question, new_difficulty, reason = reclass_result
-            salvaged_questions.append(reclassified_question)
-            logger.info(f"  ✓ RECLASSIFIED: {reason}")
-            logger.info(f"    Question: {reclassified_question.question_text[:60]}...")
-            continue
-
-        still_rejected.append(rejected)
+        salvaged_question = attempt_local_salvage(rejected, logger)
+        if salvaged_question is not None:
+            salvaged_questions.append(salvaged_question)
+        else:
+            still_rejected.append(rejected)
 
     regenerated_count = 0
     if still_rejected:
@@ -354,7 +395,7 @@ def run_salvage_phase(
                 judge=judge,
                 min_score=min_score,
                 logger=logger,
-                max_regenerations=min(len(still_rejected), 5),
+                max_regenerations=min(len(still_rejected), MAX_REGENERATIONS_PER_RUN),
             )
 
         try:
@@ -380,21 +421,7 @@ def run_salvage_phase(
             f"still rejected: {len(still_rejected)})"
         )
         for sq in salvaged_questions:
-            salvaged_eval = EvaluatedQuestion(
-                question=sq,
-                evaluation=EvaluationScore(
-                    clarity_score=0.8,
-                    difficulty_score=0.8,
-                    validity_score=0.8,
-                    formatting_score=0.8,
-                    creativity_score=0.6,
-                    overall_score=0.75,
-                    feedback="Salvaged question (repaired or reclassified)",
-                ),
-                judge_model="salvage",
-                approved=True,
-            )
-            new_approved.append(salvaged_eval)
+            new_approved.append(build_salvaged_evaluation(sq))
 
     approval_rate = (
         len(new_approved) / len(generated_questions) * 100
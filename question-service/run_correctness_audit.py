@@ -5,12 +5,17 @@ Runs the adversarial blind-solve verification audit independently of question
 generation.  Can be scheduled on its own cadence (e.g. weekly full sweep)
 without triggering the generation pipeline.
 
+Questions are verified concurrently and results are committed in small
+batches.  If a run is interrupted, re-running the command resumes from the
+checkpoint file instead of starting over.
+
 Exit Codes:
     0 - Success
     1 - Configuration / runtime error
 """
 
 import argparse
+import asyncio
 import logging
 import sys
 from pathlib import Path
@@ -45,6 +50,31 @@ def parse_arguments() -> argparse.Namespace:
         help="Skip questions audited within this many hours (incremental mode). "
         "Questions never audited are always included.",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=settings.audit_concurrency,
+        help="Questions verified concurrently (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--provider-concurrency",
+        type=int,
+        default=settings.audit_provider_concurrency,
+        help="Concurrent verifications per judge provider (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--commit-batch-size",
+        type=int,
+        default=settings.audit_commit_batch_size,
+        help="Audited questions committed per transaction (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--checkpoint-file",
+        type=Path,
+        default=Path(settings.audit_checkpoint_path),
+        help="Progress file used to resume an interrupted audit "
+        "(default: %(default)s).",
+    )
     parser.add_argument(
         "--verbose", action="store_true", help="Enable DEBUG-level logging."
     )
@@ -90,6 +120,7 @@ def main() -> int:
         anthropic_api_key=settings.anthropic_api_key,
         google_api_key=settings.google_api_key,
         xai_api_key=settings.xai_api_key,
+        max_concurrent_evaluations=args.concurrency,
     )
     logger.info("Judge initialized")
 
@@ -108,16 +139,25 @@ def main() -> int:
     # Run audit
     try:
         from app.data.answer_correctness_auditor import (  # noqa: PLC0415
-            run_answer_correctness_audit,
+            run_answer_correctness_audit_async,
         )
 
-        results = run_answer_correctness_audit(
-            db.SessionLocal,
-            judge,
-            judge.judge_config,
-            max_questions=args.max_questions,
-            audit_window_hours=args.audit_window_hours,
-        )
+        async def _run_audit() -> dict:
+            # Close the judge's async provider clients on the same event loop
+            async with judge:
+                return await run_answer_correctness_audit_async(
+                    db.SessionLocal,
+                    judge,
+                    judge.judge_config,
+                    max_questions=args.max_questions,
+                    audit_window_hours=args.audit_window_hours,
+                    concurrency=args.concurrency,
+                    default_provider_concurrency=args.provider_concurrency,
+                    commit_batch_size=args.commit_batch_size,
+                    checkpoint_path=args.checkpoint_file,
+                )
+
+        results = asyncio.run(_run_audit())
 
         logger.info(
             "Audit complete: scanned=%d verified=%d failed=%d deactivated=%d",
@@ -8,6 +8,12 @@ Coordinates the five generation phases by delegating to dedicated phase modules:
 - app.data.dedup_runner  — Phase 3: deduplication
 - app.data.insertion_runner — Phase 4: database insertion
 
+With --stream, app.generation.streaming_runner runs the same phases as
+overlapped stages connected by bounded queues instead.
+
+create_generation_worker() builds the components once for a long-lived
+app.generation.worker.GenerationWorker (used by trigger_server.py in warm mode).
+
 Can be invoked by any scheduler (cron, cloud scheduler, manual).
 
 Exit Codes:
@@ -25,7 +31,7 @@ import sys
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
@@ -65,6 +71,17 @@ from app.reporting.reporter import RunReporter  # noqa: E402
 from app.data.insertion_runner import run_insertion_phase  # noqa: E402
 from app.data.dedup_runner import run_dedup_phase  # noqa: E402
 from app.generation.runner import GenerationStats, run_generation_phase  # noqa: E402
+from app.generation.streaming_runner import (  # noqa: E402
+    DEFAULT_STREAM_QUEUE_SIZE,
+    run_streaming_pipeline,
+)
+from app.generation.worker import (  # noqa: E402
+    DEFAULT_MAX_CONCURRENT_JOBS,
+    DEFAULT_MAX_QUEUED_JOBS,
+    GenerationJob,
+    GenerationWorker,
+    JobStatus,
+)
 from app.evaluation.runner import run_judge_phase  # noqa: E402
 from app.salvage.runner import run_salvage_phase  # noqa: E402
 from app.observability.cost_tracking import get_cost_tracker  # noqa: E402
@@ -147,9 +164,12 @@ def log_success_run(
     print(f"SUCCESS_RUN: {json.dumps(success_entry)}", flush=True)
 
 
-def parse_arguments() -> argparse.Namespace:
+def parse_arguments(argv: Optional[list[str]] = None) -> argparse.Namespace:
     """Parse command-line arguments.
 
+    Args:
+        argv: Arguments to parse instead of sys.argv[1:]
+
     Returns:
         Parsed arguments namespace
     """
@@ -185,6 +205,12 @@ Examples:
   # Use both async generation and async judge evaluation
   python run_generation.py --async --async-judge
 
+  # Submit judge evaluations as provider batch jobs (cheaper, slower)
+  python run_generation.py --batch-judge
+
+  # Stream each question through judge, dedup and insertion as soon as it is generated
+  python run_generation.py --stream
+
   # Auto-balance generation based on inventory gaps
   python run_generation.py --auto-balance
 
@@ -288,6 +314,14 @@ Examples:
         help="Use async parallel judge evaluation for improved performance",
     )
 
+    parser.add_argument(
+        "--batch-judge",
+        dest="use_batch_judge",
+        action="store_true",
+        help="Submit judge evaluations as provider batch jobs (OpenAI, Anthropic, "
+        "Google); failed batch items are re-evaluated individually",
+    )
+
     parser.add_argument(
         "--max-concurrent-judge",
         type=int,
@@ -302,6 +336,22 @@ Examples:
         help="Timeout in seconds for async judge API calls (default: 60)",
     )
 
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Run generation, judge evaluation, deduplication and insertion as "
+        "overlapped stages connected by bounded queues, so questions are inserted "
+        "as soon as they pass (implies async generation and judge evaluation)",
+    )
+
+    parser.add_argument(
+        "--stream-queue-size",
+        type=int,
+        default=DEFAULT_STREAM_QUEUE_SIZE,
+        help="Questions buffered between stages in --stream mode before the "
+        f"upstream stage waits (default: {DEFAULT_STREAM_QUEUE_SIZE})",
+    )
+
     parser.add_argument(
         "--auto-balance",
         action="store_true",
@@ -381,7 +431,7 @@ Examples:
         "Requires --run-correctness-audit.",
     )
 
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
 def create_run_reporter(
@@ -564,6 +614,7 @@ def _init_components(
             database_url=settings.database_url,
             openai_api_key=settings.openai_api_key,
             google_api_key=settings.google_api_key,
+            embedding_encoding=settings.embedding_storage_encoding,
         )
         logger.info("✓ Database connected")
 
@@ -581,6 +632,8 @@ def _init_components(
         )
         cache_type = "Redis" if deduplicator.using_redis_cache else "in-memory"
         logger.info(f"✓ Deduplicator initialized (cache: {cache_type})")
+        # Let insertion reuse embeddings computed during dedup
+        db.embedding_cache = deduplicator.embedding_cache
     except Exception as e:
         logger.error(f"Failed to connect to database: {e}")
         observability.capture_error(
@@ -604,6 +657,81 @@ def _init_components(
     return pipeline, judge, db, deduplicator
 
 
+def create_generation_worker(
+    max_concurrent_jobs: int = DEFAULT_MAX_CONCURRENT_JOBS,
+    max_queued_jobs: int = DEFAULT_MAX_QUEUED_JOBS,
+    on_job_finished: Optional[Callable[[GenerationJob], None]] = None,
+) -> GenerationWorker:
+    """Initialize pipeline components once and wrap them in a GenerationWorker.
+
+    Jobs run like ``run_generation.py --async --async-judge --stream`` with
+    default options. Each job that ran is reported to the backend API when
+    run reporting is configured, then passed to on_job_finished.
+
+    Raises:
+        RuntimeError: On configuration or database errors (alerts are sent)
+    """
+    logger = logging.getLogger(__name__)
+    args = parse_arguments(["--async", "--async-judge", "--stream"])
+
+    alert_manager = AlertManager(
+        alert_file_path=settings.alert_file_path,
+        discord_webhook_url=settings.discord_webhook_url,
+    )
+    get_circuit_breaker_registry().set_on_open_callback(
+        alert_manager.send_circuit_breaker_alert
+    )
+
+    pipeline, judge, db, deduplicator = _init_components(
+        args, alert_manager, "generation-worker", logger
+    )
+    run_reporter = create_run_reporter(logger)
+    min_score = args.min_score or settings.min_judge_score
+
+    def _job_finished(job: GenerationJob) -> None:
+        if run_reporter:
+            inserted_count = job.result.inserted_count if job.result else 0
+            if job.status is JobStatus.SUCCEEDED and inserted_count == len(
+                job.result.unique_questions
+            ):
+                exit_code = EXIT_SUCCESS
+            elif inserted_count > 0:
+                exit_code = EXIT_PARTIAL_FAILURE
+            else:
+                exit_code = EXIT_COMPLETE_FAILURE
+            backend_run_id = run_reporter.report_run(
+                summary=job.summary,
+                exit_code=exit_code,
+                environment=settings.env,
+                triggered_by=args.triggered_by,
+                prompt_version=settings.prompt_version,
+                judge_config_version=settings.judge_config_version,
+                min_judge_score_threshold=min_score,
+                client_run_id=job.job_id,
+            )
+            if not backend_run_id:
+                logger.warning(f"Failed to report job {job.job_id} to backend API")
+        if on_job_finished is not None:
+            on_job_finished(job)
+
+    return GenerationWorker(
+        pipeline=pipeline,
+        judge=judge,
+        db=db,
+        deduplicator=deduplicator,
+        min_score=min_score,
+        max_concurrent=args.max_concurrent,
+        timeout=args.timeout,
+        max_concurrent_judge=args.max_concurrent_judge,
+        provider_tier=args.provider_tier,
+        skip_deduplication=args.skip_deduplication,
+        queue_size=args.stream_queue_size,
+        max_concurrent_jobs=max_concurrent_jobs,
+        max_queued_jobs=max_queued_jobs,
+        on_job_finished=_job_finished,
+    )
+
+
 def main() -> int:
     """Main entry point for question generation script.
 
@@ -725,23 +853,59 @@ def main() -> int:
                         {"questions_generated": 0, "reason": "inventory_balanced"}
                     )
 
-            # Phase 1: Question Generation
-            logger.info("\n" + "=" * 80)
-            logger.info("PHASE 1: Question Generation")
-            logger.info("=" * 80)
-            generated_questions, stats = run_generation_phase(
-                pipeline=pipeline,
-                generation_plan=generation_plan,
-                question_types=question_types,
-                difficulty_distribution=difficulty_distribution,
-                use_async=args.use_async,
-                max_concurrent=args.max_concurrent,
-                timeout=args.timeout,
-                provider_tier=args.provider_tier,
-                count=args.count,
-                metrics=metrics,
-                logger=logger,
-            )
+            min_score = args.min_score or settings.min_judge_score
+
+            if args.stream:
+                # Phases 1-4 overlapped: generation → judge → dedup → insertion
+                logger.info("\n" + "=" * 80)
+                logger.info(
+                    "STREAMING PIPELINE: Generation → Judge → Dedup → Insertion"
+                )
+                logger.info("=" * 80)
+                logger.info(f"Minimum approval score: {min_score}")
+                streamed = run_streaming_pipeline(
+                    pipeline=pipeline,
+                    judge=judge,
+                    db=db,
+                    deduplicator=deduplicator,
+                    generation_plan=generation_plan,
+                    question_types=question_types,
+                    difficulty_distribution=difficulty_distribution,
+                    max_concurrent=args.max_concurrent,
+                    timeout=args.timeout,
+                    provider_tier=args.provider_tier,
+                    count=args.count,
+                    min_score=min_score,
+                    max_concurrent_judge=args.max_concurrent_judge,
+                    skip_deduplication=args.skip_deduplication,
+                    metrics=metrics,
+                    logger=logger,
+                    queue_size=args.stream_queue_size,
+                )
+                generated_questions = streamed.generated_questions
+                stats = streamed.stats
+                approved_questions = streamed.approved_questions
+                approval_rate = streamed.approval_rate
+                unique_questions = streamed.unique_questions
+                inserted_count = streamed.inserted_count
+            else:
+                # Phase 1: Question Generation
+                logger.info("\n" + "=" * 80)
+                logger.info("PHASE 1: Question Generation")
+                logger.info("=" * 80)
+                generated_questions, stats = run_generation_phase(
+                    pipeline=pipeline,
+                    generation_plan=generation_plan,
+                    question_types=question_types,
+                    difficulty_distribution=difficulty_distribution,
+                    use_async=args.use_async,
+                    max_concurrent=args.max_concurrent,
+                    timeout=args.timeout,
+                    provider_tier=args.provider_tier,
+                    count=args.count,
+                    metrics=metrics,
+                    logger=logger,
+                )
 
             if not generated_questions:
                 logger.error("No questions generated!")
@@ -761,37 +925,40 @@ def main() -> int:
                 )
                 raise RuntimeError("No questions generated")
 
-            # Phase 2: Judge Evaluation
-            logger.info("\n" + "=" * 80)
-            logger.info("PHASE 2: Judge Evaluation")
-            logger.info("=" * 80)
-            min_score = args.min_score or settings.min_judge_score
-            logger.info(f"Minimum approval score: {min_score}")
-
-            approved_questions, rejected_questions, approval_rate = run_judge_phase(
-                generated_questions=generated_questions,
-                judge=judge,
-                min_score=min_score,
-                use_async_judge=args.use_async_judge,
-                metrics=metrics,
-                logger=logger,
-            )
+            if not args.stream:
+                # Phase 2: Judge Evaluation
+                logger.info("\n" + "=" * 80)
+                logger.info("PHASE 2: Judge Evaluation")
+                logger.info("=" * 80)
+                logger.info(f"Minimum approval score: {min_score}")
 
-            # Salvage Phase
-            if rejected_questions:
-                logger.info("\n" + "-" * 40)
-                logger.info("SALVAGE PHASE: Attempting to recover rejected questions")
-                logger.info("-" * 40)
-                approved_questions, approval_rate = run_salvage_phase(
-                    rejected_questions=rejected_questions,
-                    approved_questions=approved_questions,
+                approved_questions, rejected_questions, approval_rate = run_judge_phase(
                     generated_questions=generated_questions,
-                    pipeline=pipeline,
                     judge=judge,
                     min_score=min_score,
+                    use_async_judge=args.use_async_judge,
+                    metrics=metrics,
                     logger=logger,
+                    use_batch_judge=args.use_batch_judge,
                 )
 
+                # Salvage Phase
+                if rejected_questions:
+                    logger.info("\n" + "-" * 40)
+                    logger.info(
+                        "SALVAGE PHASE: Attempting to recover rejected questions"
+                    )
+                    logger.info("-" * 40)
+                    approved_questions, approval_rate = run_salvage_phase(
+                        rejected_questions=rejected_questions,
+                        approved_questions=approved_questions,
+                        generated_questions=generated_questions,
+                        pipeline=pipeline,
+                        judge=judge,
+                        min_score=min_score,
+                        logger=logger,
+                    )
+
             if not approved_questions:
                 logger.warning("No questions passed judge evaluation!")
                 send_phase_alert(
@@ -810,32 +977,33 @@ def main() -> int:
                 )
                 raise RuntimeError("No questions passed judge evaluation")
 
-            # Phase 3: Deduplication
-            unique_questions = approved_questions
-            if not args.skip_deduplication:
-                logger.info("\n" + "=" * 80)
-                logger.info("PHASE 3: Deduplication")
-                logger.info("=" * 80)
-                unique_questions = run_dedup_phase(
-                    approved_questions=approved_questions,
-                    db=db,
-                    deduplicator=deduplicator,
-                    metrics=metrics,
-                    logger=logger,
-                )
+            if not args.stream:
+                # Phase 3: Deduplication
+                unique_questions = approved_questions
+                if not args.skip_deduplication:
+                    logger.info("\n" + "=" * 80)
+                    logger.info("PHASE 3: Deduplication")
+                    logger.info("=" * 80)
+                    unique_questions = run_dedup_phase(
+                        approved_questions=approved_questions,
+                        db=db,
+                        deduplicator=deduplicator,
+                        metrics=metrics,
+                        logger=logger,
+                    )
 
-            # Phase 4: Database Insertion
-            inserted_count = 0
-            if unique_questions:
-                logger.info("\n" + "=" * 80)
-                logger.info("PHASE 4: Database Insertion")
-                logger.info("=" * 80)
-                inserted_count = run_insertion_phase(
-                    unique_questions=unique_questions,
-                    db=db,
-                    metrics=metrics,
-                    logger=logger,
-                )
+                # Phase 4: Database Insertion
+                inserted_count = 0
+                if unique_questions:
+                    logger.info("\n" + "=" * 80)
+                    logger.info("PHASE 4: Database Insertion")
+                    logger.info("=" * 80)
+                    inserted_count = run_insertion_phase(
+                        unique_questions=unique_questions,
+                        db=db,
+                        metrics=metrics,
+                        logger=logger,
+                    )
 
             # Final Summary
             metrics.end_run()
@@ -53,6 +53,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from gioe_libs.alerting.alerting import AlertManager  # noqa: E402
 from app.config.config import settings  # noqa: E402
+from app.data.database import DEDUP_FIELDS  # noqa: E402
 from app.data.database import DatabaseService as QuestionDatabase  # noqa: E402
 from app.data.deduplicator import QuestionDeduplicator  # noqa: E402
 from app.infrastructure.error_classifier import (  # noqa: E402
@@ -984,6 +985,7 @@ class BootstrapInventory:
         db = QuestionDatabase(
             database_url=settings.database_url,
             openai_api_key=settings.openai_api_key,
+            embedding_encoding=settings.embedding_storage_encoding,
         )
         self.logger.info("✓ Database connected")
 
@@ -1025,7 +1027,7 @@ class BootstrapInventory:
             return []
 
         try:
-            questions = self.database.get_all_questions()
+            questions = list(self.database.iter_questions(DEDUP_FIELDS))
             self.logger.info(
                 f"Loaded {len(questions)} existing questions for deduplication"
             )
@@ -2054,6 +2056,8 @@ class BootstrapInventory:
             if not self.config.skip_deduplication:
                 try:
                     self.deduplicator = self._initialize_deduplicator()
+                    # Let insertion reuse embeddings computed during dedup
+                    self.database.embedding_cache = self.deduplicator.embedding_cache
                     # Load existing questions for deduplication
                     self.existing_questions = self._load_existing_questions()
                 except Exception as e:
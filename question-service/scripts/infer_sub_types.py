@@ -51,6 +51,15 @@ from gioe_libs.structured_logging import setup_logging  # noqa: E402
 from app.data.models import QuestionType  # noqa: E402
 from app.generation.prompts import QUESTION_SUBTYPES  # noqa: E402
 
+# Question fields read by the classifier (no embeddings or timestamps)
+CLASSIFICATION_FIELDS = (
+    "id",
+    "question_text",
+    "question_type",
+    "answer_options",
+    "inferred_sub_type",
+)
+
 # Exit codes
 EXIT_SUCCESS = 0
 EXIT_PARTIAL_FAILURE = 1
@@ -341,34 +350,28 @@ def main() -> int:
 
         logger.info("Database connected")
 
-        # Fetch questions
-        logger.info("Fetching questions from database...")
-        all_questions = db.get_all_questions()
-        logger.info(f"Found {len(all_questions)} total questions")
-
-        # Filter: active only
-        questions = [q for q in all_questions if q.get("is_active", True)]
-        logger.info(f"Active questions: {len(questions)}")
+        # Fetch active questions, reading only the fields used here
+        logger.info("Fetching active questions from database...")
+        questions = [
+            q
+            for question_type in args.types or [None]
+            for q in db.iter_questions(
+                CLASSIFICATION_FIELDS,
+                question_type=question_type,
+                active_only=True,
+            )
+        ]
+        # Keep id order across the per-type queries for the limit
+        questions.sort(key=lambda q: q["id"])
+        logger.info(
+            f"Found {len(questions)} active questions "
+            f"(types={args.types or 'all'})"
+        )
 
         # Filter: only those missing inferred_sub_type
         questions = [q for q in questions if not q.get("inferred_sub_type")]
         logger.info(f"Questions without inferred_sub_type: {len(questions)}")
 
-        # Filter by question type if specified
-        if args.types:
-            type_values = args.types
-            questions = [
-                q
-                for q in questions
-                if (
-                    q["question_type"].value
-                    if hasattr(q["question_type"], "value")
-                    else q["question_type"]
-                )
-                in type_values
-            ]
-            logger.info(f"After type filter: {len(questions)}")
-
         # Apply limit
         if args.limit:
             questions = questions[: args.limit]
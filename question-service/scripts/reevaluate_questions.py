@@ -49,6 +49,23 @@ from app.data.models import (  # noqa: E402
     QuestionType,
 )
 
+# Question fields read by the re-evaluation (no embeddings or timestamps)
+REEVALUATION_FIELDS = (
+    "id",
+    "question_text",
+    "question_type",
+    "difficulty_level",
+    "correct_answer",
+    "answer_options",
+    "explanation",
+    "stimulus",
+    "sub_type",
+    "metadata",
+    "source_llm",
+    "source_model",
+    "judge_score",
+)
+
 # Exit codes
 EXIT_SUCCESS = 0
 EXIT_PARTIAL_FAILURE = 1
@@ -364,44 +381,26 @@ def main() -> int:
 
         logger.info("Database connected")
 
-        # Fetch questions to re-evaluate
-        logger.info("Fetching questions from database...")
-        all_questions = db.get_all_questions()
-        logger.info(f"Found {len(all_questions)} total questions")
-
-        # Filter by active status
-        questions = [q for q in all_questions if q.get("is_active", True)]
-        logger.info(f"Active questions: {len(questions)}")
-
-        # Filter by question type if specified
-        if args.types:
-            type_values = args.types
-            questions = [
-                q
-                for q in questions
-                if (
-                    q["question_type"].value
-                    if hasattr(q["question_type"], "value")
-                    else q["question_type"]
-                )
-                in type_values
-            ]
-            logger.info(f"After type filter: {len(questions)}")
-
-        # Filter by difficulty if specified
-        if args.difficulties:
-            diff_values = args.difficulties
-            questions = [
-                q
-                for q in questions
-                if (
-                    q["difficulty_level"].value
-                    if hasattr(q["difficulty_level"], "value")
-                    else q["difficulty_level"]
-                )
-                in diff_values
-            ]
-            logger.info(f"After difficulty filter: {len(questions)}")
+        # Fetch questions to re-evaluate, reading only the fields used here
+        logger.info("Fetching active questions from database...")
+        questions = [
+            q
+            for question_type in args.types or [None]
+            for difficulty in args.difficulties or [None]
+            for q in db.iter_questions(
+                REEVALUATION_FIELDS,
+                difficulty=difficulty,
+                question_type=question_type,
+                active_only=True,
+            )
+        ]
+        # Keep id order across the per-type/difficulty queries for offset/limit
+        questions.sort(key=lambda q: q["id"])
+        logger.info(
+            f"Found {len(questions)} active questions "
+            f"(types={args.types or 'all'}, "
+            f"difficulties={args.difficulties or 'all'})"
+        )
 
         # Apply offset and limit
         if args.offset > 0:
@@ -1,10 +1,16 @@
 """Tests for the answer correctness auditor."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import json
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from app.data.answer_correctness_auditor import run_answer_correctness_audit
+from app.data.answer_correctness_auditor import (
+    run_answer_correctness_audit,
+    run_answer_correctness_audit_async,
+)
 from app.data.answer_leakage_auditor import MIN_ACTIVE_PER_BUCKET
 
 
@@ -267,3 +273,167 @@ class TestRunAnswerCorrectnessAudit:
         # Two filter calls: is_active + audit_window cutoff
         query_mock = session.query.return_value
         assert query_mock.filter.call_count >= 1
+
+
+def _build_async_factory(active_questions: list, bucket_size: int) -> tuple:
+    """Return (session_factory, session_mock) for the async audit engine.
+
+    Candidate queries resolve to ``active_questions``; the per-bucket count
+    query reports ``bucket_size`` active math/easy questions.
+    """
+    factory, session = _build_factory(active_questions)
+    terminal = session.query.return_value.filter.return_value
+    terminal.group_by.return_value.all.return_value = [("math", "easy", bucket_size)]
+    return factory, session
+
+
+def _make_async_judge(results: list) -> MagicMock:
+    judge = _make_judge()
+    judge.verify_answer_async = AsyncMock(side_effect=results)
+    return judge
+
+
+class TestRunAnswerCorrectnessAuditAsync:
+    async def test_counts_match_sync_engine(self):
+        questions = [_make_question(q_id=i) for i in range(MIN_ACTIVE_PER_BUCKET + 1)]
+        factory, session = _build_async_factory(questions, len(questions))
+        judge = _make_async_judge(
+            [(False, {"outcome": "concession"})]
+            + [(True, {"outcome": "pass"})] * MIN_ACTIVE_PER_BUCKET
+        )
+
+        result = await run_answer_correctness_audit_async(
+            factory, judge, _make_judge_config(), commit_batch_size=4
+        )
+
+        assert result["scanned"] == len(questions)
+        assert result["verified_correct"] == MIN_ACTIVE_PER_BUCKET
+        assert result["failed"] == 1
+        assert result["deactivated"] == 1
+        assert judge.verify_answer.call_count == 0
+
+    async def test_commits_in_batches_with_short_sessions(self):
+        questions = [_make_question(q_id=i) for i in range(10)]
+        factory, session = _build_async_factory(questions, 100)
+        judge = _make_async_judge([(True, {"outcome": "pass"})] * 10)
+
+        await run_answer_correctness_audit_async(
+            factory, judge, _make_judge_config(), concurrency=1, commit_batch_size=3
+        )
+
+        # 4 audit batches (3+3+3+1) + record_pipeline_run + persisted audit run
+        assert session.commit.call_count == 6
+        assert session.close.call_count == factory.call_count
+
+    async def test_bucket_safety_prevents_deactivation(self):
+        questions = [_make_question(q_id=i) for i in range(3)]
+        factory, session = _build_async_factory(questions, MIN_ACTIVE_PER_BUCKET)
+        judge = _make_async_judge([(False, {"outcome": "defense_rejected"})] * 3)
+
+        result = await run_answer_correctness_audit_async(
+            factory, judge, _make_judge_config()
+        )
+
+        assert result["failed"] == 3
+        assert result["deactivated"] == 0
+
+    async def test_error_is_fail_open_and_not_stamped(self):
+        questions = [_make_question(q_id=1), _make_question(q_id=2)]
+        factory, session = _build_async_factory(questions, 100)
+        judge = _make_async_judge(
+            [RuntimeError("provider down"), (True, {"outcome": "pass"})]
+        )
+
+        result = await run_answer_correctness_audit_async(
+            factory, judge, _make_judge_config(), concurrency=1
+        )
+
+        assert result["errors"] == 1
+        assert result["verified_correct"] == 1
+        assert result["scanned"] == 2
+        assert {"id": 1, "type": "math", "difficulty": "easy", "outcome": "error"} in (
+            result["details"]
+        )
+
+    async def test_provider_limit_caps_in_flight_verifications(self):
+        questions = [_make_question(q_id=i) for i in range(8)]
+        factory, session = _build_async_factory(questions, 100)
+        in_flight = 0
+        peak = 0
+
+        async def verify(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return True, {"outcome": "pass"}
+
+        judge = _make_judge()
+        judge.verify_answer_async = verify
+
+        result = await run_answer_correctness_audit_async(
+            factory,
+            judge,
+            _make_judge_config(),
+            concurrency=8,
+            provider_concurrency={"openai": 2},
+        )
+
+        assert result["verified_correct"] == 8
+        assert peak == 2
+
+    async def test_resumes_from_checkpoint(self, tmp_path):
+        checkpoint_path = tmp_path / "audit_checkpoint.json"
+        started_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        checkpoint_path.write_text(
+            json.dumps(
+                {
+                    "started_at": started_at.isoformat(),
+                    "progress": {
+                        "scanned": 5,
+                        "verified_correct": 5,
+                        "failed": 0,
+                        "deactivated": 0,
+                        "skipped": 0,
+                        "details": [],
+                    },
+                }
+            )
+        )
+        factory, session = _build_async_factory([_make_question(q_id=9)], 100)
+        judge = _make_async_judge([(True, {"outcome": "pass"})])
+
+        result = await run_answer_correctness_audit_async(
+            factory,
+            judge,
+            _make_judge_config(),
+            max_questions=6,
+            checkpoint_path=checkpoint_path,
+        )
+
+        assert result["scanned"] == 6
+        assert result["verified_correct"] == 6
+        # Only the remaining budget is selected
+        session.query.return_value.filter.return_value.limit.assert_called_with(1)
+        assert not checkpoint_path.exists()
+
+    async def test_checkpoint_kept_when_commit_fails(self, tmp_path):
+        checkpoint_path = tmp_path / "audit_checkpoint.json"
+        questions = [_make_question(q_id=i) for i in range(4)]
+        factory, session = _build_async_factory(questions, 100)
+        session.commit.side_effect = [None, RuntimeError("db gone")]
+        judge = _make_async_judge([(True, {"outcome": "pass"})] * 4)
+
+        with pytest.raises(Exception):
+            await run_answer_correctness_audit_async(
+                factory,
+                judge,
+                _make_judge_config(),
+                concurrency=1,
+                commit_batch_size=2,
+                checkpoint_path=checkpoint_path,
+            )
+
+        saved = json.loads(checkpoint_path.read_text())
+        assert saved["progress"]["scanned"] == 2
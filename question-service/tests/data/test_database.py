@@ -1,10 +1,12 @@
 """Tests for database operations."""
 
+import numpy as np
 import pytest
 from unittest.mock import Mock, patch, ANY
 from sqlalchemy.orm import Session
 
-from app.data.database import DatabaseService, PROMPT_VERSION
+from app.data.database import DEDUP_FIELDS, DatabaseService, PROMPT_VERSION
+from app.infrastructure.embedding_codec import encode_embedding
 from app.data.models import (
     DifficultyLevel,
     EvaluatedQuestion,
@@ -90,6 +92,16 @@ def sample_evaluated_memory_question(sample_memory_question):
     )
 
 
+def paged_query(*pages):
+    """Mock a chained session query returning one page per .all() call."""
+    query = Mock()
+    query.filter.return_value = query
+    query.order_by.return_value = query
+    query.limit.return_value = query
+    query.all.side_effect = list(pages)
+    return query
+
+
 @pytest.fixture
 def mock_database_service():
     """Create a mock database service."""
@@ -524,18 +536,18 @@ class TestDatabaseService:
         ]
 
         mock_session = Mock(spec=Session)
-        mock_session.add = Mock()
-        mock_session.commit = Mock()
-        mock_session.new = []
+        mock_session.scalars.return_value = iter([41, 42])
 
         mock_database_service.SessionLocal = Mock(return_value=mock_session)
 
-        with patch("app.data.database.QuestionModel"):
-            question_ids = mock_database_service.insert_evaluated_questions_batch(
-                evaluated_questions
-            )
+        question_ids = mock_database_service.insert_evaluated_questions_batch(
+            evaluated_questions
+        )
 
-        assert isinstance(question_ids, list)
+        assert question_ids == [41, 42]
+        mock_session.scalars.assert_called_once()
+        mock_session.add.assert_not_called()
+        mock_session.commit.assert_called_once()
         mock_session.close.assert_called_once()
 
     def test_insert_evaluated_questions_batch_with_stimulus(
@@ -592,39 +604,105 @@ class TestDatabaseService:
         ]
 
         mock_session = Mock(spec=Session)
-        mock_session.add = Mock()
-        mock_session.commit = Mock()
-        mock_session.new = []
+        mock_session.scalars.return_value = iter([200, 201])
 
         mock_database_service.SessionLocal = Mock(return_value=mock_session)
 
-        captured_models = []
+        mock_database_service.insert_evaluated_questions_batch(evaluated_questions)
 
-        with patch("app.data.database.QuestionModel") as MockQuestionModel:
-            mock_instance = Mock()
-            mock_instance.id = 200
+        # Verify stimulus was preserved for memory question
+        rows = mock_session.scalars.call_args.args[1]
+        assert len(rows) == 2
+        assert rows[0]["stimulus"] == "Remember: red, blue, green, yellow"
+        assert rows[1]["stimulus"] is None
+        assert rows[0]["judge_score"] == 0.84
 
-            def capture_model(**kwargs):
-                captured_models.append(kwargs)
-                return mock_instance
+        mock_session.close.assert_called_once()
 
-            MockQuestionModel.side_effect = capture_model
+    def _bulk_questions(self, count):
+        return [
+            GeneratedQuestion(
+                question_text=f"Sample item {chr(65+i)}",
+                question_type=QuestionType.MATH,
+                difficulty_level=DifficultyLevel.EASY,
+                correct_answer=str(i + 1),
+                answer_options=["1", "2", "3", "4"],
+                explanation=f"Explanation {i}",
+                source_llm="openai",
+                source_model="gpt-4",
+            )
+            for i in range(count)
+        ]
 
-            mock_database_service.insert_evaluated_questions_batch(evaluated_questions)
+    def test_insert_questions_bulk_reuses_cached_embeddings(
+        self, mock_database_service
+    ):
+        """Test bulk insertion embeds only uncached texts, in one API call."""
+        questions = self._bulk_questions(3)
+        cache = Mock()
+        cache.get.side_effect = lambda text, model: (
+            np.ones(8) if text == "Sample item B" else None
+        )
+        mock_database_service.embedding_cache = cache
+        mock_database_service.openai_client = Mock()
+        mock_session = Mock(spec=Session)
+        mock_session.scalars.return_value = iter([7, 8, 9])
+        mock_database_service.SessionLocal = Mock(return_value=mock_session)
 
-            # Verify stimulus was preserved for memory question
-            assert len(captured_models) == 2
-            assert (
-                captured_models[0]["stimulus"] == "Remember: red, blue, green, yellow"
+        with patch(
+            "app.data.database.generate_embeddings_batch",
+            return_value=[np.full(8, 0.5), np.full(8, 0.25)],
+        ) as mock_batch:
+            question_ids = mock_database_service.insert_questions_bulk(
+                questions, judge_scores=[0.7, 0.8, 0.9]
             )
-            assert captured_models[1]["stimulus"] is None
 
-        mock_session.close.assert_called_once()
+        assert question_ids == [7, 8, 9]
+        mock_batch.assert_called_once_with(
+            mock_database_service.openai_client,
+            ["Sample item A", "Sample item C"],
+            ANY,
+        )
+        assert cache.set.call_count == 2
+        rows = mock_session.scalars.call_args.args[1]
+        assert [row["embedding_dim"] for row in rows] == [8, 8, 8]
+        assert [row["judge_score"] for row in rows] == [0.7, 0.8, 0.9]
+        mock_session.commit.assert_called_once()
+
+    def test_insert_questions_bulk_rows_share_columns(self, mock_database_service):
+        """Test rows without embeddings still carry every embedding column."""
+        mock_session = Mock(spec=Session)
+        mock_session.scalars.return_value = iter([1, 2])
+        mock_database_service.SessionLocal = Mock(return_value=mock_session)
+
+        mock_database_service.insert_questions_bulk(self._bulk_questions(2))
+
+        rows = mock_session.scalars.call_args.args[1]
+        assert rows[0].keys() == rows[1].keys()
+        assert rows[0]["embedding_vector"] is None
+
+    def test_insert_questions_bulk_rollback_on_error(self, mock_database_service):
+        """Test a failed bulk insert rolls back the whole batch."""
+        mock_session = Mock(spec=Session)
+        mock_session.scalars.side_effect = Exception("unique violation")
+        mock_database_service.SessionLocal = Mock(return_value=mock_session)
+
+        with pytest.raises(Exception, match="unique violation"):
+            mock_database_service.insert_questions_bulk(self._bulk_questions(2))
+
+        mock_session.rollback.assert_called_once()
+        mock_session.commit.assert_not_called()
+
+    def test_insert_questions_bulk_empty(self, mock_database_service):
+        """Test an empty bulk insert does not open a session."""
+        mock_database_service.SessionLocal = Mock()
+
+        assert mock_database_service.insert_questions_bulk([]) == []
+        mock_database_service.SessionLocal.assert_not_called()
 
     def test_get_all_questions(self, mock_database_service):
         """Test retrieving all questions."""
         mock_session = Mock(spec=Session)
-        mock_query = Mock()
 
         # Create mock question objects
         mock_questions = [
@@ -666,8 +744,7 @@ class TestDatabaseService:
             ),
         ]
 
-        mock_query.all.return_value = mock_questions
-        mock_session.query.return_value = mock_query
+        mock_session.query.return_value = paged_query(mock_questions)
 
         mock_database_service.SessionLocal = Mock(return_value=mock_session)
 
@@ -683,14 +760,12 @@ class TestDatabaseService:
     def test_get_questions_by_difficulty(self, mock_database_service):
         """Test retrieving questions filtered by difficulty level."""
         mock_session = Mock(spec=Session)
-        mock_query = Mock()
 
         mock_rows = [
             Mock(question_text="Easy question 1", question_embedding=[0.1, 0.2, 0.3]),
             Mock(question_text="Easy question 2", question_embedding=[0.4, 0.5, 0.6]),
         ]
-        mock_query.filter.return_value.all.return_value = mock_rows
-        mock_session.query.return_value = mock_query
+        mock_session.query.return_value = paged_query(mock_rows)
 
         mock_database_service.SessionLocal = Mock(return_value=mock_session)
 
@@ -707,6 +782,106 @@ class TestDatabaseService:
         }
         mock_session.close.assert_called_once()
 
+    def test_get_questions_by_difficulty_decodes_compact_embeddings(
+        self, mock_database_service
+    ):
+        """Test compact embeddings are preferred and decoded to NumPy views."""
+        mock_session = Mock(spec=Session)
+
+        encoded = encode_embedding([0.1, 0.2, 0.3], "text-embedding-3-small")
+        mock_rows = [
+            Mock(
+                question_text="Compact",
+                question_embedding=None,
+                embedding_vector=encoded.data,
+                embedding_encoding=encoded.encoding,
+                embedding_scale=encoded.scale,
+            ),
+            Mock(
+                question_text="Legacy",
+                question_embedding=[0.4, 0.5, 0.6],
+                embedding_vector=None,
+            ),
+        ]
+        mock_session.query.return_value = paged_query(mock_rows)
+
+        mock_database_service.SessionLocal = Mock(return_value=mock_session)
+
+        results = mock_database_service.get_questions_by_difficulty("easy")
+
+        compact = results[0]["question_embedding"]
+        assert isinstance(compact, np.ndarray)
+        assert compact.dtype == np.float32
+        np.testing.assert_allclose(compact, [0.1, 0.2, 0.3], rtol=1e-6)
+        assert results[1]["question_embedding"] == [0.4, 0.5, 0.6]
+
+    def test_iter_questions_pages_by_id(self, mock_database_service):
+        """Test pages continue after the last id seen until a short page."""
+        mock_session = Mock(spec=Session)
+        query = paged_query(
+            [Mock(id=1, question_text="First"), Mock(id=4, question_text="Second")],
+            [Mock(id=9, question_text="Third")],
+        )
+        mock_session.query.return_value = query
+        mock_database_service.SessionLocal = Mock(return_value=mock_session)
+
+        results = list(
+            mock_database_service.iter_questions(("id", "question_text"), page_size=2)
+        )
+
+        assert [r["question_text"] for r in results] == ["First", "Second", "Third"]
+        assert query.all.call_count == 2
+        # Second page starts after the last id of the first
+        last_id_filter = query.filter.call_args_list[1].args[0]
+        assert last_id_filter.right.value == 4
+        assert mock_session.close.call_count == 2
+
+    def test_iter_questions_selects_only_requested_columns(self, mock_database_service):
+        """Test dedup loading does not fetch explanation, options or metadata."""
+        mock_session = Mock(spec=Session)
+        mock_session.query.return_value = paged_query([])
+        mock_database_service.SessionLocal = Mock(return_value=mock_session)
+
+        list(mock_database_service.iter_questions(DEDUP_FIELDS, active_only=True))
+
+        selected = [c.key for c in mock_session.query.call_args.args]
+        assert selected == [
+            "id",
+            "question_text",
+            "question_embedding",
+            "embedding_vector",
+            "embedding_encoding",
+            "embedding_scale",
+        ]
+
+    def test_iter_questions_rejects_unknown_fields(self, mock_database_service):
+        """Test a typo in a field name fails before querying."""
+        with pytest.raises(ValueError, match="Unknown question fields"):
+            list(mock_database_service.iter_questions(("id", "embedding")))
+
+    def test_insert_question_stores_compact_embedding(
+        self, mock_database_service, sample_question
+    ):
+        """Test new embeddings are written to the compact columns."""
+        mock_session = Mock(spec=Session)
+        mock_database_service.SessionLocal = Mock(return_value=mock_session)
+        mock_database_service.embedding_encoding = "int8"
+        mock_database_service._generate_embedding = Mock(return_value=[0.5, -1.0, 0.25])
+
+        with patch("app.data.database.QuestionModel") as MockQuestionModel:
+            mock_instance = Mock()
+            mock_instance.id = 777
+            MockQuestionModel.return_value = mock_instance
+
+            mock_database_service.insert_question(sample_question)
+
+            call_kwargs = MockQuestionModel.call_args[1]
+            assert "question_embedding" not in call_kwargs
+            assert call_kwargs["embedding_encoding"] == "int8"
+            assert call_kwargs["embedding_dim"] == 3
+            assert call_kwargs["embedding_model"] == "text-embedding-3-small"
+            assert len(call_kwargs["embedding_vector"]) == 3
+
     def test_get_question_count(self, mock_database_service):
         """Test getting question count."""
         mock_session = Mock(spec=Session)
@@ -1,6 +1,7 @@
 """Tests for question judge functionality."""
 
 import asyncio
+import json
 import pytest
 from pydantic import ValidationError
 from unittest.mock import AsyncMock, Mock, patch
@@ -22,6 +23,9 @@ from app.data.models import (
     GenerationBatch,
     QuestionType,
 )
+from app.providers.anthropic_provider import AnthropicProvider
+from app.providers.openai_provider import OpenAIProvider
+from tests.providers.fake_batch_server import FakeBatchServer
 
 
 def make_completion_result(content):
@@ -1970,3 +1974,136 @@ class TestRuntimeFallback:
 
         with pytest.raises(asyncio.TimeoutError):
             await judge.evaluate_question_async(logic_question)
+
+
+class TestBatchEvaluation:
+    """Tests for evaluating questions through provider batch APIs."""
+
+    @staticmethod
+    def _question(text, question_type=QuestionType.MATH):
+        return GeneratedQuestion(
+            question_text=text,
+            question_type=question_type,
+            difficulty_level=DifficultyLevel.EASY,
+            correct_answer="fifty-six",
+            answer_options=["forty-two", "forty-eight", "fifty-four", "fifty-six"],
+            source_llm="openai",
+            source_model="gpt-4",
+        )
+
+    @staticmethod
+    async def _collect(judge, questions, **kwargs):
+        return [
+            evaluated
+            async for evaluated in judge.evaluate_questions_batch_async(
+                questions, poll_interval=0.01, **kwargs
+            )
+        ]
+
+    @pytest.mark.asyncio
+    @patch("app.evaluation.judge.AnthropicProvider")
+    @patch("app.evaluation.judge.OpenAIProvider")
+    async def test_batches_per_judge_and_retries_failed_items(
+        self,
+        mock_openai,
+        mock_anthropic,
+        mock_judge_config,
+        sample_evaluation_response,
+    ):
+        """Test batch jobs per judge model, with unusable items retried individually."""
+
+        def respond(prompt):
+            if "unparseable" in prompt:
+                return "not json"
+            if "errored" in prompt:
+                return None
+            return json.dumps(sample_evaluation_response)
+
+        questions = [
+            self._question("What is seven times eight, as a word?"),
+            self._question("Which answer is unparseable by the judge here?"),
+            self._question("Which answer is errored by the batch API here?"),
+            self._question("Which conclusion follows logically?", QuestionType.LOGIC),
+        ]
+        judge = QuestionJudge(
+            judge_config=mock_judge_config,
+            openai_api_key="test-key",
+            anthropic_api_key="test-key",
+        )
+        with FakeBatchServer(respond) as server:
+            openai = OpenAIProvider(api_key="sk-test", base_url=server.openai_base_url)
+            openai.generate_structured_completion_with_usage_async = AsyncMock(
+                return_value=make_completion_result(sample_evaluation_response)
+            )
+            judge.providers["openai"] = openai
+            judge.providers["anthropic"] = AnthropicProvider(
+                api_key="sk-ant-test", base_url=server.url
+            )
+
+            evaluated = await self._collect(judge, questions, chunk_size=2)
+
+        assert sorted(eq.question.question_text for eq in evaluated) == sorted(
+            q.question_text for q in questions
+        )
+        assert all(eq.approved for eq in evaluated)
+        judge_models = {eq.question.question_text: eq.judge_model for eq in evaluated}
+        assert judge_models[questions[0].question_text] == "openai/gpt-4"
+        assert (
+            judge_models[questions[3].question_text]
+            == "anthropic/claude-3-5-sonnet-20241022"
+        )
+        # Two OpenAI chunks and one Anthropic batch; two items retried individually
+        assert len(server.submitted) == 3
+        assert openai.generate_structured_completion_with_usage_async.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch("app.evaluation.judge.OpenAIProvider")
+    async def test_timed_out_job_is_cancelled_and_retried(
+        self,
+        mock_provider_class,
+        mock_judge_config,
+        sample_question,
+        sample_evaluation_response,
+    ):
+        """Test a batch job past its timeout is cancelled and evaluated individually."""
+        mock_provider = Mock()
+        mock_provider.model = "gpt-4"
+        mock_provider.supports_batch = True
+        mock_provider.max_batch_size = 1000
+        mock_provider.create_batch_job.return_value = "batch-1"
+        mock_provider.wait_for_batch_job_async = AsyncMock(side_effect=TimeoutError)
+        mock_provider.generate_structured_completion_with_usage_async = AsyncMock(
+            return_value=make_completion_result(sample_evaluation_response)
+        )
+        mock_provider_class.return_value = mock_provider
+        judge = QuestionJudge(judge_config=mock_judge_config, openai_api_key="key")
+
+        evaluated = await self._collect(judge, [sample_question], timeout=0.01)
+
+        assert [eq.question for eq in evaluated] == [sample_question]
+        mock_provider.cancel_batch_job.assert_called_once_with("batch-1")
+        mock_provider.generate_structured_completion_with_usage_async.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch("app.evaluation.judge.OpenAIProvider")
+    async def test_providers_without_batch_api_evaluate_individually(
+        self,
+        mock_provider_class,
+        mock_judge_config,
+        sample_question,
+        sample_evaluation_response,
+    ):
+        """Test questions judged by a non-batch provider use single requests."""
+        mock_provider = Mock()
+        mock_provider.model = "gpt-4"
+        mock_provider.supports_batch = False
+        mock_provider.generate_structured_completion_with_usage_async = AsyncMock(
+            return_value=make_completion_result(sample_evaluation_response)
+        )
+        mock_provider_class.return_value = mock_provider
+        judge = QuestionJudge(judge_config=mock_judge_config, openai_api_key="key")
+
+        evaluated = await self._collect(judge, [sample_question, sample_question])
+
+        assert len(evaluated) == 2
+        mock_provider.create_batch_job.assert_not_called()
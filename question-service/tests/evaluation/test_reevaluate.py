@@ -9,12 +9,16 @@ _project_root = str(Path(__file__).parent.parent.parent)
 sys.path.insert(0, _project_root)
 sys.path.insert(0, str(Path(_project_root) / "scripts"))
 
+from app.data.database import QUESTION_FIELDS  # noqa: E402
 from app.data.models import (  # noqa: E402
     DifficultyLevel,
     GeneratedQuestion,
     QuestionType,
 )
-from reevaluate_questions import db_question_to_generated  # noqa: E402
+from reevaluate_questions import (  # noqa: E402
+    REEVALUATION_FIELDS,
+    db_question_to_generated,
+)
 
 
 def _make_db_question(**overrides) -> dict:
@@ -129,3 +133,24 @@ class TestDbQuestionToGenerated:
         assert result.metadata == {}
         assert result.source_llm == "unknown"
         assert result.source_model == "unknown"
+
+
+class TestReevaluationFields:
+    """Tests for the fields the script reads from the question bank."""
+
+    def test_fields_are_loadable_and_skip_embeddings(self):
+        """Test the projection is valid for iter_questions and omits embeddings."""
+        assert set(REEVALUATION_FIELDS) <= set(QUESTION_FIELDS)
+        assert "question_embedding" not in REEVALUATION_FIELDS
+
+    def test_fields_cover_conversion(self):
+        """Test a row with only the projected fields converts cleanly."""
+        db_q = {
+            field: value
+            for field, value in _make_db_question(judge_score=0.8).items()
+            if field in REEVALUATION_FIELDS
+        }
+
+        result = db_question_to_generated(db_q)
+
+        assert result.question_text == db_q["question_text"]
@@ -0,0 +1,137 @@
+"""Tests for adaptive batch chunk sizing."""
+
+import json
+import os
+import threading
+
+from app.generation.chunk_sizing import RECOVERY_SUCCESSES, ChunkSizeEstimator
+
+KEY = ("openai", "gpt-5.2", "spatial")
+
+
+def record(estimator, count, generated, output_tokens, latency=1.0, max_tokens=8000):
+    estimator.record(
+        *KEY,
+        count=count,
+        generated=generated,
+        output_tokens=output_tokens,
+        latency=latency,
+        max_tokens=max_tokens,
+    )
+
+
+class TestChunkSizeEstimator:
+    """Tests for ChunkSizeEstimator."""
+
+    def test_no_data_keeps_configured_size(self):
+        """Test unknown provider/model/types fall back to max_batch_size."""
+        estimator = ChunkSizeEstimator()
+
+        assert estimator.recommend(*KEY, count=25, max_tokens=8000) is None
+        assert (
+            estimator.recommend(*KEY, count=25, max_tokens=8000, max_chunk_size=10)
+            == 10
+        )
+
+    def test_chunks_fit_within_token_budget(self):
+        """Test chunk size is capped by learned output tokens per question."""
+        estimator = ChunkSizeEstimator()
+        record(estimator, count=4, generated=4, output_tokens=2000)
+
+        # 500 tokens/question, 80% of 4000 max_tokens -> 6 questions
+        assert (
+            estimator.recommend(*KEY, count=25, max_tokens=4000, max_chunk_size=10) == 6
+        )
+
+    def test_truncation_shrinks_then_recovers(self):
+        """Test a truncated call cuts the cap and clean calls at it regrow it."""
+        estimator = ChunkSizeEstimator()
+        record(estimator, count=10, generated=6, output_tokens=7900)
+
+        assert estimator.get_stats()["openai|gpt-5.2|spatial"]["truncations"] == 1
+        assert (
+            estimator.recommend(*KEY, count=25, max_tokens=80000, max_chunk_size=10)
+            == 7
+        )
+
+        for _ in range(RECOVERY_SUCCESSES):
+            record(estimator, count=7, generated=7, output_tokens=3000)
+
+        assert (
+            estimator.recommend(*KEY, count=25, max_tokens=80000, max_chunk_size=10)
+            == 8
+        )
+
+    def test_parse_failure_counts_as_truncation(self):
+        """Test unparseable responses shrink the cap like truncations."""
+        estimator = ChunkSizeEstimator()
+        estimator.record_truncation(*KEY, count=4)
+        estimator.record_truncation(*KEY, count=4)
+
+        assert estimator.recommend(*KEY, count=25, max_tokens=8000) == 2
+
+    def test_latency_model_picks_fastest_size(self):
+        """Test chunk size minimizes batch wall time under the concurrency limit."""
+        token_bound = ChunkSizeEstimator()
+        for generated in (1, 2, 3):
+            record(token_bound, generated, generated, generated * 100, generated)
+        overhead_bound = ChunkSizeEstimator()
+        for generated in (1, 2, 3):
+            record(overhead_bound, generated, generated, generated * 100, 10.0)
+
+        # 1s per question: 10 parallel chunks of 2 finish sooner than 3 chunks of 10
+        assert (
+            token_bound.recommend(
+                *KEY, count=20, max_tokens=8000, max_chunk_size=10, concurrency=10
+            )
+            == 2
+        )
+        # Fixed 10s per call regardless of size: use the largest chunks
+        assert (
+            overhead_bound.recommend(
+                *KEY, count=20, max_tokens=8000, max_chunk_size=10, concurrency=10
+            )
+            == 10
+        )
+
+    def test_estimates_persist_between_runs(self, tmp_path):
+        """Test a new estimator starts from the previous run's flushed estimates."""
+        path = str(tmp_path / "chunk_sizing.json")
+        estimator = ChunkSizeEstimator(path)
+        record(estimator, count=10, generated=6, output_tokens=7900)
+
+        assert not (tmp_path / "chunk_sizing.json").exists()
+        estimator.flush()
+        reloaded = ChunkSizeEstimator(path)
+
+        assert reloaded.get_stats()["openai|gpt-5.2|spatial"]["truncation_cap"] == 7
+        assert not (tmp_path / "chunk_sizing.json.tmp").exists()
+
+    def test_due_save_runs_in_background(self, tmp_path, monkeypatch):
+        """Test recording hands a due save to a thread and keeps later changes."""
+        monkeypatch.setattr("app.generation.chunk_sizing.SAVE_INTERVAL_SECONDS", 0.0)
+        path = tmp_path / "chunk_sizing.json"
+        estimator = ChunkSizeEstimator(str(path))
+        written = threading.Event()
+        replace = os.replace
+
+        def recording_replace(src, dst):
+            replace(src, dst)
+            written.set()
+
+        monkeypatch.setattr("app.generation.chunk_sizing.os.replace", recording_replace)
+        record(estimator, count=10, generated=6, output_tokens=7900)
+
+        assert written.wait(timeout=5.0)
+        estimator.record_truncation(*KEY, count=7)
+        estimator.flush()
+
+        stats = json.loads(path.read_text())["stats"]["openai|gpt-5.2|spatial"]
+        assert stats["truncations"] == 2
+
+    def test_unreadable_stats_file_is_ignored(self, tmp_path):
+        """Test a corrupt stats file starts the estimator empty."""
+        path = tmp_path / "chunk_sizing.json"
+        path.write_text("{not json")
+
+        assert ChunkSizeEstimator(str(path)).get_stats() == {}
@@ -1,11 +1,15 @@
 """Tests for question generator."""
 
 import asyncio
+import json
+import re
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from app.observability.cost_tracking import CompletionResult
+from app.observability.cost_tracking import CompletionResult, TokenUsage
+from app.observability.provider_latency import ProviderLatencyTracker
+from app.generation.chunk_sizing import ChunkSizeEstimator
 from app.generation.generator import QuestionGenerator
 from app.infrastructure.circuit_breaker import CircuitBreakerOpen
 from app.data.models import DifficultyLevel, GeneratedQuestion, QuestionType
@@ -2070,3 +2074,275 @@ class TestBalancedProviderTierModeAsync:
 
         assert len(batch.questions) == 4
         # Should NOT have alternated — just used round-robin or default routing
+
+
+class TestHedgedRequests:
+    """Tests for hedged duplicate requests to a second provider."""
+
+    QUESTION = {
+        "question_text": "What follows 2, 4, 6?",
+        "correct_answer": "8",
+        "answer_options": ["8", "9", "10", "12"],
+        "explanation": "Explanation",
+    }
+
+    @pytest.fixture
+    def tracker(self):
+        tracker = ProviderLatencyTracker(min_samples=1)
+        tracker.record("openai", "gpt-4", 0.05)
+        return tracker
+
+    @pytest.fixture
+    def make_generator(self, tracker):
+        """Build a two-provider hedging generator with the given OpenAI delay."""
+        patches = [
+            patch("app.generation.generator.OpenAIProvider"),
+            patch("app.generation.generator.AnthropicProvider"),
+        ]
+        mock_openai, mock_anthropic = [p.start() for p in patches]
+
+        def _make(openai_delay: float):
+            async def slow_completion(**kwargs):
+                await asyncio.sleep(openai_delay)
+                return make_completion_result(self.QUESTION)
+
+            openai_provider = Mock()
+            openai_provider.model = "gpt-4"
+            openai_provider.generate_structured_completion_with_usage_async = AsyncMock(
+                side_effect=slow_completion
+            )
+            mock_openai.return_value = openai_provider
+            anthropic_provider = Mock()
+            anthropic_provider.model = "claude-3-5-sonnet"
+            anthropic_provider.generate_structured_completion_with_usage_async = (
+                AsyncMock(return_value=make_completion_result(self.QUESTION))
+            )
+            mock_anthropic.return_value = anthropic_provider
+
+            generator = QuestionGenerator(
+                openai_api_key="openai-key",
+                anthropic_api_key="anthropic-key",
+                hedge_requests=True,
+                latency_tracker=tracker,
+            )
+            generator._get_specialist_provider = Mock(
+                side_effect=lambda question_type, provider_tier=None: (
+                    ("anthropic", None)
+                    if provider_tier == "fallback"
+                    else ("openai", None)
+                )
+            )
+            return generator, openai_provider, anthropic_provider
+
+        yield _make
+        for p in patches:
+            p.stop()
+
+    async def _generate(self, generator):
+        return await generator.generate_question_async(
+            question_type=QuestionType.PATTERN,
+            difficulty=DifficultyLevel.MEDIUM,
+            provider_name="openai",
+        )
+
+    async def test_slow_call_is_hedged_and_loser_cancelled(
+        self, make_generator, tracker
+    ):
+        """Test a call past its p95 is raced against the fallback provider."""
+        generator, openai_provider, anthropic_provider = make_generator(10.0)
+
+        start = asyncio.get_running_loop().time()
+        question = await self._generate(generator)
+
+        assert question.source_llm == "anthropic"
+        assert asyncio.get_running_loop().time() - start < 5.0
+        anthropic_provider.generate_structured_completion_with_usage_async.assert_called_once()
+        # Cancelled primary is recorded with its elapsed time as a lower bound
+        assert tracker.get_stats()["openai/gpt-4/generate"]["calls"] == 2
+
+    async def test_fast_call_is_not_hedged(self, make_generator):
+        """Test calls finishing within the hedge delay never reach the fallback."""
+        generator, _, anthropic_provider = make_generator(0.0)
+
+        question = await self._generate(generator)
+
+        assert question.source_llm == "openai"
+        anthropic_provider.generate_structured_completion_with_usage_async.assert_not_called()
+
+    async def test_unreliable_hedge_target_is_skipped(self, make_generator, tracker):
+        """Test providers below the success-rate floor are not hedged to."""
+        tracker.record("anthropic", "claude-3-5-sonnet", 0.0, success=False)
+        generator, _, anthropic_provider = make_generator(0.2)
+
+        question = await self._generate(generator)
+
+        assert question.source_llm == "openai"
+        anthropic_provider.generate_structured_completion_with_usage_async.assert_not_called()
+
+    async def test_queued_time_does_not_trigger_hedge(self, make_generator):
+        """Test the hedge delay starts once the call holds a request slot."""
+        generator, _, anthropic_provider = make_generator(0.0)
+        slots = generator._max_concurrent_requests
+        for _ in range(slots):
+            await generator._rate_limiter.acquire()
+
+        call = asyncio.create_task(self._generate(generator))
+        await asyncio.sleep(0.3)
+        for _ in range(slots):
+            generator._rate_limiter.release()
+        question = await call
+
+        assert question.source_llm == "openai"
+        anthropic_provider.generate_structured_completion_with_usage_async.assert_not_called()
+
+    async def test_hedges_capped_by_budget(self, make_generator):
+        """Test slow calls past the hedge budget run unhedged."""
+        generator, _, anthropic_provider = make_generator(0.3)
+
+        first = await self._generate(generator)
+        second = await self._generate(generator)
+
+        assert first.source_llm == "anthropic"
+        assert second.source_llm == "openai"
+        anthropic_provider.generate_structured_completion_with_usage_async.assert_called_once()
+
+    async def test_no_latency_data_runs_unhedged(self, make_generator, tracker):
+        """Test hedging waits for latency data before duplicating requests."""
+        tracker.reset()
+        generator, _, anthropic_provider = make_generator(0.2)
+
+        question = await self._generate(generator)
+
+        assert question.source_llm == "openai"
+        anthropic_provider.generate_structured_completion_with_usage_async.assert_not_called()
+
+
+class TestAdaptiveChunking:
+    """Tests for chunk sizes learned by the chunk size estimator."""
+
+    @pytest.fixture
+    def estimator(self):
+        return ChunkSizeEstimator()
+
+    @pytest.fixture
+    def make_generator(self, estimator):
+        """Build an adaptive-chunking generator around a provider completion."""
+        with patch("app.generation.generator.OpenAIProvider") as mock_openai:
+
+            def _make(completion):
+                provider = Mock()
+                provider.model = "gpt-5.2"
+                # Reasoning model: completion limit widened 4x, as OpenAIProvider
+                provider.effective_output_limit = lambda max_tokens, model=None: (
+                    max_tokens * 4
+                )
+                provider.generate_structured_completion_with_usage_async = AsyncMock(
+                    side_effect=completion
+                )
+                mock_openai.return_value = provider
+                return (
+                    QuestionGenerator(
+                        openai_api_key="test-key",
+                        adaptive_chunking=True,
+                        chunk_size_estimator=estimator,
+                    ),
+                    provider,
+                )
+
+            yield _make
+
+    @staticmethod
+    async def batch_completion(prompt, **kwargs):
+        count = int(re.search(r"Generate (\d+)", prompt).group(1))
+        questions = [
+            {
+                "question_text": f"Question {i + 1}?",
+                "correct_answer": "A",
+                "answer_options": ["A", "B", "C", "D"],
+                "explanation": f"Explanation {i + 1}",
+            }
+            for i in range(count)
+        ]
+        return CompletionResult(
+            content={"questions": questions},
+            token_usage=TokenUsage(
+                input_tokens=1000,
+                output_tokens=200 * count,
+                model="gpt-5.2",
+                provider="openai",
+            ),
+        )
+
+    async def test_learned_cap_sets_chunk_size(self, make_generator, estimator):
+        """Test a learned truncation cap overrides a larger max_batch_size."""
+        estimator.record_truncation("openai", "gpt-5.2", "spatial", count=10)
+        generator, provider = make_generator(self.batch_completion)
+
+        with patch.object(generator, "_get_max_batch_size", return_value=10):
+            batch = await generator.generate_batch_async(
+                question_type=QuestionType.SPATIAL,
+                difficulty=DifficultyLevel.EASY,
+                count=25,
+                use_single_call=True,
+            )
+
+        assert len(batch.questions) == 25
+        assert batch.metadata.get("max_batch_size") == 7
+        call_args = (
+            provider.generate_structured_completion_with_usage_async.call_args_list
+        )
+        assert len(call_args) == 4
+        stats = estimator.get_stats()["openai|gpt-5.2|spatial"]
+        assert stats["calls"] == 5
+        assert stats["tokens_per_question"] == pytest.approx(200)
+
+    async def test_unparseable_response_records_truncation(
+        self, make_generator, estimator
+    ):
+        """Test JSON parse failures from the provider shrink the learned cap."""
+
+        async def truncated(**kwargs):
+            try:
+                json.loads('{"questions": [{"question_text": "Cut off')
+            except json.JSONDecodeError as e:
+                raise Exception(f"Failed to parse JSON response: {e}") from e
+
+        generator, _ = make_generator(truncated)
+
+        with pytest.raises(Exception, match="Failed to parse JSON"):
+            await generator.generate_batch_single_call_async(
+                question_type=QuestionType.SPATIAL,
+                difficulty=DifficultyLevel.EASY,
+                count=8,
+                provider_name="openai",
+            )
+
+        stats = estimator.get_stats()["openai|gpt-5.2|spatial"]
+        assert stats["truncations"] == 1
+        assert stats["truncation_cap"] == 6
+
+    async def test_reasoning_shortfall_is_not_truncation(
+        self, make_generator, estimator
+    ):
+        """Test output past max_tokens but within the widened limit isn't truncated."""
+
+        async def short_batch(prompt, **kwargs):
+            result = await self.batch_completion(prompt, **kwargs)
+            result.content["questions"].pop()
+            result.token_usage.output_tokens = 3000  # Mostly reasoning tokens
+            return result
+
+        generator, _ = make_generator(short_batch)
+
+        questions = await generator.generate_batch_single_call_async(
+            question_type=QuestionType.SPATIAL,
+            difficulty=DifficultyLevel.EASY,
+            count=5,
+            provider_name="openai",
+            max_tokens=2000,
+        )
+
+        assert len(questions) == 4
+        stats = estimator.get_stats()["openai|gpt-5.2|spatial"]
+        assert stats["truncations"] == 0
+        assert stats["truncation_cap"] is None
@@ -454,6 +454,87 @@ class TestPipelineProviderTier:
             assert call.kwargs["provider_tier"] is None
 
 
+class TestAsyncJobOnBatch:
+    """Tests for streaming batches out of the async generation jobs."""
+
+    @pytest.fixture
+    def mock_generator(self):
+        """Mock QuestionGenerator."""
+        with patch("app.generation.pipeline.QuestionGenerator") as mock:
+            generator = Mock()
+            mock.return_value = generator
+            yield generator
+
+    @pytest.fixture
+    def pipeline(self, mock_generator):
+        """Create pipeline with mocked generator."""
+        return QuestionGenerationPipeline(openai_api_key="test-key")
+
+    def _make_batch(self, question_type, difficulty):
+        batch = Mock(spec=GenerationBatch)
+        question = Mock()
+        question.source_llm = "openai"
+        question.question_type = question_type
+        question.difficulty_level = difficulty
+        batch.questions = [question]
+        return batch
+
+    @pytest.mark.asyncio
+    async def test_run_generation_job_async_emits_each_batch(
+        self, pipeline, mock_generator
+    ):
+        """Test that on_batch receives every generated batch before the job returns."""
+
+        async def generate_batch_async(question_type, difficulty, **kwargs):
+            return self._make_batch(question_type, difficulty)
+
+        mock_generator.generate_batch_async = AsyncMock(
+            side_effect=generate_batch_async
+        )
+        emitted = []
+
+        async def on_batch(batch):
+            emitted.append(batch)
+
+        result = await pipeline.run_generation_job_async(
+            questions_per_run=10,
+            question_types=[QuestionType.MATH, QuestionType.LOGIC],
+            on_batch=on_batch,
+        )
+
+        assert len(emitted) == 6
+        assert {id(batch) for batch in emitted} == {
+            id(batch) for batch in result["batches"]
+        }
+
+    @pytest.mark.asyncio
+    async def test_run_balanced_generation_job_async_skips_failed_batches(
+        self, pipeline, mock_generator
+    ):
+        """Test that failed strata are not emitted and do not stop the others."""
+
+        async def generate_batch_async(question_type, difficulty, **kwargs):
+            if question_type == QuestionType.LOGIC:
+                raise RuntimeError("provider down")
+            return self._make_batch(question_type, difficulty)
+
+        mock_generator.generate_batch_async = AsyncMock(
+            side_effect=generate_batch_async
+        )
+        on_batch = AsyncMock()
+
+        result = await pipeline.run_balanced_generation_job_async(
+            stratum_allocations={
+                (QuestionType.MATH, DifficultyLevel.EASY): 3,
+                (QuestionType.LOGIC, DifficultyLevel.HARD): 3,
+            },
+            on_batch=on_batch,
+        )
+
+        on_batch.assert_awaited_once()
+        assert result["statistics"]["questions_generated"] == 1
+
+
 class TestCreatePipeline:
     """Tests for create_pipeline factory function."""
 
@@ -4,6 +4,7 @@ from unittest.mock import patch
 
 from app.data.models import DifficultyLevel, QuestionType
 from app.generation.prompts import (
+    JUDGE_PROMPT_PREFIX,
     SYSTEM_PROMPT,
     build_generation_prompt,
     build_judge_prompt,
@@ -13,7 +14,9 @@ from app.generation.prompts import (
     QUESTION_SUBTYPES,
     QUESTION_TYPE_PROMPTS,
     DIFFICULTY_INSTRUCTIONS,
+    question_prompt_prefix,
 )
+from app.providers.base import split_cacheable_prefix
 
 
 class TestBuildGenerationPrompt:
@@ -714,3 +717,57 @@ class TestTypeDifficultyOverrides:
         assert "70-80%" in prompt
         assert "85-115" in prompt
         assert "discriminatory power" in prompt.lower()
+
+
+class TestPromptPrefixes:
+    """Tests for the compiled, cacheable prompt prefixes."""
+
+    def test_generation_and_regeneration_share_prefix(self):
+        """Test both prompt kinds start with the same registered prefix."""
+        gold = GOLD_STANDARD_EXAMPLES[QuestionType.LOGIC][0]
+        with patch("app.generation.prompts.random.choice", return_value=gold):
+            generation = build_generation_prompt(
+                QuestionType.LOGIC, DifficultyLevel.MEDIUM, count=3
+            )
+            regeneration = build_regeneration_prompt(
+                original_question="Q?",
+                original_answer="A",
+                original_options=["A", "B"],
+                question_type=QuestionType.LOGIC,
+                difficulty=DifficultyLevel.MEDIUM,
+                judge_feedback="Too easy",
+                scores={"difficulty": 0.4},
+            )
+
+        prefix, rest = split_cacheable_prefix(generation)
+
+        assert prefix.startswith(SYSTEM_PROMPT)
+        assert gold in prefix
+        assert DIFFICULTY_INSTRUCTIONS[DifficultyLevel.MEDIUM] in prefix
+        assert "Generate 3 unique" in rest
+        assert split_cacheable_prefix(regeneration)[0] == prefix
+
+    def test_prefix_is_compiled_once(self):
+        """Test repeated prompts reuse the compiled prefix."""
+        build_generation_prompt(QuestionType.MATH, DifficultyLevel.HARD, subtype=None)
+        hits = question_prompt_prefix.cache_info().hits
+        gold = GOLD_STANDARD_EXAMPLES[QuestionType.MATH][0]
+
+        with patch("app.generation.prompts.random.choice", return_value=gold):
+            first = build_generation_prompt(QuestionType.MATH, DifficultyLevel.HARD)
+            second = build_generation_prompt(QuestionType.MATH, DifficultyLevel.HARD)
+
+        assert first == second
+        assert question_prompt_prefix.cache_info().hits >= hits + 1
+
+    def test_judge_prompt_prefix(self):
+        """Test judge prompts start with the registered judge prefix."""
+        prompt = build_judge_prompt(
+            question="Q?",
+            answer_options=["A", "B", "C", "D"],
+            correct_answer="A",
+            question_type="math",
+            difficulty="easy",
+        )
+
+        assert split_cacheable_prefix(prompt)[0] == JUDGE_PROMPT_PREFIX
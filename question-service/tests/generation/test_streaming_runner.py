@@ -0,0 +1,378 @@
+"""Tests for the streaming (overlapped) mode of the generation pipeline."""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.data.dedup_runner import dedupe_within_batch
+from app.data.models import (
+    DifficultyLevel,
+    EvaluatedQuestion,
+    EvaluationScore,
+    GeneratedQuestion,
+    GenerationBatch,
+    QuestionType,
+)
+from app.generation.streaming_runner import (
+    run_streaming_pipeline,
+    run_streaming_pipeline_async,
+)
+from app.reporting.run_summary import RunSummary as PipelineRunSummary
+
+
+def _question(text: str) -> GeneratedQuestion:
+    return GeneratedQuestion(
+        question_text=text,
+        question_type=QuestionType.MATH,
+        difficulty_level=DifficultyLevel.MEDIUM,
+        correct_answer="4",
+        answer_options=["3", "4", "5", "6"],
+        source_llm="openai",
+        source_model="gpt-4",
+    )
+
+
+def _batch(*texts: str) -> GenerationBatch:
+    return GenerationBatch(
+        questions=[_question(text) for text in texts],
+        question_type=QuestionType.MATH,
+        batch_size=len(texts),
+        generation_timestamp="2026-01-01T00:00:00Z",
+    )
+
+
+def _stats(generated: int) -> dict:
+    return {
+        "target_questions": generated,
+        "questions_generated": generated,
+        "success_rate": 1.0,
+        "duration_seconds": 0.1,
+        "questions_by_type": {"math": generated},
+        "questions_by_difficulty": {"medium": generated},
+    }
+
+
+def _make_pipeline(job) -> MagicMock:
+    """Pipeline whose async generation job is ``job(on_batch)``."""
+    pipeline = MagicMock()
+    pipeline.cleanup = AsyncMock()
+    pipeline.generator.regenerate_question_with_feedback_async = AsyncMock(
+        side_effect=RuntimeError("regeneration unavailable")
+    )
+
+    async def run_generation_job_async(on_batch, **kwargs):
+        return await job(on_batch)
+
+    pipeline.run_generation_job_async = run_generation_job_async
+    return pipeline
+
+
+def _make_judge(scores: dict) -> MagicMock:
+    """Judge scoring each question by its text (default 0.9)."""
+    judge = MagicMock()
+    judge.cleanup = AsyncMock()
+    judge.judge_config.get_answer_verification_enabled.return_value = False
+    judge.determine_difficulty_placement.return_value = (None, None)
+
+    async def evaluate_question_async(question, **kwargs):
+        score = scores.get(question.question_text, 0.9)
+        return EvaluatedQuestion(
+            question=question,
+            evaluation=EvaluationScore(
+                clarity_score=score,
+                difficulty_score=score,
+                validity_score=score,
+                formatting_score=score,
+                creativity_score=score,
+                overall_score=score,
+            ),
+            judge_model="anthropic/claude",
+            approved=score >= 0.7,
+        )
+
+    judge.evaluate_question_async = AsyncMock(side_effect=evaluate_question_async)
+    return judge
+
+
+def _make_db() -> MagicMock:
+    db = MagicMock()
+    db.get_questions_by_difficulty.return_value = []
+    db.inserted = []
+
+    def insert(questions):
+        db.inserted.extend(questions)
+        return list(range(len(db.inserted) - len(questions), len(db.inserted)))
+
+    db.insert_evaluated_questions_batch.side_effect = insert
+    return db
+
+
+def _make_deduplicator(duplicate_texts=()) -> MagicMock:
+    deduplicator = MagicMock()
+
+    def check_duplicate(question, existing):
+        result = MagicMock()
+        result.is_duplicate = question.question_text in duplicate_texts
+        result.duplicate_type = "semantic" if result.is_duplicate else None
+        result.similarity_score = 0.99
+        return result
+
+    deduplicator.check_duplicate.side_effect = check_duplicate
+    return deduplicator
+
+
+def _run(pipeline, judge, db, deduplicator, metrics, **kwargs):
+    options = {
+        "generation_plan": None,
+        "question_types": None,
+        "difficulty_distribution": None,
+        "max_concurrent": 4,
+        "timeout": 30,
+        "provider_tier": "primary",
+        "count": None,
+        "min_score": 0.7,
+        "max_concurrent_judge": 2,
+        "skip_deduplication": False,
+        "logger": MagicMock(),
+        **kwargs,
+    }
+    return run_streaming_pipeline(
+        pipeline=pipeline,
+        judge=judge,
+        db=db,
+        deduplicator=deduplicator,
+        metrics=metrics,
+        **options,
+    )
+
+
+@pytest.fixture(autouse=True)
+def mock_observability():
+    with (
+        patch("app.generation.streaming_runner.observability"),
+        patch("app.generation.runner.observability"),
+        patch("app.evaluation.runner.observability"),
+        patch("app.data.dedup_runner.observability"),
+        patch("app.data.insertion_runner.observability"),
+    ):
+        yield
+
+
+class TestRunStreamingPipeline:
+    def test_questions_flow_through_every_stage(self):
+        texts = [
+            "What is two plus two, written as a digit?",
+            "Which number doubled gives eight in total?",
+            "What is two plus two, written as a digit??",  # near-duplicate
+            "Which prime number comes right after three?",
+            "How many sides does a square have in total?",
+        ]
+
+        async def job(on_batch):
+            await on_batch(_batch(*texts[:2]))
+            await on_batch(_batch(*texts[2:]))
+            return {"statistics": _stats(len(texts))}
+
+        db = _make_db()
+        metrics = PipelineRunSummary()
+        result = _run(
+            _make_pipeline(job),
+            _make_judge({texts[3]: 0.4}),
+            db,
+            _make_deduplicator(duplicate_texts={texts[1]}),
+            metrics,
+        )
+
+        assert len(result.generated_questions) == 4
+        assert len(result.approved_questions) == 3
+        assert len(result.rejected_questions) == 1
+        assert result.approval_rate == pytest.approx(75.0)
+        assert [eq.question.question_text for eq in db.inserted] == [
+            eq.question.question_text for eq in result.unique_questions
+        ]
+        assert result.inserted_count == 2
+
+        summary = metrics.to_summary_dict()
+        assert summary["generation"]["generated"] == 5
+        assert summary["evaluation"]["evaluated"] == 4
+        assert summary["evaluation"]["approved"] == 3
+        assert summary["evaluation"]["rejected"] == 1
+        assert summary["deduplication"]["checked"] == 3
+        assert summary["deduplication"]["duplicates_found"] == 1
+        assert summary["database"]["inserted"] == 2
+
+    def test_inserts_before_generation_finishes(self):
+        db = _make_db()
+        inserted = threading.Event()
+        db.insert_evaluated_questions_batch.side_effect = lambda questions: (
+            inserted.set() or [1] * len(questions)
+        )
+
+        async def job(on_batch):
+            await on_batch(_batch("What is two plus two, written as a digit?"))
+            for _ in range(200):
+                if inserted.is_set():
+                    break
+                await asyncio.sleep(0.01)
+            assert inserted.is_set(), "first batch was not inserted while generating"
+            await on_batch(_batch("Which prime number comes right after three?"))
+            return {"statistics": _stats(2)}
+
+        result = _run(
+            _make_pipeline(job),
+            _make_judge({}),
+            db,
+            _make_deduplicator(),
+            PipelineRunSummary(),
+        )
+
+        assert result.inserted_count == 2
+        assert db.insert_evaluated_questions_batch.call_count == 2
+
+    def test_full_queue_blocks_generation(self):
+        release_judge = asyncio.Event()
+        judge = _make_judge({})
+        evaluate = judge.evaluate_question_async.side_effect
+
+        async def slow_evaluate(question, **kwargs):
+            await release_judge.wait()
+            return await evaluate(question)
+
+        judge.evaluate_question_async.side_effect = slow_evaluate
+        emit_blocked = []
+
+        async def job(on_batch):
+            texts = [
+                "What is two plus two, written as a digit?",
+                "Which prime number comes right after three?",
+                "How many sides does a square have in total?",
+                "Which word is the odd one out: cat, dog, car?",
+                "Complete the pattern: red, blue, red, blue, ...",
+                "If all bloops are razzies, are some razzies bloops?",
+            ]
+            emit = asyncio.ensure_future(on_batch(_batch(*texts)))
+            await asyncio.sleep(0.05)
+            emit_blocked.append(not emit.done())
+            release_judge.set()
+            await emit
+            return {"statistics": _stats(len(texts))}
+
+        result = _run(
+            _make_pipeline(job),
+            judge,
+            _make_db(),
+            _make_deduplicator(),
+            PipelineRunSummary(),
+            queue_size=1,
+            max_concurrent_judge=1,
+            skip_deduplication=True,
+        )
+
+        assert emit_blocked == [True]
+        assert result.inserted_count == 6
+
+    def test_late_failure_keeps_inserted_questions(self):
+        db = _make_db()
+
+        async def job(on_batch):
+            await on_batch(_batch("What is two plus two, written as a digit?"))
+            for _ in range(200):
+                if db.inserted:
+                    break
+                await asyncio.sleep(0.01)
+            raise RuntimeError("provider crashed")
+
+        pipeline = _make_pipeline(job)
+        judge = _make_judge({})
+
+        with pytest.raises(RuntimeError, match="provider crashed"):
+            _run(pipeline, judge, db, _make_deduplicator(), PipelineRunSummary())
+
+        assert len(db.inserted) == 1
+        pipeline.cleanup.assert_awaited_once()
+        judge.cleanup.assert_awaited_once()
+
+    def test_failed_insert_batch_is_dropped_from_dedup_cache(self):
+        texts = [
+            "What is two plus two, written as a digit?",
+            "Which prime number comes right after three?",
+        ]
+        db = _make_db()
+        attempted = threading.Event()
+
+        def insert(questions):
+            attempted.set()
+            if questions[0].question.question_text == texts[0]:
+                raise RuntimeError("database unavailable")
+            return [1] * len(questions)
+
+        db.insert_evaluated_questions_batch.side_effect = insert
+
+        async def job(on_batch):
+            await on_batch(_batch(texts[0]))
+            for _ in range(200):
+                if attempted.is_set():
+                    break
+                await asyncio.sleep(0.01)
+            await on_batch(_batch(texts[1]))
+            return {"statistics": _stats(2)}
+
+        existing = {"medium": [{"question_text": "Which is the odd one out?"}]}
+        result = asyncio.run(
+            run_streaming_pipeline_async(
+                pipeline=_make_pipeline(job),
+                judge=_make_judge({}),
+                db=db,
+                deduplicator=_make_deduplicator(),
+                generation_plan=None,
+                question_types=None,
+                difficulty_distribution=None,
+                provider_tier="primary",
+                count=None,
+                min_score=0.7,
+                max_concurrent_judge=1,
+                skip_deduplication=False,
+                metrics=PipelineRunSummary(),
+                logger=MagicMock(),
+                existing_by_difficulty=existing,
+            )
+        )
+
+        assert result.inserted_count == 1
+        assert existing["medium"] == [
+            {"question_text": "Which is the odd one out?"},
+            {"question_text": texts[1]},
+        ]
+
+    def test_requires_database(self):
+        with pytest.raises(ValueError, match="db"):
+            _run(
+                _make_pipeline(AsyncMock()),
+                _make_judge({}),
+                None,
+                _make_deduplicator(),
+                PipelineRunSummary(),
+            )
+
+
+class TestDedupeWithinBatchSeenTexts:
+    def test_checks_against_earlier_batches(self):
+        seen: list[str] = []
+        first = dedupe_within_batch(
+            [_question("What is two plus two, written as a digit?")], seen_texts=seen
+        )
+        second = dedupe_within_batch(
+            [
+                _question("What is two plus two, written as a digit??"),
+                _question("Which prime number comes right after three?"),
+            ],
+            seen_texts=seen,
+        )
+
+        assert len(first) == 1
+        assert [q.question_text for q in second] == [
+            "Which prime number comes right after three?"
+        ]
+        assert len(seen) == 2
@@ -0,0 +1,226 @@
+"""Tests for the long-lived generation worker."""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.data.models import (
+    DifficultyLevel,
+    EvaluatedQuestion,
+    EvaluationScore,
+    GeneratedQuestion,
+    GenerationBatch,
+    QuestionType,
+)
+from app.generation.worker import GenerationWorker, JobStatus, WorkerBusyError
+
+TEXTS = [
+    "What is two plus two, written as a digit?",
+    "Which prime number comes right after three?",
+    "How many sides does a square have in total?",
+]
+
+
+def _batch(text: str) -> GenerationBatch:
+    question = GeneratedQuestion(
+        question_text=text,
+        question_type=QuestionType.MATH,
+        difficulty_level=DifficultyLevel.MEDIUM,
+        correct_answer="4",
+        answer_options=["3", "4", "5", "6"],
+        source_llm="openai",
+        source_model="gpt-4",
+    )
+    return GenerationBatch(
+        questions=[question],
+        question_type=QuestionType.MATH,
+        batch_size=1,
+        generation_timestamp="2026-01-01T00:00:00Z",
+    )
+
+
+def _make_pipeline(texts, release: threading.Event = None) -> MagicMock:
+    """Pipeline generating one question per job from texts, in order."""
+    pipeline = MagicMock()
+    pipeline.cleanup = AsyncMock()
+    remaining = list(texts)
+
+    async def run_generation_job_async(on_batch, **kwargs):
+        while release is not None and not release.is_set():
+            await asyncio.sleep(0.01)
+        await on_batch(_batch(remaining.pop(0)))
+        return {
+            "statistics": {
+                "target_questions": 1,
+                "questions_generated": 1,
+                "success_rate": 1.0,
+                "duration_seconds": 0.1,
+                "questions_by_type": {"math": 1},
+                "questions_by_difficulty": {"medium": 1},
+            }
+        }
+
+    pipeline.run_generation_job_async = run_generation_job_async
+    return pipeline
+
+
+def _make_judge() -> MagicMock:
+    judge = MagicMock()
+    judge.cleanup = AsyncMock()
+    judge.judge_config.get_answer_verification_enabled.return_value = False
+    judge.determine_difficulty_placement.return_value = (None, None)
+
+    async def evaluate_question_async(question, **kwargs):
+        return EvaluatedQuestion(
+            question=question,
+            evaluation=EvaluationScore(
+                clarity_score=0.9,
+                difficulty_score=0.9,
+                validity_score=0.9,
+                formatting_score=0.9,
+                creativity_score=0.9,
+                overall_score=0.9,
+            ),
+            judge_model="anthropic/claude",
+            approved=True,
+        )
+
+    judge.evaluate_question_async = AsyncMock(side_effect=evaluate_question_async)
+    return judge
+
+
+def _make_db() -> MagicMock:
+    db = MagicMock()
+    db.get_questions_by_difficulty.return_value = []
+    db.insert_evaluated_questions_batch.side_effect = lambda questions: [1] * len(
+        questions
+    )
+    return db
+
+
+def _make_worker(pipeline, db=None, **kwargs) -> GenerationWorker:
+    deduplicator = MagicMock()
+    deduplicator.check_duplicate.side_effect = lambda question, existing: MagicMock(
+        is_duplicate=any(
+            e["question_text"] == question.question_text for e in existing
+        ),
+        duplicate_type="exact",
+        similarity_score=1.0,
+    )
+    return GenerationWorker(
+        pipeline=pipeline,
+        judge=_make_judge(),
+        db=db or _make_db(),
+        deduplicator=deduplicator,
+        min_score=0.7,
+        max_concurrent_judge=1,
+        **kwargs,
+    )
+
+
+def _wait_finished(worker: GenerationWorker, job_id: str, timeout: float = 5.0):
+    for _ in range(int(timeout / 0.01)):
+        job = worker.get_job(job_id)
+        if job.finished:
+            return job
+        threading.Event().wait(0.01)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+@pytest.fixture(autouse=True)
+def mock_observability():
+    with (
+        patch("app.generation.worker.observability"),
+        patch("app.generation.streaming_runner.observability"),
+        patch("app.generation.runner.observability"),
+        patch("app.evaluation.runner.observability"),
+        patch("app.data.dedup_runner.observability"),
+        patch("app.data.insertion_runner.observability"),
+    ):
+        yield
+
+
+class TestGenerationWorker:
+    def test_jobs_reuse_components_and_dedup_cache(self):
+        db = _make_db()
+        finished = []
+        pipeline = _make_pipeline([TEXTS[0], TEXTS[1], TEXTS[0]])
+        worker = _make_worker(pipeline, db=db, on_job_finished=finished.append)
+        worker.start()
+        try:
+            jobs = [
+                _wait_finished(worker, worker.submit(count=1).job_id) for _ in range(3)
+            ]
+        finally:
+            worker.stop()
+
+        assert [job.status for job in jobs] == [
+            JobStatus.SUCCEEDED,
+            JobStatus.SUCCEEDED,
+            JobStatus.FAILED,  # duplicate of the first job's question
+        ]
+        assert jobs[0].result.inserted_count == 1
+        assert jobs[0].summary["database"]["inserted"] == 1
+        # Existing questions are loaded once and extended with inserted ones
+        db.get_questions_by_difficulty.assert_called_once_with("medium")
+        assert finished == jobs
+        pipeline.cleanup.assert_awaited_once()
+        db.close.assert_called_once()
+
+    def test_full_queue_rejects_job(self):
+        release = threading.Event()
+        worker = _make_worker(_make_pipeline(TEXTS, release), max_queued_jobs=1)
+        worker.start()
+        try:
+            running = worker.submit(count=1)
+            for _ in range(500):
+                if worker.get_job(running.job_id).status is JobStatus.RUNNING:
+                    break
+                threading.Event().wait(0.01)
+            queued = worker.submit(count=1)
+
+            with pytest.raises(WorkerBusyError):
+                worker.submit(count=1)
+
+            release.set()
+            assert _wait_finished(worker, queued.job_id).status is JobStatus.SUCCEEDED
+        finally:
+            worker.stop()
+
+    def test_cancel_queued_and_running_jobs(self):
+        worker = _make_worker(_make_pipeline(TEXTS, threading.Event()))
+        worker.start()
+        try:
+            running = worker.submit(count=1)
+            queued = worker.submit(count=1)
+
+            assert worker.cancel(queued.job_id).status is JobStatus.CANCELLED
+            for _ in range(500):
+                if worker.get_job(running.job_id).status is JobStatus.RUNNING:
+                    break
+                threading.Event().wait(0.01)
+            worker.cancel(running.job_id)
+
+            job = _wait_finished(worker, running.job_id)
+            assert job.status is JobStatus.CANCELLED
+            assert job.cancel_requested
+            assert worker.cancel("unknown") is None
+        finally:
+            worker.stop()
+
+    def test_stop_cancels_running_job(self):
+        worker = _make_worker(_make_pipeline(TEXTS, threading.Event()))
+        worker.start()
+        job = worker.submit(count=1)
+        for _ in range(500):
+            if job.status is JobStatus.RUNNING:
+                break
+            threading.Event().wait(0.01)
+
+        worker.stop()
+
+        assert job.status is JobStatus.CANCELLED
+        with pytest.raises(RuntimeError, match="not running"):
+            worker.submit(count=1)
@@ -16,6 +16,7 @@ from app.infrastructure.circuit_breaker import (
     get_circuit_breaker_registry,
     reset_circuit_breaker_registry,
 )
+from app.infrastructure.circuit_breaker_state import SQLiteCircuitBreakerStore
 from gioe_libs.alerting.alerting import AlertManager
 
 
@@ -593,6 +594,110 @@ class TestGlobalRegistry:
         assert new_breaker is None  # Should not exist in new registry
 
 
+class TestSharedCircuitBreakerState:
+    """Tests for circuit breakers sharing state through a state store."""
+
+    @pytest.fixture
+    def config(self):
+        return CircuitBreakerConfig(
+            failure_threshold=3,
+            error_rate_threshold=0.5,
+            window_size=4,
+            recovery_timeout=60.0,
+            sync_interval=0.0,
+        )
+
+    @pytest.fixture
+    def breakers(self, tmp_path, config):
+        """Two breakers for one provider, each with its own store connection."""
+        path = str(tmp_path / "breakers.sqlite3")
+        stores = [SQLiteCircuitBreakerStore(path), SQLiteCircuitBreakerStore(path)]
+        yield [
+            CircuitBreaker("openai", config=config, state_store=store)
+            for store in stores
+        ]
+        for store in stores:
+            store.close()
+
+    @staticmethod
+    def _sync(*breakers):
+        """Wait for each breaker's background merge, in order."""
+        for breaker in breakers:
+            assert breaker.sync(timeout=5.0)
+
+    def test_open_in_one_process_blocks_the_other(self, breakers):
+        """Test a circuit opened by one breaker rejects calls in the other."""
+        first, second = breakers
+        for _ in range(3):
+            first.record_failure()
+        self._sync(first, second)
+
+        assert first.state == CircuitState.OPEN
+        assert not second.is_available
+        with pytest.raises(CircuitBreakerOpen):
+            second.execute(lambda: "ok")
+
+    def test_error_window_is_merged(self, breakers):
+        """Test failures split across breakers open the shared circuit."""
+        first, second = breakers
+        first.record_success()
+        first.record_failure()
+        self._sync(first)
+        second.record_failure()
+        second.record_failure()
+        self._sync(second, first)
+
+        assert second.state == CircuitState.OPEN
+        assert not first.is_available
+
+    def test_reset_propagates(self, breakers):
+        """Test resetting one breaker closes the circuit for the other."""
+        first, second = breakers
+        for _ in range(3):
+            first.record_failure()
+        self._sync(first, second)
+        assert not second.is_available
+
+        first.reset()
+        self._sync(first, second)
+
+        assert second.is_available
+        assert second.state == CircuitState.CLOSED
+        assert second.get_stats()["consecutive_failures"] == 0
+
+    def test_store_errors_fall_back_to_local_state(self, config):
+        """Test a failing store leaves the breaker working on local state."""
+        store = MagicMock()
+        store.update.side_effect = OSError("disk full")
+        breaker = CircuitBreaker("openai", config=config, state_store=store)
+
+        assert breaker.execute(lambda: "ok") == "ok"
+        for _ in range(3):
+            breaker.record_failure()
+        assert breaker.sync(timeout=5.0)
+        assert breaker.state == CircuitState.OPEN
+
+    def test_slow_store_never_blocks_calls(self, config):
+        """Test calls only read local state while a merge waits on the store."""
+        release = threading.Event()
+        store = MagicMock()
+        store.update.side_effect = lambda name, merge: (
+            release.wait(5.0) and merge(None)
+        )
+        breaker = CircuitBreaker("openai", config=config, state_store=store)
+
+        start = time.monotonic()
+        for _ in range(3):
+            breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.is_available
+        assert time.monotonic() - start < 1.0
+
+        release.set()
+        assert breaker.sync(timeout=5.0)
+        assert breaker.state == CircuitState.OPEN
+
+
 class TestCircuitBreakerOpen:
     """Tests for CircuitBreakerOpen exception."""
 
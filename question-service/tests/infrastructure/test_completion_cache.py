@@ -0,0 +1,196 @@
+"""Tests for the persistent LLM completion cache."""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.infrastructure.completion_cache import (
+    CompletionCache,
+    CompletionCacheMissError,
+)
+from app.observability.cost_tracking import CompletionResult, TokenUsage
+from app.providers.base import BaseLLMProvider
+
+
+def _key(prompt: str = "Rate this question", **overrides) -> str:
+    request = {
+        "provider": "openai",
+        "model": "gpt-4o",
+        "prompt": prompt,
+        "response_format": {},
+        "temperature": 0.3,
+        "max_tokens": 500,
+        **overrides,
+    }
+    return CompletionCache.compute_key(**request)
+
+
+class CountingProvider(BaseLLMProvider):
+    """Provider returning a numbered structured completion per API call."""
+
+    def __init__(self) -> None:
+        super().__init__(api_key="test-key", model="test-model")
+        self.calls = 0
+
+    def _generate_structured_completion_internal(self, prompt, **kwargs):
+        self.calls += 1
+        return CompletionResult(
+            content={"score": self.calls},
+            token_usage=TokenUsage(
+                input_tokens=10, output_tokens=5, model=self.model, provider="test"
+            ),
+        )
+
+    async def _generate_structured_completion_internal_async(self, prompt, **kwargs):
+        return self._generate_structured_completion_internal(prompt, **kwargs)
+
+    def generate_completion(self, prompt, **kwargs):
+        raise NotImplementedError
+
+    def generate_structured_completion(self, prompt, response_format, **kwargs):
+        raise NotImplementedError
+
+    def count_tokens(self, text):
+        return len(text) // 4
+
+    async def generate_completion_async(self, prompt, **kwargs):
+        raise NotImplementedError
+
+    async def generate_structured_completion_async(
+        self, prompt, response_format, **kwargs
+    ):
+        raise NotImplementedError
+
+    def get_available_models(self):
+        return ["test-model"]
+
+
+class TestCompletionCache:
+    """Tests for CompletionCache storage."""
+
+    def test_round_trip_persists_across_instances(self, tmp_path):
+        """Test a stored completion is served by a later cache on the same file."""
+        path = str(tmp_path / "cache.sqlite3")
+        cache = CompletionCache(path)
+        cache.set(_key(), "openai", "gpt-4o", {"score": 8, "notes": ["clear"]})
+        cache.close()
+
+        reopened = CompletionCache(path)
+
+        assert reopened.get(_key()) == {"score": 8, "notes": ["clear"]}
+        assert reopened.get(_key("Another prompt")) is None
+        assert reopened.get_stats()["hits"] == 1
+        assert reopened.get_stats()["misses"] == 1
+
+    def test_key_covers_every_request_field(self):
+        """Test changing any request field changes the key."""
+        base = _key()
+
+        assert _key() == base
+        assert _key(temperature=0.2) != base
+        assert _key(model="gpt-4o-mini") != base
+        assert _key(provider="anthropic") != base
+        assert _key(response_format={"type": "json"}) != base
+        assert _key(top_p=0.9) != base
+
+    def test_expired_entries_are_misses(self, tmp_path):
+        """Test entries older than the TTL are not served."""
+        cache = CompletionCache(str(tmp_path / "cache.sqlite3"), ttl_seconds=60)
+        with patch("app.infrastructure.completion_cache.time.time", return_value=0):
+            cache.set(_key(), "openai", "gpt-4o", {"score": 8})
+
+        with patch("app.infrastructure.completion_cache.time.time", return_value=61):
+            assert cache.get(_key()) is None
+        assert cache.get_stats()["size"] == 0
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Test the oldest-accessed entry is evicted beyond max_entries."""
+        cache = CompletionCache(str(tmp_path / "cache.sqlite3"), max_entries=2)
+        with patch("app.infrastructure.completion_cache.time.time") as now:
+            now.return_value = 1
+            cache.set(_key("a"), "openai", "gpt-4o", "A")
+            now.return_value = 2
+            cache.set(_key("b"), "openai", "gpt-4o", "B")
+            now.return_value = 3
+            assert cache.get(_key("a")) == "A"
+            now.return_value = 4
+            cache.set(_key("c"), "openai", "gpt-4o", "C")
+
+        assert cache.get(_key("b")) is None
+        assert cache.get(_key("a")) == "A"
+        assert cache.get(_key("c")) == "C"
+        assert cache.get_stats()["evictions"] == 1
+
+    @pytest.mark.parametrize(
+        "mode,temperature,serves,stores",
+        [
+            ("read_write", 0.3, True, True),
+            ("read_write", 0.8, False, False),
+            ("record", 0.8, False, True),
+            ("replay", 0.8, True, False),
+        ],
+    )
+    def test_modes(self, tmp_path, mode, temperature, serves, stores):
+        """Test which requests each mode serves from and stores in the cache."""
+        cache = CompletionCache(str(tmp_path / "cache.sqlite3"), mode=mode)
+
+        assert cache.serves(temperature) is serves
+        assert cache.stores(temperature) is stores
+
+    def test_rejects_off_mode(self, tmp_path):
+        """Test an 'off' cache cannot be constructed."""
+        with pytest.raises(ValueError):
+            CompletionCache(str(tmp_path / "cache.sqlite3"), mode="off")
+
+
+class TestProviderCompletionCache:
+    """Tests for the cache behind BaseLLMProvider structured completions."""
+
+    def _complete(self, provider, temperature=0.3):
+        return provider.generate_structured_completion_with_usage(
+            prompt="Rate this question", response_format={}, temperature=temperature
+        )
+
+    def test_read_write_serves_repeated_requests(self, tmp_path):
+        """Test identical requests reach the provider once."""
+        cache = CompletionCache(str(tmp_path / "cache.sqlite3"))
+        provider = CountingProvider()
+
+        with patch("app.providers.base.get_completion_cache", return_value=cache):
+            first = self._complete(provider)
+            second = self._complete(provider)
+            sampled = self._complete(provider, temperature=0.9)
+
+        assert provider.calls == 2
+        assert first.content == second.content == {"score": 1}
+        assert first.token_usage is not None
+        assert second.token_usage is None
+        assert sampled.content == {"score": 2}
+
+    async def test_replay_serves_recorded_responses_offline(self, tmp_path):
+        """Test replay serves what record stored and never calls the provider."""
+        path = str(tmp_path / "cache.sqlite3")
+        recorder = CountingProvider()
+        with patch(
+            "app.providers.base.get_completion_cache",
+            return_value=CompletionCache(path, mode="record"),
+        ):
+            recorded = await recorder.generate_structured_completion_with_usage_async(
+                prompt="Rate this question", response_format={}, temperature=0.9
+            )
+
+        replayer = CountingProvider()
+        with patch(
+            "app.providers.base.get_completion_cache",
+            return_value=CompletionCache(path, mode="replay"),
+        ):
+            replayed = await replayer.generate_structured_completion_with_usage_async(
+                prompt="Rate this question", response_format={}, temperature=0.9
+            )
+            with pytest.raises(CompletionCacheMissError):
+                await replayer.generate_structured_completion_with_usage_async(
+                    prompt="Unrecorded prompt", response_format={}, temperature=0.9
+                )
+
+        assert replayed.content == recorded.content
+        assert replayer.calls == 0
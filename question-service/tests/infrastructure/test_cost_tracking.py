@@ -5,6 +5,7 @@ import logging
 import pytest
 
 from app.observability.cost_tracking import (
+    BATCH_PRICE_MULTIPLIER,
     COST_HISTORY_LIMIT,
     MODEL_PRICING,
     CompletionResult,
@@ -192,6 +193,50 @@ class TestCalculateCost:
 
         assert cost == pytest.approx(expected_total, rel=1e-6)
 
+    def test_calculate_cost_prices_cache_tokens_separately(self):
+        """Test cache reads cost 0.1x and cache writes 1.25x the input rate."""
+        usage = TokenUsage(
+            input_tokens=1000,
+            output_tokens=0,
+            model="claude-3-5-sonnet-20241022",
+            provider="anthropic",
+            cache_read_tokens=100_000,
+            cache_write_tokens=10_000,
+        )
+
+        cost = calculate_cost(usage)
+
+        # $3/1M input: 1000 uncached + 100k reads at $0.30 + 10k writes at $3.75
+        expected_total = (
+            (1000 / 1_000_000) * 3.00
+            + (100_000 / 1_000_000) * 0.30
+            + (10_000 / 1_000_000) * 3.75
+        )
+        assert cost == pytest.approx(expected_total, rel=1e-6)
+        assert usage.total_tokens == 111_000
+
+    def test_calculate_cost_applies_batch_discount(self):
+        """Test batch API usage costs BATCH_PRICE_MULTIPLIER of the sync price."""
+        usage = TokenUsage(
+            input_tokens=1000,
+            output_tokens=500,
+            model="claude-3-5-sonnet-20241022",
+            provider="anthropic",
+            cache_read_tokens=2000,
+        )
+        batch_usage = TokenUsage(
+            input_tokens=1000,
+            output_tokens=500,
+            model="claude-3-5-sonnet-20241022",
+            provider="anthropic",
+            cache_read_tokens=2000,
+            batch=True,
+        )
+
+        assert calculate_cost(batch_usage) == pytest.approx(
+            calculate_cost(usage) * BATCH_PRICE_MULTIPLIER, rel=1e-6
+        )
+
     def test_calculate_cost_zero_tokens(self):
         """Test cost calculation with zero tokens."""
         usage = TokenUsage(
@@ -264,6 +309,27 @@ class TestCostTracker:
         assert summary["total_tokens"] == 1500
         assert summary["total_cost_usd"] > 0
 
+    def test_record_cache_tokens(self, tracker):
+        """Test cached prompt tokens are reported apart from input tokens."""
+        tracker.record_usage(
+            TokenUsage(
+                input_tokens=50,
+                output_tokens=10,
+                model="claude-3-5-sonnet-20241022",
+                provider="anthropic",
+                cache_read_tokens=1500,
+                cache_write_tokens=200,
+            )
+        )
+
+        summary = tracker.get_summary()
+        assert summary["total_input_tokens"] == 50
+        assert summary["total_cache_read_tokens"] == 1500
+        assert summary["total_cache_write_tokens"] == 200
+        assert summary["total_tokens"] == 1760
+        model_tokens = summary["by_provider"]["anthropic"]["tokens_by_model"]
+        assert model_tokens["claude-3-5-sonnet-20241022"]["cache_read"] == 1500
+
     def test_record_multiple_usages_same_provider(self, tracker):
         """Test recording multiple usages from the same provider."""
         for _ in range(5):
@@ -0,0 +1,58 @@
+"""Tests for the compact embedding storage codec."""
+
+import numpy as np
+import pytest
+
+from app.infrastructure.embedding_codec import (
+    EMBEDDING_ENCODING_INT8,
+    decode_embedding,
+    encode_embedding,
+)
+
+
+class TestEmbeddingCodec:
+    """Tests for encode_embedding / decode_embedding."""
+
+    def test_float32_round_trip_is_zero_copy(self):
+        """Test float32 bytes decode into a view without copying."""
+        vector = np.linspace(-1.0, 1.0, 1536)
+        encoded = encode_embedding(vector, "text-embedding-3-small")
+
+        assert len(encoded.data) == 1536 * 4
+        assert encoded.dim == 1536
+        assert encoded.scale is None
+
+        decoded = decode_embedding(memoryview(encoded.data))
+        assert decoded.dtype == np.float32
+        assert not decoded.flags.owndata
+        np.testing.assert_allclose(decoded, vector, rtol=1e-6)
+
+    def test_int8_is_four_times_smaller_and_keeps_similarity(self):
+        """Test int8 quantization shrinks storage and preserves cosine."""
+        rng = np.random.default_rng(1)
+        a = rng.normal(size=768)
+        b = a + rng.normal(scale=0.3, size=768)
+
+        encoded_a = encode_embedding(a, "text-embedding-004", EMBEDDING_ENCODING_INT8)
+        encoded_b = encode_embedding(b, "text-embedding-004", EMBEDDING_ENCODING_INT8)
+        assert len(encoded_a.data) == 768
+
+        qa = decode_embedding(encoded_a.data, "int8").astype(np.float32)
+        qb = decode_embedding(encoded_b.data, "int8").astype(np.float32)
+        expected = np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b))
+        actual = np.dot(qa, qb) / (np.linalg.norm(qa) * np.linalg.norm(qb))
+        assert actual == pytest.approx(expected, abs=1e-3)
+
+    def test_zero_vector_int8(self):
+        """Test an all-zero vector quantizes without dividing by zero."""
+        encoded = encode_embedding([0.0, 0.0, 0.0], "m", EMBEDDING_ENCODING_INT8)
+
+        assert encoded.scale == pytest.approx(1.0)
+        assert decode_embedding(encoded.data, "int8").tolist() == [0, 0, 0]
+
+    def test_rejects_unknown_encoding(self):
+        """Test unknown encodings are rejected on both sides."""
+        with pytest.raises(ValueError):
+            encode_embedding([1.0], "m", "float16")
+        with pytest.raises(ValueError):
+            decode_embedding(b"\x00\x00", "float16")
@@ -0,0 +1,83 @@
+"""Tests for per-provider latency tracking."""
+
+import json
+
+import pytest
+
+from app.observability.provider_latency import ProviderLatencyTracker
+
+BENCHMARK_REPORT = {
+    "results": {
+        "openai": {
+            "questions_generated": 9,
+            "questions_failed": 1,
+            "p50_latency_ms": 2000.0,
+            "p95_latency_ms": 6000.0,
+            "p99_latency_ms": 9000.0,
+        },
+        "google": {
+            "questions_generated": 0,
+            "questions_failed": 5,
+            "p50_latency_ms": 0,
+            "p95_latency_ms": 0,
+            "p99_latency_ms": 0,
+        },
+    }
+}
+
+
+class TestProviderLatencyTracker:
+    """Tests for ProviderLatencyTracker."""
+
+    def test_percentiles_need_min_samples(self):
+        """Test live percentiles are only reported once enough calls are seen."""
+        tracker = ProviderLatencyTracker(min_samples=5)
+        for latency in (1.0, 2.0, 3.0, 4.0):
+            tracker.record("openai", "gpt-4o", latency)
+
+        assert tracker.get_percentile("openai", "gpt-4o", 0.95) is None
+
+        tracker.record("openai", "gpt-4o", 5.0)
+
+        assert tracker.get_percentile("openai", "gpt-4o", 0.5) == 3.0
+        assert tracker.get_percentile("openai", "gpt-4o", 0.95) == pytest.approx(4.8)
+        assert tracker.get_percentile("openai", "gpt-4o", 0.5, "other") is None
+
+    def test_failures_count_toward_success_rate_only(self):
+        """Test failed calls lower the success rate but add no latency."""
+        tracker = ProviderLatencyTracker(min_samples=2)
+        tracker.record("openai", "gpt-4o", 1.0)
+        tracker.record("openai", "gpt-4o", 60.0, success=False)
+
+        assert tracker.get_success_rate("openai", "gpt-4o") == 0.5
+        assert tracker.get_stats()["openai/gpt-4o/generate"]["p95_latency_s"] == 1.0
+
+    def test_benchmark_priors_until_live_data(self, tmp_path):
+        """Test benchmark results seed estimates until live calls replace them."""
+        path = tmp_path / "benchmark.json"
+        path.write_text(json.dumps(BENCHMARK_REPORT))
+        tracker = ProviderLatencyTracker(min_samples=1)
+        tracker.load_benchmark_file(str(path))
+
+        assert tracker.get_percentile("openai", "gpt-4o", 0.95) == 6.0
+        assert tracker.get_success_rate("openai", "gpt-4o") == 0.9
+        assert tracker.get_percentile("google", "gemini", 0.95) is None
+
+        tracker.record("openai", "gpt-4o", 1.5)
+
+        assert tracker.get_percentile("openai", "gpt-4o", 0.95) == 1.5
+
+    def test_benchmark_priors_only_for_single_question_calls(self):
+        """Test batch calls wait for live data instead of using the priors."""
+        tracker = ProviderLatencyTracker(min_samples=1)
+        tracker.load_benchmark(BENCHMARK_REPORT)
+
+        assert tracker.get_percentile("openai", "gpt-4o", 0.95, "generate_batch") is None
+        assert tracker.get_success_rate("openai", "gpt-4o", "generate_batch") is None
+
+    def test_unreadable_benchmark_is_ignored(self, tmp_path):
+        """Test a missing benchmark file leaves the tracker without priors."""
+        tracker = ProviderLatencyTracker()
+        tracker.load_benchmark_file(str(tmp_path / "missing.json"))
+
+        assert tracker.get_percentile("openai", "gpt-4o", 0.95) is None
@@ -289,6 +289,101 @@ class TestRunGenerationJob:
             mock_run.assert_called_once()
 
 
+class TestWarmWorkerMode:
+    """Tests for the endpoints backed by the warm generation worker."""
+
+    HEADERS = {"X-Admin-Token": "test-secret-token"}
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Reload the module with a mock worker installed."""
+        with patch.dict(os.environ, {"ADMIN_TOKEN": "test-secret-token"}, clear=False):
+            import importlib
+
+            import trigger_server
+            from app.generation.worker import GenerationJob
+
+            importlib.reload(trigger_server)
+            self.module = trigger_server
+            self.client = TestClient(trigger_server.app)
+            self.job = GenerationJob(job_id="job-1", count=10)
+            self.worker = MagicMock()
+            self.worker.submit.return_value = self.job
+            self.worker.get_job.side_effect = lambda job_id: (
+                self.job if job_id == "job-1" else None
+            )
+            self.worker.cancel.side_effect = self.worker.get_job.side_effect
+            trigger_server._worker = self.worker
+            yield
+            trigger_server._worker = None
+
+    def test_trigger_queues_job_on_worker(self):
+        """Test that /trigger queues on the worker instead of a subprocess."""
+        with patch.object(self.module, "run_generation_job") as run_job:
+            response = self.client.post(
+                "/trigger",
+                json={"count": 10, "types": ["logic"]},
+                headers=self.HEADERS,
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "queued"
+        assert data["job_id"] == "job-1"
+        run_job.assert_not_called()
+        types = self.worker.submit.call_args.kwargs["question_types"]
+        assert [qt.value for qt in types] == ["logic"]
+
+    def test_trigger_with_full_queue_returns_409(self):
+        """Test that a full worker queue is reported as a conflict."""
+        from app.generation.worker import WorkerBusyError
+
+        self.worker.submit.side_effect = WorkerBusyError("queue full")
+
+        response = self.client.post(
+            "/trigger", json={"count": 10}, headers=self.HEADERS
+        )
+
+        assert response.status_code == 409
+        assert "queue full" in response.json()["detail"]
+
+    def test_get_job_status(self):
+        """Test that job state is returned by ID."""
+        response = self.client.get("/jobs/job-1", headers=self.HEADERS)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "queued"
+        assert data["count"] == 10
+        assert data["questions_inserted"] is None
+
+    def test_cancel_job(self):
+        """Test that DELETE cancels the job on the worker."""
+        response = self.client.delete("/jobs/job-1", headers=self.HEADERS)
+
+        assert response.status_code == 200
+        self.worker.cancel.assert_called_once_with("job-1")
+
+    def test_unknown_job_returns_404(self):
+        """Test that unknown jobs return 404."""
+        assert self.client.get("/jobs/nope", headers=self.HEADERS).status_code == 404
+        assert self.client.delete("/jobs/nope", headers=self.HEADERS).status_code == 404
+
+    def test_jobs_return_404_in_subprocess_mode(self):
+        """Test that /jobs is unavailable without the warm worker."""
+        self.module._worker = None
+
+        response = self.client.get("/jobs/job-1", headers=self.HEADERS)
+
+        assert response.status_code == 404
+
+    def test_jobs_require_admin_token(self):
+        """Test that /jobs rejects an invalid admin token."""
+        response = self.client.get("/jobs/job-1", headers={"X-Admin-Token": "bad"})
+
+        assert response.status_code == 401
+
+
 class TestVerifyAdminToken:
     """Tests for the verify_admin_token dependency."""
 
@@ -0,0 +1,305 @@
+"""Local fake of the OpenAI and Anthropic batch APIs for provider tests.
+
+Serves just enough of both APIs for the official SDKs to create, poll, read
+and cancel batch jobs:
+
+    OpenAI     POST /v1/files, POST /v1/batches, GET /v1/batches/{id},
+               GET /v1/files/{id}/content, POST /v1/batches/{id}/cancel
+    Anthropic  POST /v1/messages/batches, GET /v1/messages/batches/{id},
+               GET /v1/messages/batches/{id}/results,
+               POST /v1/messages/batches/{id}/cancel
+
+Point OpenAIProvider at ``server.openai_base_url`` and AnthropicProvider at
+``server.url``. Each request's prompt is answered by ``respond(prompt)``; a
+None answer makes that request fail. Jobs finish on the polls_until_done-th
+status check.
+"""
+
+import json
+import re
+import threading
+from email.parser import BytesParser
+from email.policy import default as default_policy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+TIMESTAMP = "2026-01-01T00:00:00Z"
+
+
+class FakeBatchServer:
+    """In-process HTTP server emulating provider batch endpoints."""
+
+    def __init__(
+        self,
+        respond: Callable[[str], Optional[str]],
+        polls_until_done: int = 2,
+    ) -> None:
+        self.respond = respond
+        self.polls_until_done = polls_until_done
+        # Batch request bodies as submitted, by job ID
+        self.submitted: Dict[str, List[Dict[str, Any]]] = {}
+        self.cancelled: List[str] = []
+        self._files: Dict[str, bytes] = {}
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def openai_base_url(self) -> str:
+        return f"{self.url}/v1"
+
+    def __enter__(self) -> "FakeBatchServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    # -- job bookkeeping ----------------------------------------------------
+
+    def _new_job(self, kind: str, requests: List[Dict[str, Any]]) -> Dict[str, Any]:
+        with self._lock:
+            job_id = f"{kind}-batch-{len(self._jobs) + 1}"
+            job = {"id": job_id, "kind": kind, "requests": requests, "polls": 0}
+            self._jobs[job_id] = job
+            self.submitted[job_id] = requests
+        return job
+
+    def _poll(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None and "results" not in job:
+                job["polls"] += 1
+                if job["polls"] >= self.polls_until_done:
+                    job["results"] = [
+                        (request["custom_id"], self.respond(_prompt_of(request)))
+                        for request in job["requests"]
+                    ]
+        return job
+
+    def _cancel(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                job["cancelled"] = True
+                self.cancelled.append(job_id)
+        return job
+
+    # -- OpenAI -------------------------------------------------------------
+
+    def _openai_batch(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        results = job.get("results")
+        if job.get("cancelled"):
+            status = "cancelled"
+        elif results is None:
+            status = "in_progress"
+        else:
+            status = "completed"
+        batch = {
+            "id": job["id"],
+            "object": "batch",
+            "endpoint": "/v1/chat/completions",
+            "input_file_id": job["input_file_id"],
+            "completion_window": "24h",
+            "status": status,
+            "created_at": 0,
+            "metadata": job.get("metadata"),
+            "output_file_id": None,
+            "error_file_id": None,
+            "request_counts": {
+                "total": len(job["requests"]),
+                "completed": 0,
+                "failed": 0,
+            },
+        }
+        if status == "completed":
+            output, errors = [], []
+            for custom_id, text in results:
+                if text is None:
+                    errors.append(
+                        {
+                            "custom_id": custom_id,
+                            "response": {
+                                "status_code": 500,
+                                "body": {"error": {"message": "server error"}},
+                            },
+                            "error": None,
+                        }
+                    )
+                else:
+                    output.append(
+                        {
+                            "custom_id": custom_id,
+                            "response": {
+                                "status_code": 200,
+                                "body": {
+                                    "choices": [{"message": {"content": text}}],
+                                    "usage": {
+                                        "prompt_tokens": 10,
+                                        "completion_tokens": 5,
+                                    },
+                                },
+                            },
+                            "error": None,
+                        }
+                    )
+            batch["output_file_id"] = self._store_file(output) if output else None
+            batch["error_file_id"] = self._store_file(errors) if errors else None
+            batch["request_counts"]["completed"] = len(output)
+            batch["request_counts"]["failed"] = len(errors)
+        return batch
+
+    def _store_file(self, records: List[Dict[str, Any]]) -> str:
+        file_id = f"file-{len(self._files) + 1}"
+        self._files[file_id] = "\n".join(json.dumps(r) for r in records).encode()
+        return file_id
+
+    # -- Anthropic ----------------------------------------------------------
+
+    def _anthropic_batch(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        ended = job.get("cancelled") or job.get("results") is not None
+        return {
+            "id": job["id"],
+            "type": "message_batch",
+            "processing_status": "ended" if ended else "in_progress",
+            "request_counts": {
+                "processing": 0 if ended else len(job["requests"]),
+                "succeeded": 0,
+                "errored": 0,
+                "canceled": 0,
+                "expired": 0,
+            },
+            "results_url": (
+                f"{self.url}/v1/messages/batches/{job['id']}/results" if ended else None
+            ),
+            "created_at": TIMESTAMP,
+            "expires_at": TIMESTAMP,
+            "ended_at": TIMESTAMP if ended else None,
+            "archived_at": None,
+            "cancel_initiated_at": None,
+        }
+
+    def _anthropic_results(self, job: Dict[str, Any]) -> bytes:
+        lines = []
+        results = job.get("results") or [
+            (request["custom_id"], None) for request in job["requests"]
+        ]
+        for custom_id, text in results:
+            if job.get("cancelled") and job.get("results") is None:
+                result: Dict[str, Any] = {"type": "canceled"}
+            elif text is None:
+                result = {
+                    "type": "errored",
+                    "error": {
+                        "type": "error",
+                        "error": {"type": "api_error", "message": "server error"},
+                    },
+                }
+            else:
+                result = {
+                    "type": "succeeded",
+                    "message": {
+                        "id": "msg_1",
+                        "type": "message",
+                        "role": "assistant",
+                        "model": "claude-test",
+                        "content": [{"type": "text", "text": text}],
+                        "stop_reason": "end_turn",
+                        "stop_sequence": None,
+                        "usage": {"input_tokens": 10, "output_tokens": 5},
+                    },
+                }
+            lines.append(json.dumps({"custom_id": custom_id, "result": result}))
+        return "\n".join(lines).encode()
+
+    # -- HTTP ---------------------------------------------------------------
+
+    def _route(self, method: str, path: str, headers: Any, body: bytes) -> Tuple:
+        if method == "POST" and path == "/v1/files":
+            content = _multipart_file(headers["Content-Type"], body)
+            with self._lock:
+                file_id = f"file-{len(self._files) + 1}"
+                self._files[file_id] = content
+            return 200, {"id": file_id, "object": "file", "purpose": "batch"}
+        if method == "POST" and path == "/v1/batches":
+            payload = json.loads(body)
+            requests = [
+                json.loads(line)
+                for line in self._files[payload["input_file_id"]].decode().splitlines()
+            ]
+            job = self._new_job("openai", requests)
+            job["input_file_id"] = payload["input_file_id"]
+            job["metadata"] = payload.get("metadata")
+            return 200, self._openai_batch(job)
+        if method == "POST" and path == "/v1/messages/batches":
+            job = self._new_job("anthropic", json.loads(body)["requests"])
+            return 200, self._anthropic_batch(job)
+
+        match = re.fullmatch(r"/v1/files/([^/]+)/content", path)
+        if method == "GET" and match:
+            return 200, self._files[match.group(1)]
+        match = re.fullmatch(r"/v1/(batches|messages/batches)/([^/]+)(/\w+)?", path)
+        if match is None:
+            return 404, {"error": {"type": "not_found", "message": path}}
+        job_id, action = match.group(2), match.group(3)
+        if action == "/cancel":
+            job = self._cancel(job_id)
+        elif action == "/results":
+            job = self._jobs.get(job_id)
+            return 200, self._anthropic_results(job) if job else b""
+        else:
+            job = self._poll(job_id)
+        if job is None:
+            return 404, {"error": {"type": "not_found", "message": job_id}}
+        if job["kind"] == "openai":
+            return 200, self._openai_batch(job)
+        return 200, self._anthropic_batch(job)
+
+    def _make_handler(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _handle(self, method: str) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                status, payload = server._route(method, self.path, self.headers, body)
+                data = payload if isinstance(payload, bytes) else json.dumps(payload)
+                data = data if isinstance(data, bytes) else data.encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self) -> None:
+                self._handle("GET")
+
+            def do_POST(self) -> None:
+                self._handle("POST")
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        return Handler
+
+
+def _prompt_of(request: Dict[str, Any]) -> str:
+    body = request.get("body") or request.get("params") or {}
+    return body["messages"][0]["content"]
+
+
+def _multipart_file(content_type: str, body: bytes) -> bytes:
+    message = BytesParser(policy=default_policy).parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode() + body
+    )
+    for part in message.iter_parts():
+        if part.get_param("name", header="content-disposition") == "file":
+            return part.get_payload(decode=True)
+    raise ValueError("multipart body has no file part")
@@ -6,8 +6,9 @@ from unittest.mock import AsyncMock, MagicMock, Mock, patch
 import pytest
 from anthropic import AnthropicError
 
+from app.generation.prompts import JUDGE_PROMPT_PREFIX, build_judge_prompt
 from app.providers.anthropic_provider import ANTHROPIC_MODELS, AnthropicProvider
-from app.providers.base import LLMProviderError
+from app.providers.base import LLMProviderError, register_cacheable_prefix
 
 
 class TestAnthropicProvider:
@@ -390,3 +391,72 @@ class TestAnthropicProvider:
         )
 
         assert result == {}
+
+
+class TestAnthropicPromptCaching:
+    """Tests for marking registered prompt prefixes as cacheable."""
+
+    @patch("app.providers.anthropic_provider.Anthropic")
+    def test_registered_prefix_is_sent_with_cache_control(
+        self, mock_anthropic_class, mock_anthropic_api_key
+    ):
+        """Test a long registered prefix becomes a cached content block."""
+        mock_client = MagicMock()
+        mock_anthropic_class.return_value = mock_client
+        mock_response = Mock()
+        mock_response.content = [Mock(text='{"ok": true}')]
+        mock_response.usage = Mock(
+            input_tokens=50,
+            output_tokens=10,
+            cache_creation_input_tokens=0,
+            cache_read_input_tokens=1500,
+        )
+        mock_client.messages.create.return_value = mock_response
+        prefix = "Shared instructions. " * 300
+        register_cacheable_prefix(prefix)
+
+        provider = AnthropicProvider(api_key=mock_anthropic_api_key)
+        result = provider.generate_structured_completion_with_usage(
+            prefix + "Question-specific part", response_format={}
+        )
+
+        (message,) = mock_client.messages.create.call_args.kwargs["messages"]
+        assert message["content"] == [
+            {"type": "text", "text": prefix, "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": "Question-specific part"},
+        ]
+        assert result.token_usage.input_tokens == 50
+        assert result.token_usage.cache_read_tokens == 1500
+        assert result.token_usage.cache_write_tokens == 0
+
+    def test_short_prefix_is_sent_as_plain_text(self, mock_anthropic_api_key):
+        """Test prefixes below Anthropic's cache minimum are not marked."""
+        register_cacheable_prefix("Short prefix. ")
+        provider = AnthropicProvider(api_key=mock_anthropic_api_key)
+
+        assert provider._user_message("Short prefix. Rest") == {
+            "role": "user",
+            "content": "Short prefix. Rest",
+        }
+
+    def test_judge_prompt_prefix_is_sent_with_cache_control(
+        self, mock_anthropic_api_key
+    ):
+        """Test the judge prefix clears the cache minimum and is marked cacheable."""
+        prompt = build_judge_prompt(
+            question="What number comes next: 2, 6, 12, 20, ?",
+            answer_options=["28", "30", "32", "36"],
+            correct_answer="30",
+            question_type="pattern",
+            difficulty="medium",
+        )
+        provider = AnthropicProvider(api_key=mock_anthropic_api_key)
+
+        prefix_block, rest_block = provider._user_message(prompt)["content"]
+
+        assert prefix_block == {
+            "type": "text",
+            "text": JUDGE_PROMPT_PREFIX,
+            "cache_control": {"type": "ephemeral"},
+        }
+        assert "What number comes next" in rest_block["text"]
@@ -0,0 +1,173 @@
+"""Tests for the OpenAI and Anthropic batch APIs against a local fake server."""
+
+import json
+
+import pytest
+
+from app.observability.cost_tracking import track_costs
+from app.providers.anthropic_provider import AnthropicProvider
+from app.providers.base import BatchJobResult
+from app.providers.openai_provider import OpenAIProvider
+from app.providers.xai_provider import XAIProvider
+from tests.providers.fake_batch_server import FakeBatchServer
+
+PROMPTS = ["Rate question A", "Rate question B (fails)", "Rate question C"]
+
+
+def _respond(prompt: str):
+    if "fails" in prompt:
+        return None
+    return json.dumps({"prompt": prompt.splitlines()[0]})
+
+
+@pytest.fixture
+def server():
+    with FakeBatchServer(_respond) as fake:
+        yield fake
+
+
+@pytest.fixture
+def openai_provider(server):
+    return OpenAIProvider(
+        api_key="sk-test", model="gpt-4o", base_url=server.openai_base_url
+    )
+
+
+@pytest.fixture
+def anthropic_provider(server):
+    return AnthropicProvider(
+        api_key="sk-ant-test", model="claude-test", base_url=server.url
+    )
+
+
+def _texts_by_key(result: BatchJobResult) -> dict:
+    return {r["key"]: json.loads(r["text"])["prompt"] for r in result.responses}
+
+
+def _assert_batch_usage_recorded(result: BatchJobResult, tracker, model: str):
+    """Assert each succeeded request's usage was recorded at the batch price."""
+    assert [(u.model, u.input_tokens, u.output_tokens) for u in result.token_usage] == [
+        (model, 10, 5),
+        (model, 10, 5),
+    ]
+    assert all(u.batch for u in result.token_usage)
+    summary = tracker.get_summary()
+    assert (summary["total_input_tokens"], summary["total_output_tokens"]) == (20, 10)
+
+
+class TestOpenAIBatch:
+    """Tests for OpenAIProvider batch jobs."""
+
+    async def test_round_trip_with_partial_failure(self, server, openai_provider):
+        """Test responses are keyed by prompt index and failures are reported."""
+        result = await openai_provider.generate_batch_completions_async(
+            PROMPTS, max_tokens=300, poll_interval=0.01, response_format={}
+        )
+
+        assert result.state == "completed"
+        assert _texts_by_key(result) == {
+            "request-0": "Rate question A",
+            "request-2": "Rate question C",
+        }
+        assert (result.total_requests, result.failed_requests) == (3, 1)
+        assert "request-1" in result.errors[0]
+
+        (submitted,) = server.submitted.values()
+        assert [r["custom_id"] for r in submitted] == [
+            "request-0",
+            "request-1",
+            "request-2",
+        ]
+        assert submitted[0]["url"] == "/v1/chat/completions"
+        assert submitted[0]["body"]["response_format"] == {"type": "json_object"}
+        assert submitted[0]["body"]["max_tokens"] == 300
+
+    async def test_usage_is_recorded_at_batch_price(self, openai_provider):
+        """Test each result's body.usage is tracked against the requested model."""
+        with track_costs() as tracker:
+            result = await openai_provider.generate_batch_completions_async(
+                PROMPTS, model_override="gpt-4o-mini", poll_interval=0.01
+            )
+
+        _assert_batch_usage_recorded(result, tracker, "gpt-4o-mini")
+
+    async def test_timeout_and_cancel(self, server, openai_provider):
+        """Test waiting past the timeout raises and the job can be cancelled."""
+        server.polls_until_done = 1000
+        job_name = openai_provider.create_batch_job(PROMPTS)
+
+        with pytest.raises(TimeoutError):
+            await openai_provider.wait_for_batch_job_async(
+                job_name, poll_interval=0.01, timeout=0.05
+            )
+        openai_provider.cancel_batch_job(job_name)
+
+        assert server.cancelled == [job_name]
+        assert openai_provider.get_batch_job_status(job_name) == "cancelled"
+
+
+class TestAnthropicBatch:
+    """Tests for AnthropicProvider message batches."""
+
+    async def test_round_trip_with_partial_failure(self, server, anthropic_provider):
+        """Test succeeded and errored results are separated by custom_id."""
+        result = await anthropic_provider.generate_batch_completions_async(
+            PROMPTS, temperature=0.2, poll_interval=0.01, response_format={}
+        )
+
+        assert result.state == "ended"
+        assert _texts_by_key(result) == {
+            "request-0": "Rate question A",
+            "request-2": "Rate question C",
+        }
+        assert (result.successful_requests, result.failed_requests) == (2, 1)
+
+        (submitted,) = server.submitted.values()
+        assert submitted[1]["custom_id"] == "request-1"
+        assert submitted[1]["params"]["model"] == "claude-test"
+        assert submitted[1]["params"]["temperature"] == 0.2
+
+    async def test_usage_is_recorded_at_batch_price(self, anthropic_provider):
+        """Test each succeeded result's message.usage is tracked."""
+        with track_costs() as tracker:
+            result = await anthropic_provider.generate_batch_completions_async(
+                PROMPTS, poll_interval=0.01
+            )
+
+        _assert_batch_usage_recorded(result, tracker, "claude-test")
+
+    async def test_cancelled_batch_reports_canceled_requests(
+        self, server, anthropic_provider
+    ):
+        """Test a cancelled batch ends with every request failed."""
+        server.polls_until_done = 1000
+        job_name = anthropic_provider.create_batch_job(PROMPTS)
+        anthropic_provider.cancel_batch_job(job_name)
+
+        result = await anthropic_provider.wait_for_batch_job_async(
+            job_name, poll_interval=0.01
+        )
+
+        assert result.responses == []
+        assert result.failed_requests == 3
+
+
+class TestBatchSupport:
+    """Tests for the common batch interface."""
+
+    def test_providers_without_batch_api(self):
+        """Test providers without a batch endpoint refuse batch jobs."""
+        provider = XAIProvider(api_key="xai-test")
+
+        assert not provider.supports_batch
+        with pytest.raises(NotImplementedError):
+            provider.create_batch_job(PROMPTS)
+
+    def test_rejects_empty_and_oversized_batches(self, openai_provider):
+        """Test prompt count is validated against max_batch_size."""
+        openai_provider.max_batch_size = 2
+
+        with pytest.raises(ValueError, match="cannot be empty"):
+            openai_provider.create_batch_job([])
+        with pytest.raises(ValueError, match="exceeds maximum of 2"):
+            openai_provider.create_batch_job(PROMPTS)
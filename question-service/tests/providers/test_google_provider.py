@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
+from app.observability.cost_tracking import calculate_cost, track_costs
 from app.providers.base import LLMProviderError
 from app.providers.google_provider import (
     BatchJobResult,
@@ -311,27 +312,45 @@ class TestBatchAPI:
         mock_running_job = Mock()
         mock_running_job.state.name = "JOB_STATE_RUNNING"
 
+        usage = Mock(prompt_token_count=100, candidates_token_count=40)
         mock_completed_job = Mock()
         mock_completed_job.name = "batches/batch-123"
+        mock_completed_job.model = "models/gemini-2.5-pro"
         mock_completed_job.state.name = "JOB_STATE_SUCCEEDED"
         mock_completed_job.dest = Mock()
         mock_completed_job.dest.inlined_responses = [
-            Mock(response=Mock(text="Response 1"), error=None, key="request-0"),
-            Mock(response=Mock(text="Response 2"), error=None, key="request-1"),
+            Mock(
+                response=Mock(text="Response 1", usage_metadata=usage),
+                error=None,
+                key="request-0",
+            ),
+            Mock(
+                response=Mock(text="Response 2", usage_metadata=usage),
+                error=None,
+                key="request-1",
+            ),
         ]
 
         mock_client.batches.get.side_effect = [mock_running_job, mock_completed_job]
 
         provider = GoogleProvider(api_key=mock_google_api_key)
-        result = provider.wait_for_batch_job(
-            "batches/batch-123",
-            poll_interval=0.1,
-        )
+        with track_costs() as tracker:
+            result = provider.wait_for_batch_job(
+                "batches/batch-123",
+                poll_interval=0.1,
+            )
 
         assert isinstance(result, BatchJobResult)
         assert result.state == "JOB_STATE_SUCCEEDED"
         assert result.successful_requests == 2
         assert len(result.responses) == 2
+        assert [u.model for u in result.token_usage] == ["gemini-2.5-pro"] * 2
+        assert all(u.batch for u in result.token_usage)
+        summary = tracker.get_summary()
+        assert summary["total_input_tokens"] == 200
+        assert summary["total_cost_usd"] == pytest.approx(
+            sum(calculate_cost(u) for u in result.token_usage)
+        )
 
     @patch("app.providers.google_provider.genai.Client")
     @patch("app.providers.google_provider.time.sleep")
@@ -357,6 +357,17 @@ class TestOpenAIProvider:
         token_count = provider.count_tokens("")
         assert token_count == 0
 
+    @patch("app.providers.openai_provider.OpenAI")
+    def test_effective_output_limit(self, mock_openai_class, mock_openai_api_key):
+        """Test reasoning models report the widened completion token limit."""
+        provider = OpenAIProvider(api_key=mock_openai_api_key, model="gpt-5.5")
+
+        assert provider.effective_output_limit(1000) == 4000
+        assert provider.effective_output_limit(1000, "gpt-4o") == 1000
+        assert provider._token_limit_kwargs("gpt-5.5", 1000) == {
+            "max_completion_tokens": 4000
+        }
+
     @patch("app.providers.openai_provider.OpenAI")
     def test_get_available_models(self, mock_openai_class, mock_openai_api_key):
         """Test getting list of available models."""
@@ -417,6 +417,43 @@ class TestRunJudgePhase:
         assert len(rejected) == 1
         assert rate == pytest.approx(50.0)
 
+    @patch("app.evaluation.runner.observability")
+    def test_batch_mode_collects_streamed_evaluations(self, mock_obs):
+        from app.reporting.run_summary import RunSummary as PipelineRunSummary
+        from run_generation import run_judge_phase
+
+        mock_obs.start_span.return_value = self._make_mock_span()
+
+        eq_approved = self._make_evaluated(0.9)
+        eq_rejected = self._make_evaluated(0.4)
+
+        async def evaluate_questions_batch_async(questions):
+            for evaluated in (eq_approved, eq_rejected):
+                yield evaluated
+
+        mock_judge = MagicMock()
+        mock_judge.evaluate_questions_batch_async = evaluate_questions_batch_async
+        mock_judge.cleanup = AsyncMock()
+        mock_judge.determine_difficulty_placement.return_value = (MagicMock(), None)
+
+        metrics = PipelineRunSummary()
+        metrics.start_run()
+
+        approved, rejected, rate = run_judge_phase(
+            generated_questions=[MagicMock(), MagicMock()],
+            judge=mock_judge,
+            min_score=0.7,
+            use_async_judge=True,
+            metrics=metrics,
+            logger=MagicMock(),
+            use_batch_judge=True,
+        )
+
+        assert len(approved) == 1
+        assert len(rejected) == 1
+        mock_judge.evaluate_questions_list_async.assert_not_called()
+        mock_judge.cleanup.assert_awaited_once()
+
     @patch("app.evaluation.runner.observability")
     def test_sync_skips_question_on_evaluation_error(self, mock_obs):
         from app.reporting.run_summary import RunSummary as PipelineRunSummary
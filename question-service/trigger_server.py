@@ -7,7 +7,14 @@ on-demand via HTTP requests, instead of waiting for the cron schedule.
 
 Triggers question generation with async mode enabled for fast throughput:
   python run_generation.py --count 50 --async --async-judge --verbose
+
+With TRIGGER_WORKER_MODE=warm, jobs instead run in-process on a long-lived
+GenerationWorker (app.generation.worker) that initializes the pipeline, judge,
+database and deduplication caches once at start-up and takes jobs from a
+queue, so short top-up runs skip process start-up and re-initialization.
+Queued and running jobs can be inspected and cancelled via /jobs/{job_id}.
 """
+
 import logging
 import os
 import secrets
@@ -19,7 +26,15 @@ import time
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import AsyncGenerator, Callable, Dict, List, Literal, Optional
+from typing import (
+    TYPE_CHECKING,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+)
 
 from fastapi import Depends, FastAPI, Header, HTTPException, Request
 from pydantic import BaseModel, Field
@@ -33,6 +48,9 @@ from gioe_libs.structured_logging import request_id_context, setup_logging  # no
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from gioe_libs.observability import observability  # noqa: E402
 
+if TYPE_CHECKING:
+    from app.generation.worker import GenerationJob, GenerationWorker
+
 # Use the shared logging config — same as run_generation.py and other entry points
 setup_logging(log_level=settings.log_level, log_file=settings.log_file)
 logger = logging.getLogger(__name__)
@@ -260,8 +278,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         settings.env,
     )
 
+    if WORKER_MODE == "warm":
+        start_warm_worker()
+
     yield
 
+    stop_warm_worker()
     observability.flush(timeout=5.0)
     observability.shutdown()
 
@@ -338,6 +360,14 @@ ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")
 _running_job: Optional[threading.Thread] = None
 _job_lock = threading.Lock()
 
+# "subprocess" runs run_generation.py per job; "warm" runs jobs on a long-lived
+# in-process GenerationWorker with a queue (see start_warm_worker)
+WORKER_MODE = os.getenv("TRIGGER_WORKER_MODE", "subprocess")
+MAX_CONCURRENT_JOBS = int(os.getenv("TRIGGER_MAX_CONCURRENT_JOBS", "1"))
+MAX_QUEUED_JOBS = int(os.getenv("TRIGGER_MAX_QUEUED_JOBS", "10"))
+
+_worker: Optional["GenerationWorker"] = None
+
 
 async def verify_admin_token(
     x_admin_token: str = Header(
@@ -376,7 +406,10 @@ class TriggerRequest(BaseModel):
     )
     verbose: bool = Field(
         default=False,
-        description="If true, enables detailed logging during generation.",
+        description=(
+            "If true, enables detailed logging during generation "
+            "(subprocess worker mode only)."
+        ),
         json_schema_extra={"example": False},
     )
     types: Optional[
@@ -399,13 +432,54 @@ class TriggerResponse(BaseModel):
         json_schema_extra={"example": "Question generation job started (count=50)"},
     )
     status: str = Field(
-        description="Job status. Will be 'started' when job is successfully triggered.",
+        description=(
+            "Job status. Will be 'started' when job is successfully triggered, "
+            "or 'queued' when it was queued on the warm worker."
+        ),
         json_schema_extra={"example": "started"},
     )
     timestamp: str = Field(
         description="ISO 8601 timestamp when the job was triggered.",
         json_schema_extra={"example": "2026-01-21T10:30:00.000000"},
     )
+    job_id: Optional[str] = Field(
+        default=None,
+        description="ID for /jobs/{job_id} (warm worker mode only).",
+        json_schema_extra={"example": "3f2b9c0e6d6f4b8e9a1c2d3e4f5a6b7c"},
+    )
+
+
+class JobStatusResponse(BaseModel):
+    """State of a generation job run by the warm worker."""
+
+    job_id: str = Field(description="Job ID returned by /trigger.")
+    status: str = Field(
+        description="One of queued, running, succeeded, failed, cancelled.",
+        json_schema_extra={"example": "running"},
+    )
+    count: int = Field(description="Number of questions requested.")
+    types: Optional[List[str]] = Field(
+        default=None, description="Question types requested (None for all)."
+    )
+    cancel_requested: bool = Field(
+        description="Whether cancellation was requested for the job."
+    )
+    created_at: str = Field(description="ISO 8601 timestamp when it was queued.")
+    started_at: Optional[str] = Field(
+        default=None, description="ISO 8601 timestamp when it started running."
+    )
+    finished_at: Optional[str] = Field(
+        default=None, description="ISO 8601 timestamp when it finished."
+    )
+    questions_generated: Optional[int] = Field(
+        default=None, description="Questions generated (once finished)."
+    )
+    questions_inserted: Optional[int] = Field(
+        default=None, description="Questions inserted (once finished)."
+    )
+    error: Optional[str] = Field(
+        default=None, description="Why the job failed or stopped, if it did."
+    )
 
 
 class HealthResponse(BaseModel):
@@ -551,6 +625,77 @@ def run_generation_job(
     logger.info("Generation job finished — metrics will export on next periodic cycle")
 
 
+def _record_worker_job(job: "GenerationJob") -> None:
+    """Record the trigger job metrics for a job finished by the warm worker."""
+    status = {"succeeded": "success", "failed": "failure"}.get(
+        job.status.value, job.status.value
+    )
+    if job.duration_seconds is not None:
+        observability.record_metric(
+            "trigger.job.duration",
+            value=job.duration_seconds,
+            labels={},
+            metric_type="histogram",
+            unit="s",
+        )
+    observability.record_metric(
+        "trigger.job.completed",
+        value=1,
+        labels={"status": status},
+        metric_type="counter",
+    )
+
+
+def start_warm_worker() -> None:
+    """Start the warm generation worker, staying in subprocess mode on failure."""
+    global _worker
+
+    try:
+        from run_generation import create_generation_worker  # noqa: PLC0415
+
+        worker = create_generation_worker(
+            max_concurrent_jobs=MAX_CONCURRENT_JOBS,
+            max_queued_jobs=MAX_QUEUED_JOBS,
+            on_job_finished=_record_worker_job,
+        )
+        worker.start()
+    except Exception as e:
+        logger.exception(
+            f"Failed to start warm generation worker, using subprocess mode: {e}"
+        )
+        observability.capture_error(e, context={"step": "start_warm_worker"})
+        return
+
+    _worker = worker
+
+
+def stop_warm_worker() -> None:
+    """Stop the warm generation worker, cancelling its queued and running jobs."""
+    global _worker
+
+    if _worker is not None:
+        _worker.stop()
+        _worker = None
+
+
+def _job_status_response(job: "GenerationJob") -> JobStatusResponse:
+    return JobStatusResponse(
+        job_id=job.job_id,
+        status=job.status.value,
+        count=job.count,
+        types=[qt.value for qt in job.question_types] if job.question_types else None,
+        cancel_requested=job.cancel_requested,
+        created_at=job.created_at.isoformat(),
+        started_at=job.started_at.isoformat() if job.started_at else None,
+        finished_at=job.finished_at.isoformat() if job.finished_at else None,
+        questions_generated=(
+            len(job.result.generated_questions) if job.result else None
+        ),
+        questions_inserted=job.result.inserted_count if job.result else None,
+        error=job.error,
+    )
+
+
 @app.get(
     "/health",
     response_model=HealthResponse,
@@ -571,7 +716,9 @@ async def health_check() -> HealthResponse:
         "Manually trigger the question generation job. This executes the same pipeline "
         "as the scheduled cron job. The job runs asynchronously in the background; "
         "this endpoint returns immediately after starting the job. Only one job can "
-        "run at a time. Rate limited to 10 requests per minute per IP address."
+        "run at a time, unless the server runs the warm worker, which queues jobs "
+        "and returns a job_id for /jobs/{job_id}. "
+        "Rate limited to 10 requests per minute per IP address."
     ),
     tags=["Generation"],
     responses={
@@ -584,7 +731,7 @@ async def health_check() -> HealthResponse:
             "model": HTTPErrorResponse,
         },
         409: {
-            "description": "A generation job is already running",
+            "description": "A generation job is already running (or queue is full)",
             "model": HTTPErrorResponse,
         },
         429: {
@@ -617,6 +764,9 @@ async def trigger_generation(
         metric_type="counter",
     )
 
+    if _worker is not None:
+        return _queue_worker_job(_worker, request)
+
     with _job_lock:
         # Clean up completed job reference to avoid memory leaks
         if _running_job is not None and not _running_job.is_alive():
@@ -657,6 +807,96 @@ async def trigger_generation(
     )
 
 
+def _queue_worker_job(
+    worker: "GenerationWorker", request: TriggerRequest
+) -> TriggerResponse:
+    """Queue a triggered job on the warm worker."""
+    from app.data.models import QuestionType  # noqa: PLC0415
+    from app.generation.worker import WorkerBusyError  # noqa: PLC0415
+
+    try:
+        job = worker.submit(
+            count=request.count or 50,
+            question_types=[QuestionType(t) for t in request.types or []],
+        )
+    except WorkerBusyError as e:
+        logger.warning(f"Generation job queue full - rejecting request: {e}")
+        observability.record_metric(
+            "trigger.rejected",
+            value=1,
+            labels={"reason": "queue_full"},
+            metric_type="counter",
+        )
+        raise HTTPException(status_code=409, detail=str(e))
+
+    return TriggerResponse(
+        message=f"Question generation job queued (count={job.count})",
+        status="queued",
+        timestamp=job.created_at.isoformat(),
+        job_id=job.job_id,
+    )
+
+
+@app.get(
+    "/jobs/{job_id}",
+    response_model=JobStatusResponse,
+    summary="Get generation job status",
+    description="Returns the state of a job queued on the warm worker.",
+    tags=["Generation"],
+    responses={
+        401: {
+            "description": "Invalid or missing admin token",
+            "model": HTTPErrorResponse,
+        },
+        404: {
+            "description": "Unknown job, or the server is not in warm worker mode",
+            "model": HTTPErrorResponse,
+        },
+    },
+)
+async def get_job_status(
+    job_id: str,
+    _: bool = Depends(verify_admin_token),
+) -> JobStatusResponse:
+    """Get the status of a warm worker job."""
+    job = _worker.get_job(job_id) if _worker is not None else None
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return _job_status_response(job)
+
+
+@app.delete(
+    "/jobs/{job_id}",
+    response_model=JobStatusResponse,
+    summary="Cancel generation job",
+    description=(
+        "Cancels a job queued or running on the warm worker. A running job stops "
+        "asynchronously; questions inserted before it stops are kept. Cancelling "
+        "a finished job has no effect."
+    ),
+    tags=["Generation"],
+    responses={
+        401: {
+            "description": "Invalid or missing admin token",
+            "model": HTTPErrorResponse,
+        },
+        404: {
+            "description": "Unknown job, or the server is not in warm worker mode",
+            "model": HTTPErrorResponse,
+        },
+    },
+)
+async def cancel_job(
+    job_id: str,
+    _: bool = Depends(verify_admin_token),
+) -> JobStatusResponse:
+    """Cancel a warm worker job."""
+    job = _worker.cancel(job_id) if _worker is not None else None
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return _job_status_response(job)
+
+
 if __name__ == "__main__":
     import uvicorn
 